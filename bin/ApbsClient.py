@@ -197,6 +197,7 @@ myExecPath = sys.argv[0]
 pathSplit = os.path.split(myExecPath)
 libPath = os.path.join(pathSplit[0], "../lib/python2.5/site-packages")
 sys.path.append(os.path.abspath(libPath))
+sys.path.append(os.path.abspath(os.path.join(pathSplit[0], "../tools/manip")))
 
 # Now check to see if the user specified the APBS installation path on the command line
 if __name__ == "__main__":
@@ -228,12 +229,20 @@ def enoughMemory(inputFileName):
     if(maxmem == -1):
         return True
 
+    # gridmodel.py is installed next to this script (tools/manip in the
+    # source tree)
+    import gridmodel
+    pbe = "lpbe"
     inputFile = file(inputFileName, 'r')
     for line in inputFile:
         line = line.strip()
         if(line[:4].lower()=='dime'):
             grid_dimensions = line.split()
-    return ((int(grid_dimensions[1])*int(grid_dimensions[2])*int(grid_dimensions[3])*160/(1024*1024) < maxmem))
+        if(line.lower()=='npbe'):
+            pbe = "npbe"
+    inputFile.close()
+    dime = [int(grid_dimensions[1]), int(grid_dimensions[2]), int(grid_dimensions[3])]
+    return (gridmodel.GridModel(pbe).getMemory(dime) < maxmem)
 
 def fetchResults(jobID,outputDirectory,outputFiles,fetchAll):
 	""" Downloads files from Opal server (only if automatic downloading is enabled). """
@@ -68,6 +68,43 @@ VEMBED(rcsid="$Id: routines.c 1615 2010-10-20 19:16:35Z sobolevnrm $")
 
 VPUBLIC void startVio() { Vio_start(); }
 
+/* Timings and counters of the run; see getStats.  Each thread keeps its own,
+   so runs in different threads are counted separately. */
+VPRIVATE VTHREADLOCAL APBSstats stats;
+
+VPRIVATE const char *statsNames[APBS_NPHASE] = {
+	"parse", "molecules", "maps", "setup", "fillco", "solve", "energy",
+	"force", "write"
+};
+
+VPUBLIC void startStats(APBSphase phase) { stats.start[phase] = clock(); }
+
+VPUBLIC void stopStats(APBSphase phase) {
+	
+	stats.time[phase] += 
+		(double)(clock() - stats.start[phase])/(double)CLOCKS_PER_SEC;
+	(stats.count[phase])++;
+	
+}
+
+VPUBLIC void resetStats() {
+	
+	int i;
+	
+	for (i=0; i<APBS_NPHASE; i++) {
+		stats.time[i] = 0.0;
+		stats.count[i] = 0;
+	}
+	stats.iters = 0;
+	
+}
+
+VPUBLIC APBSstats* getStats() { return &stats; }
+
+VPUBLIC const char* getStatsName(APBSphase phase) { 
+	return statsNames[phase]; 
+}
+
 VPUBLIC Vparam* loadParameter(NOsh *nosh) {
 	
 	Vparam *param = VNULL;
@@ -111,6 +148,8 @@ VPUBLIC int loadMolecules(NOsh *nosh, Vparam *param, Valist *alist[NOSH_MAXMOL])
 	
 	Vio *sock = VNULL;
 	
+	startStats(APBS_PHASE_MOLECULES);
+	
 	Vnm_tprint( 1, "Got paths for %d molecules\n", nosh->nmol);
 	if (nosh->nmol <= 0) {
 		Vnm_tprint(2, "You didn't specify any molecules (correctly)!\n");
@@ -235,6 +274,8 @@ VPUBLIC int loadMolecules(NOsh *nosh, Vparam *param, Valist *alist[NOSH_MAXMOL])
 
 	}
 
+	stopStats(APBS_PHASE_MOLECULES);
+
 	return 1;
 
 }
@@ -251,6 +292,15 @@ VPUBLIC void killMolecules(NOsh *nosh, Valist *alist[NOSH_MAXMOL]) {
 	
 }
 
+/* Read a map stored in one of the formats handled by Vgrid_readGZ and
+ * Vgrid_readBIN */
+VPRIVATE int readGridMap(Vgrid *map, Vdata_Format fmt, const char *path) {
+	
+	if (fmt == VDF_BIN) return Vgrid_readBIN(map, path);
+	return Vgrid_readGZ(map, path);
+	
+}
+
 VPUBLIC int loadDielMaps(NOsh *nosh, 
 						 Vgrid *dielXMap[NOSH_MAXMOL], 
 						 Vgrid *dielYMap[NOSH_MAXMOL],
@@ -264,6 +314,8 @@ VPUBLIC int loadDielMaps(NOsh *nosh,
 					nosh->ndiel);
 	else return 1;
 	
+	startStats(APBS_PHASE_MAPS);
+	
 	for (i=0; i<nosh->ndiel; i++) {
 		Vnm_tprint( 1, "Reading x-shifted dielectric map data from \
 %s:\n", nosh->dielXpath[i]);
@@ -296,7 +348,9 @@ VPUBLIC int loadDielMaps(NOsh *nosh,
 				Vnm_tprint(1, "  Volume integral = %3.2e A^3\n", sum);
 				break;
 			case VDF_GZ:
-				if (Vgrid_readGZ(dielXMap[i], nosh->dielXpath[i]) != 1) {
+			case VDF_BIN:
+				if (readGridMap(dielXMap[i], nosh->dielfmt[i], 
+								nosh->dielXpath[i]) != 1) {
 					Vnm_tprint( 2, "Fatal error while reading from %s\n",
 							   nosh->dielXpath[i]);
 					return 0;
@@ -365,7 +419,9 @@ VPUBLIC int loadDielMaps(NOsh *nosh,
 				Vnm_tprint(1, "  Volume integral = %3.2e A^3\n", sum);
 				break;
 			case VDF_GZ:
-				if (Vgrid_readGZ(dielYMap[i], nosh->dielYpath[i]) != 1) {
+			case VDF_BIN:
+				if (readGridMap(dielYMap[i], nosh->dielfmt[i], 
+								nosh->dielYpath[i]) != 1) {
 					Vnm_tprint( 2, "Fatal error while reading from %s\n",
 							   nosh->dielYpath[i]);
 					return 0;
@@ -435,7 +491,9 @@ VPUBLIC int loadDielMaps(NOsh *nosh,
 				Vnm_tprint(1, "  Volume integral = %3.2e A^3\n", sum);
 				break;
 			case VDF_GZ:
-				if (Vgrid_readGZ(dielZMap[i], nosh->dielZpath[i]) != 1) {
+			case VDF_BIN:
+				if (readGridMap(dielZMap[i], nosh->dielfmt[i], 
+								nosh->dielZpath[i]) != 1) {
 					Vnm_tprint( 2, "Fatal error while reading from %s\n",
 							   nosh->dielZpath[i]);
 					return 0;
@@ -476,6 +534,8 @@ VPUBLIC int loadDielMaps(NOsh *nosh,
 		}
 	}
 	
+	stopStats(APBS_PHASE_MAPS);
+	
 	return 1;
 	
 }
@@ -511,17 +571,28 @@ VPUBLIC int loadKappaMaps(NOsh *nosh, Vgrid *map[NOSH_MAXMOL]) {
 		Vnm_tprint( 1, "Got paths for %d kappa maps\n", nosh->nkappa);
 	else return 1;
 	
+	startStats(APBS_PHASE_MAPS);
+	
 	for (i=0; i<nosh->nkappa; i++) {
 		Vnm_tprint( 1, "Reading kappa map data from %s:\n",
 					nosh->kappapath[i]);
 		map[i] = Vgrid_ctor(0, 0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, VNULL);
 		switch (nosh->kappafmt[i]) {
 			case VDF_DX:
-				if (Vgrid_readDX(map[i], "FILE", "ASC", VNULL, 
-								 nosh->kappapath[i]) != 1) {
-					Vnm_tprint( 2, "Fatal error while reading from %s\n",
-								nosh->kappapath[i]);
-					return 0;
+			case VDF_BIN:
+				if (nosh->kappafmt[i] == VDF_DX) {
+					if (Vgrid_readDX(map[i], "FILE", "ASC", VNULL, 
+									 nosh->kappapath[i]) != 1) {
+						Vnm_tprint( 2, "Fatal error while reading from %s\n",
+									nosh->kappapath[i]);
+						return 0;
+					}
+				} else {
+					if (Vgrid_readBIN(map[i], nosh->kappapath[i]) != 1) {
+						Vnm_tprint( 2, "Fatal error while reading from %s\n",
+									nosh->kappapath[i]);
+						return 0;
+					}
 				}
 				Vnm_tprint(1, "  %d x %d x %d grid\n", 
 						   map[i]->nx, map[i]->ny, map[i]->nz);
@@ -551,6 +622,8 @@ VPUBLIC int loadKappaMaps(NOsh *nosh, Vgrid *map[NOSH_MAXMOL]) {
 		}
 	}
 	
+	stopStats(APBS_PHASE_MAPS);
+	
 	return 1;
 	
 }
@@ -578,6 +651,8 @@ VPUBLIC int loadPotMaps(NOsh *nosh, Vgrid *map[NOSH_MAXMOL]) {
 		Vnm_tprint( 1, "Got paths for %d potential maps\n", nosh->npot);
 	else return 1;
 	
+	startStats(APBS_PHASE_MAPS);
+	
 	for (i=0; i<nosh->npot; i++) {
 		Vnm_tprint( 1, "Reading potential map data from %s:\n",
 				   nosh->potpath[i]);
@@ -585,6 +660,7 @@ VPUBLIC int loadPotMaps(NOsh *nosh, Vgrid *map[NOSH_MAXMOL]) {
 		switch (nosh->potfmt[i]) {
 			case VDF_DX:
 			case VDF_GZ:
+			case VDF_BIN:
 				if (nosh->potfmt[i] == VDF_DX) {
 					if (Vgrid_readDX(map[i], "FILE", "ASC", VNULL, 
 									 nosh->potpath[i]) != 1) {
@@ -593,7 +669,8 @@ VPUBLIC int loadPotMaps(NOsh *nosh, Vgrid *map[NOSH_MAXMOL]) {
 						return 0;
 					}
 				}else {
-					if (Vgrid_readGZ(map[i], nosh->potpath[i]) != 1) {
+					if (readGridMap(map[i], nosh->potfmt[i], 
+									nosh->potpath[i]) != 1) {
 						Vnm_tprint( 2, "Fatal error while reading from %s\n",
 								   nosh->potpath[i]);
 						return 0;
@@ -627,6 +704,8 @@ VPUBLIC int loadPotMaps(NOsh *nosh, Vgrid *map[NOSH_MAXMOL]) {
 		}
 	}
 	
+	stopStats(APBS_PHASE_MAPS);
+	
 	return 1;
 	
 }
@@ -654,6 +733,8 @@ VPUBLIC int loadChargeMaps(NOsh *nosh, Vgrid *map[NOSH_MAXMOL]) {
 		Vnm_tprint( 1, "Got paths for %d charge maps\n", nosh->ncharge);
 	else return 1;
 	
+	startStats(APBS_PHASE_MAPS);
+	
 	for (i=0; i<nosh->ncharge; i++) {
 		Vnm_tprint( 1, "Reading charge map data from %s:\n",
 					nosh->chargepath[i]);
@@ -688,7 +769,9 @@ VPUBLIC int loadChargeMaps(NOsh *nosh, Vgrid *map[NOSH_MAXMOL]) {
 				Vnm_tprint(2, "MCSF input not supported yet!\n");
 				return 0;
 			case VDF_GZ:
-				if (Vgrid_readGZ(map[i], nosh->chargepath[i]) != 1) {
+			case VDF_BIN:
+				if (readGridMap(map[i], nosh->chargefmt[i], 
+								nosh->chargepath[i]) != 1) {
 					Vnm_tprint( 2, "Fatal error while reading from %s\n",
 							   nosh->chargepath[i]);
 					return 0;
@@ -712,6 +795,8 @@ VPUBLIC int loadChargeMaps(NOsh *nosh, Vgrid *map[NOSH_MAXMOL]) {
 		}
 	}
 	
+	stopStats(APBS_PHASE_MAPS);
+	
 	return 1;
 	
 }
@@ -897,6 +982,11 @@ to ");
 			case VDF_FLAT:
 				Vnm_tprint(1, "%s.%s\n", pbeparm->writestem[i], "txt");
 				break;				
+			case VDF_BIN:
+			case VDF_BIN32:
+			case VDF_BINZ:
+				Vnm_tprint(1, "%s.%s\n", pbeparm->writestem[i], "bin");
+				break;
 			default: 
 				Vnm_tprint(2, "  Invalid format for writing!\n");
 				break;
@@ -936,42 +1026,12 @@ VPUBLIC void printMGPARM(MGparm *mgparm, double realCenter[3]) {
 	
 }
 
-VPUBLIC int initMG(int icalc, NOsh *nosh, MGparm *mgparm, 
-				   PBEparm *pbeparm, double realCenter[3], Vpbe *pbe[NOSH_MAXCALC], 
-				   Valist *alist[NOSH_MAXMOL], Vgrid *dielXMap[NOSH_MAXMOL], 
-				   Vgrid *dielYMap[NOSH_MAXMOL], Vgrid *dielZMap[NOSH_MAXMOL],
-				   Vgrid *kappaMap[NOSH_MAXMOL],  
-				   Vgrid *chargeMap[NOSH_MAXMOL], Vpmgp *pmgp[NOSH_MAXCALC], 
-				   Vpmg *pmg[NOSH_MAXCALC], Vgrid *potMap[NOSH_MAXMOL]) {
+/* Construct the Vpbe object for calculation icalc; returns VNULL on error */
+VPRIVATE Vpbe* makePBE(int icalc, PBEparm *pbeparm, Valist *alist[NOSH_MAXMOL]) {
+
+	int focusFlag;
+	double sparm, iparm;
 
-	int j,  focusFlag, iatom;
-	size_t bytesTotal, highWater;
-	double sparm, iparm, q;
-	Vatom *atom = VNULL;
-	Vgrid *theDielXMap, *theDielYMap, *theDielZMap;
-	Vgrid *theKappaMap, *thePotMap, *theChargeMap;
-	Valist *myalist = VNULL;
-	
-	Vnm_tstart(APBS_TIMER_SETUP, "Setup timer");
-	
-	/* Update the grid center */
-	for (j=0; j<3; j++) realCenter[j] = mgparm->center[j];
-	
-	/* Check for completely-neutral molecule */
-	q = 0;
-	myalist = alist[pbeparm->molid-1];
-	for (iatom=0; iatom<Valist_getNumberAtoms(myalist); iatom++) {
-		atom = Valist_getAtom(myalist, iatom);
-		q += VSQR(Vatom_getCharge(atom));
-	}
-	/*  D. Gohara 10/22/09 - disabled 
-	if (q < (1e-6)) {
-		Vnm_tprint(2, "Molecule #%d is uncharged!\n", pbeparm->molid);
-		Vnm_tprint(2, "Sum square charge = %g!\n", q);
-		return 0;
-	}
-	*/
-	
 	/* Set up PBE object */
 	Vnm_tprint(0, "Setting up PBE object...\n");
 	if (pbeparm->srfm == VSM_SPLINE) sparm = pbeparm->swin;
@@ -981,18 +1041,35 @@ VPUBLIC int initMG(int icalc, NOsh *nosh, MGparm *mgparm,
 	if (pbeparm->bcfl == BCFL_FOCUS) {
 		if (icalc == 0) {
 			Vnm_tprint( 2, "Can't focus first calculation!\n");
-			return 0;
+			return VNULL;
 		}
 		focusFlag = 1;
 	} else focusFlag = 0;
 	
-	pbe[icalc] = Vpbe_ctor(myalist, pbeparm->nion,
-						   pbeparm->ionc, pbeparm->ionr, pbeparm->ionq, 
-						   pbeparm->temp, pbeparm->pdie, 
-						   pbeparm->sdie, sparm, focusFlag, pbeparm->sdens, 
-						   pbeparm->zmem, pbeparm->Lmem, pbeparm->mdie, 
-						   pbeparm->memv);
-	
+	return Vpbe_ctor(alist[pbeparm->molid-1], pbeparm->nion,
+					 pbeparm->ionc, pbeparm->ionr, pbeparm->ionq, 
+					 pbeparm->temp, pbeparm->pdie, 
+					 pbeparm->sdie, sparm, focusFlag, pbeparm->sdens, 
+					 pbeparm->zmem, pbeparm->Lmem, pbeparm->mdie, 
+					 pbeparm->memv);
+}
+
+/* Copy the size-modified PBE parameters of pbeparm and pmgp into pbe; does
+   nothing for other PBE types */
+VPRIVATE void setSMPBE(PBEparm *pbeparm, Vpmgp *pmgp, Vpbe *pbe) {
+
+	if (pbeparm->pbetype != PBE_SMPBE) return;
+	pbe->smsize = pbeparm->smsize;
+	pbe->smvolume = pbeparm->smvolume;
+	pbe->ipkey = pmgp->ipkey;
+}
+
+/* Construct the Vpmgp object for a calculation with parameters mgparm and
+   pbeparm and Vpbe object pbe; returns VNULL on error */
+VPRIVATE Vpmgp* makePMGP(MGparm *mgparm, PBEparm *pbeparm, Vpbe *pbe) {
+
+	Vpmgp *pmgp = VNULL;
+
 	/* Set up PDE object */
 	Vnm_tprint(0, "Setting up PDE object...\n");
 	switch (pbeparm->pbetype) {
@@ -1000,62 +1077,48 @@ VPUBLIC int initMG(int icalc, NOsh *nosh, MGparm *mgparm,
 			/* TEMPORARY USEAQUA */
 			mgparm->nonlintype = NONLIN_NPBE;
 			mgparm->method = (mgparm->useAqua == 1) ? VSOL_NewtonAqua : VSOL_Newton;
-			pmgp[icalc] = Vpmgp_ctor(mgparm);
+			pmgp = Vpmgp_ctor(mgparm);
 			break;
 		case PBE_LPBE:
 			/* TEMPORARY USEAQUA */
 			mgparm->nonlintype = NONLIN_LPBE;
 			mgparm->method = (mgparm->useAqua == 1) ? VSOL_CGMGAqua : VSOL_MG;
-			pmgp[icalc] = Vpmgp_ctor(mgparm);
+			pmgp = Vpmgp_ctor(mgparm);
 			break;
 		case PBE_LRPBE:
 			Vnm_tprint(2, "Sorry, LRPBE isn't supported with the MG solver!\n");
-			return 0;
+			return VNULL;
 			break;
 		case PBE_NRPBE:
 			Vnm_tprint(2, "Sorry, NRPBE isn't supported with the MG solver!\n");
-			return 0;
+			return VNULL;
 			break;
 		case PBE_SMPBE: /* SMPBE Added */
 			mgparm->nonlintype = NONLIN_SMPBE;
-			pmgp[icalc] = Vpmgp_ctor(mgparm);
+			pmgp = Vpmgp_ctor(mgparm);
 			
 			/* Copy Code */
-			pbe[icalc]->smsize = pbeparm->smsize;
-			pbe[icalc]->smvolume = pbeparm->smvolume;
-			pbe[icalc]->ipkey = pmgp[icalc]->ipkey;
+			setSMPBE(pbeparm, pmgp, pbe);
 			
 			break;
 		default:
 			Vnm_tprint(2, "Error!  Unknown PBE type (%d)!\n", pbeparm->pbetype);
-			return 0;
-	}
-	Vnm_tprint(0, "Setting PDE center to local center...\n");
-	pmgp[icalc]->bcfl = pbeparm->bcfl;
-	pmgp[icalc]->xcent = realCenter[0];
-	pmgp[icalc]->ycent = realCenter[1];
-	pmgp[icalc]->zcent = realCenter[2];
-	
-	if (pbeparm->bcfl == BCFL_FOCUS) {
-        if (icalc == 0) {
-            Vnm_tprint( 2, "Can't focus first calculation!\n");
-            return 0;
-        }
-        /* Focusing requires the previous calculation in order to setup the 
-        current run... */
-        pmg[icalc] = Vpmg_ctor(pmgp[icalc], pbe[icalc], 1, pmg[icalc-1],
-							   mgparm, pbeparm->calcenergy);   
-        /* ...however, it should be done with the previous calculation now, so 
-        we should be able to destroy it here. */
-        /* Vpmg_dtor(&(pmg[icalc-1])); */
-	} else {
-		if (icalc>0) Vpmg_dtor(&(pmg[icalc-1]));
-		pmg[icalc] = Vpmg_ctor(pmgp[icalc], pbe[icalc], 0, VNULL, mgparm, PCE_NO);
-	}
-	if (icalc>0) {
-		Vpmgp_dtor(&(pmgp[icalc-1]));
-		Vpbe_dtor(&(pbe[icalc-1]));
+			return VNULL;
 	}
+
+	return pmgp;
+}
+
+/* Pick the maps calculation pbeparm uses and fill the coefficient arrays
+   of pmg; returns 1 if successful, 0 otherwise */
+VPRIVATE int fillcoMG(NOsh *nosh, MGparm *mgparm, PBEparm *pbeparm, Vpmg *pmg,
+					  Vgrid *dielXMap[NOSH_MAXMOL], Vgrid *dielYMap[NOSH_MAXMOL],
+					  Vgrid *dielZMap[NOSH_MAXMOL], Vgrid *kappaMap[NOSH_MAXMOL],
+					  Vgrid *chargeMap[NOSH_MAXMOL], Vgrid *potMap[NOSH_MAXMOL]) {
+
+	Vgrid *theDielXMap, *theDielYMap, *theDielZMap;
+	Vgrid *theKappaMap, *thePotMap, *theChargeMap;
+
 	if (pbeparm->useDielMap) {
 		if ((pbeparm->dielMapID-1) < nosh->ndiel) {
 			theDielXMap = dielXMap[pbeparm->dielMapID-1];
@@ -1118,7 +1181,8 @@ VPUBLIC int initMG(int icalc, NOsh *nosh, MGparm *mgparm,
 		return 0;
 	}
 
-	if (!Vpmg_fillco(pmg[icalc], 
+	startStats(APBS_PHASE_FILLCO);
+	if (!Vpmg_fillco(pmg, 
 					 pbeparm->srfm, pbeparm->swin, mgparm->chgm,
 					 pbeparm->useDielMap, theDielXMap,
 					 pbeparm->useDielMap, theDielYMap,
@@ -1129,6 +1193,85 @@ VPUBLIC int initMG(int icalc, NOsh *nosh, MGparm *mgparm,
 		Vnm_print(2, "initMG:  problems setting up coefficients (fillco)!\n");
 		return 0;
 	}
+	stopStats(APBS_PHASE_FILLCO);
+
+	return 1;
+}
+
+VPUBLIC int initMG(int icalc, NOsh *nosh, MGparm *mgparm, 
+				   PBEparm *pbeparm, double realCenter[3], Vpbe *pbe[NOSH_MAXCALC], 
+				   Valist *alist[NOSH_MAXMOL], Vgrid *dielXMap[NOSH_MAXMOL], 
+				   Vgrid *dielYMap[NOSH_MAXMOL], Vgrid *dielZMap[NOSH_MAXMOL],
+				   Vgrid *kappaMap[NOSH_MAXMOL],  
+				   Vgrid *chargeMap[NOSH_MAXMOL], Vpmgp *pmgp[NOSH_MAXCALC], 
+				   Vpmg *pmg[NOSH_MAXCALC], Vgrid *potMap[NOSH_MAXMOL]) {
+
+	int j, iatom;
+	size_t bytesTotal, highWater;
+	double q;
+	Vatom *atom = VNULL;
+	Valist *myalist = VNULL;
+	
+	Vnm_tstart(APBS_TIMER_SETUP, "Setup timer");
+	startStats(APBS_PHASE_SETUP);
+	
+	/* Update the grid center */
+	for (j=0; j<3; j++) realCenter[j] = mgparm->center[j];
+	
+	/* Check for completely-neutral molecule */
+	q = 0;
+	myalist = alist[pbeparm->molid-1];
+	for (iatom=0; iatom<Valist_getNumberAtoms(myalist); iatom++) {
+		atom = Valist_getAtom(myalist, iatom);
+		q += VSQR(Vatom_getCharge(atom));
+	}
+	/*  D. Gohara 10/22/09 - disabled 
+	if (q < (1e-6)) {
+		Vnm_tprint(2, "Molecule #%d is uncharged!\n", pbeparm->molid);
+		Vnm_tprint(2, "Sum square charge = %g!\n", q);
+		return 0;
+	}
+	*/
+	
+	/* Set up PBE object */
+	pbe[icalc] = makePBE(icalc, pbeparm, alist);
+	if (pbe[icalc] == VNULL) return 0;
+	
+	/* Set up PDE object */
+	pmgp[icalc] = makePMGP(mgparm, pbeparm, pbe[icalc]);
+	if (pmgp[icalc] == VNULL) return 0;
+
+	Vnm_tprint(0, "Setting PDE center to local center...\n");
+	pmgp[icalc]->bcfl = pbeparm->bcfl;
+	pmgp[icalc]->xcent = realCenter[0];
+	pmgp[icalc]->ycent = realCenter[1];
+	pmgp[icalc]->zcent = realCenter[2];
+	
+	if (pbeparm->bcfl == BCFL_FOCUS) {
+        if (icalc == 0) {
+            Vnm_tprint( 2, "Can't focus first calculation!\n");
+            return 0;
+        }
+        /* Focusing requires the previous calculation in order to setup the 
+        current run... */
+        pmg[icalc] = Vpmg_ctor(pmgp[icalc], pbe[icalc], 1, pmg[icalc-1],
+							   mgparm, pbeparm->calcenergy);   
+        /* ...however, it should be done with the previous calculation now, so 
+        we should be able to destroy it here. */
+        /* Vpmg_dtor(&(pmg[icalc-1])); */
+        /* Vpmg_ctor has already destroyed it, so don't leave a dangling
+        pointer for killAllMG */
+        pmg[icalc-1] = VNULL;
+	} else {
+		if (icalc>0) Vpmg_dtor(&(pmg[icalc-1]));
+		pmg[icalc] = Vpmg_ctor(pmgp[icalc], pbe[icalc], 0, VNULL, mgparm, PCE_NO);
+	}
+	if (icalc>0) {
+		Vpmgp_dtor(&(pmgp[icalc-1]));
+		Vpbe_dtor(&(pbe[icalc-1]));
+	}
+	if (!fillcoMG(nosh, mgparm, pbeparm, pmg[icalc], dielXMap, dielYMap,
+				  dielZMap, kappaMap, chargeMap, potMap)) return 0;
 
 	/* Print a few derived parameters */
 #ifndef VAPBSQUIET
@@ -1136,6 +1279,7 @@ VPUBLIC int initMG(int icalc, NOsh *nosh, MGparm *mgparm,
 #endif
 	
 	/* Setup time statistics */
+	stopStats(APBS_PHASE_SETUP);
 	Vnm_tstop(APBS_TIMER_SETUP, "Setup timer");
 	
 	/* Memory statistics */
@@ -1178,6 +1322,77 @@ VPUBLIC void killMG(NOsh *nosh, Vpbe *pbe[NOSH_MAXCALC],
 	
 }
 
+VPUBLIC int reinitMG(int icalc, NOsh *nosh, MGparm *mgparm, 
+					 PBEparm *pbeparm, double realCenter[3], Vpbe *pbe[NOSH_MAXCALC], 
+					 Valist *alist[NOSH_MAXMOL], Vgrid *dielXMap[NOSH_MAXMOL], 
+					 Vgrid *dielYMap[NOSH_MAXMOL], Vgrid *dielZMap[NOSH_MAXMOL],
+					 Vgrid *kappaMap[NOSH_MAXMOL],  
+					 Vgrid *chargeMap[NOSH_MAXMOL], Vpmgp *pmgp[NOSH_MAXCALC], 
+					 Vpmg *pmg[NOSH_MAXCALC], Vgrid *potMap[NOSH_MAXMOL]) {
+
+	int j, focusFlag;
+	
+	Vnm_tstart(APBS_TIMER_SETUP, "Setup timer");
+	startStats(APBS_PHASE_SETUP);
+	
+	for (j=0; j<3; j++) realCenter[j] = mgparm->center[j];
+	focusFlag = (pbeparm->bcfl == BCFL_FOCUS);
+	if (focusFlag && (icalc == 0 || pmg[icalc-1] == VNULL)) {
+		Vnm_tprint( 2, "Can't focus first calculation!\n");
+		return 0;
+	}
+	
+	/* The atoms may have moved, so the PBE object is always rebuilt */
+	Vpbe_dtor(&(pbe[icalc]));
+	pbe[icalc] = makePBE(icalc, pbeparm, alist);
+	if (pbe[icalc] == VNULL) return 0;
+	
+	if (pmg[icalc] == VNULL) {
+		pmgp[icalc] = makePMGP(mgparm, pbeparm, pbe[icalc]);
+		if (pmgp[icalc] == VNULL) return 0;
+		pmgp[icalc]->bcfl = pbeparm->bcfl;
+		pmgp[icalc]->xcent = realCenter[0];
+		pmgp[icalc]->ycent = realCenter[1];
+		pmgp[icalc]->zcent = realCenter[2];
+		/* Don't let Vpmg_ctor destroy the previous calculation */
+		pmg[icalc] = Vpmg_ctor(pmgp[icalc], pbe[icalc], 0, VNULL, mgparm, PCE_NO);
+	} else {
+		/* makePMGP is skipped, so copy its SMPBE settings to the new Vpbe */
+		setSMPBE(pbeparm, pmgp[icalc], pbe[icalc]);
+	}
+	if (focusFlag) {
+		Vpmg_reset(pmg[icalc], pbe[icalc], 1, pmg[icalc-1], mgparm,
+				   pbeparm->calcenergy);
+	} else {
+		Vpmg_reset(pmg[icalc], pbe[icalc], 0, VNULL, mgparm, PCE_NO);
+	}
+	
+	if (!fillcoMG(nosh, mgparm, pbeparm, pmg[icalc], dielXMap, dielYMap,
+				  dielZMap, kappaMap, chargeMap, potMap)) return 0;
+	
+	stopStats(APBS_PHASE_SETUP);
+	Vnm_tstop(APBS_TIMER_SETUP, "Setup timer");
+	
+	return 1;
+}
+
+VPUBLIC void killAllMG(NOsh *nosh, Vpbe *pbe[NOSH_MAXCALC], 
+					   Vpmgp *pmgp[NOSH_MAXCALC], Vpmg *pmg[NOSH_MAXCALC]) {
+	
+	int i;
+	
+#ifndef VAPBSQUIET
+	Vnm_tprint(1, "Destroying multigrid structures.\n");
+#endif
+	
+	/* Release the Vpmg structs BEFORE the Vpmgp structs; see killMG */
+	for (i=0; i<nosh->ncalc; i++) Vpmg_dtor(&(pmg[i]));
+	for (i=0; i<nosh->ncalc; i++) {
+		Vpbe_dtor(&(pbe[i]));
+		Vpmgp_dtor(&(pmgp[i]));
+	}
+}
+
 VPUBLIC int solveMG(NOsh *nosh, Vpmg *pmg, MGparm_CalcType type) {
 	
 	int nx, ny, nz, i;
@@ -1188,6 +1403,7 @@ VPUBLIC int solveMG(NOsh *nosh, Vpmg *pmg, MGparm_CalcType type) {
 	}
 	
 	Vnm_tstart(APBS_TIMER_SOLVER, "Solver timer");
+	startStats(APBS_PHASE_SOLVE);
 	
 	
 	if (type != MCT_DUMMY) {
@@ -1198,6 +1414,10 @@ VPUBLIC int solveMG(NOsh *nosh, Vpmg *pmg, MGparm_CalcType type) {
 			Vnm_print(2, "  Error during PDE solution!\n");
 			return 0;
 		}
+		stats.iters += pmg->iters;
+#ifndef VAPBSQUIET
+		Vnm_tprint( 1,"  Solver used %d iterations.\n", pmg->iters);
+#endif
 	} else {
 		Vnm_tprint( 1,"  Skipping solve for mg-dummy run; zeroing \
 solution array\n");
@@ -1206,12 +1426,81 @@ solution array\n");
 		nz = pmg->pmgp->nz;
 		for (i=0; i<nx*ny*nz; i++) pmg->u[i] = 0.0;
 	}
+	stopStats(APBS_PHASE_SOLVE);
 	Vnm_tstop(APBS_TIMER_SOLVER, "Solver timer");
 	
 	return 1;
 	
 }
 
+VPUBLIC int guessMG(NOsh *nosh, Vpmg *pmg, Vgrid *guess) {
+	
+	if (nosh != VNULL) {
+		if (nosh->bogus) return 1;
+	}
+	
+	if (guess == VNULL) {
+#ifndef VAPBSQUIET
+		Vnm_tprint( 1,"  Using current solution as initial guess...\n");
+#endif
+		Vpmg_setGuess(pmg, VNULL);
+	} else {
+#ifndef VAPBSQUIET
+		Vnm_tprint( 1,"  Interpolating %d x %d x %d initial guess...\n",
+				   guess->nx, guess->ny, guess->nz);
+#endif
+		if (!Vpmg_setGuessGrid(pmg, guess)) {
+			Vnm_tprint( 2, "  Error setting initial guess!\n");
+			return 0;
+		}
+	}
+	
+	return 1;
+}
+
+VPUBLIC Vgrid* saveGuessMG(Vpmg *pmg) {
+	
+	int i, n, nx, ny, nz;
+	double hx, hy, hzed;
+	Vgrid *grid = VNULL;
+	
+	nx = pmg->pmgp->nx;
+	ny = pmg->pmgp->ny;
+	nz = pmg->pmgp->nz;
+	hx = pmg->pmgp->hx;
+	hy = pmg->pmgp->hy;
+	hzed = pmg->pmgp->hzed;
+	n = nx*ny*nz;
+	
+	grid = Vgrid_ctor(nx, ny, nz, hx, hy, hzed,
+					  pmg->pmgp->xcent - 0.5*hx*(nx-1),
+					  pmg->pmgp->ycent - 0.5*hy*(ny-1),
+					  pmg->pmgp->zcent - 0.5*hzed*(nz-1), VNULL);
+	
+	/* Let the grid own its copy of the data so Vgrid_dtor releases it */
+	grid->data = (double *)Vmem_malloc(grid->mem, n, sizeof(double));
+	grid->readdata = 1;
+	for (i=0; i<n; i++) grid->data[i] = pmg->u[i];
+	
+	return grid;
+}
+
+VPUBLIC Vgrid* loadGuessMG(char *path) {
+	
+	Vgrid *grid = VNULL;
+	
+	Vnm_tprint( 1, "Reading initial guess from %s:\n", path);
+	grid = Vgrid_ctor(0, 0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, VNULL);
+	if (Vgrid_readDX(grid, "FILE", "ASC", VNULL, path) != 1) {
+		Vnm_tprint( 2, "Fatal error while reading from %s\n", path);
+		Vgrid_dtor(&grid);
+		return VNULL;
+	}
+	Vnm_tprint(1, "  %d x %d x %d grid\n", grid->nx, grid->ny, grid->nz);
+	
+	return grid;
+}
+
 VPUBLIC int setPartMG(NOsh *nosh, MGparm *mgparm, Vpmg *pmg) {
 	
 	int j;
@@ -1270,6 +1559,7 @@ VPUBLIC int energyMG(NOsh *nosh, int icalc, Vpmg *pmg,
 	pbeparm = nosh->calc[icalc]->pbeparm;
 	
 	Vnm_tstart(APBS_TIMER_ENERGY, "Energy timer");
+	startStats(APBS_PHASE_ENERGY);
 #ifndef VAPBSQUIET
 	Vnm_tprint( 1,"  Calculating energy (see io.mc* for details)...\n");
 #endif
@@ -1313,6 +1603,7 @@ kJ/mol\n", Vunit_kb*pbeparm->temp*(1e-3)*Vunit_Na*(*totEnergy));
 		}
 	} else *nenergy = 0;
 	
+	stopStats(APBS_PHASE_ENERGY);
 	Vnm_tstop(APBS_TIMER_ENERGY, "Energy timer");
 	
 	return 1;
@@ -1326,6 +1617,7 @@ VPUBLIC int forceMG(Vmem *mem, NOsh *nosh, PBEparm *pbeparm, MGparm *mgparm,
 	double qfForce[3], dbForce[3], ibForce[3];
 	
 	Vnm_tstart(APBS_TIMER_FORCE, "Force timer");
+	startStats(APBS_PHASE_FORCE);
 
 #ifndef VAPBSQUIET
 	Vnm_tprint( 1,"  Calculating forces...\n");
@@ -1442,6 +1734,7 @@ VPUBLIC int forceMG(Vmem *mem, NOsh *nosh, PBEparm *pbeparm, MGparm *mgparm,
 		}
 	} else *nforce = 0;
 	
+	stopStats(APBS_PHASE_FORCE);
 	Vnm_tstop(APBS_TIMER_FORCE, "Force timer");
 	
 	return 1;
@@ -2069,6 +2362,8 @@ VPUBLIC int writedataMG(int rank, NOsh *nosh, PBEparm *pbeparm, Vpmg *pmg) {
 	
 	if (nosh->bogus) return 1;
 	
+	startStats(APBS_PHASE_WRITE);
+	
 	for (i=0; i<pbeparm->numwrite; i++) { 
 		
 		nx = pmg->pmgp->nx;
@@ -2365,6 +2660,18 @@ uniform meshes yet!\n");
 							  pmg->pvec);
 				Vgrid_dtor(&grid);
 				break;
+			case VDF_BIN:
+			case VDF_BIN32:
+			case VDF_BINZ:
+				sprintf(outpath, "%s.%s", writestem, "bin");
+				Vnm_tprint(1, "%s\n", outpath);
+				grid = Vgrid_ctor(nx, ny, nz, hx, hy, hzed, xmin, ymin, zmin,
+								  pmg->rwork);
+				Vgrid_writeBIN(grid, outpath, title, pmg->pvec,
+							   (pbeparm->writefmt[i] == VDF_BIN32) ? 4 : 8,
+							   (pbeparm->writefmt[i] == VDF_BINZ));
+				Vgrid_dtor(&grid);
+				break;
 			case VDF_FLAT: 
 				sprintf(outpath, "%s.%s", writestem, "txt");
 				Vnm_tprint(1, "%s\n", outpath);
@@ -2396,6 +2703,8 @@ uniform meshes yet!\n");
 		
 	}
 	
+	stopStats(APBS_PHASE_WRITE);
+	
 	return 1;
 }
 
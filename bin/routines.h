@@ -85,6 +85,52 @@ struct AtomForce {
  * @ingroup  Frontend */
 typedef struct AtomForce AtomForce;
 
+/**
+ * @brief  Phases of a run timed by startStats and stopStats
+ * @ingroup  Frontend */
+enum eAPBSphase {
+    APBS_PHASE_PARSE=0,  /**< Parsing the input */
+    APBS_PHASE_MOLECULES=1,  /**< Reading molecules */
+    APBS_PHASE_MAPS=2,  /**< Reading dielectric, kappa, potential and charge
+                         * maps */
+    APBS_PHASE_SETUP=3,  /**< Setting up MG calculations (including
+                          * APBS_PHASE_FILLCO) */
+    APBS_PHASE_FILLCO=4,  /**< Filling the MG coefficient arrays
+                           * (Vpmg_fillco) */
+    APBS_PHASE_SOLVE=5,  /**< Solving the PBE */
+    APBS_PHASE_ENERGY=6,  /**< Calculating energies */
+    APBS_PHASE_FORCE=7,  /**< Calculating forces */
+    APBS_PHASE_WRITE=8  /**< Writing data and matrices */
+};
+
+/**
+ * @brief  Define APBSphase type
+ * @ingroup  Frontend */
+typedef enum eAPBSphase APBSphase;
+
+/**
+ * @brief  Number of phases in APBSphase
+ * @ingroup  Frontend */
+#define APBS_NPHASE 9
+
+/**
+ * @brief  Timings and counters of a run, accumulated over all
+ *         calculations since the last resetStats
+ * @ingroup  Frontend
+ * @author  Nathan Baker */
+struct APBSstats {
+   double time[APBS_NPHASE];  /**< CPU seconds spent in each phase */
+   int count[APBS_NPHASE];  /**< Number of times each phase completed */
+   int iters;  /**< Total number of solver iterations */
+   clock_t start[APBS_NPHASE];  /**< Start of the current run of each
+                                 * phase */
+};
+
+/**
+ * @brief  Define APBSstats type
+ * @ingroup  Frontend */
+typedef struct APBSstats APBSstats;
+
 /**
  * @brief  Loads and returns parameter object
  * @ingroup  Frontend
@@ -228,6 +274,45 @@ VEXTERNC int initMG(
 					Vgrid *potMap[NOSH_MAXMOL]  /**< Array of potential maps  */
 					);
 
+/**
+ * @brief  Set up an MG calculation again after the atoms have moved, reusing
+ *         the grids of an earlier call.  Unlike initMG, the objects of the
+ *         other calculations are kept, so each one can be set up again in
+ *         turn; pmg[icalc] must be VNULL or come from an earlier call.
+ *         Clean up with killAllMG.
+ * @ingroup  Frontend
+ * @author  Nathan Baker
+ * @return  1 if succesful, 0 otherwise */
+VEXTERNC int reinitMG(
+					int icalc,  /**< Index of calculation in pmg/pmpg arrays */
+					NOsh *nosh,  /**< Object with parsed input file parameters */
+					MGparm *mgparm,  /**< Object with MG-specific parameters */
+					PBEparm *pbeparm,  /**< Object with generic PBE parameters  */
+					double realCenter[3],  /**< The actual center of the current mesh */
+					Vpbe *pbe[NOSH_MAXCALC],  /**< Array of Vpbe objects (one for each calc) */
+					Valist *alist[NOSH_MAXMOL],  /**< Array of atom lists */
+					Vgrid *dielXMap[NOSH_MAXMOL],  /**< Array of x-shifted dielectric maps */
+					Vgrid *dielYMap[NOSH_MAXMOL],  /**< Array of y-shifted dielectric maps */
+					Vgrid *dielZMap[NOSH_MAXMOL],  /**< Array of z-shifted dielectric maps */
+					Vgrid *kappaMap[NOSH_MAXMOL],  /**< Array of kappa maps  */
+					Vgrid *chargeMap[NOSH_MAXMOL],  /**< Array of charge maps */
+					Vpmgp *pmgp[NOSH_MAXCALC],  /**< Array of MG parameter objects (one for each calc) */
+					Vpmg *pmg[NOSH_MAXCALC],  /**< Array of MG objects (one for each calc) */
+					Vgrid *potMap[NOSH_MAXMOL]  /**< Array of potential maps  */
+					);
+
+/**
+ * @brief  Kill structures set up by reinitMG
+ * @ingroup  Frontend
+ * @author  Nathan Baker
+ */
+VEXTERNC void killAllMG(
+					NOsh *nosh,  /**< Object with parsed input file parameters */
+					Vpbe *pbe[NOSH_MAXCALC],  /**< Array of Vpbe objects (one for each calc) */
+					Vpmgp *pmgp[NOSH_MAXCALC],  /**< Array of MG parameter objects (one for each calc) */
+					Vpmg *pmg[NOSH_MAXCALC]  /**< Array of MG objects (one for each calc) */
+					);
+
 /**
  * @brief  Kill structures initialized during an MG calculation
  * @ingroup  Frontend
@@ -240,6 +325,46 @@ VEXTERNC void killMG(
 					 Vpmg *pmg[NOSH_MAXCALC]  /** Array of MG objects for each calc */
 );
 
+/**
+ * @brief  Start timing a phase of the run
+ * @ingroup  Frontend
+ * @author  Nathan Baker
+ * @param phase  Phase to time */
+VEXTERNC void startStats(APBSphase phase);
+
+/**
+ * @brief  Stop timing a phase of the run and add it to the statistics;
+ *         phases that fail are not stopped and so not counted
+ * @ingroup  Frontend
+ * @author  Nathan Baker
+ * @param phase  Phase to time */
+VEXTERNC void stopStats(APBSphase phase);
+
+/**
+ * @brief  Clear the timings and counters
+ * @ingroup  Frontend
+ * @author  Nathan Baker */
+VEXTERNC void resetStats();
+
+/**
+ * @brief  Get the timings and counters accumulated since the start of the
+ *         run or the last resetStats
+ * @ingroup  Frontend
+ * @author  Nathan Baker
+ * @note  Each thread has its own statistics, which count only the phases
+ *        it ran
+ * @return  Statistics of the run (owned by the library) */
+VEXTERNC APBSstats* getStats();
+
+/**
+ * @brief  Get the name of a phase ("parse", "molecules", "maps", "setup",
+ *         "fillco", "solve", "energy", "force" or "write")
+ * @ingroup  Frontend
+ * @author  Nathan Baker
+ * @param phase  Phase
+ * @return  Name of the phase */
+VEXTERNC const char* getStatsName(APBSphase phase);
+
 /**
  * @brief  Solve the PBE with MG
  * @ingroup  Frontend
@@ -250,6 +375,35 @@ VEXTERNC void killMG(
  * @return  1 if successful, 0 otherwise */
 VEXTERNC int solveMG(NOsh *nosh, Vpmg *pmg, MGparm_CalcType type);
 
+/**
+ * @brief  Seed the next MG solve with an initial guess instead of zero
+ * @ingroup  Frontend
+ * @author  Nathan Baker
+ * @param nosh  Object with parsed input file parameters
+ * @param pmg  MG object for this calculation
+ * @param guess  Potential grid (kT/e) to interpolate onto the mesh, or VNULL
+ *               to start from the current contents of the solution array
+ *               (i.e., the previous solution on the same grid)
+ * @return  1 if successful, 0 otherwise */
+VEXTERNC int guessMG(NOsh *nosh, Vpmg *pmg, Vgrid *guess);
+
+/**
+ * @brief  Copy the current MG solution into a new grid (e.g., to seed a
+ *         later calculation after this one is destroyed)
+ * @ingroup  Frontend
+ * @author  Nathan Baker
+ * @param pmg  MG object
+ * @return  Potential grid; release with Vgrid_dtor */
+VEXTERNC Vgrid* saveGuessMG(Vpmg *pmg);
+
+/**
+ * @brief  Read an initial guess from an OpenDX potential map (kT/e)
+ * @ingroup  Frontend
+ * @author  Nathan Baker
+ * @param path  Path to the DX file
+ * @return  Potential grid (release with Vgrid_dtor) or VNULL on error */
+VEXTERNC Vgrid* loadGuessMG(char *path);
+
 /**
  * @brief  Set MG partitions for calculating observables and performing I/O
  * @ingroup  Frontend
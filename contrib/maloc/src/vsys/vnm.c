@@ -1010,6 +1010,10 @@ VPUBLIC void Vnm_redirect(const int flag)
  *
  * Purpose:  External interface to the console i/o routine.
  *
+ * Notes:    The console stays open between calls and is only flushed, so
+ *           that threads printing at the same time never write to a
+ *           console another thread has just closed.
+ *
  * NOTE:     We MUST NOT use VASSERT (or Vnm_print!) in this routine.
  *
  * Author:   Michael Holst
@@ -1029,7 +1033,6 @@ VPUBLIC void Vnm_print(const int unit, const char *format, ...)
         va_start(argList, format);
         vfprintf(fp, format, argList);
         va_end(argList);
-        Vnm_close(unit);
     }
     Vnm_flush(unit);
 }
@@ -1046,6 +1049,8 @@ VPUBLIC void Vnm_print(const int unit, const char *format, ...)
  *               Vnm_ioTag() >= 0   (I.e., I must have been given a tag)
  *               Vnm_nTags() >  1   (I must not be the only one given a tag)
  *
+ *           The console stays open, as in Vnm_print.
+ *
  * NOTE:     We MUST NOT use VASSERT (or Vnm_print!) in this routine.
  *
  * Author:   Michael Holst
@@ -1071,7 +1076,6 @@ VPUBLIC void Vnm_tprint(const int unit, const char *format, ...)
         va_start(argList, format);
         vfprintf(fp, format, argList);
         va_end(argList);
-        Vnm_close(unit);
     }
     Vnm_flush(unit);
 }
@@ -281,6 +281,9 @@ c*
 c*    *** stop timer ***
       call vtstop(30, 'CGMGDRIV2: solve', 16)
 c*
+c*    *** report the number of iterations used ***
+      iparm(24) = iters
+c*
 c*    *** MATLAB ***
       write(*,100) 'cgmg_sf',tsetupf,'cgmg_sc',tsetupc,
      2   'cgmg_st',(tsetupf+tsetupc),'cgmg_so',tsolve
@@ -179,6 +179,7 @@ c*    *** misc variables ***
       integer          mgkey,nlev,itmax,iok,iinfo,istop,ipkey,nu1,nu2
       integer          nx,ny,nz,ilev,ido,iters,ierror,nlev_real,ibound
       integer          mgprol,mgcoar,mgsolv,mgdisc,mgsmoo,iperf,mode
+      integer          iguess
       double precision epsiln,epsmac,errtol,omegal,omegan
       double precision bf,oh,tsetupf,tsetupc,tsolve
 c*
@@ -204,6 +205,7 @@ c*    *** decode the iparm array ***
       mgsmoo = iparm(20)
       mgsolv = iparm(21)
       iperf  = iparm(22)
+      iguess = iparm(23)
       errtol = rparm(1)
       omegal = rparm(9)
       omegan = rparm(10)
@@ -335,15 +337,20 @@ c*       *** NOTE: due to lack of vectors, we destroy "fc" in mpower... ***
             call vnmprd(2,'% MGDRIV2: mpower rho(M) = ',27,rho_p)
          endif
 c*
-c*       *** reinitialize the solution function ***
-         call azeros(nxf,nyf,nzf,u(iz(1,level)))
+c*       *** reinitialize the solution function (but keep the fine ***
+c*       *** grid initial guess when warm starting) ***
+         if ((iguess .eq. 0) .or. (level .ne. 1)) then
+            call azeros(nxf,nyf,nzf,u(iz(1,level)))
+         endif
 c*
 c*    *** next grid ***
  40   continue
 c*    print*,'%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%'
 c*
-c*    *** reinitialize the solution function ***
-      call azeros(nx,ny,nz,u)
+c*    *** reinitialize the solution function (unless warm starting) ***
+      if (iguess .eq. 0) then
+         call azeros(nx,ny,nz,u)
+      endif
 c*
 c* ******************************************************************
 c* *** this overwrites the rhs array provided by pde specification
@@ -408,6 +415,9 @@ c*
 c*    *** stop timer ***
       call vtstop(30, 'MGDRIV2: solve', 14)
 c*
+c*    *** report the number of iterations used ***
+      iparm(24) = iters
+c*
 c*    *** MATLAB ***
 c*    write(*,100) 'mg_sf',tsetupf,'mg_sc',tsetupc,
 c*   2   'mg_st',(tsetupf+tsetupc),'mg_so',tsolve
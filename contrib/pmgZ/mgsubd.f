@@ -315,6 +315,9 @@ c*       *** contraction number ***
             contrac = rsnrm/orsnrm
          endif
 c*
+c*       *** record the iteration for Vpmg (see vpmg.c) ***
+         call vpmgstep(iters,relres)
+c*
 c*       *** the i/o ***
          if (iok .eq. 1) then
             call vnmpri(0, 'PMG: iteration = ', 17, iters)
@@ -282,6 +282,9 @@ c*
 c*    *** stop timer ***
       call vtstop(30, 'NEWDRIV2: solve', 15)
 c*
+c*    *** report the number of iterations used ***
+      iparm(24) = iters
+c*
 c*    *** MATLAB ***
 c*    write(*,100) 'new_sf',tsetupf,'new_sc',tsetupc,
 c*   2   'new_st',(tsetupf+tsetupc),'new_so',tsolve
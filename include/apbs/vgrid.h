@@ -64,6 +64,15 @@
  *  @ingroup Vgrid */
 #define VGRID_DIGITS 6
 
+/** @brief Size in bytes of the header of a binary grid file (see
+ *         Vgrid_writeBIN)
+ *  @ingroup Vgrid */
+#define VGRID_BINHEADER 128
+
+/** @brief Version of the binary grid file format written by Vgrid_writeBIN
+ *  @ingroup Vgrid */
+#define VGRID_BINVERSION 1
+
 /**
  *  @ingroup Vgrid
  *  @author  Nathan Baker
@@ -290,6 +299,46 @@ VEXTERNC void Vgrid_writeDX(Vgrid *thee, const char *iodev,
 VEXTERNC int Vgrid_readDX(Vgrid *thee, const char *iodev, const char *iofmt,
   const char *thost, const char *fname);
 
+/** @brief  Write out the data in the APBS binary grid format, which can be
+ *          memory-mapped when it is not compressed
+ *  @note   The file is a 128 byte header followed by the data.  All
+ *          numbers are little-endian.  The header holds:
+ *          \li  bytes 0-7:    the magic string "APBSGRID"
+ *          \li  bytes 8-31:   32-bit integers: the format version
+ *                            (VGRID_BINVERSION), the size of each value (4
+ *                            for float, 8 for double), nx, ny, nz and the
+ *                            compression (0 for none, 1 for zlib)
+ *          \li  bytes 32-79:  doubles: hx, hy, hzed, xmin, ymin, zmin
+ *          \li  bytes 80-127: the title, padded with NULs
+ *
+ *          Uncompressed data is the nx*ny*nz values with x varying
+ *          fastest (the order of the Vgrid data array).  Compressed data
+ *          is a table of nz 64-bit sizes followed by each z plane of
+ *          nx*ny values compressed separately with zlib.
+ *  @ingroup Vgrid
+ *  @author  Nathan Baker
+ *  @param   thee   Grid object
+ *  @param   fname  Output file name
+ *  @param   title  Title to be inserted in grid file (up to 47 characters)
+ *  @param   pvec   Partition weight, as for Vgrid_writeDX (VNULL to write
+ *                  all points)
+ *  @param   size   Bytes per value: 4 (float) or 8 (double)
+ *  @param   compress  1 to compress the z planes with zlib, 0 otherwise
+ *  @returns 1 if successful, 0 otherwise
+ */
+VEXTERNC int Vgrid_writeBIN(Vgrid *thee, const char *fname, char *title,
+  double *pvec, int size, int compress);
+
+/** @brief   Read in data in the APBS binary grid format (see
+ *           Vgrid_writeBIN)
+ *  @ingroup Vgrid
+ *  @author  Nathan Baker
+ *  @param   thee   Vgrid object
+ *  @param   fname  Input file name
+ *  @returns 1 if sucessful, 0 otherwise
+ */
+VEXTERNC int Vgrid_readBIN(Vgrid *thee, const char *fname);
+
 /**
  * @brief  Get the integral of the data
  * @ingroup  Vgrid
@@ -311,7 +311,10 @@ enum eVdata_Format {
     VDF_AVS=2,  /**< AVS UCD format */
 	VDF_MCSF=3,  /**< FEtk MC Simplex Format (MCSF) */
 	VDF_GZ=4,	/**< Binary file (GZip) */
-	VDF_FLAT=5  /**< Write flat file */ 
+	VDF_FLAT=5,  /**< Write flat file */ 
+	VDF_BIN=6,  /**< APBS binary grid, double values (see Vgrid_writeBIN) */
+	VDF_BIN32=7,  /**< APBS binary grid, float values */
+	VDF_BINZ=8  /**< APBS binary grid, double values compressed by plane */
 };
 
 /** @typedef Vdata_Format
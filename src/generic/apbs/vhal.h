@@ -311,7 +311,10 @@ enum eVdata_Format {
     VDF_AVS=2,  /**< AVS UCD format */
 	VDF_MCSF=3,  /**< FEtk MC Simplex Format (MCSF) */
 	VDF_GZ=4,	/**< Binary file (GZip) */
-	VDF_FLAT=5  /**< Write flat file */ 
+	VDF_FLAT=5,  /**< Write flat file */ 
+	VDF_BIN=6,  /**< APBS binary grid, double values (see Vgrid_writeBIN) */
+	VDF_BIN32=7,  /**< APBS binary grid, float values */
+	VDF_BINZ=8  /**< APBS binary grid, double values compressed by plane */
 };
 
 /** @typedef Vdata_Format
@@ -552,6 +555,20 @@ typedef enum eVdata_Format Vdata_Format;
 #     define VFLOOR(value) floor(value)
 #endif
 
+/* Thread-local storage */
+#if defined(__GNUC__) || defined(__INTEL_COMPILER)
+#   define VTHREADLOCAL __thread
+#elif defined(_MSC_VER)
+#   define VTHREADLOCAL __declspec(thread)
+#else
+    /** @brief  Storage class of static data that each thread keeps its own
+     *          copy of; empty (shared data) for compilers without
+     *          thread-local storage
+     *  @ingroup  Vhal
+     */
+#   define VTHREADLOCAL
+#endif
+
 /* String embedding for ident */
 #if defined(HAVE_EMBED)
 /**
@@ -636,6 +636,8 @@ VPRIVATE int NOsh_parseREAD_DIEL(NOsh *thee, Vio *sock) {
         dielfmt = VDF_DX;
 	} else if (Vstring_strcasecmp(tok, "gz") == 0) {
         dielfmt = VDF_GZ;
+	} else if (Vstring_strcasecmp(tok, "bin") == 0) {
+        dielfmt = VDF_BIN;
 	} else {
         Vnm_print(2, "NOsh_parseREAD:  Ignoring undefined format \
 				  %s!\n", tok);
@@ -687,6 +689,8 @@ VPRIVATE int NOsh_parseREAD_KAPPA(NOsh *thee, Vio *sock) {
         kappafmt = VDF_DX;
 	} else if (Vstring_strcasecmp(tok, "gz") == 0) {
         kappafmt = VDF_GZ;
+	} else if (Vstring_strcasecmp(tok, "bin") == 0) {
+        kappafmt = VDF_BIN;
 	} else {
         Vnm_print(2, "NOsh_parseREAD:  Ignoring undefined format \
 				  %s!\n", tok);
@@ -730,6 +734,8 @@ VPRIVATE int NOsh_parseREAD_POTENTIAL(NOsh *thee, Vio *sock) {
         potfmt = VDF_DX;
 	} else if (Vstring_strcasecmp(tok, "gz") == 0) {
         potfmt = VDF_GZ;
+	} else if (Vstring_strcasecmp(tok, "bin") == 0) {
+        potfmt = VDF_BIN;
 	} else {
         Vnm_print(2, "NOsh_parseREAD:  Ignoring undefined format \
 				  %s!\n", tok);
@@ -773,6 +779,8 @@ VPRIVATE int NOsh_parseREAD_CHARGE(NOsh *thee, Vio *sock) {
         chargefmt = VDF_DX;
 	} else if (Vstring_strcasecmp(tok, "gz") == 0) {
         chargefmt = VDF_GZ;
+	} else if (Vstring_strcasecmp(tok, "bin") == 0) {
+        chargefmt = VDF_BIN;
 	} else {
         Vnm_print(2, "NOsh_parseREAD:  Ignoring undefined format \
 				  %s!\n", tok);
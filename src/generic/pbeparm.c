@@ -1127,6 +1127,12 @@ VPRIVATE int PBEparm_parseWRITE(PBEparm *thee, Vio *sock) {
         writefmt = VDF_GZ;
     } else if (Vstring_strcasecmp(tok, "flat") == 0) {
         writefmt = VDF_FLAT;
+    } else if (Vstring_strcasecmp(tok, "bin") == 0) {
+        writefmt = VDF_BIN;
+    } else if (Vstring_strcasecmp(tok, "bin32") == 0) {
+        writefmt = VDF_BIN32;
+    } else if (Vstring_strcasecmp(tok, "binz") == 0) {
+        writefmt = VDF_BINZ;
     } else {
         Vnm_print(2, "PBEparm_parse:  Invalid data format (%s) to write!\n",
            tok);
@@ -76,6 +76,12 @@
  */
 #define VPMGMAXPART 2000  
 
+/** @def VPMGMAXCYCLE The maximum number of solver iterations recorded in
+ *                    Vpmg::cycleResid and Vpmg::cycleTime
+ *  @ingroup Vpmg
+ */
+#define VPMGMAXCYCLE 200
+
 /** 
  *  @ingroup Vpmg
  *  @author  Nathan Baker
@@ -153,6 +159,18 @@ struct sVpmg {
   int useChargeMap;  /**< Indicates whether Vpmg_fillco was called with an
                       * external charge distribution map */
   Vgrid *chargeMap;  /**< External charge distribution map */
+
+  int useGuess;  /**< Indicates whether u holds an initial guess for the
+                  * next Vpmg_solve (cleared by the solve) */
+  int iters;  /**< Number of iterations used by the last Vpmg_solve */
+  int ncycle;  /**< Number of iterations recorded in cycleResid and
+                * cycleTime (at most VPMGMAXCYCLE) */
+  double cycleResid[VPMGMAXCYCLE];  /**< Relative residual after each
+                                     * iteration of the last Vpmg_solve (a
+                                     * V-cycle for the linear multigrid
+                                     * solvers) */
+  double cycleTime[VPMGMAXCYCLE];  /**< CPU seconds of each iteration of
+                                    * the last Vpmg_solve */
 };
 
 /** 
@@ -262,9 +280,59 @@ VEXTERNC int Vpmg_fillco(
         Vgrid *chargeMap  /**< External charge map */
         );
 
+/** @brief   Prepare an existing Vpmg object for a new solve with a new
+ *           Vpbe object (after the atoms have moved, for example), reusing
+ *           its arrays.  Unlike Vpmg_ctor2, pmgOLD is not destroyed.  Call
+ *           Vpmg_fillco before solving.
+ *  @ingroup Vpmg
+ *  @author  Nathan Baker
+ *  @returns  1 if successful, 0 otherwise
+ */
+VEXTERNC int Vpmg_reset(
+        Vpmg *thee,  /**< Vpmg object */
+        Vpbe *pbe,  /**< PBE-specific variables */
+        int focusFlag,  /**< 1 for focusing, 0 otherwise */
+        Vpmg *pmgOLD,  /**< Old Vpmg object to use for boundary conditions */
+        MGparm *mgparm,  /**< MGparm parameter object for boundary conditions */
+        PBEparm_calcEnergy energyFlag  /**< What types of energies to calculate */
+        );
+
+/** @brief   Use the contents of a supplied array as the initial guess for
+ *           the next Vpmg_solve instead of zero.
+ *  @ingroup Vpmg
+ *  @author  Nathan Baker
+ *  @note    The guess is in units of kT/e and uses the same layout as
+ *           Vpmg::u; boundary values are ignored.  If guess is VNULL, the
+ *           current contents of Vpmg::u (e.g., the previous solution after
+ *           Vpmg_reset) are used.
+ */
+VEXTERNC void Vpmg_setGuess(
+        Vpmg *thee,  /**< Vpmg object */
+        double *guess  /**< nx*ny*nz initial guess array or VNULL */
+        );
+
+/** @brief   Interpolate a potential grid (e.g., a previous solution or an
+ *           OpenDX map in kT/e) onto the mesh as the initial guess for the
+ *           next Vpmg_solve.  Mesh points outside the grid start at zero.
+ *  @ingroup Vpmg
+ *  @author  Nathan Baker
+ *  @returns  1 if successful, 0 otherwise
+ */
+VEXTERNC int Vpmg_setGuessGrid(
+        Vpmg *thee,  /**< Vpmg object */
+        Vgrid *grid  /**< Potential grid */
+        );
+
 /** @brief   Solve the PBE using PMG
  *  @ingroup Vpmg
  *  @author  Nathan Baker
+ *  @note    Starts from zero unless Vpmg_setGuess or Vpmg_setGuessGrid was
+ *           called; the number of iterations used is stored in Vpmg::iters
+ *           and their residuals and times in Vpmg::cycleResid and
+ *           Vpmg::cycleTime.  Solves of different Vpmg objects may run in
+ *           different threads at the same time (but see Vpmg_ctor for the
+ *           nonlinear solvers); the times are process CPU times, so they
+ *           include the work of other threads
  *  @returns  1 if successful, 0 otherwise
  */
 VEXTERNC int Vpmg_solve(
@@ -1317,6 +1317,357 @@ will have significant overlap.\n");
     Vio_dtor(&sock);
 }
 
+/* Binary grid files (see Vgrid_writeBIN): values and header fields are
+ * stored little-endian whatever the byte order of the host */
+VPRIVATE char *VBINmagic = "APBSGRID";
+
+VPRIVATE int VBINbigEndian() {
+
+    int one = 1;
+
+    return (*(char *)&one == 0);
+}
+
+/* Store n doubles as little-endian floats (size 4) or doubles (size 8) */
+VPRIVATE void VBINpack(double *vals, int n, int size, unsigned char *buf) {
+
+    int i, b, big;
+    float ftmp;
+    unsigned char tmp[8];
+
+    big = VBINbigEndian();
+    for (i=0; i<n; i++) {
+        if (size == 4) {
+            ftmp = (float)vals[i];
+            memcpy(tmp, &ftmp, 4);
+        } else memcpy(tmp, &(vals[i]), 8);
+        for (b=0; b<size; b++) {
+            if (big) buf[i*size+b] = tmp[size-1-b];
+            else buf[i*size+b] = tmp[b];
+        }
+    }
+}
+
+/* Load n little-endian floats (size 4) or doubles (size 8) as doubles */
+VPRIVATE void VBINunpack(unsigned char *buf, int n, int size, double *vals) {
+
+    int i, b, big;
+    float ftmp;
+    unsigned char tmp[8];
+
+    big = VBINbigEndian();
+    for (i=0; i<n; i++) {
+        for (b=0; b<size; b++) {
+            if (big) tmp[size-1-b] = buf[i*size+b];
+            else tmp[b] = buf[i*size+b];
+        }
+        if (size == 4) {
+            memcpy(&ftmp, tmp, 4);
+            vals[i] = (double)ftmp;
+        } else memcpy(&(vals[i]), tmp, 8);
+    }
+}
+
+/* Store an unsigned integer in len little-endian bytes */
+VPRIVATE void VBINputInt(unsigned char *buf, unsigned long val, int len) {
+
+    int b;
+
+    for (b=0; b<len; b++) {
+        buf[b] = (unsigned char)(val & 0xff);
+        val = val >> 8;
+    }
+}
+
+VPRIVATE unsigned long VBINgetInt(unsigned char *buf, int len) {
+
+    int b;
+    unsigned long val;
+
+    val = 0;
+    for (b=len-1; b>=0; b--) val = (val << 8) | buf[b];
+    return val;
+}
+
+/* ///////////////////////////////////////////////////////////////////////////
+// Routine:  Vgrid_writeBIN
+//
+// Author:   Nathan Baker
+/////////////////////////////////////////////////////////////////////////// */
+VPUBLIC int Vgrid_writeBIN(Vgrid *thee, const char *fname, char *title,
+  double *pvec, int size, int compress) {
+
+    int i, j, k, u, nx, ny, nz, nplane, ilo, ihi, jlo, jhi, klo, khi;
+    int nxPART, nyPART, nzPART, rc;
+    unsigned long csize;
+    unsigned char header[VGRID_BINHEADER];
+    unsigned char *bytes, *table, *zbytes;
+    double *plane, vals[6];
+    FILE *fp;
+
+    if (thee == VNULL) {
+        Vnm_print(2, "Vgrid_writeBIN:  Error -- got VNULL thee!\n");
+        VASSERT(0);
+    }
+    if (!(thee->ctordata || thee->readdata)) {
+        Vnm_print(2, "Vgrid_writeBIN:  Error -- no data available!\n");
+        VASSERT(0);
+    }
+    if ((size != 4) && (size != 8)) {
+        Vnm_print(2, "Vgrid_writeBIN:  Invalid value size (%d)!\n", size);
+        return 0;
+    }
+#ifndef HAVE_ZLIB
+    if (compress) {
+        Vnm_print(2, "Vgrid_writeBIN:  compression needs zlib support; \
+configure and compile without the --disable-zlib flag.\n");
+        return 0;
+    }
+#endif
+
+    nx = thee->nx;
+    ny = thee->ny;
+    nz = thee->nz;
+
+    /* Find the lower and upper corners of the local partition, as
+     * Vgrid_writeDX does */
+    ilo = 0; ihi = nx-1;
+    jlo = 0; jhi = ny-1;
+    klo = 0; khi = nz-1;
+    if (pvec != VNULL) {
+        ilo = nx; ihi = -1;
+        jlo = ny; jhi = -1;
+        klo = nz; khi = -1;
+        for (k=0; k<nz; k++) {
+            for (j=0; j<ny; j++) {
+                for (i=0; i<nx; i++) {
+                    if (pvec[IJK(i,j,k)] > 0.0) {
+                        ilo = VMIN2(ilo, i); ihi = VMAX2(ihi, i);
+                        jlo = VMIN2(jlo, j); jhi = VMAX2(jhi, j);
+                        klo = VMIN2(klo, k); khi = VMAX2(khi, k);
+                    }
+                }
+            }
+        }
+        if (ihi < 0) {
+            Vnm_print(2, "Vgrid_writeBIN:  No points in the partition!\n");
+            return 0;
+        }
+    }
+    nxPART = ihi - ilo + 1;
+    nyPART = jhi - jlo + 1;
+    nzPART = khi - klo + 1;
+    nplane = nxPART*nyPART;
+
+    /* Fill in the header */
+    memset(header, 0, VGRID_BINHEADER);
+    memcpy(header, VBINmagic, 8);
+    VBINputInt(header+8, VGRID_BINVERSION, 4);
+    VBINputInt(header+12, (unsigned long)size, 4);
+    VBINputInt(header+16, (unsigned long)nxPART, 4);
+    VBINputInt(header+20, (unsigned long)nyPART, 4);
+    VBINputInt(header+24, (unsigned long)nzPART, 4);
+    VBINputInt(header+28, (unsigned long)(compress != 0), 4);
+    vals[0] = thee->hx;
+    vals[1] = thee->hy;
+    vals[2] = thee->hzed;
+    vals[3] = thee->xmin + ilo*thee->hx;
+    vals[4] = thee->ymin + jlo*thee->hy;
+    vals[5] = thee->zmin + klo*thee->hzed;
+    VBINpack(vals, 6, 8, header+32);
+    if (title != VNULL) strncpy((char *)header+80, title, 47);
+
+    fp = fopen(fname, "wb");
+    if (fp == VNULL) {
+        Vnm_print(2, "Vgrid_writeBIN:  Problem opening file %s\n", fname);
+        return 0;
+    }
+    Vnm_print(0, "Vgrid_writeBIN:  Writing %d x %d x %d grid to %s\n",
+      nxPART, nyPART, nzPART, fname);
+
+    plane = (double *)Vmem_malloc(thee->mem, nplane, sizeof(double));
+    bytes = (unsigned char *)Vmem_malloc(thee->mem, nplane*size, 1);
+    table = VNULL;
+    zbytes = VNULL;
+    csize = 0;
+    rc = (fwrite(header, 1, VGRID_BINHEADER, fp) == VGRID_BINHEADER);
+
+    /* Compressed files have a table of the compressed size of each z
+     * plane, filled in once the planes are written */
+#ifdef HAVE_ZLIB
+    if (compress) {
+        table = (unsigned char *)Vmem_malloc(thee->mem, nzPART*8, 1);
+        memset(table, 0, nzPART*8);
+        csize = compressBound((uLong)(nplane*size));
+        zbytes = (unsigned char *)Vmem_malloc(thee->mem, csize, 1);
+        rc = rc && (fwrite(table, 1, nzPART*8, fp) == (size_t)(nzPART*8));
+    }
+#endif
+
+    for (k=klo; (k<=khi) && rc; k++) {
+        u = 0;
+        for (j=jlo; j<=jhi; j++) {
+            for (i=ilo; i<=ihi; i++) {
+                plane[u] = thee->data[IJK(i,j,k)];
+                u++;
+            }
+        }
+        VBINpack(plane, nplane, size, bytes);
+        if (compress) {
+#ifdef HAVE_ZLIB
+            uLongf zlen = (uLongf)csize;
+            rc = (compress2(zbytes, &zlen, bytes, (uLong)(nplane*size),
+              Z_DEFAULT_COMPRESSION) == Z_OK);
+            rc = rc && (fwrite(zbytes, 1, zlen, fp) == (size_t)zlen);
+            VBINputInt(table+8*(k-klo), (unsigned long)zlen, 8);
+#endif
+        } else {
+            rc = (fwrite(bytes, 1, nplane*size, fp) == (size_t)(nplane*size));
+        }
+    }
+
+#ifdef HAVE_ZLIB
+    if (compress) {
+        rc = rc && (fseek(fp, VGRID_BINHEADER, SEEK_SET) == 0);
+        rc = rc && (fwrite(table, 1, nzPART*8, fp) == (size_t)(nzPART*8));
+        Vmem_free(thee->mem, nzPART*8, 1, (void **)&table);
+        Vmem_free(thee->mem, csize, 1, (void **)&zbytes);
+    }
+#endif
+    Vmem_free(thee->mem, nplane, sizeof(double), (void **)&plane);
+    Vmem_free(thee->mem, nplane*size, 1, (void **)&bytes);
+    if (fclose(fp) != 0) rc = 0;
+    if (!rc) {
+        Vnm_print(2, "Vgrid_writeBIN:  Problem writing to %s\n", fname);
+        return 0;
+    }
+    return 1;
+}
+
+/* ///////////////////////////////////////////////////////////////////////////
+// Routine:  Vgrid_readBIN
+//
+// Author:   Nathan Baker
+/////////////////////////////////////////////////////////////////////////// */
+VPUBLIC int Vgrid_readBIN(Vgrid *thee, const char *fname) {
+
+    int k, nx, ny, nz, nplane, size, compress;
+    unsigned long csize, maxsize;
+    unsigned char header[VGRID_BINHEADER];
+    unsigned char *bytes, *table, *zbytes;
+    double vals[6];
+    FILE *fp;
+
+    /* Check to see if the existing data is null and, if not, clear it out */
+    if (thee->data != VNULL) {
+        Vnm_print(1, "Vgrid_readBIN:  destroying existing data!\n");
+        Vmem_free(thee->mem, (thee->nx*thee->ny*thee->nz), sizeof(double),
+          (void **)&(thee->data));
+    }
+    /* The grid owns no data until the header has been read */
+    thee->readdata = 0;
+    thee->ctordata = 0;
+
+    fp = fopen(fname, "rb");
+    if (fp == VNULL) {
+        Vnm_print(2, "Vgrid_readBIN:  Problem opening file %s\n", fname);
+        return 0;
+    }
+    if ((fread(header, 1, VGRID_BINHEADER, fp) != VGRID_BINHEADER) ||
+      (memcmp(header, VBINmagic, 8) != 0)) {
+        Vnm_print(2, "Vgrid_readBIN:  %s is not a binary grid file!\n", fname);
+        fclose(fp);
+        return 0;
+    }
+    size = (int)VBINgetInt(header+12, 4);
+    nx = (int)VBINgetInt(header+16, 4);
+    ny = (int)VBINgetInt(header+20, 4);
+    nz = (int)VBINgetInt(header+24, 4);
+    compress = (int)VBINgetInt(header+28, 4);
+    if ((VBINgetInt(header+8, 4) != VGRID_BINVERSION) ||
+      ((size != 4) && (size != 8)) || (nx < 1) || (ny < 1) || (nz < 1) ||
+      (compress < 0) || (compress > 1)) {
+        Vnm_print(2, "Vgrid_readBIN:  Unsupported or bad header in %s!\n",
+          fname);
+        fclose(fp);
+        return 0;
+    }
+#ifndef HAVE_ZLIB
+    if (compress) {
+        Vnm_print(2, "Vgrid_readBIN:  %s is compressed, which needs zlib \
+support; configure and compile without the --disable-zlib flag.\n", fname);
+        fclose(fp);
+        return 0;
+    }
+#endif
+    VBINunpack(header+32, 6, 8, vals);
+    thee->nx = nx;
+    thee->ny = ny;
+    thee->nz = nz;
+    thee->hx = vals[0];
+    thee->hy = vals[1];
+    thee->hzed = vals[2];
+    thee->xmin = vals[3];
+    thee->ymin = vals[4];
+    thee->zmin = vals[5];
+    thee->xmax = thee->xmin + (nx-1)*thee->hx;
+    thee->ymax = thee->ymin + (ny-1)*thee->hy;
+    thee->zmax = thee->zmin + (nz-1)*thee->hzed;
+    thee->data = (double *)Vmem_malloc(thee->mem, nx*ny*nz, sizeof(double));
+    VASSERT(thee->data != VNULL);
+    thee->readdata = 1;
+
+    nplane = nx*ny;
+    bytes = (unsigned char *)Vmem_malloc(thee->mem, nplane*size, 1);
+    table = VNULL;
+    zbytes = VNULL;
+    maxsize = 0;
+
+#ifdef HAVE_ZLIB
+    if (compress) {
+        table = (unsigned char *)Vmem_malloc(thee->mem, nz*8, 1);
+        VJMPERR1(fread(table, 1, nz*8, fp) == (size_t)(nz*8));
+        for (k=0; k<nz; k++) {
+            csize = VBINgetInt(table+8*k, 8);
+            if (csize > maxsize) maxsize = csize;
+        }
+        zbytes = (unsigned char *)Vmem_malloc(thee->mem, maxsize, 1);
+    }
+#endif
+
+    for (k=0; k<nz; k++) {
+        if (compress) {
+#ifdef HAVE_ZLIB
+            uLongf zlen = (uLongf)(nplane*size);
+            csize = VBINgetInt(table+8*k, 8);
+            VJMPERR1(fread(zbytes, 1, csize, fp) == (size_t)csize);
+            VJMPERR1(uncompress(bytes, &zlen, zbytes, (uLong)csize) == Z_OK);
+            VJMPERR1(zlen == (uLongf)(nplane*size));
+#endif
+        } else {
+            VJMPERR1(fread(bytes, 1, nplane*size, fp) ==
+              (size_t)(nplane*size));
+        }
+        VBINunpack(bytes, nplane, size, &(thee->data[k*nplane]));
+    }
+
+    if (table != VNULL) Vmem_free(thee->mem, nz*8, 1, (void **)&table);
+    if (zbytes != VNULL) Vmem_free(thee->mem, maxsize, 1, (void **)&zbytes);
+    Vmem_free(thee->mem, nplane*size, 1, (void **)&bytes);
+    fclose(fp);
+    return 1;
+
+    VERROR1:
+        Vnm_print(2, "Vgrid_readBIN:  Format problem with binary grid file %s\n",
+          fname);
+        if (table != VNULL) Vmem_free(thee->mem, nz*8, 1, (void **)&table);
+        if (zbytes != VNULL) Vmem_free(thee->mem, maxsize, 1,
+          (void **)&zbytes);
+        Vmem_free(thee->mem, nplane*size, 1, (void **)&bytes);
+        fclose(fp);
+        return 0;
+}
+
 VPUBLIC double Vgrid_integrate(Vgrid *thee) {
 
     int i, j, k, nx, ny, nz;
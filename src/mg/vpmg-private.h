@@ -170,6 +170,29 @@ VPRIVATE void Vpmg_splineSelect(
 		double *force	/** Force array -> array[3] */
 		);
 
+/**
+ * @brief  Fill in the boundaries and external energies of a focusing
+ * calculation from pmgOLD, or clear the external energies if focusFlag is 0
+ * @author  Nathan Baker
+ */
+VPRIVATE void setupFocus(
+		Vpmg *thee, /** Vpmg object */
+		int focusFlag, /** 1 for focusing, 0 otherwise */
+		Vpmg *pmgOLD, /** Old Vpmg object to use for boundary conditions */
+		MGparm *mgparm, /** MGparm parameter object */
+		PBEparm_calcEnergy energyFlag /** What types of energies to calculate */
+		);
+
+/**
+ * @brief  Pass the solver parameters and ion species of thee to PMG and
+ * mark the coefficient arrays as unfilled
+ * @author  Nathan Baker
+ */
+VPRIVATE void setupParams(
+		Vpmg *thee, /** Vpmg object */
+		MGparm *mgparm /** MGparm parameter object */
+		);
+
 /**
  * @brief  For focusing, fill in the boundaries of the new mesh based on the
  * potential values in the old mesh
@@ -639,5 +662,13 @@ VEXTERNC void F77MYPDEFINITSMPBE(int *nion, double *ionQ, double *ionConc,
 #define F77MYPDEFCLEAR VF77_MANGLE(mypdefclear, MYPDEFCLEAR)
 VEXTERNC void F77MYPDEFCLEAR();
 
+/** @brief   Record an iteration of the running Vpmg_solve; called by the
+ *           PMG routine prtstp before (iters = 0) and after each
+ *           iteration
+ *  @ingroup Vpmg
+ *  @author  Nathan Baker */
+#define F77VPMGSTEP VF77_MANGLE(vpmgstep, VPMGSTEP)
+VEXTERNC void F77VPMGSTEP(int *iters, double *relres);
+
 #endif
 
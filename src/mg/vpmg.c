@@ -131,10 +131,6 @@ VPUBLIC Vpmg* Vpmg_ctor(Vpmgp *pmgp, Vpbe *pbe, int focusFlag,
 VPUBLIC int Vpmg_ctor2(Vpmg *thee, Vpmgp *pmgp, Vpbe *pbe, int focusFlag,
 					   Vpmg *pmgOLD, MGparm *mgparm, PBEparm_calcEnergy energyFlag) {
 	
-    int i, j, nion;
-    double ionConc[MAXION], ionQ[MAXION], ionRadii[MAXION], zkappa2, zks2;
-    double ionstr, partMin[3], partMax[3];
-	
     /* Get the parameters */
     VASSERT(pmgp != VNULL);
     VASSERT(pbe != VNULL);
@@ -198,49 +194,7 @@ VPUBLIC int Vpmg_ctor2(Vpmg *thee, Vpmgp *pmgp, Vpbe *pbe, int focusFlag,
 	if (thee->pmgp->bcfl == BCFL_MAP)
 		Vnm_print(2,"Vpmg_ctor2: \nWarning: External energies are not used in BCFL_MAP calculations!\n");
 	
-	if (focusFlag) {
-		/* Overwrite any default or user-specified boundary condition
-		* arguments; we are now committed to a calculation via focusing */
-		if (thee->pmgp->bcfl != BCFL_FOCUS) {
-			Vnm_print(2, 
-					  "Vpmg_ctor2: reset boundary condition flag to BCFL_FOCUS!\n");
-			thee->pmgp->bcfl = BCFL_FOCUS;
-		}
-		
-		/* Fill boundaries */
-		Vnm_print(0, "Vpmg_ctor2:  Filling boundary with old solution!\n");
-		focusFillBound(thee, pmgOLD);
-		
-		/* Calculate energetic contributions from region outside focusing
-			* domain */
-		if (energyFlag != PCE_NO) {
-			
-			if (mgparm->type == MCT_PARALLEL) {
-				
-				for (j=0; j<3; j++) {
-					partMin[j] = mgparm->partDisjCenter[j]
-					- 0.5*mgparm->partDisjLength[j];
-					partMax[j] = mgparm->partDisjCenter[j]
-						+ 0.5*mgparm->partDisjLength[j];
-				}
-				
-			} else {
-				for (j=0; j<3; j++) {
-					partMin[j] = mgparm->center[j] - 0.5*mgparm->glen[j];
-					partMax[j] = mgparm->center[j] + 0.5*mgparm->glen[j];
-				}
-			}
-			extEnergy(thee, pmgOLD, energyFlag, partMin, partMax, 
-					  mgparm->partDisjOwnSide);
-		}
-		
-	} else {
-		
-		/* Ignore external energy contributions */
-		thee->extQmEnergy = 0;
-		thee->extDiEnergy = 0;
-		thee->extQfEnergy = 0;
-	}
+	setupFocus(thee, focusFlag, pmgOLD, mgparm, energyFlag);
 
 	/*
 	 * TODO: Move the dtor out of here. The current ctor is done in routines.c,
@@ -294,6 +248,89 @@ VPUBLIC int Vpmg_ctor2(Vpmg *thee, Vpmgp *pmgp, Vpbe *pbe, int focusFlag,
 	thee->zf = (double *)Vmem_malloc(thee->vmem, 5*(thee->pmgp->nz),
 									 sizeof(double));
 	
+	/* Start from a zero initial guess */
+	thee->useGuess = 0;
+	thee->iters = 0;
+	thee->ncycle = 0;
+
+	setupParams(thee, mgparm);
+
+	return 1;
+}
+
+VPUBLIC int Vpmg_reset(Vpmg *thee, Vpbe *pbe, int focusFlag, Vpmg *pmgOLD,
+					   MGparm *mgparm, PBEparm_calcEnergy energyFlag) {
+
+    VASSERT(thee != VNULL);
+    VASSERT(pbe != VNULL);
+    thee->pbe = pbe;
+
+    /* Unlike Vpmg_ctor2, keep pmgOLD */
+    setupFocus(thee, focusFlag, pmgOLD, mgparm, energyFlag);
+    setupParams(thee, mgparm);
+
+    return 1;
+}
+
+VPRIVATE void setupFocus(Vpmg *thee, int focusFlag, Vpmg *pmgOLD,
+						 MGparm *mgparm, PBEparm_calcEnergy energyFlag) {
+
+    int j;
+    double partMin[3], partMax[3];
+
+	if (focusFlag) {
+		/* Overwrite any default or user-specified boundary condition
+		* arguments; we are now committed to a calculation via focusing */
+		if (thee->pmgp->bcfl != BCFL_FOCUS) {
+			Vnm_print(2, 
+					  "Vpmg_ctor2: reset boundary condition flag to BCFL_FOCUS!\n");
+			thee->pmgp->bcfl = BCFL_FOCUS;
+		}
+		
+		/* Fill boundaries */
+		Vnm_print(0, "Vpmg_ctor2:  Filling boundary with old solution!\n");
+		focusFillBound(thee, pmgOLD);
+		
+		/* Calculate energetic contributions from region outside focusing
+			* domain */
+		if (energyFlag != PCE_NO) {
+			
+			if (mgparm->type == MCT_PARALLEL) {
+				
+				for (j=0; j<3; j++) {
+					partMin[j] = mgparm->partDisjCenter[j]
+					- 0.5*mgparm->partDisjLength[j];
+					partMax[j] = mgparm->partDisjCenter[j]
+						+ 0.5*mgparm->partDisjLength[j];
+				}
+				
+			} else {
+				for (j=0; j<3; j++) {
+					partMin[j] = mgparm->center[j] - 0.5*mgparm->glen[j];
+					partMax[j] = mgparm->center[j] + 0.5*mgparm->glen[j];
+				}
+			}
+			extEnergy(thee, pmgOLD, energyFlag, partMin, partMax, 
+					  mgparm->partDisjOwnSide);
+		}
+		
+	} else {
+		
+		/* Ignore external energy contributions */
+		thee->extQmEnergy = 0;
+		thee->extDiEnergy = 0;
+		thee->extQfEnergy = 0;
+	}
+}
+
+VPRIVATE void setupParams(Vpmg *thee, MGparm *mgparm) {
+
+    int i, nion;
+    double ionConc[MAXION], ionQ[MAXION], ionRadii[MAXION], zkappa2, zks2;
+    double ionstr;
+    Vpmgp *pmgp = thee->pmgp;
+    Vpbe *pbe = thee->pbe;
+
 	/* Plop some of the parameters into the iparm and rparm arrays */
 	F77PACKMG(thee->iparm, thee->rparm, &(thee->pmgp->nrwk), &(thee->pmgp->niwk),
 			  &(thee->pmgp->nx), &(thee->pmgp->ny), &(thee->pmgp->nz),
@@ -344,10 +381,65 @@ VPUBLIC int Vpmg_ctor2(Vpmg *thee, Vpmgp *pmgp, Vpbe *pbe, int focusFlag,
 
 	/* The coefficient arrays have not been filled */
 	thee->filled = 0;
+}
 
-	return 1;
+VPUBLIC void Vpmg_setGuess(Vpmg *thee, double *guess) {
+
+    int i, n;
+
+    VASSERT(thee != VNULL);
+
+    if (guess != VNULL) {
+        n = (thee->pmgp->nx)*(thee->pmgp->ny)*(thee->pmgp->nz);
+        for (i=0; i<n; i++) thee->u[i] = guess[i];
+    }
+    thee->useGuess = 1;
 }
 
+VPUBLIC int Vpmg_setGuessGrid(Vpmg *thee, Vgrid *grid) {
+
+    int i, j, k, nx, ny, nz;
+    double hx, hy, hzed, xmin, ymin, zmin, position[3], value;
+
+    VASSERT(thee != VNULL);
+
+    if (grid == VNULL) {
+        Vnm_print(2, "Vpmg_setGuessGrid:  Got VNULL grid!\n");
+        return 0;
+    }
+
+    nx = thee->pmgp->nx;
+    ny = thee->pmgp->ny;
+    nz = thee->pmgp->nz;
+    hx = thee->pmgp->hx;
+    hy = thee->pmgp->hy;
+    hzed = thee->pmgp->hzed;
+    xmin = thee->pmgp->xcent - 0.5*hx*(nx-1);
+    ymin = thee->pmgp->ycent - 0.5*hy*(ny-1);
+    zmin = thee->pmgp->zcent - 0.5*hzed*(nz-1);
+
+    for (k=0; k<nz; k++) {
+        position[2] = zmin + k*hzed;
+        for (j=0; j<ny; j++) {
+            position[1] = ymin + j*hy;
+            for (i=0; i<nx; i++) {
+                position[0] = xmin + i*hx;
+                if (!Vgrid_value(grid, position, &value)) value = 0.0;
+                thee->u[IJK(i,j,k)] = value;
+            }
+        }
+    }
+    thee->useGuess = 1;
+
+    return 1;
+}
+
+/* The Vpmg that this thread is solving, and the time of its last iteration.
+ * F77VPMGSTEP records the iterations straight into it; each thread has its
+ * own copy, so Vpmg_solve may run in several threads at once. */
+VPRIVATE VTHREADLOCAL Vpmg *stepPmg = VNULL;
+VPRIVATE VTHREADLOCAL clock_t stepClock;
+
 VPUBLIC int Vpmg_solve(Vpmg *thee) {
 
     int i, nx, ny, nz, n;
@@ -393,6 +485,17 @@ VPUBLIC int Vpmg_solve(Vpmg *thee) {
         }
     }
 
+    /* Start from zero unless an initial guess was supplied; the drivers
+     * report the number of iterations in iparm[23] */
+    if (!(thee->useGuess)) {
+        for (i=0; i<n; i++) thee->u[i] = 0.0;
+    }
+    thee->iparm[22] = thee->useGuess;
+    thee->iparm[23] = 0;
+    thee->ncycle = 0;
+    stepPmg = thee;
+    stepClock = clock();
+
     switch(thee->pmgp->meth) {
         /* CGMG (linear) */
         case VSOL_CGMG:
@@ -475,14 +578,39 @@ VPUBLIC int Vpmg_solve(Vpmg *thee) {
         default: 
             Vnm_print(2, "Vpmg_solve: invalid solver method key (%d)\n",
               thee->pmgp->key);
+            stepPmg = VNULL;
             return 0;
             break;
     }
 
+    stepPmg = VNULL;
+    thee->iters = thee->iparm[23];
+    thee->useGuess = 0;
+
     return 1;
 
 }
 
+VPUBLIC void F77VPMGSTEP(int *iters, double *relres) {
+
+    clock_t now;
+    Vpmg *thee;
+
+    thee = stepPmg;
+    if (thee == VNULL) return;
+
+    /* Iteration 0 is the initial residual, after the solver setup */
+    now = clock();
+    if ((*iters > 0) && (thee->ncycle < VPMGMAXCYCLE)) {
+        thee->cycleResid[thee->ncycle] = *relres;
+        thee->cycleTime[thee->ncycle] =
+          (double)(now - stepClock)/(double)CLOCKS_PER_SEC;
+        (thee->ncycle)++;
+    }
+    stepClock = now;
+
+}
+
     
 VPUBLIC void Vpmg_dtor(Vpmg **thee) {
     
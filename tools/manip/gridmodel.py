@@ -0,0 +1,127 @@
+"""
+gridmodel.py
+Memory and run time estimates for APBS multigrid calculations
+
+Used by psize.py and inputgen.py, and installed next to ApbsClient.py for
+its memory check.
+
+"""
+
+# Run time model coefficients for each PBE type, in seconds: "solve" per
+# point of the multigrid hierarchy and solve, "band" per flop of the banded
+# coarse-grid factorization, "setup" per fine grid point and solve, "atom"
+# per atom and solve, and "force" per fine grid point and atom-independent
+# force pass plus "forceatom" per atom.  These are rough single-core values;
+# use GridModel.calibrate with timings from the target machine.
+MODELCOEFFS = {
+	"lpbe": {"solve": 2.0e-6, "band": 1.0e-9, "setup": 1.0e-6,
+		"atom": 2.0e-5, "force": 1.0e-6, "forceatom": 5.0e-5},
+	"npbe": {"solve": 6.0e-6, "band": 0.0, "setup": 1.0e-6,
+		"atom": 2.0e-5, "force": 1.0e-6, "forceatom": 5.0e-5},
+}
+
+# Bytes per atom for the atom list, accessibility and force storage
+ATOMBYTES = 400
+FORCEBYTES = 96
+
+class GridModel:
+	"""Memory and run time model for one APBS multigrid calculation.  The
+	memory estimate follows the work array sizes of Vpmgp_size and
+	Vpmg_ctor2 for the given PBE type ("lpbe" or "npbe"), so it replaces a
+	fixed number of bytes per grid point; the run time estimate is a sum of
+	per-point and per-atom costs from MODELCOEFFS.
+
+	gmemfac, if given, brings back the old fixed estimate of that many
+	bytes per fine grid point (the deprecated --gmemfac option of psize.py
+	and inputgen.py)"""
+	def __init__(self, pbe="lpbe", force=0, gmemfac=None):
+		self.pbe = pbe
+		self.force = force
+		self.gmemfac = gmemfac
+		self.coeffs = MODELCOEFFS[pbe].copy()
+
+	def getLevels(self, dime):
+		""" Number of multigrid levels APBS uses for dime, as computed by
+		MGparm_check """
+		nlev = None
+		for n in dime:
+			ti = int(n) - 1
+			levels = 0
+			while ti > 0 and ti % 2 == 0:
+				levels = levels + 1
+				ti = ti / 2
+			levels = levels - 1
+			if nlev == None or levels < nlev:
+				nlev = levels
+		return nlev
+
+	def getHierarchy(self, dime):
+		""" Return (nf, narr, coarse), the number of fine grid points, the
+		number of points on all levels and the coarsest grid dimensions """
+		nlev = self.getLevels(dime)
+		nf = dime[0] * dime[1] * dime[2]
+		narr = nf
+		coarse = list(dime)
+		for level in range(2, nlev + 1):
+			for i in range(3):
+				coarse[i] = (coarse[i] - 1) / 2 + 1
+			narr = narr + coarse[0] * coarse[1] * coarse[2]
+		return nf, narr, coarse
+
+	def getBand(self, coarse):
+		""" Return (nc_band, num_band), the size and bandwidth of the banded
+		coarse grid matrix (zero for npbe, which does not factor it) """
+		if self.pbe != "lpbe":
+			return 0, 0
+		nc_band = (coarse[0] - 2) * (coarse[1] - 2) * (coarse[2] - 2)
+		num_band = 1 + (coarse[0] - 2) * (coarse[1] - 2) + (coarse[0] - 2) + 1
+		return nc_band, num_band
+
+	def getBytes(self, dime, natom=0):
+		""" Estimated memory in bytes for a calculation on a dime grid """
+		nf, narr, coarse = self.getHierarchy(dime)
+		if self.gmemfac != None:
+			return float(self.gmemfac)*nf
+		nlev = self.getLevels(dime)
+		nc_band, num_band = self.getBand(coarse)
+		narrc = narr - nf
+		# Real work array (Vpmgp_size with mgdisc 0, mgcoar 2)
+		nrwk = 2*narr + 4*nf + (27 + 14)*narrc + nc_band*num_band + 100*(nlev + 1)
+		# Coefficient, charge, potential and partition arrays
+		ndouble = nrwk + 13*narr + nf
+		# Boundary and interpolation arrays
+		ndouble = ndouble + 10*(dime[1]*dime[2] + dime[0]*dime[2] + dime[0]*dime[1])
+		ndouble = ndouble + 5*(dime[0] + dime[1] + dime[2])
+		nbytes = 8.0*ndouble + 4.0*150*(nlev + 1) + ATOMBYTES*natom
+		if self.force:
+			nbytes = nbytes + FORCEBYTES*natom
+		return nbytes
+
+	def getMemory(self, dime, natom=0):
+		""" Estimated memory in MB for a calculation on a dime grid """
+		return self.getBytes(dime, natom) / 1024.0 / 1024.0
+
+	def getTime(self, dime, nsolve=1, natom=0):
+		""" Estimated run time in seconds for nsolve solves (one per
+		focusing level) on a dime grid """
+		nf, narr, coarse = self.getHierarchy(dime)
+		nc_band, num_band = self.getBand(coarse)
+		c = self.coeffs
+		t = c["solve"]*narr + c["band"]*nc_band*num_band*num_band
+		t = t + c["setup"]*nf + c["atom"]*natom
+		if self.force:
+			t = t + c["force"]*nf + c["forceatom"]*natom
+		return nsolve * t
+
+	def calibrate(self, samples):
+		""" Rescale the run time coefficients to fit measured timings, given
+		as a list of (dime, nsolve, natom, seconds) tuples """
+		num = 0.0
+		den = 0.0
+		for dime, nsolve, natom, seconds in samples:
+			t = self.getTime(dime, nsolve, natom)
+			num = num + t*seconds
+			den = den + t*t
+		if den > 0.0:
+			for key in self.coeffs.keys():
+				self.coeffs[key] = self.coeffs[key] * num / den
@@ -18,8 +18,6 @@
 # fadd = 20                   # Amount to add to mol dims to get fine
                               # grid dims
 # space = 0.50                # Desired fine mesh resolution
-# gmemfac = 200               # Number of bytes per grid point required 
-                              # for sequential MG calculation 
 # gmemceil = 400              # Max MB allowed for sequential MG
                               # calculation.  Adjust this to force the
                               # script to perform faster calculations (which
@@ -28,10 +26,13 @@
 # redfac = 0.25               # The maximum factor by which a domain
                               # dimension can be reduced during focusing
 
-import string, sys
+import string, sys, os, itertools, copy
 import psize
 import pickle
 
+# File extensions APBS uses for each "write" format
+WRITEEXT = {"dx": "dx", "gz": "dx.gz", "uhbd": "grd", "avs": "ucd", "mcsf": "mcsf"}
+
 class Elec:
     """
         An object for the ELEC section of an APBS input file
@@ -47,7 +48,10 @@ class Elec:
         # the per-grid dime rather than the global dime.
         
         self.dime = size.getFineGridPoints()
-        gmem = 200.0 * self.dime[0] * self.dime[1] * self.dime[2] / 1024.0 / 1024.0
+        gmem = size.model.getMemory(self.dime, size.gotatom)
+        plan = size.getPlan()
+        if method == "" and plan != None: # use the planned settings
+            method = plan["method"]
         if method == "": # method not named - use ceiling
             if gmem > size.getConstant("gmemceil"): method = "mg-para"
             else: method = "mg-auto"
@@ -61,10 +65,14 @@ class Elec:
         self.cglen = size.getCoarseGridDims()
         self.fglen = size.getFineGridDims()
         self.pdime = size.getProcGrid()
+        self.nlev = size.model.getLevels(self.dime)
+        if plan != None and method == plan["method"]:
+            self.dime = plan["dime"]
+            self.pdime = plan["pdime"]
+            self.nlev = plan["nlev"]
         
         self.label = ""
-        self.nlev = 4
-        self.ofrac = 0.1
+        self.ofrac = size.getConstant("ofrac")
         self.async = 0
         self.asyncflag = asyncflag
         self.cgcent = "mol 1"
@@ -110,7 +118,7 @@ class Elec:
             text += "    fgcent %s\n" % self.fgcent
         elif self.method == "mg-para":
             text += "    pdime %i %i %i\n" % (self.pdime[0], self.pdime[1], self.pdime[2])
-            text += "    ofrac %.1f\n" % self.ofrac
+            text += "    ofrac %g\n" % self.ofrac
             text += "    cglen %.4f %.4f %.4f\n" % (self.cglen[0], self.cglen[1], self.cglen[2])
             text += "    fglen %.4f %.4f %.4f\n" % (self.fglen[0], self.fglen[1], self.fglen[2])
             text += "    cgcent %s\n" % self.cgcent
@@ -138,6 +146,30 @@ class Elec:
             text += "    write %s %s %s\n" % (write[0], write[1], write[2])
         text += "end\n"
         return text
+
+    def getChain(self, schedule):
+        """
+            Return a list of mg-manual Elec objects, one for each level of
+            a focusing schedule (see psize.Psize.setSchedule), from the
+            coarsest to the finest.  Only the last level computes energies
+            and forces and writes maps.
+        """
+        chain = []
+        for k in range(len(schedule)):
+            level = schedule[k]
+            elec = copy.copy(self)
+            elec.method = "mg-manual"
+            elec.dime = level["dime"]
+            elec.nlev = level["nlev"]
+            elec.glen = level["glen"]
+            elec.gcent = "%.4f %.4f %.4f" % tuple(level["center"])
+            elec.bcfl = level["bcfl"]
+            if k < len(schedule) - 1:
+                elec.calcenergy = "no"
+                elec.calcforce = "no"
+                elec.write = []
+            chain.append(elec)
+        return chain
         
 class Input:
     """
@@ -169,6 +201,8 @@ class Input:
 
         self.pqrpath = pqrpath
         self.asyncflag = asyncflag
+        self.model = size.model
+        self.natom = size.gotatom
 
         # Initialize variables to default elec values
 
@@ -189,6 +223,16 @@ class Input:
         else:
             self.prints = []
 
+        # Replace each calculation by a chain of focusing levels if
+        # one was planned
+        schedule = size.getSchedule()
+        if schedule != None and method in ["", "mg-manual"]:
+            self.elecs = [elec.getChain(schedule) for elec in self.elecs if elec != ""]
+            self.elecs = reduce(lambda a, b: a + b, self.elecs)
+            if potdx == 0:
+                nlevels = len(schedule)
+                self.prints = ["print elecEnergy %i - %i end" % (2*nlevels, nlevels)]
+
     def __str__(self):
         """
             Return the text of the input file
@@ -240,6 +284,92 @@ class Input:
             file.write(str(self))
             file.close()
 
+    def getTasks(self):
+        """
+            Return a list of dictionaries describing the jobs made by
+            printInputFiles: the input file, number of processors,
+            estimated memory per processor (MB), grid points per
+            processor, the output files and the names of the tasks that
+            must finish first.  Async runs get one task per processor
+            plus, if potentials are written, a merge task depending on
+            all of them.
+        """
+        period = string.find(self.pqrpath,".")
+        if period > 0:
+            stem = self.pqrpath[0:period]
+        else:
+            stem = self.pqrpath
+        elecs = [elec for elec in self.elecs if elec != ""]
+        memory = 0.0
+        gridpoints = 0
+        for elec in elecs:
+            memory = max(memory, self.model.getMemory(elec.dime, self.natom))
+            gridpoints = max(gridpoints, elec.dime[0] * elec.dime[1] * elec.dime[2])
+
+        def outputs(suffix):
+            files = []
+            for elec in elecs:
+                for write in elec.write:
+                    files.append("%s%s.%s" % (write[2], suffix, WRITEEXT.get(write[1], write[1])))
+            return files
+
+        tasks = []
+        if self.asyncflag == 1:
+            elec = elecs[0]
+            nproc = int(elec.pdime[0] * elec.pdime[1] * elec.pdime[2])
+            for i in range(nproc):
+                tasks.append({"name": "%s-PE%i" % (stem, i),
+                              "input": "%s-PE%i.in" % (stem, i),
+                              "nproc": 1, "async": i,
+                              "memory": memory, "gridpoints": gridpoints,
+                              "outputs": outputs("-PE%i" % i),
+                              "depends": []})
+            for write in elec.write:
+                tasks.append({"name": "%s-merge-%s" % (stem, write[2]),
+                              "command": "mergedx.py --out=%s.dx %s-para.in %s-PE" % (write[2], stem, write[2]),
+                              "nproc": 1, "memory": 0.0, "gridpoints": 0,
+                              "outputs": ["%s.dx" % write[2]],
+                              "depends": [task["name"] for task in tasks if task.has_key("async")]})
+        else:
+            if period > 0:
+                name = stem
+            else:
+                name = self.pqrpath
+            nproc = 1
+            suffix = ""
+            if elecs[0].method == "mg-para":
+                nproc = int(elecs[0].pdime[0] * elecs[0].pdime[1] * elecs[0].pdime[2])
+            if nproc > 1:
+                files = []
+                for i in range(nproc):
+                    files.extend(outputs("-PE%i" % i))
+            else:
+                files = outputs("")
+            tasks.append({"name": name, "input": "%s.in" % name,
+                          "nproc": nproc, "memory": memory,
+                          "gridpoints": gridpoints, "outputs": files,
+                          "depends": []})
+        return tasks
+
+    def printManifest(self):
+        """
+            Write a JSON manifest of the jobs made by printInputFiles (see
+            getTasks) for use by batch schedulers
+        """
+        import json
+        period = string.find(self.pqrpath,".")
+        if period > 0:
+            outname = self.pqrpath[0:period] + "-manifest.json"
+        else:
+            outname = self.pqrpath + "-manifest.json"
+        manifest = {"pqr": self.pqrname, "natom": self.natom,
+                    "method": self.elecs[0].method, "async": self.asyncflag,
+                    "tasks": self.getTasks()}
+        file = open(outname, "w")
+        json.dump(manifest, file, indent=1, sort_keys=True)
+        file.write("\n")
+        file.close()
+
     def dumpPickle(self):
         """
             Make a Python pickle associated with the APBS input parameters
@@ -253,38 +383,243 @@ class Input:
         pickle.dump(self, pfile)
         pfile.close()
 
-def splitInput(filename):
+def sizeEnsemble(filename, size):
+    """
+        Size the union of all frames of an ensemble (an MD trajectory, for
+        example) in one pass, so every frame can be given the same grid.
+
+        Parameters
+            filename:  Either a multi-model PDB/PQR file (MODEL/ENDMDL
+                       records), which is split into <name>-model<i>.pqr
+                       files while it is sized, or a directory or list
+                       of frame files as read by psize.readManifest
+                       (string)
+            size:      The Psize object; setAll has been called on return
+                       (psize)
+        Returns
+            frames:    The paths of the frame files (list)
+    """
+    frames = []
+    counts = []
+    if isStructure(filename):
+        period = string.find(filename,".")
+        if period > 0: stem = filename[0:period]
+        else: stem = filename
+        state = {"out": None, "natom": 0, "skip": 0}
+
+        def lines(stream):
+            # Write each model to its own file as Psize reads it; lines
+            # after an ENDMDL belong to no model until the next MODEL
+            for line in psize.readLines(stream):
+                if line.startswith("MODEL"):
+                    if state["out"] != None:
+                        state["out"].close()
+                        counts.append(state["natom"])
+                    frames.append("%s-model%i.pqr" % (stem, len(frames) + 1))
+                    state["out"] = open(frames[-1], "w")
+                    state["natom"] = 0
+                    state["skip"] = 0
+                    continue
+                if line.startswith("ENDMDL"):
+                    if state["out"] != None:
+                        state["out"].close()
+                        state["out"] = None
+                        counts.append(state["natom"])
+                    state["skip"] = 1
+                    continue
+                if state["skip"]:
+                    continue
+                if line.startswith("ATOM"):
+                    state["natom"] = state["natom"] + 1
+                if state["out"] != None:
+                    state["out"].write(string.rstrip(line, "\n") + "\n")
+                yield line
+
+        stream = psize.openInput(filename)
+        try:
+            size.parseLinesArray(lines(stream))
+        finally:
+            if stream != sys.stdin:
+                stream.close()
+        if state["out"] != None:
+            state["out"].close()
+            counts.append(state["natom"])
+        elif len(frames) == 0 and state["natom"] > 0:
+            # No MODEL records; the file is a single frame
+            frames.append(filename)
+            counts.append(state["natom"])
+    else:
+        for path in psize.readManifest(filename):
+            natom = size.gotatom
+            size.parseInput(path)
+            frames.append(path)
+            counts.append(size.gotatom - natom)
+    if len(frames) == 0:
+        sys.stderr.write("No frames found in %s!\n" % filename)
+        sys.exit(2)
+    # Memory estimates are per frame
+    size.gotatom = max(counts)
+    size.setAll()
+    return frames
+
+def isStructure(filename):
+    """
+        Return 1 if filename is a PDB/PQR file rather than a directory or
+        a list of files
+    """
+    if filename == "-":
+        return 1
+    if os.path.isdir(filename):
+        return 0
+    stream = psize.openInput(filename)
+    try:
+        for line in itertools.islice(psize.readLines(stream), 1000):
+            if line[:4] in ["ATOM", "HETA", "MODE", "REMA", "HEAD", "CRYS"]:
+                return 1
+    finally:
+        stream.close()
+    return 0
+
+def ensembleInputs(frames, size, method, asyncflag, istrng=0, potdx=0):
+    """
+        Make one Input per frame, all with the grid of the union sized by
+        sizeEnsemble.  Grid centers are written as coordinates rather
+        than "mol 1" so that they do not follow each frame, and potential
+        maps are written to a file per frame.
+    """
+    center = "%.4f %.4f %.4f" % tuple(size.getCenter())
+    inputs = []
+    for frame in frames:
+        input = Input(frame, size, method, asyncflag, istrng, potdx)
+        i = string.rfind(frame, "/") + 1
+        period = string.find(frame[i:], ".")
+        if period > 0: name = frame[i:i+period]
+        else: name = frame[i:]
+        for elec in input.elecs:
+            if elec == "": continue
+            elec.cgcent = center
+            elec.fgcent = center
+            if elec.gcent == "mol 1":
+                elec.gcent = center
+            if potdx == 0:
+                elec.write = [[write[0], write[1], "%s-%s" % (name, write[2])] for write in elec.write]
+        inputs.append(input)
+    return inputs
+
+def getAsyncTemplate(text):
+    """
+        Split the text of a parallel input file at each mg-para keyword so
+        the async input of any processor can be made with makeAsyncInput
+        without searching the text again
+
+        Parameters
+            text:      The text of a parallel input file (string)
+        Returns
+            template:  The pieces of text between the mg-para keywords
+                       (list)
+    """
+    return string.split(text, "mg-para\n")
+
+def makeAsyncInput(template, i):
+    """
+        Return the async input text for processor i from a template made
+        by getAsyncTemplate
+    """
+    return string.join(template, "mg-para\n    async %i\n" % i)
+
+def parseRange(text):
+    """
+        Parse a list of processor numbers and ranges such as "0-15,20"
+        into a list of ints
+    """
+    pes = []
+    for part in string.split(text, ","):
+        words = string.split(part, "-")
+        if len(words) == 1:
+            pes.append(int(words[0]))
+        else:
+            pes.extend(range(int(words[0]), int(words[1]) + 1))
+    return pes
+
+def writeAsyncInputs(task):
+    """
+        Write the async input files for a (template, stem, pes) task; used
+        by splitInput, possibly in a worker process
+    """
+    template, stem, pes = task
+    for i in pes:
+        outfile = open(stem + "-PE%i.in" % i, "w")
+        outfile.write(makeAsyncInput(template, i))
+        outfile.close()
+
+def splitInput(filename, pes=None, archive=None, nproc=1):
     """
         Split the parallel input file into multiple async file names
 
         Parameters
             filename:  The path to the original parallel input
                        file (string)
+            pes:       The processors to write async files for; all of
+                       them if None (list)
+            archive:   If given, write the files into this tar archive
+                       (compressed if it ends in .gz or .bz2), under
+                       their base names, instead of separate files
+                       (string)
+            nproc:     Number of processes writing the files (int)
     """
-    nproc = 0
+    nproc_input = 0
     file = open(filename, 'rU')
-    text = ""
-    while 1:
-        line = file.readline()
-        if line == "": break
-        text += line
+    text = file.read()
+    file.close()
+    for line in string.split(text, "\n"):
         line = string.strip(line)
         if line.startswith("pdime"): # Get # Procs
             words = string.split(line)
-            nproc = int(words[1]) * int(words[2]) * int(words[3])
+            nproc_input = int(words[1]) * int(words[2]) * int(words[3])
 
-    if nproc == 0:
+    if nproc_input == 0:
         sys.stderr.write("%s is not a valid APBS parallel input file!\n" % filename)
         sys.stderr.write("The inputgen script was unable to asynchronize this file!\n")
         sys.exit(2)
 
+    if pes == None:
+        pes = range(nproc_input)
+    for i in pes:
+        if i < 0 or i >= nproc_input:
+            sys.stderr.write("Processor %i is not in %s (0-%i)!\n" % (i, filename, nproc_input - 1))
+            sys.exit(2)
+
     period = string.find(filename,".")
-    for i in range(nproc):
-        outname = filename[0:period] + "-PE%i.in" % i
-        outtext = string.replace(text, "mg-para\n","mg-para\n    async %i\n" % i)
-        outfile = open(outname, "w")
-        outfile.write(outtext)
-        outfile.close()
+    stem = filename[0:period]
+    template = getAsyncTemplate(text)
+
+    if archive != None:
+        import tarfile, time
+        from cStringIO import StringIO
+        mode = "w"
+        if archive.endswith(".gz"): mode = "w:gz"
+        elif archive.endswith(".bz2"): mode = "w:bz2"
+        tar = tarfile.open(archive, mode)
+        now = time.time()
+        for i in pes:
+            outtext = makeAsyncInput(template, i)
+            info = tarfile.TarInfo(os.path.basename(stem) + "-PE%i.in" % i)
+            info.size = len(outtext)
+            info.mtime = now
+            info.mode = 0644
+            tar.addfile(info, StringIO(outtext))
+        tar.close()
+    elif nproc > 1 and len(pes) > nproc:
+        import multiprocessing
+        tasks = [(template, stem, pes[j::nproc]) for j in range(nproc)]
+        pool = multiprocessing.Pool(nproc)
+        try:
+            pool.map(writeAsyncInputs, tasks)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        writeAsyncInputs((template, stem, pes))
           
 def usage():
     """
@@ -299,6 +634,12 @@ def usage():
     usage = usage + "  --help               : Display this text\n"
     usage = usage + "  --split              : Split an existing parallel input file to multiple\n"
     usage = usage + "                         async input files.\n"
+    usage = usage + "  --pe=<list>          : With --split, only write the async files for these\n"
+    usage = usage + "                         processors, e.g. 0-15,20.\n"
+    usage = usage + "  --archive=<path>     : With --split, write the async files into one tar\n"
+    usage = usage + "                         archive (.tar, .tar.gz or .tar.bz2).\n"
+    usage = usage + "  --nproc=<value>      : With --split, write the files with this many\n"
+    usage = usage + "                         processes.\n"
     usage = usage + "  --potdx              : Create an input to compute an electrostatic potential map.\n"
     usage = usage + "  --method=<value>     : Force output file to write a specific APBS ELEC\n"
     usage = usage + "                         method.  Options are para (parallel), auto\n"
@@ -312,20 +653,40 @@ def usage():
     usage = usage + "                         [default = %g]\n" % size.getConstant("fadd")
     usage = usage + "  --space=<value>      : Desired fine mesh resolution\n"
     usage = usage + "                         [default = %g]\n" % size.getConstant("space")
-    usage = usage + "  --gmemfac=<value>    : Number of bytes per grid point required\n"
-    usage = usage + "                         for sequential MG calculation\n"
-    usage = usage + "                         [default = %g]\n" % size.getConstant("gmemfac")
     usage = usage + "  --gmemceil=<value>   : Max MB allowed for sequential MG\n"
     usage = usage + "                         calculation.  Adjust this to force the\n"
     usage = usage + "                         script to perform faster calculations (which\n"
-    usage = usage + "                         require more parallelism).\n"
+    usage = usage + "                         require more parallelism).  Memory use\n"
+    usage = usage + "                         is estimated with gridmodel.GridModel.\n"
     usage = usage + "                         [default = %g]\n" % size.getConstant("gmemceil")
+    usage = usage + "  --gmemfac=<value>    : Deprecated: estimate memory as this many bytes\n"
+    usage = usage + "                         per grid point instead.\n"
     usage = usage + "  --ofrac=<value>      : Overlap factor between mesh partitions\n"
     usage = usage + "                         [default = %g]\n" % size.getConstant("ofrac")
     usage = usage + "  --redfac=<value>     : The maximum factor by which a domain\n"
     usage = usage + "                         dimension can be reduced during focusing\n"
     usage = usage + "                         [default = %g]\n" % size.getConstant("redfac")
     usage = usage + "  --istrng=<value>     : Ionic strength (M). Na+ anc Cl- ions will be used\n"
+    usage = usage + "  --ncores=<value>     : Pick the grid and processor settings with the\n"
+    usage = usage + "                         shortest estimated wall time on this many\n"
+    usage = usage + "                         processors (see gridmodel.GridModel).\n"
+    usage = usage + "  --manifest           : Also write <name>-manifest.json listing each job\n"
+    usage = usage + "                         with its memory, grid points, outputs and\n"
+    usage = usage + "                         dependencies.\n"
+    usage = usage + "  --ensemble           : <filename> is a multi-model PDB/PQR file, a list of\n"
+    usage = usage + "                         frame files or a directory of them.  The union of\n"
+    usage = usage + "                         all frames is sized once and every frame gets an\n"
+    usage = usage + "                         input file with the same grid.\n"
+    usage = usage + "  --focus              : Write a chain of mg-manual calculations focusing from\n"
+    usage = usage + "                         the coarse grid to the fine grid with the fewest\n"
+    usage = usage + "                         grid points (see psize.Psize.setSchedule).  If\n"
+    usage = usage + "                         the fine grid needs a parallel solve, the default\n"
+    usage = usage + "                         input is written instead; use --region.\n"
+    usage = usage + "  --region=<x,y,z,lx,ly,lz> : Like --focus, but focus on the box of lengths\n"
+    usage = usage + "                         lx, ly, lz centered at x, y, z.\n"
+    usage = usage + "  --balance            : Pick the processor grid that best balances the\n"
+    usage = usage + "                         work of the parallel subdomains, estimated from\n"
+    usage = usage + "                         the atoms in each.  Also applies to async output.\n"
     sys.stderr.write(usage)
     sys.exit(2)
 
@@ -334,7 +695,7 @@ def main():
     import getopt
     filename = ""
     shortOptList = ""
-    longOptList = ["help","split","potdx","method=","cfac=","space=","gmemceil=","gmemfac=","ofrac=","redfac=","istrng="]
+    longOptList = ["help","split","potdx","method=","cfac=","space=","gmemceil=","gmemfac=","ofrac=","redfac=","istrng=","ncores=","balance","manifest","pe=","archive=","nproc=","ensemble","focus","region="]
 
     try:
         opts, args = getopt.getopt(sys.argv[1:], shortOptList, longOptList)
@@ -354,6 +715,15 @@ def main():
     split = 0
     istrng = 0
     potdx = 0
+    ncores = None
+    balance = 0
+    manifest = 0
+    pes = None
+    archive = None
+    nproc = 1
+    ensemble = 0
+    focus = 0
+    region = None
     
     for o, a in opts:
         if o == "--help":
@@ -381,22 +751,72 @@ def main():
             size.setConstant("cfac", float(a))
         if o == "--space":
             size.setConstant("space", float(a))
-        if o == "--gmemfac":
-            size.setConstant("gmemfac", int(a))
         if o == "--gmemceil":
             size.setConstant("gmemceil",  int(a))
+        if o == "--gmemfac":
+            size.setModel(psize.GridModel(gmemfac=psize.deprecateGmemfac(a)))
         if o == "--ofrac":
             size.setConstant("ofrac", float(a))
         if o == "--redfac":
             size.setConstant("redfac", float(a))
         if o == "--istrng":
             istrng = float(a)
+        if o == "--ncores":
+            ncores = int(a)
+        if o == "--balance":
+            balance = 1
+        if o == "--manifest":
+            manifest = 1
+        if o == "--pe":
+            pes = parseRange(a)
+        if o == "--archive":
+            archive = a
+        if o == "--nproc":
+            nproc = int(a)
+        if o == "--ensemble":
+            ensemble = 1
+        if o == "--focus":
+            focus = 1
+        if o == "--region":
+            region = psize.parseRegion(a)
+            focus = 1
 
     if split == 1:
-        splitInput(filename)
+        splitInput(filename, pes, archive, nproc)
     else:
-        size.runPsize(filename)
-        input = Input(filename, size, method, async, istrng, potdx)
-        input.printInputFiles()
+        if ensemble:
+            frames = sizeEnsemble(filename, size)
+        else:
+            size.runPsize(filename)
+        if ncores != None or balance:
+            if ncores == None: # as many cores as the default decomposition
+                np = size.getProcGrid()
+                ncores = int(np[0] * np[1] * np[2])
+            if method == "mg-para":
+                size.setPlan(ncores, balance=balance, method=method)
+            else:
+                size.setPlan(ncores, balance=balance)
+        if focus:
+            if region == None:
+                schedule = size.setSchedule()
+            else:
+                schedule = size.setSchedule(region[0], region[1])
+            if schedule == None and region == None:
+                # The whole fine grid needs mg-para; write the usual input
+                sys.stderr.write("The fine grid needs a parallel solve, so no focusing schedule\n")
+                sys.stderr.write("fits under gmemceil; writing the default input instead.  Use\n")
+                sys.stderr.write("--region to focus on a smaller box.\n")
+            elif schedule == None:
+                sys.stderr.write("No focusing schedule fits under gmemceil, or the region is not\n")
+                sys.stderr.write("inside the coarse grid!\n")
+                sys.exit(2)
+        if ensemble:
+            inputs = ensembleInputs(frames, size, method, async, istrng, potdx)
+        else:
+            inputs = [Input(filename, size, method, async, istrng, potdx)]
+        for input in inputs:
+            input.printInputFiles()
+            if manifest:
+                input.printManifest()
 
 if __name__ == "__main__": main()
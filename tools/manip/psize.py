@@ -14,14 +14,179 @@ Version:  $Id: psize.py 1615 2010-10-20 19:16:35Z sobolevnrm $
 
 """
 
-import string, sys, getopt
+import string, sys, os, getopt, itertools
+import gzip, bz2, csv, glob, multiprocessing
+import time, tempfile
+try:
+	import hashlib
+	sha1 = hashlib.sha1
+except ImportError:
+	import sha
+	sha1 = sha.new
+from cStringIO import StringIO
 from sys import stdout, stderr
-from math import log
+from math import log, floor
+from gridmodel import GridModel, MODELCOEFFS, ATOMBYTES, FORCEBYTES
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+# Number of lines converted to an array at a time by parseLinesArray
+BLOCKSIZE = 65536
+
+# Number of bytes read at a time by readLines
+CHUNKSIZE = 1048576
+
+def openInput(filename):
+	""" Open a structure file for reading, decompressing gzip and bzip2
+	files on the fly.  The compression is detected from the file contents
+	rather than the extension; a filename of "-" reads standard input """
+	if filename == "-":
+		return sys.stdin
+	file = open(filename, "rb")
+	magic = file.read(3)
+	file.close()
+	if magic[0:2] == "\x1f\x8b":
+		return gzip.open(filename, "rb")
+	elif magic == "BZh":
+		return bz2.BZ2File(filename, "r")
+	return open(filename, "rU")
+
+def readLines(stream, chunksize=CHUNKSIZE):
+	""" Generate the lines of a file object by reading it in fixed-size
+	chunks, so only one chunk is held in memory at a time.  Objects without
+	a read method are assumed to already be iterators over lines """
+	if not hasattr(stream, "read"):
+		for line in stream:
+			yield line
+		return
+	tail = ""
+	while 1:
+		chunk = stream.read(chunksize)
+		if chunk == "":
+			break
+		lines = string.split(tail + chunk, "\n")
+		tail = lines.pop()
+		for line in lines:
+			yield line
+	if tail != "":
+		yield tail
+
+# Bin size (in A) of the atom density histogram kept by Psize
+HISTBIN = 4.0
+
+# Maximum number of processor grids tried by Psize.setPlan
+MAXPROCGRIDS = 256
+
+# Maximum number of results kept by PsizeCache before the least recently
+# used ones are evicted
+CACHESIZE = 10000
+
+# Attributes of a Psize object saved by PsizeCache
+CACHEFIELDS = ["minlen", "maxlen", "q", "gotatom", "gothet", "olen", "cen",
+	"clen", "flen", "n", "np", "nsmall", "nfocus"]
+
+class PsizeCache:
+	"""On-disk cache of Psize results, keyed by the contents of the
+	structure file, the Psize constants and the PBE type, force setting
+	and gmemfac of the GridModel.  Each entry is a small JSON file in the
+	cache directory; its modification time records the last use so the
+	least recently used entries can be evicted"""
+	def __init__(self, path, maxsize=CACHESIZE):
+		self.path = path
+		self.maxsize = maxsize
+		if not os.path.isdir(path):
+			os.makedirs(path)
+
+	def key(self, filename, constants, model=None):
+		""" Return the cache key for a structure file, constants and
+		GridModel (default: GridModel()) """
+		if model == None:
+			model = GridModel()
+		hash = sha1()
+		file = open(filename, "rb")
+		while 1:
+			chunk = file.read(CHUNKSIZE)
+			if chunk == "":
+				break
+			hash.update(chunk)
+		file.close()
+		items = constants.items()
+		items.sort()
+		hash.update(repr(items))
+		hash.update(repr((model.pbe, model.force)))
+		if model.gmemfac != None:
+			hash.update(repr(model.gmemfac))
+		return hash.hexdigest()
+
+	def entry(self, key):
+		""" Return the path of the entry for key """
+		return os.path.join(self.path, "%s.json" % key)
+
+	def get(self, key):
+		""" Return the saved Psize attributes for key, or None if there is
+		no entry """
+		import json
+		try:
+			file = open(self.entry(key), "r")
+			state = json.load(file)
+			file.close()
+		except (IOError, ValueError):
+			return None
+		try:
+			os.utime(self.entry(key), None)
+		except OSError:
+			pass
+		return state
+
+	def put(self, key, state):
+		""" Save the Psize attributes in state under key and evict the least
+		recently used entries if the cache is full """
+		import json
+		fd, tmpname = tempfile.mkstemp(".tmp", "", self.path)
+		file = os.fdopen(fd, "w")
+		json.dump(state, file)
+		file.close()
+		os.rename(tmpname, self.entry(key))
+		self.evict()
+
+	def evict(self):
+		""" Remove the least recently used entries above maxsize """
+		entries = glob.glob(os.path.join(self.path, "*.json"))
+		if len(entries) <= self.maxsize:
+			return
+		times = []
+		for entry in entries:
+			try:
+				times.append((os.path.getmtime(entry), entry))
+			except OSError:
+				pass
+		times.sort()
+		for mtime, entry in times[0:len(times) - self.maxsize]:
+			try:
+				os.remove(entry)
+			except OSError:
+				pass
+
+	def invalidate(self, filename=None, constants=None, model=None):
+		""" Remove the entry for a structure file, constants and GridModel,
+		or every entry if no file is given """
+		if filename != None:
+			entries = [self.entry(self.key(filename, constants, model))]
+		else:
+			entries = glob.glob(os.path.join(self.path, "*.json"))
+		for entry in entries:
+			try:
+				os.remove(entry)
+			except OSError:
+				pass
 
 class Psize:
 	"""Master class for parsing input files and suggesting settings"""
 	def __init__(self):
-		self.constants = {"cfac": 1.7, "fadd":20, "space": 0.50, "gmemfac": 200, "gmemceil": 400, "ofrac":0.1, "redfac": 0.25 }
+		self.constants = {"cfac": 1.7, "fadd":20, "space": 0.50, "gmemceil": 400, "ofrac":0.1, "redfac": 0.25 }
 		self.minlen = [None, None, None]
 		self.maxlen = [None, None, None]
 		self.q = 0.0
@@ -35,16 +200,35 @@ class Psize:
 		self.np = [0.0, 0.0, 0.0]
 		self.nsmall = [0,0,0]
 		self.nfocus = 0
+		self.hist = {}
+		self.densecache = None
+		self.model = GridModel()
+		self.plan = None
+		self.schedule = None
+		self.cache = None
+		if os.environ.has_key("PSIZE_CACHE"):
+			self.cache = PsizeCache(os.environ["PSIZE_CACHE"])
 
 	def parseString(self, structure):
 		""" Parse the input structure as a string in PDB or PQR format """
-		lines = string.split(structure, "\n")
-		self.parseLines(lines)
+		self.parseStream(StringIO(structure))
 
 	def parseInput(self, filename):
-		""" Parse input structure file in PDB or PQR format """
-		file = open(filename, "r")
-		self.parseLines(file.readlines())
+		""" Parse input structure file in PDB or PQR format, which may be
+		gzip or bzip2 compressed """
+		file = openInput(filename)
+		try:
+			self.parseStream(file)
+		finally:
+			if file != sys.stdin:
+				file.close()
+
+	def parseStream(self, stream, chunksize=CHUNKSIZE):
+		""" Parse a PDB or PQR structure from a file object or an iterator
+		over lines.  The stream is consumed in chunks and only the running
+		bounding box, charge and atom counts are kept, so memory use does
+		not depend on the size of the input """
+		self.parseLinesArray(readLines(stream, chunksize))
 
 	def parseLines(self, lines):
 		""" Parse the lines """
@@ -65,6 +249,7 @@ class Psize:
 						self.minlen[i] = center[i]-rad
 					if self.maxlen[i] == None or center[i]+rad > self.maxlen[i]:
 						self.maxlen[i] = center[i]+rad
+				self.addToHistogram(center)
 			elif string.find(line, "HETATM") == 0:
 				self.gothet = self.gothet + 1
 				# Special handling for no ATOM entries in the pqr file, only HETATM entries
@@ -83,6 +268,93 @@ class Psize:
 							self.minlen[i] = center[i]-rad
 						if self.maxlen[i] == None or center[i]+rad > self.maxlen[i]:
 							self.maxlen[i] = center[i]+rad
+					self.addToHistogram(center)
+
+	def addToHistogram(self, center, count=1):
+		""" Add atoms at center to the atom density histogram, a dictionary
+		of counts keyed by (i, j, k) bins of HISTBIN A """
+		bin = (int(floor(center[0]/HISTBIN)), int(floor(center[1]/HISTBIN)),
+			int(floor(center[2]/HISTBIN)))
+		self.hist[bin] = self.hist.get(bin, 0) + count
+
+	def parseLinesArray(self, lines, blocksize=BLOCKSIZE):
+		""" Parse the lines block-wise with NumPy.  The coordinate, charge
+		and radius columns of each block are converted to an array in one
+		call and reduced to a bounding box and net charge, giving the same
+		results as parseLines.  Falls back to parseLines if NumPy is not
+		available """
+		if numpy == None:
+			self.parseLines(lines)
+			return
+		lines = iter(lines)
+		while 1:
+			block = list(itertools.islice(lines, blocksize))
+			if len(block) == 0:
+				break
+			self.parseBlock(block)
+
+	def parseBlock(self, block):
+		""" Parse a block of lines into an array of x, y, z, q, r rows and
+		add it to the running totals """
+		atoms = [line[30:] for line in block if line[:4] == "ATOM"]
+		hetatms = [line for line in block if line[:6] == "HETATM"]
+		self.gothet = self.gothet + len(hetatms)
+		if self.gotatom == 0 and len(hetatms) > 0:
+			# HETATM entries only count until the first ATOM entry
+			for line in block:
+				if line[:4] == "ATOM":
+					break
+				if line[:6] == "HETATM":
+					self.reduceArray(self.toArray([line[30:]]))
+		if len(atoms) == 0:
+			return
+		data = self.toArray(atoms)
+		self.gotatom = self.gotatom + len(data)
+		self.reduceArray(data)
+
+	def toArray(self, sublines):
+		""" Convert the coordinate fields of ATOM/HETATM lines (starting at
+		column 31) to an N x 5 array.  Lines with fewer than 4 fields are
+		skipped, as in parseLines """
+		sublines = [string.replace(subline, "-", " -") for subline in sublines]
+		nwords = [len(string.split(subline)) for subline in sublines]
+		if nwords.count(5) == len(sublines):
+			data = numpy.fromstring(string.join(sublines, "\n"), sep=" ")
+			return data.reshape((len(sublines), 5))
+		# Extra or missing fields on some lines; split them one by one
+		rows = []
+		for subline in sublines:
+			words = string.split(subline)
+			if len(words) < 4:
+				continue
+			rows.append(map(float, words[0:3]) + [float(words[3]), float(words[4])])
+		return numpy.array(rows, dtype=float).reshape((len(rows), 5))
+
+	def reduceArray(self, data):
+		""" Update the bounding box and net charge with an N x 5 array of
+		x, y, z, q, r rows """
+		if len(data) == 0:
+			return
+		lower = (data[:,0:3] - data[:,4:5]).min(axis=0)
+		upper = (data[:,0:3] + data[:,4:5]).max(axis=0)
+		for i in range(3):
+			if self.minlen[i] == None or lower[i] < self.minlen[i]:
+				self.minlen[i] = float(lower[i])
+			if self.maxlen[i] == None or upper[i] > self.maxlen[i]:
+				self.maxlen[i] = float(upper[i])
+		# Accumulate in file order, as parseLines does
+		q = numpy.concatenate(([self.q], data[:,3])).cumsum()
+		self.q = float(q[-1])
+		# Count the atoms per bin by sorting the bins; numpy.unique only
+		# takes axis from NumPy 1.13 on
+		bins = numpy.floor(data[:,0:3]/HISTBIN).astype(int)
+		bins = bins[numpy.lexsort(bins.T[::-1])]
+		starts = numpy.concatenate(([0],
+			numpy.nonzero(numpy.any(bins[1:] != bins[:-1], axis=1))[0] + 1))
+		counts = numpy.diff(numpy.concatenate((starts, [len(bins)])))
+		for i in range(len(starts)):
+			bin = (int(bins[starts[i],0]), int(bins[starts[i],1]), int(bins[starts[i],2]))
+			self.hist[bin] = self.hist.get(bin, 0) + int(counts[i])
 
 	def setConstant(self, name, value):
 		""" Set a constant to a value; returns 0 if constant not found """
@@ -138,20 +410,22 @@ class Psize:
 		""" Compute parallel division in case memory requirement above
 		ceiling Find the smallest dimension and see if the number of
 		grid points in that dimension will fit below the memory ceiling
-		Reduce nsmall until an nsmall^3 domain will fit into memory """
+		Reduce nsmall until an nsmall^3 domain will fit into memory.
+		Every processor holds all atoms, so if even 33 points per
+		direction do not fit the memory ceiling is too small """
 		nsmall = []
 		for i in range(3):
 			nsmall.append(n[i])
 		while 1:
-			nsmem = 200.0 * nsmall[0] * nsmall[1] * nsmall[2] / 1024 / 1024
+			nsmem = self.model.getMemory(nsmall, self.gotatom)
 			if nsmem < self.constants["gmemceil"]: 
 				break
 			else:
 				i = nsmall.index(max(nsmall))
-				nsmall[i] = 32 * ((nsmall[i] - 1)/32 - 1) + 1
-				if nsmall <= 0:
+				if nsmall[i] <= 33:
 					stdout.write("You picked a memory ceiling that is too small\n")
 					sys.exit(0)		
+				nsmall[i] = 32 * ((nsmall[i] - 1)/32 - 1) + 1
 
 		self.nsmall = nsmall
 		return nsmall
@@ -169,6 +443,11 @@ class Psize:
 	def setFocus(self, flen, np, clen):
 		""" Calculate the number of levels of focusing required for
 		each processor subdomain """
+		self.nfocus = self.countFocus(flen, np, clen)
+
+	def countFocus(self, flen, np, clen):
+		""" Return the number of levels of focusing required for each
+		processor subdomain of a np processor grid """
 
 		nfoc = [0,0,0]
 		for i in range(3):
@@ -177,7 +456,309 @@ class Psize:
 		if nfoc[1] > nfocus: nfocus = nfoc[1]
 		if nfoc[2] > nfocus: nfocus = nfoc[2]
 		if nfocus > 0: nfocus = nfocus + 1
-		self.nfocus = nfocus
+		return nfocus
+
+	def setSchedule(self, center=None, length=None, maxlevels=8):
+		""" Plan a chain of focusing calculations that ends on a box of the
+		given length (default: the fine grid dimensions) around center
+		(default: the molecule center) at the requested spacing, starting
+		from the coarse grid, with the fewest grid points solved in total.
+
+		Level lengths shrink geometrically, each by no more than redfac
+		per direction, and the centers move from the molecule center to
+		center so that every level lies inside the one before.  The
+		spacing of a level may be at most 1/redfac times that of the next
+		one, so levels far from the region of interest can use smaller
+		grids; more levels mean smaller intermediate grids but more of
+		them, and each number of levels up to maxlevels is tried.  Every
+		level must fit under gmemceil.  The coarsest level uses "sdh"
+		boundary conditions, or "mdh" if the coarse grid is less than
+		1.5 times the molecule size, and the others "focus".
+
+		Returns the schedule (also kept for getSchedule), a list of
+		dictionaries with the glen, center, dime, nlev, bcfl and spacing
+		of each level from coarsest to finest, or None if the region does
+		not lie inside the coarse grid or no schedule fits in memory.  The
+		default region is the whole fine grid, so for systems that need
+		a parallel solve (see setSmallest) only a smaller region fits """
+		clen = self.getCoarseGridDims()
+		olen = self.getLength()
+		cen = self.getCenter()
+		if center == None: center = cen
+		if length == None: length = self.getFineGridDims()
+		space = self.constants["space"]
+		redfac = self.constants["redfac"]
+		self.schedule = None
+		for i in range(3):
+			if abs(center[i] - cen[i]) + length[i]/2.0 > clen[i]/2.0 + 1.0e-6:
+				return None
+
+		bcfl = "sdh"
+		for i in range(3):
+			if clen[i] < 1.5*olen[i]: bcfl = "mdh"
+
+		best = None
+		for nlevels in range(1, maxlevels + 1):
+			if nlevels == 1:
+				# One level covering the coarse grid at the fine spacing
+				glens = [list(clen)]
+				centers = [list(cen)]
+			else:
+				ratio = [(length[i]/clen[i])**(1.0/(nlevels - 1)) for i in range(3)]
+				if min(ratio) < redfac - 1.0e-9:
+					continue
+				glens = []
+				centers = []
+				for k in range(nlevels):
+					glen = [clen[i]*ratio[i]**k for i in range(3)]
+					t = float(k)/(nlevels - 1)
+					cent = [cen[i] + t*(center[i] - cen[i]) for i in range(3)]
+					if k > 0:
+						# Keep the level inside the previous one
+						for i in range(3):
+							slack = (glens[-1][i] - glen[i])/2.0
+							lo = centers[-1][i] - slack
+							hi = centers[-1][i] + slack
+							cent[i] = min(max(cent[i], lo), hi)
+					glens.append(glen)
+					centers.append(cent)
+				centers[-1] = list(center)
+
+			levels = []
+			total = 0
+			h = space
+			for k in range(nlevels - 1, -1, -1):
+				dime = [self.dimeOptions(glens[k][i]/h + 1)[0] for i in range(3)]
+				if self.model.getMemory(dime, self.gotatom) > self.constants["gmemceil"]:
+					levels = None
+					break
+				if k == 0: level_bcfl = bcfl
+				else: level_bcfl = "focus"
+				level = {"glen": glens[k], "center": centers[k],
+					"dime": dime, "nlev": self.model.getLevels(dime),
+					"bcfl": level_bcfl,
+					"space": [glens[k][i]/(dime[i] - 1) for i in range(3)]}
+				levels.insert(0, level)
+				total = total + dime[0]*dime[1]*dime[2]
+				h = min(level["space"])/redfac
+			if levels == None:
+				continue
+			if best == None or total < best[0]:
+				best = (total, levels)
+
+		if best != None:
+			self.schedule = best[1]
+		return self.schedule
+
+	def setModel(self, model):
+		""" Use a GridModel for the memory and run time estimates """
+		self.model = model
+
+	def setPlan(self, ncores=1, natom=None, balance=0, method=""):
+		""" Choose the grid dimensions, processor grid and focusing depth
+		with the smallest estimated wall time on ncores processors, with at
+		most gmemceil MB per processor, for the fine and coarse grid
+		lengths set by setAll.  The processor grids come from procGrids;
+		for each, the per-processor dime is the smallest valid one covering
+		the subdomain at the requested spacing, or the next one with more
+		multigrid levels.  The overlap is the ofrac constant; it is not
+		searched over.  Returns the plan (also kept for getPlan), or None
+		if nothing fits under the memory ceiling.
+
+		With balance set, the run time of each subdomain is estimated from
+		the atoms the density histogram puts in it (plus the overlap)
+		instead of assuming every subdomain holds every atom, so the
+		processor grid that evens out the work is preferred for elongated
+		or hollow systems.  A ncores of None means one core per subdomain.
+		method may be "mg-para" or "mg-auto" to only consider parallel or
+		sequential settings """
+		if natom == None:
+			natom = self.gotatom
+		self.densecache = None
+		flen = self.getFineGridDims()
+		clen = self.getCoarseGridDims()
+		zofac = 1 + 2 * self.constants["ofrac"]
+		need = []
+		for i in range(3):
+			need.append(flen[i]/self.constants["space"] + 1)
+		best = None
+		for np in self.procGrids(need, ncores, method):
+			nproc = np[0]*np[1]*np[2]
+			if balance:
+				counts = self.countSubdomains(np)
+				counts = (max(counts), reduce(lambda a, b: a + b, counts))
+			else:
+				counts = (natom, natom*nproc)
+			options = []
+			for i in range(3):
+				n = need[i]
+				if np[i] > 1:
+					n = zofac*need[i]/np[i]
+				options.append(self.dimeOptions(n))
+			for nx in options[0]:
+				for ny in options[1]:
+					for nz in options[2]:
+						plan = self.ratePlan([nx, ny, nz], np, flen, clen, ncores, natom, counts)
+						if plan == None:
+							continue
+						if best == None or \
+							(plan["time"], plan["nproc"]) < (best["time"], best["nproc"]):
+							best = plan
+		self.plan = best
+		return best
+
+	def procGrids(self, need, ncores, method=""):
+		""" Return the processor grids setPlan tries for a fine grid of
+		need points per direction: every grid whose subdomains hold at
+		least 33 points per direction (at most 16 processors per
+		direction), limited to the MAXPROCGRIDS with a processor count
+		closest to ncores (the largest ones if ncores is None) """
+		zofac = 1 + 2 * self.constants["ofrac"]
+		procs = []
+		for i in range(3):
+			pmax = max(1, min(16, int(zofac*need[i]/33)))
+			procs.append(range(1, pmax + 1))
+		grids = []
+		for px in procs[0]:
+			for py in procs[1]:
+				for pz in procs[2]:
+					nproc = px*py*pz
+					if (method == "mg-para" and nproc == 1) or \
+						(method == "mg-auto" and nproc > 1):
+						continue
+					if ncores == None:
+						distance = -nproc
+					else:
+						distance = abs(log(float(nproc)/ncores))
+					grids.append((distance, nproc, [px, py, pz]))
+		grids.sort()
+		return [np for distance, nproc, np in grids[:MAXPROCGRIDS]]
+
+	def dimeOptions(self, n):
+		""" Return the smallest valid APBS grid dimension of at least n
+		points, and the next one with at least one more multigrid level """
+		options = []
+		dime = max(33, 32*int((n - 1)/32.0 + 0.999999) + 1)
+		options.append(dime)
+		nlev = self.model.getLevels([dime])
+		step = 2**(nlev + 2)
+		deeper = step*int((n - 1)/float(step) + 0.999999) + 1
+		if deeper != dime:
+			options.append(deeper)
+		return options
+
+	def ratePlan(self, dime, np, flen, clen, ncores, natom, counts):
+		""" Estimate memory and wall time for one candidate, given the
+		largest and the total number of atoms over the subdomains as
+		counts; returns None if it does not fit under gmemceil """
+		mem = self.model.getMemory(dime, natom)
+		if mem > self.constants["gmemceil"]:
+			return None
+		nproc = np[0]*np[1]*np[2]
+		if nproc > 1:
+			method = "mg-para"
+		else:
+			method = "mg-auto"
+		nfocus = self.countFocus(flen, np, clen)
+		# The coarsest solve sees every atom, the focused ones only the
+		# atoms in the subdomain; the time is linear in the atom count
+		base = self.model.getTime(dime, 1, natom) + self.model.getTime(dime, nfocus, 0)
+		slope = self.model.getTime(dime, nfocus, 1) - self.model.getTime(dime, nfocus, 0)
+		maxtime = base + slope*counts[0]
+		total = nproc*base + slope*counts[1]
+		if ncores == None or nproc <= ncores:
+			time = maxtime
+		else:
+			time = max(maxtime, total / ncores)
+		return {"method": method, "dime": dime, "nlev": self.model.getLevels(dime),
+			"pdime": np, "nproc": nproc, "nfocus": nfocus, "memory": mem,
+			"time": time, "imbalance": maxtime * nproc / total}
+
+	def getSubdomainBounds(self, np, axis):
+		""" Return the (lower, upper) coordinates of each subdomain of a np
+		processor grid along axis, including the ofrac overlap """
+		flen = self.getFineGridDims()
+		cen = self.getCenter()
+		width = flen[axis] / np[axis]
+		lower = cen[axis] - 0.5*flen[axis]
+		overlap = 0.0
+		if np[axis] > 1:
+			overlap = self.constants["ofrac"] * width
+		bounds = []
+		for ip in range(np[axis]):
+			bounds.append((lower + ip*width - overlap,
+				lower + (ip + 1)*width + overlap))
+		return bounds
+
+	def countSubdomains(self, np):
+		""" Count the atoms in each subdomain of a np processor grid over
+		the fine grid, including the ofrac overlap, from the atom density
+		histogram.  Subdomains are ordered as APBS numbers the processors
+		(x fastest) """
+		bounds = []
+		for i in range(3):
+			bounds.append(self.getSubdomainBounds(np, i))
+		if numpy != None:
+			return self.countSubdomainsArray(np, bounds)
+		if self.densecache == None:
+			self.densecache = {}
+		# As in countSubdomainsArray, the x and y memberships are summed
+		# once per (px, py) into counts keyed (ip, jp, z bin)
+		key = (np[0], np[1], bounds[0][0], bounds[1][0])
+		if not self.densecache.has_key(key):
+			owners = [{}, {}]
+			partial = {}
+			for bin, count in self.hist.items():
+				for i in range(2):
+					if not owners[i].has_key(bin[i]):
+						center = (bin[i] + 0.5)*HISTBIN
+						owners[i][bin[i]] = [ip for ip in range(np[i])
+							if bounds[i][ip][0] <= center < bounds[i][ip][1]]
+				for jp in owners[1][bin[1]]:
+					for ip in owners[0][bin[0]]:
+						slab = (ip, jp, bin[2])
+						partial[slab] = partial.get(slab, 0) + count
+			self.densecache[key] = partial
+		counts = [0] * (np[0]*np[1]*np[2])
+		zowners = {}
+		for (ip, jp, kbin), count in self.densecache[key].items():
+			if not zowners.has_key(kbin):
+				center = (kbin + 0.5)*HISTBIN
+				zowners[kbin] = [kp for kp in range(np[2])
+					if bounds[2][kp][0] <= center < bounds[2][kp][1]]
+			for kp in zowners[kbin]:
+				counts[ip + np[0]*(jp + np[1]*kp)] += count
+		return counts
+
+	def countSubdomainsArray(self, np, bounds):
+		""" NumPy version of countSubdomains: the histogram is made dense
+		and contracted with the bin-to-subdomain membership along each
+		axis.  The dense histogram and the partial contractions are reused
+		across the calls made by setPlan """
+		if self.densecache == None:
+			bins = numpy.array(self.hist.keys(), dtype=int).reshape((len(self.hist), 3))
+			weights = numpy.array(self.hist.values(), dtype=float)
+			lower = bins.min(axis=0)
+			shape = bins.max(axis=0) - lower + 1
+			dense = numpy.zeros(shape)
+			idx = bins - lower
+			numpy.add.at(dense, (idx[:,0], idx[:,1], idx[:,2]), weights)
+			self.densecache = (dense, lower, {})
+		dense, lower, partial = self.densecache
+		members = []
+		for i in range(3):
+			centers = (numpy.arange(dense.shape[i]) + lower[i] + 0.5)*HISTBIN
+			member = numpy.zeros((dense.shape[i], np[i]))
+			for ip in range(np[i]):
+				member[:,ip] = (centers >= bounds[i][ip][0]) & (centers < bounds[i][ip][1])
+			members.append(member)
+		key = (np[0], np[1], bounds[0][0], bounds[1][0])
+		if not partial.has_key(key):
+			xy = numpy.tensordot(members[0], dense, axes=([0], [0]))
+			partial[key] = numpy.tensordot(members[1], xy, axes=([0], [1]))
+		# partial[key] is indexed (jp, ip, k); counts are x fastest
+		counts = numpy.tensordot(partial[key], members[2], axes=([2], [0]))
+		return [int(round(c)) for c in counts.transpose((2, 0, 1)).flatten()]
 
 	def setAll(self):
 		""" Set up all of the things calculated individually above """
@@ -218,11 +799,38 @@ class Psize:
 	def getSmallest(self): return self.nsmall
 	def getProcGrid(self): return self.np
 	def getFocus(self): return self.nfocus
+	def getPlan(self): return self.plan
+	def getSchedule(self): return self.schedule
+
+	def setCache(self, cache):
+		""" Use a PsizeCache in runPsize; None disables caching """
+		self.cache = cache
 
 	def runPsize(self, filename):
-		""" Parse input PQR file and set parameters """
+		""" Parse input PQR file and set parameters.  If a cache is set and
+		holds an entry for this file, these constants and this model's PBE
+		type and force setting, the saved results are used instead of
+		parsing the file """
+		if self.cache == None or filename == "-":
+			self.parseInput(filename)
+			self.setAll()
+			return
+		key = self.cache.key(filename, self.constants, self.model)
+		state = self.cache.get(key)
+		if state != None and state.has_key("hist"):
+			for name in CACHEFIELDS:
+				setattr(self, name, state[name])
+			self.hist = {}
+			for i, j, k, count in state["hist"]:
+				self.hist[(i, j, k)] = count
+			return
 		self.parseInput(filename)
 		self.setAll()
+		state = {}
+		for name in CACHEFIELDS:
+			state[name] = getattr(self, name)
+		state["hist"] = [list(bin) + [count] for bin, count in self.hist.items()]
+		self.cache.put(key, state)
 
 	def printResults(self):
 		""" Return a string with the formatted results """
@@ -244,8 +852,8 @@ class Psize:
 			nfocus = self.getFocus()
 	
 			# Compute memory requirements
-			nsmem = 200.0 * nsmall[0] * nsmall[1] * nsmall[2] / 1024 / 1024
-			gmem = 200.0 * n[0] * n[1] * n[2] / 1024 / 1024
+			nsmem = self.model.getMemory(nsmall, self.gotatom)
+			gmem = self.model.getMemory(n, self.gotatom)
 
 			# Print the calculated entries
 			str = str + "################# MOLECULE INFO ####################\n"
@@ -281,31 +889,174 @@ clen[1]	, clen[2])
 				str = str + "Fine mesh spacing = %g x %g x %g A\n" % (flen[0]/(xglob-1), flen[1]/(yglob-1), flen[2]/(zglob-1))
 				str = str + "Estimated mem. required for parallel solve = %.3f MB/proc.\n" % nsmem
 				ntot = nsmall[0]*nsmall[1]*nsmall[2]
+				pmem = nsmem
 	
 			else:
 				str = str + "Fine mesh spacing = %g x %g x %g A\n" % (flen[0]/(n[0]-1), flen[1]/(n[1]-1), flen[2]/(n[2]-1))
 				str = str + "Estimated mem. required for sequential solve = %.3f MB\n" % gmem
 				ntot = n[0]*n[1]*n[2]
+				pmem = gmem
 		
 			str = str + "Number of focusing operations = %i\n" % nfocus
 	
 			str = str + "\n"
 			str = str + "################# ESTIMATED REQUIREMENTS ####################\n"
-			str = str + "Memory per processor                   = %.3f MB\n" % (200.0*ntot/1024/1024)
+			str = str + "Memory per processor                   = %.3f MB\n" % pmem
 			str = str + "Grid storage requirements (ASCII)      = %.3f MB\n" % (8.0*12*np[0]*np[1]*np[2]*ntot/1024/1024)
 			str = str + "\n"
 
+			plan = self.getPlan()
+			if plan != None:
+				str = str + "################# PLANNED SETTINGS ####################\n"
+				str = str + "Method = %s\n" % plan["method"]
+				str = str + "Grid pts. on each proc. = %i x %i x %i (nlev %i)\n" % \
+					(plan["dime"][0], plan["dime"][1], plan["dime"][2], plan["nlev"])
+				str = str + "Proc. grid = %i x %i x %i\n" % \
+					(plan["pdime"][0], plan["pdime"][1], plan["pdime"][2])
+				str = str + "Number of focusing operations = %i\n" % plan["nfocus"]
+				str = str + "Estimated mem. per processor = %.3f MB\n" % plan["memory"]
+				str = str + "Estimated wall time = %.3g s\n" % plan["time"]
+				str = str + "Load imbalance (max/mean) = %.3f\n" % plan["imbalance"]
+				str = str + "\n"
+
+			schedule = self.getSchedule()
+			if schedule != None:
+				str = str + "################# FOCUSING SCHEDULE ####################\n"
+				total = 0
+				for k in range(len(schedule)):
+					level = schedule[k]
+					dime = level["dime"]
+					str = str + "Level %i: %i x %i x %i pts. (nlev %i), bcfl %s\n" % \
+						(k + 1, dime[0], dime[1], dime[2], level["nlev"], level["bcfl"])
+					str = str + "  glen = %.3f x %.3f x %.3f A\n" % tuple(level["glen"])
+					str = str + "  center = %.3f x %.3f x %.3f A\n" % tuple(level["center"])
+					str = str + "  spacing = %.3f x %.3f x %.3f A\n" % tuple(level["space"])
+					total = total + dime[0]*dime[1]*dime[2]
+				str = str + "Total grid pts. solved = %i\n" % total
+				str = str + "\n"
+
 		else:
 			str = str + "No ATOM entires in file!\n\n"
 
 		return str
 
+# Columns of the table written by writeBatch
+BATCHFIELDS = ["file", "natom", "charge", "dime", "cglen", "fglen", "center",
+	"nsmall", "pdime", "nfocus", "error"]
+
+# Structure file patterns picked up when runBatch is given a directory
+BATCHPATTERNS = ["*.pqr", "*.pdb", "*.pqr.gz", "*.pdb.gz", "*.pqr.bz2",
+	"*.pdb.bz2"]
+
+def readManifest(path):
+	""" Return the list of structure files named by path, which is either
+	a directory (all PQR/PDB files in it, sorted by name) or a manifest
+	file listing one path per line.  Blank lines and lines starting with #
+	are skipped, and relative paths are taken relative to the manifest """
+	if os.path.isdir(path):
+		filenames = []
+		for pattern in BATCHPATTERNS:
+			filenames.extend(glob.glob(os.path.join(path, pattern)))
+		filenames.sort()
+		return filenames
+	filenames = []
+	root = os.path.dirname(path)
+	for line in open(path, "rU"):
+		line = string.strip(line)
+		if line == "" or line[0] == "#":
+			continue
+		filenames.append(os.path.join(root, line))
+	return filenames
+
+def sizeFile(task):
+	""" Size a single (filename, constants, pbe, force, gmemfac) task for
+	runBatch.
+	Returns a dictionary with one entry per BATCHFIELDS column; failures
+	are reported in the "error" entry rather than raised """
+	filename, constants, pbe, force, gmemfac = task
+	result = {"file": filename, "error": ""}
+	psize = Psize()
+	psize.constants.update(constants)
+	psize.setModel(GridModel(pbe, force, gmemfac))
+	try:
+		psize.parseInput(filename)
+		if psize.getMax()[0] == None:
+			raise ValueError, "no ATOM or HETATM entries"
+		psize.setAll()
+	except (Exception, SystemExit), details:
+		result["error"] = "%s: %s" % (details.__class__.__name__, details)
+		return result
+	# Same choice of per-processor dime as inputgen.Elec
+	n = psize.getFineGridPoints()
+	if psize.model.getMemory(n, psize.gotatom) > psize.getConstant("gmemceil"):
+		dime = psize.getSmallest()
+	else:
+		dime = n
+	result["natom"] = psize.gotatom
+	result["charge"] = psize.getCharge()
+	result["dime"] = list(dime)
+	result["cglen"] = list(psize.getCoarseGridDims())
+	result["fglen"] = list(psize.getFineGridDims())
+	result["center"] = list(psize.getCenter())
+	result["nsmall"] = list(psize.getSmallest())
+	result["pdime"] = [int(x) for x in psize.getProcGrid()]
+	result["nfocus"] = psize.getFocus()
+	return result
+
+def runBatch(filenames, constants=None, nproc=None, model=None):
+	""" Size many structure files on a pool of nproc worker processes
+	(default: one per CPU), with the PBE type, force setting and gmemfac
+	of model (default: GridModel()).  Returns a list of sizeFile results in the
+	same order as filenames; a file that cannot be sized gets an error
+	entry instead of stopping the batch """
+	if constants == None:
+		constants = Psize().constants
+	if model == None:
+		model = GridModel()
+	tasks = [(filename, constants, model.pbe, model.force, model.gmemfac)
+		for filename in filenames]
+	if nproc == None:
+		nproc = multiprocessing.cpu_count()
+	if nproc <= 1 or len(tasks) <= 1:
+		return map(sizeFile, tasks)
+	pool = multiprocessing.Pool(nproc)
+	try:
+		results = pool.map(sizeFile, tasks, max(1, len(tasks)/(4*nproc)))
+	finally:
+		pool.close()
+		pool.join()
+	return results
+
+def writeBatch(results, stream, format="csv"):
+	""" Write runBatch results to stream as CSV (vector columns are space
+	separated) or, if format is "json", as a JSON list of objects """
+	if format == "json":
+		import json
+		json.dump(results, stream, indent=1)
+		stream.write("\n")
+		return
+	writer = csv.writer(stream)
+	writer.writerow(BATCHFIELDS)
+	for result in results:
+		row = []
+		for field in BATCHFIELDS:
+			value = result.get(field, "")
+			if type(value) == type([]):
+				value = string.join(["%g" % x for x in value])
+			elif type(value) == type(0.0):
+				value = "%.3f" % value
+			row.append(value)
+		writer.writerow(row)
+
 def usage(rc):
 	""" Print usage information and exit with error code rc """
 	psize = Psize()
 	s = "\n"
 	s = s + "Psize script (part of APBS)\n\n"
 	s = s + "Usage: psize.py [opts] <filename>\n\n"
+	s = s + "       psize.py [opts] --batch <directory or manifest>\n\n"
+	s = s + "The file may be gzip or bzip2 compressed; use - to read from\n"
+	s = s + "standard input.\n\n"
 	s = s + "Optional Arguments:\n"
 	s = s + "	--help, -h\n"
 	s = s + "		Display this text\n"
@@ -331,32 +1082,95 @@ def usage(rc):
 		Maximum memory (in MB) available per-processor for a calculation.\n\
 		This should be adjusted to fit your machine.  If the calculation\n\
 		exceeds this value, psize will recommend settings for parallel\n\
-		focusing.\n"
+		focusing.  Memory use is estimated with gridmodel.GridModel for\n\
+		the grid, PBE type and atom count.\n"
+	s = s + "	--gmemfac=<value>\n"
+	s = s + "\
+		Deprecated: estimate memory as this many bytes per grid point\n\
+		instead of with gridmodel.GridModel.\n"
 	s = s + "	--ofrac=<value> [default = %g]\n" % psize.getConstant("ofrac")
 	s = s + "\
 		Desired overlap between parallel focusing grids.  Although the\n\
 		default value works for many calculations, the best setting can\n\
 		be somewhat system-dependent.  Users are encouraged to check\n\
 		multiple values of ofrac for quantitative calcualtions.\n"
-	s = s + "	--gmemfac=<value> [default = %g]\n" % psize.getConstant("gmemfac")
-	s = s + "\
-		APBS memory usage (in bytes per grid point) for a sequential\n\
-		multigrid calculatiaon.  This value should not need to be\n\
-		adjusted unless the program has been modified.\n"
 	s = s + "	--redfac=<value> [default = %g]\n" % psize.getConstant("redfac")
 	s = s + "\
 		APBS maximum reduction of grid spacing during focusing.  This\n\
 		value should not need to be adjusted unless the program has\n\
 		been modified.\n"
+	s = s + "	--npbe\n"
+	s = s + "\
+		Estimate memory and run time for the nonlinear rather than the\n\
+		linearized PBE.\n"
+	s = s + "	--force\n"
+	s = s + "\
+		Include force calculations in the memory and run time estimates.\n"
+	s = s + "	--ncores=<value>\n"
+	s = s + "\
+		Also suggest the grid and processor settings with the shortest\n\
+		estimated wall time on this many processors, keeping below the\n\
+		memory ceiling.\n"
+	s = s + "	--balance\n"
+	s = s + "\
+		With --ncores, estimate the work of each parallel subdomain\n\
+		from the atoms it holds and prefer the processor grid that\n\
+		balances it.\n"
+	s = s + "	--focus\n"
+	s = s + "\
+		Plan a chain of focusing levels from the coarse grid to the\n\
+		fine grid at the requested spacing (see Psize.setSchedule).\n"
+	s = s + "	--region=<x,y,z,lx,ly,lz>\n"
+	s = s + "\
+		Like --focus, but end on the box of lengths lx, ly, lz centered\n\
+		at x, y, z instead of the fine grid.\n"
+	s = s + "	--cache=<path> [default = $PSIZE_CACHE if set]\n"
+	s = s + "\
+		Directory of cached results, keyed by file contents and the\n\
+		values above, including --npbe and --force.  Structures already\n\
+		in the cache are not parsed again.\n"
+	s = s + "	--clear-cache\n"
+	s = s + "\
+		Remove all entries from the cache before running.\n"
+	s = s + "	--batch\n"
+	s = s + "\
+		Size every PQR/PDB file in a directory, or every file listed\n\
+		(one per line) in a manifest, and write one table with a row\n\
+		per structure in the same order.\n"
+	s = s + "	--nproc=<value> [default = number of CPUs]\n"
+	s = s + "\
+		Number of worker processes used by --batch.\n"
+	s = s + "	--out=<path> [default = standard output]\n"
+	s = s + "\
+		Where --batch writes its table; a path ending in .json gives\n\
+		JSON output, anything else CSV.\n"
 
 	stderr.write(s)
 	sys.exit(rc)
 
+def deprecateGmemfac(text):
+	""" Warn that --gmemfac is deprecated and return its value, for the
+	gmemfac argument of GridModel """
+	gmemfac = int(text)
+	stderr.write("Warning: --gmemfac is deprecated; estimating memory as %d bytes\n" % gmemfac)
+	stderr.write("per grid point instead of with gridmodel.GridModel.\n")
+	return gmemfac
+
+def parseRegion(text):
+	""" Parse a region of interest given as x,y,z,lx,ly,lz into
+	([x, y, z], [lx, ly, lz]) """
+	words = string.split(text, ",")
+	if len(words) != 6:
+		stderr.write("Region must be given as x,y,z,lx,ly,lz (%s)!\n" % text)
+		usage(2)
+	values = map(float, words)
+	return (values[0:3], values[3:6])
+
 def main():
 	""" Main driver for this script """
 	filename = ""
 	shortOptList = "h"
-	longOptList = ["help", "cfac=", "fadd=", "space=", "gmemfac=", "gmemceil=", "ofrac=", "redfac=" ]
+	longOptList = ["help", "cfac=", "fadd=", "space=", "gmemceil=", "gmemfac=", "ofrac=", "redfac=", "batch", "nproc=", "out=", "cache=", "clear-cache", "npbe", "force", "ncores=", "balance", "focus", "region=" ]
 	try:
 		opts, args = getopt.getopt(sys.argv[1:], shortOptList, longOptList)
 	except getopt.GetoptError, details:
@@ -369,6 +1183,17 @@ def main():
 		filename = args[0]
 
 	psize = Psize()	
+	batch = 0
+	nproc = None
+	outpath = ""
+	clearcache = 0
+	ncores = None
+	pbe = "lpbe"
+	force = 0
+	balance = 0
+	focus = 0
+	region = None
+	gmemfac = None
 
 	for o, a in opts:
 		if (o.lower() == "--help") or (o == "-h"):
@@ -379,16 +1204,77 @@ def main():
 			psize.setConstant("fadd", int(a))
 		if o.lower() == "--space":
 			psize.setConstant("space", float(a))
-		if o.lower() == "--gmemfac":
-			psize.setConstant("gmemfac", int(a))
 		if o.lower() == "--gmemceil":
 			psize.setConstant("gmemceil",  int(a))
+		if o.lower() == "--gmemfac":
+			gmemfac = deprecateGmemfac(a)
 		if o.lower() == "--ofrac":
 			psize.setConstant("ofrac", float(a))
 		if o.lower() == "--redfac":
 			psize.setConstant("redfac", float(a))
+		if o.lower() == "--batch":
+			batch = 1
+		if o.lower() == "--nproc":
+			nproc = int(a)
+		if o.lower() == "--out":
+			outpath = a
+		if o.lower() == "--cache":
+			psize.setCache(PsizeCache(a))
+		if o.lower() == "--clear-cache":
+			clearcache = 1
+		if o.lower() == "--npbe":
+			pbe = "npbe"
+		if o.lower() == "--force":
+			force = 1
+		if o.lower() == "--ncores":
+			ncores = int(a)
+		if o.lower() == "--balance":
+			balance = 1
+		if o.lower() == "--focus":
+			focus = 1
+		if o.lower() == "--region":
+			region = parseRegion(a)
+			focus = 1
+
+	psize.setModel(GridModel(pbe, force, gmemfac))
+
+	if balance and ncores == None:
+		stderr.write("--balance needs --ncores!\n")
+		usage(2)
+
+	if clearcache:
+		if psize.cache == None:
+			stderr.write("No cache to clear; use --cache or set PSIZE_CACHE\n")
+			usage(2)
+		psize.cache.invalidate()
+
+	if batch:
+		results = runBatch(readManifest(filename), psize.constants, nproc, psize.model)
+		format = "csv"
+		if outpath.endswith(".json"):
+			format = "json"
+		if outpath == "":
+			writeBatch(results, stdout, format)
+		else:
+			file = open(outpath, "w")
+			writeBatch(results, file, format)
+			file.close()
+		return
 
 	psize.runPsize(filename)
+	if ncores != None:
+		psize.setPlan(ncores, balance=balance)
+	if focus:
+		if region == None:
+			schedule = psize.setSchedule()
+		else:
+			schedule = psize.setSchedule(region[0], region[1])
+		if schedule == None and region == None:
+			stderr.write("The fine grid needs a parallel solve, so no focusing schedule\n")
+			stderr.write("fits under gmemceil; use --region to focus on a smaller box.\n")
+		elif schedule == None:
+			stderr.write("No focusing schedule fits under gmemceil, or the region is not\n")
+			stderr.write("inside the coarse grid!\n")
 	stdout.write("# Constants used: \n");
 	for key in psize.constants.keys():
 		stdout.write("# \t%s: %s\n" % (key, psize.constants[key]))
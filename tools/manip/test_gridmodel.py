@@ -0,0 +1,51 @@
+""" Tests for gridmodel.py
+
+	Run from this directory:
+
+		python test_gridmodel.py
+"""
+
+import unittest
+from gridmodel import GridModel, ATOMBYTES, FORCEBYTES
+
+class GridModelTest(unittest.TestCase):
+
+	def testLevels(self):
+		""" Levels as MGparm_check counts them; the shallowest axis wins """
+		model = GridModel()
+		self.assertEqual(model.getLevels([33, 33, 33]), 4)
+		self.assertEqual(model.getLevels([65, 129, 97]), 4)
+		self.assertEqual(model.getLevels([129, 129, 129]), 6)
+		nf, narr, coarse = model.getHierarchy([65, 65, 65])
+		self.assertEqual(nf, 65**3)
+		self.assertEqual(coarse, [5, 5, 5])
+		self.assertEqual(narr, 65**3 + 33**3 + 17**3 + 9**3 + 5**3)
+
+	def testMemory(self):
+		""" Memory grows with the grid and the atoms; forces add per-atom
+			storage and gmemfac replaces the model """
+		model = GridModel()
+		small = model.getBytes([33, 33, 33])
+		large = model.getBytes([65, 65, 65])
+		self.assert_(small < large)
+		self.assertEqual(model.getBytes([65, 65, 65], 10), large + 10*ATOMBYTES)
+		self.assertEqual(GridModel(force=1).getBytes([65, 65, 65], 10),
+			large + 10*(ATOMBYTES + FORCEBYTES))
+		self.assertEqual(model.getMemory([65, 65, 65]), large/1024.0/1024.0)
+		fixed = GridModel(gmemfac=200)
+		self.assertEqual(fixed.getBytes([65, 65, 65], 10), 200.0*65**3)
+		# lpbe stores the banded coarse grid factorization
+		self.assert_(GridModel("npbe").getBytes([65, 65, 65]) < large)
+
+	def testTime(self):
+		""" Run time is linear in the solves and atoms, and calibrate
+			rescales it to the measured timings """
+		model = GridModel()
+		one = model.getTime([65, 65, 65])
+		self.assertAlmostEqual(model.getTime([65, 65, 65], 3), 3*one)
+		self.assert_(model.getTime([65, 65, 65], 1, 100) > one)
+		model.calibrate([([65, 65, 65], 1, 0, 2*one)])
+		self.assertAlmostEqual(model.getTime([65, 65, 65]), 2*one)
+
+if __name__ == "__main__":
+	unittest.main()
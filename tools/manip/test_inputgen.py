@@ -0,0 +1,230 @@
+""" Tests for inputgen.py
+
+    Run from this directory:
+
+        python test_inputgen.py
+"""
+
+import unittest, os, shutil, tempfile, json, tarfile, string
+from cStringIO import StringIO
+import psize, inputgen
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+COMPLEX = os.path.join(HERE, "..", "..", "examples", "hca-bind", "complex.pqr")
+
+def atomLine(serial, x):
+    return "ATOM  %5i  N   ALA     1    %8.3f%8.3f%8.3f  1.0000 1.5000\n" % \
+           (serial, x, 0.0, 0.0)
+
+def sizeFile(filename, model=None):
+    size = psize.Psize()
+    if model != None:
+        size.setModel(model)
+    size.runPsize(filename)
+    return size
+
+class ElecTest(unittest.TestCase):
+
+    def testLevels(self):
+        """ nlev comes from the grid model, or from the plan """
+        size = sizeFile(COMPLEX)
+        elec = inputgen.Elec("complex.pqr", size, "mg-manual", 0)
+        self.assertEqual(elec.nlev, size.model.getLevels(elec.dime))
+        self.assert_("    nlev %i\n" % elec.nlev in str(elec))
+        plan = size.setPlan(4)
+        elec = inputgen.Elec("complex.pqr", size, "", 0)
+        self.assertEqual((elec.method, elec.dime, elec.pdime, elec.nlev),
+                         (plan["method"], plan["dime"], plan["pdime"],
+                          plan["nlev"]))
+
+    def testChain(self):
+        """ A focusing schedule becomes a chain of mg-manual calculations
+            for each of the two dielectrics; only the last of each chain
+            computes energies and writes maps """
+        size = sizeFile(COMPLEX)
+        cen = size.getCenter()
+        schedule = size.setSchedule(cen, [20.0, 20.0, 20.0])
+        input = inputgen.Input("complex.pqr", size, "", 0)
+        nlevels = len(schedule)
+        self.assertEqual(len(input.elecs), 2*nlevels)
+        for k in range(2*nlevels):
+            elec = input.elecs[k]
+            level = schedule[k % nlevels]
+            self.assertEqual((elec.method, elec.dime, elec.nlev, elec.bcfl),
+                             ("mg-manual", level["dime"], level["nlev"],
+                              level["bcfl"]))
+            last = k % nlevels == nlevels - 1
+            self.assertEqual(elec.calcenergy != "no", last)
+        self.assertEqual(input.elecs[nlevels - 1].write, [["pot", "dx", "pot"]])
+        self.assertEqual(input.prints,
+                         ["print elecEnergy %i - %i end" % (2*nlevels, nlevels)])
+
+    def testGmemfac(self):
+        """ The deprecated gmemfac sets a fixed bytes per point model and
+            warns """
+        saved = psize.stderr
+        psize.stderr = StringIO()
+        try:
+            gmemfac = psize.deprecateGmemfac("100")
+            warning = psize.stderr.getvalue()
+        finally:
+            psize.stderr = saved
+        self.assertEqual(gmemfac, 100)
+        self.assert_(warning.startswith("Warning: --gmemfac is deprecated"))
+        # The model puts the fine grid above gmemceil, 100 bytes per
+        # point below it
+        size = sizeFile(COMPLEX)
+        self.assertEqual(inputgen.Elec("complex.pqr", size, "", 0).method,
+                         "mg-para")
+        size = sizeFile(COMPLEX, psize.GridModel(gmemfac=gmemfac))
+        self.assertEqual(inputgen.Elec("complex.pqr", size, "", 0).method,
+                         "mg-auto")
+
+class OutputTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.pqr = os.path.join(self.directory, "complex.pqr")
+        shutil.copy(COMPLEX, self.pqr)
+        self.size = sizeFile(self.pqr)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def testManifest(self):
+        """ A sequential run is one task writing the potential """
+        input = inputgen.Input(self.pqr, self.size, "mg-auto", 0)
+        input.printInputFiles()
+        input.printManifest()
+        manifest = json.load(open(self.path("complex-manifest.json")))
+        self.assertEqual((manifest["pqr"], manifest["natom"],
+                          manifest["method"], manifest["async"]),
+                         ("complex.pqr", self.size.gotatom, "mg-auto", 0))
+        task, = manifest["tasks"]
+        self.assertEqual(task["input"], self.path("complex.in"))
+        self.assert_(os.path.exists(task["input"]))
+        self.assertEqual((task["nproc"], task["outputs"], task["depends"]),
+                         (1, ["pot.dx"], []))
+        dime = input.elecs[0].dime
+        self.assertEqual(task["gridpoints"], dime[0]*dime[1]*dime[2])
+        self.assertAlmostEqual(task["memory"],
+                               self.size.model.getMemory(dime, self.size.gotatom))
+
+    def testAsyncManifest(self):
+        """ An async run is one task per processor and a merge task that
+            depends on all of them """
+        input = inputgen.Input(self.pqr, self.size, "mg-para", 1)
+        input.printInputFiles()
+        tasks = input.getTasks()
+        pdime = input.elecs[0].pdime
+        nproc = int(pdime[0]*pdime[1]*pdime[2])
+        self.assert_(nproc > 1)
+        self.assertEqual(len(tasks), nproc + 1)
+        for i in range(nproc):
+            self.assertEqual(tasks[i]["async"], i)
+            self.assertEqual(tasks[i]["outputs"], ["pot-PE%i.dx" % i])
+            self.assert_(os.path.exists(tasks[i]["input"]))
+        merge = tasks[-1]
+        self.assertEqual(merge["depends"], [task["name"] for task in tasks[:-1]])
+        self.assertEqual(merge["outputs"], ["pot.dx"])
+
+    def split(self, **args):
+        """ Split complex-para.in and return the expected async texts """
+        input = inputgen.Input(self.pqr, self.size, "mg-para", 0)
+        input.printInputFiles()
+        text = open(self.path("complex.in")).read()
+        os.rename(self.path("complex.in"), self.path("complex-para.in"))
+        inputgen.splitInput(self.path("complex-para.in"), **args)
+        pdime = input.elecs[0].pdime
+        return [string.replace(text, "mg-para\n", "mg-para\n    async %i\n" % i)
+                for i in range(int(pdime[0]*pdime[1]*pdime[2]))]
+
+    def testSplit(self):
+        """ Each async file is the parallel input with its async line """
+        expected = self.split()
+        for i in range(len(expected)):
+            self.assertEqual(open(self.path("complex-para-PE%i.in" % i)).read(),
+                             expected[i])
+
+    def testSplitPool(self):
+        """ Writing on a pool gives the same files, for the requested
+            processors only """
+        expected = self.split(pes=inputgen.parseRange("0-1,3"), nproc=2)
+        for i in range(len(expected)):
+            path = self.path("complex-para-PE%i.in" % i)
+            if i in [0, 1, 3]:
+                self.assertEqual(open(path).read(), expected[i])
+            else:
+                self.failIf(os.path.exists(path))
+
+    def testSplitArchive(self):
+        """ An archive holds the same files """
+        archive = self.path("complex.tar.gz")
+        expected = self.split(archive=archive)
+        tar = tarfile.open(archive)
+        self.assertEqual(tar.getnames(), ["complex-para-PE%i.in" % i
+                                          for i in range(len(expected))])
+        for i in range(len(expected)):
+            name = "complex-para-PE%i.in" % i
+            self.assertEqual(tar.extractfile(name).read(), expected[i])
+        tar.close()
+
+class EnsembleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, lines):
+        path = os.path.join(self.directory, name)
+        open(path, "w").write("".join(lines))
+        return path
+
+    def testModels(self):
+        """ Each MODEL is written to its own frame file; lines after the
+            final ENDMDL belong to no frame and are not sized """
+        path = self.write("traj.pqr", ["REMARK two frames\n",
+            "MODEL        1\n", atomLine(1, 0.0), atomLine(2, 1.0), "ENDMDL\n",
+            "MODEL        2\n", atomLine(1, 2.0), atomLine(2, 3.0), "ENDMDL\n",
+            atomLine(3, 50.0), "END\n"])
+        size = psize.Psize()
+        frames = inputgen.sizeEnsemble(path, size)
+        self.assertEqual([os.path.basename(f) for f in frames],
+                         ["traj-model1.pqr", "traj-model2.pqr"])
+        self.assertEqual(open(frames[1]).read(),
+                         atomLine(1, 2.0) + atomLine(2, 3.0))
+        self.assertEqual(size.gotatom, 2)
+        self.assertEqual(size.maxlen[0], 4.5)
+
+    def testSingleFrame(self):
+        """ A file without MODEL records is a single frame """
+        path = self.write("one.pqr", [atomLine(1, 0.0), atomLine(2, 1.0)])
+        size = psize.Psize()
+        self.assertEqual(inputgen.sizeEnsemble(path, size), [path])
+        self.assertEqual(size.gotatom, 2)
+
+    def testClosed(self):
+        """ isStructure and sizeEnsemble close the files they open """
+        path = self.write("traj.pqr", ["MODEL        1\n", atomLine(1, 0.0),
+                                       "ENDMDL\n"])
+        opened = []
+        openInput = psize.openInput
+        def recordOpen(filename):
+            opened.append(openInput(filename))
+            return opened[-1]
+        psize.openInput = recordOpen
+        try:
+            self.assertEqual(inputgen.isStructure(path), 1)
+            inputgen.sizeEnsemble(path, psize.Psize())
+        finally:
+            psize.openInput = openInput
+        self.assertEqual(len(opened), 3)
+        self.assertEqual([stream.closed for stream in opened], [1, 1, 1])
+
+if __name__ == "__main__":
+    unittest.main()
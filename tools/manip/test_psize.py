@@ -0,0 +1,321 @@
+""" Tests for psize.py
+
+	Run from this directory:
+
+		python test_psize.py
+"""
+
+import unittest, os, glob, shutil, tempfile, gzip, bz2, csv, json
+from cStringIO import StringIO
+import psize
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+EXAMPLES = sorted(glob.glob(os.path.join(HERE, "..", "..", "examples", "*", "*.pqr")))
+ION = os.path.join(HERE, "..", "..", "examples", "born", "ion.pqr")
+COMPLEX = os.path.join(HERE, "..", "..", "examples", "hca-bind", "complex.pqr")
+
+def atomLine(fields):
+	""" Return a PQR ATOM line with fields after column 30 """
+	return "ATOM      1  N   ALA     1    " + fields + "\n"
+
+def parse(lines, array):
+	size = psize.Psize()
+	if array:
+		size.parseLinesArray(lines)
+	else:
+		size.parseLines(lines)
+	return size.minlen, size.maxlen, size.q, size.gotatom, size.gothet, \
+		size.hist
+
+class ParseTest(unittest.TestCase):
+
+	def testExamples(self):
+		""" parseLinesArray matches parseLines on every example PQR file """
+		self.assert_(len(EXAMPLES) > 0)
+		for filename in EXAMPLES:
+			lines = open(filename).readlines()
+			self.assertEqual(parse(lines, 1), parse(lines, 0), filename)
+
+	def testSmallBlocks(self):
+		""" Results don't depend on where the blocks split the file """
+		lines = open(EXAMPLES[0]).readlines()
+		size = psize.Psize()
+		size.parseLinesArray(lines, blocksize=7)
+		self.assertEqual((size.minlen, size.maxlen, size.q, size.gotatom),
+			parse(lines, 0)[:4])
+
+	def testFieldCounts(self):
+		""" Lines with missing or extra fields are handled line by line even
+			when the total field count is a multiple of 5 """
+		lines = [atomLine("1.000 2.000 3.000"),
+			atomLine("4.000 5.000 6.000 -1.000 1.500 9.000 9.000"),
+			atomLine("-1.000-2.000-3.000 0.500 2.000")]
+		self.assertEqual(parse(lines, 1), parse(lines, 0))
+		self.assertEqual(parse(lines, 1)[3], 2)
+		self.assertEqual(parse(lines, 1)[2], -0.5)
+		# Four fields fail the same way in both parsers
+		lines = [atomLine("1.000 2.000 3.000 0.000 1.000 7.000"),
+			atomLine("4.000 5.000 6.000 -1.000")]
+		self.assertRaises(IndexError, parse, lines, 0)
+		self.assertRaises(IndexError, parse, lines, 1)
+
+def sized(filename):
+	size = psize.Psize()
+	size.parseInput(filename)
+	return size.minlen, size.maxlen, size.q, size.gotatom, size.gothet
+
+class StreamTest(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def testChunks(self):
+		""" readLines gives the same lines whatever the chunk size """
+		text = open(COMPLEX).read()
+		lines = text.split("\n")
+		if lines[-1] == "":
+			lines.pop()
+		for chunksize in [1, 7, 80, 4096]:
+			self.assertEqual(list(psize.readLines(StringIO(text), chunksize)),
+				lines)
+		self.assertEqual(list(psize.readLines(StringIO("a\nb"), 1)), ["a", "b"])
+
+	def testCompressed(self):
+		""" gzip and bzip2 files are detected from their contents """
+		text = open(COMPLEX).read()
+		for name, opener in [("c.gz", gzip.open), ("c.bz2", bz2.BZ2File),
+				("c.pqr.bz2", gzip.open)]:
+			path = os.path.join(self.directory, name)
+			file = opener(path, "wb")
+			file.write(text)
+			file.close()
+			self.assertEqual(sized(path), sized(COMPLEX), name)
+
+	def testStream(self):
+		""" parseStream in small chunks matches parseInput """
+		size = psize.Psize()
+		size.parseStream(open(COMPLEX), chunksize=100)
+		self.assertEqual((size.minlen, size.maxlen, size.q, size.gotatom,
+			size.gothet), sized(COMPLEX))
+
+class BatchTest(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.empty = os.path.join(self.directory, "empty.pqr")
+		open(self.empty, "w").write("REMARK no atoms\n")
+		self.filenames = [COMPLEX, self.empty,
+			os.path.join(self.directory, "missing.pqr"), ION]
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def check(self, results):
+		self.assertEqual([result["file"] for result in results], self.filenames)
+		self.assertEqual([result["error"] == "" for result in results],
+			[1, 0, 0, 1])
+		self.assert_(results[1]["error"].startswith("ValueError"))
+		self.assert_(results[2]["error"].startswith("IOError"))
+		size = psize.Psize()
+		size.runPsize(ION)
+		self.assertEqual(results[3]["natom"], size.gotatom)
+		self.assertEqual(results[3]["fglen"], list(size.getFineGridDims()))
+		self.assertEqual(results[3]["nfocus"], size.getFocus())
+
+	def testOrder(self):
+		""" Results come back in input order, serially or on a pool, with
+			failures reported as error rows """
+		serial = psize.runBatch(self.filenames, nproc=1)
+		self.check(serial)
+		self.assertEqual(psize.runBatch(self.filenames, nproc=2), serial)
+
+	def testManifest(self):
+		""" A manifest lists paths relative to itself """
+		manifest = os.path.join(self.directory, "list.txt")
+		open(manifest, "w").write("# structures\n\nempty.pqr\n")
+		self.assertEqual(psize.readManifest(manifest), [self.empty])
+		self.assertEqual(psize.readManifest(self.directory), [self.empty])
+
+	def testWrite(self):
+		""" writeBatch writes one CSV row or JSON object per result """
+		results = psize.runBatch(self.filenames, nproc=1)
+		stream = StringIO()
+		psize.writeBatch(results, stream)
+		rows = list(csv.reader(StringIO(stream.getvalue())))
+		self.assertEqual(rows[0], psize.BATCHFIELDS)
+		self.assertEqual([row[0] for row in rows[1:]], self.filenames)
+		self.assertEqual(rows[4][2], "%.3f" % results[3]["charge"])
+		stream = StringIO()
+		psize.writeBatch(results, stream, "json")
+		self.assertEqual(json.loads(stream.getvalue()), results)
+
+class CacheTest(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.cache = psize.PsizeCache(os.path.join(self.directory, "cache"))
+		self.copy = os.path.join(self.directory, "copy.pqr")
+		shutil.copy(ION, self.copy)
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def testKeys(self):
+		""" Keys depend on the file contents, the constants and the model,
+			not on the file name """
+		constants = psize.Psize().constants
+		key = self.cache.key(ION, constants)
+		self.assertEqual(self.cache.key(self.copy, constants), key)
+		self.assertEqual(self.cache.key(ION, dict(constants)), key)
+		changed = dict(constants)
+		changed["space"] = 0.25
+		keys = [key, self.cache.key(ION, changed),
+			self.cache.key(ION, constants, psize.GridModel("npbe")),
+			self.cache.key(ION, constants, psize.GridModel(force=1)),
+			self.cache.key(ION, constants, psize.GridModel(gmemfac=200))]
+		open(self.copy, "a").write("REMARK\n")
+		keys.append(self.cache.key(self.copy, constants))
+		self.assertEqual(len(dict.fromkeys(keys)), len(keys))
+
+	def testRun(self):
+		""" runPsize stores its results and reads them back """
+		size = psize.Psize()
+		size.setCache(self.cache)
+		size.runPsize(ION)
+		key = self.cache.key(ION, size.constants, size.model)
+		state = self.cache.get(key)
+		self.assertEqual(state["gotatom"], 1)
+		state["nfocus"] = 42
+		self.cache.put(key, state)
+		cached = psize.Psize()
+		cached.setCache(self.cache)
+		cached.runPsize(self.copy)
+		self.assertEqual(cached.getFocus(), 42)
+		self.assertEqual((cached.getCoarseGridDims(), cached.getFineGridDims(),
+			cached.hist), (size.getCoarseGridDims(), size.getFineGridDims(),
+			size.hist))
+		self.cache.invalidate(ION, size.constants, size.model)
+		self.assertEqual(self.cache.get(key), None)
+
+	def testEvict(self):
+		""" Only the most recently used maxsize entries are kept """
+		cache = psize.PsizeCache(self.cache.path, maxsize=2)
+		for i, key in enumerate(["a", "b", "c"]):
+			cache.put(key, {"i": i})
+			os.utime(cache.entry(key), (i, i))
+		self.assertEqual(cache.get("a"), None)
+		cache.get("b")
+		cache.put("d", {})
+		self.assertEqual(cache.get("c"), None)
+		self.assertEqual(cache.get("b"), {"i": 1})
+
+class PlanTest(unittest.TestCase):
+
+	def setUp(self):
+		self.size = psize.Psize()
+		self.size.runPsize(os.path.join(HERE, "..", "..", "examples",
+			"actin-dimer", "complex.pqr"))
+
+	def testCounts(self):
+		""" The NumPy and the pure Python subdomain counts agree and hold
+			every atom at least once """
+		for np in [[1, 1, 1], [2, 1, 3], [5, 4, 3]]:
+			self.size.densecache = None
+			counts = self.size.countSubdomains(np)
+			self.size.densecache = None
+			saved = psize.numpy
+			psize.numpy = None
+			try:
+				self.assertEqual(self.size.countSubdomains(np), counts)
+			finally:
+				psize.numpy = saved
+			self.assertEqual(len(counts), np[0]*np[1]*np[2])
+			self.assert_(sum(counts) >= self.size.gotatom)
+
+	def testProcGrids(self):
+		""" At most MAXPROCGRIDS processor grids are tried, closest to
+			ncores first """
+		need = [1000, 1000, 1000]
+		grids = self.size.procGrids(need, 64)
+		self.assertEqual(len(grids), psize.MAXPROCGRIDS)
+		self.assert_([4, 4, 4] in grids)
+		self.assert_([16, 16, 16] not in grids)
+		self.assertEqual(self.size.procGrids(need, None)[0], [16, 16, 16])
+		self.assertEqual(self.size.procGrids([60, 60, 60], 8, "mg-auto"),
+			[[1, 1, 1]])
+
+	def testPlan(self):
+		""" Balancing gives a plan no slower than the uniform estimate,
+			with the overlap taken from the constants """
+		plan = self.size.setPlan(64)
+		balanced = self.size.setPlan(64, balance=1)
+		self.assert_(balanced["time"] <= plan["time"])
+		self.assertEqual(balanced["pdime"], self.size.getPlan()["pdime"])
+		self.assert_(not plan.has_key("ofrac"))
+
+class ScheduleTest(unittest.TestCase):
+
+	def setUp(self):
+		self.size = psize.Psize()
+		self.size.runPsize(COMPLEX)
+		cen = self.size.getCenter()
+		self.center = [cen[0] + 5.0, cen[1] - 3.0, cen[2]]
+		self.length = [20.0, 20.0, 24.0]
+
+	def testSchedule(self):
+		""" Levels run from the coarse grid to the region, each inside the
+			one before and shrinking by at most redfac, under gmemceil """
+		schedule = self.size.setSchedule(self.center, self.length)
+		self.assertEqual(schedule, self.size.getSchedule())
+		self.assert_(len(schedule) > 1)
+		clen = self.size.getCoarseGridDims()
+		redfac = self.size.getConstant("redfac")
+		self.assertEqual(schedule[0]["glen"], list(clen))
+		self.assertEqual(schedule[0]["center"], list(self.size.getCenter()))
+		self.assertEqual(schedule[-1]["center"], self.center)
+		self.assert_(schedule[0]["bcfl"] in ["sdh", "mdh"])
+		for k in range(len(schedule)):
+			level = schedule[k]
+			dime = level["dime"]
+			self.assertEqual([(n - 1) % 32 for n in dime], [0, 0, 0])
+			self.assertEqual(level["nlev"], self.size.model.getLevels(dime))
+			self.assert_(self.size.model.getMemory(dime, self.size.gotatom)
+				<= self.size.getConstant("gmemceil"))
+			if k == 0:
+				continue
+			self.assertEqual(level["bcfl"], "focus")
+			previous = schedule[k-1]
+			for i in range(3):
+				self.assert_(level["glen"][i] >= redfac*previous["glen"][i] - 1e-6)
+				self.assert_(abs(level["center"][i] - previous["center"][i])
+					+ level["glen"][i]/2 <= previous["glen"][i]/2 + 1e-6)
+		for i in range(3):
+			self.assertAlmostEqual(schedule[-1]["glen"][i], self.length[i])
+			self.assert_(schedule[-1]["space"][i] <= self.size.getConstant("space"))
+
+	def testFewestPoints(self):
+		""" No other number of levels solves fewer grid points """
+		def total(schedule):
+			return sum([level["dime"][0]*level["dime"][1]*level["dime"][2]
+				for level in schedule])
+		best = total(self.size.setSchedule(self.center, self.length))
+		for maxlevels in range(1, 8):
+			schedule = self.size.setSchedule(self.center, self.length, maxlevels)
+			if schedule != None:
+				self.assert_(total(schedule) >= best)
+
+	def testOutside(self):
+		""" A region reaching outside the coarse grid has no schedule """
+		clen = self.size.getCoarseGridDims()
+		center = list(self.size.getCenter())
+		center[0] = center[0] + clen[0]/2
+		self.assertEqual(self.size.setSchedule(center, self.length), None)
+		self.assertEqual(self.size.getSchedule(), None)
+		self.assertEqual(psize.parseRegion("1,2,3,10,20,30"),
+			([1.0, 2.0, 3.0], [10.0, 20.0, 30.0]))
+
+if __name__ == "__main__":
+	unittest.main()
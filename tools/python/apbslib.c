@@ -1,15 +1,21 @@
 /* ----------------------------------------------------------------------------
  * This file was automatically generated by SWIG (http://www.swig.org).
- * Version 1.3.31
- * 
- * This file is not intended to be easily readable and contains a number of 
+ * Version 4.0.2
+ *
+ * This file is not intended to be easily readable and contains a number of
  * coding conventions designed to improve portability and efficiency. Do not make
- * changes to this file unless you know what you are doing--modify the SWIG 
- * interface file instead. 
+ * changes to this file unless you know what you are doing--modify the SWIG
+ * interface file instead.
  * ----------------------------------------------------------------------------- */
 
+
+#ifndef SWIGPYTHON
 #define SWIGPYTHON
+#endif
+
 #define SWIG_PYTHON_DIRECTOR_NO_VTABLE
+#define SWIGPYTHON_BUILTIN
+
 /* -----------------------------------------------------------------------------
  *  This section contains generic SWIG labels for method/variable
  *  declarations/attributes, and other compiler dependent labels.
@@ -17,14 +23,14 @@
 
 /* template workaround for compilers that cannot correctly implement the C++ standard */
 #ifndef SWIGTEMPLATEDISAMBIGUATOR
-# if defined(__SUNPRO_CC)
-#   if (__SUNPRO_CC <= 0x560)
-#     define SWIGTEMPLATEDISAMBIGUATOR template
-#   else
-#     define SWIGTEMPLATEDISAMBIGUATOR 
-#   endif
+# if defined(__SUNPRO_CC) && (__SUNPRO_CC <= 0x560)
+#  define SWIGTEMPLATEDISAMBIGUATOR template
+# elif defined(__HP_aCC)
+/* Needed even with `aCC -AA' when `aCC -V' reports HP ANSI C++ B3910B A.03.55 */
+/* If we find a maximum version that requires this, the test would be __HP_aCC <= 35500 for A.03.55 */
+#  define SWIGTEMPLATEDISAMBIGUATOR template
 # else
-#   define SWIGTEMPLATEDISAMBIGUATOR 
+#  define SWIGTEMPLATEDISAMBIGUATOR
 # endif
 #endif
 
@@ -41,14 +47,20 @@
 #ifndef SWIGUNUSED
 # if defined(__GNUC__)
 #   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
-#     define SWIGUNUSED __attribute__ ((__unused__)) 
+#     define SWIGUNUSED __attribute__ ((__unused__))
 #   else
 #     define SWIGUNUSED
 #   endif
 # elif defined(__ICC)
-#   define SWIGUNUSED __attribute__ ((__unused__)) 
+#   define SWIGUNUSED __attribute__ ((__unused__))
 # else
-#   define SWIGUNUSED 
+#   define SWIGUNUSED
+# endif
+#endif
+
+#ifndef SWIG_MSC_UNSUPPRESS_4505
+# if defined(_MSC_VER)
+#   pragma warning(disable : 4505) /* unreferenced local function has been removed */
 # endif
 #endif
 
@@ -56,7 +68,7 @@
 # ifdef __cplusplus
 #   define SWIGUNUSEDPARM(p)
 # else
-#   define SWIGUNUSEDPARM(p) p SWIGUNUSED 
+#   define SWIGUNUSEDPARM(p) p SWIGUNUSED
 # endif
 #endif
 
@@ -71,9 +83,11 @@
 #endif
 
 /* exporting methods */
-#if (__GNUC__ >= 4) || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4)
-#  ifndef GCC_HASCLASSVISIBILITY
-#    define GCC_HASCLASSVISIBILITY
+#if defined(__GNUC__)
+#  if (__GNUC__ >= 4) || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4)
+#    ifndef GCC_HASCLASSVISIBILITY
+#      define GCC_HASCLASSVISIBILITY
+#    endif
 #  endif
 #endif
 
@@ -99,7 +113,7 @@
 #   define SWIGSTDCALL __stdcall
 # else
 #   define SWIGSTDCALL
-# endif 
+# endif
 #endif
 
 /* Deal with Microsoft's attempt at deprecating C standard runtime functions */
@@ -107,20 +121,50 @@
 # define _CRT_SECURE_NO_DEPRECATE
 #endif
 
+/* Deal with Microsoft's attempt at deprecating methods in the standard C++ library */
+#if !defined(SWIG_NO_SCL_SECURE_NO_DEPRECATE) && defined(_MSC_VER) && !defined(_SCL_SECURE_NO_DEPRECATE)
+# define _SCL_SECURE_NO_DEPRECATE
+#endif
+
+/* Deal with Apple's deprecated 'AssertMacros.h' from Carbon-framework */
+#if defined(__APPLE__) && !defined(__ASSERT_MACROS_DEFINE_VERSIONS_WITHOUT_UNDERSCORES)
+# define __ASSERT_MACROS_DEFINE_VERSIONS_WITHOUT_UNDERSCORES 0
+#endif
+
+/* Intel's compiler complains if a variable which was never initialised is
+ * cast to void, which is a common idiom which we use to indicate that we
+ * are aware a variable isn't used.  So we just silence that warning.
+ * See: https://github.com/swig/swig/issues/192 for more discussion.
+ */
+#ifdef __INTEL_COMPILER
+# pragma warning disable 592
+#endif
+
+
+#if defined(__GNUC__) && defined(_WIN32) && !defined(SWIG_PYTHON_NO_HYPOT_WORKAROUND)
+/* Workaround for '::hypot' has not been declared', see https://bugs.python.org/issue11566 */
+# include <math.h>
+#endif
 
-/* Python.h has to appear first */
-#include <Python.h>
+#if defined(_DEBUG) && defined(SWIG_PYTHON_INTERPRETER_NO_DEBUG)
+/* Use debug wrappers with the Python release dll */
+# undef _DEBUG
+# include <Python.h>
+# define _DEBUG 1
+#else
+# include <Python.h>
+#endif
 
 /* -----------------------------------------------------------------------------
  * swigrun.swg
  *
- * This file contains generic CAPI SWIG runtime support for pointer
+ * This file contains generic C API SWIG runtime support for pointer
  * type checking.
  * ----------------------------------------------------------------------------- */
 
 /* This should only be incremented when either the layout of swig_type_info changes,
    or for whatever reason, the runtime changes incompatibly */
-#define SWIG_RUNTIME_VERSION "3"
+#define SWIG_RUNTIME_VERSION "4"
 
 /* define SWIG_TYPE_TABLE_NAME as "SWIG_TYPE_TABLE" */
 #ifdef SWIG_TYPE_TABLE
@@ -133,11 +177,11 @@
 
 /*
   You can use the SWIGRUNTIME and SWIGRUNTIMEINLINE macros for
-  creating a static or dynamic library from the swig runtime code.
-  In 99.9% of the cases, swig just needs to declare them as 'static'.
-  
-  But only do this if is strictly necessary, ie, if you have problems
-  with your compiler or so.
+  creating a static or dynamic library from the SWIG runtime code.
+  In 99.9% of the cases, SWIG just needs to declare them as 'static'.
+
+  But only do this if strictly necessary, ie, if you have problems
+  with your compiler or suchlike.
 */
 
 #ifndef SWIGRUNTIME
@@ -155,22 +199,24 @@
 
 /* Flags for pointer conversions */
 #define SWIG_POINTER_DISOWN        0x1
+#define SWIG_CAST_NEW_MEMORY       0x2
+#define SWIG_POINTER_NO_NULL       0x4
 
 /* Flags for new pointer objects */
 #define SWIG_POINTER_OWN           0x1
 
 
-/* 
+/*
    Flags/methods for returning states.
-   
-   The swig conversion methods, as ConvertPtr, return and integer 
+
+   The SWIG conversion methods, as ConvertPtr, return an integer
    that tells if the conversion was successful or not. And if not,
    an error code can be returned (see swigerrors.swg for the codes).
-   
+
    Use the following macros/flags to set or process the returning
    states.
-   
-   In old swig versions, you usually write code as:
+
+   In old versions of SWIG, code such as the following was usually written:
 
      if (SWIG_ConvertPtr(obj,vptr,ty.flags) != -1) {
        // success code
@@ -178,7 +224,7 @@
        //fail code
      }
 
-   Now you can be more explicit as:
+   Now you can be more explicit:
 
     int res = SWIG_ConvertPtr(obj,vptr,ty.flags);
     if (SWIG_IsOK(res)) {
@@ -187,7 +233,7 @@
       // fail code
     }
 
-   that seems to be the same, but now you can also do
+   which is the same really, but now you can also do
 
     Type *ptr;
     int res = SWIG_ConvertPtr(obj,(void **)(&ptr),ty.flags);
@@ -202,28 +248,28 @@
     } else {
       // fail code
     }
-    
+
    I.e., now SWIG_ConvertPtr can return new objects and you can
    identify the case and take care of the deallocation. Of course that
-   requires also to SWIG_ConvertPtr to return new result values, as
-
-      int SWIG_ConvertPtr(obj, ptr,...) {         
-        if (<obj is ok>) {			       
-          if (<need new object>) {		       
-            *ptr = <ptr to new allocated object>; 
-            return SWIG_NEWOBJ;		       
-          } else {				       
-            *ptr = <ptr to old object>;	       
-            return SWIG_OLDOBJ;		       
-          } 				       
-        } else {				       
-          return SWIG_BADOBJ;		       
-        }					       
+   also requires SWIG_ConvertPtr to return new result values, such as
+
+      int SWIG_ConvertPtr(obj, ptr,...) {
+        if (<obj is ok>) {
+          if (<need new object>) {
+            *ptr = <ptr to new allocated object>;
+            return SWIG_NEWOBJ;
+          } else {
+            *ptr = <ptr to old object>;
+            return SWIG_OLDOBJ;
+          }
+        } else {
+          return SWIG_BADOBJ;
+        }
       }
 
    Of course, returning the plain '0(success)/-1(fail)' still works, but you can be
    more explicit by returning SWIG_BADOBJ, SWIG_ERROR or any of the
-   swig errors code.
+   SWIG errors code.
 
    Finally, if the SWIG_CASTRANK_MODE is enabled, the result code
    allows to return the 'cast rank', for example, if you have this
@@ -232,18 +278,17 @@
        int fooi(int);
 
    and you call
- 
+
       food(1)   // cast rank '1'  (1 -> 1.0)
       fooi(1)   // cast rank '0'
 
    just use the SWIG_AddCast()/SWIG_CheckState()
+*/
 
-
- */
-#define SWIG_OK                    (0) 
+#define SWIG_OK                    (0)
 #define SWIG_ERROR                 (-1)
 #define SWIG_IsOK(r)               (r >= 0)
-#define SWIG_ArgError(r)           ((r != SWIG_ERROR) ? r : SWIG_TypeError)  
+#define SWIG_ArgError(r)           ((r != SWIG_ERROR) ? r : SWIG_TypeError)
 
 /* The CastRankLimit says how many bits are used for the cast rank */
 #define SWIG_CASTRANKLIMIT         (1 << 8)
@@ -264,7 +309,6 @@
 #define SWIG_DelTmpMask(r)         (SWIG_IsOK(r) ? (r & ~SWIG_TMPOBJMASK) : r)
 #define SWIG_IsTmpObj(r)           (SWIG_IsOK(r) && (r & SWIG_TMPOBJMASK))
 
-
 /* Cast-Rank Mode */
 #if defined(SWIG_CASTRANK_MODE)
 #  ifndef SWIG_TypeRank
@@ -275,30 +319,28 @@
 #  endif
 #  define SWIG_CASTRANKMASK          ((SWIG_CASTRANKLIMIT) -1)
 #  define SWIG_CastRank(r)           (r & SWIG_CASTRANKMASK)
-SWIGINTERNINLINE int SWIG_AddCast(int r) { 
+SWIGINTERNINLINE int SWIG_AddCast(int r) {
   return SWIG_IsOK(r) ? ((SWIG_CastRank(r) < SWIG_MAXCASTRANK) ? (r + 1) : SWIG_ERROR) : r;
 }
-SWIGINTERNINLINE int SWIG_CheckState(int r) { 
-  return SWIG_IsOK(r) ? SWIG_CastRank(r) + 1 : 0; 
+SWIGINTERNINLINE int SWIG_CheckState(int r) {
+  return SWIG_IsOK(r) ? SWIG_CastRank(r) + 1 : 0;
 }
 #else /* no cast-rank mode */
-#  define SWIG_AddCast
+#  define SWIG_AddCast(r) (r)
 #  define SWIG_CheckState(r) (SWIG_IsOK(r) ? 1 : 0)
 #endif
 
 
-
-
 #include <string.h>
 
 #ifdef __cplusplus
 extern "C" {
 #endif
 
-typedef void *(*swig_converter_func)(void *);
+typedef void *(*swig_converter_func)(void *, int *);
 typedef struct swig_type_info *(*swig_dycast_func)(void **);
 
-/* Structure to store inforomation on one type */
+/* Structure to store information on one type */
 typedef struct swig_type_info {
   const char             *name;			/* mangled name of this type */
   const char             *str;			/* human readable name of this type */
@@ -328,7 +370,7 @@ typedef struct swig_module_info {
   void                    *clientdata;		/* Language specific module data */
 } swig_module_info;
 
-/* 
+/*
   Compare two type names skipping the space characters, therefore
   "char*" == "char *" and "Class<int>" == "Class<int >", etc.
 
@@ -343,23 +385,23 @@ SWIG_TypeNameComp(const char *f1, const char *l1,
     while ((*f2 == ' ') && (f2 != l2)) ++f2;
     if (*f1 != *f2) return (*f1 > *f2) ? 1 : -1;
   }
-  return (l1 - f1) - (l2 - f2);
+  return (int)((l1 - f1) - (l2 - f2));
 }
 
 /*
   Check type equivalence in a name list like <name1>|<name2>|...
-  Return 0 if not equal, 1 if equal
+  Return 0 if equal, -1 if nb < tb, 1 if nb > tb
 */
 SWIGRUNTIME int
-SWIG_TypeEquiv(const char *nb, const char *tb) {
-  int equiv = 0;
+SWIG_TypeCmp(const char *nb, const char *tb) {
+  int equiv = 1;
   const char* te = tb + strlen(tb);
   const char* ne = nb;
-  while (!equiv && *ne) {
+  while (equiv != 0 && *ne) {
     for (nb = ne; *ne; ++ne) {
       if (*ne == '|') break;
     }
-    equiv = (SWIG_TypeNameComp(nb, ne, tb, te) == 0) ? 1 : 0;
+    equiv = SWIG_TypeNameComp(nb, ne, tb, te);
     if (*ne) ++ne;
   }
   return equiv;
@@ -367,69 +409,76 @@ SWIG_TypeEquiv(const char *nb, const char *tb) {
 
 /*
   Check type equivalence in a name list like <name1>|<name2>|...
-  Return 0 if equal, -1 if nb < tb, 1 if nb > tb
+  Return 0 if not equal, 1 if equal
 */
 SWIGRUNTIME int
-SWIG_TypeCompare(const char *nb, const char *tb) {
-  int equiv = 0;
-  const char* te = tb + strlen(tb);
-  const char* ne = nb;
-  while (!equiv && *ne) {
-    for (nb = ne; *ne; ++ne) {
-      if (*ne == '|') break;
-    }
-    equiv = (SWIG_TypeNameComp(nb, ne, tb, te) == 0) ? 1 : 0;
-    if (*ne) ++ne;
-  }
-  return equiv;
+SWIG_TypeEquiv(const char *nb, const char *tb) {
+  return SWIG_TypeCmp(nb, tb) == 0 ? 1 : 0;
 }
 
-
-/* think of this as a c++ template<> or a scheme macro */
-#define SWIG_TypeCheck_Template(comparison, ty)         \
-  if (ty) {                                             \
-    swig_cast_info *iter = ty->cast;                    \
-    while (iter) {                                      \
-      if (comparison) {                                 \
-        if (iter == ty->cast) return iter;              \
-        /* Move iter to the top of the linked list */   \
-        iter->prev->next = iter->next;                  \
-        if (iter->next)                                 \
-          iter->next->prev = iter->prev;                \
-        iter->next = ty->cast;                          \
-        iter->prev = 0;                                 \
-        if (ty->cast) ty->cast->prev = iter;            \
-        ty->cast = iter;                                \
-        return iter;                                    \
-      }                                                 \
-      iter = iter->next;                                \
-    }                                                   \
-  }                                                     \
-  return 0
-
 /*
   Check the typename
 */
 SWIGRUNTIME swig_cast_info *
 SWIG_TypeCheck(const char *c, swig_type_info *ty) {
-  SWIG_TypeCheck_Template(strcmp(iter->type->name, c) == 0, ty);
+  if (ty) {
+    swig_cast_info *iter = ty->cast;
+    while (iter) {
+      if (strcmp(iter->type->name, c) == 0) {
+        if (iter == ty->cast)
+          return iter;
+        /* Move iter to the top of the linked list */
+        iter->prev->next = iter->next;
+        if (iter->next)
+          iter->next->prev = iter->prev;
+        iter->next = ty->cast;
+        iter->prev = 0;
+        if (ty->cast) ty->cast->prev = iter;
+        ty->cast = iter;
+        return iter;
+      }
+      iter = iter->next;
+    }
+  }
+  return 0;
 }
 
-/* Same as previous function, except strcmp is replaced with a pointer comparison */
+/*
+  Identical to SWIG_TypeCheck, except strcmp is replaced with a pointer comparison
+*/
 SWIGRUNTIME swig_cast_info *
-SWIG_TypeCheckStruct(swig_type_info *from, swig_type_info *into) {
-  SWIG_TypeCheck_Template(iter->type == from, into);
+SWIG_TypeCheckStruct(swig_type_info *from, swig_type_info *ty) {
+  if (ty) {
+    swig_cast_info *iter = ty->cast;
+    while (iter) {
+      if (iter->type == from) {
+        if (iter == ty->cast)
+          return iter;
+        /* Move iter to the top of the linked list */
+        iter->prev->next = iter->next;
+        if (iter->next)
+          iter->next->prev = iter->prev;
+        iter->next = ty->cast;
+        iter->prev = 0;
+        if (ty->cast) ty->cast->prev = iter;
+        ty->cast = iter;
+        return iter;
+      }
+      iter = iter->next;
+    }
+  }
+  return 0;
 }
 
 /*
   Cast a pointer up an inheritance hierarchy
 */
 SWIGRUNTIMEINLINE void *
-SWIG_TypeCast(swig_cast_info *ty, void *ptr) {
-  return ((!ty) || (!ty->converter)) ? ptr : (*ty->converter)(ptr);
+SWIG_TypeCast(swig_cast_info *ty, void *ptr, int *newmemory) {
+  return ((!ty) || (!ty->converter)) ? ptr : (*ty->converter)(ptr, newmemory);
 }
 
-/* 
+/*
    Dynamic pointer casting. Down an inheritance hierarchy
 */
 SWIGRUNTIME swig_type_info *
@@ -473,7 +522,7 @@ SWIG_TypePrettyName(const swig_type_info *type) {
     return type->name;
 }
 
-/* 
+/*
    Set the clientdata field for a type
 */
 SWIGRUNTIME void
@@ -481,14 +530,14 @@ SWIG_TypeClientData(swig_type_info *ti, void *clientdata) {
   swig_cast_info *cast = ti->cast;
   /* if (ti->clientdata == clientdata) return; */
   ti->clientdata = clientdata;
-  
+
   while (cast) {
     if (!cast->converter) {
       swig_type_info *tc = cast->type;
       if (!tc->clientdata) {
 	SWIG_TypeClientData(tc, clientdata);
       }
-    }    
+    }
     cast = cast->next;
   }
 }
@@ -497,31 +546,31 @@ SWIG_TypeNewClientData(swig_type_info *ti, void *clientdata) {
   SWIG_TypeClientData(ti, clientdata);
   ti->owndata = 1;
 }
-  
+
 /*
   Search for a swig_type_info structure only by mangled name
   Search is a O(log #types)
-  
-  We start searching at module start, and finish searching when start == end.  
+
+  We start searching at module start, and finish searching when start == end.
   Note: if start == end at the beginning of the function, we go all the way around
   the circular list.
 */
 SWIGRUNTIME swig_type_info *
-SWIG_MangledTypeQueryModule(swig_module_info *start, 
-                            swig_module_info *end, 
+SWIG_MangledTypeQueryModule(swig_module_info *start,
+                            swig_module_info *end,
 		            const char *name) {
   swig_module_info *iter = start;
   do {
     if (iter->size) {
-      register size_t l = 0;
-      register size_t r = iter->size - 1;
+      size_t l = 0;
+      size_t r = iter->size - 1;
       do {
 	/* since l+r >= 0, we can (>> 1) instead (/ 2) */
-	register size_t i = (l + r) >> 1; 
+	size_t i = (l + r) >> 1;
 	const char *iname = iter->types[i]->name;
 	if (iname) {
-	  register int compare = strcmp(name, iname);
-	  if (compare == 0) {	    
+	  int compare = strcmp(name, iname);
+	  if (compare == 0) {
 	    return iter->types[i];
 	  } else if (compare < 0) {
 	    if (i) {
@@ -546,14 +595,14 @@ SWIG_MangledTypeQueryModule(swig_module_info *start,
   Search for a swig_type_info structure for either a mangled name or a human readable name.
   It first searches the mangled names of the types, which is a O(log #types)
   If a type is not found it then searches the human readable names, which is O(#types).
-  
-  We start searching at module start, and finish searching when start == end.  
+
+  We start searching at module start, and finish searching when start == end.
   Note: if start == end at the beginning of the function, we go all the way around
   the circular list.
 */
 SWIGRUNTIME swig_type_info *
-SWIG_TypeQueryModule(swig_module_info *start, 
-                     swig_module_info *end, 
+SWIG_TypeQueryModule(swig_module_info *start,
+                     swig_module_info *end,
 		     const char *name) {
   /* STEP 1: Search the name field using binary search */
   swig_type_info *ret = SWIG_MangledTypeQueryModule(start, end, name);
@@ -564,7 +613,7 @@ SWIG_TypeQueryModule(swig_module_info *start,
        of the str field (the human readable name) */
     swig_module_info *iter = start;
     do {
-      register size_t i = 0;
+      size_t i = 0;
       for (; i < iter->size; ++i) {
 	if (iter->types[i]->str && (SWIG_TypeEquiv(iter->types[i]->str, name)))
 	  return iter->types[i];
@@ -572,56 +621,56 @@ SWIG_TypeQueryModule(swig_module_info *start,
       iter = iter->next;
     } while (iter != end);
   }
-  
+
   /* neither found a match */
   return 0;
 }
 
-/* 
+/*
    Pack binary data into a string
 */
 SWIGRUNTIME char *
 SWIG_PackData(char *c, void *ptr, size_t sz) {
   static const char hex[17] = "0123456789abcdef";
-  register const unsigned char *u = (unsigned char *) ptr;
-  register const unsigned char *eu =  u + sz;
+  const unsigned char *u = (unsigned char *) ptr;
+  const unsigned char *eu =  u + sz;
   for (; u != eu; ++u) {
-    register unsigned char uu = *u;
+    unsigned char uu = *u;
     *(c++) = hex[(uu & 0xf0) >> 4];
     *(c++) = hex[uu & 0xf];
   }
   return c;
 }
 
-/* 
+/*
    Unpack binary data from a string
 */
 SWIGRUNTIME const char *
 SWIG_UnpackData(const char *c, void *ptr, size_t sz) {
-  register unsigned char *u = (unsigned char *) ptr;
-  register const unsigned char *eu = u + sz;
+  unsigned char *u = (unsigned char *) ptr;
+  const unsigned char *eu = u + sz;
   for (; u != eu; ++u) {
-    register char d = *(c++);
-    register unsigned char uu;
+    char d = *(c++);
+    unsigned char uu;
     if ((d >= '0') && (d <= '9'))
-      uu = ((d - '0') << 4);
+      uu = (unsigned char)((d - '0') << 4);
     else if ((d >= 'a') && (d <= 'f'))
-      uu = ((d - ('a'-10)) << 4);
-    else 
+      uu = (unsigned char)((d - ('a'-10)) << 4);
+    else
       return (char *) 0;
     d = *(c++);
     if ((d >= '0') && (d <= '9'))
-      uu |= (d - '0');
+      uu |= (unsigned char)(d - '0');
     else if ((d >= 'a') && (d <= 'f'))
-      uu |= (d - ('a'-10));
-    else 
+      uu |= (unsigned char)(d - ('a'-10));
+    else
       return (char *) 0;
     *u = uu;
   }
   return c;
 }
 
-/* 
+/*
    Pack 'void *' into a string buffer.
 */
 SWIGRUNTIME char *
@@ -681,109 +730,112 @@ SWIG_UnpackDataName(const char *c, void *ptr, size_t sz, const char *name) {
 #endif
 
 /*  Errors in SWIG */
-#define  SWIG_UnknownError    	   -1 
-#define  SWIG_IOError        	   -2 
-#define  SWIG_RuntimeError   	   -3 
-#define  SWIG_IndexError     	   -4 
-#define  SWIG_TypeError      	   -5 
-#define  SWIG_DivisionByZero 	   -6 
-#define  SWIG_OverflowError  	   -7 
-#define  SWIG_SyntaxError    	   -8 
-#define  SWIG_ValueError     	   -9 
+#define  SWIG_UnknownError    	   -1
+#define  SWIG_IOError        	   -2
+#define  SWIG_RuntimeError   	   -3
+#define  SWIG_IndexError     	   -4
+#define  SWIG_TypeError      	   -5
+#define  SWIG_DivisionByZero 	   -6
+#define  SWIG_OverflowError  	   -7
+#define  SWIG_SyntaxError    	   -8
+#define  SWIG_ValueError     	   -9
 #define  SWIG_SystemError    	   -10
 #define  SWIG_AttributeError 	   -11
-#define  SWIG_MemoryError    	   -12 
+#define  SWIG_MemoryError    	   -12
 #define  SWIG_NullReferenceError   -13
 
 
 
+/* Compatibility macros for Python 3 */
+#if PY_VERSION_HEX >= 0x03000000
 
-/* Add PyOS_snprintf for old Pythons */
-#if PY_VERSION_HEX < 0x02020000
-# if defined(_MSC_VER) || defined(__BORLANDC__) || defined(_WATCOM)
-#  define PyOS_snprintf _snprintf
-# else
-#  define PyOS_snprintf snprintf
-# endif
-#endif
-
-/* A crude PyString_FromFormat implementation for old Pythons */
-#if PY_VERSION_HEX < 0x02020000
+#define PyClass_Check(obj) PyObject_IsInstance(obj, (PyObject *)&PyType_Type)
+#define PyInt_Check(x) PyLong_Check(x)
+#define PyInt_AsLong(x) PyLong_AsLong(x)
+#define PyInt_FromLong(x) PyLong_FromLong(x)
+#define PyInt_FromSize_t(x) PyLong_FromSize_t(x)
+#define PyString_Check(name) PyBytes_Check(name)
+#define PyString_FromString(x) PyUnicode_FromString(x)
+#define PyString_Format(fmt, args)  PyUnicode_Format(fmt, args)
+#define PyString_AsString(str) PyBytes_AsString(str)
+#define PyString_Size(str) PyBytes_Size(str)	
+#define PyString_InternFromString(key) PyUnicode_InternFromString(key)
+#define Py_TPFLAGS_HAVE_CLASS Py_TPFLAGS_BASETYPE
+#define PyString_AS_STRING(x) PyUnicode_AS_STRING(x)
+#define _PyLong_FromSsize_t(x) PyLong_FromSsize_t(x)
 
-#ifndef SWIG_PYBUFFER_SIZE
-# define SWIG_PYBUFFER_SIZE 1024
 #endif
 
-static PyObject *
-PyString_FromFormat(const char *fmt, ...) {
-  va_list ap;
-  char buf[SWIG_PYBUFFER_SIZE * 2];
-  int res;
-  va_start(ap, fmt);
-  res = vsnprintf(buf, sizeof(buf), fmt, ap);
-  va_end(ap);
-  return (res < 0 || res >= (int)sizeof(buf)) ? 0 : PyString_FromString(buf);
-}
+#ifndef Py_TYPE
+#  define Py_TYPE(op) ((op)->ob_type)
 #endif
 
-/* Add PyObject_Del for old Pythons */
-#if PY_VERSION_HEX < 0x01060000
-# define PyObject_Del(op) PyMem_DEL((op))
-#endif
-#ifndef PyObject_DEL
-# define PyObject_DEL PyObject_Del
-#endif
+/* SWIG APIs for compatibility of both Python 2 & 3 */
 
-/* A crude PyExc_StopIteration exception for old Pythons */
-#if PY_VERSION_HEX < 0x02020000
-# ifndef PyExc_StopIteration
-#  define PyExc_StopIteration PyExc_RuntimeError
-# endif
-# ifndef PyObject_GenericGetAttr
-#  define PyObject_GenericGetAttr 0
-# endif
-#endif
-/* Py_NotImplemented is defined in 2.1 and up. */
-#if PY_VERSION_HEX < 0x02010000
-# ifndef Py_NotImplemented
-#  define Py_NotImplemented PyExc_RuntimeError
-# endif
+#if PY_VERSION_HEX >= 0x03000000
+#  define SWIG_Python_str_FromFormat PyUnicode_FromFormat
+#else
+#  define SWIG_Python_str_FromFormat PyString_FromFormat
 #endif
 
 
-/* A crude PyString_AsStringAndSize implementation for old Pythons */
-#if PY_VERSION_HEX < 0x02010000
-# ifndef PyString_AsStringAndSize
-#  define PyString_AsStringAndSize(obj, s, len) {*s = PyString_AsString(obj); *len = *s ? strlen(*s) : 0;}
-# endif
+/* Warning: This function will allocate a new string in Python 3,
+ * so please call SWIG_Python_str_DelForPy3(x) to free the space.
+ */
+SWIGINTERN char*
+SWIG_Python_str_AsChar(PyObject *str)
+{
+#if PY_VERSION_HEX >= 0x03030000
+  return (char *)PyUnicode_AsUTF8(str);
+#elif PY_VERSION_HEX >= 0x03000000
+  char *newstr = 0;
+  str = PyUnicode_AsUTF8String(str);
+  if (str) {
+    char *cstr;
+    Py_ssize_t len;
+    if (PyBytes_AsStringAndSize(str, &cstr, &len) != -1) {
+      newstr = (char *) malloc(len+1);
+      if (newstr)
+        memcpy(newstr, cstr, len+1);
+    }
+    Py_XDECREF(str);
+  }
+  return newstr;
+#else
+  return PyString_AsString(str);
 #endif
+}
 
-/* PySequence_Size for old Pythons */
-#if PY_VERSION_HEX < 0x02000000
-# ifndef PySequence_Size
-#  define PySequence_Size PySequence_Length
-# endif
+#if PY_VERSION_HEX >= 0x03030000 || PY_VERSION_HEX < 0x03000000
+#  define SWIG_Python_str_DelForPy3(x)
+#else
+#  define SWIG_Python_str_DelForPy3(x) free( (void*) (x) )
 #endif
 
 
-/* PyBool_FromLong for old Pythons */
-#if PY_VERSION_HEX < 0x02030000
-static
-PyObject *PyBool_FromLong(long ok)
+SWIGINTERN PyObject*
+SWIG_Python_str_FromChar(const char *c)
 {
-  PyObject *result = ok ? Py_True : Py_False;
-  Py_INCREF(result);
-  return result;
+#if PY_VERSION_HEX >= 0x03000000
+  return PyUnicode_FromString(c); 
+#else
+  return PyString_FromString(c);
+#endif
 }
+
+#ifndef PyObject_DEL
+# define PyObject_DEL PyObject_Del
 #endif
 
-/* Py_ssize_t for old Pythons */
-/* This code is as recommended by: */
-/* http://www.python.org/dev/peps/pep-0353/#conversion-guidelines */
-#if PY_VERSION_HEX < 0x02050000 && !defined(PY_SSIZE_T_MIN)
-typedef int Py_ssize_t;
-# define PY_SSIZE_T_MAX INT_MAX
-# define PY_SSIZE_T_MIN INT_MIN
+// SWIGPY_USE_CAPSULE is no longer used within SWIG itself, but some user
+// interface files check for it.
+# define SWIGPY_USE_CAPSULE
+# define SWIGPY_CAPSULE_NAME ("swig_runtime_data" SWIG_RUNTIME_VERSION ".type_pointer_capsule" SWIG_TYPE_TABLE_NAME)
+
+#if PY_VERSION_HEX < 0x03020000
+#define PyDescr_TYPE(x) (((PyDescrObject *)(x))->d_type)
+#define PyDescr_NAME(x) (((PyDescrObject *)(x))->d_name)
+#define Py_hash_t long
 #endif
 
 /* -----------------------------------------------------------------------------
@@ -841,20 +893,55 @@ SWIG_Python_AddErrorMsg(const char* mesg)
   PyObject *value = 0;
   PyObject *traceback = 0;
 
-  if (PyErr_Occurred()) PyErr_Fetch(&type, &value, &traceback);
+  if (PyErr_Occurred())
+    PyErr_Fetch(&type, &value, &traceback);
   if (value) {
     PyObject *old_str = PyObject_Str(value);
+    const char *tmp = SWIG_Python_str_AsChar(old_str);
     PyErr_Clear();
     Py_XINCREF(type);
-    PyErr_Format(type, "%s %s", PyString_AsString(old_str), mesg);
+    if (tmp)
+      PyErr_Format(type, "%s %s", tmp, mesg);
+    else
+      PyErr_Format(type, "%s", mesg);
+    SWIG_Python_str_DelForPy3(tmp);
     Py_DECREF(old_str);
     Py_DECREF(value);
   } else {
-    PyErr_Format(PyExc_RuntimeError, mesg);
+    PyErr_SetString(PyExc_RuntimeError, mesg);
   }
 }
 
+SWIGRUNTIME int
+SWIG_Python_TypeErrorOccurred(PyObject *obj)
+{
+  PyObject *error;
+  if (obj)
+    return 0;
+  error = PyErr_Occurred();
+  return error && PyErr_GivenExceptionMatches(error, PyExc_TypeError);
+}
 
+SWIGRUNTIME void
+SWIG_Python_RaiseOrModifyTypeError(const char *message)
+{
+  if (SWIG_Python_TypeErrorOccurred(NULL)) {
+    /* Use existing TypeError to preserve stacktrace and enhance with given message */
+    PyObject *newvalue;
+    PyObject *type = NULL, *value = NULL, *traceback = NULL;
+    PyErr_Fetch(&type, &value, &traceback);
+#if PY_VERSION_HEX >= 0x03000000
+    newvalue = PyUnicode_FromFormat("%S\nAdditional information:\n%s", value, message);
+#else
+    newvalue = PyString_FromFormat("%s\nAdditional information:\n%s", PyString_AsString(value), message);
+#endif
+    Py_XDECREF(value);
+    PyErr_Restore(type, newvalue, traceback);
+  } else {
+    /* Raise TypeError using given message */
+    PyErr_SetString(PyExc_TypeError, message);
+  }
+}
 
 #if defined(SWIG_PYTHON_NO_THREADS)
 #  if defined(SWIG_PYTHON_THREADS)
@@ -863,9 +950,7 @@ SWIG_Python_AddErrorMsg(const char* mesg)
 #endif
 #if defined(SWIG_PYTHON_THREADS) /* Threading support is enabled */
 #  if !defined(SWIG_PYTHON_USE_GIL) && !defined(SWIG_PYTHON_NO_USE_GIL)
-#    if (PY_VERSION_HEX >= 0x02030000) /* For 2.3 or later, use the PyGILState calls */
-#      define SWIG_PYTHON_USE_GIL
-#    endif
+#    define SWIG_PYTHON_USE_GIL
 #  endif
 #  if defined(SWIG_PYTHON_USE_GIL) /* Use PyGILState threads calls */
 #    ifndef SWIG_PYTHON_INITIALIZE_THREADS
@@ -929,9 +1014,6 @@ SWIG_Python_AddErrorMsg(const char* mesg)
 
 #ifdef __cplusplus
 extern "C" {
-#if 0
-} /* cc-mode */
-#endif
 #endif
 
 /* -----------------------------------------------------------------------------
@@ -945,7 +1027,7 @@ extern "C" {
 /* Constant information structure */
 typedef struct swig_const_info {
   int type;
-  char *name;
+  const char *name;
   long lvalue;
   double dvalue;
   void   *pvalue;
@@ -953,17 +1035,11 @@ typedef struct swig_const_info {
 } swig_const_info;
 
 #ifdef __cplusplus
-#if 0
-{ /* cc-mode */
-#endif
 }
 #endif
 
 
 /* -----------------------------------------------------------------------------
- * See the LICENSE file for information on copyright, usage and redistribution
- * of SWIG, and the README file for authors - http://www.swig.org/release.html.
- *
  * pyrun.swg
  *
  * This file contains the runtime support for Python modules
@@ -972,13 +1048,29 @@ typedef struct swig_const_info {
  *
  * ----------------------------------------------------------------------------- */
 
+#if PY_VERSION_HEX < 0x02070000 /* 2.7.0 */
+# error "This version of SWIG only supports Python >= 2.7"
+#endif
+
+#if PY_VERSION_HEX >= 0x03000000 && PY_VERSION_HEX < 0x03020000
+# error "This version of SWIG only supports Python 3 >= 3.2"
+#endif
+
 /* Common SWIG API */
 
 /* for raw pointers */
 #define SWIG_Python_ConvertPtr(obj, pptr, type, flags)  SWIG_Python_ConvertPtrAndOwn(obj, pptr, type, flags, 0)
 #define SWIG_ConvertPtr(obj, pptr, type, flags)         SWIG_Python_ConvertPtr(obj, pptr, type, flags)
 #define SWIG_ConvertPtrAndOwn(obj,pptr,type,flags,own)  SWIG_Python_ConvertPtrAndOwn(obj, pptr, type, flags, own)
-#define SWIG_NewPointerObj(ptr, type, flags)            SWIG_Python_NewPointerObj(ptr, type, flags)
+
+#ifdef SWIGPYTHON_BUILTIN
+#define SWIG_NewPointerObj(ptr, type, flags)            SWIG_Python_NewPointerObj(self, ptr, type, flags)
+#else
+#define SWIG_NewPointerObj(ptr, type, flags)            SWIG_Python_NewPointerObj(NULL, ptr, type, flags)
+#endif
+
+#define SWIG_InternalNewPointerObj(ptr, type, flags)	SWIG_Python_NewPointerObj(NULL, ptr, type, flags)
+
 #define SWIG_CheckImplicit(ty)                          SWIG_Python_CheckImplicit(ty) 
 #define SWIG_AcquirePtr(ptr, src)                       SWIG_Python_AcquirePtr(ptr, src)
 #define swig_owntype                                    int
@@ -993,7 +1085,7 @@ typedef struct swig_const_info {
 
 /* for C or C++ function pointers */
 #define SWIG_ConvertFunctionPtr(obj, pptr, type)        SWIG_Python_ConvertFunctionPtr(obj, pptr, type)
-#define SWIG_NewFunctionPtrObj(ptr, type)               SWIG_Python_NewPointerObj(ptr, type, 0)
+#define SWIG_NewFunctionPtrObj(ptr, type)               SWIG_Python_NewPointerObj(NULL, ptr, type, 0)
 
 /* for C++ member pointers, ie, member methods */
 #define SWIG_ConvertMember(obj, ptr, sz, ty)            SWIG_Python_ConvertPacked(obj, ptr, sz, ty)
@@ -1002,9 +1094,9 @@ typedef struct swig_const_info {
 
 /* Runtime API */
 
-#define SWIG_GetModule(clientdata)                      SWIG_Python_GetModule()
+#define SWIG_GetModule(clientdata)                      SWIG_Python_GetModule(clientdata)
 #define SWIG_SetModule(clientdata, pointer)             SWIG_Python_SetModule(pointer)
-#define SWIG_NewClientData(obj)                         PySwigClientData_New(obj)
+#define SWIG_NewClientData(obj)                         SwigPyClientData_New(obj)
 
 #define SWIG_SetErrorObj                                SWIG_Python_SetErrorObj                            
 #define SWIG_SetErrorMsg                        	SWIG_Python_SetErrorMsg				   
@@ -1028,7 +1120,7 @@ SWIG_Python_SetErrorObj(PyObject *errtype, PyObject *obj) {
 SWIGINTERN void 
 SWIG_Python_SetErrorMsg(PyObject *errtype, const char *msg) {
   SWIG_PYTHON_THREAD_BEGIN_BLOCK;
-  PyErr_SetString(errtype, (char *) msg);
+  PyErr_SetString(errtype, msg);
   SWIG_PYTHON_THREAD_END_BLOCK;
 }
 
@@ -1036,17 +1128,37 @@ SWIG_Python_SetErrorMsg(PyObject *errtype, const char *msg) {
 
 /* Set a constant value */
 
+#if defined(SWIGPYTHON_BUILTIN)
+
+SWIGINTERN void
+SwigPyBuiltin_AddPublicSymbol(PyObject *seq, const char *key) {
+  PyObject *s = PyString_InternFromString(key);
+  PyList_Append(seq, s);
+  Py_DECREF(s);
+}
+
+SWIGINTERN void
+SWIG_Python_SetConstant(PyObject *d, PyObject *public_interface, const char *name, PyObject *obj) {   
+  PyDict_SetItemString(d, name, obj);
+  Py_DECREF(obj);
+  if (public_interface)
+    SwigPyBuiltin_AddPublicSymbol(public_interface, name);
+}
+
+#else
+
 SWIGINTERN void
 SWIG_Python_SetConstant(PyObject *d, const char *name, PyObject *obj) {   
-  PyDict_SetItemString(d, (char*) name, obj);
+  PyDict_SetItemString(d, name, obj);
   Py_DECREF(obj);                            
 }
 
+#endif
+
 /* Append a value to the result obj */
 
 SWIGINTERN PyObject*
 SWIG_Python_AppendOutput(PyObject* result, PyObject* obj) {
-#if !defined(SWIG_PYTHON_OUTPUT_TUPLE)
   if (!result) {
     result = obj;
   } else if (result == Py_None) {
@@ -1062,60 +1174,45 @@ SWIG_Python_AppendOutput(PyObject* result, PyObject* obj) {
     Py_DECREF(obj);
   }
   return result;
-#else
-  PyObject*   o2;
-  PyObject*   o3;
-  if (!result) {
-    result = obj;
-  } else if (result == Py_None) {
-    Py_DECREF(result);
-    result = obj;
-  } else {
-    if (!PyTuple_Check(result)) {
-      o2 = result;
-      result = PyTuple_New(1);
-      PyTuple_SET_ITEM(result, 0, o2);
-    }
-    o3 = PyTuple_New(1);
-    PyTuple_SET_ITEM(o3, 0, obj);
-    o2 = result;
-    result = PySequence_Concat(o2, o3);
-    Py_DECREF(o2);
-    Py_DECREF(o3);
-  }
-  return result;
-#endif
 }
 
 /* Unpack the argument tuple */
 
-SWIGINTERN int
-SWIG_Python_UnpackTuple(PyObject *args, const char *name, int min, int max, PyObject **objs)
+SWIGINTERN Py_ssize_t
+SWIG_Python_UnpackTuple(PyObject *args, const char *name, Py_ssize_t min, Py_ssize_t max, PyObject **objs)
 {
   if (!args) {
     if (!min && !max) {
       return 1;
     } else {
       PyErr_Format(PyExc_TypeError, "%s expected %s%d arguments, got none", 
-		   name, (min == max ? "" : "at least "), min);
+		   name, (min == max ? "" : "at least "), (int)min);
       return 0;
     }
   }  
   if (!PyTuple_Check(args)) {
+    if (min <= 1 && max >= 1) {
+      Py_ssize_t i;
+      objs[0] = args;
+      for (i = 1; i < max; ++i) {
+	objs[i] = 0;
+      }
+      return 2;
+    }
     PyErr_SetString(PyExc_SystemError, "UnpackTuple() argument list is not a tuple");
     return 0;
   } else {
-    register int l = PyTuple_GET_SIZE(args);
+    Py_ssize_t l = PyTuple_GET_SIZE(args);
     if (l < min) {
       PyErr_Format(PyExc_TypeError, "%s expected %s%d arguments, got %d", 
-		   name, (min == max ? "" : "at least "), min, l);
+		   name, (min == max ? "" : "at least "), (int)min, (int)l);
       return 0;
     } else if (l > max) {
       PyErr_Format(PyExc_TypeError, "%s expected %s%d arguments, got %d", 
-		   name, (min == max ? "" : "at most "), max, l);
+		   name, (min == max ? "" : "at most "), (int)max, (int)l);
       return 0;
     } else {
-      register int i;
+      Py_ssize_t i;
       for (i = 0; i < l; ++i) {
 	objs[i] = PyTuple_GET_ITEM(args, i);
       }
@@ -1127,12 +1224,21 @@ SWIG_Python_UnpackTuple(PyObject *args, const char *name, int min, int max, PyOb
   }
 }
 
+SWIGINTERN int
+SWIG_Python_CheckNoKeywords(PyObject *kwargs, const char *name) {
+  int no_kwargs = 1;
+  if (kwargs) {
+    assert(PyDict_Check(kwargs));
+    if (PyDict_Size(kwargs) > 0) {
+      PyErr_Format(PyExc_TypeError, "%s() does not take keyword arguments", name);
+      no_kwargs = 0;
+    }
+  }
+  return no_kwargs;
+}
+
 /* A functor is a function object with one single object argument */
-#if PY_VERSION_HEX >= 0x02020000
 #define SWIG_Python_CallFunctor(functor, obj)	        PyObject_CallFunctionObjArgs(functor, obj, NULL);
-#else
-#define SWIG_Python_CallFunctor(functor, obj)	        PyObject_CallFunction(functor, "O", obj);
-#endif
 
 /*
   Helper for static pointer initialization for both C and C++ code, for example
@@ -1154,40 +1260,11 @@ SWIG_Python_UnpackTuple(PyObject *args, const char *name, int min, int max, PyOb
 
 #define SWIG_POINTER_IMPLICIT_CONV  (SWIG_POINTER_DISOWN   << 1)
 
+#define SWIG_BUILTIN_TP_INIT	    (SWIG_POINTER_OWN << 2)
+#define SWIG_BUILTIN_INIT	    (SWIG_BUILTIN_TP_INIT | SWIG_POINTER_OWN)
+
 #ifdef __cplusplus
 extern "C" {
-#if 0
-} /* cc-mode */
-#endif
-#endif
-
-/*  How to access Py_None */
-#if defined(_WIN32) || defined(__WIN32__) || defined(__CYGWIN__)
-#  ifndef SWIG_PYTHON_NO_BUILD_NONE
-#    ifndef SWIG_PYTHON_BUILD_NONE
-#      define SWIG_PYTHON_BUILD_NONE
-#    endif
-#  endif
-#endif
-
-#ifdef SWIG_PYTHON_BUILD_NONE
-#  ifdef Py_None
-#   undef Py_None
-#   define Py_None SWIG_Py_None()
-#  endif
-SWIGRUNTIMEINLINE PyObject * 
-_SWIG_Py_None(void)
-{
-  PyObject *none = Py_BuildValue((char*)"");
-  Py_DECREF(none);
-  return none;
-}
-SWIGRUNTIME PyObject * 
-SWIG_Py_None(void)
-{
-  static PyObject *SWIG_STATIC_POINTER(none) = _SWIG_Py_None();
-  return none;
-}
 #endif
 
 /* The python void return value */
@@ -1200,7 +1277,7 @@ SWIG_Py_Void(void)
   return none;
 }
 
-/* PySwigClientData */
+/* SwigPyClientData */
 
 typedef struct {
   PyObject *klass;
@@ -1209,30 +1286,34 @@ typedef struct {
   PyObject *destroy;
   int delargs;
   int implicitconv;
-} PySwigClientData;
+  PyTypeObject *pytype;
+} SwigPyClientData;
 
 SWIGRUNTIMEINLINE int 
 SWIG_Python_CheckImplicit(swig_type_info *ty)
 {
-  PySwigClientData *data = (PySwigClientData *)ty->clientdata;
-  return data ? data->implicitconv : 0;
+  SwigPyClientData *data = (SwigPyClientData *)ty->clientdata;
+  int fail = data ? data->implicitconv : 0;
+  if (fail)
+    PyErr_SetString(PyExc_TypeError, "Implicit conversion is prohibited for explicit constructors.");
+  return fail;
 }
 
 SWIGRUNTIMEINLINE PyObject *
 SWIG_Python_ExceptionType(swig_type_info *desc) {
-  PySwigClientData *data = desc ? (PySwigClientData *) desc->clientdata : 0;
+  SwigPyClientData *data = desc ? (SwigPyClientData *) desc->clientdata : 0;
   PyObject *klass = data ? data->klass : 0;
   return (klass ? klass : PyExc_RuntimeError);
 }
 
 
-SWIGRUNTIME PySwigClientData * 
-PySwigClientData_New(PyObject* obj)
+SWIGRUNTIME SwigPyClientData * 
+SwigPyClientData_New(PyObject* obj)
 {
   if (!obj) {
     return 0;
   } else {
-    PySwigClientData *data = (PySwigClientData *)malloc(sizeof(PySwigClientData));
+    SwigPyClientData *data = (SwigPyClientData *)malloc(sizeof(SwigPyClientData));
     /* the klass element */
     data->klass = obj;
     Py_INCREF(data->klass);
@@ -1242,11 +1323,7 @@ PySwigClientData_New(PyObject* obj)
       data->newargs = obj;
       Py_INCREF(obj);
     } else {
-#if (PY_VERSION_HEX < 0x02020000)
-      data->newraw = 0;
-#else
-      data->newraw = PyObject_GetAttrString(data->klass, (char *)"__new__");
-#endif
+      data->newraw = PyObject_GetAttrString(data->klass, "__new__");
       if (data->newraw) {
 	Py_INCREF(data->newraw);
 	data->newargs = PyTuple_New(1);
@@ -1257,7 +1334,7 @@ PySwigClientData_New(PyObject* obj)
       Py_INCREF(data->newargs);
     }
     /* the destroy method, aka as the C++ delete method */
-    data->destroy = PyObject_GetAttrString(data->klass, (char *)"__swig_destroy__");
+    data->destroy = PyObject_GetAttrString(data->klass, "__swig_destroy__");
     if (PyErr_Occurred()) {
       PyErr_Clear();
       data->destroy = 0;
@@ -1266,28 +1343,24 @@ PySwigClientData_New(PyObject* obj)
       int flags;
       Py_INCREF(data->destroy);
       flags = PyCFunction_GET_FLAGS(data->destroy);
-#ifdef METH_O
       data->delargs = !(flags & (METH_O));
-#else
-      data->delargs = 0;
-#endif
     } else {
       data->delargs = 0;
     }
     data->implicitconv = 0;
+    data->pytype = 0;
     return data;
   }
 }
 
 SWIGRUNTIME void 
-PySwigClientData_Del(PySwigClientData* data)
-{
+SwigPyClientData_Del(SwigPyClientData *data) {
   Py_XDECREF(data->newraw);
   Py_XDECREF(data->newargs);
   Py_XDECREF(data->destroy);
 }
 
-/* =============== PySwigObject =====================*/
+/* =============== SwigPyObject =====================*/
 
 typedef struct {
   PyObject_HEAD
@@ -1295,24 +1368,48 @@ typedef struct {
   swig_type_info *ty;
   int own;
   PyObject *next;
-} PySwigObject;
+#ifdef SWIGPYTHON_BUILTIN
+  PyObject *dict;
+#endif
+} SwigPyObject;
+
+
+#ifdef SWIGPYTHON_BUILTIN
+
+SWIGRUNTIME PyObject *
+SwigPyObject_get___dict__(PyObject *v, PyObject *SWIGUNUSEDPARM(args))
+{
+  SwigPyObject *sobj = (SwigPyObject *)v;
+
+  if (!sobj->dict)
+    sobj->dict = PyDict_New();
+
+  Py_INCREF(sobj->dict);
+  return sobj->dict;
+}
+
+#endif
 
 SWIGRUNTIME PyObject *
-PySwigObject_long(PySwigObject *v)
+SwigPyObject_long(SwigPyObject *v)
 {
   return PyLong_FromVoidPtr(v->ptr);
 }
 
 SWIGRUNTIME PyObject *
-PySwigObject_format(const char* fmt, PySwigObject *v)
+SwigPyObject_format(const char* fmt, SwigPyObject *v)
 {
   PyObject *res = NULL;
   PyObject *args = PyTuple_New(1);
   if (args) {
-    if (PyTuple_SetItem(args, 0, PySwigObject_long(v)) == 0) {
-      PyObject *ofmt = PyString_FromString(fmt);
+    if (PyTuple_SetItem(args, 0, SwigPyObject_long(v)) == 0) {
+      PyObject *ofmt = SWIG_Python_str_FromChar(fmt);
       if (ofmt) {
+#if PY_VERSION_HEX >= 0x03000000
+	res = PyUnicode_Format(ofmt,args);
+#else
 	res = PyString_Format(ofmt,args);
+#endif
 	Py_DECREF(ofmt);
       }
       Py_DECREF(args);
@@ -1322,133 +1419,160 @@ PySwigObject_format(const char* fmt, PySwigObject *v)
 }
 
 SWIGRUNTIME PyObject *
-PySwigObject_oct(PySwigObject *v)
+SwigPyObject_oct(SwigPyObject *v)
 {
-  return PySwigObject_format("%o",v);
+  return SwigPyObject_format("%o",v);
 }
 
 SWIGRUNTIME PyObject *
-PySwigObject_hex(PySwigObject *v)
+SwigPyObject_hex(SwigPyObject *v)
 {
-  return PySwigObject_format("%x",v);
+  return SwigPyObject_format("%x",v);
 }
 
 SWIGRUNTIME PyObject *
-#ifdef METH_NOARGS
-PySwigObject_repr(PySwigObject *v)
-#else
-PySwigObject_repr(PySwigObject *v, PyObject *args)
-#endif
+SwigPyObject_repr(SwigPyObject *v)
 {
   const char *name = SWIG_TypePrettyName(v->ty);
-  PyObject *hex = PySwigObject_hex(v);    
-  PyObject *repr = PyString_FromFormat("<Swig Object of type '%s' at 0x%s>", name, PyString_AsString(hex));
-  Py_DECREF(hex);
+  PyObject *repr = SWIG_Python_str_FromFormat("<Swig Object of type '%s' at %p>", (name ? name : "unknown"), (void *)v);
   if (v->next) {
-#ifdef METH_NOARGS
-    PyObject *nrep = PySwigObject_repr((PySwigObject *)v->next);
-#else
-    PyObject *nrep = PySwigObject_repr((PySwigObject *)v->next, args);
-#endif
+    PyObject *nrep = SwigPyObject_repr((SwigPyObject *)v->next);
+# if PY_VERSION_HEX >= 0x03000000
+    PyObject *joined = PyUnicode_Concat(repr, nrep);
+    Py_DecRef(repr);
+    Py_DecRef(nrep);
+    repr = joined;
+# else
     PyString_ConcatAndDel(&repr,nrep);
+# endif
   }
   return repr;  
 }
 
-SWIGRUNTIME int
-PySwigObject_print(PySwigObject *v, FILE *fp, int SWIGUNUSEDPARM(flags))
-{
-#ifdef METH_NOARGS
-  PyObject *repr = PySwigObject_repr(v);
-#else
-  PyObject *repr = PySwigObject_repr(v, NULL);
-#endif
-  if (repr) {
-    fputs(PyString_AsString(repr), fp);
-    Py_DECREF(repr);
-    return 0; 
-  } else {
-    return 1; 
-  }
-}
-
+/* We need a version taking two PyObject* parameters so it's a valid
+ * PyCFunction to use in swigobject_methods[]. */
 SWIGRUNTIME PyObject *
-PySwigObject_str(PySwigObject *v)
+SwigPyObject_repr2(PyObject *v, PyObject *SWIGUNUSEDPARM(args))
 {
-  char result[SWIG_BUFFER_SIZE];
-  return SWIG_PackVoidPtr(result, v->ptr, v->ty->name, sizeof(result)) ?
-    PyString_FromString(result) : 0;
+  return SwigPyObject_repr((SwigPyObject*)v);
 }
 
 SWIGRUNTIME int
-PySwigObject_compare(PySwigObject *v, PySwigObject *w)
+SwigPyObject_compare(SwigPyObject *v, SwigPyObject *w)
 {
   void *i = v->ptr;
   void *j = w->ptr;
   return (i < j) ? -1 : ((i > j) ? 1 : 0);
 }
 
-SWIGRUNTIME PyTypeObject* _PySwigObject_type(void);
+/* Added for Python 3.x, would it also be useful for Python 2.x? */
+SWIGRUNTIME PyObject*
+SwigPyObject_richcompare(SwigPyObject *v, SwigPyObject *w, int op)
+{
+  PyObject* res;
+  if( op != Py_EQ && op != Py_NE ) {
+    Py_INCREF(Py_NotImplemented);
+    return Py_NotImplemented;
+  }
+  res = PyBool_FromLong( (SwigPyObject_compare(v, w)==0) == (op == Py_EQ) ? 1 : 0);
+  return res;  
+}
+
+
+SWIGRUNTIME PyTypeObject* SwigPyObject_TypeOnce(void);
 
+#ifdef SWIGPYTHON_BUILTIN
+static swig_type_info *SwigPyObject_stype = 0;
+SWIGRUNTIME PyTypeObject*
+SwigPyObject_type(void) {
+    SwigPyClientData *cd;
+    assert(SwigPyObject_stype);
+    cd = (SwigPyClientData*) SwigPyObject_stype->clientdata;
+    assert(cd);
+    assert(cd->pytype);
+    return cd->pytype;
+}
+#else
 SWIGRUNTIME PyTypeObject*
-PySwigObject_type(void) {
-  static PyTypeObject *SWIG_STATIC_POINTER(type) = _PySwigObject_type();
+SwigPyObject_type(void) {
+  static PyTypeObject *SWIG_STATIC_POINTER(type) = SwigPyObject_TypeOnce();
   return type;
 }
+#endif
 
 SWIGRUNTIMEINLINE int
-PySwigObject_Check(PyObject *op) {
-  return ((op)->ob_type == PySwigObject_type())
-    || (strcmp((op)->ob_type->tp_name,"PySwigObject") == 0);
-}
-
+SwigPyObject_Check(PyObject *op) {
+#ifdef SWIGPYTHON_BUILTIN
+  PyTypeObject *target_tp = SwigPyObject_type();
+  if (PyType_IsSubtype(op->ob_type, target_tp))
+    return 1;
+  return (strcmp(op->ob_type->tp_name, "SwigPyObject") == 0);
+#else
+  return (Py_TYPE(op) == SwigPyObject_type())
+    || (strcmp(Py_TYPE(op)->tp_name,"SwigPyObject") == 0);
+#endif
+}
+
 SWIGRUNTIME PyObject *
-PySwigObject_New(void *ptr, swig_type_info *ty, int own);
+SwigPyObject_New(void *ptr, swig_type_info *ty, int own);
 
 SWIGRUNTIME void
-PySwigObject_dealloc(PyObject *v)
+SwigPyObject_dealloc(PyObject *v)
 {
-  PySwigObject *sobj = (PySwigObject *) v;
+  SwigPyObject *sobj = (SwigPyObject *) v;
   PyObject *next = sobj->next;
-  if (sobj->own) {
+  if (sobj->own == SWIG_POINTER_OWN) {
     swig_type_info *ty = sobj->ty;
-    PySwigClientData *data = ty ? (PySwigClientData *) ty->clientdata : 0;
+    SwigPyClientData *data = ty ? (SwigPyClientData *) ty->clientdata : 0;
     PyObject *destroy = data ? data->destroy : 0;
     if (destroy) {
       /* destroy is always a VARARGS method */
       PyObject *res;
+
+      /* PyObject_CallFunction() has the potential to silently drop
+         the active exception.  In cases of unnamed temporary
+         variable or where we just finished iterating over a generator
+         StopIteration will be active right now, and this needs to
+         remain true upon return from SwigPyObject_dealloc.  So save
+         and restore. */
+      
+      PyObject *type = NULL, *value = NULL, *traceback = NULL;
+      PyErr_Fetch(&type, &value, &traceback);
+
       if (data->delargs) {
-	/* we need to create a temporal object to carry the destroy operation */
-	PyObject *tmp = PySwigObject_New(sobj->ptr, ty, 0);
-	res = SWIG_Python_CallFunctor(destroy, tmp);
-	Py_DECREF(tmp);
+        /* we need to create a temporary object to carry the destroy operation */
+        PyObject *tmp = SwigPyObject_New(sobj->ptr, ty, 0);
+        res = SWIG_Python_CallFunctor(destroy, tmp);
+        Py_DECREF(tmp);
       } else {
-	PyCFunction meth = PyCFunction_GET_FUNCTION(destroy);
-	PyObject *mself = PyCFunction_GET_SELF(destroy);
-	res = ((*meth)(mself, v));
+        PyCFunction meth = PyCFunction_GET_FUNCTION(destroy);
+        PyObject *mself = PyCFunction_GET_SELF(destroy);
+        res = ((*meth)(mself, v));
       }
+      if (!res)
+        PyErr_WriteUnraisable(destroy);
+
+      PyErr_Restore(type, value, traceback);
+
       Py_XDECREF(res);
-    } else {
-      const char *name = SWIG_TypePrettyName(ty);
+    } 
 #if !defined(SWIG_PYTHON_SILENT_MEMLEAK)
-      printf("swig/python detected a memory leak of type '%s', no destructor found.\n", name);
-#endif
+    else {
+      const char *name = SWIG_TypePrettyName(ty);
+      printf("swig/python detected a memory leak of type '%s', no destructor found.\n", (name ? name : "unknown"));
     }
+#endif
   } 
   Py_XDECREF(next);
   PyObject_DEL(v);
 }
 
 SWIGRUNTIME PyObject* 
-PySwigObject_append(PyObject* v, PyObject* next)
+SwigPyObject_append(PyObject* v, PyObject* next)
 {
-  PySwigObject *sobj = (PySwigObject *) v;
-#ifndef METH_O
-  PyObject *tmp = 0;
-  if (!PyArg_ParseTuple(next,(char *)"O:append", &tmp)) return NULL;
-  next = tmp;
-#endif
-  if (!PySwigObject_Check(next)) {
+  SwigPyObject *sobj = (SwigPyObject *) v;
+  if (!SwigPyObject_Check(next)) {
+    PyErr_SetString(PyExc_TypeError, "Attempt to append a non SwigPyObject");
     return NULL;
   }
   sobj->next = next;
@@ -1457,13 +1581,9 @@ PySwigObject_append(PyObject* v, PyObject* next)
 }
 
 SWIGRUNTIME PyObject* 
-#ifdef METH_NOARGS
-PySwigObject_next(PyObject* v)
-#else
-PySwigObject_next(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
-#endif
+SwigPyObject_next(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
 {
-  PySwigObject *sobj = (PySwigObject *) v;
+  SwigPyObject *sobj = (SwigPyObject *) v;
   if (sobj->next) {    
     Py_INCREF(sobj->next);
     return sobj->next;
@@ -1473,105 +1593,64 @@ PySwigObject_next(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
 }
 
 SWIGINTERN PyObject*
-#ifdef METH_NOARGS
-PySwigObject_disown(PyObject *v)
-#else
-PySwigObject_disown(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
-#endif
+SwigPyObject_disown(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
 {
-  PySwigObject *sobj = (PySwigObject *)v;
+  SwigPyObject *sobj = (SwigPyObject *)v;
   sobj->own = 0;
   return SWIG_Py_Void();
 }
 
 SWIGINTERN PyObject*
-#ifdef METH_NOARGS
-PySwigObject_acquire(PyObject *v)
-#else
-PySwigObject_acquire(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
-#endif
+SwigPyObject_acquire(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
 {
-  PySwigObject *sobj = (PySwigObject *)v;
+  SwigPyObject *sobj = (SwigPyObject *)v;
   sobj->own = SWIG_POINTER_OWN;
   return SWIG_Py_Void();
 }
 
 SWIGINTERN PyObject*
-PySwigObject_own(PyObject *v, PyObject *args)
+SwigPyObject_own(PyObject *v, PyObject *args)
 {
   PyObject *val = 0;
-#if (PY_VERSION_HEX < 0x02020000)
-  if (!PyArg_ParseTuple(args,(char *)"|O:own",&val))
-#else
-  if (!PyArg_UnpackTuple(args, (char *)"own", 0, 1, &val)) 
-#endif
-    {
-      return NULL;
+  if (!PyArg_UnpackTuple(args, "own", 0, 1, &val)) {
+    return NULL;
+  } else {
+    SwigPyObject *sobj = (SwigPyObject *)v;
+    PyObject *obj = PyBool_FromLong(sobj->own);
+    if (val) {
+      if (PyObject_IsTrue(val)) {
+        SwigPyObject_acquire(v,args);
+      } else {
+        SwigPyObject_disown(v,args);
+      }
     } 
-  else
-    {
-      PySwigObject *sobj = (PySwigObject *)v;
-      PyObject *obj = PyBool_FromLong(sobj->own);
-      if (val) {
-#ifdef METH_NOARGS
-	if (PyObject_IsTrue(val)) {
-	  PySwigObject_acquire(v);
-	} else {
-	  PySwigObject_disown(v);
-	}
-#else
-	if (PyObject_IsTrue(val)) {
-	  PySwigObject_acquire(v,args);
-	} else {
-	  PySwigObject_disown(v,args);
-	}
-#endif
-      } 
-      return obj;
-    }
+    return obj;
+  }
 }
 
-#ifdef METH_O
-static PyMethodDef
-swigobject_methods[] = {
-  {(char *)"disown",  (PyCFunction)PySwigObject_disown,  METH_NOARGS,  (char *)"releases ownership of the pointer"},
-  {(char *)"acquire", (PyCFunction)PySwigObject_acquire, METH_NOARGS,  (char *)"aquires ownership of the pointer"},
-  {(char *)"own",     (PyCFunction)PySwigObject_own,     METH_VARARGS, (char *)"returns/sets ownership of the pointer"},
-  {(char *)"append",  (PyCFunction)PySwigObject_append,  METH_O,       (char *)"appends another 'this' object"},
-  {(char *)"next",    (PyCFunction)PySwigObject_next,    METH_NOARGS,  (char *)"returns the next 'this' object"},
-  {(char *)"__repr__",(PyCFunction)PySwigObject_repr,    METH_NOARGS,  (char *)"returns object representation"},
-  {0, 0, 0, 0}  
-};
-#else
 static PyMethodDef
 swigobject_methods[] = {
-  {(char *)"disown",  (PyCFunction)PySwigObject_disown,  METH_VARARGS,  (char *)"releases ownership of the pointer"},
-  {(char *)"acquire", (PyCFunction)PySwigObject_acquire, METH_VARARGS,  (char *)"aquires ownership of the pointer"},
-  {(char *)"own",     (PyCFunction)PySwigObject_own,     METH_VARARGS,  (char *)"returns/sets ownership of the pointer"},
-  {(char *)"append",  (PyCFunction)PySwigObject_append,  METH_VARARGS,  (char *)"appends another 'this' object"},
-  {(char *)"next",    (PyCFunction)PySwigObject_next,    METH_VARARGS,  (char *)"returns the next 'this' object"},
-  {(char *)"__repr__",(PyCFunction)PySwigObject_repr,   METH_VARARGS,  (char *)"returns object representation"},
+  {"disown",  SwigPyObject_disown,  METH_NOARGS,  "releases ownership of the pointer"},
+  {"acquire", SwigPyObject_acquire, METH_NOARGS,  "acquires ownership of the pointer"},
+  {"own",     SwigPyObject_own,     METH_VARARGS, "returns/sets ownership of the pointer"},
+  {"append",  SwigPyObject_append,  METH_O,       "appends another 'this' object"},
+  {"next",    SwigPyObject_next,    METH_NOARGS,  "returns the next 'this' object"},
+  {"__repr__",SwigPyObject_repr2,   METH_NOARGS,  "returns object representation"},
   {0, 0, 0, 0}  
 };
-#endif
-
-#if PY_VERSION_HEX < 0x02020000
-SWIGINTERN PyObject *
-PySwigObject_getattr(PySwigObject *sobj,char *name)
-{
-  return Py_FindMethod(swigobject_methods, (PyObject *)sobj, name);
-}
-#endif
 
 SWIGRUNTIME PyTypeObject*
-_PySwigObject_type(void) {
+SwigPyObject_TypeOnce(void) {
   static char swigobject_doc[] = "Swig object carries a C/C++ instance pointer";
-  
-  static PyNumberMethods PySwigObject_as_number = {
+
+  static PyNumberMethods SwigPyObject_as_number = {
     (binaryfunc)0, /*nb_add*/
     (binaryfunc)0, /*nb_subtract*/
     (binaryfunc)0, /*nb_multiply*/
+    /* nb_divide removed in Python 3 */
+#if PY_VERSION_HEX < 0x03000000
     (binaryfunc)0, /*nb_divide*/
+#endif
     (binaryfunc)0, /*nb_remainder*/
     (binaryfunc)0, /*nb_divmod*/
     (ternaryfunc)0,/*nb_power*/
@@ -1585,94 +1664,118 @@ _PySwigObject_type(void) {
     0,		   /*nb_and*/
     0,		   /*nb_xor*/
     0,		   /*nb_or*/
-    (coercion)0,   /*nb_coerce*/
-    (unaryfunc)PySwigObject_long, /*nb_int*/
-    (unaryfunc)PySwigObject_long, /*nb_long*/
+#if PY_VERSION_HEX < 0x03000000
+    0,   /*nb_coerce*/
+#endif
+    (unaryfunc)SwigPyObject_long, /*nb_int*/
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc)SwigPyObject_long, /*nb_long*/
+#else
+    0, /*nb_reserved*/
+#endif
     (unaryfunc)0,                 /*nb_float*/
-    (unaryfunc)PySwigObject_oct,  /*nb_oct*/
-    (unaryfunc)PySwigObject_hex,  /*nb_hex*/
-#if PY_VERSION_HEX >= 0x02020000
-    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_inplace_true_divide */ 
-#elif PY_VERSION_HEX >= 0x02000000
-    0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_inplace_or */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc)SwigPyObject_oct,  /*nb_oct*/
+    (unaryfunc)SwigPyObject_hex,  /*nb_hex*/
+#endif
+#if PY_VERSION_HEX >= 0x03050000 /* 3.5 */
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_inplace_matrix_multiply */
+#elif PY_VERSION_HEX >= 0x03000000 /* 3.0 */
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_index, nb_inplace_divide removed */
+#else
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_index */
 #endif
   };
 
-  static PyTypeObject pyswigobject_type;  
+  static PyTypeObject swigpyobject_type;
   static int type_init = 0;
   if (!type_init) {
-    const PyTypeObject tmp
-      = {
-	PyObject_HEAD_INIT(NULL)
-	0,				    /* ob_size */
-	(char *)"PySwigObject",		    /* tp_name */
-	sizeof(PySwigObject),		    /* tp_basicsize */
-	0,			            /* tp_itemsize */
-	(destructor)PySwigObject_dealloc,   /* tp_dealloc */
-	(printfunc)PySwigObject_print,	    /* tp_print */
-#if PY_VERSION_HEX < 0x02020000
-	(getattrfunc)PySwigObject_getattr,  /* tp_getattr */ 
+    const PyTypeObject tmp = {
+#if PY_VERSION_HEX >= 0x03000000
+      PyVarObject_HEAD_INIT(NULL, 0)
+#else
+      PyObject_HEAD_INIT(NULL)
+      0,                                    /* ob_size */
+#endif
+      "SwigPyObject",                       /* tp_name */
+      sizeof(SwigPyObject),                 /* tp_basicsize */
+      0,                                    /* tp_itemsize */
+      (destructor)SwigPyObject_dealloc,     /* tp_dealloc */
+      0,                                    /* tp_print */
+      (getattrfunc)0,                       /* tp_getattr */
+      (setattrfunc)0,                       /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+      0, /* tp_reserved in 3.0.1, tp_compare in 3.0.0 but not used */
 #else
-	(getattrfunc)0,			    /* tp_getattr */ 
-#endif
-	(setattrfunc)0,			    /* tp_setattr */ 
-	(cmpfunc)PySwigObject_compare,	    /* tp_compare */ 
-	(reprfunc)PySwigObject_repr,	    /* tp_repr */    
-	&PySwigObject_as_number,	    /* tp_as_number */
-	0,				    /* tp_as_sequence */
-	0,				    /* tp_as_mapping */
-	(hashfunc)0,			    /* tp_hash */
-	(ternaryfunc)0,			    /* tp_call */
-	(reprfunc)PySwigObject_str,	    /* tp_str */
-	PyObject_GenericGetAttr,            /* tp_getattro */
-	0,				    /* tp_setattro */
-	0,		                    /* tp_as_buffer */
-	Py_TPFLAGS_DEFAULT,	            /* tp_flags */
-	swigobject_doc, 	            /* tp_doc */        
-	0,                                  /* tp_traverse */
-	0,                                  /* tp_clear */
-	0,                                  /* tp_richcompare */
-	0,                                  /* tp_weaklistoffset */
-#if PY_VERSION_HEX >= 0x02020000
-	0,                                  /* tp_iter */
-	0,                                  /* tp_iternext */
-	swigobject_methods,		    /* tp_methods */ 
-	0,			            /* tp_members */
-	0,				    /* tp_getset */	    	
-	0,			            /* tp_base */	        
-	0,				    /* tp_dict */	    	
-	0,				    /* tp_descr_get */  	
-	0,				    /* tp_descr_set */  	
-	0,				    /* tp_dictoffset */ 	
-	0,				    /* tp_init */	    	
-	0,				    /* tp_alloc */	    	
-	0,			            /* tp_new */	    	
-	0,	                            /* tp_free */	   
-        0,                                  /* tp_is_gc */  
-	0,				    /* tp_bases */   
-	0,				    /* tp_mro */
-	0,				    /* tp_cache */   
- 	0,				    /* tp_subclasses */
-	0,				    /* tp_weaklist */
-#endif
-#if PY_VERSION_HEX >= 0x02030000
-	0,                                  /* tp_del */
+      (cmpfunc)SwigPyObject_compare,        /* tp_compare */
+#endif
+      (reprfunc)SwigPyObject_repr,          /* tp_repr */
+      &SwigPyObject_as_number,              /* tp_as_number */
+      0,                                    /* tp_as_sequence */
+      0,                                    /* tp_as_mapping */
+      (hashfunc)0,                          /* tp_hash */
+      (ternaryfunc)0,                       /* tp_call */
+      0,                                    /* tp_str */
+      PyObject_GenericGetAttr,              /* tp_getattro */
+      0,                                    /* tp_setattro */
+      0,                                    /* tp_as_buffer */
+      Py_TPFLAGS_DEFAULT,                   /* tp_flags */
+      swigobject_doc,                       /* tp_doc */
+      0,                                    /* tp_traverse */
+      0,                                    /* tp_clear */
+      (richcmpfunc)SwigPyObject_richcompare,/* tp_richcompare */
+      0,                                    /* tp_weaklistoffset */
+      0,                                    /* tp_iter */
+      0,                                    /* tp_iternext */
+      swigobject_methods,                   /* tp_methods */
+      0,                                    /* tp_members */
+      0,                                    /* tp_getset */
+      0,                                    /* tp_base */
+      0,                                    /* tp_dict */
+      0,                                    /* tp_descr_get */
+      0,                                    /* tp_descr_set */
+      0,                                    /* tp_dictoffset */
+      0,                                    /* tp_init */
+      0,                                    /* tp_alloc */
+      0,                                    /* tp_new */
+      0,                                    /* tp_free */
+      0,                                    /* tp_is_gc */
+      0,                                    /* tp_bases */
+      0,                                    /* tp_mro */
+      0,                                    /* tp_cache */
+      0,                                    /* tp_subclasses */
+      0,                                    /* tp_weaklist */
+      0,                                    /* tp_del */
+      0,                                    /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+      0,                                    /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+      0,                                    /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+      0,                                    /* tp_print */
 #endif
 #ifdef COUNT_ALLOCS
-	0,0,0,0                             /* tp_alloc -> tp_next */
+      0,                                    /* tp_allocs */
+      0,                                    /* tp_frees */
+      0,                                    /* tp_maxalloc */
+      0,                                    /* tp_prev */
+      0                                     /* tp_next */
 #endif
-      };
-    pyswigobject_type = tmp;
-    pyswigobject_type.ob_type = &PyType_Type;
+    };
+    swigpyobject_type = tmp;
     type_init = 1;
+    if (PyType_Ready(&swigpyobject_type) < 0)
+      return NULL;
   }
-  return &pyswigobject_type;
+  return &swigpyobject_type;
 }
 
 SWIGRUNTIME PyObject *
-PySwigObject_New(void *ptr, swig_type_info *ty, int own)
+SwigPyObject_New(void *ptr, swig_type_info *ty, int own)
 {
-  PySwigObject *sobj = PyObject_NEW(PySwigObject, PySwigObject_type());
+  SwigPyObject *sobj = PyObject_NEW(SwigPyObject, SwigPyObject_type());
   if (sobj) {
     sobj->ptr  = ptr;
     sobj->ty   = ty;
@@ -1691,151 +1794,155 @@ typedef struct {
   void *pack;
   swig_type_info *ty;
   size_t size;
-} PySwigPacked;
+} SwigPyPacked;
 
-SWIGRUNTIME int
-PySwigPacked_print(PySwigPacked *v, FILE *fp, int SWIGUNUSEDPARM(flags))
-{
-  char result[SWIG_BUFFER_SIZE];
-  fputs("<Swig Packed ", fp); 
-  if (SWIG_PackDataName(result, v->pack, v->size, 0, sizeof(result))) {
-    fputs("at ", fp); 
-    fputs(result, fp); 
-  }
-  fputs(v->ty->name,fp); 
-  fputs(">", fp);
-  return 0; 
-}
-  
 SWIGRUNTIME PyObject *
-PySwigPacked_repr(PySwigPacked *v)
+SwigPyPacked_repr(SwigPyPacked *v)
 {
   char result[SWIG_BUFFER_SIZE];
   if (SWIG_PackDataName(result, v->pack, v->size, 0, sizeof(result))) {
-    return PyString_FromFormat("<Swig Packed at %s%s>", result, v->ty->name);
+    return SWIG_Python_str_FromFormat("<Swig Packed at %s%s>", result, v->ty->name);
   } else {
-    return PyString_FromFormat("<Swig Packed %s>", v->ty->name);
+    return SWIG_Python_str_FromFormat("<Swig Packed %s>", v->ty->name);
   }  
 }
 
 SWIGRUNTIME PyObject *
-PySwigPacked_str(PySwigPacked *v)
+SwigPyPacked_str(SwigPyPacked *v)
 {
   char result[SWIG_BUFFER_SIZE];
   if (SWIG_PackDataName(result, v->pack, v->size, 0, sizeof(result))){
-    return PyString_FromFormat("%s%s", result, v->ty->name);
+    return SWIG_Python_str_FromFormat("%s%s", result, v->ty->name);
   } else {
-    return PyString_FromString(v->ty->name);
+    return SWIG_Python_str_FromChar(v->ty->name);
   }  
 }
 
 SWIGRUNTIME int
-PySwigPacked_compare(PySwigPacked *v, PySwigPacked *w)
+SwigPyPacked_compare(SwigPyPacked *v, SwigPyPacked *w)
 {
   size_t i = v->size;
   size_t j = w->size;
   int s = (i < j) ? -1 : ((i > j) ? 1 : 0);
-  return s ? s : strncmp((char *)v->pack, (char *)w->pack, 2*v->size);
+  return s ? s : strncmp((const char *)v->pack, (const char *)w->pack, 2*v->size);
 }
 
-SWIGRUNTIME PyTypeObject* _PySwigPacked_type(void);
+SWIGRUNTIME PyTypeObject* SwigPyPacked_TypeOnce(void);
 
 SWIGRUNTIME PyTypeObject*
-PySwigPacked_type(void) {
-  static PyTypeObject *SWIG_STATIC_POINTER(type) = _PySwigPacked_type();
+SwigPyPacked_type(void) {
+  static PyTypeObject *SWIG_STATIC_POINTER(type) = SwigPyPacked_TypeOnce();
   return type;
 }
 
 SWIGRUNTIMEINLINE int
-PySwigPacked_Check(PyObject *op) {
-  return ((op)->ob_type == _PySwigPacked_type()) 
-    || (strcmp((op)->ob_type->tp_name,"PySwigPacked") == 0);
+SwigPyPacked_Check(PyObject *op) {
+  return ((op)->ob_type == SwigPyPacked_TypeOnce()) 
+    || (strcmp((op)->ob_type->tp_name,"SwigPyPacked") == 0);
 }
 
 SWIGRUNTIME void
-PySwigPacked_dealloc(PyObject *v)
+SwigPyPacked_dealloc(PyObject *v)
 {
-  if (PySwigPacked_Check(v)) {
-    PySwigPacked *sobj = (PySwigPacked *) v;
+  if (SwigPyPacked_Check(v)) {
+    SwigPyPacked *sobj = (SwigPyPacked *) v;
     free(sobj->pack);
   }
   PyObject_DEL(v);
 }
 
 SWIGRUNTIME PyTypeObject*
-_PySwigPacked_type(void) {
+SwigPyPacked_TypeOnce(void) {
   static char swigpacked_doc[] = "Swig object carries a C/C++ instance pointer";
-  static PyTypeObject pyswigpacked_type;
-  static int type_init = 0;  
+  static PyTypeObject swigpypacked_type;
+  static int type_init = 0;
   if (!type_init) {
-    const PyTypeObject tmp
-      = {
-	PyObject_HEAD_INIT(NULL)
-	0,				    /* ob_size */	
-	(char *)"PySwigPacked",		    /* tp_name */	
-	sizeof(PySwigPacked),		    /* tp_basicsize */	
-	0,				    /* tp_itemsize */	
-	(destructor)PySwigPacked_dealloc,   /* tp_dealloc */	
-	(printfunc)PySwigPacked_print,	    /* tp_print */   	
-	(getattrfunc)0,			    /* tp_getattr */ 	
-	(setattrfunc)0,			    /* tp_setattr */ 	
-	(cmpfunc)PySwigPacked_compare,	    /* tp_compare */ 	
-	(reprfunc)PySwigPacked_repr,	    /* tp_repr */    	
-	0,	                            /* tp_as_number */	
-	0,				    /* tp_as_sequence */
-	0,				    /* tp_as_mapping */	
-	(hashfunc)0,			    /* tp_hash */	
-	(ternaryfunc)0,			    /* tp_call */	
-	(reprfunc)PySwigPacked_str,	    /* tp_str */	
-	PyObject_GenericGetAttr,            /* tp_getattro */
-	0,				    /* tp_setattro */
-	0,		                    /* tp_as_buffer */
-	Py_TPFLAGS_DEFAULT,	            /* tp_flags */
-	swigpacked_doc, 	            /* tp_doc */
-	0,                                  /* tp_traverse */
-	0,                                  /* tp_clear */
-	0,                                  /* tp_richcompare */
-	0,                                  /* tp_weaklistoffset */
-#if PY_VERSION_HEX >= 0x02020000
-	0,                                  /* tp_iter */
-	0,                                  /* tp_iternext */
-	0,		                    /* tp_methods */ 
-	0,			            /* tp_members */
-	0,				    /* tp_getset */	    	
-	0,			            /* tp_base */	        
-	0,				    /* tp_dict */	    	
-	0,				    /* tp_descr_get */  	
-	0,				    /* tp_descr_set */  	
-	0,				    /* tp_dictoffset */ 	
-	0,				    /* tp_init */	    	
-	0,				    /* tp_alloc */	    	
-	0,			            /* tp_new */	    	
-	0, 	                            /* tp_free */	   
-        0,                                  /* tp_is_gc */  
-	0,				    /* tp_bases */   
-	0,				    /* tp_mro */
-	0,				    /* tp_cache */   
- 	0,				    /* tp_subclasses */
-	0,				    /* tp_weaklist */
-#endif
-#if PY_VERSION_HEX >= 0x02030000
-	0,                                  /* tp_del */
+    const PyTypeObject tmp = {
+#if PY_VERSION_HEX>=0x03000000
+      PyVarObject_HEAD_INIT(NULL, 0)
+#else
+      PyObject_HEAD_INIT(NULL)
+      0,                                    /* ob_size */
+#endif
+      "SwigPyPacked",                       /* tp_name */
+      sizeof(SwigPyPacked),                 /* tp_basicsize */
+      0,                                    /* tp_itemsize */
+      (destructor)SwigPyPacked_dealloc,     /* tp_dealloc */
+      0,                                    /* tp_print */
+      (getattrfunc)0,                       /* tp_getattr */
+      (setattrfunc)0,                       /* tp_setattr */
+#if PY_VERSION_HEX>=0x03000000
+      0, /* tp_reserved in 3.0.1 */
+#else
+      (cmpfunc)SwigPyPacked_compare,        /* tp_compare */
+#endif
+      (reprfunc)SwigPyPacked_repr,          /* tp_repr */
+      0,                                    /* tp_as_number */
+      0,                                    /* tp_as_sequence */
+      0,                                    /* tp_as_mapping */
+      (hashfunc)0,                          /* tp_hash */
+      (ternaryfunc)0,                       /* tp_call */
+      (reprfunc)SwigPyPacked_str,           /* tp_str */
+      PyObject_GenericGetAttr,              /* tp_getattro */
+      0,                                    /* tp_setattro */
+      0,                                    /* tp_as_buffer */
+      Py_TPFLAGS_DEFAULT,                   /* tp_flags */
+      swigpacked_doc,                       /* tp_doc */
+      0,                                    /* tp_traverse */
+      0,                                    /* tp_clear */
+      0,                                    /* tp_richcompare */
+      0,                                    /* tp_weaklistoffset */
+      0,                                    /* tp_iter */
+      0,                                    /* tp_iternext */
+      0,                                    /* tp_methods */
+      0,                                    /* tp_members */
+      0,                                    /* tp_getset */
+      0,                                    /* tp_base */
+      0,                                    /* tp_dict */
+      0,                                    /* tp_descr_get */
+      0,                                    /* tp_descr_set */
+      0,                                    /* tp_dictoffset */
+      0,                                    /* tp_init */
+      0,                                    /* tp_alloc */
+      0,                                    /* tp_new */
+      0,                                    /* tp_free */
+      0,                                    /* tp_is_gc */
+      0,                                    /* tp_bases */
+      0,                                    /* tp_mro */
+      0,                                    /* tp_cache */
+      0,                                    /* tp_subclasses */
+      0,                                    /* tp_weaklist */
+      0,                                    /* tp_del */
+      0,                                    /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+      0,                                    /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+      0,                                    /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+      0,                                    /* tp_print */
 #endif
 #ifdef COUNT_ALLOCS
-	0,0,0,0                             /* tp_alloc -> tp_next */
+      0,                                    /* tp_allocs */
+      0,                                    /* tp_frees */
+      0,                                    /* tp_maxalloc */
+      0,                                    /* tp_prev */
+      0                                     /* tp_next */
 #endif
-      };
-    pyswigpacked_type = tmp;
-    pyswigpacked_type.ob_type = &PyType_Type;
+    };
+    swigpypacked_type = tmp;
     type_init = 1;
+    if (PyType_Ready(&swigpypacked_type) < 0)
+      return NULL;
   }
-  return &pyswigpacked_type;
+  return &swigpypacked_type;
 }
 
 SWIGRUNTIME PyObject *
-PySwigPacked_New(void *ptr, size_t size, swig_type_info *ty)
+SwigPyPacked_New(void *ptr, size_t size, swig_type_info *ty)
 {
-  PySwigPacked *sobj = PyObject_NEW(PySwigPacked, PySwigPacked_type());
+  SwigPyPacked *sobj = PyObject_NEW(SwigPyPacked, SwigPyPacked_type());
   if (sobj) {
     void *pack = malloc(size);
     if (pack) {
@@ -1852,10 +1959,10 @@ PySwigPacked_New(void *ptr, size_t size, swig_type_info *ty)
 }
 
 SWIGRUNTIME swig_type_info *
-PySwigPacked_UnpackData(PyObject *obj, void *ptr, size_t size)
+SwigPyPacked_UnpackData(PyObject *obj, void *ptr, size_t size)
 {
-  if (PySwigPacked_Check(obj)) {
-    PySwigPacked *sobj = (PySwigPacked *)obj;
+  if (SwigPyPacked_Check(obj)) {
+    SwigPyPacked *sobj = (SwigPyPacked *)obj;
     if (sobj->size != size) return 0;
     memcpy(ptr, sobj->pack, size);
     return sobj->ty;
@@ -1868,76 +1975,93 @@ PySwigPacked_UnpackData(PyObject *obj, void *ptr, size_t size)
  * pointers/data manipulation
  * ----------------------------------------------------------------------------- */
 
-SWIGRUNTIMEINLINE PyObject *
-_SWIG_This(void)
-{
-  return PyString_FromString("this");
-}
+static PyObject *Swig_This_global = NULL;
 
 SWIGRUNTIME PyObject *
 SWIG_This(void)
 {
-  static PyObject *SWIG_STATIC_POINTER(swig_this) = _SWIG_This();
-  return swig_this;
+  if (Swig_This_global == NULL)
+    Swig_This_global = SWIG_Python_str_FromChar("this");
+  return Swig_This_global;
 }
 
 /* #define SWIG_PYTHON_SLOW_GETSET_THIS */
 
-SWIGRUNTIME PySwigObject *
+/* TODO: I don't know how to implement the fast getset in Python 3 right now */
+#if PY_VERSION_HEX>=0x03000000
+#define SWIG_PYTHON_SLOW_GETSET_THIS 
+#endif
+
+SWIGRUNTIME SwigPyObject *
 SWIG_Python_GetSwigThis(PyObject *pyobj) 
 {
-  if (PySwigObject_Check(pyobj)) {
-    return (PySwigObject *) pyobj;
+  PyObject *obj;
+
+  if (SwigPyObject_Check(pyobj))
+    return (SwigPyObject *) pyobj;
+
+#ifdef SWIGPYTHON_BUILTIN
+  (void)obj;
+# ifdef PyWeakref_CheckProxy
+  if (PyWeakref_CheckProxy(pyobj)) {
+    pyobj = PyWeakref_GET_OBJECT(pyobj);
+    if (pyobj && SwigPyObject_Check(pyobj))
+      return (SwigPyObject*) pyobj;
+  }
+# endif
+  return NULL;
+#else
+
+  obj = 0;
+
+#if !defined(SWIG_PYTHON_SLOW_GETSET_THIS)
+  if (PyInstance_Check(pyobj)) {
+    obj = _PyInstance_Lookup(pyobj, SWIG_This());      
   } else {
-    PyObject *obj = 0;
-#if (!defined(SWIG_PYTHON_SLOW_GETSET_THIS) && (PY_VERSION_HEX >= 0x02030000))
-    if (PyInstance_Check(pyobj)) {
-      obj = _PyInstance_Lookup(pyobj, SWIG_This());      
+    PyObject **dictptr = _PyObject_GetDictPtr(pyobj);
+    if (dictptr != NULL) {
+      PyObject *dict = *dictptr;
+      obj = dict ? PyDict_GetItem(dict, SWIG_This()) : 0;
     } else {
-      PyObject **dictptr = _PyObject_GetDictPtr(pyobj);
-      if (dictptr != NULL) {
-	PyObject *dict = *dictptr;
-	obj = dict ? PyDict_GetItem(dict, SWIG_This()) : 0;
-      } else {
 #ifdef PyWeakref_CheckProxy
-	if (PyWeakref_CheckProxy(pyobj)) {
-	  PyObject *wobj = PyWeakref_GET_OBJECT(pyobj);
-	  return wobj ? SWIG_Python_GetSwigThis(wobj) : 0;
-	}
+      if (PyWeakref_CheckProxy(pyobj)) {
+	PyObject *wobj = PyWeakref_GET_OBJECT(pyobj);
+	return wobj ? SWIG_Python_GetSwigThis(wobj) : 0;
+      }
 #endif
-	obj = PyObject_GetAttr(pyobj,SWIG_This());
-	if (obj) {
-	  Py_DECREF(obj);
-	} else {
-	  if (PyErr_Occurred()) PyErr_Clear();
-	  return 0;
-	}
+      obj = PyObject_GetAttr(pyobj,SWIG_This());
+      if (obj) {
+	Py_DECREF(obj);
+      } else {
+	if (PyErr_Occurred()) PyErr_Clear();
+	return 0;
       }
     }
+  }
 #else
-    obj = PyObject_GetAttr(pyobj,SWIG_This());
-    if (obj) {
-      Py_DECREF(obj);
-    } else {
-      if (PyErr_Occurred()) PyErr_Clear();
-      return 0;
-    }
+  obj = PyObject_GetAttr(pyobj,SWIG_This());
+  if (obj) {
+    Py_DECREF(obj);
+  } else {
+    if (PyErr_Occurred()) PyErr_Clear();
+    return 0;
+  }
 #endif
-    if (obj && !PySwigObject_Check(obj)) {
-      /* a PyObject is called 'this', try to get the 'real this'
-	 PySwigObject from it */ 
-      return SWIG_Python_GetSwigThis(obj);
-    }
-    return (PySwigObject *)obj;
+  if (obj && !SwigPyObject_Check(obj)) {
+    /* a PyObject is called 'this', try to get the 'real this'
+       SwigPyObject from it */ 
+    return SWIG_Python_GetSwigThis(obj);
   }
+  return (SwigPyObject *)obj;
+#endif
 }
 
 /* Acquire a pointer value */
 
 SWIGRUNTIME int
 SWIG_Python_AcquirePtr(PyObject *obj, int own) {
-  if (own) {
-    PySwigObject *sobj = SWIG_Python_GetSwigThis(obj);
+  if (own == SWIG_POINTER_OWN) {
+    SwigPyObject *sobj = SWIG_Python_GetSwigThis(obj);
     if (sobj) {
       int oldown = sobj->own;
       sobj->own = own;
@@ -1951,80 +2075,105 @@ SWIG_Python_AcquirePtr(PyObject *obj, int own) {
 
 SWIGRUNTIME int
 SWIG_Python_ConvertPtrAndOwn(PyObject *obj, void **ptr, swig_type_info *ty, int flags, int *own) {
-  if (!obj) return SWIG_ERROR;
-  if (obj == Py_None) {
-    if (ptr) *ptr = 0;
-    return SWIG_OK;
-  } else {
-    PySwigObject *sobj = SWIG_Python_GetSwigThis(obj);
-    while (sobj) {
-      void *vptr = sobj->ptr;
-      if (ty) {
-	swig_type_info *to = sobj->ty;
-	if (to == ty) {
-	  /* no type cast needed */
-	  if (ptr) *ptr = vptr;
-	  break;
-	} else {
-	  swig_cast_info *tc = SWIG_TypeCheck(to->name,ty);
-	  if (!tc) {
-	    sobj = (PySwigObject *)sobj->next;
-	  } else {
-	    if (ptr) *ptr = SWIG_TypeCast(tc,vptr);
-	    break;
-	  }
-	}
+  int res;
+  SwigPyObject *sobj;
+  int implicit_conv = (flags & SWIG_POINTER_IMPLICIT_CONV) != 0;
+
+  if (!obj)
+    return SWIG_ERROR;
+  if (obj == Py_None && !implicit_conv) {
+    if (ptr)
+      *ptr = 0;
+    return (flags & SWIG_POINTER_NO_NULL) ? SWIG_NullReferenceError : SWIG_OK;
+  }
+
+  res = SWIG_ERROR;
+
+  sobj = SWIG_Python_GetSwigThis(obj);
+  if (own)
+    *own = 0;
+  while (sobj) {
+    void *vptr = sobj->ptr;
+    if (ty) {
+      swig_type_info *to = sobj->ty;
+      if (to == ty) {
+        /* no type cast needed */
+        if (ptr) *ptr = vptr;
+        break;
       } else {
-	if (ptr) *ptr = vptr;
-	break;
+        swig_cast_info *tc = SWIG_TypeCheck(to->name,ty);
+        if (!tc) {
+          sobj = (SwigPyObject *)sobj->next;
+        } else {
+          if (ptr) {
+            int newmemory = 0;
+            *ptr = SWIG_TypeCast(tc,vptr,&newmemory);
+            if (newmemory == SWIG_CAST_NEW_MEMORY) {
+              assert(own); /* badly formed typemap which will lead to a memory leak - it must set and use own to delete *ptr */
+              if (own)
+                *own = *own | SWIG_CAST_NEW_MEMORY;
+            }
+          }
+          break;
+        }
       }
+    } else {
+      if (ptr) *ptr = vptr;
+      break;
     }
-    if (sobj) {
-      if (own) *own = sobj->own;
-      if (flags & SWIG_POINTER_DISOWN) {
-	sobj->own = 0;
+  }
+  if (sobj) {
+    if (own)
+      *own = *own | sobj->own;
+    if (flags & SWIG_POINTER_DISOWN) {
+      sobj->own = 0;
+    }
+    res = SWIG_OK;
+  } else {
+    if (implicit_conv) {
+      SwigPyClientData *data = ty ? (SwigPyClientData *) ty->clientdata : 0;
+      if (data && !data->implicitconv) {
+        PyObject *klass = data->klass;
+        if (klass) {
+          PyObject *impconv;
+          data->implicitconv = 1; /* avoid recursion and call 'explicit' constructors*/
+          impconv = SWIG_Python_CallFunctor(klass, obj);
+          data->implicitconv = 0;
+          if (PyErr_Occurred()) {
+            PyErr_Clear();
+            impconv = 0;
+          }
+          if (impconv) {
+            SwigPyObject *iobj = SWIG_Python_GetSwigThis(impconv);
+            if (iobj) {
+              void *vptr;
+              res = SWIG_Python_ConvertPtrAndOwn((PyObject*)iobj, &vptr, ty, 0, 0);
+              if (SWIG_IsOK(res)) {
+                if (ptr) {
+                  *ptr = vptr;
+                  /* transfer the ownership to 'ptr' */
+                  iobj->own = 0;
+                  res = SWIG_AddCast(res);
+                  res = SWIG_AddNewMask(res);
+                } else {
+                  res = SWIG_AddCast(res);		    
+                }
+              }
+            }
+            Py_DECREF(impconv);
+          }
+        }
       }
-      return SWIG_OK;
-    } else {
-      int res = SWIG_ERROR;
-      if (flags & SWIG_POINTER_IMPLICIT_CONV) {
-	PySwigClientData *data = ty ? (PySwigClientData *) ty->clientdata : 0;
-	if (data && !data->implicitconv) {
-	  PyObject *klass = data->klass;
-	  if (klass) {
-	    PyObject *impconv;
-	    data->implicitconv = 1; /* avoid recursion and call 'explicit' constructors*/
-	    impconv = SWIG_Python_CallFunctor(klass, obj);
-	    data->implicitconv = 0;
-	    if (PyErr_Occurred()) {
-	      PyErr_Clear();
-	      impconv = 0;
-	    }
-	    if (impconv) {
-	      PySwigObject *iobj = SWIG_Python_GetSwigThis(impconv);
-	      if (iobj) {
-		void *vptr;
-		res = SWIG_Python_ConvertPtrAndOwn((PyObject*)iobj, &vptr, ty, 0, 0);
-		if (SWIG_IsOK(res)) {
-		  if (ptr) {
-		    *ptr = vptr;
-		    /* transfer the ownership to 'ptr' */
-		    iobj->own = 0;
-		    res = SWIG_AddCast(res);
-		    res = SWIG_AddNewMask(res);
-		  } else {
-		    res = SWIG_AddCast(res);		    
-		  }
-		}
-	      }
-	      Py_DECREF(impconv);
-	    }
-	  }
-	}
+      if (!SWIG_IsOK(res) && obj == Py_None) {
+        if (ptr)
+          *ptr = 0;
+        if (PyErr_Occurred())
+          PyErr_Clear();
+        res = SWIG_OK;
       }
-      return res;
     }
   }
+  return res;
 }
 
 /* Convert a function ptr value */
@@ -2035,30 +2184,32 @@ SWIG_Python_ConvertFunctionPtr(PyObject *obj, void **ptr, swig_type_info *ty) {
     return SWIG_ConvertPtr(obj, ptr, ty, 0);
   } else {
     void *vptr = 0;
-    
+    swig_cast_info *tc;
+
     /* here we get the method pointer for callbacks */
     const char *doc = (((PyCFunctionObject *)obj) -> m_ml -> ml_doc);
     const char *desc = doc ? strstr(doc, "swig_ptr: ") : 0;
-    if (desc) {
+    if (desc)
       desc = ty ? SWIG_UnpackVoidPtr(desc + 10, &vptr, ty->name) : 0;
-      if (!desc) return SWIG_ERROR;
-    }
-    if (ty) {
-      swig_cast_info *tc = SWIG_TypeCheck(desc,ty);
-      if (!tc) return SWIG_ERROR;
-      *ptr = SWIG_TypeCast(tc,vptr);
+    if (!desc)
+      return SWIG_ERROR;
+    tc = SWIG_TypeCheck(desc,ty);
+    if (tc) {
+      int newmemory = 0;
+      *ptr = SWIG_TypeCast(tc,vptr,&newmemory);
+      assert(!newmemory); /* newmemory handling not yet implemented */
     } else {
-      *ptr = vptr;
+      return SWIG_ERROR;
     }
     return SWIG_OK;
   }
 }
 
-/* Convert a packed value value */
+/* Convert a packed pointer value */
 
 SWIGRUNTIME int
 SWIG_Python_ConvertPacked(PyObject *obj, void *ptr, size_t sz, swig_type_info *ty) {
-  swig_type_info *to = PySwigPacked_UnpackData(obj, ptr, sz);
+  swig_type_info *to = SwigPyPacked_UnpackData(obj, ptr, sz);
   if (!to) return SWIG_ERROR;
   if (ty) {
     if (to != ty) {
@@ -2075,14 +2226,13 @@ SWIG_Python_ConvertPacked(PyObject *obj, void *ptr, size_t sz, swig_type_info *t
  * ----------------------------------------------------------------------------- */
 
 /*
-  Create a new instance object, whitout calling __init__, and set the
+  Create a new instance object, without calling __init__, and set the
   'this' attribute.
 */
 
 SWIGRUNTIME PyObject* 
-SWIG_Python_NewShadowInstance(PySwigClientData *data, PyObject *swig_this)
+SWIG_Python_NewShadowInstance(SwigPyClientData *data, PyObject *swig_this)
 {
-#if (PY_VERSION_HEX >= 0x02020000)
   PyObject *inst = 0;
   PyObject *newraw = data->newraw;
   if (newraw) {
@@ -2099,82 +2249,73 @@ SWIG_Python_NewShadowInstance(PySwigClientData *data, PyObject *swig_this)
 	}
       }
 #else
-      PyObject *key = SWIG_This();
-      PyObject_SetAttr(inst, key, swig_this);
+      if (PyObject_SetAttr(inst, SWIG_This(), swig_this) == -1) {
+        Py_DECREF(inst);
+        inst = 0;
+      }
 #endif
     }
   } else {
+#if PY_VERSION_HEX >= 0x03000000
+    PyObject *empty_args = PyTuple_New(0);
+    if (empty_args) {
+      PyObject *empty_kwargs = PyDict_New();
+      if (empty_kwargs) {
+        inst = ((PyTypeObject *)data->newargs)->tp_new((PyTypeObject *)data->newargs, empty_args, empty_kwargs);
+        Py_DECREF(empty_kwargs);
+        if (inst) {
+          if (PyObject_SetAttr(inst, SWIG_This(), swig_this) == -1) {
+            Py_DECREF(inst);
+            inst = 0;
+          } else {
+            Py_TYPE(inst)->tp_flags &= ~Py_TPFLAGS_VALID_VERSION_TAG;
+          }
+        }
+      }
+      Py_DECREF(empty_args);
+    }
+#else
     PyObject *dict = PyDict_New();
-    PyDict_SetItem(dict, SWIG_This(), swig_this);
-    inst = PyInstance_NewRaw(data->newargs, dict);
-    Py_DECREF(dict);
+    if (dict) {
+      PyDict_SetItem(dict, SWIG_This(), swig_this);
+      inst = PyInstance_NewRaw(data->newargs, dict);
+      Py_DECREF(dict);
+    }
+#endif
   }
   return inst;
-#else
-#if (PY_VERSION_HEX >= 0x02010000)
-  PyObject *inst;
-  PyObject *dict = PyDict_New();
-  PyDict_SetItem(dict, SWIG_This(), swig_this);
-  inst = PyInstance_NewRaw(data->newargs, dict);
-  Py_DECREF(dict);
-  return (PyObject *) inst;
-#else
-  PyInstanceObject *inst = PyObject_NEW(PyInstanceObject, &PyInstance_Type);
-  if (inst == NULL) {
-    return NULL;
-  }
-  inst->in_class = (PyClassObject *)data->newargs;
-  Py_INCREF(inst->in_class);
-  inst->in_dict = PyDict_New();
-  if (inst->in_dict == NULL) {
-    Py_DECREF(inst);
-    return NULL;
-  }
-#ifdef Py_TPFLAGS_HAVE_WEAKREFS
-  inst->in_weakreflist = NULL;
-#endif
-#ifdef Py_TPFLAGS_GC
-  PyObject_GC_Init(inst);
-#endif
-  PyDict_SetItem(inst->in_dict, SWIG_This(), swig_this);
-  return (PyObject *) inst;
-#endif
-#endif
 }
 
-SWIGRUNTIME void
+SWIGRUNTIME int
 SWIG_Python_SetSwigThis(PyObject *inst, PyObject *swig_this)
 {
- PyObject *dict;
-#if (PY_VERSION_HEX >= 0x02020000) && !defined(SWIG_PYTHON_SLOW_GETSET_THIS)
- PyObject **dictptr = _PyObject_GetDictPtr(inst);
- if (dictptr != NULL) {
-   dict = *dictptr;
-   if (dict == NULL) {
-     dict = PyDict_New();
-     *dictptr = dict;
-   }
-   PyDict_SetItem(dict, SWIG_This(), swig_this);
-   return;
- }
+#if !defined(SWIG_PYTHON_SLOW_GETSET_THIS)
+  PyObject **dictptr = _PyObject_GetDictPtr(inst);
+  if (dictptr != NULL) {
+    PyObject *dict = *dictptr;
+    if (dict == NULL) {
+      dict = PyDict_New();
+      *dictptr = dict;
+    }
+    return PyDict_SetItem(dict, SWIG_This(), swig_this);
+  }
 #endif
- dict = PyObject_GetAttrString(inst, (char*)"__dict__");
- PyDict_SetItem(dict, SWIG_This(), swig_this);
- Py_DECREF(dict);
+  return PyObject_SetAttr(inst, SWIG_This(), swig_this);
 } 
 
 
 SWIGINTERN PyObject *
 SWIG_Python_InitShadowInstance(PyObject *args) {
   PyObject *obj[2];
-  if (!SWIG_Python_UnpackTuple(args,(char*)"swiginit", 2, 2, obj)) {
+  if (!SWIG_Python_UnpackTuple(args, "swiginit", 2, 2, obj)) {
     return NULL;
   } else {
-    PySwigObject *sthis = SWIG_Python_GetSwigThis(obj[0]);
+    SwigPyObject *sthis = SWIG_Python_GetSwigThis(obj[0]);
     if (sthis) {
-      PySwigObject_append((PyObject*) sthis, obj[1]);
+      SwigPyObject_append((PyObject*) sthis, obj[1]);
     } else {
-      SWIG_Python_SetSwigThis(obj[0], obj[1]);
+      if (SWIG_Python_SetSwigThis(obj[0], obj[1]) != 0)
+        return NULL;
     }
     return SWIG_Py_Void();
   }
@@ -2183,29 +2324,62 @@ SWIG_Python_InitShadowInstance(PyObject *args) {
 /* Create a new pointer object */
 
 SWIGRUNTIME PyObject *
-SWIG_Python_NewPointerObj(void *ptr, swig_type_info *type, int flags) {
-  if (!ptr) {
+SWIG_Python_NewPointerObj(PyObject *self, void *ptr, swig_type_info *type, int flags) {
+  SwigPyClientData *clientdata;
+  PyObject * robj;
+  int own;
+
+  if (!ptr)
     return SWIG_Py_Void();
-  } else {
-    int own = (flags & SWIG_POINTER_OWN) ? SWIG_POINTER_OWN : 0;
-    PyObject *robj = PySwigObject_New(ptr, type, own);
-    PySwigClientData *clientdata = type ? (PySwigClientData *)(type->clientdata) : 0;
-    if (clientdata && !(flags & SWIG_POINTER_NOSHADOW)) {
-      PyObject *inst = SWIG_Python_NewShadowInstance(clientdata, robj);
-      if (inst) {
-	Py_DECREF(robj);
-	robj = inst;
+
+  clientdata = type ? (SwigPyClientData *)(type->clientdata) : 0;
+  own = (flags & SWIG_POINTER_OWN) ? SWIG_POINTER_OWN : 0;
+  if (clientdata && clientdata->pytype) {
+    SwigPyObject *newobj;
+    if (flags & SWIG_BUILTIN_TP_INIT) {
+      newobj = (SwigPyObject*) self;
+      if (newobj->ptr) {
+        PyObject *next_self = clientdata->pytype->tp_alloc(clientdata->pytype, 0);
+        while (newobj->next)
+	  newobj = (SwigPyObject *) newobj->next;
+        newobj->next = next_self;
+        newobj = (SwigPyObject *)next_self;
+#ifdef SWIGPYTHON_BUILTIN
+        newobj->dict = 0;
+#endif
       }
+    } else {
+      newobj = PyObject_New(SwigPyObject, clientdata->pytype);
+#ifdef SWIGPYTHON_BUILTIN
+      newobj->dict = 0;
+#endif
+    }
+    if (newobj) {
+      newobj->ptr = ptr;
+      newobj->ty = type;
+      newobj->own = own;
+      newobj->next = 0;
+      return (PyObject*) newobj;
     }
-    return robj;
+    return SWIG_Py_Void();
+  }
+
+  assert(!(flags & SWIG_BUILTIN_TP_INIT));
+
+  robj = SwigPyObject_New(ptr, type, own);
+  if (robj && clientdata && !(flags & SWIG_POINTER_NOSHADOW)) {
+    PyObject *inst = SWIG_Python_NewShadowInstance(clientdata, robj);
+    Py_DECREF(robj);
+    robj = inst;
   }
+  return robj;
 }
 
 /* Create a new packed object */
 
 SWIGRUNTIMEINLINE PyObject *
 SWIG_Python_NewPackedObj(void *ptr, size_t sz, swig_type_info *type) {
-  return ptr ? PySwigPacked_New((void *) ptr, sz, type) : SWIG_Py_Void();
+  return ptr ? SwigPyPacked_New((void *) ptr, sz, type) : SWIG_Py_Void();
 }
 
 /* -----------------------------------------------------------------------------*
@@ -2217,15 +2391,14 @@ void *SWIG_ReturnGlobalTypeList(void *);
 #endif
 
 SWIGRUNTIME swig_module_info *
-SWIG_Python_GetModule(void) {
+SWIG_Python_GetModule(void *SWIGUNUSEDPARM(clientdata)) {
   static void *type_pointer = (void *)0;
   /* first check if module already created */
   if (!type_pointer) {
 #ifdef SWIG_LINK_RUNTIME
     type_pointer = SWIG_ReturnGlobalTypeList((void *)0);
 #else
-    type_pointer = PyCObject_Import((char*)"swig_runtime_data" SWIG_RUNTIME_VERSION,
-				    (char*)"type_pointer" SWIG_TYPE_TABLE_NAME);
+    type_pointer = PyCapsule_Import(SWIGPY_CAPSULE_NAME, 0);
     if (PyErr_Occurred()) {
       PyErr_Clear();
       type_pointer = (void *)0;
@@ -2235,63 +2408,35 @@ SWIG_Python_GetModule(void) {
   return (swig_module_info *) type_pointer;
 }
 
-#if PY_MAJOR_VERSION < 2
-/* PyModule_AddObject function was introduced in Python 2.0.  The following function
-   is copied out of Python/modsupport.c in python version 2.3.4 */
-SWIGINTERN int
-PyModule_AddObject(PyObject *m, char *name, PyObject *o)
-{
-  PyObject *dict;
-  if (!PyModule_Check(m)) {
-    PyErr_SetString(PyExc_TypeError,
-		    "PyModule_AddObject() needs module as first arg");
-    return SWIG_ERROR;
-  }
-  if (!o) {
-    PyErr_SetString(PyExc_TypeError,
-		    "PyModule_AddObject() needs non-NULL value");
-    return SWIG_ERROR;
-  }
-  
-  dict = PyModule_GetDict(m);
-  if (dict == NULL) {
-    /* Internal error -- modules must have a dict! */
-    PyErr_Format(PyExc_SystemError, "module '%s' has no __dict__",
-		 PyModule_GetName(m));
-    return SWIG_ERROR;
-  }
-  if (PyDict_SetItemString(dict, name, o))
-    return SWIG_ERROR;
-  Py_DECREF(o);
-  return SWIG_OK;
-}
-#endif
-
 SWIGRUNTIME void
-SWIG_Python_DestroyModule(void *vptr)
+SWIG_Python_DestroyModule(PyObject *obj)
 {
-  swig_module_info *swig_module = (swig_module_info *) vptr;
+  swig_module_info *swig_module = (swig_module_info *) PyCapsule_GetPointer(obj, SWIGPY_CAPSULE_NAME);
   swig_type_info **types = swig_module->types;
   size_t i;
   for (i =0; i < swig_module->size; ++i) {
     swig_type_info *ty = types[i];
     if (ty->owndata) {
-      PySwigClientData *data = (PySwigClientData *) ty->clientdata;
-      if (data) PySwigClientData_Del(data);
+      SwigPyClientData *data = (SwigPyClientData *) ty->clientdata;
+      if (data) SwigPyClientData_Del(data);
     }
   }
   Py_DECREF(SWIG_This());
+  Swig_This_global = NULL;
 }
 
 SWIGRUNTIME void
 SWIG_Python_SetModule(swig_module_info *swig_module) {
-  static PyMethodDef swig_empty_runtime_method_table[] = { {NULL, NULL, 0, NULL} };/* Sentinel */
-
-  PyObject *module = Py_InitModule((char*)"swig_runtime_data" SWIG_RUNTIME_VERSION,
-				   swig_empty_runtime_method_table);
-  PyObject *pointer = PyCObject_FromVoidPtr((void *) swig_module, SWIG_Python_DestroyModule);
+#if PY_VERSION_HEX >= 0x03000000
+ /* Add a dummy module object into sys.modules */
+  PyObject *module = PyImport_AddModule("swig_runtime_data" SWIG_RUNTIME_VERSION);
+#else
+  static PyMethodDef swig_empty_runtime_method_table[] = { {NULL, NULL, 0, NULL} }; /* Sentinel */
+  PyObject *module = Py_InitModule("swig_runtime_data" SWIG_RUNTIME_VERSION, swig_empty_runtime_method_table);
+#endif
+  PyObject *pointer = PyCapsule_New((void *) swig_module, SWIGPY_CAPSULE_NAME, SWIG_Python_DestroyModule);
   if (pointer && module) {
-    PyModule_AddObject(module, (char*)"type_pointer" SWIG_TYPE_TABLE_NAME, pointer);
+    PyModule_AddObject(module, "type_pointer_capsule" SWIG_TYPE_TABLE_NAME, pointer);
   } else {
     Py_XDECREF(pointer);
   }
@@ -2308,16 +2453,16 @@ SWIGRUNTIME swig_type_info *
 SWIG_Python_TypeQuery(const char *type)
 {
   PyObject *cache = SWIG_Python_TypeCache();
-  PyObject *key = PyString_FromString(type); 
+  PyObject *key = SWIG_Python_str_FromChar(type); 
   PyObject *obj = PyDict_GetItem(cache, key);
   swig_type_info *descriptor;
   if (obj) {
-    descriptor = (swig_type_info *) PyCObject_AsVoidPtr(obj);
+    descriptor = (swig_type_info *) PyCapsule_GetPointer(obj, NULL);
   } else {
-    swig_module_info *swig_module = SWIG_Python_GetModule();
+    swig_module_info *swig_module = SWIG_GetModule(0);
     descriptor = SWIG_TypeQueryModule(swig_module, swig_module, type);
     if (descriptor) {
-      obj = PyCObject_FromVoidPtr(descriptor, NULL);
+      obj = PyCapsule_New((void*) descriptor, NULL, NULL);
       PyDict_SetItem(cache, key, obj);
       Py_DECREF(obj);
     }
@@ -2335,7 +2480,7 @@ SWIG_Python_TypeQuery(const char *type)
 
 SWIGRUNTIME int
 SWIG_Python_AddErrMesg(const char* mesg, int infront)
-{
+{  
   if (PyErr_Occurred()) {
     PyObject *type = 0;
     PyObject *value = 0;
@@ -2343,13 +2488,16 @@ SWIG_Python_AddErrMesg(const char* mesg, int infront)
     PyErr_Fetch(&type, &value, &traceback);
     if (value) {
       PyObject *old_str = PyObject_Str(value);
+      const char *tmp = SWIG_Python_str_AsChar(old_str);
+      const char *errmesg = tmp ? tmp : "Invalid error message";
       Py_XINCREF(type);
       PyErr_Clear();
       if (infront) {
-	PyErr_Format(type, "%s %s", mesg, PyString_AsString(old_str));
+	PyErr_Format(type, "%s %s", mesg, errmesg);
       } else {
-	PyErr_Format(type, "%s %s", PyString_AsString(old_str), mesg);
+	PyErr_Format(type, "%s %s", errmesg, mesg);
       }
+      SWIG_Python_str_DelForPy3(tmp);
       Py_DECREF(old_str);
     }
     return 1;
@@ -2372,11 +2520,11 @@ SWIG_Python_ArgFail(int argnum)
 }
 
 SWIGRUNTIMEINLINE const char *
-PySwigObject_GetDesc(PyObject *self)
+SwigPyObject_GetDesc(PyObject *self)
 {
-  PySwigObject *v = (PySwigObject *)self;
+  SwigPyObject *v = (SwigPyObject *)self;
   swig_type_info *ty = v ? v->ty : 0;
-  return ty ? ty->str : (char*)"";
+  return ty ? ty->str : "";
 }
 
 SWIGRUNTIME void
@@ -2384,10 +2532,10 @@ SWIG_Python_TypeError(const char *type, PyObject *obj)
 {
   if (type) {
 #if defined(SWIG_COBJECT_TYPES)
-    if (obj && PySwigObject_Check(obj)) {
-      const char *otype = (const char *) PySwigObject_GetDesc(obj);
+    if (obj && SwigPyObject_Check(obj)) {
+      const char *otype = (const char *) SwigPyObject_GetDesc(obj);
       if (otype) {
-	PyErr_Format(PyExc_TypeError, "a '%s' is expected, 'PySwigObject(%s)' is received",
+	PyErr_Format(PyExc_TypeError, "a '%s' is expected, 'SwigPyObject(%s)' is received",
 		     type, otype);
 	return;
       }
@@ -2397,10 +2545,11 @@ SWIG_Python_TypeError(const char *type, PyObject *obj)
       const char *otype = (obj ? obj->ob_type->tp_name : 0); 
       if (otype) {
 	PyObject *str = PyObject_Str(obj);
-	const char *cstr = str ? PyString_AsString(str) : 0;
+	const char *cstr = str ? SWIG_Python_str_AsChar(str) : 0;
 	if (cstr) {
 	  PyErr_Format(PyExc_TypeError, "a '%s' is expected, '%s(%s)' is received",
 		       type, otype, cstr);
+          SWIG_Python_str_DelForPy3(cstr);
 	} else {
 	  PyErr_Format(PyExc_TypeError, "a '%s' is expected, '%s' is received",
 		       type, otype);
@@ -2418,81 +2567,910 @@ SWIG_Python_TypeError(const char *type, PyObject *obj)
 
 /* Convert a pointer value, signal an exception on a type mismatch */
 SWIGRUNTIME void *
-SWIG_Python_MustGetPtr(PyObject *obj, swig_type_info *ty, int argnum, int flags) {
+SWIG_Python_MustGetPtr(PyObject *obj, swig_type_info *ty, int SWIGUNUSEDPARM(argnum), int flags) {
   void *result;
   if (SWIG_Python_ConvertPtr(obj, &result, ty, flags) == -1) {
     PyErr_Clear();
-    if (flags & SWIG_POINTER_EXCEPTION) {
+#if SWIG_POINTER_EXCEPTION
+    if (flags) {
       SWIG_Python_TypeError(SWIG_TypePrettyName(ty), obj);
       SWIG_Python_ArgFail(argnum);
     }
+#endif
   }
   return result;
 }
 
+#ifdef SWIGPYTHON_BUILTIN
+SWIGRUNTIME int
+SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
+  PyTypeObject *tp = obj->ob_type;
+  PyObject *descr;
+  PyObject *encoded_name;
+  descrsetfunc f;
+  int res = -1;
+
+# ifdef Py_USING_UNICODE
+  if (PyString_Check(name)) {
+    name = PyUnicode_Decode(PyString_AsString(name), PyString_Size(name), NULL, NULL);
+    if (!name)
+      return -1;
+  } else if (!PyUnicode_Check(name))
+# else
+  if (!PyString_Check(name))
+# endif
+  {
+    PyErr_Format(PyExc_TypeError, "attribute name must be string, not '%.200s'", name->ob_type->tp_name);
+    return -1;
+  } else {
+    Py_INCREF(name);
+  }
 
-#ifdef __cplusplus
-#if 0
-{ /* cc-mode */
-#endif
+  if (!tp->tp_dict) {
+    if (PyType_Ready(tp) < 0)
+      goto done;
+  }
+
+  descr = _PyType_Lookup(tp, name);
+  f = NULL;
+  if (descr != NULL)
+    f = descr->ob_type->tp_descr_set;
+  if (!f) {
+    if (PyString_Check(name)) {
+      encoded_name = name;
+      Py_INCREF(name);
+    } else {
+      encoded_name = PyUnicode_AsUTF8String(name);
+      if (!encoded_name)
+        return -1;
+    }
+    PyErr_Format(PyExc_AttributeError, "'%.100s' object has no attribute '%.200s'", tp->tp_name, PyString_AsString(encoded_name));
+    Py_DECREF(encoded_name);
+  } else {
+    res = f(descr, obj, value);
+  }
+  
+  done:
+  Py_DECREF(name);
+  return res;
 }
 #endif
 
 
+#ifdef __cplusplus
+}
+#endif
 
-#define SWIG_exception_fail(code, msg) do { SWIG_Error(code, msg); SWIG_fail; } while(0) 
+#ifdef __cplusplus
+extern "C" {
+#endif
 
-#define SWIG_contract_assert(expr, msg) if (!(expr)) { SWIG_Error(SWIG_RuntimeError, msg); SWIG_fail; } else 
+SWIGINTERN Py_hash_t
+SwigPyObject_hash(PyObject *obj) {
+  SwigPyObject *sobj = (SwigPyObject *)obj;
+  void *ptr = sobj->ptr;
+  return (Py_hash_t)ptr;
+}
+
+SWIGINTERN Py_hash_t
+SWIG_PyNumber_AsPyHash(PyObject *obj) {
+  Py_hash_t result = -1;
+#if PY_VERSION_HEX < 0x03020000
+  if (PyInt_Check(obj))
+    result = PyInt_AsLong(obj);
+  else if (PyLong_Check(obj))
+    result = PyLong_AsLong(obj);
+#else
+  if (PyNumber_Check(obj))
+    result = PyNumber_AsSsize_t(obj, NULL);
+#endif
+  else
+    PyErr_Format(PyExc_TypeError, "Wrong type for hash function");
+  return PyErr_Occurred() ? -1 : result;
+}
 
+SWIGINTERN int
+SwigPyBuiltin_BadInit(PyObject *self, PyObject *SWIGUNUSEDPARM(args), PyObject *SWIGUNUSEDPARM(kwds)) {
+  PyErr_Format(PyExc_TypeError, "Cannot create new instances of type '%.300s'", self->ob_type->tp_name);
+  return -1;
+}
 
+SWIGINTERN void
+SwigPyBuiltin_BadDealloc(PyObject *obj) {
+  SwigPyObject *sobj = (SwigPyObject *)obj;
+  if (sobj->own) {
+    PyErr_Format(PyExc_TypeError, "Swig detected a memory leak in type '%.300s': no callable destructor found.", obj->ob_type->tp_name);
+  }
+}
 
-/* -------- TYPES TABLE (BEGIN) -------- */
+typedef struct {
+  PyCFunction get;
+  PyCFunction set;
+} SwigPyGetSet;
 
-#define SWIGTYPE_p_AtomForce swig_types[0]
-#define SWIGTYPE_p_FEMparm swig_types[1]
-#define SWIGTYPE_p_MGparm swig_types[2]
+SWIGINTERN PyObject *
+SwigPyBuiltin_GetterClosure (PyObject *obj, void *closure) {
+  SwigPyGetSet *getset;
+  PyObject *tuple, *result;
+  if (!closure)
+    return SWIG_Py_Void();
+  getset = (SwigPyGetSet *)closure;
+  if (!getset->get)
+    return SWIG_Py_Void();
+  tuple = PyTuple_New(0);
+  assert(tuple);
+  result = (*getset->get)(obj, tuple);
+  Py_DECREF(tuple);
+  return result;
+}
+
+SWIGINTERN PyObject *
+SwigPyBuiltin_FunpackGetterClosure (PyObject *obj, void *closure) {
+  SwigPyGetSet *getset;
+  PyObject *result;
+  if (!closure)
+    return SWIG_Py_Void();
+  getset = (SwigPyGetSet *)closure;
+  if (!getset->get)
+    return SWIG_Py_Void();
+  result = (*getset->get)(obj, NULL);
+  return result;
+}
+
+SWIGINTERN int
+SwigPyBuiltin_SetterClosure (PyObject *obj, PyObject *val, void *closure) {
+  SwigPyGetSet *getset;
+  PyObject *tuple, *result;
+  if (!closure) {
+    PyErr_Format(PyExc_TypeError, "Missing getset closure");
+    return -1;
+  }
+  getset = (SwigPyGetSet *)closure;
+  if (!getset->set) {
+    PyErr_Format(PyExc_TypeError, "Illegal member variable assignment in type '%.300s'", obj->ob_type->tp_name);
+    return -1;
+  }
+  tuple = PyTuple_New(1);
+  assert(tuple);
+  Py_INCREF(val);
+  PyTuple_SET_ITEM(tuple, 0, val);
+  result = (*getset->set)(obj, tuple);
+  Py_DECREF(tuple);
+  Py_XDECREF(result);
+  return result ? 0 : -1;
+}
+
+SWIGINTERN int
+SwigPyBuiltin_FunpackSetterClosure (PyObject *obj, PyObject *val, void *closure) {
+  SwigPyGetSet *getset;
+  PyObject *result;
+  if (!closure) {
+    PyErr_Format(PyExc_TypeError, "Missing getset closure");
+    return -1;
+  }
+  getset = (SwigPyGetSet *)closure;
+  if (!getset->set) {
+    PyErr_Format(PyExc_TypeError, "Illegal member variable assignment in type '%.300s'", obj->ob_type->tp_name);
+    return -1;
+  }
+  result = (*getset->set)(obj, val);
+  Py_XDECREF(result);
+  return result ? 0 : -1;
+}
+
+SWIGINTERN void
+SwigPyStaticVar_dealloc(PyDescrObject *descr) {
+  PyObject_GC_UnTrack(descr);
+  Py_XDECREF(PyDescr_TYPE(descr));
+  Py_XDECREF(PyDescr_NAME(descr));
+  PyObject_GC_Del(descr);
+}
+
+SWIGINTERN PyObject *
+SwigPyStaticVar_repr(PyGetSetDescrObject *descr) {
+#if PY_VERSION_HEX >= 0x03000000
+
+  return PyUnicode_FromFormat("<class attribute '%S' of type '%s'>", PyDescr_NAME(descr), PyDescr_TYPE(descr)->tp_name);
+#else
+  return PyString_FromFormat("<class attribute '%s' of type '%s'>", PyString_AsString(PyDescr_NAME(descr)), PyDescr_TYPE(descr)->tp_name);
+#endif
+}
+
+SWIGINTERN int
+SwigPyStaticVar_traverse(PyObject *self, visitproc visit, void *arg) {
+  PyDescrObject *descr;
+  descr = (PyDescrObject *)self;
+  Py_VISIT((PyObject*) PyDescr_TYPE(descr));
+  return 0;
+}
+
+SWIGINTERN PyObject *
+SwigPyStaticVar_get(PyGetSetDescrObject *descr, PyObject *obj, PyObject *SWIGUNUSEDPARM(type)) {
+  if (descr->d_getset->get != NULL)
+    return descr->d_getset->get(obj, descr->d_getset->closure);
+#if PY_VERSION_HEX >= 0x03000000
+  PyErr_Format(PyExc_AttributeError, "attribute '%.300S' of '%.100s' objects is not readable", PyDescr_NAME(descr), PyDescr_TYPE(descr)->tp_name);
+#else
+  PyErr_Format(PyExc_AttributeError, "attribute '%.300s' of '%.100s' objects is not readable", PyString_AsString(PyDescr_NAME(descr)), PyDescr_TYPE(descr)->tp_name);
+#endif
+  return NULL;
+}
+
+SWIGINTERN int
+SwigPyStaticVar_set(PyGetSetDescrObject *descr, PyObject *obj, PyObject *value) {
+  if (descr->d_getset->set != NULL)
+    return descr->d_getset->set(obj, value, descr->d_getset->closure);
+#if PY_VERSION_HEX >= 0x03000000
+  PyErr_Format(PyExc_AttributeError, "attribute '%.300S' of '%.100s' objects is not writable", PyDescr_NAME(descr), PyDescr_TYPE(descr)->tp_name);
+#else
+  PyErr_Format(PyExc_AttributeError, "attribute '%.300s' of '%.100s' objects is not writable", PyString_AsString(PyDescr_NAME(descr)), PyDescr_TYPE(descr)->tp_name);
+#endif
+  return -1;
+}
+
+SWIGINTERN int
+SwigPyObjectType_setattro(PyObject *typeobject, PyObject *name, PyObject *value) {
+  PyObject *attribute;
+  PyTypeObject *type;
+  descrsetfunc local_set;
+
+  assert(PyType_Check(typeobject));
+  type = (PyTypeObject *)typeobject;
+  attribute = _PyType_Lookup(type, name);
+  if (attribute != NULL) {
+    /* Implement descriptor functionality, if any */
+    local_set = attribute->ob_type->tp_descr_set;
+    if (local_set != NULL)
+      return local_set(attribute, (PyObject *)type, value);
+#if PY_VERSION_HEX >= 0x03000000
+    PyErr_Format(PyExc_AttributeError, "cannot modify read-only attribute '%.50s.%.400S'", type->tp_name, name);
+#else 
+    PyErr_Format(PyExc_AttributeError, "cannot modify read-only attribute '%.50s.%.400s'", type->tp_name, PyString_AS_STRING(name));
+#endif
+  } else {
+#if PY_VERSION_HEX >= 0x03000000
+    PyErr_Format(PyExc_AttributeError, "type '%.50s' has no attribute '%.400S'", type->tp_name, name);
+#else
+    PyErr_Format(PyExc_AttributeError, "type '%.50s' has no attribute '%.400s'", type->tp_name, PyString_AS_STRING(name));
+#endif
+  }
+
+  return -1;
+}
+
+SWIGINTERN PyTypeObject*
+SwigPyStaticVar_Type(void) {
+  static PyTypeObject staticvar_type;
+  static int type_init = 0;
+  if (!type_init) {
+    const PyTypeObject tmp = {
+#if PY_VERSION_HEX >= 0x03000000
+      PyVarObject_HEAD_INIT(&PyType_Type, 0)
+#else
+      PyObject_HEAD_INIT(&PyType_Type)
+      0,                                        /* ob_size */
+#endif
+      "swig_static_var_getset_descriptor",      /* tp_name */
+      sizeof(PyGetSetDescrObject),              /* tp_basicsize */
+      0,                                        /* tp_itemsize */
+      (destructor)SwigPyStaticVar_dealloc,      /* tp_dealloc */
+      0,                                        /* tp_print */
+      0,                                        /* tp_getattr */
+      0,                                        /* tp_setattr */
+      0,                                        /* tp_compare */
+      (reprfunc)SwigPyStaticVar_repr,           /* tp_repr */
+      0,                                        /* tp_as_number */
+      0,                                        /* tp_as_sequence */
+      0,                                        /* tp_as_mapping */
+      0,                                        /* tp_hash */
+      0,                                        /* tp_call */
+      0,                                        /* tp_str */
+      PyObject_GenericGetAttr,                  /* tp_getattro */
+      0,                                        /* tp_setattro */
+      0,                                        /* tp_as_buffer */
+      Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_CLASS, /* tp_flags */
+      0,                                        /* tp_doc */
+      SwigPyStaticVar_traverse,                 /* tp_traverse */
+      0,                                        /* tp_clear */
+      0,                                        /* tp_richcompare */
+      0,                                        /* tp_weaklistoffset */
+      0,                                        /* tp_iter */
+      0,                                        /* tp_iternext */
+      0,                                        /* tp_methods */
+      0,                                        /* tp_members */
+      0,                                        /* tp_getset */
+      0,                                        /* tp_base */
+      0,                                        /* tp_dict */
+      (descrgetfunc)SwigPyStaticVar_get,        /* tp_descr_get */
+      (descrsetfunc)SwigPyStaticVar_set,        /* tp_descr_set */
+      0,                                        /* tp_dictoffset */
+      0,                                        /* tp_init */
+      0,                                        /* tp_alloc */
+      0,                                        /* tp_new */
+      0,                                        /* tp_free */
+      0,                                        /* tp_is_gc */
+      0,                                        /* tp_bases */
+      0,                                        /* tp_mro */
+      0,                                        /* tp_cache */
+      0,                                        /* tp_subclasses */
+      0,                                        /* tp_weaklist */
+      0,                                        /* tp_del */
+      0,                                        /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+      0,                                        /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+      0,                                        /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+      0,                                        /* tp_print */
+#endif
+#ifdef COUNT_ALLOCS
+      0,                                        /* tp_allocs */
+      0,                                        /* tp_frees */
+      0,                                        /* tp_maxalloc */
+      0,                                        /* tp_prev */
+      0                                         /* tp_next */
+#endif
+    };
+    staticvar_type = tmp;
+    type_init = 1;
+    if (PyType_Ready(&staticvar_type) < 0)
+      return NULL;
+  }
+  return &staticvar_type;
+}
+
+SWIGINTERN PyTypeObject*
+SwigPyObjectType(void) {
+  static char swigpyobjecttype_doc[] = "Metaclass for SWIG wrapped types";
+  static PyTypeObject swigpyobjecttype_type;
+  static int type_init = 0;
+  if (!type_init) {
+    const PyTypeObject tmp = {
+#if PY_VERSION_HEX >= 0x03000000
+      PyVarObject_HEAD_INIT(&PyType_Type, 0)
+#else
+      PyObject_HEAD_INIT(&PyType_Type)
+      0,                                        /* ob_size */
+#endif
+      "SwigPyObjectType",                       /* tp_name */
+      PyType_Type.tp_basicsize,                 /* tp_basicsize */
+      0,                                        /* tp_itemsize */
+      0,                                        /* tp_dealloc */
+      0,                                        /* tp_print */
+      0,                                        /* tp_getattr */
+      0,                                        /* tp_setattr */
+      0,                                        /* tp_compare */
+      0,                                        /* tp_repr */
+      0,                                        /* tp_as_number */
+      0,                                        /* tp_as_sequence */
+      0,                                        /* tp_as_mapping */
+      0,                                        /* tp_hash */
+      0,                                        /* tp_call */
+      0,                                        /* tp_str */
+      0,                                        /* tp_getattro */
+      SwigPyObjectType_setattro,                /* tp_setattro */
+      0,                                        /* tp_as_buffer */
+      Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_CLASS, /* tp_flags */
+      swigpyobjecttype_doc,                     /* tp_doc */
+      0,                                        /* tp_traverse */
+      0,                                        /* tp_clear */
+      0,                                        /* tp_richcompare */
+      0,                                        /* tp_weaklistoffset */
+      0,                                        /* tp_iter */
+      0,                                        /* tp_iternext */
+      0,                                        /* tp_methods */
+      0,                                        /* tp_members */
+      0,                                        /* tp_getset */
+      0,                                        /* tp_base */
+      0,                                        /* tp_dict */
+      0,                                        /* tp_descr_get */
+      0,                                        /* tp_descr_set */
+      0,                                        /* tp_dictoffset */
+      0,                                        /* tp_init */
+      0,                                        /* tp_alloc */
+      0,                                        /* tp_new */
+      0,                                        /* tp_free */
+      0,                                        /* tp_is_gc */
+      0,                                        /* tp_bases */
+      0,                                        /* tp_mro */
+      0,                                        /* tp_cache */
+      0,                                        /* tp_subclasses */
+      0,                                        /* tp_weaklist */
+      0,                                        /* tp_del */
+      0,                                        /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+      0,                                        /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+      0,                                        /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+      0,                                        /* tp_print */
+#endif
+#ifdef COUNT_ALLOCS
+      0,                                        /* tp_allocs */
+      0,                                        /* tp_frees */
+      0,                                        /* tp_maxalloc */
+      0,                                        /* tp_prev */
+      0                                         /* tp_next */
+#endif
+    };
+    swigpyobjecttype_type = tmp;
+    type_init = 1;
+    swigpyobjecttype_type.tp_base = &PyType_Type;
+    if (PyType_Ready(&swigpyobjecttype_type) < 0)
+      return NULL;
+  }
+  return &swigpyobjecttype_type;
+}
+
+SWIGINTERN PyGetSetDescrObject *
+SwigPyStaticVar_new_getset(PyTypeObject *type, PyGetSetDef *getset) {
+
+  PyGetSetDescrObject *descr;
+  descr = (PyGetSetDescrObject *)PyType_GenericAlloc(SwigPyStaticVar_Type(), 0);
+  assert(descr);
+  Py_XINCREF(type);
+  PyDescr_TYPE(descr) = type;
+  PyDescr_NAME(descr) = PyString_InternFromString(getset->name);
+  descr->d_getset = getset;
+  if (PyDescr_NAME(descr) == NULL) {
+    Py_DECREF(descr);
+    descr = NULL;
+  }
+  return descr;
+}
+
+SWIGINTERN void
+SwigPyBuiltin_InitBases (PyTypeObject *type, PyTypeObject **bases) {
+  Py_ssize_t base_count = 0;
+  PyTypeObject **b;
+  PyObject *tuple;
+  Py_ssize_t i;
+
+  if (!bases[0]) {
+    bases[0] = SwigPyObject_type();
+    bases[1] = NULL;
+  }
+  type->tp_base = bases[0];
+  Py_INCREF((PyObject *)bases[0]);
+  for (b = bases; *b != NULL; ++b)
+    ++base_count;
+  tuple = PyTuple_New(base_count);
+  for (i = 0; i < base_count; ++i) {
+    Py_INCREF((PyObject *)bases[i]);
+    PyTuple_SET_ITEM(tuple, i, (PyObject *)bases[i]);
+  }
+  type->tp_bases = tuple;
+}
+
+SWIGINTERN PyObject *
+SwigPyBuiltin_ThisClosure (PyObject *self, void *SWIGUNUSEDPARM(closure)) {
+  PyObject *result;
+  result = (PyObject *)SWIG_Python_GetSwigThis(self);
+  Py_XINCREF(result);
+  return result;
+}
+
+SWIGINTERN void
+SwigPyBuiltin_SetMetaType (PyTypeObject *type, PyTypeObject *metatype)
+{
+#if PY_VERSION_HEX >= 0x03000000
+    type->ob_base.ob_base.ob_type = metatype;
+#else
+    type->ob_type = metatype;
+#endif
+}
+
+
+/* Start of callback function macros for use in PyTypeObject */
+
+typedef PyObject *(*SwigPyWrapperFunction)(PyObject *, PyObject *);
+
+#define SWIGPY_UNARYFUNC_CLOSURE(wrapper)		\
+SWIGINTERN PyObject *					\
+wrapper##_unaryfunc_closure(PyObject *a) {		\
+  return SwigPyBuiltin_unaryfunc_closure(wrapper, a);	\
+}
+SWIGINTERN PyObject *
+SwigPyBuiltin_unaryfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a) {
+  return wrapper(a, NULL);
+}
+
+#define SWIGPY_DESTRUCTOR_CLOSURE(wrapper)			\
+SWIGINTERN void							\
+wrapper##_destructor_closure(PyObject *a) {			\
+    SwigPyBuiltin_destructor_closure(wrapper, #wrapper, a);	\
+}
+SWIGINTERN void
+SwigPyBuiltin_destructor_closure(SwigPyWrapperFunction wrapper, const char *wrappername, PyObject *a) {
+  SwigPyObject *sobj;
+  sobj = (SwigPyObject *)a;
+  Py_XDECREF(sobj->dict);
+  if (sobj->own) {
+    PyObject *o;
+    PyObject *type = 0, *value = 0, *traceback = 0;
+    PyErr_Fetch(&type, &value, &traceback);
+    o = wrapper(a, NULL);
+    if (!o) {
+      PyObject *deallocname = PyString_FromString(wrappername);
+      PyErr_WriteUnraisable(deallocname);
+      Py_DECREF(deallocname);
+    }
+    PyErr_Restore(type, value, traceback);
+    Py_XDECREF(o);
+  }
+  if (PyType_IS_GC(a->ob_type)) {
+    PyObject_GC_Del(a);
+  } else {
+    PyObject_Del(a);
+  }
+}
+
+#define SWIGPY_INQUIRY_CLOSURE(wrapper)			\
+SWIGINTERN int						\
+wrapper##_inquiry_closure(PyObject *a) {		\
+  return SwigPyBuiltin_inquiry_closure(wrapper, a);	\
+}
+SWIGINTERN int
+SwigPyBuiltin_inquiry_closure(SwigPyWrapperFunction wrapper, PyObject *a) {
+  PyObject *pyresult;
+  int result;
+  pyresult = wrapper(a, NULL);
+  result = pyresult && PyObject_IsTrue(pyresult) ? 1 : 0;
+  Py_XDECREF(pyresult);
+  return result;
+}
+
+#define SWIGPY_GETITERFUNC_CLOSURE(wrapper)		\
+SWIGINTERN PyObject *					\
+wrapper##_getiterfunc_closure(PyObject *a) {		\
+  return SwigPyBuiltin_getiterfunc_closure(wrapper, a);	\
+}
+SWIGINTERN PyObject *
+SwigPyBuiltin_getiterfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a) {
+  return wrapper(a, NULL);
+}
+
+#define SWIGPY_BINARYFUNC_CLOSURE(wrapper)			\
+SWIGINTERN PyObject *						\
+wrapper##_binaryfunc_closure(PyObject *a, PyObject *b) {	\
+  return SwigPyBuiltin_binaryfunc_closure(wrapper, a, b);	\
+}
+SWIGINTERN PyObject *
+SwigPyBuiltin_binaryfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a, PyObject *b) {
+  PyObject *tuple, *result;
+  tuple = PyTuple_New(1);
+  assert(tuple);
+  Py_INCREF(b);
+  PyTuple_SET_ITEM(tuple, 0, b);
+  result = wrapper(a, tuple);
+  Py_DECREF(tuple);
+  return result;
+}
+
+typedef ternaryfunc ternarycallfunc;
+
+#define SWIGPY_TERNARYFUNC_CLOSURE(wrapper)				\
+SWIGINTERN PyObject *							\
+wrapper##_ternaryfunc_closure(PyObject *a, PyObject *b, PyObject *c) {	\
+  return SwigPyBuiltin_ternaryfunc_closure(wrapper, a, b, c);		\
+}
+SWIGINTERN PyObject *
+SwigPyBuiltin_ternaryfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a, PyObject *b, PyObject *c) {
+  PyObject *tuple, *result;
+  tuple = PyTuple_New(2);
+  assert(tuple);
+  Py_INCREF(b);
+  PyTuple_SET_ITEM(tuple, 0, b);
+  Py_INCREF(c);
+  PyTuple_SET_ITEM(tuple, 1, c);
+  result = wrapper(a, tuple);
+  Py_DECREF(tuple);
+  return result;
+}
+
+#define SWIGPY_TERNARYCALLFUNC_CLOSURE(wrapper)					\
+SWIGINTERN PyObject *								\
+wrapper##_ternarycallfunc_closure(PyObject *a, PyObject *b, PyObject *c) {	\
+  return SwigPyBuiltin_ternarycallfunc_closure(wrapper, a, b, c);		\
+}
+SWIGINTERN PyObject *
+SwigPyBuiltin_ternarycallfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a, PyObject *b, PyObject *c) {
+  (void) c;
+  return wrapper(a, b);
+}
+
+#define SWIGPY_LENFUNC_CLOSURE(wrapper)			\
+SWIGINTERN Py_ssize_t					\
+wrapper##_lenfunc_closure(PyObject *a) {		\
+  return SwigPyBuiltin_lenfunc_closure(wrapper, a);	\
+}
+SWIGINTERN Py_ssize_t
+SwigPyBuiltin_lenfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a) {
+  PyObject *resultobj;
+  Py_ssize_t result;
+  resultobj = wrapper(a, NULL);
+  result = PyNumber_AsSsize_t(resultobj, NULL);
+  Py_DECREF(resultobj);
+  return result;
+}
+
+#define SWIGPY_SSIZESSIZEARGFUNC_CLOSURE(wrapper)				\
+SWIGINTERN PyObject *								\
+wrapper##_ssizessizeargfunc_closure(PyObject *a, Py_ssize_t b, Py_ssize_t c) {	\
+  return SwigPyBuiltin_ssizessizeargfunc_closure(wrapper, a, b, c);		\
+}
+SWIGINTERN PyObject *
+SwigPyBuiltin_ssizessizeargfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a, Py_ssize_t b, Py_ssize_t c) {
+  PyObject *tuple, *result;
+  tuple = PyTuple_New(2);
+  assert(tuple);
+  PyTuple_SET_ITEM(tuple, 0, _PyLong_FromSsize_t(b));
+  PyTuple_SET_ITEM(tuple, 1, _PyLong_FromSsize_t(c));
+  result = wrapper(a, tuple);
+  Py_DECREF(tuple);
+  return result;
+}
+
+#define SWIGPY_SSIZESSIZEOBJARGPROC_CLOSURE(wrapper)						\
+SWIGINTERN int											\
+wrapper##_ssizessizeobjargproc_closure(PyObject *a, Py_ssize_t b, Py_ssize_t c, PyObject *d) {	\
+  return SwigPyBuiltin_ssizessizeobjargproc_closure(wrapper, a, b, c, d);			\
+}
+SWIGINTERN int
+SwigPyBuiltin_ssizessizeobjargproc_closure(SwigPyWrapperFunction wrapper, PyObject *a, Py_ssize_t b, Py_ssize_t c, PyObject *d) {
+  PyObject *tuple, *resultobj;
+  int result;
+  tuple = PyTuple_New(d ? 3 : 2);
+  assert(tuple);
+  PyTuple_SET_ITEM(tuple, 0, _PyLong_FromSsize_t(b));
+  PyTuple_SET_ITEM(tuple, 1, _PyLong_FromSsize_t(c));
+  if (d) {
+    Py_INCREF(d);
+    PyTuple_SET_ITEM(tuple, 2, d);
+  }
+  resultobj = wrapper(a, tuple);
+  result = resultobj ? 0 : -1;
+  Py_DECREF(tuple);
+  Py_XDECREF(resultobj);
+  return result;
+}
+
+#define SWIGPY_SSIZEARGFUNC_CLOSURE(wrapper)				\
+SWIGINTERN PyObject *							\
+wrapper##_ssizeargfunc_closure(PyObject *a, Py_ssize_t b) {		\
+  return SwigPyBuiltin_funpack_ssizeargfunc_closure(wrapper, a, b);	\
+}
+SWIGINTERN PyObject *
+SwigPyBuiltin_funpack_ssizeargfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a, Py_ssize_t b) {
+  PyObject *tuple, *result;
+  tuple = PyTuple_New(1);
+  assert(tuple);
+  PyTuple_SET_ITEM(tuple, 0, _PyLong_FromSsize_t(b));
+  result = wrapper(a, tuple);
+  Py_DECREF(tuple);
+  return result;
+}
+
+#define SWIGPY_FUNPACK_SSIZEARGFUNC_CLOSURE(wrapper)			\
+SWIGINTERN PyObject *							\
+wrapper##_ssizeargfunc_closure(PyObject *a, Py_ssize_t b) {		\
+  return SwigPyBuiltin_ssizeargfunc_closure(wrapper, a, b);		\
+}
+SWIGINTERN PyObject *
+SwigPyBuiltin_ssizeargfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a, Py_ssize_t b) {
+  PyObject *arg, *result;
+  arg = _PyLong_FromSsize_t(b);
+  result = wrapper(a, arg);
+  Py_DECREF(arg);
+  return result;
+}
+
+#define SWIGPY_SSIZEOBJARGPROC_CLOSURE(wrapper)					\
+SWIGINTERN int									\
+wrapper##_ssizeobjargproc_closure(PyObject *a, Py_ssize_t b, PyObject *c) {	\
+  return SwigPyBuiltin_ssizeobjargproc_closure(wrapper, a, b, c);		\
+}
+SWIGINTERN int
+SwigPyBuiltin_ssizeobjargproc_closure(SwigPyWrapperFunction wrapper, PyObject *a, Py_ssize_t b, PyObject *c) {
+  PyObject *tuple, *resultobj;
+  int result;
+  tuple = PyTuple_New(2);
+  assert(tuple);
+  PyTuple_SET_ITEM(tuple, 0, _PyLong_FromSsize_t(b));
+  Py_INCREF(c);
+  PyTuple_SET_ITEM(tuple, 1, c);
+  resultobj = wrapper(a, tuple);
+  result = resultobj ? 0 : -1;
+  Py_XDECREF(resultobj);
+  Py_DECREF(tuple);
+  return result;
+}
+
+#define SWIGPY_OBJOBJPROC_CLOSURE(wrapper)			\
+SWIGINTERN int							\
+wrapper##_objobjproc_closure(PyObject *a, PyObject *b) {	\
+  return SwigPyBuiltin_objobjproc_closure(wrapper, a, b);	\
+}
+SWIGINTERN int
+SwigPyBuiltin_objobjproc_closure(SwigPyWrapperFunction wrapper, PyObject *a, PyObject *b) {
+  int result;
+  PyObject *pyresult;
+  PyObject *tuple;
+  tuple = PyTuple_New(1);
+  assert(tuple);
+  Py_INCREF(b);
+  PyTuple_SET_ITEM(tuple, 0, b);
+  pyresult = wrapper(a, tuple);
+  result = pyresult ? (PyObject_IsTrue(pyresult) ? 1 : 0) : -1;
+  Py_XDECREF(pyresult);
+  Py_DECREF(tuple);
+  return result;
+}
+
+#define SWIGPY_FUNPACK_OBJOBJPROC_CLOSURE(wrapper)			\
+SWIGINTERN int								\
+wrapper##_objobjproc_closure(PyObject *a, PyObject *b) {		\
+  return SwigPyBuiltin_funpack_objobjproc_closure(wrapper, a, b);	\
+}
+SWIGINTERN int
+SwigPyBuiltin_funpack_objobjproc_closure(SwigPyWrapperFunction wrapper, PyObject *a, PyObject *b) {
+  int result;
+  PyObject *pyresult;
+  pyresult = wrapper(a, b);
+  result = pyresult ? (PyObject_IsTrue(pyresult) ? 1 : 0) : -1;
+  Py_XDECREF(pyresult);
+  return result;
+}
+
+#define SWIGPY_OBJOBJARGPROC_CLOSURE(wrapper)					\
+SWIGINTERN int									\
+wrapper##_objobjargproc_closure(PyObject *a, PyObject *b, PyObject *c) {	\
+  return SwigPyBuiltin_objobjargproc_closure(wrapper, a, b, c);			\
+}
+SWIGINTERN int
+SwigPyBuiltin_objobjargproc_closure(SwigPyWrapperFunction wrapper, PyObject *a, PyObject *b, PyObject *c) {
+  PyObject *tuple, *resultobj;
+  int result;
+  tuple = PyTuple_New(c ? 2 : 1);
+  assert(tuple);
+  Py_INCREF(b);
+  PyTuple_SET_ITEM(tuple, 0, b);
+  if (c) {
+    Py_INCREF(c);
+    PyTuple_SET_ITEM(tuple, 1, c);
+  }
+  resultobj = wrapper(a, tuple);
+  result = resultobj ? 0 : -1;
+  Py_XDECREF(resultobj);
+  Py_DECREF(tuple);
+  return result;
+}
+
+#define SWIGPY_REPRFUNC_CLOSURE(wrapper)		\
+SWIGINTERN PyObject *					\
+wrapper##_reprfunc_closure(PyObject *a) {		\
+  return SwigPyBuiltin_reprfunc_closure(wrapper, a);	\
+}
+SWIGINTERN PyObject *
+SwigPyBuiltin_reprfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a) {
+  return wrapper(a, NULL);
+}
+
+#define SWIGPY_HASHFUNC_CLOSURE(wrapper)		\
+SWIGINTERN Py_hash_t					\
+wrapper##_hashfunc_closure(PyObject *a) {		\
+  return SwigPyBuiltin_hashfunc_closure(wrapper, a);	\
+}
+SWIGINTERN Py_hash_t
+SwigPyBuiltin_hashfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a) {
+  PyObject *pyresult;
+  Py_hash_t result;
+  pyresult = wrapper(a, NULL);
+  if (!pyresult)
+    return -1;
+  result = SWIG_PyNumber_AsPyHash(pyresult);
+  Py_DECREF(pyresult);
+  return result;
+}
+
+#define SWIGPY_ITERNEXTFUNC_CLOSURE(wrapper)		\
+SWIGINTERN PyObject *					\
+wrapper##_iternextfunc_closure(PyObject *a) {		\
+  return SwigPyBuiltin_iternextfunc_closure(wrapper, a);\
+}
+SWIGINTERN PyObject *
+SwigPyBuiltin_iternextfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a) {
+  return wrapper(a, NULL);
+}
+
+/* End of callback function macros for use in PyTypeObject */
+
+#ifdef __cplusplus
+}
+#endif
+
+
+
+
+#define SWIG_exception_fail(code, msg) do { SWIG_Error(code, msg); SWIG_fail; } while(0) 
+
+#define SWIG_contract_assert(expr, msg) if (!(expr)) { SWIG_Error(SWIG_RuntimeError, msg); SWIG_fail; } else 
+
+
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Method creation and docstring support functions */
+
+SWIGINTERN PyMethodDef *SWIG_PythonGetProxyDoc(const char *name);
+SWIGINTERN PyObject *SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func);
+SWIGINTERN PyObject *SWIG_PyStaticMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func);
+
+#ifdef __cplusplus
+}
+#endif
+
+
+/* -------- TYPES TABLE (BEGIN) -------- */
+
+#define SWIGTYPE_p_AtomForce swig_types[0]
+#define SWIGTYPE_p_FEMparm swig_types[1]
+#define SWIGTYPE_p_MGparm swig_types[2]
 #define SWIGTYPE_p_NOsh swig_types[3]
 #define SWIGTYPE_p_NOsh_PrintType swig_types[4]
 #define SWIGTYPE_p_NOsh_calc swig_types[5]
 #define SWIGTYPE_p_PBEparm swig_types[6]
-#define SWIGTYPE_p_Vacc swig_types[7]
-#define SWIGTYPE_p_Valist swig_types[8]
-#define SWIGTYPE_p_Vatom swig_types[9]
-#define SWIGTYPE_p_Vcom swig_types[10]
-#define SWIGTYPE_p_Vmem swig_types[11]
-#define SWIGTYPE_p_Vparam swig_types[12]
-#define SWIGTYPE_p_Vpbe swig_types[13]
-#define SWIGTYPE_p_Vpmg swig_types[14]
-#define SWIGTYPE_p_char swig_types[15]
-#define SWIGTYPE_p_double swig_types[16]
-#define SWIGTYPE_p_int swig_types[17]
-#define SWIGTYPE_p_p_AtomForce swig_types[18]
-#define SWIGTYPE_p_p_Valist swig_types[19]
-#define SWIGTYPE_p_p_Vgrid swig_types[20]
-#define SWIGTYPE_p_p_Vpbe swig_types[21]
-#define SWIGTYPE_p_p_Vpmg swig_types[22]
-#define SWIGTYPE_p_p_Vpmgp swig_types[23]
-static swig_type_info *swig_types[25];
-static swig_module_info swig_module = {swig_types, 24, 0, 0, 0, 0};
+#define SWIGTYPE_p_SwigPyObject swig_types[7]
+#define SWIGTYPE_p_Vacc swig_types[8]
+#define SWIGTYPE_p_Valist swig_types[9]
+#define SWIGTYPE_p_Vatom swig_types[10]
+#define SWIGTYPE_p_Vcom swig_types[11]
+#define SWIGTYPE_p_Vgrid swig_types[12]
+#define SWIGTYPE_p_Vmem swig_types[13]
+#define SWIGTYPE_p_Vparam swig_types[14]
+#define SWIGTYPE_p_Vpbe swig_types[15]
+#define SWIGTYPE_p_Vpmg swig_types[16]
+#define SWIGTYPE_p_char swig_types[17]
+#define SWIGTYPE_p_double swig_types[18]
+#define SWIGTYPE_p_eAPBSphase swig_types[19]
+#define SWIGTYPE_p_int swig_types[20]
+#define SWIGTYPE_p_p_AtomForce swig_types[21]
+#define SWIGTYPE_p_p_Valist swig_types[22]
+#define SWIGTYPE_p_p_Vgrid swig_types[23]
+#define SWIGTYPE_p_p_Vpbe swig_types[24]
+#define SWIGTYPE_p_p_Vpmg swig_types[25]
+#define SWIGTYPE_p_p_Vpmgp swig_types[26]
+static swig_type_info *swig_types[28];
+static swig_module_info swig_module = {swig_types, 27, 0, 0, 0, 0};
 #define SWIG_TypeQuery(name) SWIG_TypeQueryModule(&swig_module, &swig_module, name)
 #define SWIG_MangledTypeQuery(name) SWIG_MangledTypeQueryModule(&swig_module, &swig_module, name)
 
 /* -------- TYPES TABLE (END) -------- */
 
-#if (PY_VERSION_HEX <= 0x02000000)
-# if !defined(SWIG_PYTHON_CLASSIC)
-#  error "This python version requires swig to be run with the '-classic' option"
-# endif
+#ifdef SWIG_TypeQuery
+# undef SWIG_TypeQuery
 #endif
+#define SWIG_TypeQuery SWIG_Python_TypeQuery
 
 /*-----------------------------------------------
               @(target):= _apbslib.so
   ------------------------------------------------*/
-#define SWIG_init    init_apbslib
+#if PY_VERSION_HEX >= 0x03000000
+#  define SWIG_init    PyInit__apbslib
+
+#else
+#  define SWIG_init    init_apbslib
 
+#endif
 #define SWIG_name    "_apbslib"
 
-#define SWIGVERSION 0x010331 
+#define SWIGVERSION 0x040002 
 #define SWIG_VERSION SWIGVERSION
 
 
@@ -2500,23 +3478,40 @@ static swig_module_info swig_module = {swig_types, 24, 0, 0, 0, 0};
 #define SWIG_as_voidptrptr(a) ((void)SWIG_as_voidptr(*a),(void**)(a)) 
 
 
+#include <stddef.h>
+
+
 #define APBS_SWIG 1
 #include "maloc/maloc.h"
 #include "apbscfg.h" 
 #include "routines.h"
 #include "apbs/valist.h"
 #include "apbs/vatom.h"
+#include <string.h>
+
+/* Point data at the memory of a writable buffer (a NumPy array, for
+   example) holding exactly count doubles; returns 0 if it can't */
+static int writeBuffer(PyObject *buffer, Py_ssize_t count, double **data){
+    void *ptr;
+    Py_ssize_t len;
+
+    if (PyObject_AsWriteBuffer(buffer, &ptr, &len) != 0) {
+        PyErr_Clear();
+        return 0;
+    }
+    if (len != (Py_ssize_t)(count*sizeof(double))) return 0;
+    *data = (double *)ptr;
+    return 1;
+}
 
 
 #include <limits.h>
-#ifndef LLONG_MIN
-# define LLONG_MIN	LONG_LONG_MIN
-#endif
-#ifndef LLONG_MAX
-# define LLONG_MAX	LONG_LONG_MAX
-#endif
-#ifndef ULLONG_MAX
-# define ULLONG_MAX	ULONG_LONG_MAX
+#if !defined(SWIG_NO_LLONG_MAX)
+# if !defined(LLONG_MAX) && defined(__GNUC__) && defined (__LONG_LONG_MAX__)
+#   define LLONG_MAX __LONG_LONG_MAX__
+#   define LLONG_MIN (-LLONG_MAX - 1LL)
+#   define ULLONG_MAX (LLONG_MAX * 2ULL + 1ULL)
+# endif
 #endif
 
 
@@ -2527,9 +3522,11 @@ SWIG_AsVal_double (PyObject *obj, double *val)
   if (PyFloat_Check(obj)) {
     if (val) *val = PyFloat_AsDouble(obj);
     return SWIG_OK;
+#if PY_VERSION_HEX < 0x03000000
   } else if (PyInt_Check(obj)) {
-    if (val) *val = PyInt_AsLong(obj);
+    if (val) *val = (double) PyInt_AsLong(obj);
     return SWIG_OK;
+#endif
   } else if (PyLong_Check(obj)) {
     double v = PyLong_AsDouble(obj);
     if (!PyErr_Occurred()) {
@@ -2603,16 +3600,20 @@ SWIG_CanCastAsInteger(double *d, double min, double max) {
 SWIGINTERN int
 SWIG_AsVal_long (PyObject *obj, long* val)
 {
+#if PY_VERSION_HEX < 0x03000000
   if (PyInt_Check(obj)) {
     if (val) *val = PyInt_AsLong(obj);
     return SWIG_OK;
-  } else if (PyLong_Check(obj)) {
+  } else
+#endif
+  if (PyLong_Check(obj)) {
     long v = PyLong_AsLong(obj);
     if (!PyErr_Occurred()) {
       if (val) *val = v;
       return SWIG_OK;
     } else {
       PyErr_Clear();
+      return SWIG_OverflowError;
     }
   }
 #ifdef SWIG_PYTHON_CAST_MODE
@@ -2655,13 +3656,10 @@ SWIG_AsVal_int (PyObject * obj, int *val)
 }
 
 
-  #define SWIG_From_long   PyInt_FromLong 
-
-
-SWIGINTERNINLINE PyObject *
-SWIG_From_int  (int value)
-{    
-  return SWIG_From_long  (value);
+SWIGINTERNINLINE PyObject*
+  SWIG_From_int  (int value)
+{
+  return PyInt_FromLong((long) value);
 }
 
 
@@ -2684,40 +3682,97 @@ SWIG_pchar_descriptor(void)
 SWIGINTERN int
 SWIG_AsCharPtrAndSize(PyObject *obj, char** cptr, size_t* psize, int *alloc)
 {
-  if (PyString_Check(obj)) {
-    char *cstr; Py_ssize_t len;
-    PyString_AsStringAndSize(obj, &cstr, &len);
-    if (cptr)  {
-      if (alloc) {
-	/* 
-	   In python the user should not be able to modify the inner
-	   string representation. To warranty that, if you define
-	   SWIG_PYTHON_SAFE_CSTRINGS, a new/copy of the python string
-	   buffer is always returned.
-
-	   The default behavior is just to return the pointer value,
-	   so, be careful.
-	*/ 
-#if defined(SWIG_PYTHON_SAFE_CSTRINGS)
-	if (*alloc != SWIG_OLDOBJ) 
+#if PY_VERSION_HEX>=0x03000000
+#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+  if (PyBytes_Check(obj))
 #else
-	if (*alloc == SWIG_NEWOBJ) 
+  if (PyUnicode_Check(obj))
 #endif
-	  {
-	    *cptr = (char *)memcpy((char *)malloc((len + 1)*sizeof(char)), cstr, sizeof(char)*(len + 1));
-	    *alloc = SWIG_NEWOBJ;
-	  }
-	else {
-	  *cptr = cstr;
+#else  
+  if (PyString_Check(obj))
+#endif
+  {
+    char *cstr; Py_ssize_t len;
+    int ret = SWIG_OK;
+#if PY_VERSION_HEX>=0x03000000
+#if !defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+    if (!alloc && cptr) {
+        /* We can't allow converting without allocation, since the internal
+           representation of string in Python 3 is UCS-2/UCS-4 but we require
+           a UTF-8 representation.
+           TODO(bhy) More detailed explanation */
+        return SWIG_RuntimeError;
+    }
+    obj = PyUnicode_AsUTF8String(obj);
+    if (!obj)
+      return SWIG_TypeError;
+    if (alloc)
+      *alloc = SWIG_NEWOBJ;
+#endif
+    if (PyBytes_AsStringAndSize(obj, &cstr, &len) == -1)
+      return SWIG_TypeError;
+#else
+    if (PyString_AsStringAndSize(obj, &cstr, &len) == -1)
+      return SWIG_TypeError;
+#endif
+    if (cptr) {
+      if (alloc) {
+	if (*alloc == SWIG_NEWOBJ) {
+	  *cptr = (char *)memcpy(malloc((len + 1)*sizeof(char)), cstr, sizeof(char)*(len + 1));
+	  *alloc = SWIG_NEWOBJ;
+	} else {
+	  *cptr = cstr;
 	  *alloc = SWIG_OLDOBJ;
 	}
       } else {
-	*cptr = PyString_AsString(obj);
+#if PY_VERSION_HEX>=0x03000000
+#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+	*cptr = PyBytes_AsString(obj);
+#else
+	assert(0); /* Should never reach here with Unicode strings in Python 3 */
+#endif
+#else
+	*cptr = SWIG_Python_str_AsChar(obj);
+        if (!*cptr)
+          ret = SWIG_TypeError;
+#endif
       }
     }
     if (psize) *psize = len + 1;
-    return SWIG_OK;
+#if PY_VERSION_HEX>=0x03000000 && !defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+    Py_XDECREF(obj);
+#endif
+    return ret;
   } else {
+#if defined(SWIG_PYTHON_2_UNICODE)
+#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+#error "Cannot use both SWIG_PYTHON_2_UNICODE and SWIG_PYTHON_STRICT_BYTE_CHAR at once"
+#endif
+#if PY_VERSION_HEX<0x03000000
+    if (PyUnicode_Check(obj)) {
+      char *cstr; Py_ssize_t len;
+      if (!alloc && cptr) {
+        return SWIG_RuntimeError;
+      }
+      obj = PyUnicode_AsUTF8String(obj);
+      if (!obj)
+        return SWIG_TypeError;
+      if (PyString_AsStringAndSize(obj, &cstr, &len) != -1) {
+        if (cptr) {
+          if (alloc) *alloc = SWIG_NEWOBJ;
+          *cptr = (char *)memcpy(malloc((len + 1)*sizeof(char)), cstr, sizeof(char)*(len + 1));
+        }
+        if (psize) *psize = len + 1;
+
+        Py_XDECREF(obj);
+        return SWIG_OK;
+      } else {
+        Py_XDECREF(obj);
+      }
+    }
+#endif
+#endif
+
     swig_type_info* pchar_descriptor = SWIG_pchar_descriptor();
     if (pchar_descriptor) {
       void* vptr = 0;
@@ -2743,9 +3798,17 @@ SWIG_FromCharPtrAndSize(const char* carray, size_t size)
     if (size > INT_MAX) {
       swig_type_info* pchar_descriptor = SWIG_pchar_descriptor();
       return pchar_descriptor ? 
-	SWIG_NewPointerObj((char *)(carray), pchar_descriptor, 0) : SWIG_Py_Void();
+	SWIG_InternalNewPointerObj((char *)(carray), pchar_descriptor, 0) : SWIG_Py_Void();
     } else {
-      return PyString_FromStringAndSize(carray, (int)(size));
+#if PY_VERSION_HEX >= 0x03000000
+#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+      return PyBytes_FromStringAndSize(carray, (Py_ssize_t)(size));
+#else
+      return PyUnicode_DecodeUTF8(carray, (Py_ssize_t)(size), "surrogateescape");
+#endif
+#else
+      return PyString_FromStringAndSize(carray, (Py_ssize_t)(size));
+#endif
     }
   } else {
     return SWIG_Py_Void();
@@ -2772,8 +3835,12 @@ Vgrid **new_gridlist(int maxargs) {
    return (Vgrid **) malloc(maxargs*sizeof(Vgrid *));
 }
 
+Vgrid *get_Vgrid(Vgrid **args, int n) {
+   return (Vgrid *)args[n];
+}
+
 Vpmg **new_pmglist(int maxargs) {
-   return (Vpmg **) malloc(maxargs*sizeof(Vpmg *));
+   return (Vpmg **) calloc(maxargs, sizeof(Vpmg *));
 }
 
 Vpmg *get_Vpmg(Vpmg **args, int n) {
@@ -2781,11 +3848,11 @@ Vpmg *get_Vpmg(Vpmg **args, int n) {
 }
 
 Vpmgp **new_pmgplist(int maxargs) {
-   return (Vpmgp **) malloc(maxargs*sizeof(Vpmgp *));
+   return (Vpmgp **) calloc(maxargs, sizeof(Vpmgp *));
 }
 
 Vpbe **new_pbelist(int maxargs) {
-   return (Vpbe **) malloc(maxargs*sizeof(Vpbe *));
+   return (Vpbe **) calloc(maxargs, sizeof(Vpbe *));
 }
 
 Vpbe *get_Vpbe(Vpbe **args, int n) { 
@@ -2815,6 +3882,10 @@ void delete_pbelist(Vpbe **a) {
     free(a);
   }
 
+void delete_Vgrid(Vgrid *grid) {
+    Vgrid_dtor(&grid);
+}
+
 void delete_Nosh(NOsh *nosh) {
     NOsh_dtor(&nosh);
 }
@@ -2868,6 +3939,14 @@ void set_entry(double *array, int i, double val){
 	    array[i] = val;
   }
 
+int get_int_entry(int *array, int i){
+	    return array[i];
+  }
+
+void set_int_entry(int *array, int i, int val){
+	    array[i] = val;
+  }
+
 
 
 int parseInputFromString(NOsh *nosh, PyObject *string){
@@ -2883,12 +3962,426 @@ int parseInputFromString(NOsh *nosh, PyObject *string){
 
     Vio_bufTake(sock, PyString_AsString(string), bufsize);
 
+    startStats(APBS_PHASE_PARSE);
     ret = NOsh_parseInput(nosh, sock); 
+    if (ret) stopStats(APBS_PHASE_PARSE);
     sock->VIObuffer = VNULL;
     Vio_dtor(&sock);
     return ret;
 }
 
+/* Validated setters for building and varying calculations without
+   writing and reparsing input text; see setCalc for the Python
+   interface.  Each sets the value and its flag and returns 1, or prints
+   the reason and returns 0, leaving the object unchanged, if the value
+   is out of range. */
+
+int PBEparm_setMolid(PBEparm *thee, int molid){
+    VASSERT(thee != VNULL);
+    if (molid < 1 || molid > NOSH_MAXMOL) {
+        Vnm_print(2, "PBEparm_setMolid:  molecule ID must be 1-%d, got %d!\n",
+          NOSH_MAXMOL, molid);
+        return 0;
+    }
+    thee->molid = molid;
+    thee->setmolid = 1;
+    return 1;
+}
+
+int PBEparm_setPBEType(PBEparm *thee, int pbetype){
+    VASSERT(thee != VNULL);
+    if (pbetype < PBE_LPBE || pbetype > PBE_SMPBE) {
+        Vnm_print(2, "PBEparm_setPBEType:  unknown PBE type %d!\n", pbetype);
+        return 0;
+    }
+    thee->pbetype = (Vhal_PBEType)pbetype;
+    thee->setpbetype = 1;
+    return 1;
+}
+
+int PBEparm_setBcfl(PBEparm *thee, int bcfl){
+    VASSERT(thee != VNULL);
+    if (bcfl < BCFL_ZERO || bcfl > BCFL_MAP || bcfl == BCFL_UNUSED) {
+        Vnm_print(2, "PBEparm_setBcfl:  unknown boundary condition %d!\n", bcfl);
+        return 0;
+    }
+    thee->bcfl = (Vbcfl)bcfl;
+    thee->setbcfl = 1;
+    return 1;
+}
+
+/* Set ion species i, which may be an existing one or the next new one */
+int PBEparm_setIon(PBEparm *thee, int i, double charge, double conc,
+  double radius){
+    VASSERT(thee != VNULL);
+    if (i < 0 || i > thee->nion || i >= MAXION) {
+        Vnm_print(2, "PBEparm_setIon:  ion %d out of range (%d set, max %d)!\n",
+          i, thee->nion, MAXION);
+        return 0;
+    }
+    if (conc < 0.0 || radius < 0.0) {
+        Vnm_print(2, "PBEparm_setIon:  negative concentration or radius!\n");
+        return 0;
+    }
+    thee->ionq[i] = charge;
+    thee->ionc[i] = conc;
+    thee->ionr[i] = radius;
+    thee->setion[i] = 1;
+    if (i == thee->nion) (thee->nion)++;
+    thee->setnion = 1;
+    return 1;
+}
+
+/* Keep the first nion ion species and drop the rest */
+int PBEparm_setNion(PBEparm *thee, int nion){
+    int i;
+    VASSERT(thee != VNULL);
+    if (nion < 0 || nion > thee->nion) {
+        Vnm_print(2, "PBEparm_setNion:  can only drop ions (%d set, got %d)!\n",
+          thee->nion, nion);
+        return 0;
+    }
+    for (i=nion; i<thee->nion; i++) {
+        thee->ionq[i] = 0.0;
+        thee->ionc[i] = 0.0;
+        thee->ionr[i] = 0.0;
+        thee->setion[i] = 0;
+    }
+    thee->nion = nion;
+    thee->setnion = 1;
+    return 1;
+}
+
+int PBEparm_setPdie(PBEparm *thee, double pdie){
+    VASSERT(thee != VNULL);
+    if (pdie <= 0.0) {
+        Vnm_print(2, "PBEparm_setPdie:  dielectric must be positive, got %g!\n",
+          pdie);
+        return 0;
+    }
+    thee->pdie = pdie;
+    thee->setpdie = 1;
+    return 1;
+}
+
+int PBEparm_setSdie(PBEparm *thee, double sdie){
+    VASSERT(thee != VNULL);
+    if (sdie <= 0.0) {
+        Vnm_print(2, "PBEparm_setSdie:  dielectric must be positive, got %g!\n",
+          sdie);
+        return 0;
+    }
+    thee->sdie = sdie;
+    thee->setsdie = 1;
+    return 1;
+}
+
+int PBEparm_setSrfm(PBEparm *thee, int srfm){
+    VASSERT(thee != VNULL);
+    if (srfm < VSM_MOL || srfm > VSM_SPLINE4) {
+        Vnm_print(2, "PBEparm_setSrfm:  unknown surface method %d!\n", srfm);
+        return 0;
+    }
+    thee->srfm = (Vsurf_Meth)srfm;
+    thee->setsrfm = 1;
+    return 1;
+}
+
+int PBEparm_setSrad(PBEparm *thee, double srad){
+    VASSERT(thee != VNULL);
+    if (srad < 0.0) {
+        Vnm_print(2, "PBEparm_setSrad:  negative radius %g!\n", srad);
+        return 0;
+    }
+    thee->srad = srad;
+    thee->setsrad = 1;
+    return 1;
+}
+
+int PBEparm_setSwin(PBEparm *thee, double swin){
+    VASSERT(thee != VNULL);
+    if (swin < 0.0) {
+        Vnm_print(2, "PBEparm_setSwin:  negative window %g!\n", swin);
+        return 0;
+    }
+    thee->swin = swin;
+    thee->setswin = 1;
+    return 1;
+}
+
+int PBEparm_setSdens(PBEparm *thee, double sdens){
+    VASSERT(thee != VNULL);
+    if (sdens <= 0.0) {
+        Vnm_print(2, "PBEparm_setSdens:  density must be positive, got %g!\n",
+          sdens);
+        return 0;
+    }
+    thee->sdens = sdens;
+    thee->setsdens = 1;
+    return 1;
+}
+
+int PBEparm_setTemp(PBEparm *thee, double temp){
+    VASSERT(thee != VNULL);
+    if (temp <= 0.0) {
+        Vnm_print(2, "PBEparm_setTemp:  temperature must be positive, got %g!\n",
+          temp);
+        return 0;
+    }
+    thee->temp = temp;
+    thee->settemp = 1;
+    return 1;
+}
+
+int PBEparm_setCalcEnergy(PBEparm *thee, int calcenergy){
+    VASSERT(thee != VNULL);
+    if (calcenergy < PCE_NO || calcenergy > PCE_COMPS) {
+        Vnm_print(2, "PBEparm_setCalcEnergy:  unknown energy type %d!\n",
+          calcenergy);
+        return 0;
+    }
+    thee->calcenergy = (PBEparm_calcEnergy)calcenergy;
+    thee->setcalcenergy = 1;
+    return 1;
+}
+
+int PBEparm_setCalcForce(PBEparm *thee, int calcforce){
+    VASSERT(thee != VNULL);
+    if (calcforce < PCF_NO || calcforce > PCF_COMPS) {
+        Vnm_print(2, "PBEparm_setCalcForce:  unknown force type %d!\n",
+          calcforce);
+        return 0;
+    }
+    thee->calcforce = (PBEparm_calcForce)calcforce;
+    thee->setcalcforce = 1;
+    return 1;
+}
+
+/* Set the grid dimensions and the number of multigrid levels the way
+   MGparm_check does, but refuse dimensions that check would reset.  The
+   spacing is recomputed from the length, or the length from the spacing,
+   whichever was set last (MGparm_setGlen, MGparm_setGrid) */
+int MGparm_setDime(MGparm *thee, int nx, int ny, int nz){
+
+    int i, ti, tnlev, nlev, dime[3];
+
+    VASSERT(thee != VNULL);
+
+    dime[0] = nx;
+    dime[1] = ny;
+    dime[2] = nz;
+    nlev = -1;
+    for (i=0; i<3; i++) {
+        ti = dime[i] - 1;
+        if (ti < 4) {
+            Vnm_print(2, "MGparm_setDime:  dime[%d] = %d is too small!\n",
+              i, dime[i]);
+            return 0;
+        }
+        if (ti == VPOW(2, (VMGNLEV+1))) {
+            tnlev = VMGNLEV;
+        } else {
+            tnlev = 0;
+            while (VEVEN(ti)) {
+                tnlev++;
+                ti = (int)ceil(0.5*ti);
+            }
+            tnlev--;
+            if ((dime[i] > 65) && (tnlev < VMGNLEV)) {
+                Vnm_print(2, "MGparm_setDime:  dime[%d] = %d allows only %d \
+levels; use c*2^%d + 1!\n", i, dime[i], tnlev, VMGNLEV+1);
+                return 0;
+            }
+        }
+        if (nlev < 0 || tnlev < nlev) nlev = tnlev;
+    }
+    if (nlev <= 0) {
+        Vnm_print(2, "MGparm_setDime:  dime (%d, %d, %d) gives no multigrid \
+levels!\n", nx, ny, nz);
+        return 0;
+    }
+
+    for (i=0; i<3; i++) {
+        thee->dime[i] = dime[i];
+        if (thee->setglen) {
+            thee->grid[i] = thee->glen[i]/((double)(dime[i]-1));
+        } else if (thee->setgrid) {
+            thee->glen[i] = thee->grid[i]*((double)(dime[i]-1));
+        }
+    }
+    thee->nlev = nlev;
+    thee->setdime = 1;
+    return 1;
+}
+
+int MGparm_setGlen(MGparm *thee, double x, double y, double z){
+
+    int i;
+    double glen[3];
+
+    VASSERT(thee != VNULL);
+
+    glen[0] = x;
+    glen[1] = y;
+    glen[2] = z;
+    for (i=0; i<3; i++) {
+        if (glen[i] <= 0.0) {
+            Vnm_print(2, "MGparm_setGlen:  glen[%d] must be positive, got %g!\n",
+              i, glen[i]);
+            return 0;
+        }
+    }
+    for (i=0; i<3; i++) {
+        thee->glen[i] = glen[i];
+        if (thee->setdime) thee->grid[i] = glen[i]/((double)(thee->dime[i]-1));
+    }
+    thee->setglen = 1;
+    thee->setgrid = 0;
+    return 1;
+}
+
+int MGparm_setGrid(MGparm *thee, double hx, double hy, double hz){
+
+    int i;
+    double grid[3];
+
+    VASSERT(thee != VNULL);
+
+    grid[0] = hx;
+    grid[1] = hy;
+    grid[2] = hz;
+    for (i=0; i<3; i++) {
+        if (grid[i] <= 0.0) {
+            Vnm_print(2, "MGparm_setGrid:  grid[%d] must be positive, got %g!\n",
+              i, grid[i]);
+            return 0;
+        }
+    }
+    for (i=0; i<3; i++) {
+        thee->grid[i] = grid[i];
+        if (thee->setdime) thee->glen[i] = grid[i]*((double)(thee->dime[i]-1));
+    }
+    thee->setgrid = 1;
+    thee->setglen = 0;
+    return 1;
+}
+
+int MGparm_setCenter(MGparm *thee, double x, double y, double z){
+    VASSERT(thee != VNULL);
+    thee->center[0] = x;
+    thee->center[1] = y;
+    thee->center[2] = z;
+    thee->cmeth = MCM_POINT;
+    thee->setgcent = 1;
+    return 1;
+}
+
+int MGparm_setChgm(MGparm *thee, int chgm){
+    VASSERT(thee != VNULL);
+    if (chgm < VCM_TRIL || chgm > VCM_BSPL4) {
+        Vnm_print(2, "MGparm_setChgm:  unknown charge method %d!\n", chgm);
+        return 0;
+    }
+    thee->chgm = (Vchrg_Meth)chgm;
+    thee->setchgm = 1;
+    return 1;
+}
+
+int MGparm_setEtol(MGparm *thee, double etol){
+    VASSERT(thee != VNULL);
+    if (etol <= 0.0) {
+        Vnm_print(2, "MGparm_setEtol:  tolerance must be positive, got %g!\n",
+          etol);
+        return 0;
+    }
+    thee->etol = etol;
+    thee->setetol = 1;
+    return 1;
+}
+
+/* A new, empty manual multigrid calculation, to be filled with the
+   setters above and added to a NOsh with addCalc */
+NOsh_calc *newCalc(){
+    NOsh_calc *calc;
+    calc = NOsh_calc_ctor(NCT_MG);
+    calc->mgparm->type = MCT_MANUAL;
+    calc->mgparm->parsed = 1;
+    calc->pbeparm->parsed = 1;
+    return calc;
+}
+
+/* A copy of a calculation, sharing nothing with it */
+NOsh_calc *copyCalc(NOsh_calc *source){
+    NOsh_calc *calc;
+    VASSERT(source != VNULL);
+    calc = NOsh_calc_ctor(source->calctype);
+    NOsh_calc_copy(calc, source);
+    return calc;
+}
+
+void deleteCalc(NOsh_calc *calc){
+    NOsh_calc_dtor(&calc);
+}
+
+/* Check that a multigrid calculation has everything initMG needs before
+   it is added to nosh as the next calculation */
+int checkCalc(NOsh *nosh, NOsh_calc *calc){
+
+    MGparm *mgparm;
+    PBEparm *pbeparm;
+
+    VASSERT(nosh != VNULL);
+    VASSERT(calc != VNULL);
+
+    mgparm = calc->mgparm;
+    pbeparm = calc->pbeparm;
+    if (calc->calctype != NCT_MG || mgparm == VNULL) {
+        Vnm_print(2, "checkCalc:  not a multigrid calculation!\n");
+        return 0;
+    }
+    if (!mgparm->setdime) {
+        Vnm_print(2, "checkCalc:  DIME not set!\n");
+        return 0;
+    }
+    if (!mgparm->setchgm) {
+        Vnm_print(2, "checkCalc:  CHGM not set!\n");
+        return 0;
+    }
+    if (!mgparm->setgrid && !mgparm->setglen) {
+        Vnm_print(2, "checkCalc:  neither GRID nor GLEN set!\n");
+        return 0;
+    }
+    if (mgparm->type == MCT_MANUAL && !mgparm->setgcent) {
+        Vnm_print(2, "checkCalc:  GCENT not set!\n");
+        return 0;
+    }
+    if (!PBEparm_check(pbeparm)) return 0;
+    if (pbeparm->molid > nosh->nmol) {
+        Vnm_print(2, "checkCalc:  molecule %d not loaded (%d molecules)!\n",
+          pbeparm->molid, nosh->nmol);
+        return 0;
+    }
+    if (pbeparm->bcfl == BCFL_FOCUS && nosh->ncalc == 0) {
+        Vnm_print(2, "checkCalc:  can't focus the first calculation!\n");
+        return 0;
+    }
+    return 1;
+}
+
+/* Add a checked calculation to nosh, which then owns it; returns its
+   index, or -1 if it is incomplete or nosh is full */
+int addCalc(NOsh *nosh, NOsh_calc *calc){
+    if (nosh->ncalc >= NOSH_MAXCALC) {
+        Vnm_print(2, "addCalc:  too many calculations (max %d)!\n",
+          NOSH_MAXCALC);
+        return -1;
+    }
+    if (!checkCalc(nosh, calc)) return -1;
+    nosh->calc[nosh->ncalc] = calc;
+    (nosh->ncalc)++;
+    return nosh->ncalc - 1;
+}
+
 void Valist_load(Valist *thee, int size, PyObject *x, PyObject *y, PyObject *z, PyObject *chg, PyObject *rad){ 
    
     int i,j;
@@ -2941,6 +4434,66 @@ void Valist_load(Valist *thee, int size, PyObject *x, PyObject *y, PyObject *z,
 
 }
 
+/* Load atoms from an object exposing a buffer of size rows of five
+   doubles (x, y, z, charge, radius); returns 0 if the buffer does not
+   hold exactly that.  See Valist_loadArray for the Python interface. */
+int Valist_loadBuffer(Valist *thee, int size, PyObject *data){
+
+    int i;
+    const void *buffer;
+    Py_ssize_t len;
+    double *row;
+
+    VASSERT(thee != VNULL);
+
+    if (PyObject_AsReadBuffer(data, &buffer, &len) != 0) {
+        PyErr_Clear();
+        return 0;
+    }
+    if (size < 1 || len != (Py_ssize_t)(5*size*sizeof(double))) return 0;
+
+    if (thee->atoms != VNULL) {
+        Vmem_free(thee->vmem, thee->number, sizeof(Vatom),
+          (void **)&(thee->atoms));
+    }
+    thee->atoms = Vmem_malloc(thee->vmem, size, sizeof(Vatom));
+    thee->number = size;
+    row = (double *)buffer;
+    for (i=0; i<size; i++, row += 5) {
+        Vatom_setPosition(&(thee->atoms[i]), row);
+        Vatom_setCharge(&(thee->atoms[i]), row[3]);
+        Vatom_setRadius(&(thee->atoms[i]), row[4]);
+        Vatom_setAtomID(&(thee->atoms[i]), i);
+    }
+
+    return (Valist_getStatistics(thee) == VRC_SUCCESS);
+}
+
+/* Replace the positions of the atoms already in a Valist from a buffer
+   of three doubles per atom; returns 0 if the buffer has the wrong size */
+int Valist_updateBuffer(Valist *thee, PyObject *data){
+
+    int i;
+    const void *buffer;
+    Py_ssize_t len;
+    double *row;
+
+    VASSERT(thee != VNULL);
+
+    if (PyObject_AsReadBuffer(data, &buffer, &len) != 0) {
+        PyErr_Clear();
+        return 0;
+    }
+    if (thee->number < 1 || len != (Py_ssize_t)(3*thee->number*sizeof(double))) return 0;
+
+    row = (double *)buffer;
+    for (i=0; i<thee->number; i++, row += 3) {
+        Vatom_setPosition(&(thee->atoms[i]), row);
+    }
+
+    return (Valist_getStatistics(thee) == VRC_SUCCESS);
+}
+
 extern int NOsh_setupElecCalc(NOsh *nosh, Valist *alist[NOSH_MAXMOL]);
 extern int NOsh_setupApolCalc(NOsh *nosh, Valist *alist[NOSH_MAXMOL]);
 
@@ -2957,6 +4510,34 @@ int wrap_forceMG(Vmem *mem, NOsh *nosh, PBEparm *pbeparm, MGparm *mgparm,
     return *nforce;
 }
 
+/* Copy the forces of one calculation to and from a string so they can be
+   passed between processes */
+
+PyObject *getAtomForceData(AtomForce **atomForce, int nforce){
+    if (nforce <= 0) return PyString_FromStringAndSize("", 0);
+    return PyString_FromStringAndSize((char *)(*atomForce),
+      (Py_ssize_t)(nforce*sizeof(AtomForce)));
+}
+
+int setAtomForceData(Vmem *mem, AtomForce **atomForce,
+ int forcearray[NOSH_MAXCALC], int calcid, PyObject *data){
+    char *buffer;
+    Py_ssize_t size;
+    int nforce;
+
+    if (PyString_AsStringAndSize(data, &buffer, &size) == -1) {
+        PyErr_Clear();
+        return -1;
+    }
+    nforce = (int)(size/sizeof(AtomForce));
+    forcearray[calcid] = nforce;
+    if (nforce > 0) {
+        *atomForce = (AtomForce *)Vmem_malloc(mem, nforce, sizeof(AtomForce));
+        memcpy(*atomForce, buffer, nforce*sizeof(AtomForce));
+    }
+    return nforce;
+}
+
 PyObject *getAtomPosition(Vatom *atom){
     double *position;
     int i;
@@ -3000,6 +4581,8 @@ PyObject *getPotentials(NOsh *nosh, PBEparm *pbeparm, Vpmg *pmg, Valist *alist){
     for (i=0;i<Valist_getNumberAtoms(alist);i++){
         atom = Valist_getAtom(alist, i);
         position = Vatom_getPosition(atom); 
+        /* Atoms off the grid get zero */
+        value = 0.0;
         Vgrid_value(grid, position, &value);
         PyList_SetItem(values, i, PyFloat_FromDouble(value)); 
     } 
@@ -3022,32 +4605,95 @@ PyObject *getEnergies(Vpmg *pmg, Valist *alist){
     return values;
 }
 
-PyObject *getForces(AtomForce **atomForce, Valist *alist){
-    int i, j;
-    PyObject *dict;
-    PyObject *qfvalues, *qf, *qfholder;
-    PyObject *ibvalues, *ib, *ibholder;
-    PyObject *dbvalues, *db, *dbholder;
-    PyObject *npvalues, *np, *npholder;
-    
-    dict = PyDict_New(); 
-    qfvalues = PyList_New(Valist_getNumberAtoms(alist));
-    dbvalues = PyList_New(Valist_getNumberAtoms(alist)); 
-    ibvalues = PyList_New(Valist_getNumberAtoms(alist)); 
-    
-    qfholder = PyList_New(3);
-    dbholder = PyList_New(3);
-    ibholder = PyList_New(3);
-    
-    qf = PyString_FromString("qf");
-    db = PyString_FromString("db");
-    ib = PyString_FromString("ib");
+int fillPotentials(NOsh *nosh, PBEparm *pbeparm, Vpmg *pmg, Valist *alist,
+ PyObject *buffer){
+    Vgrid *grid;
+    int i, nx, ny, nz, natoms;
+    double hx, hy, hzed, xmin, ymin, zmin;
+    double *values;
 
-    for (i=0;i<Valist_getNumberAtoms(alist);i++){
-        for (j=0;j<3;j++){
-           PyList_SetItem(qfholder, j, PyFloat_FromDouble(atomForce[0][i].qfForce[j]));
-           PyList_SetItem(dbholder, j, PyFloat_FromDouble(atomForce[0][i].dbForce[j]));
-           PyList_SetItem(ibholder, j, PyFloat_FromDouble(atomForce[0][i].ibForce[j]));
+    natoms = Valist_getNumberAtoms(alist);
+    if (!writeBuffer(buffer, natoms, &values)) return 0;
+    nx = pmg->pmgp->nx;
+    ny = pmg->pmgp->ny;
+    nz = pmg->pmgp->nz;
+    hx = pmg->pmgp->hx;
+    hy = pmg->pmgp->hy;
+    hzed = pmg->pmgp->hzed;
+    xmin = pmg->pmgp->xcent - 0.5*(nx-1)*hx;
+    ymin = pmg->pmgp->ycent - 0.5*(ny-1)*hy;
+    zmin = pmg->pmgp->zcent - 0.5*(nz-1)*hzed;
+
+    Vpmg_fillArray(pmg, pmg->rwork, VDT_POT, 0.0, pbeparm->pbetype, pbeparm);
+    grid = Vgrid_ctor(nx, ny, nz, hx, hy, hzed, xmin, ymin, zmin,
+                  pmg->rwork);
+    for (i=0; i<natoms; i++) {
+        /* Atoms off the grid get zero */
+        values[i] = 0.0;
+        Vgrid_value(grid, Vatom_getPosition(Valist_getAtom(alist, i)),
+          &(values[i]));
+    }
+    Vgrid_dtor(&grid);
+    return 1;
+}
+
+int fillEnergies(Vpmg *pmg, Valist *alist, PyObject *buffer){
+    int i, natoms;
+    double *values;
+
+    natoms = Valist_getNumberAtoms(alist);
+    if (!writeBuffer(buffer, natoms, &values)) return 0;
+    for (i=0; i<natoms; i++) {
+        values[i] = Vpmg_qfAtomEnergy(pmg, Valist_getAtom(alist, i));
+    }
+    return 1;
+}
+
+int fillForces(AtomForce **atomForce, Valist *alist, PyObject *qfbuffer,
+ PyObject *ibbuffer, PyObject *dbbuffer){
+    int i, j, natoms;
+    double *qf, *ib, *db;
+
+    natoms = Valist_getNumberAtoms(alist);
+    if (!writeBuffer(qfbuffer, 3*natoms, &qf)) return 0;
+    if (!writeBuffer(ibbuffer, 3*natoms, &ib)) return 0;
+    if (!writeBuffer(dbbuffer, 3*natoms, &db)) return 0;
+    for (i=0; i<natoms; i++) {
+        for (j=0; j<3; j++) {
+            qf[3*i+j] = atomForce[0][i].qfForce[j];
+            ib[3*i+j] = atomForce[0][i].ibForce[j];
+            db[3*i+j] = atomForce[0][i].dbForce[j];
+        }
+    }
+    return 1;
+}
+
+PyObject *getForces(AtomForce **atomForce, Valist *alist){
+    int i, j;
+    PyObject *dict;
+    PyObject *qfvalues, *qf, *qfholder;
+    PyObject *ibvalues, *ib, *ibholder;
+    PyObject *dbvalues, *db, *dbholder;
+    PyObject *npvalues, *np, *npholder;
+    
+    dict = PyDict_New(); 
+    qfvalues = PyList_New(Valist_getNumberAtoms(alist));
+    dbvalues = PyList_New(Valist_getNumberAtoms(alist)); 
+    ibvalues = PyList_New(Valist_getNumberAtoms(alist)); 
+    
+    qfholder = PyList_New(3);
+    dbholder = PyList_New(3);
+    ibholder = PyList_New(3);
+    
+    qf = PyString_FromString("qf");
+    db = PyString_FromString("db");
+    ib = PyString_FromString("ib");
+
+    for (i=0;i<Valist_getNumberAtoms(alist);i++){
+        for (j=0;j<3;j++){
+           PyList_SetItem(qfholder, j, PyFloat_FromDouble(atomForce[0][i].qfForce[j]));
+           PyList_SetItem(dbholder, j, PyFloat_FromDouble(atomForce[0][i].dbForce[j]));
+           PyList_SetItem(ibholder, j, PyFloat_FromDouble(atomForce[0][i].ibForce[j]));
         }
         PyList_SetItem(qfvalues, i,  PyList_GetSlice(qfholder, 0, 3));
         PyList_SetItem(dbvalues, i,  PyList_GetSlice(dbholder, 0, 3));
@@ -3059,37 +4705,137 @@ PyObject *getForces(AtomForce **atomForce, Valist *alist){
     return dict;
 }
 
+/* Grid arrays of a Vpmg that can be viewed from Python, indexed (i,j,k)
+   with i varying fastest as in IJK() */
+
+double *getGridData(Vpmg *pmg, char *name){
+
+    if (strcmp(name, "pot") == 0) return pmg->u;
+    if (strcmp(name, "charge") == 0) return pmg->charge;
+    if (strcmp(name, "dielx") == 0) return pmg->epsx;
+    if (strcmp(name, "diely") == 0) return pmg->epsy;
+    if (strcmp(name, "dielz") == 0) return pmg->epsz;
+    if (strcmp(name, "kappa") == 0) return pmg->kappa;
+    if (strcmp(name, "a1cf") == 0) return pmg->a1cf;
+    if (strcmp(name, "a2cf") == 0) return pmg->a2cf;
+    if (strcmp(name, "a3cf") == 0) return pmg->a3cf;
+    if (strcmp(name, "ccf") == 0) return pmg->ccf;
+    if (strcmp(name, "fcf") == 0) return pmg->fcf;
+    return VNULL;
+}
+
+PyObject *getGridBuffer(Vpmg *pmg, char *name){
+    double *data;
+    Vpmgp *pmgp;
+
+    VASSERT(pmg != VNULL);
+    data = getGridData(pmg, name);
+    if (data == VNULL) {
+        PyErr_Format(PyExc_ValueError, "no %s array in this Vpmg", name);
+        return NULL;
+    }
+    pmgp = pmg->pmgp;
+    return PyBuffer_FromReadWriteMemory((void *)data,
+      (Py_ssize_t)(pmgp->nx*pmgp->ny*pmgp->nz*sizeof(double)));
+}
+
+PyObject *getGridInfo(Vpmg *pmg){
+    Vpmgp *pmgp;
+    PyObject *dict, *value;
+
+    VASSERT(pmg != VNULL);
+    pmgp = pmg->pmgp;
+    dict = PyDict_New();
+#define SETINFO(key, obj) value = (obj); PyDict_SetItemString(dict, key, value); Py_DECREF(value)
+    SETINFO("nx", PyInt_FromLong(pmgp->nx));
+    SETINFO("ny", PyInt_FromLong(pmgp->ny));
+    SETINFO("nz", PyInt_FromLong(pmgp->nz));
+    SETINFO("hx", PyFloat_FromDouble(pmgp->hx));
+    SETINFO("hy", PyFloat_FromDouble(pmgp->hy));
+    SETINFO("hzed", PyFloat_FromDouble(pmgp->hzed));
+    SETINFO("xmin", PyFloat_FromDouble(pmgp->xcent - 0.5*(pmgp->nx-1)*pmgp->hx));
+    SETINFO("ymin", PyFloat_FromDouble(pmgp->ycent - 0.5*(pmgp->ny-1)*pmgp->hy));
+    SETINFO("zmin", PyFloat_FromDouble(pmgp->zcent - 0.5*(pmgp->nz-1)*pmgp->hzed));
+    SETINFO("zmagic", PyFloat_FromDouble(Vpbe_getZmagic(pmg->pbe)));
+#undef SETINFO
+    return dict;
+}
+
+/* The timings and counters of the run (see getStats in routines.h) as a
+   dictionary: "phases" maps each phase name to its CPU "time" (s) and
+   "count", "iters" is the total number of solver iterations and "memory"
+   holds the current and peak bytes allocated through Vmem */
+PyObject *getStatsRecord(){
+    APBSstats *stats;
+    PyObject *dict, *phases, *phase, *memory, *value;
+    int i;
+
+    stats = getStats();
+    dict = PyDict_New();
+    phases = PyDict_New();
+    memory = PyDict_New();
+#define SETITEM(d, key, obj) value = (obj); PyDict_SetItemString(d, key, value); Py_DECREF(value)
+    for (i=0; i<APBS_NPHASE; i++) {
+        phase = PyDict_New();
+        SETITEM(phase, "time", PyFloat_FromDouble(stats->time[i]));
+        SETITEM(phase, "count", PyInt_FromLong(stats->count[i]));
+        SETITEM(phases, getStatsName((APBSphase)i), phase);
+    }
+    SETITEM(memory, "bytes", PyLong_FromSize_t(Vmem_bytesTotal()));
+    SETITEM(memory, "highwater", PyLong_FromSize_t(Vmem_highWaterTotal()));
+    SETITEM(dict, "phases", phases);
+    SETITEM(dict, "memory", memory);
+    SETITEM(dict, "iters", PyInt_FromLong(stats->iters));
+#undef SETITEM
+    return dict;
+}
+
+/* The iterations of the last solve of pmg as a list of (relative
+   residual, CPU seconds) tuples */
+PyObject *getCycles(Vpmg *pmg){
+    PyObject *list;
+    int i;
+
+    VASSERT(pmg != VNULL);
+    list = PyList_New(pmg->ncycle);
+    for (i=0; i<pmg->ncycle; i++) {
+        PyList_SET_ITEM(list, i, Py_BuildValue("(dd)", pmg->cycleResid[i],
+          pmg->cycleTime[i]));
+    }
+    return list;
+}
+
 #ifdef __cplusplus
 extern "C" {
 #endif
-SWIGINTERN PyObject *_wrap_new_Valist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN int _wrap_new_Valist(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
   Valist *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)":new_Valist")) SWIG_fail;
-  result = (Valist *)(Valist *) calloc(1, sizeof(Valist));
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Valist, SWIG_POINTER_NEW |  0 );
-  return resultobj;
+  if (!SWIG_Python_CheckNoKeywords(kwargs, "new_Valist")) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "new_Valist", 0, 0, 0)) SWIG_fail;
+  result = (Valist *)calloc(1, sizeof(Valist));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Valist, SWIG_BUILTIN_INIT |  0 );
+  return resultobj == Py_None ? -1 : 0;
 fail:
-  return NULL;
+  return -1;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_Valist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_Valist(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   Valist *arg1 = (Valist *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_Valist",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Valist, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "delete_Valist", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Valist, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Valist" "', argument " "1"" of type '" "Valist *""'"); 
   }
   arg1 = (Valist *)(argp1);
   free((char *) arg1);
-  
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -3097,7 +4843,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Valist_number_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Valist_number_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   Valist *arg1 = (Valist *) 0 ;
   int arg2 ;
@@ -3105,22 +4851,21 @@ SWIGINTERN PyObject *_wrap_Valist_number_set(PyObject *SWIGUNUSEDPARM(self), PyO
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:Valist_number_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Valist, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Valist, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Valist_number_set" "', argument " "1"" of type '" "Valist *""'"); 
   }
   arg1 = (Valist *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
   if (!SWIG_IsOK(ecode2)) {
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Valist_number_set" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = (int)(val2);
   if (arg1) (arg1)->number = arg2;
-  
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -3128,16 +4873,16 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Valist_number_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Valist_number_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   Valist *arg1 = (Valist *) 0 ;
-  int result;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:Valist_number_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Valist, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "Valist_number_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Valist, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Valist_number_get" "', argument " "1"" of type '" "Valist *""'"); 
   }
@@ -3150,23 +4895,19 @@ fail:
 }
 
 
-SWIGINTERN PyObject *Valist_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O|swigregister", &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_Valist, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_Valist) /* defines _wrap_delete_Valist_destructor_closure */
 
-SWIGINTERN PyObject *_wrap_Valist_getAtomList(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Valist_getAtomList(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   Valist *arg1 = (Valist *) 0 ;
-  Vatom *result = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  Vatom *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:Valist_getAtomList",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Valist, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Valist, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Valist_getAtomList" "', argument " "1"" of type '" "Valist *""'"); 
   }
@@ -3179,25 +4920,24 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Valist_getAtom(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Valist_getAtom(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   Valist *arg1 = (Valist *) 0 ;
   int arg2 ;
-  Vatom *result = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
+  Vatom *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:Valist_getAtom",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Valist, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "Valist_getAtom", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Valist, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Valist_getAtom" "', argument " "1"" of type '" "Valist *""'"); 
   }
   arg1 = (Valist *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Valist_getAtom" "', argument " "2"" of type '" "int""'");
   } 
@@ -3210,34 +4950,34 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_new_Vatom(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN int _wrap_new_Vatom(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
   Vatom *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)":new_Vatom")) SWIG_fail;
-  result = (Vatom *)(Vatom *) calloc(1, sizeof(Vatom));
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vatom, SWIG_POINTER_NEW |  0 );
-  return resultobj;
+  if (!SWIG_Python_CheckNoKeywords(kwargs, "new_Vatom")) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "new_Vatom", 0, 0, 0)) SWIG_fail;
+  result = (Vatom *)calloc(1, sizeof(Vatom));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vatom, SWIG_BUILTIN_INIT |  0 );
+  return resultobj == Py_None ? -1 : 0;
 fail:
-  return NULL;
+  return -1;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_Vatom(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_Vatom(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   Vatom *arg1 = (Vatom *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_Vatom",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vatom, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "delete_Vatom", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Vatom, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Vatom" "', argument " "1"" of type '" "Vatom *""'"); 
   }
   arg1 = (Vatom *)(argp1);
   free((char *) arg1);
-  
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -3245,7 +4985,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Vatom_id_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Vatom_id_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   Vatom *arg1 = (Vatom *) 0 ;
   int arg2 ;
@@ -3253,22 +4993,21 @@ SWIGINTERN PyObject *_wrap_Vatom_id_set(PyObject *SWIGUNUSEDPARM(self), PyObject
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:Vatom_id_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vatom, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Vatom, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vatom_id_set" "', argument " "1"" of type '" "Vatom *""'"); 
   }
   arg1 = (Vatom *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
   if (!SWIG_IsOK(ecode2)) {
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Vatom_id_set" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = (int)(val2);
   if (arg1) (arg1)->id = arg2;
-  
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -3276,16 +5015,16 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Vatom_id_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Vatom_id_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   Vatom *arg1 = (Vatom *) 0 ;
-  int result;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:Vatom_id_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vatom, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "Vatom_id_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Vatom, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vatom_id_get" "', argument " "1"" of type '" "Vatom *""'"); 
   }
@@ -3298,23 +5037,19 @@ fail:
 }
 
 
-SWIGINTERN PyObject *Vatom_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O|swigregister", &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_Vatom, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_Vatom) /* defines _wrap_delete_Vatom_destructor_closure */
 
-SWIGINTERN PyObject *_wrap_Vatom_getPosition(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Vatom_getPosition(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   Vatom *arg1 = (Vatom *) 0 ;
-  double *result = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  double *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:Vatom_getPosition",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vatom, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vatom, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vatom_getPosition" "', argument " "1"" of type '" "Vatom *""'"); 
   }
@@ -3327,7 +5062,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Vatom_setCharge(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Vatom_setCharge(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   Vatom *arg1 = (Vatom *) 0 ;
   double arg2 ;
@@ -3335,16 +5070,15 @@ SWIGINTERN PyObject *_wrap_Vatom_setCharge(PyObject *SWIGUNUSEDPARM(self), PyObj
   int res1 = 0 ;
   double val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:Vatom_setCharge",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vatom, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "Vatom_setCharge", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vatom, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vatom_setCharge" "', argument " "1"" of type '" "Vatom *""'"); 
   }
   arg1 = (Vatom *)(argp1);
-  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Vatom_setCharge" "', argument " "2"" of type '" "double""'");
   } 
@@ -3357,16 +5091,17 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Vatom_getCharge(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Vatom_getCharge(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   Vatom *arg1 = (Vatom *) 0 ;
-  double result;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:Vatom_getCharge",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vatom, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vatom, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vatom_getCharge" "', argument " "1"" of type '" "Vatom *""'"); 
   }
@@ -3379,16 +5114,17 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Vatom_getRadius(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Vatom_getRadius(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   Vatom *arg1 = (Vatom *) 0 ;
-  double result;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:Vatom_getRadius",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vatom, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vatom, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vatom_getRadius" "', argument " "1"" of type '" "Vatom *""'"); 
   }
@@ -3401,34 +5137,34 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_new_MGparm(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN int _wrap_new_MGparm(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
   MGparm *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)":new_MGparm")) SWIG_fail;
-  result = (MGparm *)(MGparm *) calloc(1, sizeof(MGparm));
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_MGparm, SWIG_POINTER_NEW |  0 );
-  return resultobj;
+  if (!SWIG_Python_CheckNoKeywords(kwargs, "new_MGparm")) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "new_MGparm", 0, 0, 0)) SWIG_fail;
+  result = (MGparm *)calloc(1, sizeof(MGparm));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_MGparm, SWIG_BUILTIN_INIT |  0 );
+  return resultobj == Py_None ? -1 : 0;
 fail:
-  return NULL;
+  return -1;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_MGparm(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_MGparm(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   MGparm *arg1 = (MGparm *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_MGparm",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_MGparm, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "delete_MGparm", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_MGparm, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_MGparm" "', argument " "1"" of type '" "MGparm *""'"); 
   }
   arg1 = (MGparm *)(argp1);
   free((char *) arg1);
-  
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -3436,7 +5172,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_MGparm_type_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_MGparm_type_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   MGparm *arg1 = (MGparm *) 0 ;
   MGparm_CalcType arg2 ;
@@ -3444,22 +5180,21 @@ SWIGINTERN PyObject *_wrap_MGparm_type_set(PyObject *SWIGUNUSEDPARM(self), PyObj
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:MGparm_type_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_type_set" "', argument " "1"" of type '" "MGparm *""'"); 
   }
   arg1 = (MGparm *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
   if (!SWIG_IsOK(ecode2)) {
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "MGparm_type_set" "', argument " "2"" of type '" "MGparm_CalcType""'");
   } 
   arg2 = (MGparm_CalcType)(val2);
   if (arg1) (arg1)->type = arg2;
-  
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -3467,16 +5202,16 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_MGparm_type_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_MGparm_type_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   MGparm *arg1 = (MGparm *) 0 ;
-  MGparm_CalcType result;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  MGparm_CalcType result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:MGparm_type_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "MGparm_type_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_type_get" "', argument " "1"" of type '" "MGparm *""'"); 
   }
@@ -3489,14 +5224,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *MGparm_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O|swigregister", &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_MGparm, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_MGparm) /* defines _wrap_delete_MGparm_destructor_closure */
 
-SWIGINTERN PyObject *_wrap_MGparm_setCenterX(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_MGparm_setCenterX(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   MGparm *arg1 = (MGparm *) 0 ;
   double arg2 ;
@@ -3504,16 +5234,15 @@ SWIGINTERN PyObject *_wrap_MGparm_setCenterX(PyObject *SWIGUNUSEDPARM(self), PyO
   int res1 = 0 ;
   double val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:MGparm_setCenterX",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "MGparm_setCenterX", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_setCenterX" "', argument " "1"" of type '" "MGparm *""'"); 
   }
   arg1 = (MGparm *)(argp1);
-  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "MGparm_setCenterX" "', argument " "2"" of type '" "double""'");
   } 
@@ -3526,7 +5255,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_MGparm_setCenterY(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_MGparm_setCenterY(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   MGparm *arg1 = (MGparm *) 0 ;
   double arg2 ;
@@ -3534,16 +5263,15 @@ SWIGINTERN PyObject *_wrap_MGparm_setCenterY(PyObject *SWIGUNUSEDPARM(self), PyO
   int res1 = 0 ;
   double val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:MGparm_setCenterY",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "MGparm_setCenterY", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_setCenterY" "', argument " "1"" of type '" "MGparm *""'"); 
   }
   arg1 = (MGparm *)(argp1);
-  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "MGparm_setCenterY" "', argument " "2"" of type '" "double""'");
   } 
@@ -3556,7 +5284,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_MGparm_setCenterZ(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_MGparm_setCenterZ(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   MGparm *arg1 = (MGparm *) 0 ;
   double arg2 ;
@@ -3564,16 +5292,15 @@ SWIGINTERN PyObject *_wrap_MGparm_setCenterZ(PyObject *SWIGUNUSEDPARM(self), PyO
   int res1 = 0 ;
   double val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:MGparm_setCenterZ",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "MGparm_setCenterZ", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_setCenterZ" "', argument " "1"" of type '" "MGparm *""'"); 
   }
   arg1 = (MGparm *)(argp1);
-  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "MGparm_setCenterZ" "', argument " "2"" of type '" "double""'");
   } 
@@ -3586,34 +5313,172 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_new_PBEparm(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_MGparm_getNx(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  PBEparm *result = 0 ;
+  MGparm *arg1 = (MGparm *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_getNx" "', argument " "1"" of type '" "MGparm *""'"); 
+  }
+  arg1 = (MGparm *)(argp1);
+  result = (int)MGparm_getNx(arg1);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_MGparm_getNy(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  MGparm *arg1 = (MGparm *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_getNy" "', argument " "1"" of type '" "MGparm *""'"); 
+  }
+  arg1 = (MGparm *)(argp1);
+  result = (int)MGparm_getNy(arg1);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_MGparm_getNz(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  MGparm *arg1 = (MGparm *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_getNz" "', argument " "1"" of type '" "MGparm *""'"); 
+  }
+  arg1 = (MGparm *)(argp1);
+  result = (int)MGparm_getNz(arg1);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_MGparm_getHx(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  MGparm *arg1 = (MGparm *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_getHx" "', argument " "1"" of type '" "MGparm *""'"); 
+  }
+  arg1 = (MGparm *)(argp1);
+  result = (double)MGparm_getHx(arg1);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_MGparm_getHy(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  MGparm *arg1 = (MGparm *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_getHy" "', argument " "1"" of type '" "MGparm *""'"); 
+  }
+  arg1 = (MGparm *)(argp1);
+  result = (double)MGparm_getHy(arg1);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_MGparm_getHz(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  MGparm *arg1 = (MGparm *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
   
-  if (!PyArg_ParseTuple(args,(char *)":new_PBEparm")) SWIG_fail;
-  result = (PBEparm *)(PBEparm *) calloc(1, sizeof(PBEparm));
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_PBEparm, SWIG_POINTER_NEW |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_getHz" "', argument " "1"" of type '" "MGparm *""'"); 
+  }
+  arg1 = (MGparm *)(argp1);
+  result = (double)MGparm_getHz(arg1);
+  resultobj = SWIG_From_double((double)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_PBEparm(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN int _wrap_new_PBEparm(PyObject *self, PyObject *args, PyObject *kwargs) {
+  PyObject *resultobj = 0;
+  PBEparm *result = 0 ;
+  
+  if (!SWIG_Python_CheckNoKeywords(kwargs, "new_PBEparm")) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "new_PBEparm", 0, 0, 0)) SWIG_fail;
+  result = (PBEparm *)calloc(1, sizeof(PBEparm));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_PBEparm, SWIG_BUILTIN_INIT |  0 );
+  return resultobj == Py_None ? -1 : 0;
+fail:
+  return -1;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_PBEparm(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   PBEparm *arg1 = (PBEparm *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_PBEparm",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PBEparm, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "delete_PBEparm", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_PBEparm" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
   arg1 = (PBEparm *)(argp1);
   free((char *) arg1);
-  
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -3621,7 +5486,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_PBEparm_temp_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_temp_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   PBEparm *arg1 = (PBEparm *) 0 ;
   double arg2 ;
@@ -3629,22 +5494,21 @@ SWIGINTERN PyObject *_wrap_PBEparm_temp_set(PyObject *SWIGUNUSEDPARM(self), PyOb
   int res1 = 0 ;
   double val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:PBEparm_temp_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_temp_set" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
   arg1 = (PBEparm *)(argp1);
-  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  ecode2 = SWIG_AsVal_double(swig_obj[0], &val2);
   if (!SWIG_IsOK(ecode2)) {
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_temp_set" "', argument " "2"" of type '" "double""'");
   } 
   arg2 = (double)(val2);
   if (arg1) (arg1)->temp = arg2;
-  
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -3652,16 +5516,16 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_PBEparm_temp_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_temp_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   PBEparm *arg1 = (PBEparm *) 0 ;
-  double result;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:PBEparm_temp_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_temp_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_temp_get" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
@@ -3674,7 +5538,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_PBEparm_pdie_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_pdie_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   PBEparm *arg1 = (PBEparm *) 0 ;
   double arg2 ;
@@ -3682,22 +5546,21 @@ SWIGINTERN PyObject *_wrap_PBEparm_pdie_set(PyObject *SWIGUNUSEDPARM(self), PyOb
   int res1 = 0 ;
   double val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:PBEparm_pdie_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_pdie_set" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
   arg1 = (PBEparm *)(argp1);
-  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  ecode2 = SWIG_AsVal_double(swig_obj[0], &val2);
   if (!SWIG_IsOK(ecode2)) {
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_pdie_set" "', argument " "2"" of type '" "double""'");
   } 
   arg2 = (double)(val2);
   if (arg1) (arg1)->pdie = arg2;
-  
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -3705,16 +5568,16 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_PBEparm_pdie_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_pdie_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   PBEparm *arg1 = (PBEparm *) 0 ;
-  double result;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:PBEparm_pdie_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_pdie_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_pdie_get" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
@@ -3727,7 +5590,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_PBEparm_sdie_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_sdie_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   PBEparm *arg1 = (PBEparm *) 0 ;
   double arg2 ;
@@ -3735,22 +5598,21 @@ SWIGINTERN PyObject *_wrap_PBEparm_sdie_set(PyObject *SWIGUNUSEDPARM(self), PyOb
   int res1 = 0 ;
   double val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:PBEparm_sdie_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_sdie_set" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
   arg1 = (PBEparm *)(argp1);
-  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  ecode2 = SWIG_AsVal_double(swig_obj[0], &val2);
   if (!SWIG_IsOK(ecode2)) {
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_sdie_set" "', argument " "2"" of type '" "double""'");
   } 
   arg2 = (double)(val2);
   if (arg1) (arg1)->sdie = arg2;
-  
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -3758,16 +5620,16 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_PBEparm_sdie_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_sdie_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   PBEparm *arg1 = (PBEparm *) 0 ;
-  double result;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:PBEparm_sdie_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_sdie_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_sdie_get" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
@@ -3780,7 +5642,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_PBEparm_molid_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_molid_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   PBEparm *arg1 = (PBEparm *) 0 ;
   int arg2 ;
@@ -3788,22 +5650,21 @@ SWIGINTERN PyObject *_wrap_PBEparm_molid_set(PyObject *SWIGUNUSEDPARM(self), PyO
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:PBEparm_molid_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_molid_set" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
   arg1 = (PBEparm *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
   if (!SWIG_IsOK(ecode2)) {
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_molid_set" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = (int)(val2);
   if (arg1) (arg1)->molid = arg2;
-  
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -3811,16 +5672,16 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_PBEparm_molid_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_molid_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   PBEparm *arg1 = (PBEparm *) 0 ;
-  int result;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:PBEparm_molid_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_molid_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_molid_get" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
@@ -3833,92 +5694,103 @@ fail:
 }
 
 
-SWIGINTERN PyObject *PBEparm_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O|swigregister", &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_PBEparm, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
-
-SWIGINTERN PyObject *_wrap_new_Vcom(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_bcfl_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vcom *result = 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)":new_Vcom")) SWIG_fail;
-  result = (Vcom *)(Vcom *) calloc(1, sizeof(Vcom));
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vcom, SWIG_POINTER_NEW |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_bcfl_set" "', argument " "1"" of type '" "PBEparm *""'"); 
+  }
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_bcfl_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->bcfl = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_Vcom(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_bcfl_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vcom *arg1 = (Vcom *) 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_Vcom",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vcom, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_bcfl_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Vcom" "', argument " "1"" of type '" "Vcom *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_bcfl_get" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg1 = (Vcom *)(argp1);
-  free((char *) arg1);
-  
-  resultobj = SWIG_Py_Void();
+  arg1 = (PBEparm *)(argp1);
+  result = (int) ((arg1)->bcfl);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *Vcom_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O|swigregister", &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_Vcom, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
-
-SWIGINTERN PyObject *_wrap_Vcom_ctor(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_pbetype_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  int arg1 ;
-  Vcom *result = 0 ;
-  int val1 ;
-  int ecode1 = 0 ;
-  PyObject * obj0 = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:Vcom_ctor",&obj0)) SWIG_fail;
-  ecode1 = SWIG_AsVal_int(obj0, &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "Vcom_ctor" "', argument " "1"" of type '" "int""'");
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_pbetype_set" "', argument " "1"" of type '" "PBEparm *""'"); 
+  }
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_pbetype_set" "', argument " "2"" of type '" "int""'");
   } 
-  arg1 = (int)(val1);
-  result = (Vcom *)Vcom_ctor(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vcom, 0 |  0 );
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->pbetype = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Vcom_size(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_pbetype_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vcom *arg1 = (Vcom *) 0 ;
-  int result;
+  PBEparm *arg1 = (PBEparm *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:Vcom_size",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_pbetype_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vcom_size" "', argument " "1"" of type '" "Vcom *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_pbetype_get" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg1 = (Vcom *)(argp1);
-  result = (int)Vcom_size(arg1);
+  arg1 = (PBEparm *)(argp1);
+  result = (int) ((arg1)->pbetype);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -3926,56 +5798,81 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Vcom_rank(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_nion_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vcom *arg1 = (Vcom *) 0 ;
-  int result;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:Vcom_rank",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vcom_rank" "', argument " "1"" of type '" "Vcom *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_nion_set" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg1 = (Vcom *)(argp1);
-  result = (int)Vcom_rank(arg1);
-  resultobj = SWIG_From_int((int)(result));
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_nion_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->nion = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_new_Vmem(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_nion_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vmem *result = 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)":new_Vmem")) SWIG_fail;
-  result = (Vmem *)(Vmem *) calloc(1, sizeof(Vmem));
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vmem, SWIG_POINTER_NEW |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_nion_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_nion_get" "', argument " "1"" of type '" "PBEparm *""'"); 
+  }
+  arg1 = (PBEparm *)(argp1);
+  result = (int) ((arg1)->nion);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_Vmem(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_srfm_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vmem *arg1 = (Vmem *) 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_Vmem",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vmem, SWIG_POINTER_DISOWN |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Vmem" "', argument " "1"" of type '" "Vmem *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_srfm_set" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg1 = (Vmem *)(argp1);
-  free((char *) arg1);
-  
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_srfm_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->srfm = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -3983,66 +5880,51 @@ fail:
 }
 
 
-SWIGINTERN PyObject *Vmem_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O|swigregister", &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_Vmem, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
-
-SWIGINTERN PyObject *_wrap_Vmem_ctor(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_srfm_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  char *arg1 = (char *) 0 ;
-  Vmem *result = 0 ;
-  int res1 ;
-  char *buf1 = 0 ;
-  int alloc1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:Vmem_ctor",&obj0)) SWIG_fail;
-  res1 = SWIG_AsCharPtrAndSize(obj0, &buf1, NULL, &alloc1);
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_srfm_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vmem_ctor" "', argument " "1"" of type '" "char *""'");
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_srfm_get" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg1 = (char *)(buf1);
-  result = (Vmem *)Vmem_ctor(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vmem, 0 |  0 );
-  if (alloc1 == SWIG_NEWOBJ) free((char*)buf1);
-  return resultobj;
-fail:
-  if (alloc1 == SWIG_NEWOBJ) free((char*)buf1);
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_new_Vpmg(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  Vpmg *result = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)":new_Vpmg")) SWIG_fail;
-  result = (Vpmg *)(Vpmg *) calloc(1, sizeof(Vpmg));
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vpmg, SWIG_POINTER_NEW |  0 );
+  arg1 = (PBEparm *)(argp1);
+  result = (int) ((arg1)->srfm);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_Vpmg(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_srad_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vpmg *arg1 = (Vpmg *) 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_Vpmg",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vpmg, SWIG_POINTER_DISOWN |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Vpmg" "', argument " "1"" of type '" "Vpmg *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_srad_set" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg1 = (Vpmg *)(argp1);
-  free((char *) arg1);
-  
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_srad_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->srad = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -4050,41 +5932,51 @@ fail:
 }
 
 
-SWIGINTERN PyObject *Vpmg_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O|swigregister", &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_Vpmg, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
-
-SWIGINTERN PyObject *_wrap_new_Vpbe(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_srad_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vpbe *result = 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
   
-  if (!PyArg_ParseTuple(args,(char *)":new_Vpbe")) SWIG_fail;
-  result = (Vpbe *)(Vpbe *) calloc(1, sizeof(Vpbe));
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vpbe, SWIG_POINTER_NEW |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_srad_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_srad_get" "', argument " "1"" of type '" "PBEparm *""'"); 
+  }
+  arg1 = (PBEparm *)(argp1);
+  result = (double) ((arg1)->srad);
+  resultobj = SWIG_From_double((double)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_Vpbe(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_swin_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vpbe *arg1 = (Vpbe *) 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_Vpbe",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vpbe, SWIG_POINTER_DISOWN |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Vpbe" "', argument " "1"" of type '" "Vpbe *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_swin_set" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg1 = (Vpbe *)(argp1);
-  free((char *) arg1);
-  
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_swin_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->swin = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -4092,94 +5984,103 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Vpbe_acc_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_swin_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vpbe *arg1 = (Vpbe *) 0 ;
-  Vacc *arg2 = (Vacc *) 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:Vpbe_acc_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vpbe, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_swin_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vpbe_acc_set" "', argument " "1"" of type '" "Vpbe *""'"); 
-  }
-  arg1 = (Vpbe *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_Vacc, SWIG_POINTER_DISOWN |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Vpbe_acc_set" "', argument " "2"" of type '" "Vacc *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_swin_get" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg2 = (Vacc *)(argp2);
-  if (arg1) (arg1)->acc = arg2;
-  
-  resultobj = SWIG_Py_Void();
+  arg1 = (PBEparm *)(argp1);
+  result = (double) ((arg1)->swin);
+  resultobj = SWIG_From_double((double)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Vpbe_acc_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_sdens_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vpbe *arg1 = (Vpbe *) 0 ;
-  Vacc *result = 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:Vpbe_acc_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vpbe, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vpbe_acc_get" "', argument " "1"" of type '" "Vpbe *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_sdens_set" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg1 = (Vpbe *)(argp1);
-  result = (Vacc *) ((arg1)->acc);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vacc, 0 |  0 );
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_sdens_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->sdens = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *Vpbe_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O|swigregister", &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_Vpbe, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
-
-SWIGINTERN PyObject *_wrap_new_NOsh_calc(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_sdens_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh_calc *result = 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
   
-  if (!PyArg_ParseTuple(args,(char *)":new_NOsh_calc")) SWIG_fail;
-  result = (NOsh_calc *)(NOsh_calc *) calloc(1, sizeof(NOsh_calc));
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_NOsh_calc, SWIG_POINTER_NEW |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_sdens_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_sdens_get" "', argument " "1"" of type '" "PBEparm *""'"); 
+  }
+  arg1 = (PBEparm *)(argp1);
+  result = (double) ((arg1)->sdens);
+  resultobj = SWIG_From_double((double)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_NOsh_calc(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_calcenergy_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_NOsh_calc",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh_calc, SWIG_POINTER_DISOWN |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_NOsh_calc" "', argument " "1"" of type '" "NOsh_calc *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_calcenergy_set" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg1 = (NOsh_calc *)(argp1);
-  free((char *) arg1);
-  
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_calcenergy_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->calcenergy = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -4187,390 +6088,399 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_calc_mgparm_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_calcenergy_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
-  MGparm *arg2 = (MGparm *) 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_calc_mgparm_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_calcenergy_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_mgparm_set" "', argument " "1"" of type '" "NOsh_calc *""'"); 
-  }
-  arg1 = (NOsh_calc *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_MGparm, SWIG_POINTER_DISOWN |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "NOsh_calc_mgparm_set" "', argument " "2"" of type '" "MGparm *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_calcenergy_get" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg2 = (MGparm *)(argp2);
-  if (arg1) (arg1)->mgparm = arg2;
-  
-  resultobj = SWIG_Py_Void();
+  arg1 = (PBEparm *)(argp1);
+  result = (int) ((arg1)->calcenergy);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_calc_mgparm_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_calcforce_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
-  MGparm *result = 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:NOsh_calc_mgparm_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_mgparm_get" "', argument " "1"" of type '" "NOsh_calc *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_calcforce_set" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg1 = (NOsh_calc *)(argp1);
-  result = (MGparm *) ((arg1)->mgparm);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_MGparm, 0 |  0 );
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_calcforce_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->calcforce = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_calc_femparm_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_calcforce_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
-  FEMparm *arg2 = (FEMparm *) 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_calc_femparm_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_calcforce_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_femparm_set" "', argument " "1"" of type '" "NOsh_calc *""'"); 
-  }
-  arg1 = (NOsh_calc *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_FEMparm, SWIG_POINTER_DISOWN |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "NOsh_calc_femparm_set" "', argument " "2"" of type '" "FEMparm *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_calcforce_get" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg2 = (FEMparm *)(argp2);
-  if (arg1) (arg1)->femparm = arg2;
-  
-  resultobj = SWIG_Py_Void();
+  arg1 = (PBEparm *)(argp1);
+  result = (int) ((arg1)->calcforce);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_calc_femparm_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_PBEparm) /* defines _wrap_delete_PBEparm_destructor_closure */
+
+SWIGINTERN PyObject *_wrap_PBEparm_getIonCharge(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
-  FEMparm *result = 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  double result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:NOsh_calc_femparm_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_getIonCharge", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_femparm_get" "', argument " "1"" of type '" "NOsh_calc *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_getIonCharge" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg1 = (NOsh_calc *)(argp1);
-  result = (FEMparm *) ((arg1)->femparm);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_FEMparm, 0 |  0 );
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_getIonCharge" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (double)PBEparm_getIonCharge(arg1,arg2);
+  resultobj = SWIG_From_double((double)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_calc_pbeparm_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_getIonConc(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
-  PBEparm *arg2 = (PBEparm *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_calc_pbeparm_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_pbeparm_set" "', argument " "1"" of type '" "NOsh_calc *""'"); 
-  }
-  arg1 = (NOsh_calc *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_PBEparm, SWIG_POINTER_DISOWN |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "NOsh_calc_pbeparm_set" "', argument " "2"" of type '" "PBEparm *""'"); 
-  }
-  arg2 = (PBEparm *)(argp2);
-  if (arg1) (arg1)->pbeparm = arg2;
-  
-  resultobj = SWIG_Py_Void();
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_NOsh_calc_pbeparm_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
-  PBEparm *result = 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  double result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:NOsh_calc_pbeparm_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_getIonConc", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_pbeparm_get" "', argument " "1"" of type '" "NOsh_calc *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_getIonConc" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg1 = (NOsh_calc *)(argp1);
-  result = (PBEparm *) ((arg1)->pbeparm);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_PBEparm, 0 |  0 );
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_getIonConc" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (double)PBEparm_getIonConc(arg1,arg2);
+  resultobj = SWIG_From_double((double)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_calc_calctype_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_getIonRadius(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
   int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
+  double result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_calc_calctype_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_getIonRadius", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_calctype_set" "', argument " "1"" of type '" "NOsh_calc *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_getIonRadius" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg1 = (NOsh_calc *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_calc_calctype_set" "', argument " "2"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_getIonRadius" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = (int)(val2);
-  if (arg1) (arg1)->calctype = arg2;
-  
-  resultobj = SWIG_Py_Void();
+  result = (double)PBEparm_getIonRadius(arg1,arg2);
+  resultobj = SWIG_From_double((double)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_calc_calctype_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN int _wrap_new_Vcom(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
-  int result;
+  Vcom *result = 0 ;
+  
+  if (!SWIG_Python_CheckNoKeywords(kwargs, "new_Vcom")) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "new_Vcom", 0, 0, 0)) SWIG_fail;
+  result = (Vcom *)calloc(1, sizeof(Vcom));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vcom, SWIG_BUILTIN_INIT |  0 );
+  return resultobj == Py_None ? -1 : 0;
+fail:
+  return -1;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_Vcom(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vcom *arg1 = (Vcom *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:NOsh_calc_calctype_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "delete_Vcom", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Vcom, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_calctype_get" "', argument " "1"" of type '" "NOsh_calc *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Vcom" "', argument " "1"" of type '" "Vcom *""'"); 
   }
-  arg1 = (NOsh_calc *)(argp1);
-  result = (int) ((arg1)->calctype);
-  resultobj = SWIG_From_int((int)(result));
+  arg1 = (Vcom *)(argp1);
+  free((char *) arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *NOsh_calc_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O|swigregister", &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_NOsh_calc, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_Vcom) /* defines _wrap_delete_Vcom_destructor_closure */
 
-SWIGINTERN PyObject *_wrap_new_NOsh(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Vcom_ctor(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *result = 0 ;
+  int arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  Vcom *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)":new_NOsh")) SWIG_fail;
-  result = (NOsh *)(NOsh *) calloc(1, sizeof(NOsh));
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_NOsh, SWIG_POINTER_NEW |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "Vcom_ctor" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  result = (Vcom *)Vcom_ctor(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vcom, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_NOsh(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Vcom_size(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
+  Vcom *arg1 = (Vcom *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_NOsh",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, SWIG_POINTER_DISOWN |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_NOsh" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vcom_size" "', argument " "1"" of type '" "Vcom *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  free((char *) arg1);
-  
-  resultobj = SWIG_Py_Void();
+  arg1 = (Vcom *)(argp1);
+  result = (int)Vcom_size(arg1);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_ncalc_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Vcom_rank(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  int arg2 ;
+  Vcom *arg1 = (Vcom *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_ncalc_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_ncalc_set" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vcom_rank" "', argument " "1"" of type '" "Vcom *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_ncalc_set" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = (int)(val2);
-  if (arg1) (arg1)->ncalc = arg2;
-  
-  resultobj = SWIG_Py_Void();
+  arg1 = (Vcom *)(argp1);
+  result = (int)Vcom_rank(arg1);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_ncalc_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN int _wrap_new_Vmem(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  int result;
+  Vmem *result = 0 ;
+  
+  if (!SWIG_Python_CheckNoKeywords(kwargs, "new_Vmem")) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "new_Vmem", 0, 0, 0)) SWIG_fail;
+  result = (Vmem *)calloc(1, sizeof(Vmem));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vmem, SWIG_BUILTIN_INIT |  0 );
+  return resultobj == Py_None ? -1 : 0;
+fail:
+  return -1;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_Vmem(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vmem *arg1 = (Vmem *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:NOsh_ncalc_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "delete_Vmem", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Vmem, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_ncalc_get" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Vmem" "', argument " "1"" of type '" "Vmem *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  result = (int) ((arg1)->ncalc);
-  resultobj = SWIG_From_int((int)(result));
+  arg1 = (Vmem *)(argp1);
+  free((char *) arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_nprint_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_Vmem) /* defines _wrap_delete_Vmem_destructor_closure */
+
+SWIGINTERN PyObject *_wrap_Vmem_ctor(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  int arg2 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  char *arg1 = (char *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  PyObject *swig_obj[1] ;
+  Vmem *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_nprint_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_nprint_set" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vmem_ctor" "', argument " "1"" of type '" "char *""'");
   }
-  arg1 = (NOsh *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_nprint_set" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = (int)(val2);
-  if (arg1) (arg1)->nprint = arg2;
-  
-  resultobj = SWIG_Py_Void();
+  arg1 = (char *)(buf1);
+  result = (Vmem *)Vmem_ctor(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vmem, 0 |  0 );
+  if (alloc1 == SWIG_NEWOBJ) free((char*)buf1);
   return resultobj;
 fail:
+  if (alloc1 == SWIG_NEWOBJ) free((char*)buf1);
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_nprint_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN int _wrap_new_Vpmg(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  int result;
+  Vpmg *result = 0 ;
+  
+  if (!SWIG_Python_CheckNoKeywords(kwargs, "new_Vpmg")) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "new_Vpmg", 0, 0, 0)) SWIG_fail;
+  result = (Vpmg *)calloc(1, sizeof(Vpmg));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vpmg, SWIG_BUILTIN_INIT |  0 );
+  return resultobj == Py_None ? -1 : 0;
+fail:
+  return -1;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_Vpmg(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vpmg *arg1 = (Vpmg *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:NOsh_nprint_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "delete_Vpmg", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Vpmg, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_nprint_get" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Vpmg" "', argument " "1"" of type '" "Vpmg *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  result = (int) ((arg1)->nprint);
-  resultobj = SWIG_From_int((int)(result));
+  arg1 = (Vpmg *)(argp1);
+  free((char *) arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_nelec_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Vpmg_iters_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
+  Vpmg *arg1 = (Vpmg *) 0 ;
   int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_nelec_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Vpmg, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_nelec_set" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vpmg_iters_set" "', argument " "1"" of type '" "Vpmg *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  arg1 = (Vpmg *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_nelec_set" "', argument " "2"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Vpmg_iters_set" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = (int)(val2);
-  if (arg1) (arg1)->nelec = arg2;
-  
+  if (arg1) (arg1)->iters = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -4578,21 +6488,21 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_nelec_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Vpmg_iters_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  int result;
+  Vpmg *arg1 = (Vpmg *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:NOsh_nelec_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "Vpmg_iters_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Vpmg, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_nelec_get" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vpmg_iters_get" "', argument " "1"" of type '" "Vpmg *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  result = (int) ((arg1)->nelec);
+  arg1 = (Vpmg *)(argp1);
+  result = (int) ((arg1)->iters);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -4600,30 +6510,29 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_nmol_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Vpmg_ncycle_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
+  Vpmg *arg1 = (Vpmg *) 0 ;
   int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_nmol_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Vpmg, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_nmol_set" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vpmg_ncycle_set" "', argument " "1"" of type '" "Vpmg *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  arg1 = (Vpmg *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_nmol_set" "', argument " "2"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Vpmg_ncycle_set" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = (int)(val2);
-  if (arg1) (arg1)->nmol = arg2;
-  
+  if (arg1) (arg1)->ncycle = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -4631,21 +6540,21 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_nmol_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Vpmg_ncycle_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  int result;
+  Vpmg *arg1 = (Vpmg *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:NOsh_nmol_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "Vpmg_ncycle_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Vpmg, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_nmol_get" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vpmg_ncycle_get" "', argument " "1"" of type '" "Vpmg *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  result = (int) ((arg1)->nmol);
+  arg1 = (Vpmg *)(argp1);
+  result = (int) ((arg1)->ncycle);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -4653,36 +6562,30 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_printwhat_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_Vpmg) /* defines _wrap_delete_Vpmg_destructor_closure */
+
+SWIGINTERN PyObject *_wrap_Vpmg_setGuess(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  NOsh_PrintType *arg2 ;
+  Vpmg *arg1 = (Vpmg *) 0 ;
+  double *arg2 = (double *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_printwhat_set",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "Vpmg_setGuess", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vpmg, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_printwhat_set" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vpmg_setGuess" "', argument " "1"" of type '" "Vpmg *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_NOsh_PrintType, 0 |  0 );
+  arg1 = (Vpmg *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_double, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "NOsh_printwhat_set" "', argument " "2"" of type '" "NOsh_PrintType [NOSH_MAXPRINT]""'"); 
-  } 
-  arg2 = (NOsh_PrintType *)(argp2);
-  {
-    if (arg2) {
-      size_t ii = 0;
-      for (; ii < (size_t)NOSH_MAXPRINT; ++ii) arg1->printwhat[ii] = arg2[ii];
-    } else {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""printwhat""' of type '""NOsh_PrintType [NOSH_MAXPRINT]""'");
-    }
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Vpmg_setGuess" "', argument " "2"" of type '" "double *""'"); 
   }
+  arg2 = (double *)(argp2);
+  Vpmg_setGuess(arg1,arg2);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -4690,252 +6593,257 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_printwhat_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN int _wrap_new_Vpbe(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  NOsh_PrintType *result = 0 ;
+  Vpbe *result = 0 ;
+  
+  if (!SWIG_Python_CheckNoKeywords(kwargs, "new_Vpbe")) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "new_Vpbe", 0, 0, 0)) SWIG_fail;
+  result = (Vpbe *)calloc(1, sizeof(Vpbe));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vpbe, SWIG_BUILTIN_INIT |  0 );
+  return resultobj == Py_None ? -1 : 0;
+fail:
+  return -1;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_Vpbe(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vpbe *arg1 = (Vpbe *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:NOsh_printwhat_get",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "delete_Vpbe", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Vpbe, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_printwhat_get" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Vpbe" "', argument " "1"" of type '" "Vpbe *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  result = (NOsh_PrintType *)(NOsh_PrintType *) ((arg1)->printwhat);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_NOsh_PrintType, 0 |  0 );
+  arg1 = (Vpbe *)(argp1);
+  free((char *) arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *NOsh_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O|swigregister", &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_NOsh, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
-
-SWIGINTERN PyObject *_wrap_NOsh_getCalc(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Vpbe_acc_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  int arg2 ;
-  NOsh_calc *result = 0 ;
+  Vpbe *arg1 = (Vpbe *) 0 ;
+  Vacc *arg2 = (Vacc *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_getCalc",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Vpbe, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_getCalc" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vpbe_acc_set" "', argument " "1"" of type '" "Vpbe *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_getCalc" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = (int)(val2);
-  result = (NOsh_calc *)NOsh_getCalc(arg1,arg2);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_NOsh_calc, 0 |  0 );
+  arg1 = (Vpbe *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_Vacc, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Vpbe_acc_set" "', argument " "2"" of type '" "Vacc *""'"); 
+  }
+  arg2 = (Vacc *)(argp2);
+  if (arg1) (arg1)->acc = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_elecname(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Vpbe_acc_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  int arg2 ;
-  char *result = 0 ;
+  Vpbe *arg1 = (Vpbe *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[1] ;
+  Vacc *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_elecname",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "Vpbe_acc_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Vpbe, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_elecname" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vpbe_acc_get" "', argument " "1"" of type '" "Vpbe *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_elecname" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = (int)(val2);
-  result = (char *)NOsh_elecname(arg1,arg2);
-  resultobj = SWIG_FromCharPtr((const char *)result);
+  arg1 = (Vpbe *)(argp1);
+  result = (Vacc *) ((arg1)->acc);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vacc, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_elec2calc(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_Vpbe) /* defines _wrap_delete_Vpbe_destructor_closure */
+
+SWIGINTERN int _wrap_new_NOsh_calc(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  int arg2 ;
-  int result;
+  NOsh_calc *result = 0 ;
+  
+  if (!SWIG_Python_CheckNoKeywords(kwargs, "new_NOsh_calc")) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "new_NOsh_calc", 0, 0, 0)) SWIG_fail;
+  result = (NOsh_calc *)calloc(1, sizeof(NOsh_calc));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_NOsh_calc, SWIG_BUILTIN_INIT |  0 );
+  return resultobj == Py_None ? -1 : 0;
+fail:
+  return -1;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_NOsh_calc(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_elec2calc",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "delete_NOsh_calc", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh_calc, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_elec2calc" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_NOsh_calc" "', argument " "1"" of type '" "NOsh_calc *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_elec2calc" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = (int)(val2);
-  result = (int)NOsh_elec2calc(arg1,arg2);
-  resultobj = SWIG_From_int((int)(result));
+  arg1 = (NOsh_calc *)(argp1);
+  free((char *) arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_printWhat(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_calc_mgparm_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  int arg2 ;
-  NOsh_PrintType result;
+  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
+  MGparm *arg2 = (MGparm *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_printWhat",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_printWhat" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_mgparm_set" "', argument " "1"" of type '" "NOsh_calc *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_printWhat" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = (int)(val2);
-  result = (NOsh_PrintType)NOsh_printWhat(arg1,arg2);
-  resultobj = SWIG_From_int((int)(result));
+  arg1 = (NOsh_calc *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_MGparm, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "NOsh_calc_mgparm_set" "', argument " "2"" of type '" "MGparm *""'"); 
+  }
+  arg2 = (MGparm *)(argp2);
+  if (arg1) (arg1)->mgparm = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_parseInputFile(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_calc_mgparm_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  char *arg2 = (char *) 0 ;
-  int result;
+  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int res2 ;
-  char *buf2 = 0 ;
-  int alloc2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[1] ;
+  MGparm *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_parseInputFile",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_calc_mgparm_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_parseInputFile" "', argument " "1"" of type '" "NOsh *""'"); 
-  }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_AsCharPtrAndSize(obj1, &buf2, NULL, &alloc2);
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "NOsh_parseInputFile" "', argument " "2"" of type '" "char *""'");
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_mgparm_get" "', argument " "1"" of type '" "NOsh_calc *""'"); 
   }
-  arg2 = (char *)(buf2);
-  result = (int)NOsh_parseInputFile(arg1,arg2);
-  resultobj = SWIG_From_int((int)(result));
-  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  arg1 = (NOsh_calc *)(argp1);
+  result = (MGparm *) ((arg1)->mgparm);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_MGparm, 0 |  0 );
   return resultobj;
 fail:
-  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_ctor(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_calc_femparm_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  int arg1 ;
-  int arg2 ;
-  NOsh *result = 0 ;
-  int val1 ;
-  int ecode1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
+  FEMparm *arg2 = (FEMparm *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_ctor",&obj0,&obj1)) SWIG_fail;
-  ecode1 = SWIG_AsVal_int(obj0, &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "NOsh_ctor" "', argument " "1"" of type '" "int""'");
-  } 
-  arg1 = (int)(val1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_ctor" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = (int)(val2);
-  result = (NOsh *)NOsh_ctor(arg1,arg2);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_femparm_set" "', argument " "1"" of type '" "NOsh_calc *""'"); 
+  }
+  arg1 = (NOsh_calc *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_FEMparm, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "NOsh_calc_femparm_set" "', argument " "2"" of type '" "FEMparm *""'"); 
+  }
+  arg2 = (FEMparm *)(argp2);
+  if (arg1) (arg1)->femparm = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_new_AtomForce(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_calc_femparm_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  AtomForce *result = 0 ;
+  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  FEMparm *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)":new_AtomForce")) SWIG_fail;
-  result = (AtomForce *)(AtomForce *) calloc(1, sizeof(AtomForce));
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_AtomForce, SWIG_POINTER_NEW |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_calc_femparm_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_femparm_get" "', argument " "1"" of type '" "NOsh_calc *""'"); 
+  }
+  arg1 = (NOsh_calc *)(argp1);
+  result = (FEMparm *) ((arg1)->femparm);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_FEMparm, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_AtomForce(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_calc_pbeparm_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  AtomForce *arg1 = (AtomForce *) 0 ;
+  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
+  PBEparm *arg2 = (PBEparm *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_AtomForce",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_AtomForce, SWIG_POINTER_DISOWN |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_AtomForce" "', argument " "1"" of type '" "AtomForce *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_pbeparm_set" "', argument " "1"" of type '" "NOsh_calc *""'"); 
   }
-  arg1 = (AtomForce *)(argp1);
-  free((char *) arg1);
-  
+  arg1 = (NOsh_calc *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_PBEparm, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "NOsh_calc_pbeparm_set" "', argument " "2"" of type '" "PBEparm *""'"); 
+  }
+  arg2 = (PBEparm *)(argp2);
+  if (arg1) (arg1)->pbeparm = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -4943,273 +6851,244 @@ fail:
 }
 
 
-SWIGINTERN PyObject *AtomForce_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O|swigregister", &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_AtomForce, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
-
-SWIGINTERN PyObject *_wrap_new_valist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_calc_pbeparm_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  int arg1 ;
-  Valist **result = 0 ;
-  int val1 ;
-  int ecode1 = 0 ;
-  PyObject * obj0 = 0 ;
+  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  PBEparm *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:new_valist",&obj0)) SWIG_fail;
-  ecode1 = SWIG_AsVal_int(obj0, &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_valist" "', argument " "1"" of type '" "int""'");
-  } 
-  arg1 = (int)(val1);
-  result = (Valist **)new_valist(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_Valist, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_calc_pbeparm_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_pbeparm_get" "', argument " "1"" of type '" "NOsh_calc *""'"); 
+  }
+  arg1 = (NOsh_calc *)(argp1);
+  result = (PBEparm *) ((arg1)->pbeparm);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_PBEparm, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_get_Valist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_calc_calctype_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Valist **arg1 = (Valist **) 0 ;
+  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
   int arg2 ;
-  Valist *result = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:get_Valist",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_p_Valist, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "get_Valist" "', argument " "1"" of type '" "Valist **""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_calctype_set" "', argument " "1"" of type '" "NOsh_calc *""'"); 
   }
-  arg1 = (Valist **)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  arg1 = (NOsh_calc *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "get_Valist" "', argument " "2"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_calc_calctype_set" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = (int)(val2);
-  result = (Valist *)get_Valist(arg1,arg2);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Valist, 0 |  0 );
+  if (arg1) (arg1)->calctype = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_new_gridlist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_calc_calctype_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  int arg1 ;
-  Vgrid **result = 0 ;
-  int val1 ;
-  int ecode1 = 0 ;
-  PyObject * obj0 = 0 ;
+  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:new_gridlist",&obj0)) SWIG_fail;
-  ecode1 = SWIG_AsVal_int(obj0, &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_gridlist" "', argument " "1"" of type '" "int""'");
-  } 
-  arg1 = (int)(val1);
-  result = (Vgrid **)new_gridlist(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_calc_calctype_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_calc_calctype_get" "', argument " "1"" of type '" "NOsh_calc *""'"); 
+  }
+  arg1 = (NOsh_calc *)(argp1);
+  result = (int) ((arg1)->calctype);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_new_pmglist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_NOsh_calc) /* defines _wrap_delete_NOsh_calc_destructor_closure */
+
+SWIGINTERN int _wrap_new_NOsh(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  int arg1 ;
-  Vpmg **result = 0 ;
-  int val1 ;
-  int ecode1 = 0 ;
-  PyObject * obj0 = 0 ;
+  NOsh *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:new_pmglist",&obj0)) SWIG_fail;
-  ecode1 = SWIG_AsVal_int(obj0, &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_pmglist" "', argument " "1"" of type '" "int""'");
-  } 
-  arg1 = (int)(val1);
-  result = (Vpmg **)new_pmglist(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_Vpmg, 0 |  0 );
-  return resultobj;
+  if (!SWIG_Python_CheckNoKeywords(kwargs, "new_NOsh")) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "new_NOsh", 0, 0, 0)) SWIG_fail;
+  result = (NOsh *)calloc(1, sizeof(NOsh));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_NOsh, SWIG_BUILTIN_INIT |  0 );
+  return resultobj == Py_None ? -1 : 0;
 fail:
-  return NULL;
+  return -1;
 }
 
 
-SWIGINTERN PyObject *_wrap_get_Vpmg(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_NOsh(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vpmg **arg1 = (Vpmg **) 0 ;
-  int arg2 ;
-  Vpmg *result = 0 ;
+  NOsh *arg1 = (NOsh *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:get_Vpmg",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_p_Vpmg, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "delete_NOsh", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "get_Vpmg" "', argument " "1"" of type '" "Vpmg **""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_NOsh" "', argument " "1"" of type '" "NOsh *""'"); 
   }
-  arg1 = (Vpmg **)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "get_Vpmg" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = (int)(val2);
-  result = (Vpmg *)get_Vpmg(arg1,arg2);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vpmg, 0 |  0 );
+  arg1 = (NOsh *)(argp1);
+  free((char *) arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_new_pmgplist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_ncalc_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  int arg1 ;
-  Vpmgp **result = 0 ;
-  int val1 ;
-  int ecode1 = 0 ;
-  PyObject * obj0 = 0 ;
+  NOsh *arg1 = (NOsh *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:new_pmgplist",&obj0)) SWIG_fail;
-  ecode1 = SWIG_AsVal_int(obj0, &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_pmgplist" "', argument " "1"" of type '" "int""'");
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_ncalc_set" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_ncalc_set" "', argument " "2"" of type '" "int""'");
   } 
-  arg1 = (int)(val1);
-  result = (Vpmgp **)new_pmgplist(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_Vpmgp, 0 |  0 );
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->ncalc = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_new_pbelist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_ncalc_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  int arg1 ;
-  Vpbe **result = 0 ;
-  int val1 ;
-  int ecode1 = 0 ;
-  PyObject * obj0 = 0 ;
+  NOsh *arg1 = (NOsh *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:new_pbelist",&obj0)) SWIG_fail;
-  ecode1 = SWIG_AsVal_int(obj0, &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_pbelist" "', argument " "1"" of type '" "int""'");
-  } 
-  arg1 = (int)(val1);
-  result = (Vpbe **)new_pbelist(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_Vpbe, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_ncalc_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_ncalc_get" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  result = (int) ((arg1)->ncalc);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_get_Vpbe(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_nprint_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vpbe **arg1 = (Vpbe **) 0 ;
+  NOsh *arg1 = (NOsh *) 0 ;
   int arg2 ;
-  Vpbe *result = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:get_Vpbe",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_p_Vpbe, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "get_Vpbe" "', argument " "1"" of type '" "Vpbe **""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_nprint_set" "', argument " "1"" of type '" "NOsh *""'"); 
   }
-  arg1 = (Vpbe **)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  arg1 = (NOsh *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "get_Vpbe" "', argument " "2"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_nprint_set" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = (int)(val2);
-  result = (Vpbe *)get_Vpbe(arg1,arg2);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vpbe, 0 |  0 );
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_new_atomforcelist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  int arg1 ;
-  AtomForce **result = 0 ;
-  int val1 ;
-  int ecode1 = 0 ;
-  PyObject * obj0 = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:new_atomforcelist",&obj0)) SWIG_fail;
-  ecode1 = SWIG_AsVal_int(obj0, &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_atomforcelist" "', argument " "1"" of type '" "int""'");
-  } 
-  arg1 = (int)(val1);
-  result = (AtomForce **)new_atomforcelist(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_AtomForce, 0 |  0 );
+  if (arg1) (arg1)->nprint = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_atomforcelist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_nprint_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  AtomForce **arg1 = (AtomForce **) 0 ;
+  NOsh *arg1 = (NOsh *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_atomforcelist",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_p_AtomForce, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_nprint_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_atomforcelist" "', argument " "1"" of type '" "AtomForce **""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_nprint_get" "', argument " "1"" of type '" "NOsh *""'"); 
   }
-  arg1 = (AtomForce **)(argp1);
-  delete_atomforcelist(arg1);
-  resultobj = SWIG_Py_Void();
+  arg1 = (NOsh *)(argp1);
+  result = (int) ((arg1)->nprint);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_valist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_nelec_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Valist **arg1 = (Valist **) 0 ;
+  NOsh *arg1 = (NOsh *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_valist",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_p_Valist, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_valist" "', argument " "1"" of type '" "Valist **""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_nelec_set" "', argument " "1"" of type '" "NOsh *""'"); 
   }
-  arg1 = (Valist **)(argp1);
-  delete_valist(arg1);
+  arg1 = (NOsh *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_nelec_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->nelec = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -5217,41 +7096,51 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_gridlist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_nelec_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vgrid **arg1 = (Vgrid **) 0 ;
+  NOsh *arg1 = (NOsh *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_gridlist",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_nelec_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_gridlist" "', argument " "1"" of type '" "Vgrid **""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_nelec_get" "', argument " "1"" of type '" "NOsh *""'"); 
   }
-  arg1 = (Vgrid **)(argp1);
-  delete_gridlist(arg1);
-  resultobj = SWIG_Py_Void();
+  arg1 = (NOsh *)(argp1);
+  result = (int) ((arg1)->nelec);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_pmglist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_nmol_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vpmg **arg1 = (Vpmg **) 0 ;
+  NOsh *arg1 = (NOsh *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_pmglist",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_p_Vpmg, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_pmglist" "', argument " "1"" of type '" "Vpmg **""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_nmol_set" "', argument " "1"" of type '" "NOsh *""'"); 
   }
-  arg1 = (Vpmg **)(argp1);
-  delete_pmglist(arg1);
+  arg1 = (NOsh *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_nmol_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->nmol = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -5259,41 +7148,58 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_pmgplist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_nmol_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vpmgp **arg1 = (Vpmgp **) 0 ;
+  NOsh *arg1 = (NOsh *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_pmgplist",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_p_Vpmgp, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_nmol_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_pmgplist" "', argument " "1"" of type '" "Vpmgp **""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_nmol_get" "', argument " "1"" of type '" "NOsh *""'"); 
   }
-  arg1 = (Vpmgp **)(argp1);
-  delete_pmgplist(arg1);
-  resultobj = SWIG_Py_Void();
+  arg1 = (NOsh *)(argp1);
+  result = (int) ((arg1)->nmol);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_pbelist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_printwhat_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vpbe **arg1 = (Vpbe **) 0 ;
+  NOsh *arg1 = (NOsh *) 0 ;
+  NOsh_PrintType *arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_pbelist",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_p_Vpbe, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_pbelist" "', argument " "1"" of type '" "Vpbe **""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_printwhat_set" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_NOsh_PrintType, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "NOsh_printwhat_set" "', argument " "2"" of type '" "NOsh_PrintType [NOSH_MAXPRINT]""'"); 
+  } 
+  arg2 = (NOsh_PrintType *)(argp2);
+  {
+    if (arg2) {
+      size_t ii = 0;
+      for (; ii < (size_t)NOSH_MAXPRINT; ++ii) *(NOsh_PrintType *)&arg1->printwhat[ii] = *((NOsh_PrintType *)arg2 + ii);
+    } else {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""printwhat""' of type '""NOsh_PrintType [NOSH_MAXPRINT]""'");
+    }
   }
-  arg1 = (Vpbe **)(argp1);
-  delete_pbelist(arg1);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -5301,730 +7207,703 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_Nosh(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_printwhat_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   NOsh *arg1 = (NOsh *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  NOsh_PrintType *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_Nosh",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_printwhat_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Nosh" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_printwhat_get" "', argument " "1"" of type '" "NOsh *""'"); 
   }
   arg1 = (NOsh *)(argp1);
-  delete_Nosh(arg1);
-  resultobj = SWIG_Py_Void();
+  result = (NOsh_PrintType *)(NOsh_PrintType *) ((arg1)->printwhat);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_NOsh_PrintType, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_Com(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_NOsh) /* defines _wrap_delete_NOsh_destructor_closure */
+
+SWIGINTERN PyObject *_wrap_NOsh_getCalc(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vcom *arg1 = (Vcom *) 0 ;
+  NOsh *arg1 = (NOsh *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  NOsh_calc *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_Com",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_getCalc", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Com" "', argument " "1"" of type '" "Vcom *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_getCalc" "', argument " "1"" of type '" "NOsh *""'"); 
   }
-  arg1 = (Vcom *)(argp1);
-  delete_Com(arg1);
-  resultobj = SWIG_Py_Void();
+  arg1 = (NOsh *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_getCalc" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (NOsh_calc *)NOsh_getCalc(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_NOsh_calc, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_Mem(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_elecname(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vmem *arg1 = (Vmem *) 0 ;
+  NOsh *arg1 = (NOsh *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  char *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_Mem",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vmem, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_elecname", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Mem" "', argument " "1"" of type '" "Vmem *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_elecname" "', argument " "1"" of type '" "NOsh *""'"); 
   }
-  arg1 = (Vmem *)(argp1);
-  delete_Mem(arg1);
-  resultobj = SWIG_Py_Void();
+  arg1 = (NOsh *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_elecname" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (char *)NOsh_elecname(arg1,arg2);
+  resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_get_AtomForce(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_elec2calc(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  AtomForce **arg1 = (AtomForce **) 0 ;
+  NOsh *arg1 = (NOsh *) 0 ;
   int arg2 ;
-  AtomForce **result = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:get_AtomForce",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_p_AtomForce, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_elec2calc", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "get_AtomForce" "', argument " "1"" of type '" "AtomForce **""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_elec2calc" "', argument " "1"" of type '" "NOsh *""'"); 
   }
-  arg1 = (AtomForce **)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  arg1 = (NOsh *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "get_AtomForce" "', argument " "2"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_elec2calc" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = (int)(val2);
-  result = (AtomForce **)get_AtomForce(arg1,arg2);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_AtomForce, 0 |  0 );
+  result = (int)NOsh_elec2calc(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_make_Valist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_printWhat(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Valist **arg1 = (Valist **) 0 ;
+  NOsh *arg1 = (NOsh *) 0 ;
   int arg2 ;
-  Valist *result = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
+  NOsh_PrintType result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:make_Valist",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_p_Valist, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_printWhat", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "make_Valist" "', argument " "1"" of type '" "Valist **""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_printWhat" "', argument " "1"" of type '" "NOsh *""'"); 
   }
-  arg1 = (Valist **)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  arg1 = (NOsh *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "make_Valist" "', argument " "2"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_printWhat" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = (int)(val2);
-  result = (Valist *)make_Valist(arg1,arg2);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Valist, 0 |  0 );
+  result = (NOsh_PrintType)NOsh_printWhat(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_remove_Valist(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_parseInputFile(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Valist *arg1 = (Valist *) 0 ;
+  NOsh *arg1 = (NOsh *) 0 ;
+  char *arg2 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:remove_Valist",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Valist, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_parseInputFile", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "remove_Valist" "', argument " "1"" of type '" "Valist *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_parseInputFile" "', argument " "1"" of type '" "NOsh *""'"); 
   }
-  arg1 = (Valist *)(argp1);
-  remove_Valist(arg1);
-  resultobj = SWIG_Py_Void();
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "NOsh_parseInputFile" "', argument " "2"" of type '" "char *""'");
+  }
+  arg2 = (char *)(buf2);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)NOsh_parseInputFile(arg1,arg2);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
   return resultobj;
 fail:
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_double_array(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_NOsh_ctor(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   int arg1 ;
-  double *result = 0 ;
+  int arg2 ;
   int val1 ;
   int ecode1 = 0 ;
-  PyObject * obj0 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  NOsh *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:double_array",&obj0)) SWIG_fail;
-  ecode1 = SWIG_AsVal_int(obj0, &val1);
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_ctor", 2, 2, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
   if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "double_array" "', argument " "1"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "NOsh_ctor" "', argument " "1"" of type '" "int""'");
   } 
   arg1 = (int)(val1);
-  result = (double *)double_array(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_double, 0 |  0 );
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "NOsh_ctor" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (NOsh *)NOsh_ctor(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_NOsh, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN int _wrap_new_AtomForce(PyObject *self, PyObject *args, PyObject *kwargs) {
+  PyObject *resultobj = 0;
+  AtomForce *result = 0 ;
+  
+  if (!SWIG_Python_CheckNoKeywords(kwargs, "new_AtomForce")) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "new_AtomForce", 0, 0, 0)) SWIG_fail;
+  result = (AtomForce *)calloc(1, sizeof(AtomForce));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_AtomForce, SWIG_BUILTIN_INIT |  0 );
+  return resultobj == Py_None ? -1 : 0;
+fail:
+  return -1;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_AtomForce(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  AtomForce *arg1 = (AtomForce *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "delete_AtomForce", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_AtomForce, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_AtomForce" "', argument " "1"" of type '" "AtomForce *""'"); 
+  }
+  arg1 = (AtomForce *)(argp1);
+  free((char *) arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_int_array(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_AtomForce) /* defines _wrap_delete_AtomForce_destructor_closure */
+
+SWIGINTERN PyObject *_wrap_new_valist(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   int arg1 ;
-  int *result = 0 ;
   int val1 ;
   int ecode1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
+  Valist **result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:int_array",&obj0)) SWIG_fail;
-  ecode1 = SWIG_AsVal_int(obj0, &val1);
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
   if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "int_array" "', argument " "1"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_valist" "', argument " "1"" of type '" "int""'");
   } 
   arg1 = (int)(val1);
-  result = (int *)int_array(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_int, 0 |  0 );
+  result = (Valist **)new_valist(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_Valist, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_double_array(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_get_Valist(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  double *arg1 = (double *) 0 ;
+  Valist **arg1 = (Valist **) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  Valist *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_double_array",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "get_Valist", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_Valist, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_double_array" "', argument " "1"" of type '" "double *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "get_Valist" "', argument " "1"" of type '" "Valist **""'"); 
   }
-  arg1 = (double *)(argp1);
-  delete_double_array(arg1);
-  resultobj = SWIG_Py_Void();
+  arg1 = (Valist **)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "get_Valist" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (Valist *)get_Valist(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Valist, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_int_array(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_new_gridlist(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  int *arg1 = (int *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  int arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  Vgrid **result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_int_array",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_int, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_int_array" "', argument " "1"" of type '" "int *""'"); 
-  }
-  arg1 = (int *)(argp1);
-  delete_int_array(arg1);
-  resultobj = SWIG_Py_Void();
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_gridlist" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  result = (Vgrid **)new_gridlist(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_Vgrid, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_get_entry(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_get_Vgrid(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  double *arg1 = (double *) 0 ;
+  Vgrid **arg1 = (Vgrid **) 0 ;
   int arg2 ;
-  double result;
   void *argp1 = 0 ;
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[2] ;
+  Vgrid *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:get_entry",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "get_Vgrid", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_Vgrid, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "get_entry" "', argument " "1"" of type '" "double *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "get_Vgrid" "', argument " "1"" of type '" "Vgrid **""'"); 
   }
-  arg1 = (double *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  arg1 = (Vgrid **)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "get_entry" "', argument " "2"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "get_Vgrid" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = (int)(val2);
-  result = (double)get_entry(arg1,arg2);
-  resultobj = SWIG_From_double((double)(result));
+  result = (Vgrid *)get_Vgrid(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vgrid, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_set_entry(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_new_pmglist(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  double *arg1 = (double *) 0 ;
+  int arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  Vpmg **result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_pmglist" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  result = (Vpmg **)new_pmglist(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_Vpmg, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_get_Vpmg(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vpmg **arg1 = (Vpmg **) 0 ;
   int arg2 ;
-  double arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  double val3 ;
-  int ecode3 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
+  PyObject *swig_obj[2] ;
+  Vpmg *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:set_entry",&obj0,&obj1,&obj2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "get_Vpmg", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_Vpmg, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "set_entry" "', argument " "1"" of type '" "double *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "get_Vpmg" "', argument " "1"" of type '" "Vpmg **""'"); 
   }
-  arg1 = (double *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  arg1 = (Vpmg **)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "set_entry" "', argument " "2"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "get_Vpmg" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = (int)(val2);
-  ecode3 = SWIG_AsVal_double(obj2, &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "set_entry" "', argument " "3"" of type '" "double""'");
+  result = (Vpmg *)get_Vpmg(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vpmg, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_pmgplist(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  Vpmgp **result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_pmgplist" "', argument " "1"" of type '" "int""'");
   } 
-  arg3 = (double)(val3);
-  set_entry(arg1,arg2,arg3);
-  resultobj = SWIG_Py_Void();
+  arg1 = (int)(val1);
+  result = (Vpmgp **)new_pmgplist(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_Vpmgp, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_parseInputFromString(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_new_pbelist(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  PyObject *arg2 = (PyObject *) 0 ;
-  int result;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  int arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  Vpbe **result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:parseInputFromString",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "parseInputFromString" "', argument " "1"" of type '" "NOsh *""'"); 
-  }
-  arg1 = (NOsh *)(argp1);
-  arg2 = obj1;
-  result = (int)parseInputFromString(arg1,arg2);
-  resultobj = SWIG_From_int((int)(result));
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_pbelist" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  result = (Vpbe **)new_pbelist(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_Vpbe, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Valist_load(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_get_Vpbe(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Valist *arg1 = (Valist *) 0 ;
+  Vpbe **arg1 = (Vpbe **) 0 ;
   int arg2 ;
-  PyObject *arg3 = (PyObject *) 0 ;
-  PyObject *arg4 = (PyObject *) 0 ;
-  PyObject *arg5 = (PyObject *) 0 ;
-  PyObject *arg6 = (PyObject *) 0 ;
-  PyObject *arg7 = (PyObject *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
-  PyObject * obj4 = 0 ;
-  PyObject * obj5 = 0 ;
-  PyObject * obj6 = 0 ;
+  PyObject *swig_obj[2] ;
+  Vpbe *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOOOOO:Valist_load",&obj0,&obj1,&obj2,&obj3,&obj4,&obj5,&obj6)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Valist, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "get_Vpbe", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_Vpbe, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Valist_load" "', argument " "1"" of type '" "Valist *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "get_Vpbe" "', argument " "1"" of type '" "Vpbe **""'"); 
   }
-  arg1 = (Valist *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  arg1 = (Vpbe **)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Valist_load" "', argument " "2"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "get_Vpbe" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = (int)(val2);
-  arg3 = obj2;
-  arg4 = obj3;
-  arg5 = obj4;
-  arg6 = obj5;
-  arg7 = obj6;
-  Valist_load(arg1,arg2,arg3,arg4,arg5,arg6,arg7);
-  resultobj = SWIG_Py_Void();
+  result = (Vpbe *)get_Vpbe(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vpbe, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_setupElecCalc(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_new_atomforcelist(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  Valist **arg2 ;
-  int result;
+  int arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  AtomForce **result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_atomforcelist" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  result = (AtomForce **)new_atomforcelist(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_AtomForce, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_atomforcelist(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  AtomForce **arg1 = (AtomForce **) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_setupElecCalc",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_AtomForce, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_setupElecCalc" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_atomforcelist" "', argument " "1"" of type '" "AtomForce **""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_p_Valist, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "NOsh_setupElecCalc" "', argument " "2"" of type '" "Valist *[NOSH_MAXMOL]""'"); 
-  } 
-  arg2 = (Valist **)(argp2);
-  result = (int)NOsh_setupElecCalc(arg1,arg2);
-  resultobj = SWIG_From_int((int)(result));
+  arg1 = (AtomForce **)(argp1);
+  delete_atomforcelist(arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_NOsh_setupApolCalc(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_valist(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  Valist **arg2 ;
-  int result;
+  Valist **arg1 = (Valist **) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:NOsh_setupApolCalc",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_Valist, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_setupApolCalc" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_valist" "', argument " "1"" of type '" "Valist **""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_p_Valist, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "NOsh_setupApolCalc" "', argument " "2"" of type '" "Valist *[NOSH_MAXMOL]""'"); 
-  } 
-  arg2 = (Valist **)(argp2);
-  result = (int)NOsh_setupApolCalc(arg1,arg2);
-  resultobj = SWIG_From_int((int)(result));
+  arg1 = (Valist **)(argp1);
+  delete_valist(arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_wrap_forceMG(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_gridlist(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vmem *arg1 = (Vmem *) 0 ;
-  NOsh *arg2 = (NOsh *) 0 ;
-  PBEparm *arg3 = (PBEparm *) 0 ;
-  MGparm *arg4 = (MGparm *) 0 ;
-  Vpmg *arg5 = (Vpmg *) 0 ;
-  AtomForce **arg6 ;
-  Valist **arg7 ;
-  int *arg8 ;
-  int arg9 ;
-  int result;
+  Vgrid **arg1 = (Vgrid **) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  void *argp5 = 0 ;
-  int res5 = 0 ;
-  void *argp6 = 0 ;
-  int res6 = 0 ;
-  void *argp7 = 0 ;
-  int res7 = 0 ;
-  void *argp8 = 0 ;
-  int res8 = 0 ;
-  int val9 ;
-  int ecode9 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
-  PyObject * obj4 = 0 ;
-  PyObject * obj5 = 0 ;
-  PyObject * obj6 = 0 ;
-  PyObject * obj7 = 0 ;
-  PyObject * obj8 = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"OOOOOOOOO:wrap_forceMG",&obj0,&obj1,&obj2,&obj3,&obj4,&obj5,&obj6,&obj7,&obj8)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vmem, 0 |  0 );
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_Vgrid, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "wrap_forceMG" "', argument " "1"" of type '" "Vmem *""'"); 
-  }
-  arg1 = (Vmem *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "wrap_forceMG" "', argument " "2"" of type '" "NOsh *""'"); 
-  }
-  arg2 = (NOsh *)(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_PBEparm, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "wrap_forceMG" "', argument " "3"" of type '" "PBEparm *""'"); 
-  }
-  arg3 = (PBEparm *)(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_MGparm, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "wrap_forceMG" "', argument " "4"" of type '" "MGparm *""'"); 
-  }
-  arg4 = (MGparm *)(argp4);
-  res5 = SWIG_ConvertPtr(obj4, &argp5,SWIGTYPE_p_Vpmg, 0 |  0 );
-  if (!SWIG_IsOK(res5)) {
-    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "wrap_forceMG" "', argument " "5"" of type '" "Vpmg *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_gridlist" "', argument " "1"" of type '" "Vgrid **""'"); 
   }
-  arg5 = (Vpmg *)(argp5);
-  res6 = SWIG_ConvertPtr(obj5, &argp6,SWIGTYPE_p_p_AtomForce, 0 |  0 );
-  if (!SWIG_IsOK(res6)) {
-    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "wrap_forceMG" "', argument " "6"" of type '" "AtomForce *[NOSH_MAXCALC]""'"); 
-  } 
-  arg6 = (AtomForce **)(argp6);
-  res7 = SWIG_ConvertPtr(obj6, &argp7,SWIGTYPE_p_p_Valist, 0 |  0 );
-  if (!SWIG_IsOK(res7)) {
-    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "wrap_forceMG" "', argument " "7"" of type '" "Valist *[NOSH_MAXMOL]""'"); 
-  } 
-  arg7 = (Valist **)(argp7);
-  res8 = SWIG_ConvertPtr(obj7, &argp8,SWIGTYPE_p_int, 0 |  0 );
-  if (!SWIG_IsOK(res8)) {
-    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "wrap_forceMG" "', argument " "8"" of type '" "int [NOSH_MAXCALC]""'"); 
-  } 
-  arg8 = (int *)(argp8);
-  ecode9 = SWIG_AsVal_int(obj8, &val9);
-  if (!SWIG_IsOK(ecode9)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode9), "in method '" "wrap_forceMG" "', argument " "9"" of type '" "int""'");
-  } 
-  arg9 = (int)(val9);
-  result = (int)wrap_forceMG(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9);
-  resultobj = SWIG_From_int((int)(result));
+  arg1 = (Vgrid **)(argp1);
+  delete_gridlist(arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_getAtomPosition(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_pmglist(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vatom *arg1 = (Vatom *) 0 ;
-  PyObject *result = 0 ;
+  Vpmg **arg1 = (Vpmg **) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:getAtomPosition",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vatom, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_Vpmg, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "getAtomPosition" "', argument " "1"" of type '" "Vatom *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_pmglist" "', argument " "1"" of type '" "Vpmg **""'"); 
   }
-  arg1 = (Vatom *)(argp1);
-  result = (PyObject *)getAtomPosition(arg1);
-  resultobj = result;
+  arg1 = (Vpmg **)(argp1);
+  delete_pmglist(arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_getPotentials(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_pmgplist(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  PBEparm *arg2 = (PBEparm *) 0 ;
-  Vpmg *arg3 = (Vpmg *) 0 ;
-  Valist *arg4 = (Valist *) 0 ;
-  PyObject *result = 0 ;
+  Vpmgp **arg1 = (Vpmgp **) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:getPotentials",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_Vpmgp, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "getPotentials" "', argument " "1"" of type '" "NOsh *""'"); 
-  }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_PBEparm, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "getPotentials" "', argument " "2"" of type '" "PBEparm *""'"); 
-  }
-  arg2 = (PBEparm *)(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_Vpmg, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "getPotentials" "', argument " "3"" of type '" "Vpmg *""'"); 
-  }
-  arg3 = (Vpmg *)(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_Valist, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "getPotentials" "', argument " "4"" of type '" "Valist *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_pmgplist" "', argument " "1"" of type '" "Vpmgp **""'"); 
   }
-  arg4 = (Valist *)(argp4);
-  result = (PyObject *)getPotentials(arg1,arg2,arg3,arg4);
-  resultobj = result;
+  arg1 = (Vpmgp **)(argp1);
+  delete_pmgplist(arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_getEnergies(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_pbelist(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vpmg *arg1 = (Vpmg *) 0 ;
-  Valist *arg2 = (Valist *) 0 ;
-  PyObject *result = 0 ;
+  Vpbe **arg1 = (Vpbe **) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:getEnergies",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_Vpbe, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "getEnergies" "', argument " "1"" of type '" "Vpmg *""'"); 
-  }
-  arg1 = (Vpmg *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_Valist, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "getEnergies" "', argument " "2"" of type '" "Valist *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_pbelist" "', argument " "1"" of type '" "Vpbe **""'"); 
   }
-  arg2 = (Valist *)(argp2);
-  result = (PyObject *)getEnergies(arg1,arg2);
-  resultobj = result;
+  arg1 = (Vpbe **)(argp1);
+  delete_pbelist(arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_getForces(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_Vgrid(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  AtomForce **arg1 = (AtomForce **) 0 ;
-  Valist *arg2 = (Valist *) 0 ;
-  PyObject *result = 0 ;
+  Vgrid *arg1 = (Vgrid *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:getForces",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_p_AtomForce, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vgrid, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "getForces" "', argument " "1"" of type '" "AtomForce **""'"); 
-  }
-  arg1 = (AtomForce **)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_Valist, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "getForces" "', argument " "2"" of type '" "Valist *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Vgrid" "', argument " "1"" of type '" "Vgrid *""'"); 
   }
-  arg2 = (Valist *)(argp2);
-  result = (PyObject *)getForces(arg1,arg2);
-  resultobj = result;
+  arg1 = (Vgrid *)(argp1);
+  delete_Vgrid(arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_loadMolecules(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_Nosh(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   NOsh *arg1 = (NOsh *) 0 ;
-  Vparam *arg2 = (Vparam *) 0 ;
-  Valist **arg3 ;
-  int result;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:loadMolecules",&obj0,&obj1,&obj2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "loadMolecules" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Nosh" "', argument " "1"" of type '" "NOsh *""'"); 
   }
   arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_Vparam, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "loadMolecules" "', argument " "2"" of type '" "Vparam *""'"); 
-  }
-  arg2 = (Vparam *)(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_p_Valist, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "loadMolecules" "', argument " "3"" of type '" "Valist *[NOSH_MAXMOL]""'"); 
-  } 
-  arg3 = (Valist **)(argp3);
-  result = (int)loadMolecules(arg1,arg2,arg3);
-  resultobj = SWIG_From_int((int)(result));
+  delete_Nosh(arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_killMolecules(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_Com(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  Valist **arg2 ;
+  Vcom *arg1 = (Vcom *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:killMolecules",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "killMolecules" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Com" "', argument " "1"" of type '" "Vcom *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_p_Valist, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "killMolecules" "', argument " "2"" of type '" "Valist *[NOSH_MAXMOL]""'"); 
-  } 
-  arg2 = (Valist **)(argp2);
-  killMolecules(arg1,arg2);
+  arg1 = (Vcom *)(argp1);
+  delete_Com(arg1);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -6032,157 +7911,103 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_loadDielMaps(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_Mem(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  Vgrid **arg2 ;
-  Vgrid **arg3 ;
-  Vgrid **arg4 ;
-  int result;
+  Vmem *arg1 = (Vmem *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:loadDielMaps",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vmem, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "loadDielMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Mem" "', argument " "1"" of type '" "Vmem *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "loadDielMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
-  } 
-  arg2 = (Vgrid **)(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "loadDielMaps" "', argument " "3"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
-  } 
-  arg3 = (Vgrid **)(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "loadDielMaps" "', argument " "4"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
-  } 
-  arg4 = (Vgrid **)(argp4);
-  result = (int)loadDielMaps(arg1,arg2,arg3,arg4);
-  resultobj = SWIG_From_int((int)(result));
+  arg1 = (Vmem *)(argp1);
+  delete_Mem(arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_killDielMaps(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_get_AtomForce(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  Vgrid **arg2 ;
-  Vgrid **arg3 ;
-  Vgrid **arg4 ;
+  AtomForce **arg1 = (AtomForce **) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  AtomForce **result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:killDielMaps",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "get_AtomForce", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_AtomForce, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "killDielMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "get_AtomForce" "', argument " "1"" of type '" "AtomForce **""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "killDielMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
-  } 
-  arg2 = (Vgrid **)(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "killDielMaps" "', argument " "3"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
-  } 
-  arg3 = (Vgrid **)(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "killDielMaps" "', argument " "4"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  arg1 = (AtomForce **)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "get_AtomForce" "', argument " "2"" of type '" "int""'");
   } 
-  arg4 = (Vgrid **)(argp4);
-  killDielMaps(arg1,arg2,arg3,arg4);
-  resultobj = SWIG_Py_Void();
+  arg2 = (int)(val2);
+  result = (AtomForce **)get_AtomForce(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_AtomForce, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_loadKappaMaps(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_make_Valist(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  Vgrid **arg2 ;
-  int result;
+  Valist **arg1 = (Valist **) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  Valist *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:loadKappaMaps",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "make_Valist", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_Valist, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "loadKappaMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "make_Valist" "', argument " "1"" of type '" "Valist **""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "loadKappaMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  arg1 = (Valist **)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "make_Valist" "', argument " "2"" of type '" "int""'");
   } 
-  arg2 = (Vgrid **)(argp2);
-  result = (int)loadKappaMaps(arg1,arg2);
-  resultobj = SWIG_From_int((int)(result));
+  arg2 = (int)(val2);
+  result = (Valist *)make_Valist(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Valist, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_killKappaMaps(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_remove_Valist(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  Vgrid **arg2 ;
+  Valist *arg1 = (Valist *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:killKappaMaps",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Valist, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "killKappaMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "remove_Valist" "', argument " "1"" of type '" "Valist *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "killKappaMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
-  } 
-  arg2 = (Vgrid **)(argp2);
-  killKappaMaps(arg1,arg2);
+  arg1 = (Valist *)(argp1);
+  remove_Valist(arg1);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -6190,60 +8015,156 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_loadPotMaps(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_double_array(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  Vgrid **arg2 ;
-  int result;
+  int arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "double_array" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  result = (double *)double_array(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_double, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_int_array(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "int_array" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  result = (int *)int_array(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_int, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_double_array(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  double *arg1 = (double *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:loadPotMaps",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_double, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "loadPotMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_double_array" "', argument " "1"" of type '" "double *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "loadPotMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  arg1 = (double *)(argp1);
+  delete_double_array(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_int_array(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int *arg1 = (int *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_int, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_int_array" "', argument " "1"" of type '" "int *""'"); 
+  }
+  arg1 = (int *)(argp1);
+  delete_int_array(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_get_entry(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  double *arg1 = (double *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  double result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "get_entry", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "get_entry" "', argument " "1"" of type '" "double *""'"); 
+  }
+  arg1 = (double *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "get_entry" "', argument " "2"" of type '" "int""'");
   } 
-  arg2 = (Vgrid **)(argp2);
-  result = (int)loadPotMaps(arg1,arg2);
-  resultobj = SWIG_From_int((int)(result));
+  arg2 = (int)(val2);
+  result = (double)get_entry(arg1,arg2);
+  resultobj = SWIG_From_double((double)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_killPotMaps(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_set_entry(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  Vgrid **arg2 ;
+  double *arg1 = (double *) 0 ;
+  int arg2 ;
+  double arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:killPotMaps",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "set_entry", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_double, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "killPotMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "set_entry" "', argument " "1"" of type '" "double *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "killPotMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  arg1 = (double *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "set_entry" "', argument " "2"" of type '" "int""'");
   } 
-  arg2 = (Vgrid **)(argp2);
-  killPotMaps(arg1,arg2);
+  arg2 = (int)(val2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "set_entry" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  set_entry(arg1,arg2,arg3);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -6251,30 +8172,29 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_loadChargeMaps(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_get_int_entry(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  Vgrid **arg2 ;
-  int result;
+  int *arg1 = (int *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:loadChargeMaps",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "get_int_entry", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_int, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "loadChargeMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "get_int_entry" "', argument " "1"" of type '" "int *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "loadChargeMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  arg1 = (int *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "get_int_entry" "', argument " "2"" of type '" "int""'");
   } 
-  arg2 = (Vgrid **)(argp2);
-  result = (int)loadChargeMaps(arg1,arg2);
+  arg2 = (int)(val2);
+  result = (int)get_int_entry(arg1,arg2);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -6282,29 +8202,36 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_killChargeMaps(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_set_int_entry(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  Vgrid **arg2 ;
+  int *arg1 = (int *) 0 ;
+  int arg2 ;
+  int arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:killChargeMaps",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "set_int_entry", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_int, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "killChargeMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "set_int_entry" "', argument " "1"" of type '" "int *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "killChargeMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  arg1 = (int *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "set_int_entry" "', argument " "2"" of type '" "int""'");
   } 
-  arg2 = (Vgrid **)(argp2);
-  killChargeMaps(arg1,arg2);
+  arg2 = (int)(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "set_int_entry" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = (int)(val3);
+  set_int_entry(arg1,arg2,arg3);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -6312,198 +8239,113 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_printPBEPARM(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_parseInputFromString(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "parseInputFromString", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "parseInputFromString" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  arg2 = swig_obj[1];
+  result = (int)parseInputFromString(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_PBEparm_setMolid(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject * obj0 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:printPBEPARM",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_setMolid", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printPBEPARM" "', argument " "1"" of type '" "PBEparm *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_setMolid" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
   arg1 = (PBEparm *)(argp1);
-  printPBEPARM(arg1);
-  resultobj = SWIG_Py_Void();
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_setMolid" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (int)PBEparm_setMolid(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_printMGPARM(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_setPBEType(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  MGparm *arg1 = (MGparm *) 0 ;
-  double *arg2 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:printMGPARM",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_setPBEType", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printMGPARM" "', argument " "1"" of type '" "MGparm *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_setPBEType" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg1 = (MGparm *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_double, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "printMGPARM" "', argument " "2"" of type '" "double [3]""'"); 
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_setPBEType" "', argument " "2"" of type '" "int""'");
   } 
-  arg2 = (double *)(argp2);
-  printMGPARM(arg1,arg2);
-  resultobj = SWIG_Py_Void();
+  arg2 = (int)(val2);
+  result = (int)PBEparm_setPBEType(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_initMG(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_setBcfl(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  int arg1 ;
-  NOsh *arg2 = (NOsh *) 0 ;
-  MGparm *arg3 = (MGparm *) 0 ;
-  PBEparm *arg4 = (PBEparm *) 0 ;
-  double *arg5 ;
-  Vpbe **arg6 ;
-  Valist **arg7 ;
-  Vgrid **arg8 ;
-  Vgrid **arg9 ;
-  Vgrid **arg10 ;
-  Vgrid **arg11 ;
-  Vgrid **arg12 ;
-  Vpmgp **arg13 ;
-  Vpmg **arg14 ;
-  Vgrid **arg15 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   int result;
-  int val1 ;
-  int ecode1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  void *argp5 = 0 ;
-  int res5 = 0 ;
-  void *argp6 = 0 ;
-  int res6 = 0 ;
-  void *argp7 = 0 ;
-  int res7 = 0 ;
-  void *argp8 = 0 ;
-  int res8 = 0 ;
-  void *argp9 = 0 ;
-  int res9 = 0 ;
-  void *argp10 = 0 ;
-  int res10 = 0 ;
-  void *argp11 = 0 ;
-  int res11 = 0 ;
-  void *argp12 = 0 ;
-  int res12 = 0 ;
-  void *argp13 = 0 ;
-  int res13 = 0 ;
-  void *argp14 = 0 ;
-  int res14 = 0 ;
-  void *argp15 = 0 ;
-  int res15 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
-  PyObject * obj4 = 0 ;
-  PyObject * obj5 = 0 ;
-  PyObject * obj6 = 0 ;
-  PyObject * obj7 = 0 ;
-  PyObject * obj8 = 0 ;
-  PyObject * obj9 = 0 ;
-  PyObject * obj10 = 0 ;
-  PyObject * obj11 = 0 ;
-  PyObject * obj12 = 0 ;
-  PyObject * obj13 = 0 ;
-  PyObject * obj14 = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"OOOOOOOOOOOOOOO:initMG",&obj0,&obj1,&obj2,&obj3,&obj4,&obj5,&obj6,&obj7,&obj8,&obj9,&obj10,&obj11,&obj12,&obj13,&obj14)) SWIG_fail;
-  ecode1 = SWIG_AsVal_int(obj0, &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "initMG" "', argument " "1"" of type '" "int""'");
-  } 
-  arg1 = (int)(val1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "initMG" "', argument " "2"" of type '" "NOsh *""'"); 
-  }
-  arg2 = (NOsh *)(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_MGparm, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "initMG" "', argument " "3"" of type '" "MGparm *""'"); 
-  }
-  arg3 = (MGparm *)(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_PBEparm, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "initMG" "', argument " "4"" of type '" "PBEparm *""'"); 
+  
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_setBcfl", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_setBcfl" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg4 = (PBEparm *)(argp4);
-  res5 = SWIG_ConvertPtr(obj4, &argp5,SWIGTYPE_p_double, 0 |  0 );
-  if (!SWIG_IsOK(res5)) {
-    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "initMG" "', argument " "5"" of type '" "double [3]""'"); 
-  } 
-  arg5 = (double *)(argp5);
-  res6 = SWIG_ConvertPtr(obj5, &argp6,SWIGTYPE_p_p_Vpbe, 0 |  0 );
-  if (!SWIG_IsOK(res6)) {
-    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "initMG" "', argument " "6"" of type '" "Vpbe *[NOSH_MAXCALC]""'"); 
-  } 
-  arg6 = (Vpbe **)(argp6);
-  res7 = SWIG_ConvertPtr(obj6, &argp7,SWIGTYPE_p_p_Valist, 0 |  0 );
-  if (!SWIG_IsOK(res7)) {
-    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "initMG" "', argument " "7"" of type '" "Valist *[NOSH_MAXMOL]""'"); 
-  } 
-  arg7 = (Valist **)(argp7);
-  res8 = SWIG_ConvertPtr(obj7, &argp8,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res8)) {
-    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "initMG" "', argument " "8"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
-  } 
-  arg8 = (Vgrid **)(argp8);
-  res9 = SWIG_ConvertPtr(obj8, &argp9,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res9)) {
-    SWIG_exception_fail(SWIG_ArgError(res9), "in method '" "initMG" "', argument " "9"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
-  } 
-  arg9 = (Vgrid **)(argp9);
-  res10 = SWIG_ConvertPtr(obj9, &argp10,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res10)) {
-    SWIG_exception_fail(SWIG_ArgError(res10), "in method '" "initMG" "', argument " "10"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
-  } 
-  arg10 = (Vgrid **)(argp10);
-  res11 = SWIG_ConvertPtr(obj10, &argp11,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res11)) {
-    SWIG_exception_fail(SWIG_ArgError(res11), "in method '" "initMG" "', argument " "11"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
-  } 
-  arg11 = (Vgrid **)(argp11);
-  res12 = SWIG_ConvertPtr(obj11, &argp12,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res12)) {
-    SWIG_exception_fail(SWIG_ArgError(res12), "in method '" "initMG" "', argument " "12"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
-  } 
-  arg12 = (Vgrid **)(argp12);
-  res13 = SWIG_ConvertPtr(obj12, &argp13,SWIGTYPE_p_p_Vpmgp, 0 |  0 );
-  if (!SWIG_IsOK(res13)) {
-    SWIG_exception_fail(SWIG_ArgError(res13), "in method '" "initMG" "', argument " "13"" of type '" "Vpmgp *[NOSH_MAXCALC]""'"); 
-  } 
-  arg13 = (Vpmgp **)(argp13);
-  res14 = SWIG_ConvertPtr(obj13, &argp14,SWIGTYPE_p_p_Vpmg, 0 |  0 );
-  if (!SWIG_IsOK(res14)) {
-    SWIG_exception_fail(SWIG_ArgError(res14), "in method '" "initMG" "', argument " "14"" of type '" "Vpmg *[NOSH_MAXCALC]""'"); 
-  } 
-  arg14 = (Vpmg **)(argp14);
-  res15 = SWIG_ConvertPtr(obj14, &argp15,SWIGTYPE_p_p_Vgrid, 0 |  0 );
-  if (!SWIG_IsOK(res15)) {
-    SWIG_exception_fail(SWIG_ArgError(res15), "in method '" "initMG" "', argument " "15"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_setBcfl" "', argument " "2"" of type '" "int""'");
   } 
-  arg15 = (Vgrid **)(argp15);
-  result = (int)initMG(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9,arg10,arg11,arg12,arg13,arg14,arg15);
+  arg2 = (int)(val2);
+  result = (int)PBEparm_setBcfl(arg1,arg2);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -6511,87 +8353,83 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_killMG(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_setIon(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  Vpbe **arg2 ;
-  Vpmgp **arg3 ;
-  Vpmg **arg4 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
+  double arg3 ;
+  double arg4 ;
+  double arg5 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  double val5 ;
+  int ecode5 = 0 ;
+  PyObject *swig_obj[5] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:killMG",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_setIon", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "killMG" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_setIon" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_p_Vpbe, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "killMG" "', argument " "2"" of type '" "Vpbe *[NOSH_MAXCALC]""'"); 
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_setIon" "', argument " "2"" of type '" "int""'");
   } 
-  arg2 = (Vpbe **)(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_p_Vpmgp, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "killMG" "', argument " "3"" of type '" "Vpmgp *[NOSH_MAXCALC]""'"); 
+  arg2 = (int)(val2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "PBEparm_setIon" "', argument " "3"" of type '" "double""'");
   } 
-  arg3 = (Vpmgp **)(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_p_Vpmg, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "killMG" "', argument " "4"" of type '" "Vpmg *[NOSH_MAXCALC]""'"); 
+  arg3 = (double)(val3);
+  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "PBEparm_setIon" "', argument " "4"" of type '" "double""'");
   } 
-  arg4 = (Vpmg **)(argp4);
-  killMG(arg1,arg2,arg3,arg4);
-  resultobj = SWIG_Py_Void();
+  arg4 = (double)(val4);
+  ecode5 = SWIG_AsVal_double(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "PBEparm_setIon" "', argument " "5"" of type '" "double""'");
+  } 
+  arg5 = (double)(val5);
+  result = (int)PBEparm_setIon(arg1,arg2,arg3,arg4,arg5);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_solveMG(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_setNion(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  Vpmg *arg2 = (Vpmg *) 0 ;
-  MGparm_CalcType arg3 ;
-  int result;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  int val3 ;
-  int ecode3 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:solveMG",&obj0,&obj1,&obj2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_setNion", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "solveMG" "', argument " "1"" of type '" "NOsh *""'"); 
-  }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_Vpmg, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "solveMG" "', argument " "2"" of type '" "Vpmg *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_setNion" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg2 = (Vpmg *)(argp2);
-  ecode3 = SWIG_AsVal_int(obj2, &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "solveMG" "', argument " "3"" of type '" "MGparm_CalcType""'");
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_setNion" "', argument " "2"" of type '" "int""'");
   } 
-  arg3 = (MGparm_CalcType)(val3);
-  result = (int)solveMG(arg1,arg2,arg3);
+  arg2 = (int)(val2);
+  result = (int)PBEparm_setNion(arg1,arg2);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -6599,39 +8437,29 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_setPartMG(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_setPdie(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  MGparm *arg2 = (MGparm *) 0 ;
-  Vpmg *arg3 = (Vpmg *) 0 ;
-  int result;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:setPartMG",&obj0,&obj1,&obj2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_setPdie", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "setPartMG" "', argument " "1"" of type '" "NOsh *""'"); 
-  }
-  arg1 = (NOsh *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_MGparm, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "setPartMG" "', argument " "2"" of type '" "MGparm *""'"); 
-  }
-  arg2 = (MGparm *)(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_Vpmg, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "setPartMG" "', argument " "3"" of type '" "Vpmg *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_setPdie" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg3 = (Vpmg *)(argp3);
-  result = (int)setPartMG(arg1,arg2,arg3);
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_setPdie" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  result = (int)PBEparm_setPdie(arg1,arg2);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -6639,108 +8467,89 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_killEnergy(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_setSdie(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)":killEnergy")) SWIG_fail;
-  killEnergy();
-  resultobj = SWIG_Py_Void();
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_setSdie", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_setSdie" "', argument " "1"" of type '" "PBEparm *""'"); 
+  }
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_setSdie" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  result = (int)PBEparm_setSdie(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_killForce(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_setSrfm(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vmem *arg1 = (Vmem *) 0 ;
-  NOsh *arg2 = (NOsh *) 0 ;
-  int *arg3 ;
-  AtomForce **arg4 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:killForce",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vmem, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_setSrfm", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "killForce" "', argument " "1"" of type '" "Vmem *""'"); 
-  }
-  arg1 = (Vmem *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "killForce" "', argument " "2"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_setSrfm" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg2 = (NOsh *)(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_int, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "killForce" "', argument " "3"" of type '" "int [NOSH_MAXCALC]""'"); 
-  } 
-  arg3 = (int *)(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_p_AtomForce, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "killForce" "', argument " "4"" of type '" "AtomForce *[NOSH_MAXCALC]""'"); 
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_setSrfm" "', argument " "2"" of type '" "int""'");
   } 
-  arg4 = (AtomForce **)(argp4);
-  killForce(arg1,arg2,arg3,arg4);
-  resultobj = SWIG_Py_Void();
+  arg2 = (int)(val2);
+  result = (int)PBEparm_setSrfm(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_writedataMG(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_setSrad(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  int arg1 ;
-  NOsh *arg2 = (NOsh *) 0 ;
-  PBEparm *arg3 = (PBEparm *) 0 ;
-  Vpmg *arg4 = (Vpmg *) 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   int result;
-  int val1 ;
-  int ecode1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:writedataMG",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
-  ecode1 = SWIG_AsVal_int(obj0, &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "writedataMG" "', argument " "1"" of type '" "int""'");
-  } 
-  arg1 = (int)(val1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "writedataMG" "', argument " "2"" of type '" "NOsh *""'"); 
-  }
-  arg2 = (NOsh *)(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_PBEparm, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "writedataMG" "', argument " "3"" of type '" "PBEparm *""'"); 
-  }
-  arg3 = (PBEparm *)(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_Vpmg, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "writedataMG" "', argument " "4"" of type '" "Vpmg *""'"); 
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_setSrad", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_setSrad" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg4 = (Vpmg *)(argp4);
-  result = (int)writedataMG(arg1,arg2,arg3,arg4);
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_setSrad" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  result = (int)PBEparm_setSrad(arg1,arg2);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -6748,48 +8557,29 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_writematMG(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_setSwin(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  int arg1 ;
-  NOsh *arg2 = (NOsh *) 0 ;
-  PBEparm *arg3 = (PBEparm *) 0 ;
-  Vpmg *arg4 = (Vpmg *) 0 ;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   int result;
-  int val1 ;
-  int ecode1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:writematMG",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
-  ecode1 = SWIG_AsVal_int(obj0, &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "writematMG" "', argument " "1"" of type '" "int""'");
-  } 
-  arg1 = (int)(val1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "writematMG" "', argument " "2"" of type '" "NOsh *""'"); 
-  }
-  arg2 = (NOsh *)(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_PBEparm, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "writematMG" "', argument " "3"" of type '" "PBEparm *""'"); 
-  }
-  arg3 = (PBEparm *)(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_Vpmg, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "writematMG" "', argument " "4"" of type '" "Vpmg *""'"); 
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_setSwin", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_setSwin" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg4 = (Vpmg *)(argp4);
-  result = (int)writematMG(arg1,arg2,arg3,arg4);
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_setSwin" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  result = (int)PBEparm_setSwin(arg1,arg2);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -6797,57 +8587,29 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_printForce(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_setSdens(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vcom *arg1 = (Vcom *) 0 ;
-  NOsh *arg2 = (NOsh *) 0 ;
-  int *arg3 ;
-  AtomForce **arg4 ;
-  int arg5 ;
-  int result;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  int val5 ;
-  int ecode5 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
-  PyObject * obj4 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOOO:printForce",&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_setSdens", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printForce" "', argument " "1"" of type '" "Vcom *""'"); 
-  }
-  arg1 = (Vcom *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "printForce" "', argument " "2"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_setSdens" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg2 = (NOsh *)(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_int, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "printForce" "', argument " "3"" of type '" "int [NOSH_MAXCALC]""'"); 
-  } 
-  arg3 = (int *)(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_p_AtomForce, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "printForce" "', argument " "4"" of type '" "AtomForce *[NOSH_MAXCALC]""'"); 
-  } 
-  arg4 = (AtomForce **)(argp4);
-  ecode5 = SWIG_AsVal_int(obj4, &val5);
-  if (!SWIG_IsOK(ecode5)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "printForce" "', argument " "5"" of type '" "int""'");
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_setSdens" "', argument " "2"" of type '" "double""'");
   } 
-  arg5 = (int)(val5);
-  result = (int)printForce(arg1,arg2,arg3,arg4,arg5);
+  arg2 = (double)(val2);
+  result = (int)PBEparm_setSdens(arg1,arg2);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -6855,57 +8617,29 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_printElecForce(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_setTemp(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vcom *arg1 = (Vcom *) 0 ;
-  NOsh *arg2 = (NOsh *) 0 ;
-  int *arg3 ;
-  AtomForce **arg4 ;
-  int arg5 ;
-  int result;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  int val5 ;
-  int ecode5 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
-  PyObject * obj4 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOOO:printElecForce",&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_setTemp", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printElecForce" "', argument " "1"" of type '" "Vcom *""'"); 
-  }
-  arg1 = (Vcom *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "printElecForce" "', argument " "2"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_setTemp" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg2 = (NOsh *)(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_int, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "printElecForce" "', argument " "3"" of type '" "int [NOSH_MAXCALC]""'"); 
-  } 
-  arg3 = (int *)(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_p_AtomForce, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "printElecForce" "', argument " "4"" of type '" "AtomForce *[NOSH_MAXCALC]""'"); 
-  } 
-  arg4 = (AtomForce **)(argp4);
-  ecode5 = SWIG_AsVal_int(obj4, &val5);
-  if (!SWIG_IsOK(ecode5)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "printElecForce" "', argument " "5"" of type '" "int""'");
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_setTemp" "', argument " "2"" of type '" "double""'");
   } 
-  arg5 = (int)(val5);
-  result = (int)printElecForce(arg1,arg2,arg3,arg4,arg5);
+  arg2 = (double)(val2);
+  result = (int)PBEparm_setTemp(arg1,arg2);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -6913,57 +8647,59 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_printApolForce(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_PBEparm_setCalcEnergy(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vcom *arg1 = (Vcom *) 0 ;
-  NOsh *arg2 = (NOsh *) 0 ;
-  int *arg3 ;
-  AtomForce **arg4 ;
-  int arg5 ;
-  int result;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  int val5 ;
-  int ecode5 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
-  PyObject * obj4 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOOO:printApolForce",&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_setCalcEnergy", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printApolForce" "', argument " "1"" of type '" "Vcom *""'"); 
-  }
-  arg1 = (Vcom *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "printApolForce" "', argument " "2"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_setCalcEnergy" "', argument " "1"" of type '" "PBEparm *""'"); 
   }
-  arg2 = (NOsh *)(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_int, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "printApolForce" "', argument " "3"" of type '" "int [NOSH_MAXCALC]""'"); 
-  } 
-  arg3 = (int *)(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_p_AtomForce, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "printApolForce" "', argument " "4"" of type '" "AtomForce *[NOSH_MAXCALC]""'"); 
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_setCalcEnergy" "', argument " "2"" of type '" "int""'");
   } 
-  arg4 = (AtomForce **)(argp4);
-  ecode5 = SWIG_AsVal_int(obj4, &val5);
-  if (!SWIG_IsOK(ecode5)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "printApolForce" "', argument " "5"" of type '" "int""'");
+  arg2 = (int)(val2);
+  result = (int)PBEparm_setCalcEnergy(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_PBEparm_setCalcForce(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "PBEparm_setCalcForce", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PBEparm_setCalcForce" "', argument " "1"" of type '" "PBEparm *""'"); 
+  }
+  arg1 = (PBEparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PBEparm_setCalcForce" "', argument " "2"" of type '" "int""'");
   } 
-  arg5 = (int)(val5);
-  result = (int)printApolForce(arg1,arg2,arg3,arg4,arg5);
+  arg2 = (int)(val2);
+  result = (int)PBEparm_setCalcForce(arg1,arg2);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -6971,270 +8707,331 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_startVio(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_MGparm_setDime(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
+  MGparm *arg1 = (MGparm *) 0 ;
+  int arg2 ;
+  int arg3 ;
+  int arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  PyObject *swig_obj[4] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)":startVio")) SWIG_fail;
-  startVio();
-  resultobj = SWIG_Py_Void();
+  if (!SWIG_Python_UnpackTuple(args, "MGparm_setDime", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_setDime" "', argument " "1"" of type '" "MGparm *""'"); 
+  }
+  arg1 = (MGparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "MGparm_setDime" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "MGparm_setDime" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = (int)(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "MGparm_setDime" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = (int)(val4);
+  result = (int)MGparm_setDime(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Vacc_molAcc(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_MGparm_setGlen(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vacc *arg1 = (Vacc *) 0 ;
-  double *arg2 ;
+  MGparm *arg1 = (MGparm *) 0 ;
+  double arg2 ;
   double arg3 ;
-  double result;
+  double arg4 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
   double val3 ;
   int ecode3 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  PyObject *swig_obj[4] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Vacc_molAcc",&obj0,&obj1,&obj2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vacc, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "MGparm_setGlen", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vacc_molAcc" "', argument " "1"" of type '" "Vacc *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_setGlen" "', argument " "1"" of type '" "MGparm *""'"); 
   }
-  arg1 = (Vacc *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_double, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Vacc_molAcc" "', argument " "2"" of type '" "double [3]""'"); 
+  arg1 = (MGparm *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "MGparm_setGlen" "', argument " "2"" of type '" "double""'");
   } 
-  arg2 = (double *)(argp2);
-  ecode3 = SWIG_AsVal_double(obj2, &val3);
+  arg2 = (double)(val2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
   if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "Vacc_molAcc" "', argument " "3"" of type '" "double""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "MGparm_setGlen" "', argument " "3"" of type '" "double""'");
   } 
   arg3 = (double)(val3);
-  result = (double)Vacc_molAcc(arg1,arg2,arg3);
-  resultobj = SWIG_From_double((double)(result));
+  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "MGparm_setGlen" "', argument " "4"" of type '" "double""'");
+  } 
+  arg4 = (double)(val4);
+  result = (int)MGparm_setGlen(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Vacc_vdwAcc(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_MGparm_setGrid(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vacc *arg1 = (Vacc *) 0 ;
-  double *arg2 ;
-  double result;
+  MGparm *arg1 = (MGparm *) 0 ;
+  double arg2 ;
+  double arg3 ;
+  double arg4 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  PyObject *swig_obj[4] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:Vacc_vdwAcc",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vacc, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "MGparm_setGrid", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vacc_vdwAcc" "', argument " "1"" of type '" "Vacc *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_setGrid" "', argument " "1"" of type '" "MGparm *""'"); 
   }
-  arg1 = (Vacc *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_double, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Vacc_vdwAcc" "', argument " "2"" of type '" "double [3]""'"); 
+  arg1 = (MGparm *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "MGparm_setGrid" "', argument " "2"" of type '" "double""'");
   } 
-  arg2 = (double *)(argp2);
-  result = (double)Vacc_vdwAcc(arg1,arg2);
-  resultobj = SWIG_From_double((double)(result));
+  arg2 = (double)(val2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "MGparm_setGrid" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "MGparm_setGrid" "', argument " "4"" of type '" "double""'");
+  } 
+  arg4 = (double)(val4);
+  result = (int)MGparm_setGrid(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_energyMG(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_MGparm_setCenter(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
-  int arg2 ;
-  Vpmg *arg3 = (Vpmg *) 0 ;
-  int *arg4 = (int *) 0 ;
-  double *arg5 = (double *) 0 ;
-  double *arg6 = (double *) 0 ;
-  double *arg7 = (double *) 0 ;
-  double *arg8 = (double *) 0 ;
+  MGparm *arg1 = (MGparm *) 0 ;
+  double arg2 ;
+  double arg3 ;
+  double arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  PyObject *swig_obj[4] ;
   int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "MGparm_setCenter", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_setCenter" "', argument " "1"" of type '" "MGparm *""'"); 
+  }
+  arg1 = (MGparm *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "MGparm_setCenter" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "MGparm_setCenter" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "MGparm_setCenter" "', argument " "4"" of type '" "double""'");
+  } 
+  arg4 = (double)(val4);
+  result = (int)MGparm_setCenter(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_MGparm_setChgm(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  MGparm *arg1 = (MGparm *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  int temp4 ;
-  int res4 = 0 ;
-  double temp5 ;
-  int res5 = 0 ;
-  double temp6 ;
-  int res6 = 0 ;
-  double temp7 ;
-  int res7 = 0 ;
-  double temp8 ;
-  int res8 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
-  PyObject * obj4 = 0 ;
-  PyObject * obj5 = 0 ;
-  PyObject * obj6 = 0 ;
-  PyObject * obj7 = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"OOOOOOOO:energyMG",&obj0,&obj1,&obj2,&obj3,&obj4,&obj5,&obj6,&obj7)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "MGparm_setChgm", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "energyMG" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_setChgm" "', argument " "1"" of type '" "MGparm *""'"); 
   }
-  arg1 = (NOsh *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  arg1 = (MGparm *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "energyMG" "', argument " "2"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "MGparm_setChgm" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = (int)(val2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_Vpmg, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "energyMG" "', argument " "3"" of type '" "Vpmg *""'"); 
-  }
-  arg3 = (Vpmg *)(argp3);
-  if (!(SWIG_IsOK((res4 = SWIG_ConvertPtr(obj3,SWIG_as_voidptrptr(&arg4),SWIGTYPE_p_int,0))))) {
-    int val; 
-    int ecode = SWIG_AsVal_int(obj3, &val);
-    if (!SWIG_IsOK(ecode)) {
-      SWIG_exception_fail(SWIG_ArgError(ecode), "in method '" "energyMG" "', argument " "4"" of type '" "int""'");
-    }
-    temp4 = (int)(val);
-    arg4 = &temp4;
-    res4 = SWIG_AddTmpMask(ecode);
-  }
-  if (!(SWIG_IsOK((res5 = SWIG_ConvertPtr(obj4,SWIG_as_voidptrptr(&arg5),SWIGTYPE_p_double,0))))) {
-    double val; 
-    int ecode = SWIG_AsVal_double(obj4, &val);
-    if (!SWIG_IsOK(ecode)) {
-      SWIG_exception_fail(SWIG_ArgError(ecode), "in method '" "energyMG" "', argument " "5"" of type '" "double""'");
-    }
-    temp5 = (double)(val);
-    arg5 = &temp5;
-    res5 = SWIG_AddTmpMask(ecode);
-  }
-  if (!(SWIG_IsOK((res6 = SWIG_ConvertPtr(obj5,SWIG_as_voidptrptr(&arg6),SWIGTYPE_p_double,0))))) {
-    double val; 
-    int ecode = SWIG_AsVal_double(obj5, &val);
-    if (!SWIG_IsOK(ecode)) {
-      SWIG_exception_fail(SWIG_ArgError(ecode), "in method '" "energyMG" "', argument " "6"" of type '" "double""'");
-    }
-    temp6 = (double)(val);
-    arg6 = &temp6;
-    res6 = SWIG_AddTmpMask(ecode);
-  }
-  if (!(SWIG_IsOK((res7 = SWIG_ConvertPtr(obj6,SWIG_as_voidptrptr(&arg7),SWIGTYPE_p_double,0))))) {
-    double val; 
-    int ecode = SWIG_AsVal_double(obj6, &val);
-    if (!SWIG_IsOK(ecode)) {
-      SWIG_exception_fail(SWIG_ArgError(ecode), "in method '" "energyMG" "', argument " "7"" of type '" "double""'");
-    }
-    temp7 = (double)(val);
-    arg7 = &temp7;
-    res7 = SWIG_AddTmpMask(ecode);
-  }
-  if (!(SWIG_IsOK((res8 = SWIG_ConvertPtr(obj7,SWIG_as_voidptrptr(&arg8),SWIGTYPE_p_double,0))))) {
-    double val; 
-    int ecode = SWIG_AsVal_double(obj7, &val);
-    if (!SWIG_IsOK(ecode)) {
-      SWIG_exception_fail(SWIG_ArgError(ecode), "in method '" "energyMG" "', argument " "8"" of type '" "double""'");
-    }
-    temp8 = (double)(val);
-    arg8 = &temp8;
-    res8 = SWIG_AddTmpMask(ecode);
+  result = (int)MGparm_setChgm(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_MGparm_setEtol(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  MGparm *arg1 = (MGparm *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "MGparm_setEtol", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "MGparm_setEtol" "', argument " "1"" of type '" "MGparm *""'"); 
   }
-  result = (int)energyMG(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8);
+  arg1 = (MGparm *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "MGparm_setEtol" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  result = (int)MGparm_setEtol(arg1,arg2);
   resultobj = SWIG_From_int((int)(result));
-  if (SWIG_IsTmpObj(res5)) {
-    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_From_double((*arg5)));
-  } else {
-    int new_flags = SWIG_IsNewObj(res5) ? (SWIG_POINTER_OWN |  0 ) :  0 ;
-    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((void*)(arg5), SWIGTYPE_p_double, new_flags));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_newCalc(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh_calc *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "newCalc", 0, 0, 0)) SWIG_fail;
+  result = (NOsh_calc *)newCalc();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_NOsh_calc, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_copyCalc(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  NOsh_calc *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "copyCalc" "', argument " "1"" of type '" "NOsh_calc *""'"); 
   }
-  if (SWIG_IsNewObj(res4)) free((char*)arg4);
-  if (SWIG_IsNewObj(res6)) free((char*)arg6);
-  if (SWIG_IsNewObj(res7)) free((char*)arg7);
-  if (SWIG_IsNewObj(res8)) free((char*)arg8);
+  arg1 = (NOsh_calc *)(argp1);
+  result = (NOsh_calc *)copyCalc(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_NOsh_calc, 0 |  0 );
   return resultobj;
 fail:
-  if (SWIG_IsNewObj(res4)) free((char*)arg4);
-  if (SWIG_IsNewObj(res6)) free((char*)arg6);
-  if (SWIG_IsNewObj(res7)) free((char*)arg7);
-  if (SWIG_IsNewObj(res8)) free((char*)arg8);
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_printEnergy(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_deleteCalc(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vcom *arg1 = (Vcom *) 0 ;
-  NOsh *arg2 = (NOsh *) 0 ;
-  double *arg3 ;
-  int arg4 ;
-  int result;
+  NOsh_calc *arg1 = (NOsh_calc *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh_calc, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "deleteCalc" "', argument " "1"" of type '" "NOsh_calc *""'"); 
+  }
+  arg1 = (NOsh_calc *)(argp1);
+  deleteCalc(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_checkCalc(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  NOsh_calc *arg2 = (NOsh_calc *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  int val4 ;
-  int ecode4 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:printEnergy",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "checkCalc", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printEnergy" "', argument " "1"" of type '" "Vcom *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "checkCalc" "', argument " "1"" of type '" "NOsh *""'"); 
   }
-  arg1 = (Vcom *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_NOsh_calc, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "printEnergy" "', argument " "2"" of type '" "NOsh *""'"); 
-  }
-  arg2 = (NOsh *)(argp2);
-  {
-    /* Check if is a list */
-    if (PyList_Check(obj2)) {
-      int size = PyList_Size(obj2);
-      int i = 0;
-      arg3 = (double *) malloc((size+1)*sizeof(double));
-      for (i = 0; i < size; i++) {
-        PyObject *o = PyList_GetItem(obj2,i);
-        if (PyFloat_Check(o))
-        arg3[i] = PyFloat_AsDouble(PyList_GetItem(obj2,i));
-        else {
-          PyErr_SetString(PyExc_TypeError,"list must contain floats");
-          free(arg3);
-          return NULL;
-        }
-      }
-      arg3[i] = 0;
-    } else {
-      PyErr_SetString(PyExc_TypeError,"not a list");
-      return NULL;
-    }
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "checkCalc" "', argument " "2"" of type '" "NOsh_calc *""'"); 
   }
-  ecode4 = SWIG_AsVal_int(obj3, &val4);
-  if (!SWIG_IsOK(ecode4)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "printEnergy" "', argument " "4"" of type '" "int""'");
-  } 
-  arg4 = (int)(val4);
-  result = (int)printEnergy(arg1,arg2,arg3,arg4);
+  arg2 = (NOsh_calc *)(argp2);
+  result = (int)checkCalc(arg1,arg2);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -7242,63 +9039,29 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_printElecEnergy(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_addCalc(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Vcom *arg1 = (Vcom *) 0 ;
-  NOsh *arg2 = (NOsh *) 0 ;
-  double *arg3 ;
-  int arg4 ;
-  int result;
+  NOsh *arg1 = (NOsh *) 0 ;
+  NOsh_calc *arg2 = (NOsh_calc *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  int val4 ;
-  int ecode4 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:printElecEnergy",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "addCalc", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printElecEnergy" "', argument " "1"" of type '" "Vcom *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "addCalc" "', argument " "1"" of type '" "NOsh *""'"); 
   }
-  arg1 = (Vcom *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_NOsh_calc, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "printElecEnergy" "', argument " "2"" of type '" "NOsh *""'"); 
-  }
-  arg2 = (NOsh *)(argp2);
-  {
-    /* Check if is a list */
-    if (PyList_Check(obj2)) {
-      int size = PyList_Size(obj2);
-      int i = 0;
-      arg3 = (double *) malloc((size+1)*sizeof(double));
-      for (i = 0; i < size; i++) {
-        PyObject *o = PyList_GetItem(obj2,i);
-        if (PyFloat_Check(o))
-        arg3[i] = PyFloat_AsDouble(PyList_GetItem(obj2,i));
-        else {
-          PyErr_SetString(PyExc_TypeError,"list must contain floats");
-          free(arg3);
-          return NULL;
-        }
-      }
-      arg3[i] = 0;
-    } else {
-      PyErr_SetString(PyExc_TypeError,"not a list");
-      return NULL;
-    }
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "addCalc" "', argument " "2"" of type '" "NOsh_calc *""'"); 
   }
-  ecode4 = SWIG_AsVal_int(obj3, &val4);
-  if (!SWIG_IsOK(ecode4)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "printElecEnergy" "', argument " "4"" of type '" "int""'");
-  } 
-  arg4 = (int)(val4);
-  result = (int)printElecEnergy(arg1,arg2,arg3,arg4);
+  arg2 = (NOsh_calc *)(argp2);
+  result = (int)addCalc(arg1,arg2);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -7306,278 +9069,5156 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_printApolEnergy(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Valist_load(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  NOsh *arg1 = (NOsh *) 0 ;
+  Valist *arg1 = (Valist *) 0 ;
   int arg2 ;
-  int result;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  PyObject *arg3 = (PyObject *) 0 ;
+  PyObject *arg4 = (PyObject *) 0 ;
+  PyObject *arg5 = (PyObject *) 0 ;
+  PyObject *arg6 = (PyObject *) 0 ;
+  PyObject *arg7 = (PyObject *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[7] ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:printApolEnergy",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "Valist_load", 7, 7, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Valist, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printApolEnergy" "', argument " "1"" of type '" "NOsh *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Valist_load" "', argument " "1"" of type '" "Valist *""'"); 
+  }
+  arg1 = (Valist *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Valist_load" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  arg3 = swig_obj[2];
+  arg4 = swig_obj[3];
+  arg5 = swig_obj[4];
+  arg6 = swig_obj[5];
+  arg7 = swig_obj[6];
+  Valist_load(arg1,arg2,arg3,arg4,arg5,arg6,arg7);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Valist_loadBuffer(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Valist *arg1 = (Valist *) 0 ;
+  int arg2 ;
+  PyObject *arg3 = (PyObject *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[3] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "Valist_loadBuffer", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Valist, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Valist_loadBuffer" "', argument " "1"" of type '" "Valist *""'"); 
+  }
+  arg1 = (Valist *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Valist_loadBuffer" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  arg3 = swig_obj[2];
+  result = (int)Valist_loadBuffer(arg1,arg2,arg3);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Valist_updateBuffer(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Valist *arg1 = (Valist *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "Valist_updateBuffer", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Valist, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Valist_updateBuffer" "', argument " "1"" of type '" "Valist *""'"); 
+  }
+  arg1 = (Valist *)(argp1);
+  arg2 = swig_obj[1];
+  result = (int)Valist_updateBuffer(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_NOsh_setupElecCalc(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Valist **arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_setupElecCalc", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_setupElecCalc" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_Valist, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "NOsh_setupElecCalc" "', argument " "2"" of type '" "Valist *[NOSH_MAXMOL]""'"); 
+  } 
+  arg2 = (Valist **)(argp2);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)NOsh_setupElecCalc(arg1,arg2);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_NOsh_setupApolCalc(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Valist **arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "NOsh_setupApolCalc", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "NOsh_setupApolCalc" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_Valist, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "NOsh_setupApolCalc" "', argument " "2"" of type '" "Valist *[NOSH_MAXMOL]""'"); 
+  } 
+  arg2 = (Valist **)(argp2);
+  result = (int)NOsh_setupApolCalc(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_wrap_forceMG(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vmem *arg1 = (Vmem *) 0 ;
+  NOsh *arg2 = (NOsh *) 0 ;
+  PBEparm *arg3 = (PBEparm *) 0 ;
+  MGparm *arg4 = (MGparm *) 0 ;
+  Vpmg *arg5 = (Vpmg *) 0 ;
+  AtomForce **arg6 ;
+  Valist **arg7 ;
+  int *arg8 ;
+  int arg9 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  void *argp8 = 0 ;
+  int res8 = 0 ;
+  int val9 ;
+  int ecode9 = 0 ;
+  PyObject *swig_obj[9] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "wrap_forceMG", 9, 9, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vmem, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "wrap_forceMG" "', argument " "1"" of type '" "Vmem *""'"); 
+  }
+  arg1 = (Vmem *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "wrap_forceMG" "', argument " "2"" of type '" "NOsh *""'"); 
+  }
+  arg2 = (NOsh *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "wrap_forceMG" "', argument " "3"" of type '" "PBEparm *""'"); 
+  }
+  arg3 = (PBEparm *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "wrap_forceMG" "', argument " "4"" of type '" "MGparm *""'"); 
+  }
+  arg4 = (MGparm *)(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "wrap_forceMG" "', argument " "5"" of type '" "Vpmg *""'"); 
+  }
+  arg5 = (Vpmg *)(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_p_AtomForce, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "wrap_forceMG" "', argument " "6"" of type '" "AtomForce *[NOSH_MAXCALC]""'"); 
+  } 
+  arg6 = (AtomForce **)(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_p_Valist, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "wrap_forceMG" "', argument " "7"" of type '" "Valist *[NOSH_MAXMOL]""'"); 
+  } 
+  arg7 = (Valist **)(argp7);
+  res8 = SWIG_ConvertPtr(swig_obj[7], &argp8,SWIGTYPE_p_int, 0 |  0 );
+  if (!SWIG_IsOK(res8)) {
+    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "wrap_forceMG" "', argument " "8"" of type '" "int [NOSH_MAXCALC]""'"); 
+  } 
+  arg8 = (int *)(argp8);
+  ecode9 = SWIG_AsVal_int(swig_obj[8], &val9);
+  if (!SWIG_IsOK(ecode9)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode9), "in method '" "wrap_forceMG" "', argument " "9"" of type '" "int""'");
+  } 
+  arg9 = (int)(val9);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)wrap_forceMG(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_getAtomForceData(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  AtomForce **arg1 = (AtomForce **) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "getAtomForceData", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_AtomForce, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "getAtomForceData" "', argument " "1"" of type '" "AtomForce **""'"); 
+  }
+  arg1 = (AtomForce **)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "getAtomForceData" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (PyObject *)getAtomForceData(arg1,arg2);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_setAtomForceData(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vmem *arg1 = (Vmem *) 0 ;
+  AtomForce **arg2 = (AtomForce **) 0 ;
+  int *arg3 ;
+  int arg4 ;
+  PyObject *arg5 = (PyObject *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  PyObject *swig_obj[5] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "setAtomForceData", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vmem, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "setAtomForceData" "', argument " "1"" of type '" "Vmem *""'"); 
+  }
+  arg1 = (Vmem *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_AtomForce, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "setAtomForceData" "', argument " "2"" of type '" "AtomForce **""'"); 
+  }
+  arg2 = (AtomForce **)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_int, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "setAtomForceData" "', argument " "3"" of type '" "int [NOSH_MAXCALC]""'"); 
+  } 
+  arg3 = (int *)(argp3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "setAtomForceData" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = (int)(val4);
+  arg5 = swig_obj[4];
+  result = (int)setAtomForceData(arg1,arg2,arg3,arg4,arg5);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_getAtomPosition(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vatom *arg1 = (Vatom *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  PyObject *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vatom, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "getAtomPosition" "', argument " "1"" of type '" "Vatom *""'"); 
+  }
+  arg1 = (Vatom *)(argp1);
+  result = (PyObject *)getAtomPosition(arg1);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_getPotentialsList(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  PBEparm *arg2 = (PBEparm *) 0 ;
+  Vpmg *arg3 = (Vpmg *) 0 ;
+  Valist *arg4 = (Valist *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "getPotentialsList", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "getPotentialsList" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "getPotentialsList" "', argument " "2"" of type '" "PBEparm *""'"); 
+  }
+  arg2 = (PBEparm *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "getPotentialsList" "', argument " "3"" of type '" "Vpmg *""'"); 
+  }
+  arg3 = (Vpmg *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_Valist, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "getPotentialsList" "', argument " "4"" of type '" "Valist *""'"); 
+  }
+  arg4 = (Valist *)(argp4);
+  result = (PyObject *)getPotentials(arg1,arg2,arg3,arg4);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_getEnergiesList(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vpmg *arg1 = (Vpmg *) 0 ;
+  Valist *arg2 = (Valist *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "getEnergiesList", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "getEnergiesList" "', argument " "1"" of type '" "Vpmg *""'"); 
+  }
+  arg1 = (Vpmg *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_Valist, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "getEnergiesList" "', argument " "2"" of type '" "Valist *""'"); 
+  }
+  arg2 = (Valist *)(argp2);
+  result = (PyObject *)getEnergies(arg1,arg2);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_fillPotentials(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  PBEparm *arg2 = (PBEparm *) 0 ;
+  Vpmg *arg3 = (Vpmg *) 0 ;
+  Valist *arg4 = (Valist *) 0 ;
+  PyObject *arg5 = (PyObject *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[5] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "fillPotentials", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "fillPotentials" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "fillPotentials" "', argument " "2"" of type '" "PBEparm *""'"); 
+  }
+  arg2 = (PBEparm *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "fillPotentials" "', argument " "3"" of type '" "Vpmg *""'"); 
+  }
+  arg3 = (Vpmg *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_Valist, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "fillPotentials" "', argument " "4"" of type '" "Valist *""'"); 
+  }
+  arg4 = (Valist *)(argp4);
+  arg5 = swig_obj[4];
+  result = (int)fillPotentials(arg1,arg2,arg3,arg4,arg5);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_fillEnergies(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vpmg *arg1 = (Vpmg *) 0 ;
+  Valist *arg2 = (Valist *) 0 ;
+  PyObject *arg3 = (PyObject *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[3] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "fillEnergies", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "fillEnergies" "', argument " "1"" of type '" "Vpmg *""'"); 
+  }
+  arg1 = (Vpmg *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_Valist, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "fillEnergies" "', argument " "2"" of type '" "Valist *""'"); 
+  }
+  arg2 = (Valist *)(argp2);
+  arg3 = swig_obj[2];
+  result = (int)fillEnergies(arg1,arg2,arg3);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_fillForces(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  AtomForce **arg1 = (AtomForce **) 0 ;
+  Valist *arg2 = (Valist *) 0 ;
+  PyObject *arg3 = (PyObject *) 0 ;
+  PyObject *arg4 = (PyObject *) 0 ;
+  PyObject *arg5 = (PyObject *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[5] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "fillForces", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_AtomForce, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "fillForces" "', argument " "1"" of type '" "AtomForce **""'"); 
+  }
+  arg1 = (AtomForce **)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_Valist, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "fillForces" "', argument " "2"" of type '" "Valist *""'"); 
+  }
+  arg2 = (Valist *)(argp2);
+  arg3 = swig_obj[2];
+  arg4 = swig_obj[3];
+  arg5 = swig_obj[4];
+  result = (int)fillForces(arg1,arg2,arg3,arg4,arg5);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_getForcesList(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  AtomForce **arg1 = (AtomForce **) 0 ;
+  Valist *arg2 = (Valist *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "getForcesList", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_AtomForce, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "getForcesList" "', argument " "1"" of type '" "AtomForce **""'"); 
+  }
+  arg1 = (AtomForce **)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_Valist, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "getForcesList" "', argument " "2"" of type '" "Valist *""'"); 
+  }
+  arg2 = (Valist *)(argp2);
+  result = (PyObject *)getForces(arg1,arg2);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_getGridData(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vpmg *arg1 = (Vpmg *) 0 ;
+  char *arg2 = (char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  PyObject *swig_obj[2] ;
+  double *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "getGridData", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "getGridData" "', argument " "1"" of type '" "Vpmg *""'"); 
+  }
+  arg1 = (Vpmg *)(argp1);
+  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "getGridData" "', argument " "2"" of type '" "char *""'");
+  }
+  arg2 = (char *)(buf2);
+  result = (double *)getGridData(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_double, 0 |  0 );
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_getGridBuffer(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vpmg *arg1 = (Vpmg *) 0 ;
+  char *arg2 = (char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  PyObject *swig_obj[2] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "getGridBuffer", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "getGridBuffer" "', argument " "1"" of type '" "Vpmg *""'"); 
+  }
+  arg1 = (Vpmg *)(argp1);
+  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "getGridBuffer" "', argument " "2"" of type '" "char *""'");
+  }
+  arg2 = (char *)(buf2);
+  result = (PyObject *)getGridBuffer(arg1,arg2);
+  resultobj = result;
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_getGridInfo(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vpmg *arg1 = (Vpmg *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  PyObject *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "getGridInfo" "', argument " "1"" of type '" "Vpmg *""'"); 
+  }
+  arg1 = (Vpmg *)(argp1);
+  result = (PyObject *)getGridInfo(arg1);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_getStatsRecord(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "getStatsRecord", 0, 0, 0)) SWIG_fail;
+  result = (PyObject *)getStatsRecord();
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_getCycles(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vpmg *arg1 = (Vpmg *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  PyObject *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "getCycles" "', argument " "1"" of type '" "Vpmg *""'"); 
+  }
+  arg1 = (Vpmg *)(argp1);
+  result = (PyObject *)getCycles(arg1);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_loadMolecules(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Vparam *arg2 = (Vparam *) 0 ;
+  Valist **arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "loadMolecules", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "loadMolecules" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_Vparam, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "loadMolecules" "', argument " "2"" of type '" "Vparam *""'"); 
+  }
+  arg2 = (Vparam *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_p_Valist, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "loadMolecules" "', argument " "3"" of type '" "Valist *[NOSH_MAXMOL]""'"); 
+  } 
+  arg3 = (Valist **)(argp3);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)loadMolecules(arg1,arg2,arg3);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_killMolecules(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Valist **arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "killMolecules", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "killMolecules" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_Valist, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "killMolecules" "', argument " "2"" of type '" "Valist *[NOSH_MAXMOL]""'"); 
+  } 
+  arg2 = (Valist **)(argp2);
+  killMolecules(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_loadDielMaps(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Vgrid **arg2 ;
+  Vgrid **arg3 ;
+  Vgrid **arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "loadDielMaps", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "loadDielMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "loadDielMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg2 = (Vgrid **)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "loadDielMaps" "', argument " "3"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg3 = (Vgrid **)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "loadDielMaps" "', argument " "4"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg4 = (Vgrid **)(argp4);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)loadDielMaps(arg1,arg2,arg3,arg4);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_killDielMaps(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Vgrid **arg2 ;
+  Vgrid **arg3 ;
+  Vgrid **arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "killDielMaps", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "killDielMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "killDielMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg2 = (Vgrid **)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "killDielMaps" "', argument " "3"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg3 = (Vgrid **)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "killDielMaps" "', argument " "4"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg4 = (Vgrid **)(argp4);
+  killDielMaps(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_loadKappaMaps(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Vgrid **arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "loadKappaMaps", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "loadKappaMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "loadKappaMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg2 = (Vgrid **)(argp2);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)loadKappaMaps(arg1,arg2);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_killKappaMaps(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Vgrid **arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "killKappaMaps", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "killKappaMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "killKappaMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg2 = (Vgrid **)(argp2);
+  killKappaMaps(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_loadPotMaps(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Vgrid **arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "loadPotMaps", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "loadPotMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "loadPotMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg2 = (Vgrid **)(argp2);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)loadPotMaps(arg1,arg2);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_killPotMaps(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Vgrid **arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "killPotMaps", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "killPotMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "killPotMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg2 = (Vgrid **)(argp2);
+  killPotMaps(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_loadChargeMaps(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Vgrid **arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "loadChargeMaps", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "loadChargeMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "loadChargeMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg2 = (Vgrid **)(argp2);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)loadChargeMaps(arg1,arg2);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_killChargeMaps(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Vgrid **arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "killChargeMaps", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "killChargeMaps" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "killChargeMaps" "', argument " "2"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg2 = (Vgrid **)(argp2);
+  killChargeMaps(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_printPBEPARM(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  PBEparm *arg1 = (PBEparm *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printPBEPARM" "', argument " "1"" of type '" "PBEparm *""'"); 
+  }
+  arg1 = (PBEparm *)(argp1);
+  printPBEPARM(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_printMGPARM(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  MGparm *arg1 = (MGparm *) 0 ;
+  double *arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "printMGPARM", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printMGPARM" "', argument " "1"" of type '" "MGparm *""'"); 
+  }
+  arg1 = (MGparm *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "printMGPARM" "', argument " "2"" of type '" "double [3]""'"); 
+  } 
+  arg2 = (double *)(argp2);
+  printMGPARM(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_initMG(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  NOsh *arg2 = (NOsh *) 0 ;
+  MGparm *arg3 = (MGparm *) 0 ;
+  PBEparm *arg4 = (PBEparm *) 0 ;
+  double *arg5 ;
+  Vpbe **arg6 ;
+  Valist **arg7 ;
+  Vgrid **arg8 ;
+  Vgrid **arg9 ;
+  Vgrid **arg10 ;
+  Vgrid **arg11 ;
+  Vgrid **arg12 ;
+  Vpmgp **arg13 ;
+  Vpmg **arg14 ;
+  Vgrid **arg15 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  void *argp8 = 0 ;
+  int res8 = 0 ;
+  void *argp9 = 0 ;
+  int res9 = 0 ;
+  void *argp10 = 0 ;
+  int res10 = 0 ;
+  void *argp11 = 0 ;
+  int res11 = 0 ;
+  void *argp12 = 0 ;
+  int res12 = 0 ;
+  void *argp13 = 0 ;
+  int res13 = 0 ;
+  void *argp14 = 0 ;
+  int res14 = 0 ;
+  void *argp15 = 0 ;
+  int res15 = 0 ;
+  PyObject *swig_obj[15] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "initMG", 15, 15, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "initMG" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "initMG" "', argument " "2"" of type '" "NOsh *""'"); 
+  }
+  arg2 = (NOsh *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "initMG" "', argument " "3"" of type '" "MGparm *""'"); 
+  }
+  arg3 = (MGparm *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "initMG" "', argument " "4"" of type '" "PBEparm *""'"); 
+  }
+  arg4 = (PBEparm *)(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "initMG" "', argument " "5"" of type '" "double [3]""'"); 
+  } 
+  arg5 = (double *)(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_p_Vpbe, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "initMG" "', argument " "6"" of type '" "Vpbe *[NOSH_MAXCALC]""'"); 
+  } 
+  arg6 = (Vpbe **)(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_p_Valist, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "initMG" "', argument " "7"" of type '" "Valist *[NOSH_MAXMOL]""'"); 
+  } 
+  arg7 = (Valist **)(argp7);
+  res8 = SWIG_ConvertPtr(swig_obj[7], &argp8,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res8)) {
+    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "initMG" "', argument " "8"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg8 = (Vgrid **)(argp8);
+  res9 = SWIG_ConvertPtr(swig_obj[8], &argp9,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res9)) {
+    SWIG_exception_fail(SWIG_ArgError(res9), "in method '" "initMG" "', argument " "9"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg9 = (Vgrid **)(argp9);
+  res10 = SWIG_ConvertPtr(swig_obj[9], &argp10,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res10)) {
+    SWIG_exception_fail(SWIG_ArgError(res10), "in method '" "initMG" "', argument " "10"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg10 = (Vgrid **)(argp10);
+  res11 = SWIG_ConvertPtr(swig_obj[10], &argp11,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res11)) {
+    SWIG_exception_fail(SWIG_ArgError(res11), "in method '" "initMG" "', argument " "11"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg11 = (Vgrid **)(argp11);
+  res12 = SWIG_ConvertPtr(swig_obj[11], &argp12,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res12)) {
+    SWIG_exception_fail(SWIG_ArgError(res12), "in method '" "initMG" "', argument " "12"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg12 = (Vgrid **)(argp12);
+  res13 = SWIG_ConvertPtr(swig_obj[12], &argp13,SWIGTYPE_p_p_Vpmgp, 0 |  0 );
+  if (!SWIG_IsOK(res13)) {
+    SWIG_exception_fail(SWIG_ArgError(res13), "in method '" "initMG" "', argument " "13"" of type '" "Vpmgp *[NOSH_MAXCALC]""'"); 
+  } 
+  arg13 = (Vpmgp **)(argp13);
+  res14 = SWIG_ConvertPtr(swig_obj[13], &argp14,SWIGTYPE_p_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res14)) {
+    SWIG_exception_fail(SWIG_ArgError(res14), "in method '" "initMG" "', argument " "14"" of type '" "Vpmg *[NOSH_MAXCALC]""'"); 
+  } 
+  arg14 = (Vpmg **)(argp14);
+  res15 = SWIG_ConvertPtr(swig_obj[14], &argp15,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res15)) {
+    SWIG_exception_fail(SWIG_ArgError(res15), "in method '" "initMG" "', argument " "15"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg15 = (Vgrid **)(argp15);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)initMG(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9,arg10,arg11,arg12,arg13,arg14,arg15);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_killMG(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Vpbe **arg2 ;
+  Vpmgp **arg3 ;
+  Vpmg **arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "killMG", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "killMG" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_Vpbe, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "killMG" "', argument " "2"" of type '" "Vpbe *[NOSH_MAXCALC]""'"); 
+  } 
+  arg2 = (Vpbe **)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_p_Vpmgp, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "killMG" "', argument " "3"" of type '" "Vpmgp *[NOSH_MAXCALC]""'"); 
+  } 
+  arg3 = (Vpmgp **)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "killMG" "', argument " "4"" of type '" "Vpmg *[NOSH_MAXCALC]""'"); 
+  } 
+  arg4 = (Vpmg **)(argp4);
+  killMG(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_reinitMG(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  NOsh *arg2 = (NOsh *) 0 ;
+  MGparm *arg3 = (MGparm *) 0 ;
+  PBEparm *arg4 = (PBEparm *) 0 ;
+  double *arg5 ;
+  Vpbe **arg6 ;
+  Valist **arg7 ;
+  Vgrid **arg8 ;
+  Vgrid **arg9 ;
+  Vgrid **arg10 ;
+  Vgrid **arg11 ;
+  Vgrid **arg12 ;
+  Vpmgp **arg13 ;
+  Vpmg **arg14 ;
+  Vgrid **arg15 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  void *argp8 = 0 ;
+  int res8 = 0 ;
+  void *argp9 = 0 ;
+  int res9 = 0 ;
+  void *argp10 = 0 ;
+  int res10 = 0 ;
+  void *argp11 = 0 ;
+  int res11 = 0 ;
+  void *argp12 = 0 ;
+  int res12 = 0 ;
+  void *argp13 = 0 ;
+  int res13 = 0 ;
+  void *argp14 = 0 ;
+  int res14 = 0 ;
+  void *argp15 = 0 ;
+  int res15 = 0 ;
+  PyObject *swig_obj[15] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "reinitMG", 15, 15, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "reinitMG" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "reinitMG" "', argument " "2"" of type '" "NOsh *""'"); 
+  }
+  arg2 = (NOsh *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "reinitMG" "', argument " "3"" of type '" "MGparm *""'"); 
+  }
+  arg3 = (MGparm *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "reinitMG" "', argument " "4"" of type '" "PBEparm *""'"); 
+  }
+  arg4 = (PBEparm *)(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "reinitMG" "', argument " "5"" of type '" "double [3]""'"); 
+  } 
+  arg5 = (double *)(argp5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_p_Vpbe, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "reinitMG" "', argument " "6"" of type '" "Vpbe *[NOSH_MAXCALC]""'"); 
+  } 
+  arg6 = (Vpbe **)(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_p_Valist, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "reinitMG" "', argument " "7"" of type '" "Valist *[NOSH_MAXMOL]""'"); 
+  } 
+  arg7 = (Valist **)(argp7);
+  res8 = SWIG_ConvertPtr(swig_obj[7], &argp8,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res8)) {
+    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "reinitMG" "', argument " "8"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg8 = (Vgrid **)(argp8);
+  res9 = SWIG_ConvertPtr(swig_obj[8], &argp9,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res9)) {
+    SWIG_exception_fail(SWIG_ArgError(res9), "in method '" "reinitMG" "', argument " "9"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg9 = (Vgrid **)(argp9);
+  res10 = SWIG_ConvertPtr(swig_obj[9], &argp10,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res10)) {
+    SWIG_exception_fail(SWIG_ArgError(res10), "in method '" "reinitMG" "', argument " "10"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg10 = (Vgrid **)(argp10);
+  res11 = SWIG_ConvertPtr(swig_obj[10], &argp11,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res11)) {
+    SWIG_exception_fail(SWIG_ArgError(res11), "in method '" "reinitMG" "', argument " "11"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg11 = (Vgrid **)(argp11);
+  res12 = SWIG_ConvertPtr(swig_obj[11], &argp12,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res12)) {
+    SWIG_exception_fail(SWIG_ArgError(res12), "in method '" "reinitMG" "', argument " "12"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg12 = (Vgrid **)(argp12);
+  res13 = SWIG_ConvertPtr(swig_obj[12], &argp13,SWIGTYPE_p_p_Vpmgp, 0 |  0 );
+  if (!SWIG_IsOK(res13)) {
+    SWIG_exception_fail(SWIG_ArgError(res13), "in method '" "reinitMG" "', argument " "13"" of type '" "Vpmgp *[NOSH_MAXCALC]""'"); 
+  } 
+  arg13 = (Vpmgp **)(argp13);
+  res14 = SWIG_ConvertPtr(swig_obj[13], &argp14,SWIGTYPE_p_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res14)) {
+    SWIG_exception_fail(SWIG_ArgError(res14), "in method '" "reinitMG" "', argument " "14"" of type '" "Vpmg *[NOSH_MAXCALC]""'"); 
+  } 
+  arg14 = (Vpmg **)(argp14);
+  res15 = SWIG_ConvertPtr(swig_obj[14], &argp15,SWIGTYPE_p_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res15)) {
+    SWIG_exception_fail(SWIG_ArgError(res15), "in method '" "reinitMG" "', argument " "15"" of type '" "Vgrid *[NOSH_MAXMOL]""'"); 
+  } 
+  arg15 = (Vgrid **)(argp15);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)reinitMG(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9,arg10,arg11,arg12,arg13,arg14,arg15);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_killAllMG(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Vpbe **arg2 ;
+  Vpmgp **arg3 ;
+  Vpmg **arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "killAllMG", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "killAllMG" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_Vpbe, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "killAllMG" "', argument " "2"" of type '" "Vpbe *[NOSH_MAXCALC]""'"); 
+  } 
+  arg2 = (Vpbe **)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_p_Vpmgp, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "killAllMG" "', argument " "3"" of type '" "Vpmgp *[NOSH_MAXCALC]""'"); 
+  } 
+  arg3 = (Vpmgp **)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "killAllMG" "', argument " "4"" of type '" "Vpmg *[NOSH_MAXCALC]""'"); 
+  } 
+  arg4 = (Vpmg **)(argp4);
+  killAllMG(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_solveMG(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Vpmg *arg2 = (Vpmg *) 0 ;
+  MGparm_CalcType arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "solveMG", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "solveMG" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "solveMG" "', argument " "2"" of type '" "Vpmg *""'"); 
+  }
+  arg2 = (Vpmg *)(argp2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "solveMG" "', argument " "3"" of type '" "MGparm_CalcType""'");
+  } 
+  arg3 = (MGparm_CalcType)(val3);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)solveMG(arg1,arg2,arg3);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_guessMG(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  Vpmg *arg2 = (Vpmg *) 0 ;
+  Vgrid *arg3 = (Vgrid *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "guessMG", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "guessMG" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "guessMG" "', argument " "2"" of type '" "Vpmg *""'"); 
+  }
+  arg2 = (Vpmg *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_Vgrid, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "guessMG" "', argument " "3"" of type '" "Vgrid *""'"); 
+  }
+  arg3 = (Vgrid *)(argp3);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)guessMG(arg1,arg2,arg3);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_saveGuessMG(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vpmg *arg1 = (Vpmg *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  Vgrid *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "saveGuessMG" "', argument " "1"" of type '" "Vpmg *""'"); 
+  }
+  arg1 = (Vpmg *)(argp1);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (Vgrid *)saveGuessMG(arg1);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vgrid, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_loadGuessMG(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  char *arg1 = (char *) 0 ;
+  int res1 ;
+  char *buf1 = 0 ;
+  int alloc1 = 0 ;
+  PyObject *swig_obj[1] ;
+  Vgrid *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_AsCharPtrAndSize(swig_obj[0], &buf1, NULL, &alloc1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "loadGuessMG" "', argument " "1"" of type '" "char *""'");
+  }
+  arg1 = (char *)(buf1);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (Vgrid *)loadGuessMG(arg1);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Vgrid, 0 |  0 );
+  if (alloc1 == SWIG_NEWOBJ) free((char*)buf1);
+  return resultobj;
+fail:
+  if (alloc1 == SWIG_NEWOBJ) free((char*)buf1);
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_setPartMG(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  MGparm *arg2 = (MGparm *) 0 ;
+  Vpmg *arg3 = (Vpmg *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "setPartMG", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "setPartMG" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_MGparm, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "setPartMG" "', argument " "2"" of type '" "MGparm *""'"); 
+  }
+  arg2 = (MGparm *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "setPartMG" "', argument " "3"" of type '" "Vpmg *""'"); 
+  }
+  arg3 = (Vpmg *)(argp3);
+  result = (int)setPartMG(arg1,arg2,arg3);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_killEnergy(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  
+  if (!SWIG_Python_UnpackTuple(args, "killEnergy", 0, 0, 0)) SWIG_fail;
+  killEnergy();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_killForce(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vmem *arg1 = (Vmem *) 0 ;
+  NOsh *arg2 = (NOsh *) 0 ;
+  int *arg3 ;
+  AtomForce **arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "killForce", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vmem, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "killForce" "', argument " "1"" of type '" "Vmem *""'"); 
+  }
+  arg1 = (Vmem *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "killForce" "', argument " "2"" of type '" "NOsh *""'"); 
+  }
+  arg2 = (NOsh *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_int, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "killForce" "', argument " "3"" of type '" "int [NOSH_MAXCALC]""'"); 
+  } 
+  arg3 = (int *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_p_AtomForce, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "killForce" "', argument " "4"" of type '" "AtomForce *[NOSH_MAXCALC]""'"); 
+  } 
+  arg4 = (AtomForce **)(argp4);
+  killForce(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_writedataMG(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  NOsh *arg2 = (NOsh *) 0 ;
+  PBEparm *arg3 = (PBEparm *) 0 ;
+  Vpmg *arg4 = (Vpmg *) 0 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "writedataMG", 4, 4, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "writedataMG" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "writedataMG" "', argument " "2"" of type '" "NOsh *""'"); 
+  }
+  arg2 = (NOsh *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "writedataMG" "', argument " "3"" of type '" "PBEparm *""'"); 
+  }
+  arg3 = (PBEparm *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "writedataMG" "', argument " "4"" of type '" "Vpmg *""'"); 
+  }
+  arg4 = (Vpmg *)(argp4);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)writedataMG(arg1,arg2,arg3,arg4);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_writematMG(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  NOsh *arg2 = (NOsh *) 0 ;
+  PBEparm *arg3 = (PBEparm *) 0 ;
+  Vpmg *arg4 = (Vpmg *) 0 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "writematMG", 4, 4, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "writematMG" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "writematMG" "', argument " "2"" of type '" "NOsh *""'"); 
+  }
+  arg2 = (NOsh *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_PBEparm, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "writematMG" "', argument " "3"" of type '" "PBEparm *""'"); 
+  }
+  arg3 = (PBEparm *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "writematMG" "', argument " "4"" of type '" "Vpmg *""'"); 
+  }
+  arg4 = (Vpmg *)(argp4);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)writematMG(arg1,arg2,arg3,arg4);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_printForce(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vcom *arg1 = (Vcom *) 0 ;
+  NOsh *arg2 = (NOsh *) 0 ;
+  int *arg3 ;
+  AtomForce **arg4 ;
+  int arg5 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  int val5 ;
+  int ecode5 = 0 ;
+  PyObject *swig_obj[5] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "printForce", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printForce" "', argument " "1"" of type '" "Vcom *""'"); 
+  }
+  arg1 = (Vcom *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "printForce" "', argument " "2"" of type '" "NOsh *""'"); 
+  }
+  arg2 = (NOsh *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_int, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "printForce" "', argument " "3"" of type '" "int [NOSH_MAXCALC]""'"); 
+  } 
+  arg3 = (int *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_p_AtomForce, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "printForce" "', argument " "4"" of type '" "AtomForce *[NOSH_MAXCALC]""'"); 
+  } 
+  arg4 = (AtomForce **)(argp4);
+  ecode5 = SWIG_AsVal_int(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "printForce" "', argument " "5"" of type '" "int""'");
+  } 
+  arg5 = (int)(val5);
+  result = (int)printForce(arg1,arg2,arg3,arg4,arg5);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_printElecForce(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vcom *arg1 = (Vcom *) 0 ;
+  NOsh *arg2 = (NOsh *) 0 ;
+  int *arg3 ;
+  AtomForce **arg4 ;
+  int arg5 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  int val5 ;
+  int ecode5 = 0 ;
+  PyObject *swig_obj[5] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "printElecForce", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printElecForce" "', argument " "1"" of type '" "Vcom *""'"); 
+  }
+  arg1 = (Vcom *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "printElecForce" "', argument " "2"" of type '" "NOsh *""'"); 
+  }
+  arg2 = (NOsh *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_int, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "printElecForce" "', argument " "3"" of type '" "int [NOSH_MAXCALC]""'"); 
+  } 
+  arg3 = (int *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_p_AtomForce, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "printElecForce" "', argument " "4"" of type '" "AtomForce *[NOSH_MAXCALC]""'"); 
+  } 
+  arg4 = (AtomForce **)(argp4);
+  ecode5 = SWIG_AsVal_int(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "printElecForce" "', argument " "5"" of type '" "int""'");
+  } 
+  arg5 = (int)(val5);
+  result = (int)printElecForce(arg1,arg2,arg3,arg4,arg5);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_printApolForce(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vcom *arg1 = (Vcom *) 0 ;
+  NOsh *arg2 = (NOsh *) 0 ;
+  int *arg3 ;
+  AtomForce **arg4 ;
+  int arg5 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  int val5 ;
+  int ecode5 = 0 ;
+  PyObject *swig_obj[5] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "printApolForce", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printApolForce" "', argument " "1"" of type '" "Vcom *""'"); 
+  }
+  arg1 = (Vcom *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "printApolForce" "', argument " "2"" of type '" "NOsh *""'"); 
+  }
+  arg2 = (NOsh *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_int, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "printApolForce" "', argument " "3"" of type '" "int [NOSH_MAXCALC]""'"); 
+  } 
+  arg3 = (int *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_p_AtomForce, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "printApolForce" "', argument " "4"" of type '" "AtomForce *[NOSH_MAXCALC]""'"); 
+  } 
+  arg4 = (AtomForce **)(argp4);
+  ecode5 = SWIG_AsVal_int(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "printApolForce" "', argument " "5"" of type '" "int""'");
+  } 
+  arg5 = (int)(val5);
+  result = (int)printApolForce(arg1,arg2,arg3,arg4,arg5);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_startVio(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  
+  if (!SWIG_Python_UnpackTuple(args, "startVio", 0, 0, 0)) SWIG_fail;
+  startVio();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_startStats(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  APBSphase arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "startStats" "', argument " "1"" of type '" "APBSphase""'");
+  } 
+  arg1 = (APBSphase)(val1);
+  startStats(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_stopStats(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  APBSphase arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "stopStats" "', argument " "1"" of type '" "APBSphase""'");
+  } 
+  arg1 = (APBSphase)(val1);
+  stopStats(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_resetStats(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  
+  if (!SWIG_Python_UnpackTuple(args, "resetStats", 0, 0, 0)) SWIG_fail;
+  resetStats();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Vacc_molAcc(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vacc *arg1 = (Vacc *) 0 ;
+  double *arg2 ;
+  double arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  double result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "Vacc_molAcc", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vacc, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vacc_molAcc" "', argument " "1"" of type '" "Vacc *""'"); 
+  }
+  arg1 = (Vacc *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Vacc_molAcc" "', argument " "2"" of type '" "double [3]""'"); 
+  } 
+  arg2 = (double *)(argp2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "Vacc_molAcc" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  result = (double)Vacc_molAcc(arg1,arg2,arg3);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Vacc_vdwAcc(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vacc *arg1 = (Vacc *) 0 ;
+  double *arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  double result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "Vacc_vdwAcc", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vacc, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Vacc_vdwAcc" "', argument " "1"" of type '" "Vacc *""'"); 
+  }
+  arg1 = (Vacc *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Vacc_vdwAcc" "', argument " "2"" of type '" "double [3]""'"); 
+  } 
+  arg2 = (double *)(argp2);
+  result = (double)Vacc_vdwAcc(arg1,arg2);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_energyMG(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  int arg2 ;
+  Vpmg *arg3 = (Vpmg *) 0 ;
+  int *arg4 = (int *) 0 ;
+  double *arg5 = (double *) 0 ;
+  double *arg6 = (double *) 0 ;
+  double *arg7 = (double *) 0 ;
+  double *arg8 = (double *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  int temp4 ;
+  int res4 = 0 ;
+  double temp5 ;
+  int res5 = 0 ;
+  double temp6 ;
+  int res6 = 0 ;
+  double temp7 ;
+  int res7 = 0 ;
+  double temp8 ;
+  int res8 = 0 ;
+  PyObject *swig_obj[8] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "energyMG", 8, 8, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "energyMG" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "energyMG" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_Vpmg, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "energyMG" "', argument " "3"" of type '" "Vpmg *""'"); 
+  }
+  arg3 = (Vpmg *)(argp3);
+  if (!(SWIG_IsOK((res4 = SWIG_ConvertPtr(swig_obj[3],SWIG_as_voidptrptr(&arg4),SWIGTYPE_p_int,0))))) {
+    int val; 
+    int ecode = SWIG_AsVal_int(swig_obj[3], &val);
+    if (!SWIG_IsOK(ecode)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode), "in method '" "energyMG" "', argument " "4"" of type '" "int""'");
+    }
+    temp4 = (int)(val);
+    arg4 = &temp4;
+    res4 = SWIG_AddTmpMask(ecode);
+  }
+  if (!(SWIG_IsOK((res5 = SWIG_ConvertPtr(swig_obj[4],SWIG_as_voidptrptr(&arg5),SWIGTYPE_p_double,0))))) {
+    double val; 
+    int ecode = SWIG_AsVal_double(swig_obj[4], &val);
+    if (!SWIG_IsOK(ecode)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode), "in method '" "energyMG" "', argument " "5"" of type '" "double""'");
+    }
+    temp5 = (double)(val);
+    arg5 = &temp5;
+    res5 = SWIG_AddTmpMask(ecode);
+  }
+  if (!(SWIG_IsOK((res6 = SWIG_ConvertPtr(swig_obj[5],SWIG_as_voidptrptr(&arg6),SWIGTYPE_p_double,0))))) {
+    double val; 
+    int ecode = SWIG_AsVal_double(swig_obj[5], &val);
+    if (!SWIG_IsOK(ecode)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode), "in method '" "energyMG" "', argument " "6"" of type '" "double""'");
+    }
+    temp6 = (double)(val);
+    arg6 = &temp6;
+    res6 = SWIG_AddTmpMask(ecode);
+  }
+  if (!(SWIG_IsOK((res7 = SWIG_ConvertPtr(swig_obj[6],SWIG_as_voidptrptr(&arg7),SWIGTYPE_p_double,0))))) {
+    double val; 
+    int ecode = SWIG_AsVal_double(swig_obj[6], &val);
+    if (!SWIG_IsOK(ecode)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode), "in method '" "energyMG" "', argument " "7"" of type '" "double""'");
+    }
+    temp7 = (double)(val);
+    arg7 = &temp7;
+    res7 = SWIG_AddTmpMask(ecode);
+  }
+  if (!(SWIG_IsOK((res8 = SWIG_ConvertPtr(swig_obj[7],SWIG_as_voidptrptr(&arg8),SWIGTYPE_p_double,0))))) {
+    double val; 
+    int ecode = SWIG_AsVal_double(swig_obj[7], &val);
+    if (!SWIG_IsOK(ecode)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode), "in method '" "energyMG" "', argument " "8"" of type '" "double""'");
+    }
+    temp8 = (double)(val);
+    arg8 = &temp8;
+    res8 = SWIG_AddTmpMask(ecode);
+  }
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = (int)energyMG(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8);
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_From_int((int)(result));
+  if (SWIG_IsTmpObj(res5)) {
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_From_double((*arg5)));
+  } else {
+    int new_flags = SWIG_IsNewObj(res5) ? (SWIG_POINTER_OWN |  0 ) :  0 ;
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((void*)(arg5), SWIGTYPE_p_double, new_flags));
+  }
+  if (SWIG_IsNewObj(res4)) free((char*)arg4);
+  if (SWIG_IsNewObj(res6)) free((char*)arg6);
+  if (SWIG_IsNewObj(res7)) free((char*)arg7);
+  if (SWIG_IsNewObj(res8)) free((char*)arg8);
+  return resultobj;
+fail:
+  if (SWIG_IsNewObj(res4)) free((char*)arg4);
+  if (SWIG_IsNewObj(res6)) free((char*)arg6);
+  if (SWIG_IsNewObj(res7)) free((char*)arg7);
+  if (SWIG_IsNewObj(res8)) free((char*)arg8);
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_printEnergy(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vcom *arg1 = (Vcom *) 0 ;
+  NOsh *arg2 = (NOsh *) 0 ;
+  double *arg3 ;
+  int arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  PyObject *swig_obj[4] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "printEnergy", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printEnergy" "', argument " "1"" of type '" "Vcom *""'"); 
+  }
+  arg1 = (Vcom *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "printEnergy" "', argument " "2"" of type '" "NOsh *""'"); 
+  }
+  arg2 = (NOsh *)(argp2);
+  {
+    /* Check if is a list */
+    if (PyList_Check(swig_obj[2])) {
+      int size = PyList_Size(swig_obj[2]);
+      int i = 0;
+      arg3 = (double *) malloc((size+1)*sizeof(double));
+      for (i = 0; i < size; i++) {
+        PyObject *o = PyList_GetItem(swig_obj[2],i);
+        if (PyFloat_Check(o))
+        arg3[i] = PyFloat_AsDouble(PyList_GetItem(swig_obj[2],i));
+        else {
+          PyErr_SetString(PyExc_TypeError,"list must contain floats");
+          free(arg3);
+          return NULL;
+        }
+      }
+      arg3[i] = 0;
+    } else {
+      PyErr_SetString(PyExc_TypeError,"not a list");
+      return NULL;
+    }
+  }
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "printEnergy" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = (int)(val4);
+  result = (int)printEnergy(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_printElecEnergy(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vcom *arg1 = (Vcom *) 0 ;
+  NOsh *arg2 = (NOsh *) 0 ;
+  double *arg3 ;
+  int arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  PyObject *swig_obj[4] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "printElecEnergy", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printElecEnergy" "', argument " "1"" of type '" "Vcom *""'"); 
+  }
+  arg1 = (Vcom *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "printElecEnergy" "', argument " "2"" of type '" "NOsh *""'"); 
+  }
+  arg2 = (NOsh *)(argp2);
+  {
+    /* Check if is a list */
+    if (PyList_Check(swig_obj[2])) {
+      int size = PyList_Size(swig_obj[2]);
+      int i = 0;
+      arg3 = (double *) malloc((size+1)*sizeof(double));
+      for (i = 0; i < size; i++) {
+        PyObject *o = PyList_GetItem(swig_obj[2],i);
+        if (PyFloat_Check(o))
+        arg3[i] = PyFloat_AsDouble(PyList_GetItem(swig_obj[2],i));
+        else {
+          PyErr_SetString(PyExc_TypeError,"list must contain floats");
+          free(arg3);
+          return NULL;
+        }
+      }
+      arg3[i] = 0;
+    } else {
+      PyErr_SetString(PyExc_TypeError,"not a list");
+      return NULL;
+    }
+  }
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "printElecEnergy" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = (int)(val4);
+  result = (int)printElecEnergy(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_printApolEnergy(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  NOsh *arg1 = (NOsh *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "printApolEnergy", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "printApolEnergy" "', argument " "1"" of type '" "NOsh *""'"); 
+  }
+  arg1 = (NOsh *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "printApolEnergy" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (int)printApolEnergy(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_returnEnergy(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Vcom *arg1 = (Vcom *) 0 ;
+  NOsh *arg2 = (NOsh *) 0 ;
+  double *arg3 ;
+  int arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  PyObject *swig_obj[4] ;
+  double result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "returnEnergy", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "returnEnergy" "', argument " "1"" of type '" "Vcom *""'"); 
+  }
+  arg1 = (Vcom *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "returnEnergy" "', argument " "2"" of type '" "NOsh *""'"); 
+  }
+  arg2 = (NOsh *)(argp2);
+  {
+    /* Check if is a list */
+    if (PyList_Check(swig_obj[2])) {
+      int size = PyList_Size(swig_obj[2]);
+      int i = 0;
+      arg3 = (double *) malloc((size+1)*sizeof(double));
+      for (i = 0; i < size; i++) {
+        PyObject *o = PyList_GetItem(swig_obj[2],i);
+        if (PyFloat_Check(o))
+        arg3[i] = PyFloat_AsDouble(PyList_GetItem(swig_obj[2],i));
+        else {
+          PyErr_SetString(PyExc_TypeError,"list must contain floats");
+          free(arg3);
+          return NULL;
+        }
+      }
+      arg3[i] = 0;
+    } else {
+      PyErr_SetString(PyExc_TypeError,"not a list");
+      return NULL;
+    }
+  }
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "returnEnergy" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = (int)(val4);
+  result = (double)returnEnergy(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+static PyMethodDef SwigMethods[] = {
+	 { "SWIG_PyInstanceMethod_New", SWIG_PyInstanceMethod_New, METH_O, NULL},
+	 { "SWIG_PyStaticMethod_New", SWIG_PyStaticMethod_New, METH_O, NULL},
+	 { "Valist_getAtomList", _wrap_Valist_getAtomList, METH_O, NULL},
+	 { "Valist_getAtom", _wrap_Valist_getAtom, METH_VARARGS, NULL},
+	 { "Vatom_getPosition", _wrap_Vatom_getPosition, METH_O, NULL},
+	 { "Vatom_setCharge", _wrap_Vatom_setCharge, METH_VARARGS, NULL},
+	 { "Vatom_getCharge", _wrap_Vatom_getCharge, METH_O, NULL},
+	 { "Vatom_getRadius", _wrap_Vatom_getRadius, METH_O, NULL},
+	 { "MGparm_setCenterX", _wrap_MGparm_setCenterX, METH_VARARGS, NULL},
+	 { "MGparm_setCenterY", _wrap_MGparm_setCenterY, METH_VARARGS, NULL},
+	 { "MGparm_setCenterZ", _wrap_MGparm_setCenterZ, METH_VARARGS, NULL},
+	 { "MGparm_getNx", _wrap_MGparm_getNx, METH_O, NULL},
+	 { "MGparm_getNy", _wrap_MGparm_getNy, METH_O, NULL},
+	 { "MGparm_getNz", _wrap_MGparm_getNz, METH_O, NULL},
+	 { "MGparm_getHx", _wrap_MGparm_getHx, METH_O, NULL},
+	 { "MGparm_getHy", _wrap_MGparm_getHy, METH_O, NULL},
+	 { "MGparm_getHz", _wrap_MGparm_getHz, METH_O, NULL},
+	 { "PBEparm_getIonCharge", _wrap_PBEparm_getIonCharge, METH_VARARGS, NULL},
+	 { "PBEparm_getIonConc", _wrap_PBEparm_getIonConc, METH_VARARGS, NULL},
+	 { "PBEparm_getIonRadius", _wrap_PBEparm_getIonRadius, METH_VARARGS, NULL},
+	 { "Vcom_ctor", _wrap_Vcom_ctor, METH_O, NULL},
+	 { "Vcom_size", _wrap_Vcom_size, METH_O, NULL},
+	 { "Vcom_rank", _wrap_Vcom_rank, METH_O, NULL},
+	 { "Vmem_ctor", _wrap_Vmem_ctor, METH_O, NULL},
+	 { "Vpmg_setGuess", _wrap_Vpmg_setGuess, METH_VARARGS, NULL},
+	 { "NOsh_getCalc", _wrap_NOsh_getCalc, METH_VARARGS, NULL},
+	 { "NOsh_elecname", _wrap_NOsh_elecname, METH_VARARGS, NULL},
+	 { "NOsh_elec2calc", _wrap_NOsh_elec2calc, METH_VARARGS, NULL},
+	 { "NOsh_printWhat", _wrap_NOsh_printWhat, METH_VARARGS, NULL},
+	 { "NOsh_parseInputFile", _wrap_NOsh_parseInputFile, METH_VARARGS, NULL},
+	 { "NOsh_ctor", _wrap_NOsh_ctor, METH_VARARGS, NULL},
+	 { "new_valist", _wrap_new_valist, METH_O, NULL},
+	 { "get_Valist", _wrap_get_Valist, METH_VARARGS, NULL},
+	 { "new_gridlist", _wrap_new_gridlist, METH_O, NULL},
+	 { "get_Vgrid", _wrap_get_Vgrid, METH_VARARGS, NULL},
+	 { "new_pmglist", _wrap_new_pmglist, METH_O, NULL},
+	 { "get_Vpmg", _wrap_get_Vpmg, METH_VARARGS, NULL},
+	 { "new_pmgplist", _wrap_new_pmgplist, METH_O, NULL},
+	 { "new_pbelist", _wrap_new_pbelist, METH_O, NULL},
+	 { "get_Vpbe", _wrap_get_Vpbe, METH_VARARGS, NULL},
+	 { "new_atomforcelist", _wrap_new_atomforcelist, METH_O, NULL},
+	 { "delete_atomforcelist", _wrap_delete_atomforcelist, METH_O, NULL},
+	 { "delete_valist", _wrap_delete_valist, METH_O, NULL},
+	 { "delete_gridlist", _wrap_delete_gridlist, METH_O, NULL},
+	 { "delete_pmglist", _wrap_delete_pmglist, METH_O, NULL},
+	 { "delete_pmgplist", _wrap_delete_pmgplist, METH_O, NULL},
+	 { "delete_pbelist", _wrap_delete_pbelist, METH_O, NULL},
+	 { "delete_Vgrid", _wrap_delete_Vgrid, METH_O, NULL},
+	 { "delete_Nosh", _wrap_delete_Nosh, METH_O, NULL},
+	 { "delete_Com", _wrap_delete_Com, METH_O, NULL},
+	 { "delete_Mem", _wrap_delete_Mem, METH_O, NULL},
+	 { "get_AtomForce", _wrap_get_AtomForce, METH_VARARGS, NULL},
+	 { "make_Valist", _wrap_make_Valist, METH_VARARGS, NULL},
+	 { "remove_Valist", _wrap_remove_Valist, METH_O, NULL},
+	 { "double_array", _wrap_double_array, METH_O, NULL},
+	 { "int_array", _wrap_int_array, METH_O, NULL},
+	 { "delete_double_array", _wrap_delete_double_array, METH_O, NULL},
+	 { "delete_int_array", _wrap_delete_int_array, METH_O, NULL},
+	 { "get_entry", _wrap_get_entry, METH_VARARGS, NULL},
+	 { "set_entry", _wrap_set_entry, METH_VARARGS, NULL},
+	 { "get_int_entry", _wrap_get_int_entry, METH_VARARGS, NULL},
+	 { "set_int_entry", _wrap_set_int_entry, METH_VARARGS, NULL},
+	 { "parseInputFromString", _wrap_parseInputFromString, METH_VARARGS, NULL},
+	 { "PBEparm_setMolid", _wrap_PBEparm_setMolid, METH_VARARGS, NULL},
+	 { "PBEparm_setPBEType", _wrap_PBEparm_setPBEType, METH_VARARGS, NULL},
+	 { "PBEparm_setBcfl", _wrap_PBEparm_setBcfl, METH_VARARGS, NULL},
+	 { "PBEparm_setIon", _wrap_PBEparm_setIon, METH_VARARGS, NULL},
+	 { "PBEparm_setNion", _wrap_PBEparm_setNion, METH_VARARGS, NULL},
+	 { "PBEparm_setPdie", _wrap_PBEparm_setPdie, METH_VARARGS, NULL},
+	 { "PBEparm_setSdie", _wrap_PBEparm_setSdie, METH_VARARGS, NULL},
+	 { "PBEparm_setSrfm", _wrap_PBEparm_setSrfm, METH_VARARGS, NULL},
+	 { "PBEparm_setSrad", _wrap_PBEparm_setSrad, METH_VARARGS, NULL},
+	 { "PBEparm_setSwin", _wrap_PBEparm_setSwin, METH_VARARGS, NULL},
+	 { "PBEparm_setSdens", _wrap_PBEparm_setSdens, METH_VARARGS, NULL},
+	 { "PBEparm_setTemp", _wrap_PBEparm_setTemp, METH_VARARGS, NULL},
+	 { "PBEparm_setCalcEnergy", _wrap_PBEparm_setCalcEnergy, METH_VARARGS, NULL},
+	 { "PBEparm_setCalcForce", _wrap_PBEparm_setCalcForce, METH_VARARGS, NULL},
+	 { "MGparm_setDime", _wrap_MGparm_setDime, METH_VARARGS, NULL},
+	 { "MGparm_setGlen", _wrap_MGparm_setGlen, METH_VARARGS, NULL},
+	 { "MGparm_setGrid", _wrap_MGparm_setGrid, METH_VARARGS, NULL},
+	 { "MGparm_setCenter", _wrap_MGparm_setCenter, METH_VARARGS, NULL},
+	 { "MGparm_setChgm", _wrap_MGparm_setChgm, METH_VARARGS, NULL},
+	 { "MGparm_setEtol", _wrap_MGparm_setEtol, METH_VARARGS, NULL},
+	 { "newCalc", _wrap_newCalc, METH_NOARGS, NULL},
+	 { "copyCalc", _wrap_copyCalc, METH_O, NULL},
+	 { "deleteCalc", _wrap_deleteCalc, METH_O, NULL},
+	 { "checkCalc", _wrap_checkCalc, METH_VARARGS, NULL},
+	 { "addCalc", _wrap_addCalc, METH_VARARGS, NULL},
+	 { "Valist_load", _wrap_Valist_load, METH_VARARGS, NULL},
+	 { "Valist_loadBuffer", _wrap_Valist_loadBuffer, METH_VARARGS, NULL},
+	 { "Valist_updateBuffer", _wrap_Valist_updateBuffer, METH_VARARGS, NULL},
+	 { "NOsh_setupElecCalc", _wrap_NOsh_setupElecCalc, METH_VARARGS, NULL},
+	 { "NOsh_setupApolCalc", _wrap_NOsh_setupApolCalc, METH_VARARGS, NULL},
+	 { "wrap_forceMG", _wrap_wrap_forceMG, METH_VARARGS, NULL},
+	 { "getAtomForceData", _wrap_getAtomForceData, METH_VARARGS, NULL},
+	 { "setAtomForceData", _wrap_setAtomForceData, METH_VARARGS, NULL},
+	 { "getAtomPosition", _wrap_getAtomPosition, METH_O, NULL},
+	 { "getPotentialsList", _wrap_getPotentialsList, METH_VARARGS, NULL},
+	 { "getEnergiesList", _wrap_getEnergiesList, METH_VARARGS, NULL},
+	 { "fillPotentials", _wrap_fillPotentials, METH_VARARGS, NULL},
+	 { "fillEnergies", _wrap_fillEnergies, METH_VARARGS, NULL},
+	 { "fillForces", _wrap_fillForces, METH_VARARGS, NULL},
+	 { "getForcesList", _wrap_getForcesList, METH_VARARGS, NULL},
+	 { "getGridData", _wrap_getGridData, METH_VARARGS, NULL},
+	 { "getGridBuffer", _wrap_getGridBuffer, METH_VARARGS, NULL},
+	 { "getGridInfo", _wrap_getGridInfo, METH_O, NULL},
+	 { "getStatsRecord", _wrap_getStatsRecord, METH_NOARGS, NULL},
+	 { "getCycles", _wrap_getCycles, METH_O, NULL},
+	 { "loadMolecules", _wrap_loadMolecules, METH_VARARGS, NULL},
+	 { "killMolecules", _wrap_killMolecules, METH_VARARGS, NULL},
+	 { "loadDielMaps", _wrap_loadDielMaps, METH_VARARGS, NULL},
+	 { "killDielMaps", _wrap_killDielMaps, METH_VARARGS, NULL},
+	 { "loadKappaMaps", _wrap_loadKappaMaps, METH_VARARGS, NULL},
+	 { "killKappaMaps", _wrap_killKappaMaps, METH_VARARGS, NULL},
+	 { "loadPotMaps", _wrap_loadPotMaps, METH_VARARGS, NULL},
+	 { "killPotMaps", _wrap_killPotMaps, METH_VARARGS, NULL},
+	 { "loadChargeMaps", _wrap_loadChargeMaps, METH_VARARGS, NULL},
+	 { "killChargeMaps", _wrap_killChargeMaps, METH_VARARGS, NULL},
+	 { "printPBEPARM", _wrap_printPBEPARM, METH_O, NULL},
+	 { "printMGPARM", _wrap_printMGPARM, METH_VARARGS, NULL},
+	 { "initMG", _wrap_initMG, METH_VARARGS, NULL},
+	 { "killMG", _wrap_killMG, METH_VARARGS, NULL},
+	 { "reinitMG", _wrap_reinitMG, METH_VARARGS, NULL},
+	 { "killAllMG", _wrap_killAllMG, METH_VARARGS, NULL},
+	 { "solveMG", _wrap_solveMG, METH_VARARGS, NULL},
+	 { "guessMG", _wrap_guessMG, METH_VARARGS, NULL},
+	 { "saveGuessMG", _wrap_saveGuessMG, METH_O, NULL},
+	 { "loadGuessMG", _wrap_loadGuessMG, METH_O, NULL},
+	 { "setPartMG", _wrap_setPartMG, METH_VARARGS, NULL},
+	 { "killEnergy", _wrap_killEnergy, METH_NOARGS, NULL},
+	 { "killForce", _wrap_killForce, METH_VARARGS, NULL},
+	 { "writedataMG", _wrap_writedataMG, METH_VARARGS, NULL},
+	 { "writematMG", _wrap_writematMG, METH_VARARGS, NULL},
+	 { "printForce", _wrap_printForce, METH_VARARGS, NULL},
+	 { "printElecForce", _wrap_printElecForce, METH_VARARGS, NULL},
+	 { "printApolForce", _wrap_printApolForce, METH_VARARGS, NULL},
+	 { "startVio", _wrap_startVio, METH_NOARGS, NULL},
+	 { "startStats", _wrap_startStats, METH_O, NULL},
+	 { "stopStats", _wrap_stopStats, METH_O, NULL},
+	 { "resetStats", _wrap_resetStats, METH_NOARGS, NULL},
+	 { "Vacc_molAcc", _wrap_Vacc_molAcc, METH_VARARGS, NULL},
+	 { "Vacc_vdwAcc", _wrap_Vacc_vdwAcc, METH_VARARGS, NULL},
+	 { "energyMG", _wrap_energyMG, METH_VARARGS, NULL},
+	 { "printEnergy", _wrap_printEnergy, METH_VARARGS, NULL},
+	 { "printElecEnergy", _wrap_printElecEnergy, METH_VARARGS, NULL},
+	 { "printApolEnergy", _wrap_printApolEnergy, METH_VARARGS, NULL},
+	 { "returnEnergy", _wrap_returnEnergy, METH_VARARGS, NULL},
+	 { NULL, NULL, 0, NULL }
+};
+
+static PyMethodDef SwigMethods_proxydocs[] = {
+	 { "SWIG_PyInstanceMethod_New", SWIG_PyInstanceMethod_New, METH_O, NULL},
+	 { "SWIG_PyStaticMethod_New", SWIG_PyStaticMethod_New, METH_O, NULL},
+	 { "Valist_getAtomList", _wrap_Valist_getAtomList, METH_O, NULL},
+	 { "Valist_getAtom", _wrap_Valist_getAtom, METH_VARARGS, NULL},
+	 { "Vatom_getPosition", _wrap_Vatom_getPosition, METH_O, NULL},
+	 { "Vatom_setCharge", _wrap_Vatom_setCharge, METH_VARARGS, NULL},
+	 { "Vatom_getCharge", _wrap_Vatom_getCharge, METH_O, NULL},
+	 { "Vatom_getRadius", _wrap_Vatom_getRadius, METH_O, NULL},
+	 { "MGparm_setCenterX", _wrap_MGparm_setCenterX, METH_VARARGS, NULL},
+	 { "MGparm_setCenterY", _wrap_MGparm_setCenterY, METH_VARARGS, NULL},
+	 { "MGparm_setCenterZ", _wrap_MGparm_setCenterZ, METH_VARARGS, NULL},
+	 { "MGparm_getNx", _wrap_MGparm_getNx, METH_O, NULL},
+	 { "MGparm_getNy", _wrap_MGparm_getNy, METH_O, NULL},
+	 { "MGparm_getNz", _wrap_MGparm_getNz, METH_O, NULL},
+	 { "MGparm_getHx", _wrap_MGparm_getHx, METH_O, NULL},
+	 { "MGparm_getHy", _wrap_MGparm_getHy, METH_O, NULL},
+	 { "MGparm_getHz", _wrap_MGparm_getHz, METH_O, NULL},
+	 { "PBEparm_getIonCharge", _wrap_PBEparm_getIonCharge, METH_VARARGS, NULL},
+	 { "PBEparm_getIonConc", _wrap_PBEparm_getIonConc, METH_VARARGS, NULL},
+	 { "PBEparm_getIonRadius", _wrap_PBEparm_getIonRadius, METH_VARARGS, NULL},
+	 { "Vcom_ctor", _wrap_Vcom_ctor, METH_O, NULL},
+	 { "Vcom_size", _wrap_Vcom_size, METH_O, NULL},
+	 { "Vcom_rank", _wrap_Vcom_rank, METH_O, NULL},
+	 { "Vmem_ctor", _wrap_Vmem_ctor, METH_O, NULL},
+	 { "Vpmg_setGuess", _wrap_Vpmg_setGuess, METH_VARARGS, NULL},
+	 { "NOsh_getCalc", _wrap_NOsh_getCalc, METH_VARARGS, NULL},
+	 { "NOsh_elecname", _wrap_NOsh_elecname, METH_VARARGS, NULL},
+	 { "NOsh_elec2calc", _wrap_NOsh_elec2calc, METH_VARARGS, NULL},
+	 { "NOsh_printWhat", _wrap_NOsh_printWhat, METH_VARARGS, NULL},
+	 { "NOsh_parseInputFile", _wrap_NOsh_parseInputFile, METH_VARARGS, NULL},
+	 { "NOsh_ctor", _wrap_NOsh_ctor, METH_VARARGS, NULL},
+	 { "new_valist", _wrap_new_valist, METH_O, NULL},
+	 { "get_Valist", _wrap_get_Valist, METH_VARARGS, NULL},
+	 { "new_gridlist", _wrap_new_gridlist, METH_O, NULL},
+	 { "get_Vgrid", _wrap_get_Vgrid, METH_VARARGS, NULL},
+	 { "new_pmglist", _wrap_new_pmglist, METH_O, NULL},
+	 { "get_Vpmg", _wrap_get_Vpmg, METH_VARARGS, NULL},
+	 { "new_pmgplist", _wrap_new_pmgplist, METH_O, NULL},
+	 { "new_pbelist", _wrap_new_pbelist, METH_O, NULL},
+	 { "get_Vpbe", _wrap_get_Vpbe, METH_VARARGS, NULL},
+	 { "new_atomforcelist", _wrap_new_atomforcelist, METH_O, NULL},
+	 { "delete_atomforcelist", _wrap_delete_atomforcelist, METH_O, NULL},
+	 { "delete_valist", _wrap_delete_valist, METH_O, NULL},
+	 { "delete_gridlist", _wrap_delete_gridlist, METH_O, NULL},
+	 { "delete_pmglist", _wrap_delete_pmglist, METH_O, NULL},
+	 { "delete_pmgplist", _wrap_delete_pmgplist, METH_O, NULL},
+	 { "delete_pbelist", _wrap_delete_pbelist, METH_O, NULL},
+	 { "delete_Vgrid", _wrap_delete_Vgrid, METH_O, NULL},
+	 { "delete_Nosh", _wrap_delete_Nosh, METH_O, NULL},
+	 { "delete_Com", _wrap_delete_Com, METH_O, NULL},
+	 { "delete_Mem", _wrap_delete_Mem, METH_O, NULL},
+	 { "get_AtomForce", _wrap_get_AtomForce, METH_VARARGS, NULL},
+	 { "make_Valist", _wrap_make_Valist, METH_VARARGS, NULL},
+	 { "remove_Valist", _wrap_remove_Valist, METH_O, NULL},
+	 { "double_array", _wrap_double_array, METH_O, NULL},
+	 { "int_array", _wrap_int_array, METH_O, NULL},
+	 { "delete_double_array", _wrap_delete_double_array, METH_O, NULL},
+	 { "delete_int_array", _wrap_delete_int_array, METH_O, NULL},
+	 { "get_entry", _wrap_get_entry, METH_VARARGS, NULL},
+	 { "set_entry", _wrap_set_entry, METH_VARARGS, NULL},
+	 { "get_int_entry", _wrap_get_int_entry, METH_VARARGS, NULL},
+	 { "set_int_entry", _wrap_set_int_entry, METH_VARARGS, NULL},
+	 { "parseInputFromString", _wrap_parseInputFromString, METH_VARARGS, NULL},
+	 { "PBEparm_setMolid", _wrap_PBEparm_setMolid, METH_VARARGS, NULL},
+	 { "PBEparm_setPBEType", _wrap_PBEparm_setPBEType, METH_VARARGS, NULL},
+	 { "PBEparm_setBcfl", _wrap_PBEparm_setBcfl, METH_VARARGS, NULL},
+	 { "PBEparm_setIon", _wrap_PBEparm_setIon, METH_VARARGS, NULL},
+	 { "PBEparm_setNion", _wrap_PBEparm_setNion, METH_VARARGS, NULL},
+	 { "PBEparm_setPdie", _wrap_PBEparm_setPdie, METH_VARARGS, NULL},
+	 { "PBEparm_setSdie", _wrap_PBEparm_setSdie, METH_VARARGS, NULL},
+	 { "PBEparm_setSrfm", _wrap_PBEparm_setSrfm, METH_VARARGS, NULL},
+	 { "PBEparm_setSrad", _wrap_PBEparm_setSrad, METH_VARARGS, NULL},
+	 { "PBEparm_setSwin", _wrap_PBEparm_setSwin, METH_VARARGS, NULL},
+	 { "PBEparm_setSdens", _wrap_PBEparm_setSdens, METH_VARARGS, NULL},
+	 { "PBEparm_setTemp", _wrap_PBEparm_setTemp, METH_VARARGS, NULL},
+	 { "PBEparm_setCalcEnergy", _wrap_PBEparm_setCalcEnergy, METH_VARARGS, NULL},
+	 { "PBEparm_setCalcForce", _wrap_PBEparm_setCalcForce, METH_VARARGS, NULL},
+	 { "MGparm_setDime", _wrap_MGparm_setDime, METH_VARARGS, NULL},
+	 { "MGparm_setGlen", _wrap_MGparm_setGlen, METH_VARARGS, NULL},
+	 { "MGparm_setGrid", _wrap_MGparm_setGrid, METH_VARARGS, NULL},
+	 { "MGparm_setCenter", _wrap_MGparm_setCenter, METH_VARARGS, NULL},
+	 { "MGparm_setChgm", _wrap_MGparm_setChgm, METH_VARARGS, NULL},
+	 { "MGparm_setEtol", _wrap_MGparm_setEtol, METH_VARARGS, NULL},
+	 { "newCalc", _wrap_newCalc, METH_NOARGS, NULL},
+	 { "copyCalc", _wrap_copyCalc, METH_O, NULL},
+	 { "deleteCalc", _wrap_deleteCalc, METH_O, NULL},
+	 { "checkCalc", _wrap_checkCalc, METH_VARARGS, NULL},
+	 { "addCalc", _wrap_addCalc, METH_VARARGS, NULL},
+	 { "Valist_load", _wrap_Valist_load, METH_VARARGS, NULL},
+	 { "Valist_loadBuffer", _wrap_Valist_loadBuffer, METH_VARARGS, NULL},
+	 { "Valist_updateBuffer", _wrap_Valist_updateBuffer, METH_VARARGS, NULL},
+	 { "NOsh_setupElecCalc", _wrap_NOsh_setupElecCalc, METH_VARARGS, NULL},
+	 { "NOsh_setupApolCalc", _wrap_NOsh_setupApolCalc, METH_VARARGS, NULL},
+	 { "wrap_forceMG", _wrap_wrap_forceMG, METH_VARARGS, NULL},
+	 { "getAtomForceData", _wrap_getAtomForceData, METH_VARARGS, NULL},
+	 { "setAtomForceData", _wrap_setAtomForceData, METH_VARARGS, NULL},
+	 { "getAtomPosition", _wrap_getAtomPosition, METH_O, NULL},
+	 { "getPotentialsList", _wrap_getPotentialsList, METH_VARARGS, NULL},
+	 { "getEnergiesList", _wrap_getEnergiesList, METH_VARARGS, NULL},
+	 { "fillPotentials", _wrap_fillPotentials, METH_VARARGS, NULL},
+	 { "fillEnergies", _wrap_fillEnergies, METH_VARARGS, NULL},
+	 { "fillForces", _wrap_fillForces, METH_VARARGS, NULL},
+	 { "getForcesList", _wrap_getForcesList, METH_VARARGS, NULL},
+	 { "getGridData", _wrap_getGridData, METH_VARARGS, NULL},
+	 { "getGridBuffer", _wrap_getGridBuffer, METH_VARARGS, NULL},
+	 { "getGridInfo", _wrap_getGridInfo, METH_O, NULL},
+	 { "getStatsRecord", _wrap_getStatsRecord, METH_NOARGS, NULL},
+	 { "getCycles", _wrap_getCycles, METH_O, NULL},
+	 { "loadMolecules", _wrap_loadMolecules, METH_VARARGS, NULL},
+	 { "killMolecules", _wrap_killMolecules, METH_VARARGS, NULL},
+	 { "loadDielMaps", _wrap_loadDielMaps, METH_VARARGS, NULL},
+	 { "killDielMaps", _wrap_killDielMaps, METH_VARARGS, NULL},
+	 { "loadKappaMaps", _wrap_loadKappaMaps, METH_VARARGS, NULL},
+	 { "killKappaMaps", _wrap_killKappaMaps, METH_VARARGS, NULL},
+	 { "loadPotMaps", _wrap_loadPotMaps, METH_VARARGS, NULL},
+	 { "killPotMaps", _wrap_killPotMaps, METH_VARARGS, NULL},
+	 { "loadChargeMaps", _wrap_loadChargeMaps, METH_VARARGS, NULL},
+	 { "killChargeMaps", _wrap_killChargeMaps, METH_VARARGS, NULL},
+	 { "printPBEPARM", _wrap_printPBEPARM, METH_O, NULL},
+	 { "printMGPARM", _wrap_printMGPARM, METH_VARARGS, NULL},
+	 { "initMG", _wrap_initMG, METH_VARARGS, NULL},
+	 { "killMG", _wrap_killMG, METH_VARARGS, NULL},
+	 { "reinitMG", _wrap_reinitMG, METH_VARARGS, NULL},
+	 { "killAllMG", _wrap_killAllMG, METH_VARARGS, NULL},
+	 { "solveMG", _wrap_solveMG, METH_VARARGS, NULL},
+	 { "guessMG", _wrap_guessMG, METH_VARARGS, NULL},
+	 { "saveGuessMG", _wrap_saveGuessMG, METH_O, NULL},
+	 { "loadGuessMG", _wrap_loadGuessMG, METH_O, NULL},
+	 { "setPartMG", _wrap_setPartMG, METH_VARARGS, NULL},
+	 { "killEnergy", _wrap_killEnergy, METH_NOARGS, NULL},
+	 { "killForce", _wrap_killForce, METH_VARARGS, NULL},
+	 { "writedataMG", _wrap_writedataMG, METH_VARARGS, NULL},
+	 { "writematMG", _wrap_writematMG, METH_VARARGS, NULL},
+	 { "printForce", _wrap_printForce, METH_VARARGS, NULL},
+	 { "printElecForce", _wrap_printElecForce, METH_VARARGS, NULL},
+	 { "printApolForce", _wrap_printApolForce, METH_VARARGS, NULL},
+	 { "startVio", _wrap_startVio, METH_NOARGS, NULL},
+	 { "startStats", _wrap_startStats, METH_O, NULL},
+	 { "stopStats", _wrap_stopStats, METH_O, NULL},
+	 { "resetStats", _wrap_resetStats, METH_NOARGS, NULL},
+	 { "Vacc_molAcc", _wrap_Vacc_molAcc, METH_VARARGS, NULL},
+	 { "Vacc_vdwAcc", _wrap_Vacc_vdwAcc, METH_VARARGS, NULL},
+	 { "energyMG", _wrap_energyMG, METH_VARARGS, NULL},
+	 { "printEnergy", _wrap_printEnergy, METH_VARARGS, NULL},
+	 { "printElecEnergy", _wrap_printElecEnergy, METH_VARARGS, NULL},
+	 { "printApolEnergy", _wrap_printApolEnergy, METH_VARARGS, NULL},
+	 { "returnEnergy", _wrap_returnEnergy, METH_VARARGS, NULL},
+	 { NULL, NULL, 0, NULL }
+};
+
+static SwigPyGetSet Valist___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet Valist_number_getset = { _wrap_Valist_number_get, _wrap_Valist_number_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Valist_getset[] = {
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Valist___dict___getset },
+    { (char *)"number", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Valist_number_getset },
+    { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin__Valist_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin__Valist_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin__Valist_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "apbslib.Valist",                         /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    _wrap_delete_Valist_destructor_closure,   /* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin__Valist_type.as_number,    /* tp_as_number */
+    &SwigPyBuiltin__Valist_type.as_sequence,  /* tp_as_sequence */
+    &SwigPyBuiltin__Valist_type.as_mapping,   /* tp_as_mapping */
+    SwigPyObject_hash,                        /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin__Valist_type.as_buffer,    /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::Valist",                               /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    SwigPyBuiltin__Valist_richcompare,        /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__Valist_methods,            /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin__Valist_getset,             /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    offsetof(SwigPyObject, dict),             /* tp_dictoffset */
+    _wrap_new_Valist,                         /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+    (int) 0,                                  /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+    (vectorcallfunc) 0,                       /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+    0,                                        /* tp_print */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+    0,                                        /* tp_prev */
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+    (unaryfunc) 0,                            /* nb_index */
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Valist_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Valist_type};
+
+static SwigPyGetSet Vatom___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet Vatom_id_getset = { _wrap_Vatom_id_get, _wrap_Vatom_id_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Vatom_getset[] = {
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Vatom___dict___getset },
+    { (char *)"id", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Vatom_id_getset },
+    { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin__Vatom_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin__Vatom_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin__Vatom_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "apbslib.Vatom",                          /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    _wrap_delete_Vatom_destructor_closure,    /* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin__Vatom_type.as_number,     /* tp_as_number */
+    &SwigPyBuiltin__Vatom_type.as_sequence,   /* tp_as_sequence */
+    &SwigPyBuiltin__Vatom_type.as_mapping,    /* tp_as_mapping */
+    SwigPyObject_hash,                        /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin__Vatom_type.as_buffer,     /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::Vatom",                                /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    SwigPyBuiltin__Vatom_richcompare,         /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__Vatom_methods,             /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin__Vatom_getset,              /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    offsetof(SwigPyObject, dict),             /* tp_dictoffset */
+    _wrap_new_Vatom,                          /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+    (int) 0,                                  /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+    (vectorcallfunc) 0,                       /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+    0,                                        /* tp_print */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+    0,                                        /* tp_prev */
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+    (unaryfunc) 0,                            /* nb_index */
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Vatom_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Vatom_type};
+
+static SwigPyGetSet MGparm___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet MGparm_type_getset = { _wrap_MGparm_type_get, _wrap_MGparm_type_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__MGparm_getset[] = {
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &MGparm___dict___getset },
+    { (char *)"type", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &MGparm_type_getset },
+    { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin__MGparm_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin__MGparm_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin__MGparm_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "apbslib.MGparm",                         /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    _wrap_delete_MGparm_destructor_closure,   /* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin__MGparm_type.as_number,    /* tp_as_number */
+    &SwigPyBuiltin__MGparm_type.as_sequence,  /* tp_as_sequence */
+    &SwigPyBuiltin__MGparm_type.as_mapping,   /* tp_as_mapping */
+    SwigPyObject_hash,                        /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin__MGparm_type.as_buffer,    /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::MGparm",                               /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    SwigPyBuiltin__MGparm_richcompare,        /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__MGparm_methods,            /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin__MGparm_getset,             /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    offsetof(SwigPyObject, dict),             /* tp_dictoffset */
+    _wrap_new_MGparm,                         /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+    (int) 0,                                  /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+    (vectorcallfunc) 0,                       /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+    0,                                        /* tp_print */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+    0,                                        /* tp_prev */
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+    (unaryfunc) 0,                            /* nb_index */
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin__MGparm_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__MGparm_type};
+
+static SwigPyGetSet PBEparm_calcforce_getset = { _wrap_PBEparm_calcforce_get, _wrap_PBEparm_calcforce_set };
+static SwigPyGetSet PBEparm_sdie_getset = { _wrap_PBEparm_sdie_get, _wrap_PBEparm_sdie_set };
+static SwigPyGetSet PBEparm_swin_getset = { _wrap_PBEparm_swin_get, _wrap_PBEparm_swin_set };
+static SwigPyGetSet PBEparm_srfm_getset = { _wrap_PBEparm_srfm_get, _wrap_PBEparm_srfm_set };
+static SwigPyGetSet PBEparm_srad_getset = { _wrap_PBEparm_srad_get, _wrap_PBEparm_srad_set };
+static SwigPyGetSet PBEparm_molid_getset = { _wrap_PBEparm_molid_get, _wrap_PBEparm_molid_set };
+static SwigPyGetSet PBEparm_nion_getset = { _wrap_PBEparm_nion_get, _wrap_PBEparm_nion_set };
+static SwigPyGetSet PBEparm_calcenergy_getset = { _wrap_PBEparm_calcenergy_get, _wrap_PBEparm_calcenergy_set };
+static SwigPyGetSet PBEparm___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet PBEparm_pdie_getset = { _wrap_PBEparm_pdie_get, _wrap_PBEparm_pdie_set };
+static SwigPyGetSet PBEparm_bcfl_getset = { _wrap_PBEparm_bcfl_get, _wrap_PBEparm_bcfl_set };
+static SwigPyGetSet PBEparm_pbetype_getset = { _wrap_PBEparm_pbetype_get, _wrap_PBEparm_pbetype_set };
+static SwigPyGetSet PBEparm_sdens_getset = { _wrap_PBEparm_sdens_get, _wrap_PBEparm_sdens_set };
+static SwigPyGetSet PBEparm_temp_getset = { _wrap_PBEparm_temp_get, _wrap_PBEparm_temp_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__PBEparm_getset[] = {
+    { (char *)"calcforce", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &PBEparm_calcforce_getset },
+    { (char *)"sdie", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &PBEparm_sdie_getset },
+    { (char *)"swin", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &PBEparm_swin_getset },
+    { (char *)"srfm", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &PBEparm_srfm_getset },
+    { (char *)"srad", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &PBEparm_srad_getset },
+    { (char *)"molid", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &PBEparm_molid_getset },
+    { (char *)"nion", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &PBEparm_nion_getset },
+    { (char *)"calcenergy", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &PBEparm_calcenergy_getset },
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &PBEparm___dict___getset },
+    { (char *)"pdie", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &PBEparm_pdie_getset },
+    { (char *)"bcfl", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &PBEparm_bcfl_getset },
+    { (char *)"pbetype", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &PBEparm_pbetype_getset },
+    { (char *)"sdens", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &PBEparm_sdens_getset },
+    { (char *)"temp", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &PBEparm_temp_getset },
+    { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin__PBEparm_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin__PBEparm_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin__PBEparm_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "apbslib.PBEparm",                        /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    _wrap_delete_PBEparm_destructor_closure,  /* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin__PBEparm_type.as_number,   /* tp_as_number */
+    &SwigPyBuiltin__PBEparm_type.as_sequence, /* tp_as_sequence */
+    &SwigPyBuiltin__PBEparm_type.as_mapping,  /* tp_as_mapping */
+    SwigPyObject_hash,                        /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin__PBEparm_type.as_buffer,   /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::PBEparm",                              /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    SwigPyBuiltin__PBEparm_richcompare,       /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__PBEparm_methods,           /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin__PBEparm_getset,            /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    offsetof(SwigPyObject, dict),             /* tp_dictoffset */
+    _wrap_new_PBEparm,                        /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+    (int) 0,                                  /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+    (vectorcallfunc) 0,                       /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+    0,                                        /* tp_print */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+    0,                                        /* tp_prev */
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+    (unaryfunc) 0,                            /* nb_index */
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin__PBEparm_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__PBEparm_type};
+
+static SwigPyGetSet Vcom___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Vcom_getset[] = {
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Vcom___dict___getset },
+    { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin__Vcom_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin__Vcom_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin__Vcom_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "apbslib.Vcom",                           /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    _wrap_delete_Vcom_destructor_closure,     /* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin__Vcom_type.as_number,      /* tp_as_number */
+    &SwigPyBuiltin__Vcom_type.as_sequence,    /* tp_as_sequence */
+    &SwigPyBuiltin__Vcom_type.as_mapping,     /* tp_as_mapping */
+    SwigPyObject_hash,                        /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin__Vcom_type.as_buffer,      /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::Vcom",                                 /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    SwigPyBuiltin__Vcom_richcompare,          /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__Vcom_methods,              /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin__Vcom_getset,               /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    offsetof(SwigPyObject, dict),             /* tp_dictoffset */
+    _wrap_new_Vcom,                           /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+    (int) 0,                                  /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+    (vectorcallfunc) 0,                       /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+    0,                                        /* tp_print */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+    0,                                        /* tp_prev */
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+    (unaryfunc) 0,                            /* nb_index */
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Vcom_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Vcom_type};
+
+static SwigPyGetSet Vmem___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Vmem_getset[] = {
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Vmem___dict___getset },
+    { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin__Vmem_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin__Vmem_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin__Vmem_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "apbslib.Vmem",                           /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    _wrap_delete_Vmem_destructor_closure,     /* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin__Vmem_type.as_number,      /* tp_as_number */
+    &SwigPyBuiltin__Vmem_type.as_sequence,    /* tp_as_sequence */
+    &SwigPyBuiltin__Vmem_type.as_mapping,     /* tp_as_mapping */
+    SwigPyObject_hash,                        /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin__Vmem_type.as_buffer,      /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::Vmem",                                 /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    SwigPyBuiltin__Vmem_richcompare,          /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__Vmem_methods,              /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin__Vmem_getset,               /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    offsetof(SwigPyObject, dict),             /* tp_dictoffset */
+    _wrap_new_Vmem,                           /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+    (int) 0,                                  /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+    (vectorcallfunc) 0,                       /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+    0,                                        /* tp_print */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+    0,                                        /* tp_prev */
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+    (unaryfunc) 0,                            /* nb_index */
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Vmem_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Vmem_type};
+
+static SwigPyGetSet Vpmg_ncycle_getset = { _wrap_Vpmg_ncycle_get, _wrap_Vpmg_ncycle_set };
+static SwigPyGetSet Vpmg_iters_getset = { _wrap_Vpmg_iters_get, _wrap_Vpmg_iters_set };
+static SwigPyGetSet Vpmg___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Vpmg_getset[] = {
+    { (char *)"ncycle", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Vpmg_ncycle_getset },
+    { (char *)"iters", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Vpmg_iters_getset },
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Vpmg___dict___getset },
+    { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin__Vpmg_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin__Vpmg_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin__Vpmg_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "apbslib.Vpmg",                           /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    _wrap_delete_Vpmg_destructor_closure,     /* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin__Vpmg_type.as_number,      /* tp_as_number */
+    &SwigPyBuiltin__Vpmg_type.as_sequence,    /* tp_as_sequence */
+    &SwigPyBuiltin__Vpmg_type.as_mapping,     /* tp_as_mapping */
+    SwigPyObject_hash,                        /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin__Vpmg_type.as_buffer,      /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::Vpmg",                                 /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    SwigPyBuiltin__Vpmg_richcompare,          /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__Vpmg_methods,              /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin__Vpmg_getset,               /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    offsetof(SwigPyObject, dict),             /* tp_dictoffset */
+    _wrap_new_Vpmg,                           /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+    (int) 0,                                  /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+    (vectorcallfunc) 0,                       /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+    0,                                        /* tp_print */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+    0,                                        /* tp_prev */
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+    (unaryfunc) 0,                            /* nb_index */
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Vpmg_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Vpmg_type};
+
+static SwigPyGetSet Vpbe_acc_getset = { _wrap_Vpbe_acc_get, _wrap_Vpbe_acc_set };
+static SwigPyGetSet Vpbe___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Vpbe_getset[] = {
+    { (char *)"acc", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Vpbe_acc_getset },
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Vpbe___dict___getset },
+    { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin__Vpbe_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin__Vpbe_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin__Vpbe_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "apbslib.Vpbe",                           /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    _wrap_delete_Vpbe_destructor_closure,     /* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin__Vpbe_type.as_number,      /* tp_as_number */
+    &SwigPyBuiltin__Vpbe_type.as_sequence,    /* tp_as_sequence */
+    &SwigPyBuiltin__Vpbe_type.as_mapping,     /* tp_as_mapping */
+    SwigPyObject_hash,                        /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin__Vpbe_type.as_buffer,      /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::Vpbe",                                 /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    SwigPyBuiltin__Vpbe_richcompare,          /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__Vpbe_methods,              /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin__Vpbe_getset,               /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    offsetof(SwigPyObject, dict),             /* tp_dictoffset */
+    _wrap_new_Vpbe,                           /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+    (int) 0,                                  /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+    (vectorcallfunc) 0,                       /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+    0,                                        /* tp_print */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+    0,                                        /* tp_prev */
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+    (unaryfunc) 0,                            /* nb_index */
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Vpbe_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Vpbe_type};
+
+static SwigPyGetSet NOsh_calc_femparm_getset = { _wrap_NOsh_calc_femparm_get, _wrap_NOsh_calc_femparm_set };
+static SwigPyGetSet NOsh_calc_pbeparm_getset = { _wrap_NOsh_calc_pbeparm_get, _wrap_NOsh_calc_pbeparm_set };
+static SwigPyGetSet NOsh_calc_calctype_getset = { _wrap_NOsh_calc_calctype_get, _wrap_NOsh_calc_calctype_set };
+static SwigPyGetSet NOsh_calc_mgparm_getset = { _wrap_NOsh_calc_mgparm_get, _wrap_NOsh_calc_mgparm_set };
+static SwigPyGetSet NOsh_calc___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__NOsh_calc_getset[] = {
+    { (char *)"femparm", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &NOsh_calc_femparm_getset },
+    { (char *)"pbeparm", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &NOsh_calc_pbeparm_getset },
+    { (char *)"calctype", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &NOsh_calc_calctype_getset },
+    { (char *)"mgparm", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &NOsh_calc_mgparm_getset },
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &NOsh_calc___dict___getset },
+    { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin__NOsh_calc_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin__NOsh_calc_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin__NOsh_calc_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "apbslib.NOsh_calc",                      /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    _wrap_delete_NOsh_calc_destructor_closure,/* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin__NOsh_calc_type.as_number, /* tp_as_number */
+    &SwigPyBuiltin__NOsh_calc_type.as_sequence,                   /* tp_as_sequence */
+    &SwigPyBuiltin__NOsh_calc_type.as_mapping,/* tp_as_mapping */
+    SwigPyObject_hash,                        /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin__NOsh_calc_type.as_buffer, /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::NOsh_calc",                            /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    SwigPyBuiltin__NOsh_calc_richcompare,     /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__NOsh_calc_methods,         /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin__NOsh_calc_getset,          /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    offsetof(SwigPyObject, dict),             /* tp_dictoffset */
+    _wrap_new_NOsh_calc,                      /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+    (int) 0,                                  /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+    (vectorcallfunc) 0,                       /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+    0,                                        /* tp_print */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+    0,                                        /* tp_prev */
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+    (unaryfunc) 0,                            /* nb_index */
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin__NOsh_calc_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__NOsh_calc_type};
+
+static SwigPyGetSet NOsh_nmol_getset = { _wrap_NOsh_nmol_get, _wrap_NOsh_nmol_set };
+static SwigPyGetSet NOsh_nelec_getset = { _wrap_NOsh_nelec_get, _wrap_NOsh_nelec_set };
+static SwigPyGetSet NOsh___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet NOsh_printwhat_getset = { _wrap_NOsh_printwhat_get, _wrap_NOsh_printwhat_set };
+static SwigPyGetSet NOsh_nprint_getset = { _wrap_NOsh_nprint_get, _wrap_NOsh_nprint_set };
+static SwigPyGetSet NOsh_ncalc_getset = { _wrap_NOsh_ncalc_get, _wrap_NOsh_ncalc_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__NOsh_getset[] = {
+    { (char *)"nmol", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &NOsh_nmol_getset },
+    { (char *)"nelec", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &NOsh_nelec_getset },
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &NOsh___dict___getset },
+    { (char *)"printwhat", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &NOsh_printwhat_getset },
+    { (char *)"nprint", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &NOsh_nprint_getset },
+    { (char *)"ncalc", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &NOsh_ncalc_getset },
+    { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin__NOsh_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
   }
-  arg1 = (NOsh *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "printApolEnergy" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = (int)(val2);
-  result = (int)printApolEnergy(arg1,arg2);
-  resultobj = SWIG_From_int((int)(result));
-  return resultobj;
-fail:
-  return NULL;
+  return result;
 }
 
+SWIGINTERN PyMethodDef SwigPyBuiltin__NOsh_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
 
-SWIGINTERN PyObject *_wrap_returnEnergy(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  Vcom *arg1 = (Vcom *) 0 ;
-  NOsh *arg2 = (NOsh *) 0 ;
-  double *arg3 ;
-  int arg4 ;
-  double result;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  int val4 ;
-  int ecode4 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:returnEnergy",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Vcom, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "returnEnergy" "', argument " "1"" of type '" "Vcom *""'"); 
-  }
-  arg1 = (Vcom *)(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_NOsh, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "returnEnergy" "', argument " "2"" of type '" "NOsh *""'"); 
-  }
-  arg2 = (NOsh *)(argp2);
+static PyHeapTypeObject SwigPyBuiltin__NOsh_type = {
   {
-    /* Check if is a list */
-    if (PyList_Check(obj2)) {
-      int size = PyList_Size(obj2);
-      int i = 0;
-      arg3 = (double *) malloc((size+1)*sizeof(double));
-      for (i = 0; i < size; i++) {
-        PyObject *o = PyList_GetItem(obj2,i);
-        if (PyFloat_Check(o))
-        arg3[i] = PyFloat_AsDouble(PyList_GetItem(obj2,i));
-        else {
-          PyErr_SetString(PyExc_TypeError,"list must contain floats");
-          free(arg3);
-          return NULL;
-        }
-      }
-      arg3[i] = 0;
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "apbslib.NOsh",                           /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    _wrap_delete_NOsh_destructor_closure,     /* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin__NOsh_type.as_number,      /* tp_as_number */
+    &SwigPyBuiltin__NOsh_type.as_sequence,    /* tp_as_sequence */
+    &SwigPyBuiltin__NOsh_type.as_mapping,     /* tp_as_mapping */
+    SwigPyObject_hash,                        /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin__NOsh_type.as_buffer,      /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::NOsh",                                 /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    SwigPyBuiltin__NOsh_richcompare,          /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__NOsh_methods,              /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin__NOsh_getset,               /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    offsetof(SwigPyObject, dict),             /* tp_dictoffset */
+    _wrap_new_NOsh,                           /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+    (int) 0,                                  /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+    (vectorcallfunc) 0,                       /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+    0,                                        /* tp_print */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+    0,                                        /* tp_prev */
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+    (unaryfunc) 0,                            /* nb_index */
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin__NOsh_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__NOsh_type};
+
+static SwigPyGetSet AtomForce___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__AtomForce_getset[] = {
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &AtomForce___dict___getset },
+    { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin__AtomForce_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
     } else {
-      PyErr_SetString(PyExc_TypeError,"not a list");
-      return NULL;
+      result = Py_NotImplemented;
+      Py_INCREF(result);
     }
   }
-  ecode4 = SWIG_AsVal_int(obj3, &val4);
-  if (!SWIG_IsOK(ecode4)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "returnEnergy" "', argument " "4"" of type '" "int""'");
-  } 
-  arg4 = (int)(val4);
-  result = (double)returnEnergy(arg1,arg2,arg3,arg4);
-  resultobj = SWIG_From_double((double)(result));
-  return resultobj;
-fail:
-  return NULL;
+  return result;
 }
 
+SWIGINTERN PyMethodDef SwigPyBuiltin__AtomForce_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
 
-static PyMethodDef SwigMethods[] = {
-	 { (char *)"new_Valist", _wrap_new_Valist, METH_VARARGS, NULL},
-	 { (char *)"delete_Valist", _wrap_delete_Valist, METH_VARARGS, NULL},
-	 { (char *)"Valist_number_set", _wrap_Valist_number_set, METH_VARARGS, NULL},
-	 { (char *)"Valist_number_get", _wrap_Valist_number_get, METH_VARARGS, NULL},
-	 { (char *)"Valist_swigregister", Valist_swigregister, METH_VARARGS, NULL},
-	 { (char *)"Valist_getAtomList", _wrap_Valist_getAtomList, METH_VARARGS, NULL},
-	 { (char *)"Valist_getAtom", _wrap_Valist_getAtom, METH_VARARGS, NULL},
-	 { (char *)"new_Vatom", _wrap_new_Vatom, METH_VARARGS, NULL},
-	 { (char *)"delete_Vatom", _wrap_delete_Vatom, METH_VARARGS, NULL},
-	 { (char *)"Vatom_id_set", _wrap_Vatom_id_set, METH_VARARGS, NULL},
-	 { (char *)"Vatom_id_get", _wrap_Vatom_id_get, METH_VARARGS, NULL},
-	 { (char *)"Vatom_swigregister", Vatom_swigregister, METH_VARARGS, NULL},
-	 { (char *)"Vatom_getPosition", _wrap_Vatom_getPosition, METH_VARARGS, NULL},
-	 { (char *)"Vatom_setCharge", _wrap_Vatom_setCharge, METH_VARARGS, NULL},
-	 { (char *)"Vatom_getCharge", _wrap_Vatom_getCharge, METH_VARARGS, NULL},
-	 { (char *)"Vatom_getRadius", _wrap_Vatom_getRadius, METH_VARARGS, NULL},
-	 { (char *)"new_MGparm", _wrap_new_MGparm, METH_VARARGS, NULL},
-	 { (char *)"delete_MGparm", _wrap_delete_MGparm, METH_VARARGS, NULL},
-	 { (char *)"MGparm_type_set", _wrap_MGparm_type_set, METH_VARARGS, NULL},
-	 { (char *)"MGparm_type_get", _wrap_MGparm_type_get, METH_VARARGS, NULL},
-	 { (char *)"MGparm_swigregister", MGparm_swigregister, METH_VARARGS, NULL},
-	 { (char *)"MGparm_setCenterX", _wrap_MGparm_setCenterX, METH_VARARGS, NULL},
-	 { (char *)"MGparm_setCenterY", _wrap_MGparm_setCenterY, METH_VARARGS, NULL},
-	 { (char *)"MGparm_setCenterZ", _wrap_MGparm_setCenterZ, METH_VARARGS, NULL},
-	 { (char *)"new_PBEparm", _wrap_new_PBEparm, METH_VARARGS, NULL},
-	 { (char *)"delete_PBEparm", _wrap_delete_PBEparm, METH_VARARGS, NULL},
-	 { (char *)"PBEparm_temp_set", _wrap_PBEparm_temp_set, METH_VARARGS, NULL},
-	 { (char *)"PBEparm_temp_get", _wrap_PBEparm_temp_get, METH_VARARGS, NULL},
-	 { (char *)"PBEparm_pdie_set", _wrap_PBEparm_pdie_set, METH_VARARGS, NULL},
-	 { (char *)"PBEparm_pdie_get", _wrap_PBEparm_pdie_get, METH_VARARGS, NULL},
-	 { (char *)"PBEparm_sdie_set", _wrap_PBEparm_sdie_set, METH_VARARGS, NULL},
-	 { (char *)"PBEparm_sdie_get", _wrap_PBEparm_sdie_get, METH_VARARGS, NULL},
-	 { (char *)"PBEparm_molid_set", _wrap_PBEparm_molid_set, METH_VARARGS, NULL},
-	 { (char *)"PBEparm_molid_get", _wrap_PBEparm_molid_get, METH_VARARGS, NULL},
-	 { (char *)"PBEparm_swigregister", PBEparm_swigregister, METH_VARARGS, NULL},
-	 { (char *)"new_Vcom", _wrap_new_Vcom, METH_VARARGS, NULL},
-	 { (char *)"delete_Vcom", _wrap_delete_Vcom, METH_VARARGS, NULL},
-	 { (char *)"Vcom_swigregister", Vcom_swigregister, METH_VARARGS, NULL},
-	 { (char *)"Vcom_ctor", _wrap_Vcom_ctor, METH_VARARGS, NULL},
-	 { (char *)"Vcom_size", _wrap_Vcom_size, METH_VARARGS, NULL},
-	 { (char *)"Vcom_rank", _wrap_Vcom_rank, METH_VARARGS, NULL},
-	 { (char *)"new_Vmem", _wrap_new_Vmem, METH_VARARGS, NULL},
-	 { (char *)"delete_Vmem", _wrap_delete_Vmem, METH_VARARGS, NULL},
-	 { (char *)"Vmem_swigregister", Vmem_swigregister, METH_VARARGS, NULL},
-	 { (char *)"Vmem_ctor", _wrap_Vmem_ctor, METH_VARARGS, NULL},
-	 { (char *)"new_Vpmg", _wrap_new_Vpmg, METH_VARARGS, NULL},
-	 { (char *)"delete_Vpmg", _wrap_delete_Vpmg, METH_VARARGS, NULL},
-	 { (char *)"Vpmg_swigregister", Vpmg_swigregister, METH_VARARGS, NULL},
-	 { (char *)"new_Vpbe", _wrap_new_Vpbe, METH_VARARGS, NULL},
-	 { (char *)"delete_Vpbe", _wrap_delete_Vpbe, METH_VARARGS, NULL},
-	 { (char *)"Vpbe_acc_set", _wrap_Vpbe_acc_set, METH_VARARGS, NULL},
-	 { (char *)"Vpbe_acc_get", _wrap_Vpbe_acc_get, METH_VARARGS, NULL},
-	 { (char *)"Vpbe_swigregister", Vpbe_swigregister, METH_VARARGS, NULL},
-	 { (char *)"new_NOsh_calc", _wrap_new_NOsh_calc, METH_VARARGS, NULL},
-	 { (char *)"delete_NOsh_calc", _wrap_delete_NOsh_calc, METH_VARARGS, NULL},
-	 { (char *)"NOsh_calc_mgparm_set", _wrap_NOsh_calc_mgparm_set, METH_VARARGS, NULL},
-	 { (char *)"NOsh_calc_mgparm_get", _wrap_NOsh_calc_mgparm_get, METH_VARARGS, NULL},
-	 { (char *)"NOsh_calc_femparm_set", _wrap_NOsh_calc_femparm_set, METH_VARARGS, NULL},
-	 { (char *)"NOsh_calc_femparm_get", _wrap_NOsh_calc_femparm_get, METH_VARARGS, NULL},
-	 { (char *)"NOsh_calc_pbeparm_set", _wrap_NOsh_calc_pbeparm_set, METH_VARARGS, NULL},
-	 { (char *)"NOsh_calc_pbeparm_get", _wrap_NOsh_calc_pbeparm_get, METH_VARARGS, NULL},
-	 { (char *)"NOsh_calc_calctype_set", _wrap_NOsh_calc_calctype_set, METH_VARARGS, NULL},
-	 { (char *)"NOsh_calc_calctype_get", _wrap_NOsh_calc_calctype_get, METH_VARARGS, NULL},
-	 { (char *)"NOsh_calc_swigregister", NOsh_calc_swigregister, METH_VARARGS, NULL},
-	 { (char *)"new_NOsh", _wrap_new_NOsh, METH_VARARGS, NULL},
-	 { (char *)"delete_NOsh", _wrap_delete_NOsh, METH_VARARGS, NULL},
-	 { (char *)"NOsh_ncalc_set", _wrap_NOsh_ncalc_set, METH_VARARGS, NULL},
-	 { (char *)"NOsh_ncalc_get", _wrap_NOsh_ncalc_get, METH_VARARGS, NULL},
-	 { (char *)"NOsh_nprint_set", _wrap_NOsh_nprint_set, METH_VARARGS, NULL},
-	 { (char *)"NOsh_nprint_get", _wrap_NOsh_nprint_get, METH_VARARGS, NULL},
-	 { (char *)"NOsh_nelec_set", _wrap_NOsh_nelec_set, METH_VARARGS, NULL},
-	 { (char *)"NOsh_nelec_get", _wrap_NOsh_nelec_get, METH_VARARGS, NULL},
-	 { (char *)"NOsh_nmol_set", _wrap_NOsh_nmol_set, METH_VARARGS, NULL},
-	 { (char *)"NOsh_nmol_get", _wrap_NOsh_nmol_get, METH_VARARGS, NULL},
-	 { (char *)"NOsh_printwhat_set", _wrap_NOsh_printwhat_set, METH_VARARGS, NULL},
-	 { (char *)"NOsh_printwhat_get", _wrap_NOsh_printwhat_get, METH_VARARGS, NULL},
-	 { (char *)"NOsh_swigregister", NOsh_swigregister, METH_VARARGS, NULL},
-	 { (char *)"NOsh_getCalc", _wrap_NOsh_getCalc, METH_VARARGS, NULL},
-	 { (char *)"NOsh_elecname", _wrap_NOsh_elecname, METH_VARARGS, NULL},
-	 { (char *)"NOsh_elec2calc", _wrap_NOsh_elec2calc, METH_VARARGS, NULL},
-	 { (char *)"NOsh_printWhat", _wrap_NOsh_printWhat, METH_VARARGS, NULL},
-	 { (char *)"NOsh_parseInputFile", _wrap_NOsh_parseInputFile, METH_VARARGS, NULL},
-	 { (char *)"NOsh_ctor", _wrap_NOsh_ctor, METH_VARARGS, NULL},
-	 { (char *)"new_AtomForce", _wrap_new_AtomForce, METH_VARARGS, NULL},
-	 { (char *)"delete_AtomForce", _wrap_delete_AtomForce, METH_VARARGS, NULL},
-	 { (char *)"AtomForce_swigregister", AtomForce_swigregister, METH_VARARGS, NULL},
-	 { (char *)"new_valist", _wrap_new_valist, METH_VARARGS, NULL},
-	 { (char *)"get_Valist", _wrap_get_Valist, METH_VARARGS, NULL},
-	 { (char *)"new_gridlist", _wrap_new_gridlist, METH_VARARGS, NULL},
-	 { (char *)"new_pmglist", _wrap_new_pmglist, METH_VARARGS, NULL},
-	 { (char *)"get_Vpmg", _wrap_get_Vpmg, METH_VARARGS, NULL},
-	 { (char *)"new_pmgplist", _wrap_new_pmgplist, METH_VARARGS, NULL},
-	 { (char *)"new_pbelist", _wrap_new_pbelist, METH_VARARGS, NULL},
-	 { (char *)"get_Vpbe", _wrap_get_Vpbe, METH_VARARGS, NULL},
-	 { (char *)"new_atomforcelist", _wrap_new_atomforcelist, METH_VARARGS, NULL},
-	 { (char *)"delete_atomforcelist", _wrap_delete_atomforcelist, METH_VARARGS, NULL},
-	 { (char *)"delete_valist", _wrap_delete_valist, METH_VARARGS, NULL},
-	 { (char *)"delete_gridlist", _wrap_delete_gridlist, METH_VARARGS, NULL},
-	 { (char *)"delete_pmglist", _wrap_delete_pmglist, METH_VARARGS, NULL},
-	 { (char *)"delete_pmgplist", _wrap_delete_pmgplist, METH_VARARGS, NULL},
-	 { (char *)"delete_pbelist", _wrap_delete_pbelist, METH_VARARGS, NULL},
-	 { (char *)"delete_Nosh", _wrap_delete_Nosh, METH_VARARGS, NULL},
-	 { (char *)"delete_Com", _wrap_delete_Com, METH_VARARGS, NULL},
-	 { (char *)"delete_Mem", _wrap_delete_Mem, METH_VARARGS, NULL},
-	 { (char *)"get_AtomForce", _wrap_get_AtomForce, METH_VARARGS, NULL},
-	 { (char *)"make_Valist", _wrap_make_Valist, METH_VARARGS, NULL},
-	 { (char *)"remove_Valist", _wrap_remove_Valist, METH_VARARGS, NULL},
-	 { (char *)"double_array", _wrap_double_array, METH_VARARGS, NULL},
-	 { (char *)"int_array", _wrap_int_array, METH_VARARGS, NULL},
-	 { (char *)"delete_double_array", _wrap_delete_double_array, METH_VARARGS, NULL},
-	 { (char *)"delete_int_array", _wrap_delete_int_array, METH_VARARGS, NULL},
-	 { (char *)"get_entry", _wrap_get_entry, METH_VARARGS, NULL},
-	 { (char *)"set_entry", _wrap_set_entry, METH_VARARGS, NULL},
-	 { (char *)"parseInputFromString", _wrap_parseInputFromString, METH_VARARGS, NULL},
-	 { (char *)"Valist_load", _wrap_Valist_load, METH_VARARGS, NULL},
-	 { (char *)"NOsh_setupElecCalc", _wrap_NOsh_setupElecCalc, METH_VARARGS, NULL},
-	 { (char *)"NOsh_setupApolCalc", _wrap_NOsh_setupApolCalc, METH_VARARGS, NULL},
-	 { (char *)"wrap_forceMG", _wrap_wrap_forceMG, METH_VARARGS, NULL},
-	 { (char *)"getAtomPosition", _wrap_getAtomPosition, METH_VARARGS, NULL},
-	 { (char *)"getPotentials", _wrap_getPotentials, METH_VARARGS, NULL},
-	 { (char *)"getEnergies", _wrap_getEnergies, METH_VARARGS, NULL},
-	 { (char *)"getForces", _wrap_getForces, METH_VARARGS, NULL},
-	 { (char *)"loadMolecules", _wrap_loadMolecules, METH_VARARGS, NULL},
-	 { (char *)"killMolecules", _wrap_killMolecules, METH_VARARGS, NULL},
-	 { (char *)"loadDielMaps", _wrap_loadDielMaps, METH_VARARGS, NULL},
-	 { (char *)"killDielMaps", _wrap_killDielMaps, METH_VARARGS, NULL},
-	 { (char *)"loadKappaMaps", _wrap_loadKappaMaps, METH_VARARGS, NULL},
-	 { (char *)"killKappaMaps", _wrap_killKappaMaps, METH_VARARGS, NULL},
-	 { (char *)"loadPotMaps", _wrap_loadPotMaps, METH_VARARGS, NULL},
-	 { (char *)"killPotMaps", _wrap_killPotMaps, METH_VARARGS, NULL},
-	 { (char *)"loadChargeMaps", _wrap_loadChargeMaps, METH_VARARGS, NULL},
-	 { (char *)"killChargeMaps", _wrap_killChargeMaps, METH_VARARGS, NULL},
-	 { (char *)"printPBEPARM", _wrap_printPBEPARM, METH_VARARGS, NULL},
-	 { (char *)"printMGPARM", _wrap_printMGPARM, METH_VARARGS, NULL},
-	 { (char *)"initMG", _wrap_initMG, METH_VARARGS, NULL},
-	 { (char *)"killMG", _wrap_killMG, METH_VARARGS, NULL},
-	 { (char *)"solveMG", _wrap_solveMG, METH_VARARGS, NULL},
-	 { (char *)"setPartMG", _wrap_setPartMG, METH_VARARGS, NULL},
-	 { (char *)"killEnergy", _wrap_killEnergy, METH_VARARGS, NULL},
-	 { (char *)"killForce", _wrap_killForce, METH_VARARGS, NULL},
-	 { (char *)"writedataMG", _wrap_writedataMG, METH_VARARGS, NULL},
-	 { (char *)"writematMG", _wrap_writematMG, METH_VARARGS, NULL},
-	 { (char *)"printForce", _wrap_printForce, METH_VARARGS, NULL},
-	 { (char *)"printElecForce", _wrap_printElecForce, METH_VARARGS, NULL},
-	 { (char *)"printApolForce", _wrap_printApolForce, METH_VARARGS, NULL},
-	 { (char *)"startVio", _wrap_startVio, METH_VARARGS, NULL},
-	 { (char *)"Vacc_molAcc", _wrap_Vacc_molAcc, METH_VARARGS, NULL},
-	 { (char *)"Vacc_vdwAcc", _wrap_Vacc_vdwAcc, METH_VARARGS, NULL},
-	 { (char *)"energyMG", _wrap_energyMG, METH_VARARGS, NULL},
-	 { (char *)"printEnergy", _wrap_printEnergy, METH_VARARGS, NULL},
-	 { (char *)"printElecEnergy", _wrap_printElecEnergy, METH_VARARGS, NULL},
-	 { (char *)"printApolEnergy", _wrap_printApolEnergy, METH_VARARGS, NULL},
-	 { (char *)"returnEnergy", _wrap_returnEnergy, METH_VARARGS, NULL},
-	 { NULL, NULL, 0, NULL }
+static PyHeapTypeObject SwigPyBuiltin__AtomForce_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "apbslib.AtomForce",                      /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    _wrap_delete_AtomForce_destructor_closure,/* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin__AtomForce_type.as_number, /* tp_as_number */
+    &SwigPyBuiltin__AtomForce_type.as_sequence,                   /* tp_as_sequence */
+    &SwigPyBuiltin__AtomForce_type.as_mapping,/* tp_as_mapping */
+    SwigPyObject_hash,                        /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin__AtomForce_type.as_buffer, /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::AtomForce",                            /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    SwigPyBuiltin__AtomForce_richcompare,     /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__AtomForce_methods,         /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin__AtomForce_getset,          /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    offsetof(SwigPyObject, dict),             /* tp_dictoffset */
+    _wrap_new_AtomForce,                      /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+    (int) 0,                                  /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+    (vectorcallfunc) 0,                       /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+    0,                                        /* tp_print */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+    0,                                        /* tp_prev */
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+    (unaryfunc) 0,                            /* nb_index */
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
 };
 
+SWIGINTERN SwigPyClientData SwigPyBuiltin__AtomForce_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__AtomForce_type};
+
 
 /* -------- TYPE CONVERSION AND EQUIVALENCE RULES (BEGIN) -------- */
 
-static swig_type_info _swigt__p_AtomForce = {"_p_AtomForce", "AtomForce *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_AtomForce = {"_p_AtomForce", "AtomForce *", 0, 0, (void*)&SwigPyBuiltin__AtomForce_clientdata, 0};
 static swig_type_info _swigt__p_FEMparm = {"_p_FEMparm", "FEMparm *", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_MGparm = {"_p_MGparm", "MGparm *", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_NOsh = {"_p_NOsh", "NOsh *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_MGparm = {"_p_MGparm", "MGparm *", 0, 0, (void*)&SwigPyBuiltin__MGparm_clientdata, 0};
+static swig_type_info _swigt__p_NOsh = {"_p_NOsh", "NOsh *", 0, 0, (void*)&SwigPyBuiltin__NOsh_clientdata, 0};
 static swig_type_info _swigt__p_NOsh_PrintType = {"_p_NOsh_PrintType", "enum NOsh_PrintType *|NOsh_PrintType *", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_NOsh_calc = {"_p_NOsh_calc", "NOsh_calc *", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_PBEparm = {"_p_PBEparm", "PBEparm *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_NOsh_calc = {"_p_NOsh_calc", "NOsh_calc *", 0, 0, (void*)&SwigPyBuiltin__NOsh_calc_clientdata, 0};
+static swig_type_info _swigt__p_PBEparm = {"_p_PBEparm", "PBEparm *", 0, 0, (void*)&SwigPyBuiltin__PBEparm_clientdata, 0};
+static swig_type_info _swigt__p_SwigPyObject = {"_p_SwigPyObject", "SwigPyObject *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_Vacc = {"_p_Vacc", "Vacc *", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_Valist = {"_p_Valist", "Valist *", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_Vatom = {"_p_Vatom", "Vatom *", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_Vcom = {"_p_Vcom", "Vcom *", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_Vmem = {"_p_Vmem", "Vmem *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_Valist = {"_p_Valist", "Valist *", 0, 0, (void*)&SwigPyBuiltin__Valist_clientdata, 0};
+static swig_type_info _swigt__p_Vatom = {"_p_Vatom", "Vatom *", 0, 0, (void*)&SwigPyBuiltin__Vatom_clientdata, 0};
+static swig_type_info _swigt__p_Vcom = {"_p_Vcom", "Vcom *", 0, 0, (void*)&SwigPyBuiltin__Vcom_clientdata, 0};
+static swig_type_info _swigt__p_Vgrid = {"_p_Vgrid", "Vgrid *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_Vmem = {"_p_Vmem", "Vmem *", 0, 0, (void*)&SwigPyBuiltin__Vmem_clientdata, 0};
 static swig_type_info _swigt__p_Vparam = {"_p_Vparam", "Vparam *", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_Vpbe = {"_p_Vpbe", "Vpbe *", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_Vpmg = {"_p_Vpmg", "Vpmg *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_Vpbe = {"_p_Vpbe", "Vpbe *", 0, 0, (void*)&SwigPyBuiltin__Vpbe_clientdata, 0};
+static swig_type_info _swigt__p_Vpmg = {"_p_Vpmg", "Vpmg *", 0, 0, (void*)&SwigPyBuiltin__Vpmg_clientdata, 0};
 static swig_type_info _swigt__p_char = {"_p_char", "char *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_double = {"_p_double", "double *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_eAPBSphase = {"_p_eAPBSphase", "enum eAPBSphase *|APBSphase *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_int = {"_p_int", "int *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_p_AtomForce = {"_p_p_AtomForce", "AtomForce **", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_p_Valist = {"_p_p_Valist", "Valist **", 0, 0, (void*)0, 0};
@@ -7594,16 +14235,19 @@ static swig_type_info *swig_type_initial[] = {
   &_swigt__p_NOsh_PrintType,
   &_swigt__p_NOsh_calc,
   &_swigt__p_PBEparm,
+  &_swigt__p_SwigPyObject,
   &_swigt__p_Vacc,
   &_swigt__p_Valist,
   &_swigt__p_Vatom,
   &_swigt__p_Vcom,
+  &_swigt__p_Vgrid,
   &_swigt__p_Vmem,
   &_swigt__p_Vparam,
   &_swigt__p_Vpbe,
   &_swigt__p_Vpmg,
   &_swigt__p_char,
   &_swigt__p_double,
+  &_swigt__p_eAPBSphase,
   &_swigt__p_int,
   &_swigt__p_p_AtomForce,
   &_swigt__p_p_Valist,
@@ -7620,16 +14264,19 @@ static swig_cast_info _swigc__p_NOsh[] = {  {&_swigt__p_NOsh, 0, 0, 0},{0, 0, 0,
 static swig_cast_info _swigc__p_NOsh_PrintType[] = {  {&_swigt__p_NOsh_PrintType, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_NOsh_calc[] = {  {&_swigt__p_NOsh_calc, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_PBEparm[] = {  {&_swigt__p_PBEparm, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_SwigPyObject[] = {  {&_swigt__p_SwigPyObject, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_Vacc[] = {  {&_swigt__p_Vacc, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_Valist[] = {  {&_swigt__p_Valist, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_Vatom[] = {  {&_swigt__p_Vatom, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_Vcom[] = {  {&_swigt__p_Vcom, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_Vgrid[] = {  {&_swigt__p_Vgrid, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_Vmem[] = {  {&_swigt__p_Vmem, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_Vparam[] = {  {&_swigt__p_Vparam, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_Vpbe[] = {  {&_swigt__p_Vpbe, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_Vpmg[] = {  {&_swigt__p_Vpmg, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_char[] = {  {&_swigt__p_char, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_double[] = {  {&_swigt__p_double, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_eAPBSphase[] = {  {&_swigt__p_eAPBSphase, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_int[] = {  {&_swigt__p_int, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_p_AtomForce[] = {  {&_swigt__p_p_AtomForce, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_p_Valist[] = {  {&_swigt__p_p_Valist, 0, 0, 0},{0, 0, 0, 0}};
@@ -7646,16 +14293,19 @@ static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_NOsh_PrintType,
   _swigc__p_NOsh_calc,
   _swigc__p_PBEparm,
+  _swigc__p_SwigPyObject,
   _swigc__p_Vacc,
   _swigc__p_Valist,
   _swigc__p_Vatom,
   _swigc__p_Vcom,
+  _swigc__p_Vgrid,
   _swigc__p_Vmem,
   _swigc__p_Vparam,
   _swigc__p_Vpbe,
   _swigc__p_Vpmg,
   _swigc__p_char,
   _swigc__p_double,
+  _swigc__p_eAPBSphase,
   _swigc__p_int,
   _swigc__p_p_AtomForce,
   _swigc__p_p_Valist,
@@ -7674,20 +14324,22 @@ static swig_const_info swig_const_table[] = {
 #ifdef __cplusplus
 }
 #endif
+static PyTypeObject *builtin_bases[2];
+
 /* -----------------------------------------------------------------------------
  * Type initialization:
- * This problem is tough by the requirement that no dynamic 
- * memory is used. Also, since swig_type_info structures store pointers to 
+ * This problem is tough by the requirement that no dynamic
+ * memory is used. Also, since swig_type_info structures store pointers to
  * swig_cast_info structures and swig_cast_info structures store pointers back
- * to swig_type_info structures, we need some lookup code at initialization. 
- * The idea is that swig generates all the structures that are needed. 
- * The runtime then collects these partially filled structures. 
- * The SWIG_InitializeModule function takes these initial arrays out of 
+ * to swig_type_info structures, we need some lookup code at initialization.
+ * The idea is that swig generates all the structures that are needed.
+ * The runtime then collects these partially filled structures.
+ * The SWIG_InitializeModule function takes these initial arrays out of
  * swig_module, and does all the lookup, filling in the swig_module.types
  * array with the correct data and linking the correct swig_cast_info
  * structures together.
  *
- * The generated swig_type_info structures are assigned staticly to an initial 
+ * The generated swig_type_info structures are assigned statically to an initial
  * array. We just loop through that array, and handle each type individually.
  * First we lookup if this type has been already loaded, and if so, use the
  * loaded structure instead of the generated one. Then we have to fill in the
@@ -7697,17 +14349,17 @@ static swig_const_info swig_const_table[] = {
  * a column is one of the swig_cast_info structures for that type.
  * The cast_initial array is actually an array of arrays, because each row has
  * a variable number of columns. So to actually build the cast linked list,
- * we find the array of casts associated with the type, and loop through it 
+ * we find the array of casts associated with the type, and loop through it
  * adding the casts to the list. The one last trick we need to do is making
  * sure the type pointer in the swig_cast_info struct is correct.
  *
- * First off, we lookup the cast->type name to see if it is already loaded. 
+ * First off, we lookup the cast->type name to see if it is already loaded.
  * There are three cases to handle:
  *  1) If the cast->type has already been loaded AND the type we are adding
  *     casting info to has not been loaded (it is in this module), THEN we
  *     replace the cast->type pointer with the type pointer that has already
  *     been loaded.
- *  2) If BOTH types (the one we are adding casting info to, and the 
+ *  2) If BOTH types (the one we are adding casting info to, and the
  *     cast->type) are loaded, THEN the cast info has already been loaded by
  *     the previous module so we just ignore it.
  *  3) Finally, if cast->type has not already been loaded, then we add that
@@ -7731,9 +14383,7 @@ SWIGRUNTIME void
 SWIG_InitializeModule(void *clientdata) {
   size_t i;
   swig_module_info *module_head, *iter;
-  int found;
-  
-  clientdata = clientdata;
+  int init;
   
   /* check to see if the circular list has been setup, if not, set it up */
   if (swig_module.next==0) {
@@ -7741,6 +14391,9 @@ SWIG_InitializeModule(void *clientdata) {
     swig_module.type_initial = swig_type_initial;
     swig_module.cast_initial = swig_cast_initial;
     swig_module.next = &swig_module;
+    init = 1;
+  } else {
+    init = 0;
   }
   
   /* Try and load any already created modules */
@@ -7749,29 +14402,31 @@ SWIG_InitializeModule(void *clientdata) {
     /* This is the first module loaded for this interpreter */
     /* so set the swig module into the interpreter */
     SWIG_SetModule(clientdata, &swig_module);
-    module_head = &swig_module;
   } else {
     /* the interpreter has loaded a SWIG module, but has it loaded this one? */
-    found=0;
     iter=module_head;
     do {
       if (iter==&swig_module) {
-        found=1;
-        break;
+        /* Our module is already in the list, so there's nothing more to do. */
+        return;
       }
       iter=iter->next;
     } while (iter!= module_head);
     
-    /* if the is found in the list, then all is done and we may leave */
-    if (found) return;
-    /* otherwise we must add out module into the list */
+    /* otherwise we must add our module into the list */
     swig_module.next = module_head->next;
     module_head->next = &swig_module;
   }
   
+  /* When multiple interpreters are used, a module could have already been initialized in
+       a different interpreter, but not yet have a pointer in this interpreter.
+       In this case, we do not want to continue adding types... everything should be
+       set up already */
+  if (init == 0) return;
+  
   /* Now work on filling in swig_module.types */
 #ifdef SWIGRUNTIME_DEBUG
-  printf("SWIG_InitializeModule: size %d\n", swig_module.size);
+  printf("SWIG_InitializeModule: size %lu\n", (unsigned long)swig_module.size);
 #endif
   for (i = 0; i < swig_module.size; ++i) {
     swig_type_info *type = 0;
@@ -7779,7 +14434,7 @@ SWIG_InitializeModule(void *clientdata) {
     swig_cast_info *cast;
     
 #ifdef SWIGRUNTIME_DEBUG
-    printf("SWIG_InitializeModule: type %d %s\n", i, swig_module.type_initial[i]->name);
+    printf("SWIG_InitializeModule: type %lu %s\n", (unsigned long)i, swig_module.type_initial[i]->name);
 #endif
     
     /* if there is another module already loaded */
@@ -7854,7 +14509,7 @@ SWIG_InitializeModule(void *clientdata) {
   for (i = 0; i < swig_module.size; ++i) {
     int j = 0;
     swig_cast_info *cast = swig_module.cast_initial[i];
-    printf("SWIG_InitializeModule: type %d %s\n", i, swig_module.type_initial[i]->name);
+    printf("SWIG_InitializeModule: type %lu %s\n", (unsigned long)i, swig_module.type_initial[i]->name);
     while (cast->type) {
       printf("SWIG_InitializeModule: cast type %s\n", cast->type->name);
       cast++;
@@ -7931,30 +14586,51 @@ extern "C" {
   
   SWIGINTERN PyObject *
   swig_varlink_repr(swig_varlinkobject *SWIGUNUSEDPARM(v)) {
+#if PY_VERSION_HEX >= 0x03000000
+    return PyUnicode_InternFromString("<Swig global variables>");
+#else
     return PyString_FromString("<Swig global variables>");
+#endif
   }
   
   SWIGINTERN PyObject *
   swig_varlink_str(swig_varlinkobject *v) {
+#if PY_VERSION_HEX >= 0x03000000
+    PyObject *str = PyUnicode_InternFromString("(");
+    PyObject *tail;
+    PyObject *joined;
+    swig_globalvar *var;
+    for (var = v->vars; var; var=var->next) {
+      tail = PyUnicode_FromString(var->name);
+      joined = PyUnicode_Concat(str, tail);
+      Py_DecRef(str);
+      Py_DecRef(tail);
+      str = joined;
+      if (var->next) {
+        tail = PyUnicode_InternFromString(", ");
+        joined = PyUnicode_Concat(str, tail);
+        Py_DecRef(str);
+        Py_DecRef(tail);
+        str = joined;
+      }
+    }
+    tail = PyUnicode_InternFromString(")");
+    joined = PyUnicode_Concat(str, tail);
+    Py_DecRef(str);
+    Py_DecRef(tail);
+    str = joined;
+#else
     PyObject *str = PyString_FromString("(");
-    swig_globalvar  *var;
+    swig_globalvar *var;
     for (var = v->vars; var; var=var->next) {
       PyString_ConcatAndDel(&str,PyString_FromString(var->name));
       if (var->next) PyString_ConcatAndDel(&str,PyString_FromString(", "));
     }
     PyString_ConcatAndDel(&str,PyString_FromString(")"));
+#endif
     return str;
   }
   
-  SWIGINTERN int
-  swig_varlink_print(swig_varlinkobject *v, FILE *fp, int SWIGUNUSEDPARM(flags)) {
-    PyObject *str = swig_varlink_str(v);
-    fprintf(fp,"Swig global variables ");
-    fprintf(fp,"%s\n", PyString_AsString(str));
-    Py_DECREF(str);
-    return 0;
-  }
-  
   SWIGINTERN void
   swig_varlink_dealloc(swig_varlinkobject *v) {
     swig_globalvar *var = v->vars;
@@ -7978,7 +14654,7 @@ extern "C" {
       var = var->next;
     }
     if (res == NULL && !PyErr_Occurred()) {
-      PyErr_SetString(PyExc_NameError,"Unknown C global variable");
+      PyErr_Format(PyExc_AttributeError, "Unknown C global variable '%s'", n);
     }
     return res;
   }
@@ -7995,7 +14671,7 @@ extern "C" {
       var = var->next;
     }
     if (res == 1 && !PyErr_Occurred()) {
-      PyErr_SetString(PyExc_NameError,"Unknown C global variable");
+      PyErr_Format(PyExc_AttributeError, "Unknown C global variable '%s'", n);
     }
     return res;
   }
@@ -8004,19 +14680,22 @@ extern "C" {
   swig_varlink_type(void) {
     static char varlink__doc__[] = "Swig var link object";
     static PyTypeObject varlink_type;
-    static int type_init = 0;  
+    static int type_init = 0;
     if (!type_init) {
-      const PyTypeObject tmp
-      = {
+      const PyTypeObject tmp = {
+#if PY_VERSION_HEX >= 0x03000000
+        PyVarObject_HEAD_INIT(NULL, 0)
+#else
         PyObject_HEAD_INIT(NULL)
-        0,                                  /* Number of items in variable part (ob_size) */
-        (char *)"swigvarlink",              /* Type name (tp_name) */
-        sizeof(swig_varlinkobject),         /* Basic size (tp_basicsize) */
-        0,                                  /* Itemsize (tp_itemsize) */
-        (destructor) swig_varlink_dealloc,   /* Deallocator (tp_dealloc) */ 
-        (printfunc) swig_varlink_print,     /* Print (tp_print) */
-        (getattrfunc) swig_varlink_getattr, /* get attr (tp_getattr) */
-        (setattrfunc) swig_varlink_setattr, /* Set attr (tp_setattr) */
+        0,                                  /* ob_size */
+#endif
+        "swigvarlink",                      /* tp_name */
+        sizeof(swig_varlinkobject),         /* tp_basicsize */
+        0,                                  /* tp_itemsize */
+        (destructor) swig_varlink_dealloc,  /* tp_dealloc */
+        0,                                  /* tp_print */
+        (getattrfunc) swig_varlink_getattr, /* tp_getattr */
+        (setattrfunc) swig_varlink_setattr, /* tp_setattr */
         0,                                  /* tp_compare */
         (reprfunc) swig_varlink_repr,       /* tp_repr */
         0,                                  /* tp_as_number */
@@ -8024,7 +14703,7 @@ extern "C" {
         0,                                  /* tp_as_mapping */
         0,                                  /* tp_hash */
         0,                                  /* tp_call */
-        (reprfunc)swig_varlink_str,        /* tp_str */
+        (reprfunc) swig_varlink_str,        /* tp_str */
         0,                                  /* tp_getattro */
         0,                                  /* tp_setattro */
         0,                                  /* tp_as_buffer */
@@ -8034,19 +14713,30 @@ extern "C" {
         0,                                  /* tp_clear */
         0,                                  /* tp_richcompare */
         0,                                  /* tp_weaklistoffset */
-#if PY_VERSION_HEX >= 0x02020000
         0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0, /* tp_iter -> tp_weaklist */
-#endif
-#if PY_VERSION_HEX >= 0x02030000
         0,                                  /* tp_del */
+        0,                                  /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+        0,                                  /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+        0,                                  /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+        0,                                  /* tp_print */
 #endif
 #ifdef COUNT_ALLOCS
-        0,0,0,0                             /* tp_alloc -> tp_next */
+        0,                                  /* tp_allocs */
+        0,                                  /* tp_frees */
+        0,                                  /* tp_maxalloc */
+        0,                                  /* tp_prev */
+        0                                   /* tp_next */
 #endif
       };
       varlink_type = tmp;
-      varlink_type.ob_type = &PyType_Type;
       type_init = 1;
+      if (PyType_Ready(&varlink_type) < 0)
+      return NULL;
     }
     return &varlink_type;
   }
@@ -8062,14 +14752,14 @@ extern "C" {
   }
   
   SWIGINTERN void 
-  SWIG_Python_addvarlink(PyObject *p, char *name, PyObject *(*get_attr)(void), int (*set_attr)(PyObject *p)) {
+  SWIG_Python_addvarlink(PyObject *p, const char *name, PyObject *(*get_attr)(void), int (*set_attr)(PyObject *p)) {
     swig_varlinkobject *v = (swig_varlinkobject *) p;
     swig_globalvar *gv = (swig_globalvar *) malloc(sizeof(swig_globalvar));
     if (gv) {
       size_t size = strlen(name)+1;
       gv->name = (char *)malloc(size);
       if (gv->name) {
-        strncpy(gv->name,name,size);
+        memcpy(gv->name, name, size);
         gv->get_attr = get_attr;
         gv->set_attr = set_attr;
         gv->next = v->vars;
@@ -8080,9 +14770,11 @@ extern "C" {
   
   SWIGINTERN PyObject *
   SWIG_globals(void) {
-    static PyObject *_SWIG_globals = 0; 
-    if (!_SWIG_globals) _SWIG_globals = SWIG_newvarlink();  
-    return _SWIG_globals;
+    static PyObject *globals = 0;
+    if (!globals) {
+      globals = SWIG_newvarlink();
+    }
+    return globals;
   }
   
   /* -----------------------------------------------------------------------------
@@ -8097,7 +14789,7 @@ extern "C" {
     for (i = 0; constants[i].type; ++i) {
       switch(constants[i].type) {
       case SWIG_PY_POINTER:
-        obj = SWIG_NewPointerObj(constants[i].pvalue, *(constants[i]).ptype,0);
+        obj = SWIG_InternalNewPointerObj(constants[i].pvalue, *(constants[i]).ptype,0);
         break;
       case SWIG_PY_BINARY:
         obj = SWIG_NewPackedObj(constants[i].pvalue, constants[i].lvalue, *(constants[i].ptype));
@@ -8125,7 +14817,9 @@ extern "C" {
     size_t i;
     for (i = 0; methods[i].ml_name; ++i) {
       const char *c = methods[i].ml_doc;
-      if (c && (c = strstr(c, "swig_ptr: "))) {
+      if (!c) continue;
+      c = strstr(c, "swig_ptr: ");
+      if (c) {
         int j;
         swig_const_info *ci = 0;
         const char *name = c + 10;
@@ -8137,18 +14831,18 @@ extern "C" {
           }
         }
         if (ci) {
-          size_t shift = (ci->ptype) - types;
-          swig_type_info *ty = types_initial[shift];
-          size_t ldoc = (c - methods[i].ml_doc);
-          size_t lptr = strlen(ty->name)+2*sizeof(void*)+2;
-          char *ndoc = (char*)malloc(ldoc + lptr + 10);
-          if (ndoc) {
-            char *buff = ndoc;
-            void *ptr = (ci->type == SWIG_PY_POINTER) ? ci->pvalue : 0;
-            if (ptr) {
-              strncpy(buff, methods[i].ml_doc, ldoc);
+          void *ptr = (ci->type == SWIG_PY_POINTER) ? ci->pvalue : 0;
+          if (ptr) {
+            size_t shift = (ci->ptype) - types;
+            swig_type_info *ty = types_initial[shift];
+            size_t ldoc = (c - methods[i].ml_doc);
+            size_t lptr = strlen(ty->name)+2*sizeof(void*)+2;
+            char *ndoc = (char*)malloc(ldoc + lptr + 10);
+            if (ndoc) {
+              char *buff = ndoc;
+              memcpy(buff, methods[i].ml_doc, ldoc);
               buff += ldoc;
-              strncpy(buff, "swig_ptr: ", 10);
+              memcpy(buff, "swig_ptr: ", 10);
               buff += 10;
               SWIG_PackVoidPtr(buff, ptr, ty->name, lptr);
               methods[i].ml_doc = ndoc;
@@ -8159,6 +14853,64 @@ extern "C" {
     }
   } 
   
+  /* -----------------------------------------------------------------------------
+   * Method creation and docstring support functions
+   * ----------------------------------------------------------------------------- */
+  
+  /* -----------------------------------------------------------------------------
+   * Function to find the method definition with the correct docstring for the
+   * proxy module as opposed to the low-level API
+   * ----------------------------------------------------------------------------- */
+  
+  SWIGINTERN PyMethodDef *SWIG_PythonGetProxyDoc(const char *name) {
+    /* Find the function in the modified method table */
+    size_t offset = 0;
+    int found = 0;
+    while (SwigMethods_proxydocs[offset].ml_meth != NULL) {
+      if (strcmp(SwigMethods_proxydocs[offset].ml_name, name) == 0) {
+        found = 1;
+        break;
+      }
+      offset++;
+    }
+    /* Use the copy with the modified docstring if available */
+    return found ? &SwigMethods_proxydocs[offset] : NULL;
+  }
+  
+  /* -----------------------------------------------------------------------------
+   * Wrapper of PyInstanceMethod_New() used in Python 3
+   * It is exported to the generated module, used for -fastproxy
+   * ----------------------------------------------------------------------------- */
+  
+  SWIGINTERN PyObject *SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func) {
+    if (PyCFunction_Check(func)) {
+      PyCFunctionObject *funcobj = (PyCFunctionObject *)func;
+      PyMethodDef *ml = SWIG_PythonGetProxyDoc(funcobj->m_ml->ml_name);
+      if (ml)
+      func = PyCFunction_NewEx(ml, funcobj->m_self, funcobj->m_module);
+    }
+#if PY_VERSION_HEX >= 0x03000000
+    return PyInstanceMethod_New(func);
+#else
+    return PyMethod_New(func, NULL, NULL);
+#endif
+  }
+  
+  /* -----------------------------------------------------------------------------
+   * Wrapper of PyStaticMethod_New()
+   * It is exported to the generated module, used for -fastproxy
+   * ----------------------------------------------------------------------------- */
+  
+  SWIGINTERN PyObject *SWIG_PyStaticMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func) {
+    if (PyCFunction_Check(func)) {
+      PyCFunctionObject *funcobj = (PyCFunctionObject *)func;
+      PyMethodDef *ml = SWIG_PythonGetProxyDoc(funcobj->m_ml->ml_name);
+      if (ml)
+      func = PyCFunction_NewEx(ml, funcobj->m_self, funcobj->m_module);
+    }
+    return PyStaticMethod_New(func);
+  }
+  
 #ifdef __cplusplus
 }
 #endif
@@ -8170,24 +14922,432 @@ extern "C" {
 #ifdef __cplusplus
 extern "C"
 #endif
-SWIGEXPORT void SWIG_init(void) {
-  PyObject *m, *d;
+
+SWIGEXPORT 
+#if PY_VERSION_HEX >= 0x03000000
+PyObject*
+#else
+void
+#endif
+SWIG_init(void) {
+  PyObject *m, *d, *md, *globals;
+  
+#if PY_VERSION_HEX >= 0x03000000
+  static struct PyModuleDef SWIG_module = {
+    PyModuleDef_HEAD_INIT,
+    SWIG_name,
+    NULL,
+    -1,
+    SwigMethods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+  };
+#endif
+  
+#if defined(SWIGPYTHON_BUILTIN)
+  static SwigPyClientData SwigPyObject_clientdata = {
+    0, 0, 0, 0, 0, 0, 0
+  };
+  static PyGetSetDef this_getset_def = {
+    (char *)"this", &SwigPyBuiltin_ThisClosure, NULL, NULL, NULL
+  };
+  static SwigPyGetSet thisown_getset_closure = {
+    SwigPyObject_own,
+    SwigPyObject_own
+  };
+  static PyGetSetDef thisown_getset_def = {
+    (char *)"thisown", SwigPyBuiltin_GetterClosure, SwigPyBuiltin_SetterClosure, NULL, &thisown_getset_closure
+  };
+  PyTypeObject *builtin_pytype;
+  int builtin_base_count;
+  swig_type_info *builtin_basetype;
+  PyObject *tuple;
+  PyGetSetDescrObject *static_getset;
+  PyTypeObject *metatype;
+  PyTypeObject *swigpyobject;
+  SwigPyClientData *cd;
+  PyObject *public_interface, *public_symbol;
+  PyObject *this_descr;
+  PyObject *thisown_descr;
+  PyObject *self = 0;
+  int i;
+  
+  (void)builtin_pytype;
+  (void)builtin_base_count;
+  (void)builtin_basetype;
+  (void)tuple;
+  (void)static_getset;
+  (void)self;
+  
+  /* Metaclass is used to implement static member variables */
+  metatype = SwigPyObjectType();
+  assert(metatype);
+#endif
+  
+  (void)globals;
+  
+  /* Create singletons now to avoid potential deadlocks with multi-threaded usage after module initialization */
+  SWIG_This();
+  SWIG_Python_TypeCache();
+  SwigPyPacked_type();
+#ifndef SWIGPYTHON_BUILTIN
+  SwigPyObject_type();
+#endif
   
   /* Fix SwigMethods to carry the callback ptrs when needed */
   SWIG_Python_FixMethods(SwigMethods, swig_const_table, swig_types, swig_type_initial);
   
-  m = Py_InitModule((char *) SWIG_name, SwigMethods);
-  d = PyModule_GetDict(m);
+#if PY_VERSION_HEX >= 0x03000000
+  m = PyModule_Create(&SWIG_module);
+#else
+  m = Py_InitModule(SWIG_name, SwigMethods);
+#endif
+  
+  md = d = PyModule_GetDict(m);
+  (void)md;
   
   SWIG_InitializeModule(0);
+  
+#ifdef SWIGPYTHON_BUILTIN
+  swigpyobject = SwigPyObject_TypeOnce();
+  
+  SwigPyObject_stype = SWIG_MangledTypeQuery("_p_SwigPyObject");
+  assert(SwigPyObject_stype);
+  cd = (SwigPyClientData*) SwigPyObject_stype->clientdata;
+  if (!cd) {
+    SwigPyObject_stype->clientdata = &SwigPyObject_clientdata;
+    SwigPyObject_clientdata.pytype = swigpyobject;
+  } else if (swigpyobject->tp_basicsize != cd->pytype->tp_basicsize) {
+    PyErr_SetString(PyExc_RuntimeError, "Import error: attempted to load two incompatible swig-generated modules.");
+# if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+# else
+    return;
+# endif
+  }
+  
+  /* All objects have a 'this' attribute */
+  this_descr = PyDescr_NewGetSet(SwigPyObject_type(), &this_getset_def);
+  (void)this_descr;
+  
+  /* All objects have a 'thisown' attribute */
+  thisown_descr = PyDescr_NewGetSet(SwigPyObject_type(), &thisown_getset_def);
+  (void)thisown_descr;
+  
+  public_interface = PyList_New(0);
+  public_symbol = 0;
+  (void)public_symbol;
+  
+  PyDict_SetItemString(md, "__all__", public_interface);
+  Py_DECREF(public_interface);
+  for (i = 0; SwigMethods[i].ml_name != NULL; ++i)
+  SwigPyBuiltin_AddPublicSymbol(public_interface, SwigMethods[i].ml_name);
+  for (i = 0; swig_const_table[i].name != 0; ++i)
+  SwigPyBuiltin_AddPublicSymbol(public_interface, swig_const_table[i].name);
+#endif
+  
   SWIG_InstallConstants(d,swig_const_table);
   
   
-  SWIG_Python_SetConstant(d, "NPT_ENERGY",SWIG_From_int((int)(NPT_ENERGY)));
-  SWIG_Python_SetConstant(d, "NPT_FORCE",SWIG_From_int((int)(NPT_FORCE)));
-  SWIG_Python_SetConstant(d, "NPT_ELECENERGY",SWIG_From_int((int)(NPT_ELECENERGY)));
-  SWIG_Python_SetConstant(d, "NPT_ELECFORCE",SWIG_From_int((int)(NPT_ELECFORCE)));
-  SWIG_Python_SetConstant(d, "NPT_APOLENERGY",SWIG_From_int((int)(NPT_APOLENERGY)));
-  SWIG_Python_SetConstant(d, "NPT_APOLFORCE",SWIG_From_int((int)(NPT_APOLFORCE)));
+  /* type '::Valist' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__Valist_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'Valist'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "Valist", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "Valist");
+  d = md;
+  
+  /* type '::Vatom' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__Vatom_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'Vatom'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "Vatom", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "Vatom");
+  d = md;
+  
+  /* type '::MGparm' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__MGparm_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'MGparm'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "MGparm", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "MGparm");
+  d = md;
+  
+  /* type '::PBEparm' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__PBEparm_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'PBEparm'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "PBEparm", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "PBEparm");
+  d = md;
+  
+  /* type '::Vcom' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__Vcom_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'Vcom'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "Vcom", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "Vcom");
+  d = md;
+  
+  /* type '::Vmem' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__Vmem_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'Vmem'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "Vmem", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "Vmem");
+  d = md;
+  
+  /* type '::Vpmg' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__Vpmg_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'Vpmg'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "Vpmg", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "Vpmg");
+  d = md;
+  
+  /* type '::Vpbe' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__Vpbe_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'Vpbe'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "Vpbe", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "Vpbe");
+  d = md;
+  
+  /* type '::NOsh_calc' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__NOsh_calc_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'NOsh_calc'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "NOsh_calc", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "NOsh_calc");
+  d = md;
+  
+  /* type '::NOsh' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__NOsh_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'NOsh'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "NOsh", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "NOsh");
+  d = md;
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "PBE_LPBE",SWIG_From_int((int)(PBE_LPBE)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "PBE_NPBE",SWIG_From_int((int)(PBE_NPBE)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "PBE_LRPBE",SWIG_From_int((int)(PBE_LRPBE)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "PBE_NRPBE",SWIG_From_int((int)(PBE_NRPBE)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "PBE_SMPBE",SWIG_From_int((int)(PBE_SMPBE)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "BCFL_ZERO",SWIG_From_int((int)(BCFL_ZERO)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "BCFL_SDH",SWIG_From_int((int)(BCFL_SDH)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "BCFL_MDH",SWIG_From_int((int)(BCFL_MDH)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "BCFL_UNUSED",SWIG_From_int((int)(BCFL_UNUSED)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "BCFL_FOCUS",SWIG_From_int((int)(BCFL_FOCUS)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "BCFL_MEM",SWIG_From_int((int)(BCFL_MEM)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "BCFL_MAP",SWIG_From_int((int)(BCFL_MAP)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "VSM_MOL",SWIG_From_int((int)(VSM_MOL)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "VSM_MOLSMOOTH",SWIG_From_int((int)(VSM_MOLSMOOTH)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "VSM_SPLINE",SWIG_From_int((int)(VSM_SPLINE)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "VSM_SPLINE3",SWIG_From_int((int)(VSM_SPLINE3)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "VSM_SPLINE4",SWIG_From_int((int)(VSM_SPLINE4)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "VCM_TRIL",SWIG_From_int((int)(VCM_TRIL)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "VCM_BSPL2",SWIG_From_int((int)(VCM_BSPL2)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "VCM_BSPL4",SWIG_From_int((int)(VCM_BSPL4)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "PCE_NO",SWIG_From_int((int)(PCE_NO)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "PCE_TOTAL",SWIG_From_int((int)(PCE_TOTAL)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "PCE_COMPS",SWIG_From_int((int)(PCE_COMPS)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "PCF_NO",SWIG_From_int((int)(PCF_NO)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "PCF_TOTAL",SWIG_From_int((int)(PCF_TOTAL)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "PCF_COMPS",SWIG_From_int((int)(PCF_COMPS)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "APBS_PHASE_PARSE",SWIG_From_int((int)(APBS_PHASE_PARSE)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "APBS_PHASE_MOLECULES",SWIG_From_int((int)(APBS_PHASE_MOLECULES)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "APBS_PHASE_MAPS",SWIG_From_int((int)(APBS_PHASE_MAPS)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "APBS_PHASE_SETUP",SWIG_From_int((int)(APBS_PHASE_SETUP)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "APBS_PHASE_FILLCO",SWIG_From_int((int)(APBS_PHASE_FILLCO)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "APBS_PHASE_SOLVE",SWIG_From_int((int)(APBS_PHASE_SOLVE)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "APBS_PHASE_ENERGY",SWIG_From_int((int)(APBS_PHASE_ENERGY)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "APBS_PHASE_FORCE",SWIG_From_int((int)(APBS_PHASE_FORCE)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "APBS_PHASE_WRITE",SWIG_From_int((int)(APBS_PHASE_WRITE)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "NPT_ENERGY",SWIG_From_int((int)(NPT_ENERGY)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "NPT_FORCE",SWIG_From_int((int)(NPT_FORCE)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "NPT_ELECENERGY",SWIG_From_int((int)(NPT_ELECENERGY)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "NPT_ELECFORCE",SWIG_From_int((int)(NPT_ELECFORCE)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "NPT_APOLENERGY",SWIG_From_int((int)(NPT_APOLENERGY)));
+  SWIG_Python_SetConstant(d, d == md ? public_interface : NULL, "NPT_APOLFORCE",SWIG_From_int((int)(NPT_APOLFORCE)));
+  
+  /* type '::AtomForce' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__AtomForce_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'AtomForce'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "AtomForce", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "AtomForce");
+  d = md;
+#if PY_VERSION_HEX >= 0x03000000
+  return m;
+#else
+  return;
+#endif
 }
 
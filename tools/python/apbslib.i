@@ -1,8 +1,12 @@
 /* Input file for creating Python wrappers for APBS via swig
    Author: Todd Dolinsky
    Email: todd@ccb.wustl.edu
-   To generate a new apbslib wrapper file:
-        swig -python -module apbslib -o apbslib.c apbslib.i
+   To generate a new apbslib wrapper file ("make wrappers"), with native
+   extension types instead of shadow classes (faster to import, direct
+   attribute access):
+        swig -python -builtin -O -module apbslib -o apbslib.c apbslib.i
+   This needs SWIG 2.0.4 to 4.0; later versions don't support Python 2.
+   Commit the generated apbslib.c and apbslib.py with the interface.
 */
 
 /* 
@@ -17,6 +21,22 @@ Header files:
 #include "routines.h"
 #include "apbs/valist.h"
 #include "apbs/vatom.h"
+#include <string.h>
+
+/* Point data at the memory of a writable buffer (a NumPy array, for
+   example) holding exactly count doubles; returns 0 if it can't */
+static int writeBuffer(PyObject *buffer, Py_ssize_t count, double **data){
+    void *ptr;
+    Py_ssize_t len;
+
+    if (PyObject_AsWriteBuffer(buffer, &ptr, &len) != 0) {
+        PyErr_Clear();
+        return 0;
+    }
+    if (len != (Py_ssize_t)(count*sizeof(double))) return 0;
+    *data = (double *)ptr;
+    return 1;
+}
 %} 
 
 /* 
@@ -26,6 +46,37 @@ Structures and functions to be wrapped:
 
 #define VEXTERNC extern  
 
+/* Release the GIL around calls that spend their time in APBS (setting up
+   and solving calculations, reading and writing files) so other Python
+   threads can run meanwhile.  None of these calls touch Python objects.
+   See the README for which objects may be used from several threads. */
+
+%define RELEASEGIL(function)
+%exception function {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+}
+%enddef
+
+RELEASEGIL(NOsh_parseInputFile)
+RELEASEGIL(NOsh_setupElecCalc)
+RELEASEGIL(loadMolecules)
+RELEASEGIL(loadDielMaps)
+RELEASEGIL(loadKappaMaps)
+RELEASEGIL(loadPotMaps)
+RELEASEGIL(loadChargeMaps)
+RELEASEGIL(initMG)
+RELEASEGIL(reinitMG)
+RELEASEGIL(solveMG)
+RELEASEGIL(guessMG)
+RELEASEGIL(saveGuessMG)
+RELEASEGIL(loadGuessMG)
+RELEASEGIL(energyMG)
+RELEASEGIL(wrap_forceMG)
+RELEASEGIL(writedataMG)
+RELEASEGIL(writematMG)
+
 // Functions and Constructors from valist.h:
 
 typedef struct {
@@ -58,6 +109,12 @@ typedef struct {
 extern void MGparm_setCenterX(MGparm *thee, double x);
 extern void MGparm_setCenterY(MGparm *thee, double y);
 extern void MGparm_setCenterZ(MGparm *thee, double z);
+extern int MGparm_getNx(MGparm *thee);
+extern int MGparm_getNy(MGparm *thee);
+extern int MGparm_getNz(MGparm *thee);
+extern double MGparm_getHx(MGparm *thee);
+extern double MGparm_getHy(MGparm *thee);
+extern double MGparm_getHz(MGparm *thee);
       
 // Functions and Constructors from pbeparm.h:
   
@@ -68,7 +125,19 @@ typedef struct {
 	double pdie;
 	double sdie;
 	int molid;
+	int bcfl;
+	int pbetype;
+	int nion;
+	int srfm;
+	double srad;
+	double swin;
+	double sdens;
+	int calcenergy;
+	int calcforce;
 } PBEparm;
+extern double PBEparm_getIonCharge(PBEparm *thee, int iion);
+extern double PBEparm_getIonConc(PBEparm *thee, int iion);
+extern double PBEparm_getIonRadius(PBEparm *thee, int iion);
 
 // Functions and Constructor from vcom.h:
 
@@ -93,7 +162,10 @@ extern Vmem* Vmem_ctor(char *name);
 typedef struct {
 	Vpmg();
 	~Vpmg();
+	int iters;
+	int ncycle;
 } Vpmg;
+extern void Vpmg_setGuess(Vpmg *thee, double *guess);
 
 // Functions and Constructor from vpbe.h:
 typedef struct {
@@ -126,6 +198,37 @@ typedef struct {
 enum MGparm_CalcType {
 };
 
+enum eVhal_PBEType {
+    PBE_LPBE, PBE_NPBE, PBE_LRPBE, PBE_NRPBE, PBE_SMPBE
+};
+
+enum eVbcfl {
+    BCFL_ZERO=0, BCFL_SDH=1, BCFL_MDH=2, BCFL_UNUSED=3, BCFL_FOCUS=4, BCFL_MEM=5, BCFL_MAP=6
+};
+
+enum eVsurf_Meth {
+    VSM_MOL=0, VSM_MOLSMOOTH=1, VSM_SPLINE=2, VSM_SPLINE3=3, VSM_SPLINE4=4
+};
+
+enum eVchrg_Meth {
+    VCM_TRIL=0, VCM_BSPL2=1, VCM_BSPL4=2
+};
+
+enum ePBEparm_calcEnergy {
+    PCE_NO=0, PCE_TOTAL=1, PCE_COMPS=2
+};
+
+enum ePBEparm_calcForce {
+    PCF_NO=0, PCF_TOTAL=1, PCF_COMPS=2
+};
+
+enum eAPBSphase {
+    APBS_PHASE_PARSE=0, APBS_PHASE_MOLECULES=1, APBS_PHASE_MAPS=2, APBS_PHASE_SETUP=3,
+    APBS_PHASE_FILLCO=4, APBS_PHASE_SOLVE=5, APBS_PHASE_ENERGY=6, APBS_PHASE_FORCE=7,
+    APBS_PHASE_WRITE=8
+};
+typedef enum eAPBSphase APBSphase;
+
 enum NOsh_PrintType {
     NPT_ENERGY=0, NPT_FORCE=1, NPT_ELECENERGY=2, NPT_ELECFORCE=3, NPT_APOLENERGY=4, NPT_APOLFORCE=5
 };
@@ -169,8 +272,12 @@ Vgrid **new_gridlist(int maxargs) {
    return (Vgrid **) malloc(maxargs*sizeof(Vgrid *));
 }
 
+Vgrid *get_Vgrid(Vgrid **args, int n) {
+   return (Vgrid *)args[n];
+}
+
 Vpmg **new_pmglist(int maxargs) {
-   return (Vpmg **) malloc(maxargs*sizeof(Vpmg *));
+   return (Vpmg **) calloc(maxargs, sizeof(Vpmg *));
 }
 
 Vpmg *get_Vpmg(Vpmg **args, int n) {
@@ -178,11 +285,11 @@ Vpmg *get_Vpmg(Vpmg **args, int n) {
 }
 
 Vpmgp **new_pmgplist(int maxargs) {
-   return (Vpmgp **) malloc(maxargs*sizeof(Vpmgp *));
+   return (Vpmgp **) calloc(maxargs, sizeof(Vpmgp *));
 }
 
 Vpbe **new_pbelist(int maxargs) {
-   return (Vpbe **) malloc(maxargs*sizeof(Vpbe *));
+   return (Vpbe **) calloc(maxargs, sizeof(Vpbe *));
 }
 
 Vpbe *get_Vpbe(Vpbe **args, int n) { 
@@ -212,6 +319,10 @@ void delete_pbelist(Vpbe **a) {
     free(a);
   }
 
+void delete_Vgrid(Vgrid *grid) {
+    Vgrid_dtor(&grid);
+}
+
 void delete_Nosh(NOsh *nosh) {
     NOsh_dtor(&nosh);
 }
@@ -264,8 +375,24 @@ double get_entry(double *array, int i){
 void set_entry(double *array, int i, double val){
 	    array[i] = val;
   }
+
+int get_int_entry(int *array, int i){
+	    return array[i];
+  }
+
+void set_int_entry(int *array, int i, int val){
+	    array[i] = val;
+  }
 %}
 
+/* The list versions of the per-atom results; the Python getPotentials,
+   getEnergies and getForces below return NumPy arrays filled by
+   fillPotentials, fillEnergies and fillForces when NumPy is available */
+
+%rename(getPotentialsList) getPotentials;
+%rename(getEnergiesList) getEnergies;
+%rename(getForcesList) getForces;
+
 // Additional functions for reading input from buffers
 
 %inline %{
@@ -283,12 +410,426 @@ int parseInputFromString(NOsh *nosh, PyObject *string){
 
     Vio_bufTake(sock, PyString_AsString(string), bufsize);
 
+    startStats(APBS_PHASE_PARSE);
     ret = NOsh_parseInput(nosh, sock); 
+    if (ret) stopStats(APBS_PHASE_PARSE);
     sock->VIObuffer = VNULL;
     Vio_dtor(&sock);
     return ret;
 }
 
+/* Validated setters for building and varying calculations without
+   writing and reparsing input text; see setCalc for the Python
+   interface.  Each sets the value and its flag and returns 1, or prints
+   the reason and returns 0, leaving the object unchanged, if the value
+   is out of range. */
+
+int PBEparm_setMolid(PBEparm *thee, int molid){
+    VASSERT(thee != VNULL);
+    if (molid < 1 || molid > NOSH_MAXMOL) {
+        Vnm_print(2, "PBEparm_setMolid:  molecule ID must be 1-%d, got %d!\n",
+          NOSH_MAXMOL, molid);
+        return 0;
+    }
+    thee->molid = molid;
+    thee->setmolid = 1;
+    return 1;
+}
+
+int PBEparm_setPBEType(PBEparm *thee, int pbetype){
+    VASSERT(thee != VNULL);
+    if (pbetype < PBE_LPBE || pbetype > PBE_SMPBE) {
+        Vnm_print(2, "PBEparm_setPBEType:  unknown PBE type %d!\n", pbetype);
+        return 0;
+    }
+    thee->pbetype = (Vhal_PBEType)pbetype;
+    thee->setpbetype = 1;
+    return 1;
+}
+
+int PBEparm_setBcfl(PBEparm *thee, int bcfl){
+    VASSERT(thee != VNULL);
+    if (bcfl < BCFL_ZERO || bcfl > BCFL_MAP || bcfl == BCFL_UNUSED) {
+        Vnm_print(2, "PBEparm_setBcfl:  unknown boundary condition %d!\n", bcfl);
+        return 0;
+    }
+    thee->bcfl = (Vbcfl)bcfl;
+    thee->setbcfl = 1;
+    return 1;
+}
+
+/* Set ion species i, which may be an existing one or the next new one */
+int PBEparm_setIon(PBEparm *thee, int i, double charge, double conc,
+  double radius){
+    VASSERT(thee != VNULL);
+    if (i < 0 || i > thee->nion || i >= MAXION) {
+        Vnm_print(2, "PBEparm_setIon:  ion %d out of range (%d set, max %d)!\n",
+          i, thee->nion, MAXION);
+        return 0;
+    }
+    if (conc < 0.0 || radius < 0.0) {
+        Vnm_print(2, "PBEparm_setIon:  negative concentration or radius!\n");
+        return 0;
+    }
+    thee->ionq[i] = charge;
+    thee->ionc[i] = conc;
+    thee->ionr[i] = radius;
+    thee->setion[i] = 1;
+    if (i == thee->nion) (thee->nion)++;
+    thee->setnion = 1;
+    return 1;
+}
+
+/* Keep the first nion ion species and drop the rest */
+int PBEparm_setNion(PBEparm *thee, int nion){
+    int i;
+    VASSERT(thee != VNULL);
+    if (nion < 0 || nion > thee->nion) {
+        Vnm_print(2, "PBEparm_setNion:  can only drop ions (%d set, got %d)!\n",
+          thee->nion, nion);
+        return 0;
+    }
+    for (i=nion; i<thee->nion; i++) {
+        thee->ionq[i] = 0.0;
+        thee->ionc[i] = 0.0;
+        thee->ionr[i] = 0.0;
+        thee->setion[i] = 0;
+    }
+    thee->nion = nion;
+    thee->setnion = 1;
+    return 1;
+}
+
+int PBEparm_setPdie(PBEparm *thee, double pdie){
+    VASSERT(thee != VNULL);
+    if (pdie <= 0.0) {
+        Vnm_print(2, "PBEparm_setPdie:  dielectric must be positive, got %g!\n",
+          pdie);
+        return 0;
+    }
+    thee->pdie = pdie;
+    thee->setpdie = 1;
+    return 1;
+}
+
+int PBEparm_setSdie(PBEparm *thee, double sdie){
+    VASSERT(thee != VNULL);
+    if (sdie <= 0.0) {
+        Vnm_print(2, "PBEparm_setSdie:  dielectric must be positive, got %g!\n",
+          sdie);
+        return 0;
+    }
+    thee->sdie = sdie;
+    thee->setsdie = 1;
+    return 1;
+}
+
+int PBEparm_setSrfm(PBEparm *thee, int srfm){
+    VASSERT(thee != VNULL);
+    if (srfm < VSM_MOL || srfm > VSM_SPLINE4) {
+        Vnm_print(2, "PBEparm_setSrfm:  unknown surface method %d!\n", srfm);
+        return 0;
+    }
+    thee->srfm = (Vsurf_Meth)srfm;
+    thee->setsrfm = 1;
+    return 1;
+}
+
+int PBEparm_setSrad(PBEparm *thee, double srad){
+    VASSERT(thee != VNULL);
+    if (srad < 0.0) {
+        Vnm_print(2, "PBEparm_setSrad:  negative radius %g!\n", srad);
+        return 0;
+    }
+    thee->srad = srad;
+    thee->setsrad = 1;
+    return 1;
+}
+
+int PBEparm_setSwin(PBEparm *thee, double swin){
+    VASSERT(thee != VNULL);
+    if (swin < 0.0) {
+        Vnm_print(2, "PBEparm_setSwin:  negative window %g!\n", swin);
+        return 0;
+    }
+    thee->swin = swin;
+    thee->setswin = 1;
+    return 1;
+}
+
+int PBEparm_setSdens(PBEparm *thee, double sdens){
+    VASSERT(thee != VNULL);
+    if (sdens <= 0.0) {
+        Vnm_print(2, "PBEparm_setSdens:  density must be positive, got %g!\n",
+          sdens);
+        return 0;
+    }
+    thee->sdens = sdens;
+    thee->setsdens = 1;
+    return 1;
+}
+
+int PBEparm_setTemp(PBEparm *thee, double temp){
+    VASSERT(thee != VNULL);
+    if (temp <= 0.0) {
+        Vnm_print(2, "PBEparm_setTemp:  temperature must be positive, got %g!\n",
+          temp);
+        return 0;
+    }
+    thee->temp = temp;
+    thee->settemp = 1;
+    return 1;
+}
+
+int PBEparm_setCalcEnergy(PBEparm *thee, int calcenergy){
+    VASSERT(thee != VNULL);
+    if (calcenergy < PCE_NO || calcenergy > PCE_COMPS) {
+        Vnm_print(2, "PBEparm_setCalcEnergy:  unknown energy type %d!\n",
+          calcenergy);
+        return 0;
+    }
+    thee->calcenergy = (PBEparm_calcEnergy)calcenergy;
+    thee->setcalcenergy = 1;
+    return 1;
+}
+
+int PBEparm_setCalcForce(PBEparm *thee, int calcforce){
+    VASSERT(thee != VNULL);
+    if (calcforce < PCF_NO || calcforce > PCF_COMPS) {
+        Vnm_print(2, "PBEparm_setCalcForce:  unknown force type %d!\n",
+          calcforce);
+        return 0;
+    }
+    thee->calcforce = (PBEparm_calcForce)calcforce;
+    thee->setcalcforce = 1;
+    return 1;
+}
+
+/* Set the grid dimensions and the number of multigrid levels the way
+   MGparm_check does, but refuse dimensions that check would reset.  The
+   spacing is recomputed from the length, or the length from the spacing,
+   whichever was set last (MGparm_setGlen, MGparm_setGrid) */
+int MGparm_setDime(MGparm *thee, int nx, int ny, int nz){
+
+    int i, ti, tnlev, nlev, dime[3];
+
+    VASSERT(thee != VNULL);
+
+    dime[0] = nx;
+    dime[1] = ny;
+    dime[2] = nz;
+    nlev = -1;
+    for (i=0; i<3; i++) {
+        ti = dime[i] - 1;
+        if (ti < 4) {
+            Vnm_print(2, "MGparm_setDime:  dime[%d] = %d is too small!\n",
+              i, dime[i]);
+            return 0;
+        }
+        if (ti == VPOW(2, (VMGNLEV+1))) {
+            tnlev = VMGNLEV;
+        } else {
+            tnlev = 0;
+            while (VEVEN(ti)) {
+                tnlev++;
+                ti = (int)ceil(0.5*ti);
+            }
+            tnlev--;
+            if ((dime[i] > 65) && (tnlev < VMGNLEV)) {
+                Vnm_print(2, "MGparm_setDime:  dime[%d] = %d allows only %d \
+levels; use c*2^%d + 1!\n", i, dime[i], tnlev, VMGNLEV+1);
+                return 0;
+            }
+        }
+        if (nlev < 0 || tnlev < nlev) nlev = tnlev;
+    }
+    if (nlev <= 0) {
+        Vnm_print(2, "MGparm_setDime:  dime (%d, %d, %d) gives no multigrid \
+levels!\n", nx, ny, nz);
+        return 0;
+    }
+
+    for (i=0; i<3; i++) {
+        thee->dime[i] = dime[i];
+        if (thee->setglen) {
+            thee->grid[i] = thee->glen[i]/((double)(dime[i]-1));
+        } else if (thee->setgrid) {
+            thee->glen[i] = thee->grid[i]*((double)(dime[i]-1));
+        }
+    }
+    thee->nlev = nlev;
+    thee->setdime = 1;
+    return 1;
+}
+
+int MGparm_setGlen(MGparm *thee, double x, double y, double z){
+
+    int i;
+    double glen[3];
+
+    VASSERT(thee != VNULL);
+
+    glen[0] = x;
+    glen[1] = y;
+    glen[2] = z;
+    for (i=0; i<3; i++) {
+        if (glen[i] <= 0.0) {
+            Vnm_print(2, "MGparm_setGlen:  glen[%d] must be positive, got %g!\n",
+              i, glen[i]);
+            return 0;
+        }
+    }
+    for (i=0; i<3; i++) {
+        thee->glen[i] = glen[i];
+        if (thee->setdime) thee->grid[i] = glen[i]/((double)(thee->dime[i]-1));
+    }
+    thee->setglen = 1;
+    thee->setgrid = 0;
+    return 1;
+}
+
+int MGparm_setGrid(MGparm *thee, double hx, double hy, double hz){
+
+    int i;
+    double grid[3];
+
+    VASSERT(thee != VNULL);
+
+    grid[0] = hx;
+    grid[1] = hy;
+    grid[2] = hz;
+    for (i=0; i<3; i++) {
+        if (grid[i] <= 0.0) {
+            Vnm_print(2, "MGparm_setGrid:  grid[%d] must be positive, got %g!\n",
+              i, grid[i]);
+            return 0;
+        }
+    }
+    for (i=0; i<3; i++) {
+        thee->grid[i] = grid[i];
+        if (thee->setdime) thee->glen[i] = grid[i]*((double)(thee->dime[i]-1));
+    }
+    thee->setgrid = 1;
+    thee->setglen = 0;
+    return 1;
+}
+
+int MGparm_setCenter(MGparm *thee, double x, double y, double z){
+    VASSERT(thee != VNULL);
+    thee->center[0] = x;
+    thee->center[1] = y;
+    thee->center[2] = z;
+    thee->cmeth = MCM_POINT;
+    thee->setgcent = 1;
+    return 1;
+}
+
+int MGparm_setChgm(MGparm *thee, int chgm){
+    VASSERT(thee != VNULL);
+    if (chgm < VCM_TRIL || chgm > VCM_BSPL4) {
+        Vnm_print(2, "MGparm_setChgm:  unknown charge method %d!\n", chgm);
+        return 0;
+    }
+    thee->chgm = (Vchrg_Meth)chgm;
+    thee->setchgm = 1;
+    return 1;
+}
+
+int MGparm_setEtol(MGparm *thee, double etol){
+    VASSERT(thee != VNULL);
+    if (etol <= 0.0) {
+        Vnm_print(2, "MGparm_setEtol:  tolerance must be positive, got %g!\n",
+          etol);
+        return 0;
+    }
+    thee->etol = etol;
+    thee->setetol = 1;
+    return 1;
+}
+
+/* A new, empty manual multigrid calculation, to be filled with the
+   setters above and added to a NOsh with addCalc */
+NOsh_calc *newCalc(){
+    NOsh_calc *calc;
+    calc = NOsh_calc_ctor(NCT_MG);
+    calc->mgparm->type = MCT_MANUAL;
+    calc->mgparm->parsed = 1;
+    calc->pbeparm->parsed = 1;
+    return calc;
+}
+
+/* A copy of a calculation, sharing nothing with it */
+NOsh_calc *copyCalc(NOsh_calc *source){
+    NOsh_calc *calc;
+    VASSERT(source != VNULL);
+    calc = NOsh_calc_ctor(source->calctype);
+    NOsh_calc_copy(calc, source);
+    return calc;
+}
+
+void deleteCalc(NOsh_calc *calc){
+    NOsh_calc_dtor(&calc);
+}
+
+/* Check that a multigrid calculation has everything initMG needs before
+   it is added to nosh as the next calculation */
+int checkCalc(NOsh *nosh, NOsh_calc *calc){
+
+    MGparm *mgparm;
+    PBEparm *pbeparm;
+
+    VASSERT(nosh != VNULL);
+    VASSERT(calc != VNULL);
+
+    mgparm = calc->mgparm;
+    pbeparm = calc->pbeparm;
+    if (calc->calctype != NCT_MG || mgparm == VNULL) {
+        Vnm_print(2, "checkCalc:  not a multigrid calculation!\n");
+        return 0;
+    }
+    if (!mgparm->setdime) {
+        Vnm_print(2, "checkCalc:  DIME not set!\n");
+        return 0;
+    }
+    if (!mgparm->setchgm) {
+        Vnm_print(2, "checkCalc:  CHGM not set!\n");
+        return 0;
+    }
+    if (!mgparm->setgrid && !mgparm->setglen) {
+        Vnm_print(2, "checkCalc:  neither GRID nor GLEN set!\n");
+        return 0;
+    }
+    if (mgparm->type == MCT_MANUAL && !mgparm->setgcent) {
+        Vnm_print(2, "checkCalc:  GCENT not set!\n");
+        return 0;
+    }
+    if (!PBEparm_check(pbeparm)) return 0;
+    if (pbeparm->molid > nosh->nmol) {
+        Vnm_print(2, "checkCalc:  molecule %d not loaded (%d molecules)!\n",
+          pbeparm->molid, nosh->nmol);
+        return 0;
+    }
+    if (pbeparm->bcfl == BCFL_FOCUS && nosh->ncalc == 0) {
+        Vnm_print(2, "checkCalc:  can't focus the first calculation!\n");
+        return 0;
+    }
+    return 1;
+}
+
+/* Add a checked calculation to nosh, which then owns it; returns its
+   index, or -1 if it is incomplete or nosh is full */
+int addCalc(NOsh *nosh, NOsh_calc *calc){
+    if (nosh->ncalc >= NOSH_MAXCALC) {
+        Vnm_print(2, "addCalc:  too many calculations (max %d)!\n",
+          NOSH_MAXCALC);
+        return -1;
+    }
+    if (!checkCalc(nosh, calc)) return -1;
+    nosh->calc[nosh->ncalc] = calc;
+    (nosh->ncalc)++;
+    return nosh->ncalc - 1;
+}
+
 void Valist_load(Valist *thee, int size, PyObject *x, PyObject *y, PyObject *z, PyObject *chg, PyObject *rad){ 
    
     int i,j;
@@ -341,6 +882,66 @@ void Valist_load(Valist *thee, int size, PyObject *x, PyObject *y, PyObject *z,
 
 }
 
+/* Load atoms from an object exposing a buffer of size rows of five
+   doubles (x, y, z, charge, radius); returns 0 if the buffer does not
+   hold exactly that.  See Valist_loadArray for the Python interface. */
+int Valist_loadBuffer(Valist *thee, int size, PyObject *data){
+
+    int i;
+    const void *buffer;
+    Py_ssize_t len;
+    double *row;
+
+    VASSERT(thee != VNULL);
+
+    if (PyObject_AsReadBuffer(data, &buffer, &len) != 0) {
+        PyErr_Clear();
+        return 0;
+    }
+    if (size < 1 || len != (Py_ssize_t)(5*size*sizeof(double))) return 0;
+
+    if (thee->atoms != VNULL) {
+        Vmem_free(thee->vmem, thee->number, sizeof(Vatom),
+          (void **)&(thee->atoms));
+    }
+    thee->atoms = Vmem_malloc(thee->vmem, size, sizeof(Vatom));
+    thee->number = size;
+    row = (double *)buffer;
+    for (i=0; i<size; i++, row += 5) {
+        Vatom_setPosition(&(thee->atoms[i]), row);
+        Vatom_setCharge(&(thee->atoms[i]), row[3]);
+        Vatom_setRadius(&(thee->atoms[i]), row[4]);
+        Vatom_setAtomID(&(thee->atoms[i]), i);
+    }
+
+    return (Valist_getStatistics(thee) == VRC_SUCCESS);
+}
+
+/* Replace the positions of the atoms already in a Valist from a buffer
+   of three doubles per atom; returns 0 if the buffer has the wrong size */
+int Valist_updateBuffer(Valist *thee, PyObject *data){
+
+    int i;
+    const void *buffer;
+    Py_ssize_t len;
+    double *row;
+
+    VASSERT(thee != VNULL);
+
+    if (PyObject_AsReadBuffer(data, &buffer, &len) != 0) {
+        PyErr_Clear();
+        return 0;
+    }
+    if (thee->number < 1 || len != (Py_ssize_t)(3*thee->number*sizeof(double))) return 0;
+
+    row = (double *)buffer;
+    for (i=0; i<thee->number; i++, row += 3) {
+        Vatom_setPosition(&(thee->atoms[i]), row);
+    }
+
+    return (Valist_getStatistics(thee) == VRC_SUCCESS);
+}
+
 extern int NOsh_setupElecCalc(NOsh *nosh, Valist *alist[NOSH_MAXMOL]);
 extern int NOsh_setupApolCalc(NOsh *nosh, Valist *alist[NOSH_MAXMOL]);
 
@@ -357,6 +958,34 @@ int wrap_forceMG(Vmem *mem, NOsh *nosh, PBEparm *pbeparm, MGparm *mgparm,
     return *nforce;
 }
 
+/* Copy the forces of one calculation to and from a string so they can be
+   passed between processes */
+
+PyObject *getAtomForceData(AtomForce **atomForce, int nforce){
+    if (nforce <= 0) return PyString_FromStringAndSize("", 0);
+    return PyString_FromStringAndSize((char *)(*atomForce),
+      (Py_ssize_t)(nforce*sizeof(AtomForce)));
+}
+
+int setAtomForceData(Vmem *mem, AtomForce **atomForce,
+ int forcearray[NOSH_MAXCALC], int calcid, PyObject *data){
+    char *buffer;
+    Py_ssize_t size;
+    int nforce;
+
+    if (PyString_AsStringAndSize(data, &buffer, &size) == -1) {
+        PyErr_Clear();
+        return -1;
+    }
+    nforce = (int)(size/sizeof(AtomForce));
+    forcearray[calcid] = nforce;
+    if (nforce > 0) {
+        *atomForce = (AtomForce *)Vmem_malloc(mem, nforce, sizeof(AtomForce));
+        memcpy(*atomForce, buffer, nforce*sizeof(AtomForce));
+    }
+    return nforce;
+}
+
 PyObject *getAtomPosition(Vatom *atom){
     double *position;
     int i;
@@ -400,6 +1029,8 @@ PyObject *getPotentials(NOsh *nosh, PBEparm *pbeparm, Vpmg *pmg, Valist *alist){
     for (i=0;i<Valist_getNumberAtoms(alist);i++){
         atom = Valist_getAtom(alist, i);
         position = Vatom_getPosition(atom); 
+        /* Atoms off the grid get zero */
+        value = 0.0;
         Vgrid_value(grid, position, &value);
         PyList_SetItem(values, i, PyFloat_FromDouble(value)); 
     } 
@@ -422,6 +1053,69 @@ PyObject *getEnergies(Vpmg *pmg, Valist *alist){
     return values;
 }
 
+int fillPotentials(NOsh *nosh, PBEparm *pbeparm, Vpmg *pmg, Valist *alist,
+ PyObject *buffer){
+    Vgrid *grid;
+    int i, nx, ny, nz, natoms;
+    double hx, hy, hzed, xmin, ymin, zmin;
+    double *values;
+
+    natoms = Valist_getNumberAtoms(alist);
+    if (!writeBuffer(buffer, natoms, &values)) return 0;
+    nx = pmg->pmgp->nx;
+    ny = pmg->pmgp->ny;
+    nz = pmg->pmgp->nz;
+    hx = pmg->pmgp->hx;
+    hy = pmg->pmgp->hy;
+    hzed = pmg->pmgp->hzed;
+    xmin = pmg->pmgp->xcent - 0.5*(nx-1)*hx;
+    ymin = pmg->pmgp->ycent - 0.5*(ny-1)*hy;
+    zmin = pmg->pmgp->zcent - 0.5*(nz-1)*hzed;
+
+    Vpmg_fillArray(pmg, pmg->rwork, VDT_POT, 0.0, pbeparm->pbetype, pbeparm);
+    grid = Vgrid_ctor(nx, ny, nz, hx, hy, hzed, xmin, ymin, zmin,
+                  pmg->rwork);
+    for (i=0; i<natoms; i++) {
+        /* Atoms off the grid get zero */
+        values[i] = 0.0;
+        Vgrid_value(grid, Vatom_getPosition(Valist_getAtom(alist, i)),
+          &(values[i]));
+    }
+    Vgrid_dtor(&grid);
+    return 1;
+}
+
+int fillEnergies(Vpmg *pmg, Valist *alist, PyObject *buffer){
+    int i, natoms;
+    double *values;
+
+    natoms = Valist_getNumberAtoms(alist);
+    if (!writeBuffer(buffer, natoms, &values)) return 0;
+    for (i=0; i<natoms; i++) {
+        values[i] = Vpmg_qfAtomEnergy(pmg, Valist_getAtom(alist, i));
+    }
+    return 1;
+}
+
+int fillForces(AtomForce **atomForce, Valist *alist, PyObject *qfbuffer,
+ PyObject *ibbuffer, PyObject *dbbuffer){
+    int i, j, natoms;
+    double *qf, *ib, *db;
+
+    natoms = Valist_getNumberAtoms(alist);
+    if (!writeBuffer(qfbuffer, 3*natoms, &qf)) return 0;
+    if (!writeBuffer(ibbuffer, 3*natoms, &ib)) return 0;
+    if (!writeBuffer(dbbuffer, 3*natoms, &db)) return 0;
+    for (i=0; i<natoms; i++) {
+        for (j=0; j<3; j++) {
+            qf[3*i+j] = atomForce[0][i].qfForce[j];
+            ib[3*i+j] = atomForce[0][i].ibForce[j];
+            db[3*i+j] = atomForce[0][i].dbForce[j];
+        }
+    }
+    return 1;
+}
+
 PyObject *getForces(AtomForce **atomForce, Valist *alist){
     int i, j;
     PyObject *dict;
@@ -458,6 +1152,354 @@ PyObject *getForces(AtomForce **atomForce, Valist *alist){
     PyDict_SetItem(dict, ib, ibvalues);
     return dict;
 }
+
+/* Grid arrays of a Vpmg that can be viewed from Python, indexed (i,j,k)
+   with i varying fastest as in IJK() */
+
+double *getGridData(Vpmg *pmg, char *name){
+
+    if (strcmp(name, "pot") == 0) return pmg->u;
+    if (strcmp(name, "charge") == 0) return pmg->charge;
+    if (strcmp(name, "dielx") == 0) return pmg->epsx;
+    if (strcmp(name, "diely") == 0) return pmg->epsy;
+    if (strcmp(name, "dielz") == 0) return pmg->epsz;
+    if (strcmp(name, "kappa") == 0) return pmg->kappa;
+    if (strcmp(name, "a1cf") == 0) return pmg->a1cf;
+    if (strcmp(name, "a2cf") == 0) return pmg->a2cf;
+    if (strcmp(name, "a3cf") == 0) return pmg->a3cf;
+    if (strcmp(name, "ccf") == 0) return pmg->ccf;
+    if (strcmp(name, "fcf") == 0) return pmg->fcf;
+    return VNULL;
+}
+
+PyObject *getGridBuffer(Vpmg *pmg, char *name){
+    double *data;
+    Vpmgp *pmgp;
+
+    VASSERT(pmg != VNULL);
+    data = getGridData(pmg, name);
+    if (data == VNULL) {
+        PyErr_Format(PyExc_ValueError, "no %s array in this Vpmg", name);
+        return NULL;
+    }
+    pmgp = pmg->pmgp;
+    return PyBuffer_FromReadWriteMemory((void *)data,
+      (Py_ssize_t)(pmgp->nx*pmgp->ny*pmgp->nz*sizeof(double)));
+}
+
+PyObject *getGridInfo(Vpmg *pmg){
+    Vpmgp *pmgp;
+    PyObject *dict, *value;
+
+    VASSERT(pmg != VNULL);
+    pmgp = pmg->pmgp;
+    dict = PyDict_New();
+#define SETINFO(key, obj) value = (obj); PyDict_SetItemString(dict, key, value); Py_DECREF(value)
+    SETINFO("nx", PyInt_FromLong(pmgp->nx));
+    SETINFO("ny", PyInt_FromLong(pmgp->ny));
+    SETINFO("nz", PyInt_FromLong(pmgp->nz));
+    SETINFO("hx", PyFloat_FromDouble(pmgp->hx));
+    SETINFO("hy", PyFloat_FromDouble(pmgp->hy));
+    SETINFO("hzed", PyFloat_FromDouble(pmgp->hzed));
+    SETINFO("xmin", PyFloat_FromDouble(pmgp->xcent - 0.5*(pmgp->nx-1)*pmgp->hx));
+    SETINFO("ymin", PyFloat_FromDouble(pmgp->ycent - 0.5*(pmgp->ny-1)*pmgp->hy));
+    SETINFO("zmin", PyFloat_FromDouble(pmgp->zcent - 0.5*(pmgp->nz-1)*pmgp->hzed));
+    SETINFO("zmagic", PyFloat_FromDouble(Vpbe_getZmagic(pmg->pbe)));
+#undef SETINFO
+    return dict;
+}
+
+/* The timings and counters of the run (see getStats in routines.h) as a
+   dictionary: "phases" maps each phase name to its CPU "time" (s) and
+   "count", "iters" is the total number of solver iterations and "memory"
+   holds the current and peak bytes allocated through Vmem */
+PyObject *getStatsRecord(){
+    APBSstats *stats;
+    PyObject *dict, *phases, *phase, *memory, *value;
+    int i;
+
+    stats = getStats();
+    dict = PyDict_New();
+    phases = PyDict_New();
+    memory = PyDict_New();
+#define SETITEM(d, key, obj) value = (obj); PyDict_SetItemString(d, key, value); Py_DECREF(value)
+    for (i=0; i<APBS_NPHASE; i++) {
+        phase = PyDict_New();
+        SETITEM(phase, "time", PyFloat_FromDouble(stats->time[i]));
+        SETITEM(phase, "count", PyInt_FromLong(stats->count[i]));
+        SETITEM(phases, getStatsName((APBSphase)i), phase);
+    }
+    SETITEM(memory, "bytes", PyLong_FromSize_t(Vmem_bytesTotal()));
+    SETITEM(memory, "highwater", PyLong_FromSize_t(Vmem_highWaterTotal()));
+    SETITEM(dict, "phases", phases);
+    SETITEM(dict, "memory", memory);
+    SETITEM(dict, "iters", PyInt_FromLong(stats->iters));
+#undef SETITEM
+    return dict;
+}
+
+/* The iterations of the last solve of pmg as a list of (relative
+   residual, CPU seconds) tuples */
+PyObject *getCycles(Vpmg *pmg){
+    PyObject *list;
+    int i;
+
+    VASSERT(pmg != VNULL);
+    list = PyList_New(pmg->ncycle);
+    for (i=0; i<pmg->ncycle; i++) {
+        PyList_SET_ITEM(list, i, Py_BuildValue("(dd)", pmg->cycleResid[i],
+          pmg->cycleTime[i]));
+    }
+    return list;
+}
+%}
+
+%pythoncode %{
+# NumPy takes longer to import than the rest of apbslib, so it is only
+# imported by the first call that needs it (see loadNumpy).  The module is
+# kept in _numpy, which "from apbslib import *" does not copy over a
+# caller's own numpy
+_numpy = None
+GridArray = None
+_numpyLoaded = 0
+
+def loadNumpy():
+    """ Import NumPy and define GridArray the first time they are needed;
+    returns the numpy module, or None if NumPy is not installed """
+    global _numpy, GridArray, _numpyLoaded
+    if not _numpyLoaded:
+        _numpyLoaded = 1
+        try:
+            import numpy
+        except ImportError:
+            return None
+        _numpy = numpy
+
+        class GridArray(numpy.ndarray):
+            """ A NumPy view of one of the grid arrays of a Vpmg, indexed
+            [i,j,k] like the APBS IJK() macro, with the grid geometry as
+            attributes: name, nx, ny, nz, h (hx, hy, hzed), origin (xmin,
+            ymin, zmin) and zmagic, the factor by which the "charge" array
+            is scaled.  Arrays derived from it (slices, for example) keep
+            the attributes unchanged """
+
+            def __array_finalize__(self, obj):
+                for key in ["name", "nx", "ny", "nz", "h", "origin",
+                            "zmagic"]:
+                    setattr(self, key, getattr(obj, key, None))
+    return _numpy
+
+GRIDNAMES = ["pot", "charge", "dielx", "diely", "dielz", "kappa",
+             "a1cf", "a2cf", "a3cf", "ccf", "fcf"]
+
+def getGridArray(pmg, name="pot"):
+    """ Return a writable NumPy view (a GridArray) of a grid array of a
+    Vpmg: "pot" (the solution, kT/e), "charge", "dielx", "diely", "dielz",
+    "kappa" or the operator coefficients "a1cf", "a2cf", "a3cf", "ccf"
+    and "fcf".  No data is copied, so changes to the array change the
+    Vpmg; the view must not be used after the Vpmg is destroyed (killMG) """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("getGridArray requires NumPy")
+    info = getGridInfo(pmg)
+    shape = (info["nx"], info["ny"], info["nz"])
+    data = numpy.frombuffer(getGridBuffer(pmg, name), dtype=numpy.float64)
+    array = data.reshape(shape, order="F").view(GridArray)
+    array.name = name
+    array.nx, array.ny, array.nz = shape
+    array.h = (info["hx"], info["hy"], info["hzed"])
+    array.origin = (info["xmin"], info["ymin"], info["zmin"])
+    array.zmagic = info["zmagic"]
+    return array
+
+ATOMFIELDS = ["x", "y", "z", "charge", "radius"]
+
+def Valist_loadArray(thee, atoms):
+    """ Load atoms into a Valist from an (N,5) array of x, y, z, charge
+    and radius, or from a structured array with those fields.  A C
+    contiguous float64 array is copied straight into the Vatom array;
+    anything else is converted to one first """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("Valist_loadArray requires NumPy")
+    atoms = numpy.asarray(atoms)
+    if atoms.dtype.names != None:
+        atoms = numpy.column_stack([atoms[field] for field in ATOMFIELDS])
+    atoms = numpy.ascontiguousarray(atoms, dtype=numpy.float64)
+    if atoms.ndim != 2 or atoms.shape[1] != 5 or len(atoms) == 0:
+        raise ValueError("atoms must be an (N,5) array, N > 0")
+    if not Valist_loadBuffer(thee, len(atoms), atoms):
+        raise ValueError("could not load atoms into the Valist")
+
+def Valist_updateCoordinates(thee, coords):
+    """ Replace the atom positions of a loaded Valist, in place, from an
+    (N,3) array with one row per atom, and update its center and bounds.
+    Charges, radii and atom IDs are kept """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("Valist_updateCoordinates requires NumPy")
+    coords = numpy.ascontiguousarray(coords, dtype=numpy.float64)
+    if coords.ndim != 2 or coords.shape[1] != 3:
+        raise ValueError("coordinates must be an (N,3) array")
+    if not Valist_updateBuffer(thee, coords):
+        raise ValueError("expected %i atoms, got %i" % (thee.number, len(coords)))
+
+def setGuessArray(pmg, guess):
+    """ Use a NumPy array of shape (nx, ny, nz), indexed like getGridArray,
+    as the initial guess (kT/e) for the next solveMG on this Vpmg instead
+    of zero.  The array is copied into the solution array; boundary values
+    are ignored """
+    numpy = loadNumpy()
+    pot = getGridArray(pmg, "pot")
+    guess = numpy.asarray(guess, dtype=numpy.float64)
+    if guess.shape != pot.shape:
+        raise ValueError("expected a %s guess, got %s" % (pot.shape, guess.shape))
+    pot[...] = guess
+    Vpmg_setGuess(pmg, None)
+
+def resultArray(out, shape):
+    """ Return out, checked to be a C contiguous float64 array of the
+    given shape, or a new array if out is None """
+    numpy = loadNumpy()
+    if out is None:
+        return numpy.empty(shape, dtype=numpy.float64)
+    if not isinstance(out, numpy.ndarray) or out.dtype != numpy.float64 \
+       or out.shape != shape or not out.flags.c_contiguous:
+        raise ValueError("out must be a C contiguous float64 array of shape %s" % (shape,))
+    return out
+
+def getPotentials(nosh, pbeparm, pmg, alist, out=None):
+    """ Return the potential (kT/e) at each atom of alist as an (N,)
+    array, written into out if it is given.  Without NumPy, a list is
+    returned instead """
+    numpy = loadNumpy()
+    if numpy == None:
+        return getPotentialsList(nosh, pbeparm, pmg, alist)
+    out = resultArray(out, (alist.number,))
+    if not fillPotentials(nosh, pbeparm, pmg, alist, out):
+        raise ValueError("Unable to write the potentials into out")
+    return out
+
+def getEnergies(pmg, alist, out=None):
+    """ Return the fixed charge energy (kT) of each atom of alist as an
+    (N,) array, written into out if it is given.  Without NumPy, a list is
+    returned instead """
+    numpy = loadNumpy()
+    if numpy == None:
+        return getEnergiesList(pmg, alist)
+    out = resultArray(out, (alist.number,))
+    if not fillEnergies(pmg, alist, out):
+        raise ValueError("Unable to write the energies into out")
+    return out
+
+def getForces(atomForce, alist, out=None):
+    """ Return the per-atom forces of a calculation (calcforce comps) as a
+    dictionary of (N,3) arrays of the "qf", "ib" and "db" components,
+    written into the arrays of the dictionary out if it is given.  Without
+    NumPy, a dictionary of lists is returned instead """
+    numpy = loadNumpy()
+    if numpy == None:
+        return getForcesList(atomForce, alist)
+    if out is None:
+        out = {}
+    shape = (alist.number, 3)
+    for key in ["qf", "ib", "db"]:
+        out[key] = resultArray(out.get(key), shape)
+    if not fillForces(atomForce, alist, out["qf"], out["ib"], out["db"]):
+        raise ValueError("Unable to write the forces into out")
+    return out
+
+def getGridArrays(pmg):
+    """ Return a dictionary of GridArray views of every grid array
+    allocated in a Vpmg (see getGridArray) """
+    arrays = {}
+    for name in GRIDNAMES:
+        try:
+            arrays[name] = getGridArray(pmg, name)
+        except ValueError:
+            pass
+    return arrays
+
+PBESETTERS = {"molid": PBEparm_setMolid, "pbetype": PBEparm_setPBEType,
+              "bcfl": PBEparm_setBcfl, "pdie": PBEparm_setPdie,
+              "sdie": PBEparm_setSdie, "srfm": PBEparm_setSrfm,
+              "srad": PBEparm_setSrad, "swin": PBEparm_setSwin,
+              "sdens": PBEparm_setSdens, "temp": PBEparm_setTemp,
+              "calcenergy": PBEparm_setCalcEnergy,
+              "calcforce": PBEparm_setCalcForce}
+MGSETTERS = {"chgm": MGparm_setChgm, "etol": MGparm_setEtol}
+MGVECTORS = {"dime": MGparm_setDime, "glen": MGparm_setGlen,
+             "grid": MGparm_setGrid, "gcent": MGparm_setCenter}
+
+def setCalc(calc, **values):
+    """ Set parameters of a multigrid calculation (a NOsh_calc) in place,
+    without writing or parsing input text.  The keywords are named after
+    the ELEC keywords and PBEparm fields:
+
+        PBE:  molid, pbetype (PBE_LPBE, ...), bcfl (BCFL_SDH, ...),
+              ions (a list of (charge, conc, radius) tuples replacing
+              all ion species), pdie, sdie, srfm (VSM_MOL, ...), srad,
+              swin, sdens, temp, calcenergy (PCE_NO, ...) and
+              calcforce (PCF_NO, ...)
+        MG:   dime, glen or grid, gcent (each an (x, y, z) sequence;
+              gcent is a point), chgm (VCM_TRIL, ...) and etol
+
+    Each value is validated as it is set; a bad one raises ValueError
+    naming it (the reason is printed by APBS), and the values before it
+    stay set.  Grid changes only take effect through initMG, not reinitMG """
+    if values.has_key("glen") and values.has_key("grid"):
+        raise ValueError("set glen or grid, not both")
+    for key in values.keys():
+        value = values[key]
+        if key == "ions":
+            ok = PBEparm_setNion(calc.pbeparm, 0)
+            for i in range(len(value)):
+                charge, conc, radius = value[i]
+                ok = ok and PBEparm_setIon(calc.pbeparm, i, charge, conc, radius)
+        elif PBESETTERS.has_key(key):
+            ok = PBESETTERS[key](calc.pbeparm, value)
+        elif MGSETTERS.has_key(key):
+            ok = MGSETTERS[key](calc.mgparm, value)
+        elif MGVECTORS.has_key(key):
+            x, y, z = value
+            ok = MGVECTORS[key](calc.mgparm, x, y, z)
+        else:
+            raise ValueError("unknown calculation parameter %s" % key)
+        if not ok:
+            raise ValueError("invalid %s: %s" % (key, value))
+
+def appendCalc(nosh, calc, values):
+    """ Set values in calc and add it to nosh, or destroy it and raise
+    ValueError; returns the index of the new calculation """
+    try:
+        setCalc(calc, **values)
+    except:
+        deleteCalc(calc)
+        raise
+    icalc = addCalc(nosh, calc)
+    if icalc < 0:
+        deleteCalc(calc)
+        raise ValueError("incomplete or too many calculations")
+    return icalc
+
+def makeCalc(nosh, **values):
+    """ Build a manual multigrid calculation from the keywords of setCalc
+    and add it to nosh as its next calculation, as if it had been read
+    from an ELEC statement; returns its index.  The same settings an
+    ELEC statement requires must be given (dime, glen or grid, gcent,
+    chgm, molid, pbetype, bcfl, pdie, sdie, srfm, srad, sdens and temp,
+    plus swin for the spline surfaces), or ValueError is raised """
+    return appendCalc(nosh, newCalc(), values)
+
+def cloneCalc(nosh, icalc, **values):
+    """ Add a copy of calculation icalc of nosh, changed by the keywords
+    of setCalc, as the next calculation; returns its index.  Copying the
+    parameters costs next to nothing, so a sweep over pdie, sdie or the
+    ions adds one clone per value instead of parsing the input again.
+    The clone belongs to no ELEC statement, so PRINT ignores it.  A
+    focusing calculation focuses on the calculation before it, so clone
+    a whole focusing chain in order """
+    return appendCalc(nosh, copyCalc(NOsh_getCalc(nosh, icalc)), values)
 %}
 
 extern int loadMolecules(NOsh *nosh, Vparam *param, Valist *alist[NOSH_MAXMOL]);
@@ -483,7 +1525,19 @@ extern int initMG(int i, NOsh *nosh, MGparm *mgparm,
   Vgrid *potMap[NOSH_MAXMOL]);
 extern void killMG(NOsh *nosh, Vpbe *pbe[NOSH_MAXCALC],
   Vpmgp *pmgp[NOSH_MAXCALC], Vpmg *pmg[NOSH_MAXCALC]);
+extern int reinitMG(int i, NOsh *nosh, MGparm *mgparm,
+  PBEparm *pbeparm, double realCenter[3], Vpbe *pbe[NOSH_MAXCALC],
+  Valist *alist[NOSH_MAXMOL], Vgrid *dielXMap[NOSH_MAXMOL], 
+  Vgrid *dielYMap[NOSH_MAXMOL], Vgrid *dielZMap[NOSH_MAXMOL], 
+  Vgrid *kappaMap[NOSH_MAXMOL], Vgrid *chargeMap[NOSH_MAXMOL], 
+  Vpmgp *pmgp[NOSH_MAXCALC], Vpmg *pmg[NOSH_MAXCALC],
+  Vgrid *potMap[NOSH_MAXMOL]);
+extern void killAllMG(NOsh *nosh, Vpbe *pbe[NOSH_MAXCALC],
+  Vpmgp *pmgp[NOSH_MAXCALC], Vpmg *pmg[NOSH_MAXCALC]);
 extern int solveMG(NOsh *nosh, Vpmg *pmg, MGparm_CalcType type);
+extern int guessMG(NOsh *nosh, Vpmg *pmg, Vgrid *guess);
+extern Vgrid* saveGuessMG(Vpmg *pmg);
+extern Vgrid* loadGuessMG(char *path);
 extern int setPartMG(NOsh *nosh, MGparm *mgparm, Vpmg *pmg);
 extern void killEnergy();
 //extern int forceMG(Vmem *mem, NOsh *nosh, PBEparm *pbeparm, MGparm *mgparm,
@@ -499,6 +1553,9 @@ extern int printElecForce(Vcom *com, NOsh *nosh, int nforce[NOSH_MAXCALC],
 extern int printApolForce(Vcom *com, NOsh *nosh, int nforce[NOSH_MAXCALC], 
   AtomForce *atomForce[NOSH_MAXCALC], int i);
 extern void startVio();
+extern void startStats(APBSphase phase);
+extern void stopStats(APBSphase phase);
+extern void resetStats();
 extern double Vacc_molAcc(Vacc *thee, double center[3], double radius);
 extern double Vacc_vdwAcc(Vacc *thee, double center[3]);
 
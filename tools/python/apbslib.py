@@ -1,360 +1,323 @@
 # This file was automatically generated by SWIG (http://www.swig.org).
-# Version 1.3.31
+# Version 4.0.2
 #
-# Don't modify this file, modify the SWIG interface instead.
-# This file is compatible with both classic and new-style classes.
+# Do not make changes to this file unless you know what you are doing--modify
+# the SWIG interface file instead.
+
+from sys import version_info as _swig_python_version_info
+if _swig_python_version_info < (2, 7, 0):
+    raise RuntimeError("Python 2.7 or later required")
+
+# Pull in all the attributes from the low-level C/C++ module
+if __package__ or "." in __name__:
+    from ._apbslib import *
+else:
+    from _apbslib import *
 
-import _apbslib
-import new
-new_instancemethod = new.instancemethod
 try:
-    _swig_property = property
-except NameError:
-    pass # Python < 2.2 doesn't have 'property'.
-def _swig_setattr_nondynamic(self,class_type,name,value,static=1):
-    if (name == "thisown"): return self.this.own(value)
-    if (name == "this"):
-        if type(value).__name__ == 'PySwigObject':
-            self.__dict__[name] = value
-            return
-    method = class_type.__swig_setmethods__.get(name,None)
-    if method: return method(self,value)
-    if (not static) or hasattr(self,name):
-        self.__dict__[name] = value
-    else:
-        raise AttributeError("You cannot add attributes to %s" % self)
-
-def _swig_setattr(self,class_type,name,value):
-    return _swig_setattr_nondynamic(self,class_type,name,value,0)
-
-def _swig_getattr(self,class_type,name):
-    if (name == "thisown"): return self.this.own()
-    method = class_type.__swig_getmethods__.get(name,None)
-    if method: return method(self)
-    raise AttributeError,name
+    import builtins as __builtin__
+except ImportError:
+    import __builtin__
 
 def _swig_repr(self):
-    try: strthis = "proxy of " + self.this.__repr__()
-    except: strthis = ""
+    try:
+        strthis = "proxy of " + self.this.__repr__()
+    except __builtin__.Exception:
+        strthis = ""
     return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
 
-import types
-try:
-    _object = types.ObjectType
-    _newclass = 1
-except AttributeError:
-    class _object : pass
-    _newclass = 0
-del types
-
-
-class Valist(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, Valist, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, Valist, name)
-    __repr__ = _swig_repr
-    def __init__(self, *args): 
-        this = _apbslib.new_Valist(*args)
-        try: self.this.append(this)
-        except: self.this = this
-    __swig_destroy__ = _apbslib.delete_Valist
-    __del__ = lambda self : None;
-    __swig_setmethods__["number"] = _apbslib.Valist_number_set
-    __swig_getmethods__["number"] = _apbslib.Valist_number_get
-    if _newclass:number = _swig_property(_apbslib.Valist_number_get, _apbslib.Valist_number_set)
-Valist_swigregister = _apbslib.Valist_swigregister
-Valist_swigregister(Valist)
-
-Valist_getAtomList = _apbslib.Valist_getAtomList
-Valist_getAtom = _apbslib.Valist_getAtom
-class Vatom(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, Vatom, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, Vatom, name)
-    __repr__ = _swig_repr
-    def __init__(self, *args): 
-        this = _apbslib.new_Vatom(*args)
-        try: self.this.append(this)
-        except: self.this = this
-    __swig_destroy__ = _apbslib.delete_Vatom
-    __del__ = lambda self : None;
-    __swig_setmethods__["id"] = _apbslib.Vatom_id_set
-    __swig_getmethods__["id"] = _apbslib.Vatom_id_get
-    if _newclass:id = _swig_property(_apbslib.Vatom_id_get, _apbslib.Vatom_id_set)
-Vatom_swigregister = _apbslib.Vatom_swigregister
-Vatom_swigregister(Vatom)
-
-Vatom_getPosition = _apbslib.Vatom_getPosition
-Vatom_setCharge = _apbslib.Vatom_setCharge
-Vatom_getCharge = _apbslib.Vatom_getCharge
-Vatom_getRadius = _apbslib.Vatom_getRadius
-class MGparm(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, MGparm, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, MGparm, name)
-    __repr__ = _swig_repr
-    def __init__(self, *args): 
-        this = _apbslib.new_MGparm(*args)
-        try: self.this.append(this)
-        except: self.this = this
-    __swig_destroy__ = _apbslib.delete_MGparm
-    __del__ = lambda self : None;
-    __swig_setmethods__["type"] = _apbslib.MGparm_type_set
-    __swig_getmethods__["type"] = _apbslib.MGparm_type_get
-    if _newclass:type = _swig_property(_apbslib.MGparm_type_get, _apbslib.MGparm_type_set)
-MGparm_swigregister = _apbslib.MGparm_swigregister
-MGparm_swigregister(MGparm)
-
-MGparm_setCenterX = _apbslib.MGparm_setCenterX
-MGparm_setCenterY = _apbslib.MGparm_setCenterY
-MGparm_setCenterZ = _apbslib.MGparm_setCenterZ
-class PBEparm(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, PBEparm, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, PBEparm, name)
-    __repr__ = _swig_repr
-    def __init__(self, *args): 
-        this = _apbslib.new_PBEparm(*args)
-        try: self.this.append(this)
-        except: self.this = this
-    __swig_destroy__ = _apbslib.delete_PBEparm
-    __del__ = lambda self : None;
-    __swig_setmethods__["temp"] = _apbslib.PBEparm_temp_set
-    __swig_getmethods__["temp"] = _apbslib.PBEparm_temp_get
-    if _newclass:temp = _swig_property(_apbslib.PBEparm_temp_get, _apbslib.PBEparm_temp_set)
-    __swig_setmethods__["pdie"] = _apbslib.PBEparm_pdie_set
-    __swig_getmethods__["pdie"] = _apbslib.PBEparm_pdie_get
-    if _newclass:pdie = _swig_property(_apbslib.PBEparm_pdie_get, _apbslib.PBEparm_pdie_set)
-    __swig_setmethods__["sdie"] = _apbslib.PBEparm_sdie_set
-    __swig_getmethods__["sdie"] = _apbslib.PBEparm_sdie_get
-    if _newclass:sdie = _swig_property(_apbslib.PBEparm_sdie_get, _apbslib.PBEparm_sdie_set)
-    __swig_setmethods__["molid"] = _apbslib.PBEparm_molid_set
-    __swig_getmethods__["molid"] = _apbslib.PBEparm_molid_get
-    if _newclass:molid = _swig_property(_apbslib.PBEparm_molid_get, _apbslib.PBEparm_molid_set)
-PBEparm_swigregister = _apbslib.PBEparm_swigregister
-PBEparm_swigregister(PBEparm)
-
-class Vcom(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, Vcom, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, Vcom, name)
-    __repr__ = _swig_repr
-    def __init__(self, *args): 
-        this = _apbslib.new_Vcom(*args)
-        try: self.this.append(this)
-        except: self.this = this
-    __swig_destroy__ = _apbslib.delete_Vcom
-    __del__ = lambda self : None;
-Vcom_swigregister = _apbslib.Vcom_swigregister
-Vcom_swigregister(Vcom)
-
-Vcom_ctor = _apbslib.Vcom_ctor
-Vcom_size = _apbslib.Vcom_size
-Vcom_rank = _apbslib.Vcom_rank
-class Vmem(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, Vmem, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, Vmem, name)
-    __repr__ = _swig_repr
-    def __init__(self, *args): 
-        this = _apbslib.new_Vmem(*args)
-        try: self.this.append(this)
-        except: self.this = this
-    __swig_destroy__ = _apbslib.delete_Vmem
-    __del__ = lambda self : None;
-Vmem_swigregister = _apbslib.Vmem_swigregister
-Vmem_swigregister(Vmem)
-
-Vmem_ctor = _apbslib.Vmem_ctor
-class Vpmg(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, Vpmg, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, Vpmg, name)
-    __repr__ = _swig_repr
-    def __init__(self, *args): 
-        this = _apbslib.new_Vpmg(*args)
-        try: self.this.append(this)
-        except: self.this = this
-    __swig_destroy__ = _apbslib.delete_Vpmg
-    __del__ = lambda self : None;
-Vpmg_swigregister = _apbslib.Vpmg_swigregister
-Vpmg_swigregister(Vpmg)
-
-class Vpbe(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, Vpbe, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, Vpbe, name)
-    __repr__ = _swig_repr
-    def __init__(self, *args): 
-        this = _apbslib.new_Vpbe(*args)
-        try: self.this.append(this)
-        except: self.this = this
-    __swig_destroy__ = _apbslib.delete_Vpbe
-    __del__ = lambda self : None;
-    __swig_setmethods__["acc"] = _apbslib.Vpbe_acc_set
-    __swig_getmethods__["acc"] = _apbslib.Vpbe_acc_get
-    if _newclass:acc = _swig_property(_apbslib.Vpbe_acc_get, _apbslib.Vpbe_acc_set)
-Vpbe_swigregister = _apbslib.Vpbe_swigregister
-Vpbe_swigregister(Vpbe)
-
-class NOsh_calc(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, NOsh_calc, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, NOsh_calc, name)
-    __repr__ = _swig_repr
-    def __init__(self, *args): 
-        this = _apbslib.new_NOsh_calc(*args)
-        try: self.this.append(this)
-        except: self.this = this
-    __swig_destroy__ = _apbslib.delete_NOsh_calc
-    __del__ = lambda self : None;
-    __swig_setmethods__["mgparm"] = _apbslib.NOsh_calc_mgparm_set
-    __swig_getmethods__["mgparm"] = _apbslib.NOsh_calc_mgparm_get
-    if _newclass:mgparm = _swig_property(_apbslib.NOsh_calc_mgparm_get, _apbslib.NOsh_calc_mgparm_set)
-    __swig_setmethods__["femparm"] = _apbslib.NOsh_calc_femparm_set
-    __swig_getmethods__["femparm"] = _apbslib.NOsh_calc_femparm_get
-    if _newclass:femparm = _swig_property(_apbslib.NOsh_calc_femparm_get, _apbslib.NOsh_calc_femparm_set)
-    __swig_setmethods__["pbeparm"] = _apbslib.NOsh_calc_pbeparm_set
-    __swig_getmethods__["pbeparm"] = _apbslib.NOsh_calc_pbeparm_get
-    if _newclass:pbeparm = _swig_property(_apbslib.NOsh_calc_pbeparm_get, _apbslib.NOsh_calc_pbeparm_set)
-    __swig_setmethods__["calctype"] = _apbslib.NOsh_calc_calctype_set
-    __swig_getmethods__["calctype"] = _apbslib.NOsh_calc_calctype_get
-    if _newclass:calctype = _swig_property(_apbslib.NOsh_calc_calctype_get, _apbslib.NOsh_calc_calctype_set)
-NOsh_calc_swigregister = _apbslib.NOsh_calc_swigregister
-NOsh_calc_swigregister(NOsh_calc)
-
-class NOsh(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, NOsh, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, NOsh, name)
-    __repr__ = _swig_repr
-    def __init__(self, *args): 
-        this = _apbslib.new_NOsh(*args)
-        try: self.this.append(this)
-        except: self.this = this
-    __swig_destroy__ = _apbslib.delete_NOsh
-    __del__ = lambda self : None;
-    __swig_setmethods__["ncalc"] = _apbslib.NOsh_ncalc_set
-    __swig_getmethods__["ncalc"] = _apbslib.NOsh_ncalc_get
-    if _newclass:ncalc = _swig_property(_apbslib.NOsh_ncalc_get, _apbslib.NOsh_ncalc_set)
-    __swig_setmethods__["nprint"] = _apbslib.NOsh_nprint_set
-    __swig_getmethods__["nprint"] = _apbslib.NOsh_nprint_get
-    if _newclass:nprint = _swig_property(_apbslib.NOsh_nprint_get, _apbslib.NOsh_nprint_set)
-    __swig_setmethods__["nelec"] = _apbslib.NOsh_nelec_set
-    __swig_getmethods__["nelec"] = _apbslib.NOsh_nelec_get
-    if _newclass:nelec = _swig_property(_apbslib.NOsh_nelec_get, _apbslib.NOsh_nelec_set)
-    __swig_setmethods__["nmol"] = _apbslib.NOsh_nmol_set
-    __swig_getmethods__["nmol"] = _apbslib.NOsh_nmol_get
-    if _newclass:nmol = _swig_property(_apbslib.NOsh_nmol_get, _apbslib.NOsh_nmol_set)
-    __swig_setmethods__["printwhat"] = _apbslib.NOsh_printwhat_set
-    __swig_getmethods__["printwhat"] = _apbslib.NOsh_printwhat_get
-    if _newclass:printwhat = _swig_property(_apbslib.NOsh_printwhat_get, _apbslib.NOsh_printwhat_set)
-NOsh_swigregister = _apbslib.NOsh_swigregister
-NOsh_swigregister(NOsh)
-
-NPT_ENERGY = _apbslib.NPT_ENERGY
-NPT_FORCE = _apbslib.NPT_FORCE
-NPT_ELECENERGY = _apbslib.NPT_ELECENERGY
-NPT_ELECFORCE = _apbslib.NPT_ELECFORCE
-NPT_APOLENERGY = _apbslib.NPT_APOLENERGY
-NPT_APOLFORCE = _apbslib.NPT_APOLFORCE
-NOsh_getCalc = _apbslib.NOsh_getCalc
-NOsh_elecname = _apbslib.NOsh_elecname
-NOsh_elec2calc = _apbslib.NOsh_elec2calc
-NOsh_printWhat = _apbslib.NOsh_printWhat
-NOsh_parseInputFile = _apbslib.NOsh_parseInputFile
-NOsh_ctor = _apbslib.NOsh_ctor
-class AtomForce(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, AtomForce, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, AtomForce, name)
-    __repr__ = _swig_repr
-    def __init__(self, *args): 
-        this = _apbslib.new_AtomForce(*args)
-        try: self.this.append(this)
-        except: self.this = this
-    __swig_destroy__ = _apbslib.delete_AtomForce
-    __del__ = lambda self : None;
-AtomForce_swigregister = _apbslib.AtomForce_swigregister
-AtomForce_swigregister(AtomForce)
-
-new_valist = _apbslib.new_valist
-get_Valist = _apbslib.get_Valist
-new_gridlist = _apbslib.new_gridlist
-new_pmglist = _apbslib.new_pmglist
-get_Vpmg = _apbslib.get_Vpmg
-new_pmgplist = _apbslib.new_pmgplist
-new_pbelist = _apbslib.new_pbelist
-get_Vpbe = _apbslib.get_Vpbe
-new_atomforcelist = _apbslib.new_atomforcelist
-delete_atomforcelist = _apbslib.delete_atomforcelist
-delete_valist = _apbslib.delete_valist
-delete_gridlist = _apbslib.delete_gridlist
-delete_pmglist = _apbslib.delete_pmglist
-delete_pmgplist = _apbslib.delete_pmgplist
-delete_pbelist = _apbslib.delete_pbelist
-delete_Nosh = _apbslib.delete_Nosh
-delete_Com = _apbslib.delete_Com
-delete_Mem = _apbslib.delete_Mem
-get_AtomForce = _apbslib.get_AtomForce
-make_Valist = _apbslib.make_Valist
-remove_Valist = _apbslib.remove_Valist
-double_array = _apbslib.double_array
-int_array = _apbslib.int_array
-delete_double_array = _apbslib.delete_double_array
-delete_int_array = _apbslib.delete_int_array
-get_entry = _apbslib.get_entry
-set_entry = _apbslib.set_entry
-parseInputFromString = _apbslib.parseInputFromString
-Valist_load = _apbslib.Valist_load
-NOsh_setupElecCalc = _apbslib.NOsh_setupElecCalc
-NOsh_setupApolCalc = _apbslib.NOsh_setupApolCalc
-wrap_forceMG = _apbslib.wrap_forceMG
-getAtomPosition = _apbslib.getAtomPosition
-getPotentials = _apbslib.getPotentials
-getEnergies = _apbslib.getEnergies
-getForces = _apbslib.getForces
-loadMolecules = _apbslib.loadMolecules
-killMolecules = _apbslib.killMolecules
-loadDielMaps = _apbslib.loadDielMaps
-killDielMaps = _apbslib.killDielMaps
-loadKappaMaps = _apbslib.loadKappaMaps
-killKappaMaps = _apbslib.killKappaMaps
-loadPotMaps = _apbslib.loadPotMaps
-killPotMaps = _apbslib.killPotMaps
-loadChargeMaps = _apbslib.loadChargeMaps
-killChargeMaps = _apbslib.killChargeMaps
-printPBEPARM = _apbslib.printPBEPARM
-printMGPARM = _apbslib.printMGPARM
-initMG = _apbslib.initMG
-killMG = _apbslib.killMG
-solveMG = _apbslib.solveMG
-setPartMG = _apbslib.setPartMG
-killEnergy = _apbslib.killEnergy
-killForce = _apbslib.killForce
-writedataMG = _apbslib.writedataMG
-writematMG = _apbslib.writematMG
-printForce = _apbslib.printForce
-printElecForce = _apbslib.printElecForce
-printApolForce = _apbslib.printApolForce
-startVio = _apbslib.startVio
-Vacc_molAcc = _apbslib.Vacc_molAcc
-Vacc_vdwAcc = _apbslib.Vacc_vdwAcc
-energyMG = _apbslib.energyMG
-printEnergy = _apbslib.printEnergy
-printElecEnergy = _apbslib.printElecEnergy
-printApolEnergy = _apbslib.printApolEnergy
-returnEnergy = _apbslib.returnEnergy
+
+def _swig_setattr_nondynamic_instance_variable(set):
+    def set_instance_attr(self, name, value):
+        if name == "thisown":
+            self.this.own(value)
+        elif name == "this":
+            set(self, name, value)
+        elif hasattr(self, name) and isinstance(getattr(type(self), name), property):
+            set(self, name, value)
+        else:
+            raise AttributeError("You cannot add instance attributes to %s" % self)
+    return set_instance_attr
+
+
+def _swig_setattr_nondynamic_class_variable(set):
+    def set_class_attr(cls, name, value):
+        if hasattr(cls, name) and not isinstance(getattr(cls, name), property):
+            set(cls, name, value)
+        else:
+            raise AttributeError("You cannot add class attributes to %s" % cls)
+    return set_class_attr
+
+
+def _swig_add_metaclass(metaclass):
+    """Class decorator for adding a metaclass to a SWIG wrapped class - a slimmed down version of six.add_metaclass"""
+    def wrapper(cls):
+        return metaclass(cls.__name__, cls.__bases__, cls.__dict__.copy())
+    return wrapper
+
+
+class _SwigNonDynamicMeta(type):
+    """Meta class to enforce nondynamic attributes (no new attributes) for a class"""
+    __setattr__ = _swig_setattr_nondynamic_class_variable(type.__setattr__)
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+# NumPy takes longer to import than the rest of apbslib, so it is only
+# imported by the first call that needs it (see loadNumpy).  The module is
+# kept in _numpy, which "from apbslib import *" does not copy over a
+# caller's own numpy
+_numpy = None
+GridArray = None
+_numpyLoaded = 0
+
+def loadNumpy():
+    """ Import NumPy and define GridArray the first time they are needed;
+    returns the numpy module, or None if NumPy is not installed """
+    global _numpy, GridArray, _numpyLoaded
+    if not _numpyLoaded:
+        _numpyLoaded = 1
+        try:
+            import numpy
+        except ImportError:
+            return None
+        _numpy = numpy
+
+        class GridArray(numpy.ndarray):
+            """ A NumPy view of one of the grid arrays of a Vpmg, indexed
+            [i,j,k] like the APBS IJK() macro, with the grid geometry as
+            attributes: name, nx, ny, nz, h (hx, hy, hzed), origin (xmin,
+            ymin, zmin) and zmagic, the factor by which the "charge" array
+            is scaled.  Arrays derived from it (slices, for example) keep
+            the attributes unchanged """
+
+            def __array_finalize__(self, obj):
+                for key in ["name", "nx", "ny", "nz", "h", "origin",
+                            "zmagic"]:
+                    setattr(self, key, getattr(obj, key, None))
+    return _numpy
+
+GRIDNAMES = ["pot", "charge", "dielx", "diely", "dielz", "kappa",
+             "a1cf", "a2cf", "a3cf", "ccf", "fcf"]
+
+def getGridArray(pmg, name="pot"):
+    """ Return a writable NumPy view (a GridArray) of a grid array of a
+    Vpmg: "pot" (the solution, kT/e), "charge", "dielx", "diely", "dielz",
+    "kappa" or the operator coefficients "a1cf", "a2cf", "a3cf", "ccf"
+    and "fcf".  No data is copied, so changes to the array change the
+    Vpmg; the view must not be used after the Vpmg is destroyed (killMG) """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("getGridArray requires NumPy")
+    info = getGridInfo(pmg)
+    shape = (info["nx"], info["ny"], info["nz"])
+    data = numpy.frombuffer(getGridBuffer(pmg, name), dtype=numpy.float64)
+    array = data.reshape(shape, order="F").view(GridArray)
+    array.name = name
+    array.nx, array.ny, array.nz = shape
+    array.h = (info["hx"], info["hy"], info["hzed"])
+    array.origin = (info["xmin"], info["ymin"], info["zmin"])
+    array.zmagic = info["zmagic"]
+    return array
+
+ATOMFIELDS = ["x", "y", "z", "charge", "radius"]
+
+def Valist_loadArray(thee, atoms):
+    """ Load atoms into a Valist from an (N,5) array of x, y, z, charge
+    and radius, or from a structured array with those fields.  A C
+    contiguous float64 array is copied straight into the Vatom array;
+    anything else is converted to one first """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("Valist_loadArray requires NumPy")
+    atoms = numpy.asarray(atoms)
+    if atoms.dtype.names != None:
+        atoms = numpy.column_stack([atoms[field] for field in ATOMFIELDS])
+    atoms = numpy.ascontiguousarray(atoms, dtype=numpy.float64)
+    if atoms.ndim != 2 or atoms.shape[1] != 5 or len(atoms) == 0:
+        raise ValueError("atoms must be an (N,5) array, N > 0")
+    if not Valist_loadBuffer(thee, len(atoms), atoms):
+        raise ValueError("could not load atoms into the Valist")
+
+def Valist_updateCoordinates(thee, coords):
+    """ Replace the atom positions of a loaded Valist, in place, from an
+    (N,3) array with one row per atom, and update its center and bounds.
+    Charges, radii and atom IDs are kept """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("Valist_updateCoordinates requires NumPy")
+    coords = numpy.ascontiguousarray(coords, dtype=numpy.float64)
+    if coords.ndim != 2 or coords.shape[1] != 3:
+        raise ValueError("coordinates must be an (N,3) array")
+    if not Valist_updateBuffer(thee, coords):
+        raise ValueError("expected %i atoms, got %i" % (thee.number, len(coords)))
+
+def setGuessArray(pmg, guess):
+    """ Use a NumPy array of shape (nx, ny, nz), indexed like getGridArray,
+    as the initial guess (kT/e) for the next solveMG on this Vpmg instead
+    of zero.  The array is copied into the solution array; boundary values
+    are ignored """
+    numpy = loadNumpy()
+    pot = getGridArray(pmg, "pot")
+    guess = numpy.asarray(guess, dtype=numpy.float64)
+    if guess.shape != pot.shape:
+        raise ValueError("expected a %s guess, got %s" % (pot.shape, guess.shape))
+    pot[...] = guess
+    Vpmg_setGuess(pmg, None)
+
+def resultArray(out, shape):
+    """ Return out, checked to be a C contiguous float64 array of the
+    given shape, or a new array if out is None """
+    numpy = loadNumpy()
+    if out is None:
+        return numpy.empty(shape, dtype=numpy.float64)
+    if not isinstance(out, numpy.ndarray) or out.dtype != numpy.float64 \
+       or out.shape != shape or not out.flags.c_contiguous:
+        raise ValueError("out must be a C contiguous float64 array of shape %s" % (shape,))
+    return out
+
+def getPotentials(nosh, pbeparm, pmg, alist, out=None):
+    """ Return the potential (kT/e) at each atom of alist as an (N,)
+    array, written into out if it is given.  Without NumPy, a list is
+    returned instead """
+    numpy = loadNumpy()
+    if numpy == None:
+        return getPotentialsList(nosh, pbeparm, pmg, alist)
+    out = resultArray(out, (alist.number,))
+    if not fillPotentials(nosh, pbeparm, pmg, alist, out):
+        raise ValueError("Unable to write the potentials into out")
+    return out
+
+def getEnergies(pmg, alist, out=None):
+    """ Return the fixed charge energy (kT) of each atom of alist as an
+    (N,) array, written into out if it is given.  Without NumPy, a list is
+    returned instead """
+    numpy = loadNumpy()
+    if numpy == None:
+        return getEnergiesList(pmg, alist)
+    out = resultArray(out, (alist.number,))
+    if not fillEnergies(pmg, alist, out):
+        raise ValueError("Unable to write the energies into out")
+    return out
+
+def getForces(atomForce, alist, out=None):
+    """ Return the per-atom forces of a calculation (calcforce comps) as a
+    dictionary of (N,3) arrays of the "qf", "ib" and "db" components,
+    written into the arrays of the dictionary out if it is given.  Without
+    NumPy, a dictionary of lists is returned instead """
+    numpy = loadNumpy()
+    if numpy == None:
+        return getForcesList(atomForce, alist)
+    if out is None:
+        out = {}
+    shape = (alist.number, 3)
+    for key in ["qf", "ib", "db"]:
+        out[key] = resultArray(out.get(key), shape)
+    if not fillForces(atomForce, alist, out["qf"], out["ib"], out["db"]):
+        raise ValueError("Unable to write the forces into out")
+    return out
+
+def getGridArrays(pmg):
+    """ Return a dictionary of GridArray views of every grid array
+    allocated in a Vpmg (see getGridArray) """
+    arrays = {}
+    for name in GRIDNAMES:
+        try:
+            arrays[name] = getGridArray(pmg, name)
+        except ValueError:
+            pass
+    return arrays
+
+PBESETTERS = {"molid": PBEparm_setMolid, "pbetype": PBEparm_setPBEType,
+              "bcfl": PBEparm_setBcfl, "pdie": PBEparm_setPdie,
+              "sdie": PBEparm_setSdie, "srfm": PBEparm_setSrfm,
+              "srad": PBEparm_setSrad, "swin": PBEparm_setSwin,
+              "sdens": PBEparm_setSdens, "temp": PBEparm_setTemp,
+              "calcenergy": PBEparm_setCalcEnergy,
+              "calcforce": PBEparm_setCalcForce}
+MGSETTERS = {"chgm": MGparm_setChgm, "etol": MGparm_setEtol}
+MGVECTORS = {"dime": MGparm_setDime, "glen": MGparm_setGlen,
+             "grid": MGparm_setGrid, "gcent": MGparm_setCenter}
+
+def setCalc(calc, **values):
+    """ Set parameters of a multigrid calculation (a NOsh_calc) in place,
+    without writing or parsing input text.  The keywords are named after
+    the ELEC keywords and PBEparm fields:
+
+        PBE:  molid, pbetype (PBE_LPBE, ...), bcfl (BCFL_SDH, ...),
+              ions (a list of (charge, conc, radius) tuples replacing
+              all ion species), pdie, sdie, srfm (VSM_MOL, ...), srad,
+              swin, sdens, temp, calcenergy (PCE_NO, ...) and
+              calcforce (PCF_NO, ...)
+        MG:   dime, glen or grid, gcent (each an (x, y, z) sequence;
+              gcent is a point), chgm (VCM_TRIL, ...) and etol
+
+    Each value is validated as it is set; a bad one raises ValueError
+    naming it (the reason is printed by APBS), and the values before it
+    stay set.  Grid changes only take effect through initMG, not reinitMG """
+    if values.has_key("glen") and values.has_key("grid"):
+        raise ValueError("set glen or grid, not both")
+    for key in values.keys():
+        value = values[key]
+        if key == "ions":
+            ok = PBEparm_setNion(calc.pbeparm, 0)
+            for i in range(len(value)):
+                charge, conc, radius = value[i]
+                ok = ok and PBEparm_setIon(calc.pbeparm, i, charge, conc, radius)
+        elif PBESETTERS.has_key(key):
+            ok = PBESETTERS[key](calc.pbeparm, value)
+        elif MGSETTERS.has_key(key):
+            ok = MGSETTERS[key](calc.mgparm, value)
+        elif MGVECTORS.has_key(key):
+            x, y, z = value
+            ok = MGVECTORS[key](calc.mgparm, x, y, z)
+        else:
+            raise ValueError("unknown calculation parameter %s" % key)
+        if not ok:
+            raise ValueError("invalid %s: %s" % (key, value))
+
+def appendCalc(nosh, calc, values):
+    """ Set values in calc and add it to nosh, or destroy it and raise
+    ValueError; returns the index of the new calculation """
+    try:
+        setCalc(calc, **values)
+    except:
+        deleteCalc(calc)
+        raise
+    icalc = addCalc(nosh, calc)
+    if icalc < 0:
+        deleteCalc(calc)
+        raise ValueError("incomplete or too many calculations")
+    return icalc
+
+def makeCalc(nosh, **values):
+    """ Build a manual multigrid calculation from the keywords of setCalc
+    and add it to nosh as its next calculation, as if it had been read
+    from an ELEC statement; returns its index.  The same settings an
+    ELEC statement requires must be given (dime, glen or grid, gcent,
+    chgm, molid, pbetype, bcfl, pdie, sdie, srfm, srad, sdens and temp,
+    plus swin for the spline surfaces), or ValueError is raised """
+    return appendCalc(nosh, newCalc(), values)
+
+def cloneCalc(nosh, icalc, **values):
+    """ Add a copy of calculation icalc of nosh, changed by the keywords
+    of setCalc, as the next calculation; returns its index.  Copying the
+    parameters costs next to nothing, so a sweep over pdie, sdie or the
+    ions adds one clone per value instead of parsing the input again.
+    The clone belongs to no ELEC statement, so PRINT ignores it.  A
+    focusing calculation focuses on the calculation before it, so clone
+    a whole focusing chain in order """
+    return appendCalc(nosh, copyCalc(NOsh_getCalc(nosh, icalc)), values)
+
 
 
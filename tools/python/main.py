@@ -50,7 +50,7 @@
 """ 
 
 from apbslib import *
-import sys, time
+import sys, os, time, getopt
 import string
 from sys import stdout, stderr
 
@@ -148,11 +148,78 @@ def getUsage():
     This driver program calculates electrostatic potentials, energies,\n\
     and forces using both multigrid methods.\n\
     It is invoked as:\n\n\
-      python main.py apbs.in\n\
+      python main.py [options] apbs.in\n\n\
+    where the options are:\n\n\
+      --warm        Start each calculation from the solution of the\n\
+                    previous calculation instead of zero\n\
+      --guess=FILE  Start each calculation from the potential (kT/e)\n\
+                    in the OpenDX map FILE instead of zero\n\
+      --jobs=N      Run independent calculations (those not linked by\n\
+                    focusing) in up to N processes at once; results and\n\
+                    PRINT statements are the same as for a serial run\n\
+      --stats=FILE  Write the time spent in each phase of the run, the\n\
+                    solver iterations and residuals of each calculation\n\
+                    and the memory used to FILE as a JSON record\n\n\
+    The number of solver iterations of each calculation is reported;\n\
+    compare with a run without these options to see the reduction.\n\
     ----------------------------------------------------------------------\n\n"
 
     return usage
 
+def getChains(nosh):
+    """ Group the calculations into chains that must run in order: a
+        focusing calculation needs the solution of the one before it, while
+        separate chains are independent of each other
+        Returns (chains)
+            chains: List of lists of calculation numbers
+    """
+    chains = []
+    for icalc in xrange(nosh.ncalc):
+        pbeparm = NOsh_getCalc(nosh, icalc).pbeparm
+        if icalc > 0 and pbeparm.bcfl == BCFL_FOCUS:
+            chains[-1].append(icalc)
+        else:
+            chains.append([icalc])
+    return chains
+
+def mergeStats(record, other):
+    """ Add the timings and counters of a getStatsRecord dictionary from
+        another process to record """
+    for name, phase in other["phases"].items():
+        record["phases"][name]["time"] += phase["time"]
+        record["phases"][name]["count"] += phase["count"]
+    record["iters"] += other["iters"]
+    record["memory"]["highwater"] = max(record["memory"]["highwater"],
+                                        other["memory"]["highwater"])
+
+_worker = None
+
+def runWorker(chain):
+    """ Pool entry point; runs the function given to runParallel """
+    return _worker(chain)
+
+def runParallel(function, chains, jobs):
+    """ Run function on each chain in a pool of up to jobs forked
+        processes, which inherit the parsed input, molecules and maps of
+        this one.  APBS keeps solver state in globals (the PMG common
+        blocks and timers, for example), so processes are used rather
+        than threads.
+        Returns (results)
+            results: List of the return values, in the order of chains
+    """
+    global _worker
+    import multiprocessing
+    _worker = function
+    stdout.flush()
+    pool = multiprocessing.Pool(min(jobs, len(chains)))
+    try:
+        results = pool.map(runWorker, chains, 1)
+    finally:
+        pool.close()
+        pool.join()
+        _worker = None
+    return results
+
 def main():
     """ Main driver for testing.  Runs APBS on given input file """
     
@@ -176,21 +243,52 @@ def main():
     
     # Start the main timer
     main_timer_start = time.clock()
+    wall_start = time.time()
 
     # Check invocation
     stdout.write(getHeader())
-    if len(sys.argv) != 2:
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "", ["warm", "guess=", "jobs=", "stats="])
+    except getopt.GetoptError, details:
+        stderr.write("main:  %s\n" % details)
+        stderr.write(getUsage())
+        raise APBSError, "Incorrect Usage!"
+    if len(args) != 1:
         stderr.write("main:  Called with %d arguments!\n" % len(sys.argv))
         stderr.write(getUsage())
         raise APBSError, "Incorrect Usage!"
+    warm = 0
+    guessfile = None
+    statsfile = None
+    jobs = 1
+    for o, a in opts:
+        if o == "--warm":
+            warm = 1
+        elif o == "--guess":
+            guessfile = a
+        elif o == "--stats":
+            statsfile = a
+        elif o == "--jobs":
+            try:
+                jobs = int(a)
+            except ValueError:
+                jobs = 0
+            if jobs < 1:
+                stderr.write("main:  --jobs must be a positive integer!\n")
+                raise APBSError, "Incorrect Usage!"
+    if jobs > 1 and not hasattr(os, "fork"):
+        stderr.write("main:  --jobs needs os.fork; running serially.\n")
+        jobs = 1
 
     # Parse the input file
     nosh = NOsh_ctor(rank, size)
-    input_file = sys.argv[1]
+    input_file = args[0]
     stdout.write("Parsing input file %s...\n" % input_file)
+    startStats(APBS_PHASE_PARSE)
     if NOsh_parseInputFile(nosh, input_file) != 1:
         stderr.write("main:  Error while parsing input file.\n")
         raise APBSError, "Error while parsing input file!"
+    stopStats(APBS_PHASE_PARSE)
 
     # Load the molecules using loadMolecules routine
     # loadMolecule passing NULL as second arg instead of Vparam
@@ -224,13 +322,36 @@ def main():
         stderr.write("Error reading charge maps!\n")
         raise APBSError, "Error reading charge maps!"
 
+    potMap = new_gridlist(NOSH_MAXMOL)
+    if loadPotMaps(nosh, potMap) != 1:
+        stderr.write("Error reading potential maps!\n")
+        raise APBSError, "Error reading potential maps!"
+
+    # Read the initial guess, if any
+
+    guessmap = None
+    if guessfile != None:
+        guessmap = loadGuessMG(guessfile)
+        if guessmap == None:
+            stderr.write("Error reading initial guess!\n")
+            raise APBSError, "Error reading initial guess!"
+    iterations = []
+    cycles = []
+
     # Do the calculations
 
     stdout.write("Preparing to run %d PBE calculations. \n" % nosh.ncalc)
 
-    for icalc in xrange(nosh.ncalc): totEnergy.append(0.0)
-
     for icalc in xrange(nosh.ncalc):
+        totEnergy.append(0.0)
+        iterations.append(0)
+        cycles.append([])
+        set_int_entry(nforce, icalc, 0)
+
+    def runCalc(icalc):
+        """ Set up, solve and analyze calculation icalc, storing its
+            energy in totEnergy and its forces in atomforce; returns the
+            number of forces """
         stdout.write("---------------------------------------------\n")
         calc = NOsh_getCalc(nosh, icalc)
         mgparm = calc.mgparm
@@ -249,12 +370,19 @@ def main():
         else:
             stdout.write("CALCULATION #%d (%s): MULTIGRID\n" % ((icalc+1),name))
         stdout.write("Setting up problem...\n")
+
+        # Keep the previous solution, which initMG may destroy, as the
+        # initial guess for this calculation
+
+        previous = None
+        if warm and icalc > 0 and get_Vpmg(pmg, icalc-1) != None:
+            previous = saveGuessMG(get_Vpmg(pmg, icalc-1))
 	
         # Routine initMG
 	
         if initMG(icalc, nosh, mgparm, pbeparm, realCenter, pbe, 
               alist, dielXMap, dielYMap, dielZMap, kappaMap, chargeMap, 
-              pmgp, pmg) != 1:
+              pmgp, pmg, potMap) != 1:
             stderr.write("Error setting up MG calculation!\n")
             raise APBSError, "Error setting up MG calculation!"
 	
@@ -268,9 +396,22 @@ def main():
 	
         thispmg = get_Vpmg(pmg,icalc)
 
+        if previous != None:
+            ret = guessMG(nosh, thispmg, previous)
+            delete_Vgrid(previous)
+        elif guessmap != None:
+            ret = guessMG(nosh, thispmg, guessmap)
+        else:
+            ret = 1
+        if ret != 1:
+            stderr.write("Error setting initial guess!\n")
+            raise APBSError, "Error setting initial guess!"
+
         if solveMG(nosh, thispmg, mgparm.type) != 1:
             stderr.write("Error solving PDE! \n")
             raise APBSError, "Error Solving PDE!"
+        iterations[icalc] = thispmg.iters
+        cycles[icalc] = getCycles(thispmg)
 
         # Set partition information : Routine setPartMG
 
@@ -287,14 +428,68 @@ def main():
         # Calculate forces
         
         aforce = get_AtomForce(atomforce, icalc)
-        wrap_forceMG(mem, nosh, pbeparm, mgparm, thispmg, aforce, alist, nforce, icalc)
+        n = wrap_forceMG(mem, nosh, pbeparm, mgparm, thispmg, aforce, alist, nforce, icalc)
           
         # Write out data from MG calculations : Routine writedataMG	
         writedataMG(rank, nosh, pbeparm, thispmg)
 	
         # Write out matrix from MG calculations	
         writematMG(rank, nosh, pbeparm, thispmg)
+
+        return n
+
+    def runChain(chain):
+        """ Run a chain of calculations in a worker process and return
+            their results and timings; the worker's grids and forces are
+            freed since the next chain it runs does not need them """
+        resetStats()
+        results = []
+        for icalc in chain:
+            n = runCalc(icalc)
+            forces = getAtomForceData(get_AtomForce(atomforce, icalc), n)
+            results.append((icalc, totEnergy[icalc], forces, iterations[icalc],
+                            cycles[icalc]))
+        stdout.flush()
+        killForce(mem, nosh, nforce, atomforce)
+        for icalc in chain: set_int_entry(nforce, icalc, 0)
+        killAllMG(nosh, pbe, pmgp, pmg)
+        return results, getStatsRecord()
+
+    chains = getChains(nosh)
+    if jobs > 1 and len(chains) > 1:
+        stdout.write("Running %d independent groups of calculations with %d processes.\n" \
+                     % (len(chains), min(jobs, len(chains))))
+        workerStats = []
+        for chain, chainStats in runParallel(runChain, chains, jobs):
+            workerStats.append(chainStats)
+            for icalc, energy, forces, iters, calcCycles in chain:
+                totEnergy[icalc] = energy
+                iterations[icalc] = iters
+                cycles[icalc] = calcCycles
+                setAtomForceData(mem, get_AtomForce(atomforce, icalc), nforce, icalc, forces)
+    else:
+        workerStats = []
+        for icalc in xrange(nosh.ncalc):
+            runCalc(icalc)
+
+    # Collect the timings and counters while the calculations are alive
+
+    if statsfile != None:
+        record = getStatsRecord()
+        for chainStats in workerStats:
+            mergeStats(record, chainStats)
+        record["input"] = input_file
+        record["jobs"] = jobs
+        record["calcs"] = []
+        for icalc in xrange(nosh.ncalc):
+            record["calcs"].append({"energy": totEnergy[icalc],
+                                    "iters": iterations[icalc],
+                                    "cycles": cycles[icalc]})
     
+    stdout.write("---------------------------------------------\n")
+    stdout.write("Solver iterations:  %s (total %d)\n" % \
+                 (string.join(map(str, iterations), ", "), sum(iterations)))
+
     # Handle print statements - comment out if limiting output to stdout
 
     if nosh.nprint > 0:
@@ -325,9 +520,11 @@ def main():
     killEnergy()
     killMG(nosh, pbe, pmgp, pmg)
     killChargeMaps(nosh, chargeMap)
+    killPotMaps(nosh, potMap)
     killKappaMaps(nosh, kappaMap)
     killDielMaps(nosh, dielXMap, dielYMap, dielZMap)
     killMolecules(nosh, alist)
+    if guessmap != None: delete_Vgrid(guessmap)
     
     delete_Nosh(nosh)
 
@@ -342,6 +539,7 @@ def main():
     delete_gridlist(dielZMap)
     delete_gridlist(kappaMap)
     delete_gridlist(chargeMap)
+    delete_gridlist(potMap)
     delete_pmglist(pmg)
     delete_pmgplist(pmgp)
     delete_pbelist(pbe)
@@ -357,5 +555,14 @@ def main():
     main_timer_stop = time.clock()
     stdout.write("Total execution time:  %1.6e sec\n" % (main_timer_stop - main_timer_start))
 
+    if statsfile != None:
+        import json
+        record["cpu"] = main_timer_stop - main_timer_start
+        record["wall"] = time.time() - wall_start
+        stats = open(statsfile, "w")
+        json.dump(record, stats, indent=1, sort_keys=True)
+        stats.write("\n")
+        stats.close()
+
  
 if __name__ == "__main__": main()
@@ -219,8 +219,11 @@ def printResults(energyList, potList, forceList):
 
         potList[calc #][atom #]  :  Per-atom potential for a specific calc #
 
+        With NumPy, each entry is an array (see getPotentials, getEnergies
+        and getForces in apbslib); without it, a list.
+
         forceList is a little more difficult, as it is a list of dictionaries
-        of lists:
+        of (N,3) arrays:
 
         forceList[calc #]['force type'][atom #][x=0/y=1/z=2 direction ]
 
@@ -270,8 +273,15 @@ def printResults(energyList, potList, forceList):
             print "\t%i\t%s (db)" % (j, db)
 
 
-def runAPBS(PQR, INPUT):
-    """ Main driver for testing.  Runs APBS on given input file """
+def runAPBS(PQR, INPUT, warm=0, guess=None):
+    """ Main driver for testing.  Runs APBS on given input file
+
+        Parameters
+            warm:   If true, start each calculation from the solution of
+                    the previous calculation instead of zero (int)
+            guess:  OpenDX map of the potential (kT/e) to start each
+                    calculation from instead of zero (string)
+    """
     
     # Initialize variables, arrays
     com = Vcom_ctor(1)
@@ -367,6 +377,21 @@ def runAPBS(PQR, INPUT):
         stderr.write("Error reading charge maps!\n")
         raise APBSError, "Error reading charge maps!"
 
+    potMap = new_gridlist(NOSH_MAXMOL)
+    if loadPotMaps(nosh, potMap) != 1:
+        stderr.write("Error reading potential maps!\n")
+        raise APBSError, "Error reading potential maps!"
+
+    # Read the initial guess, if any
+
+    guessmap = None
+    if guess != None:
+        guessmap = loadGuessMG(guess)
+        if guessmap == None:
+            stderr.write("Error reading initial guess!\n")
+            raise APBSError, "Error reading initial guess!"
+    iterations = []
+
     # Do the calculations
 
     stdout.write("Preparing to run %d PBE calculations. \n" % nosh.ncalc)
@@ -390,12 +415,19 @@ def runAPBS(PQR, INPUT):
         else:
             stdout.write("CALCULATION #%d (%s): MULTIGRID\n" % ((icalc+1),name))
         stdout.write("Setting up problem...\n")
+
+        # Keep the previous solution, which initMG may destroy, as the
+        # initial guess for this calculation
+
+        previous = None
+        if warm and icalc > 0:
+            previous = saveGuessMG(get_Vpmg(pmg, icalc-1))
 	
         # Routine initMG
         
         if initMG(icalc, nosh, mgparm, pbeparm, realCenter, pbe, 
               alist, dielXMap, dielYMap, dielZMap, kappaMap, chargeMap, 
-              pmgp, pmg) != 1:
+              pmgp, pmg, potMap) != 1:
             stderr.write("Error setting up MG calculation!\n")
             raise APBSError, "Error setting up MG calculation!"
 	
@@ -409,9 +441,21 @@ def runAPBS(PQR, INPUT):
 	
         thispmg = get_Vpmg(pmg,icalc)
 
+        if previous != None:
+            ret = guessMG(nosh, thispmg, previous)
+            delete_Vgrid(previous)
+        elif guessmap != None:
+            ret = guessMG(nosh, thispmg, guessmap)
+        else:
+            ret = 1
+        if ret != 1:
+            stderr.write("Error setting initial guess!\n")
+            raise APBSError, "Error setting initial guess!"
+
         if solveMG(nosh, thispmg, mgparm.type) != 1:
             stderr.write("Error solving PDE! \n")
             raise APBSError, "Error Solving PDE!"
+        iterations.append(thispmg.iters)
 
         # Set partition information : Routine setPartMG
 
@@ -450,6 +494,10 @@ def runAPBS(PQR, INPUT):
         if doforce:
             forceList.append(getForces(aforce, myAlist))
     
+    stdout.write("---------------------------------------------\n")
+    stdout.write("Solver iterations:  %s (total %d)\n" % \
+                 (string.join(map(str, iterations), ", "), sum(iterations)))
+
     # Handle print statements - comment out if limiting output to stdout
 
     if nosh.nprint > 0:
@@ -472,9 +520,11 @@ def runAPBS(PQR, INPUT):
     killEnergy()
     killMG(nosh, pbe, pmgp, pmg)
     killChargeMaps(nosh, chargeMap)
+    killPotMaps(nosh, potMap)
     killKappaMaps(nosh, kappaMap)
     killDielMaps(nosh, dielXMap, dielYMap, dielZMap)
     killMolecules(nosh, alist)
+    if guessmap != None: delete_Vgrid(guessmap)
     #delete_Nosh(nosh)
     
     # Clean up Python structures
@@ -488,6 +538,7 @@ def runAPBS(PQR, INPUT):
     delete_gridlist(dielZMap)
     delete_gridlist(kappaMap)
     delete_gridlist(chargeMap)
+    delete_gridlist(potMap)
     delete_pmglist(pmg)
     delete_pmgplist(pmgp)
     delete_pbelist(pbe)
@@ -0,0 +1,398 @@
+""" Persistent APBS sessions
+
+    This module keeps an APBS calculation alive between solves for
+    applications (Monte Carlo or molecular dynamics, for example) that
+    evaluate the same system thousands of times with only the atoms moved.
+    The input is parsed, the molecules and maps are loaded and the grids are
+    allocated once; after update_coordinates, solve sets up each ELEC
+    calculation again on its existing grids (see reinitMG in routines.c).
+
+        session = Session(open("apbs.in").read())
+        session.solve()
+        for coords in trajectory:
+            session.update_coordinates(coords)
+            session.solve(warm=1)
+            energies = session.energy()
+            forces = session.forces(0)
+        session.close()
+
+    The grids stay where they were set up for the first coordinates, so
+    moves should keep the atoms well inside the coarsest grid.  With
+    warm=1, each calculation starts from its previous solution instead of
+    zero; iterations and reduction report the effect on the solver.
+    set_parameters changes the dielectrics, ions and other physical
+    parameters between solves without parsing new input.
+
+    Sessions can be used from several threads.  Each session serializes its
+    own methods, and the APBS calls release the GIL, so a threaded server
+    can solve different sessions at the same time.  Linearized (lpbe) solves
+    of different sessions overlap.  Setting up a calculation,
+    nonlinear solves and closing a session are serialized across sessions,
+    since PMG keeps the ion parameters of the nonlinear term in a single
+    Fortran common block.
+
+	APBS -- Adaptive Poisson-Boltzmann Solver
+
+	  Nathan A. Baker (nathan.baker@pnl.gov)
+	  Pacific Northwest National Laboratory
+
+	  Additional contributing authors listed in the code documentation.
+
+	Copyright (c) 2010, Pacific Northwest National Laboratory.  Portions Copyright (c) 2002-2010, Washington University in St. Louis.  Portions Copyright (c) 2002-2010, Nathan A. Baker.  Portions Copyright (c) 1999-2002, The Regents of the University of California.  Portions Copyright (c) 1995, Michael Holst
+
+	All rights reserved.
+
+	Redistribution and use in source and binary forms, with or without
+	modification, are permitted provided that the following conditions are met: 
+
+	* Redistributions of source code must retain the above copyright notice, this
+	list of conditions and the following disclaimer.  
+
+	* Redistributions in binary form must reproduce the above copyright notice,
+	this list of conditions and the following disclaimer in the documentation
+	and/or other materials provided with the distribution.
+
+	* Neither the name of Washington University in St. Louis nor the names of its
+	contributors may be used to endorse or promote products derived from this
+	software without specific prior written permission.
+
+	THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+	"AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+	LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+	A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+	CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+	EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+	PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+	PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+	LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+	NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+	SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+from apbslib import *
+import time, threading
+from sys import stdout, stderr
+
+__date__ = "October 2026"
+
+NOSH_MAXMOL = 20
+NOSH_MAXCALC = 20
+
+# setCalc keywords that reinitMG picks up without new grids
+SESSIONKEYS = ["pdie", "sdie", "temp", "ions", "srfm", "srad", "swin", "sdens"]
+
+# Held while the PMG ion parameters (common block MYPDEF) are set, used or
+# cleared, i.e. around setup, nonlinear solves and destruction
+pdeLock = threading.Lock()
+
+def locked(method):
+    """ Make a Session method hold the lock of its session """
+    def wrapper(self, *args, **kwargs):
+        self.lock.acquire()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.lock.release()
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+class APBSError(Exception):
+    """ APBSError class
+
+        The APBSError class inherits off the Exception module and returns
+        a string defining the nature of the error. 
+    """
+    
+    def __init__(self, value):
+        """
+            Initialize with error message
+
+            Parameters
+                value:  Error Message (string)
+        """
+        self.value = value
+        
+    def __str__(self):
+        """
+            Return the error message
+        """
+        return `self.value`
+
+class Session:
+    """
+        A persistent APBS calculation.  All ELEC calculations must be
+        multigrid calculations.
+    """
+
+    def __init__(self, input, atoms=None):
+        """
+            Parse the input, load the molecules and maps and set up the
+            calculations.  Nothing is solved until solve is called.
+
+            Parameters
+                input:  The text of an APBS input file (string)
+                atoms:  Optional list with one array of atoms per molecule,
+                        as accepted by Valist_loadArray, to use instead of
+                        the files named in the READ section (list)
+        """
+        startVio()
+        self.lock = threading.RLock()
+        self.com = Vcom_ctor(1)
+        self.mem = Vmem_ctor("Session")
+        self.pbe = new_pbelist(NOSH_MAXCALC)
+        self.pmg = new_pmglist(NOSH_MAXCALC)
+        self.pmgp = new_pmgplist(NOSH_MAXCALC)
+        self.realCenter = double_array(3)
+        self.nforce = int_array(NOSH_MAXCALC)
+        self.atomforce = new_atomforcelist(NOSH_MAXCALC)
+        self.totEnergy = []
+        self.doforce = []
+        self.iters = []
+        self.coldIters = []
+        self.solved = 0
+
+        self.nosh = NOsh_ctor(Vcom_rank(self.com), Vcom_size(self.com))
+        if not parseInputFromString(self.nosh, input):
+            raise APBSError, "Error while parsing input!"
+
+        self.alist = new_valist(NOSH_MAXMOL)
+        if atoms == None:
+            if loadMolecules(self.nosh, None, self.alist) != 1:
+                raise APBSError, "Error while loading molecules!"
+        else:
+            for i in range(len(atoms)):
+                Valist_loadArray(make_Valist(self.alist, i), atoms[i])
+
+        if NOsh_setupElecCalc(self.nosh, self.alist) != 1:
+            raise APBSError, "Error while setting up calculations!"
+        for icalc in xrange(self.nosh.ncalc):
+            if NOsh_getCalc(self.nosh, icalc).calctype != 0:
+                raise APBSError, "Only multigrid calculations supported!"
+            self.totEnergy.append(0.0)
+            self.doforce.append(0)
+            self.iters.append(0)
+            self.coldIters.append(0)
+
+        self.dielXMap = new_gridlist(NOSH_MAXMOL)
+        self.dielYMap = new_gridlist(NOSH_MAXMOL)
+        self.dielZMap = new_gridlist(NOSH_MAXMOL)
+        if loadDielMaps(self.nosh, self.dielXMap, self.dielYMap, self.dielZMap) != 1:
+            raise APBSError, "Error reading dielectric maps!"
+        self.kappaMap = new_gridlist(NOSH_MAXMOL)
+        if loadKappaMaps(self.nosh, self.kappaMap) != 1:
+            raise APBSError, "Error reading kappa maps!"
+        self.potMap = new_gridlist(NOSH_MAXMOL)
+        if loadPotMaps(self.nosh, self.potMap) != 1:
+            raise APBSError, "Error reading potential maps!"
+        self.chargeMap = new_gridlist(NOSH_MAXMOL)
+        if loadChargeMaps(self.nosh, self.chargeMap) != 1:
+            raise APBSError, "Error reading charge maps!"
+
+    @locked
+    def update_coordinates(self, coords, molecule=0):
+        """
+            Move the atoms of a molecule; the change takes effect at the
+            next solve
+
+            Parameters
+                coords:    An (N,3) array with one row per atom, in the
+                           order the atoms were loaded
+                molecule:  The index of the molecule (int)
+        """
+        Valist_updateCoordinates(get_Valist(self.alist, molecule), coords)
+
+    @locked
+    def set_parameters(self, icalc=None, **values):
+        """
+            Change physical parameters of a calculation, or of all of them;
+            the change takes effect at the next solve.  Sweeps over the
+            dielectrics or ionic strength need no new input text:
+
+                for sdie in [2.0, 4.0, 78.54]:
+                    session.set_parameters(sdie=sdie)
+                    energies = session.solve()
+
+            Parameters
+                icalc:   The index of the calculation, or None for all (int)
+                values:  Any of the setCalc keywords pdie, sdie, temp,
+                         ions, srfm, srad, swin and sdens; the grids and the
+                         kind of equation are fixed when the session is
+                         created
+        """
+        for key in values.keys():
+            if key not in SESSIONKEYS:
+                raise APBSError, "Can't change %s in a session!" % key
+        if icalc == None:
+            calcs = range(self.nosh.ncalc)
+        else:
+            calcs = [icalc]
+        for i in calcs:
+            try:
+                setCalc(NOsh_getCalc(self.nosh, i), **values)
+            except ValueError, error:
+                raise APBSError, str(error)
+
+    @locked
+    def solve(self, warm=0):
+        """
+            Solve every ELEC calculation for the current coordinates and
+            compute their energies and forces
+
+            Parameters
+                warm:  If true, start each calculation from its solution of
+                       the previous solve instead of zero (int)
+            Returns
+                energies:  The total energy of each calculation in kT (list)
+        """
+        nosh = self.nosh
+        warm = warm and self.solved
+        if self.solved:
+            killForce(self.mem, nosh, self.nforce, self.atomforce)
+        for icalc in xrange(nosh.ncalc):
+            calc = NOsh_getCalc(nosh, icalc)
+            mgparm = calc.mgparm
+            pbeparm = calc.pbeparm
+            nonlinear = (pbeparm.pbetype != PBE_LPBE)
+            pdeLock.acquire()
+            held = 1
+            try:
+                if reinitMG(icalc, nosh, mgparm, pbeparm, self.realCenter,
+                            self.pbe, self.alist, self.dielXMap, self.dielYMap,
+                            self.dielZMap, self.kappaMap, self.chargeMap,
+                            self.pmgp, self.pmg, self.potMap) != 1:
+                    raise APBSError, "Error setting up MG calculation!"
+                if not nonlinear:
+                    pdeLock.release()
+                    held = 0
+                thispmg = get_Vpmg(self.pmg, icalc)
+                if warm and guessMG(nosh, thispmg, None) != 1:
+                    raise APBSError, "Error setting initial guess!"
+                if solveMG(nosh, thispmg, mgparm.type) != 1:
+                    raise APBSError, "Error Solving PDE!"
+            finally:
+                if held: pdeLock.release()
+            self.iters[icalc] = thispmg.iters
+            if not warm:
+                self.coldIters[icalc] = thispmg.iters
+            if setPartMG(nosh, mgparm, thispmg) != 1:
+                raise APBSError, "Error setting partition info!"
+            ret, self.totEnergy[icalc] = energyMG(nosh, icalc, thispmg, 0,
+                                                  0.0, 0.0, 0.0, 0.0)
+            aforce = get_AtomForce(self.atomforce, icalc)
+            self.doforce[icalc] = wrap_forceMG(self.mem, nosh, pbeparm, mgparm,
+                                               thispmg, aforce, self.alist,
+                                               self.nforce, icalc)
+        self.solved = 1
+        return self.energy()
+
+    def checkSolved(self):
+        """
+            Raise APBSError if solve has not been called
+        """
+        if not self.solved:
+            raise APBSError, "No solution yet; call solve first!"
+
+    @locked
+    def iterations(self):
+        """
+            Return the number of solver iterations of each calculation in
+            the last solve (list)
+        """
+        self.checkSolved()
+        return list(self.iters)
+
+    @locked
+    def reduction(self):
+        """
+            Return the fraction of solver iterations saved by the last solve
+            of each calculation compared with its last solve from zero
+            (list; 0.0 when the last solve started from zero)
+        """
+        self.checkSolved()
+        fractions = []
+        for icalc in xrange(self.nosh.ncalc):
+            if self.coldIters[icalc] > 0:
+                fractions.append(1.0 - float(self.iters[icalc])/self.coldIters[icalc])
+            else:
+                fractions.append(0.0)
+        return fractions
+
+    @locked
+    def energy(self, iprint=None):
+        """
+            Return the energies of the last solve
+
+            Parameters
+                iprint:  If given, the index of a PRINT ENERGY statement of
+                         the input whose value should be returned (int)
+            Returns
+                energy:  The total energy of each calculation in kT (list),
+                         or the value of the PRINT statement (float)
+        """
+        self.checkSolved()
+        if iprint == None:
+            return list(self.totEnergy)
+        return returnEnergy(self.com, self.nosh, self.totEnergy, iprint)
+
+    @locked
+    def forces(self, icalc):
+        """
+            Return the forces on each atom from calculation icalc of the
+            last solve, as a dictionary of "qf", "ib" and "db" lists of
+            [x, y, z] components (see getForces), or None if the
+            calculation does not compute forces
+        """
+        self.checkSolved()
+        if not self.doforce[icalc]:
+            return None
+        pbeparm = NOsh_getCalc(self.nosh, icalc).pbeparm
+        return getForces(get_AtomForce(self.atomforce, icalc),
+                         get_Valist(self.alist, pbeparm.molid - 1))
+
+    @locked
+    def potentials(self, icalc):
+        """
+            Return the potential at each atom from calculation icalc of the
+            last solve (list, kT/e)
+        """
+        self.checkSolved()
+        pbeparm = NOsh_getCalc(self.nosh, icalc).pbeparm
+        return getPotentials(self.nosh, pbeparm, get_Vpmg(self.pmg, icalc),
+                             get_Valist(self.alist, pbeparm.molid - 1))
+
+    @locked
+    def close(self):
+        """
+            Free everything the session holds; it can't be used afterwards
+        """
+        if self.nosh == None:
+            return
+        if self.solved:
+            killForce(self.mem, self.nosh, self.nforce, self.atomforce)
+        killEnergy()
+        pdeLock.acquire()
+        try:
+            killAllMG(self.nosh, self.pbe, self.pmgp, self.pmg)
+        finally:
+            pdeLock.release()
+        killChargeMaps(self.nosh, self.chargeMap)
+        killPotMaps(self.nosh, self.potMap)
+        killKappaMaps(self.nosh, self.kappaMap)
+        killDielMaps(self.nosh, self.dielXMap, self.dielYMap, self.dielZMap)
+        killMolecules(self.nosh, self.alist)
+
+        delete_double_array(self.realCenter)
+        delete_int_array(self.nforce)
+        delete_atomforcelist(self.atomforce)
+        delete_valist(self.alist)
+        delete_gridlist(self.dielXMap)
+        delete_gridlist(self.dielYMap)
+        delete_gridlist(self.dielZMap)
+        delete_gridlist(self.kappaMap)
+        delete_gridlist(self.potMap)
+        delete_gridlist(self.chargeMap)
+        delete_pmglist(self.pmg)
+        delete_pmgplist(self.pmgp)
+        delete_pbelist(self.pbe)
+        self.nosh = None
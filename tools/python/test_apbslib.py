@@ -0,0 +1,241 @@
+""" Tests for the NumPy helpers of apbslib.py
+
+    Run from the build tree, after make has built _apbslib.so:
+
+        python test_apbslib.py
+"""
+
+import unittest, os, sys, subprocess
+import numpy
+from apbslib import *
+from session import Session
+from test_session import INPUT, makeSession
+
+class GridArrayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = makeSession()
+        self.session.solve()
+        # The fine grid: 33 points 0.5 A apart, centered on the ion
+        self.pmg = get_Vpmg(self.session.pmg, 1)
+
+    def tearDown(self):
+        self.session.close()
+
+    def testGeometry(self):
+        """ Views are (nx, ny, nz) arrays with the grid geometry """
+        pot = getGridArray(self.pmg)
+        self.assertEqual(pot.shape, (33, 33, 33))
+        self.assertEqual((pot.name, pot.nx, pot.ny, pot.nz),
+                         ("pot", 33, 33, 33))
+        self.assertEqual(pot.h, (0.5, 0.5, 0.5))
+        self.assertEqual(pot.origin, (-8.0, -8.0, -8.0))
+        self.assertEqual(pot[1:3].h, pot.h)
+        arrays = getGridArrays(self.pmg)
+        for name in ["pot", "charge", "dielx", "kappa", "a1cf", "fcf"]:
+            self.assertEqual(arrays[name].shape, pot.shape)
+            self.assertEqual(arrays[name].name, name)
+        self.assertRaises(ValueError, getGridArray, self.pmg, "nothing")
+
+    def testValues(self):
+        """ Views index the solution as [i,j,k] and share its memory """
+        pot = getGridArray(self.pmg)
+        potential = self.session.potentials(1)[0]
+        self.assertAlmostEqual(pot[16,16,16], potential, 10)
+        # The potential is symmetric about the ion, so the i, j and k
+        # axes agree
+        self.assertAlmostEqual(pot[10,16,16], pot[16,10,16], 6)
+        self.assertAlmostEqual(pot[10,16,16], pot[16,16,10], 6)
+        self.assert_(pot[10,16,16] < potential)
+        other = getGridArray(self.pmg)
+        pot[16,16,16] = 123.0
+        self.assertEqual(other[16,16,16], 123.0)
+        self.assertEqual(self.session.potentials(1)[0], 123.0)
+
+class ValistTest(unittest.TestCase):
+
+    def setUp(self):
+        self.alists = new_valist(1)
+        self.alist = make_Valist(self.alists, 0)
+        random = numpy.random.RandomState(1)
+        self.atoms = numpy.column_stack([random.uniform(-10, 10, (50, 3)),
+                                         random.uniform(-1, 1, 50),
+                                         random.uniform(1, 2, 50)])
+        # Valist_dtor2 expects a loaded list
+        Valist_loadArray(self.alist, self.atoms)
+
+    def tearDown(self):
+        remove_Valist(self.alist)
+        delete_valist(self.alists)
+
+    def getAtoms(self):
+        rows = []
+        for i in range(self.alist.number):
+            atom = Valist_getAtom(self.alist, i)
+            rows.append(getAtomPosition(atom) + [Vatom_getCharge(atom),
+                                                 Vatom_getRadius(atom)])
+        return numpy.array(rows)
+
+    def testLoad(self):
+        """ Arrays load the same atoms as the list interface """
+        Valist_load(self.alist, 50, list(self.atoms[:,0]),
+                    list(self.atoms[:,1]), list(self.atoms[:,2]),
+                    list(self.atoms[:,3]), list(self.atoms[:,4]))
+        loaded = self.getAtoms()
+        self.assertEqual(loaded.tolist(), self.atoms.tolist())
+        Valist_loadArray(self.alist, self.atoms[:10])
+        self.assertEqual(self.getAtoms().tolist(), self.atoms[:10].tolist())
+        # Fortran ordered and structured arrays are converted
+        Valist_loadArray(self.alist, numpy.asfortranarray(self.atoms))
+        self.assertEqual(self.getAtoms().tolist(), loaded.tolist())
+        fields = numpy.zeros(50, dtype=[(name, float) for name in
+                                        ["radius", "x", "y", "z", "charge"]])
+        for i in range(5):
+            fields[ATOMFIELDS[i]] = self.atoms[:,i]
+        Valist_loadArray(self.alist, fields)
+        self.assertEqual(self.getAtoms().tolist(), loaded.tolist())
+
+    def testBadArrays(self):
+        """ Arrays of the wrong shape are refused, keeping the atoms """
+        for atoms in [numpy.zeros((0, 5)), numpy.zeros((3, 4)), numpy.zeros(5)]:
+            self.assertRaises(ValueError, Valist_loadArray, self.alist, atoms)
+        self.assertEqual(self.getAtoms().tolist(), self.atoms.tolist())
+
+    def testUpdate(self):
+        """ Coordinates are replaced in place; charges and radii stay """
+        moved = self.atoms[:,0:3] + 1.0
+        Valist_updateCoordinates(self.alist, moved)
+        loaded = self.getAtoms()
+        self.assertEqual(loaded[:,0:3].tolist(), moved.tolist())
+        self.assertEqual(loaded[:,3:5].tolist(), self.atoms[:,3:5].tolist())
+        self.assertRaises(ValueError, Valist_updateCoordinates, self.alist,
+                          moved[:-1])
+
+    def testSession(self):
+        """ A session from an array solves like one from the PQR file """
+        fromFile = Session(INPUT % 78.54)
+        fromArray = makeSession()
+        try:
+            self.assertEqual(fromArray.solve(), fromFile.solve())
+        finally:
+            fromFile.close()
+            fromArray.close()
+
+PBEFIELDS = ["molid", "pbetype", "bcfl", "nion", "pdie", "sdie", "srfm",
+             "srad", "swin", "sdens", "temp", "calcenergy", "calcforce"]
+
+def describeCalc(calc):
+    """ The PBE fields and grid of a calculation, for comparisons """
+    mgparm = calc.mgparm
+    return ([getattr(calc.pbeparm, name) for name in PBEFIELDS] +
+            [MGparm_getNx(mgparm), MGparm_getNy(mgparm), MGparm_getNz(mgparm),
+             MGparm_getHx(mgparm), MGparm_getHy(mgparm), MGparm_getHz(mgparm)])
+
+class CalcTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = makeSession()
+        self.nosh = self.session.nosh
+
+    def tearDown(self):
+        self.session.close()
+
+    def testSetCalc(self):
+        """ Good values are set; bad values and keywords raise ValueError
+            and leave the value unchanged """
+        calc = newCalc()
+        try:
+            setCalc(calc, sdie=4.0, pdie=2.0, dime=(65, 33, 33),
+                    glen=(32.0, 16.0, 16.0))
+            self.assertEqual((calc.pbeparm.sdie, calc.pbeparm.pdie),
+                             (4.0, 2.0))
+            self.assertEqual((MGparm_getNx(calc.mgparm),
+                              MGparm_getHx(calc.mgparm)), (65, 0.5))
+            for values in [{"sdie": -1.0}, {"pdie": 0.0}, {"temp": 0.0},
+                           {"srad": -1.4}, {"bcfl": 99}, {"pbetype": -1},
+                           {"dime": (3, 3, 3)}, {"glen": (10.0, 0.0, 10.0)},
+                           {"ions": [(1.0, -0.1, 2.0)]}, {"nothing": 1}]:
+                self.assertRaises(ValueError, setCalc, calc, **values)
+            self.assertRaises(ValueError, setCalc, calc,
+                              glen=(10.0, 10.0, 10.0), grid=(0.5, 0.5, 0.5))
+            self.assertEqual((calc.pbeparm.sdie, calc.pbeparm.pdie),
+                             (4.0, 2.0))
+            self.assertEqual(MGparm_getHx(calc.mgparm), 0.5)
+            setCalc(calc, ions=[(1.0, 0.15, 2.0), (-1.0, 0.15, 2.0)])
+            self.assertEqual(calc.pbeparm.nion, 2)
+            self.assertEqual(PBEparm_getIonConc(calc.pbeparm, 1), 0.15)
+        finally:
+            deleteCalc(calc)
+
+    def testMakeCalc(self):
+        """ A complete calculation is added after the parsed ones; an
+            incomplete one is not added """
+        ncalc = self.nosh.ncalc
+        values = {"dime": (33, 33, 33), "glen": (16.0, 16.0, 16.0),
+                  "gcent": (0.0, 0.0, 0.0), "chgm": VCM_BSPL2, "molid": 1,
+                  "pbetype": PBE_LPBE, "bcfl": BCFL_MDH, "pdie": 1.0,
+                  "sdie": 78.54, "srfm": VSM_MOL, "srad": 1.4, "swin": 0.3,
+                  "sdens": 10.0, "temp": 298.15}
+        incomplete = values.copy()
+        del incomplete["temp"]
+        self.assertRaises(ValueError, makeCalc, self.nosh, **incomplete)
+        self.assertEqual(self.nosh.ncalc, ncalc)
+        self.assertEqual(makeCalc(self.nosh, **values), ncalc)
+        self.assertEqual(self.nosh.ncalc, ncalc + 1)
+        calc = NOsh_getCalc(self.nosh, ncalc)
+        self.assertEqual((calc.pbeparm.sdie, calc.pbeparm.temp,
+                          MGparm_getNx(calc.mgparm), MGparm_getHx(calc.mgparm)),
+                         (78.54, 298.15, 33, 0.5))
+
+    def testCloneCalc(self):
+        """ Clones for a dielectric sweep match the parsed calculations
+            of that dielectric, and leave the original unchanged """
+        ncalc = self.nosh.ncalc
+        original = describeCalc(NOsh_getCalc(self.nosh, 1))
+        swept = makeSession(2.0)
+        try:
+            for sdie in [2.0, 4.0]:
+                icalc = cloneCalc(self.nosh, 1, sdie=sdie)
+                clone = NOsh_getCalc(self.nosh, icalc)
+                self.assertEqual(clone.pbeparm.sdie, sdie)
+            self.assertEqual(self.nosh.ncalc, ncalc + 2)
+            self.assertEqual(describeCalc(NOsh_getCalc(self.nosh, ncalc)),
+                             describeCalc(NOsh_getCalc(swept.nosh, 1)))
+            self.assertEqual(describeCalc(NOsh_getCalc(self.nosh, 1)), original)
+            self.assertRaises(ValueError, cloneCalc, self.nosh, 1, sdie=-2.0)
+            self.assertEqual(self.nosh.ncalc, ncalc + 2)
+        finally:
+            swept.close()
+
+def runPython(code):
+    """ Run code in a new interpreter and return what it prints """
+    process = subprocess.Popen([sys.executable, "-c", code],
+                               stdout=subprocess.PIPE,
+                               cwd=os.path.dirname(os.path.abspath(__file__)))
+    return process.communicate()[0].split()
+
+class LazyImportTest(unittest.TestCase):
+
+    def testImport(self):
+        """ Importing apbslib leaves NumPy unimported until needed """
+        self.assertEqual(runPython("""
+import sys, apbslib
+print "numpy" in sys.modules, apbslib.GridArray is None
+numpy = apbslib.loadNumpy()
+print "numpy" in sys.modules, numpy is sys.modules["numpy"]
+print issubclass(apbslib.GridArray, numpy.ndarray)
+"""), ["False", "True", "True", "True", "True"])
+
+    def testStarImport(self):
+        """ A star import never replaces the caller's numpy """
+        self.assertEqual(runPython("""
+numpy = "mine"
+from apbslib import *
+print numpy
+loadNumpy()
+from apbslib import *
+print numpy
+"""), ["mine", "mine"])
+
+if __name__ == "__main__":
+    unittest.main()
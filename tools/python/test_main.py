@@ -0,0 +1,62 @@
+""" Tests for main.py
+
+    Run from the build tree, after make has built _apbslib.so:
+
+        python test_main.py
+"""
+
+import unittest, os, sys, shutil, tempfile, subprocess, time, json
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BORN = os.path.join(HERE, "..", "..", "examples", "born")
+
+def runMain(args, directory, timeout=120):
+    """ Run main.py with args in directory and return its exit status and
+        output; a run that doesn't finish in timeout seconds is killed """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([HERE] + \
+        filter(None, [env.get("PYTHONPATH")]))
+    log = open(os.path.join(directory, "main.log"), "w+")
+    process = subprocess.Popen([sys.executable, os.path.join(HERE, "main.py")]
+                               + args, cwd=directory, env=env, stdout=log,
+                               stderr=subprocess.STDOUT)
+    deadline = time.time() + timeout
+    while process.poll() == None and time.time() < deadline:
+        time.sleep(0.1)
+    if process.poll() == None:
+        process.kill()
+        process.wait()
+    log.seek(0)
+    output = log.read()
+    log.close()
+    return process.returncode, output
+
+class MainTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        for name in ["apbs-mol-auto.in", "ion.xml"]:
+            shutil.copy(os.path.join(BORN, name), self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def runStats(self, args):
+        path = os.path.join(self.directory, "stats.json")
+        status, output = runMain(args + ["--stats=%s" % path,
+                                         "apbs-mol-auto.in"], self.directory)
+        self.assertEqual(status, 0, output)
+        return json.load(open(path))
+
+    def testJobs(self):
+        """ mg-auto focusing chains run in worker processes (and are freed
+            there) with the energies of a serial run """
+        serial = self.runStats([])
+        parallel = self.runStats(["--jobs=2"])
+        self.assertEqual(len(serial["calcs"]), 6)
+        self.assertEqual([calc["energy"] for calc in parallel["calcs"]],
+                         [calc["energy"] for calc in serial["calcs"]])
+        self.assertEqual(parallel["iters"], serial["iters"])
+
+if __name__ == "__main__":
+    unittest.main()
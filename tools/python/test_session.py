@@ -0,0 +1,280 @@
+""" Tests for session.py
+
+    Run from the build tree, after make has built _apbslib.so:
+
+        python test_session.py
+"""
+
+import unittest, threading, time, os, re, shutil, subprocess, tempfile
+import numpy
+from session import *
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APBS = os.path.join(HERE, "..", "..", "bin", "apbs")
+
+INPUT = """
+read
+    mol pqr ion.pqr
+end
+elec name solvated
+    mg-auto
+    dime 33 33 33
+    cglen 40 40 40
+    fglen 16 16 16
+    cgcent mol 1
+    fgcent mol 1
+    mol 1
+    lpbe
+    bcfl mdh
+    pdie 1.0
+    sdie %s
+    chgm spl2
+    srfm mol
+    srad 1.4
+    swin 0.3
+    sdens 10.0
+    temp 298.15
+    calcenergy total
+    calcforce no
+end
+quit
+"""
+
+# One ion of charge +1 and radius 3 A, as in examples/born/ion.pqr
+ATOMS = numpy.array([[0.0, 0.0, 0.0, 1.0, 3.0]])
+
+def makeSession(sdie=78.54):
+    return Session(INPUT % sdie, [ATOMS])
+
+def runThreads(function, args):
+    """ Call function once per entry of args, each in its own thread, and
+        return the results in the order of args; exceptions are re-raised """
+    results = [None]*len(args)
+    errors = []
+    def run(i):
+        try:
+            results[i] = function(args[i])
+        except Exception, error:
+            errors.append(error)
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(args))]
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+class SessionTest(unittest.TestCase):
+
+    def testMatchesApbs(self):
+        """ A session gives the energies of the apbs program """
+        directory = tempfile.mkdtemp()
+        try:
+            open(os.path.join(directory, "apbs.in"), "w").write(INPUT % 78.54)
+            shutil.copy(os.path.join(HERE, "ion.pqr"), directory)
+            process = subprocess.Popen([APBS, "apbs.in"], cwd=directory,
+                                       stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT)
+            output = process.communicate()[0]
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual(process.returncode, 0, output)
+        expected = [float(x) for x in re.findall(
+            r"Total electrostatic energy = (\S+) kJ/mol", output)]
+        session = makeSession()
+        try:
+            energies = session.solve()
+        finally:
+            session.close()
+        self.assertEqual(len(energies), len(expected))
+        # kT to kJ/mol at 298.15 K, with the constants of vunit.h
+        kT = 1.3806581e-23 * 6.0221367e23 * 298.15 / 1000.0
+        for energy, value in zip(energies, expected):
+            self.assertAlmostEqual(energy*kT/value, 1.0, 10)
+
+    def testMoves(self):
+        """ Moving the atoms changes the energies, and moving them back
+            restores them; dielectric changes match a new session """
+        session = makeSession()
+        try:
+            first = session.solve()
+            session.update_coordinates(ATOMS[:,0:3] + 0.3)
+            moved = session.solve()
+            self.assertNotEqual(moved, first)
+            session.update_coordinates(ATOMS[:,0:3])
+            self.assertEqual(session.solve(), first)
+            session.set_parameters(sdie=2.0)
+            swept = session.solve()
+        finally:
+            session.close()
+        fresh = makeSession(2.0)
+        try:
+            self.assertEqual(swept, fresh.solve())
+        finally:
+            fresh.close()
+
+    def testErrors(self):
+        """ Results need a solve, and only physical parameters change """
+        session = makeSession()
+        try:
+            self.assertRaises(APBSError, session.energy)
+            self.assertRaises(APBSError, session.set_parameters,
+                              dime=(65, 65, 65))
+            self.assertRaises(APBSError, session.set_parameters, sdie=-1.0)
+            self.assertRaises(ValueError, session.update_coordinates,
+                              numpy.zeros((2, 3)))
+        finally:
+            session.close()
+
+    def testCycles(self):
+        """ Each solve records one residual per iteration in its Vpmg """
+        session = makeSession()
+        try:
+            session.solve()
+            for icalc in range(session.nosh.ncalc):
+                cycles = getCycles(get_Vpmg(session.pmg, icalc))
+                self.assertEqual(len(cycles), session.iterations()[icalc])
+                self.assert_(cycles[-1][0] < cycles[0][0])
+        finally:
+            session.close()
+
+    def testThreadedSolves(self):
+        """ Sessions solved in concurrent threads give the energies and
+            iteration records of serial solves """
+        def solve(sdie):
+            session = makeSession(sdie)
+            try:
+                energies = session.solve()
+                cycles = [getCycles(get_Vpmg(session.pmg, icalc))
+                          for icalc in range(session.nosh.ncalc)]
+                return energies, cycles
+            finally:
+                session.close()
+        sdies = [78.54, 2.0, 78.54, 2.0]
+        serial = [solve(sdie) for sdie in sdies]
+        for i in range(3):
+            threaded = runThreads(solve, sdies)
+            for (energies, cycles), (serialEnergies, serialCycles) \
+                    in zip(threaded, serial):
+                self.assertEqual(energies, serialEnergies)
+                self.assertEqual([[r for r, t in c] for c in cycles],
+                                 [[r for r, t in c] for c in serialCycles])
+
+    def testOverlap(self):
+        """ Linearized solves of two sessions run at the same time: the
+            first solveMG of each thread waits until the other thread has
+            reached solveMG too, which times out if the solves are
+            serialized """
+        import session as module
+        solveMG = module.solveMG
+        arrived = threading.Condition()
+        state = {"arrived": 0, "met": 0}
+        local = threading.local()
+        def overlappingSolveMG(nosh, pmg, type):
+            if not getattr(local, "waited", 0):
+                local.waited = 1
+                arrived.acquire()
+                state["arrived"] += 1
+                arrived.notifyAll()
+                deadline = time.time() + 10.0
+                while state["arrived"] < 2 and time.time() < deadline:
+                    arrived.wait(deadline - time.time())
+                if state["arrived"] == 2:
+                    state["met"] += 1
+                arrived.release()
+            return solveMG(nosh, pmg, type)
+        def solve(session):
+            return session.solve()
+        sessions = [makeSession(), makeSession(2.0)]
+        module.solveMG = overlappingSolveMG
+        try:
+            runThreads(solve, sessions)
+        finally:
+            module.solveMG = solveMG
+            for session in sessions: session.close()
+        self.assertEqual(state["met"], 2, "solves were serialized")
+
+    def testOffGridPotentials(self):
+        """ Atoms outside the fine grid get a zero potential, and a
+            read-only out array is refused """
+        atoms = numpy.array([[-15.0, 0.0, 0.0, 1.0, 3.0],
+                             [15.0, 0.0, 0.0, 1.0, 3.0]])
+        session = Session(INPUT % 78.54, [atoms])
+        try:
+            session.solve()
+            self.assert_(numpy.all(session.potentials(0) != 0.0))
+            stale = numpy.empty(2)
+            stale.fill(numpy.nan)
+            pbeparm = NOsh_getCalc(session.nosh, 1).pbeparm
+            alist = get_Valist(session.alist, 0)
+            potentials = getPotentials(session.nosh, pbeparm,
+                                       get_Vpmg(session.pmg, 1), alist,
+                                       stale)
+            self.assertEqual(list(potentials), [0.0, 0.0])
+            stale.flags.writeable = False
+            self.assertRaises(ValueError, getPotentials, session.nosh,
+                              pbeparm, get_Vpmg(session.pmg, 1), alist,
+                              stale)
+        finally:
+            session.close()
+
+    def testThreadStats(self):
+        """ Each thread counts only its own phases """
+        resetStats()
+        def solve(count):
+            resetStats()
+            session = makeSession()
+            try:
+                for i in range(count):
+                    session.solve()
+            finally:
+                session.close()
+            return getStatsRecord()["phases"]["solve"]["count"]
+        counts = runThreads(solve, [1, 2, 3])
+        self.assertEqual(counts, [2, 4, 6])
+        self.assertEqual(getStatsRecord()["phases"]["solve"]["count"], 0)
+
+class WarmStartTest(unittest.TestCase):
+
+    def testWarm(self):
+        """ A warm solve after a small move gives the energies of a cold
+            solve on the same grids in fewer iterations """
+        session = makeSession()
+        try:
+            session.solve(warm=1)
+            self.assertEqual(session.reduction(), [0.0, 0.0])
+            cold = session.iterations()
+            session.update_coordinates(ATOMS[:,0:3] + 0.1)
+            energies = session.solve(warm=1)
+            iters = session.iterations()
+            self.assert_(min(session.reduction()) > 0.0)
+            expected = session.solve()
+            self.assertEqual(session.reduction(), [0.0, 0.0])
+            for energy, value in zip(energies, expected):
+                self.assertAlmostEqual(energy/value, 1.0, 5)
+            for i in range(len(iters)):
+                self.assert_(iters[i] < session.iterations()[i])
+                self.assert_(iters[i] < cold[i])
+        finally:
+            session.close()
+
+    def testGuessArray(self):
+        """ The converged solution as a guess needs fewer iterations; a
+            guess of the wrong shape is refused """
+        session = makeSession()
+        try:
+            session.solve()
+            nosh = session.nosh
+            pmg = get_Vpmg(session.pmg, 1)
+            cold = pmg.iters
+            solution = getGridArray(pmg).copy()
+            self.assertRaises(ValueError, setGuessArray, pmg, solution[1:])
+            setGuessArray(pmg, solution)
+            self.assertEqual(solveMG(nosh, pmg, NOsh_getCalc(nosh, 1).mgparm.type), 1)
+            self.assert_(pmg.iters < cold)
+            self.assertAlmostEqual(getGridArray(pmg)[16,16,16]/
+                                   solution[16,16,16], 1.0, 6)
+        finally:
+            session.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 from vgrid import *
 import sys
 import math
+import numpy
 from sys import stdout, stderr
 
 """
@@ -82,22 +83,17 @@ def main():
     jmax = min(jmax, ny-1)
     kmax = int(math.ceil((zmaxAVG - zmin)/hzed))
     kmax = min(kmax, nz-1)
+    # A window that misses the grid leaves max < min; make it empty
+    imax = max(imax, imin)
+    jmax = max(jmax, jmin)
+    kmax = max(kmax, kmin)
 
     stdout.write("#  \tY POS\t\tAVERAGE\n")
+    window = getVgridArray(grid)[imin:imax, jmin:jmax, kmin:kmax]
     for j in range(jmin, jmax):
-        avg = 0.0
-        navg = 0
-        for k in range(kmin, kmax):
-            for i in range(imin, imax):
-                pt = [i,j,k]
-                val = 0.0
-                ret, value = Vgrid_value(grid, pt, val)
-                if ret:
-                    avg = avg + value
-                    navg = navg + 1
-
-        if navg != 0:
-            avg = avg/navg
+        plane = window[:, j-jmin, :]
+        if plane.size != 0:
+            avg = plane.mean()
             stdout.write("   \t%e\t\t%e\n" % ((hy*j + ymin), avg))
         else:
             stdout.write("   \t%e\t\t%s\n" % ((hy*j + ymin), "nan"))
@@ -0,0 +1,139 @@
+#!/usr/bin/python2 -O
+
+"""
+    gridconvert.py - Python script for converting grids between the
+                     OpenDX and APBS binary grid formats
+"""
+
+__date__ = "October 2026"
+
+HEADER = "\n\n\
+    ----------------------------------------------------------------------\n\
+    Adaptive Poisson-Boltzmann Solver (APBS)\n\
+    ----------------------------------------------------------------------\n\
+    \n\n"
+TITLE = "Converted by gridconvert.py"
+
+import sys
+import getopt
+from vgrid import *
+
+def getFormat(path):
+    """
+        Return the format of a grid file from its extension
+
+        Parameters
+            path:    The path of the grid file (string)
+        Returns
+            format:  "dx" or "bin", or None if the extension is unknown
+    """
+    if path.endswith(".dx"):
+        return "dx"
+    elif path.endswith(".bin"):
+        return "bin"
+    return None
+
+def convertGrid(inpath, outpath, size=8, compress=0, title=TITLE):
+    """
+        Read a grid from inpath and write it to outpath, each in the
+        format given by its extension
+
+        Parameters
+            inpath:   The path of the grid to read (string)
+            outpath:  The path of the grid to write (string)
+            size:     Bytes per value of a binary output grid, 4 or 8 (int)
+            compress: 1 to compress a binary output grid with zlib (int)
+            title:    The title of the output grid (string)
+        Returns
+            grid:     The grid that was converted; free it with delete_vgrid
+    """
+    data = []
+    grid = Vgrid_ctor(0, 0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, data)
+    if getFormat(inpath) == "dx":
+        rc = Vgrid_readDX(grid, "FILE", "ASC", "", inpath)
+    else:
+        rc = Vgrid_readBIN(grid, inpath)
+    if rc != 1:
+        delete_vgrid(grid)
+        raise IOError("Unable to read %s" % inpath)
+
+    if getFormat(outpath) == "dx":
+        Vgrid_writeDX(grid, "FILE", "ASC", "", outpath, title, null_array())
+    elif Vgrid_writeBIN(grid, outpath, title, null_array(), size,
+                        compress) != 1:
+        delete_vgrid(grid)
+        raise IOError("Unable to write %s" % outpath)
+    return grid
+
+def usage():
+    """
+        Print usage information
+    """
+    str = "%s" % HEADER
+    str = str + "gridconvert.py\n"
+    str = str + "\n"
+    str = str + "This module converts a grid between the OpenDX (.dx) and APBS\n"
+    str = str + "binary (.bin) grid formats; the format of each file is taken\n"
+    str = str + "from its extension.\n"
+    str = str + "\n"
+    str = str + "Usage: gridconvert.py [options] <input-file> <output-file>\n"
+    str = str + "\n"
+    str = str + "    Required Arguments:\n"
+    str = str + "        <input-file>   : The grid to read (.dx or .bin)\n"
+    str = str + "        <output-file>  : The grid to write (.dx or .bin)\n"
+    str = str + "\n"
+    str = str + "   Optional Arguments:\n"
+    str = str + "        --help   (-h)  : Display the usage information\n"
+    str = str + "        --float        : Store binary values as 32-bit floats\n"
+    str = str + "                         instead of doubles\n"
+    str = str + "        --compress     : Compress a binary grid with zlib\n"
+    str = str + "        --title=<title>: Title of the output grid\n"
+    str = str + "\n"
+    sys.stderr.write(str)
+    sys.exit()
+
+def main():
+    """
+        The main driver for the gridconvert script
+    """
+    shortOptlist = "h"
+    longOptlist = ["help","float","compress","title="]
+    try: opts, args = getopt.getopt(sys.argv[1:], shortOptlist, longOptlist)
+    except getopt.GetoptError, details:
+        sys.stderr.write("GetoptError:  %s\n" % details)
+        usage()
+
+    size = 8
+    compress = 0
+    title = TITLE
+    for o,a in opts:
+        if o in ("-h","--help"):
+            usage()
+        elif o == "--float":
+            size = 4
+        elif o == "--compress":
+            compress = 1
+        elif o == "--title":
+            title = a
+
+    if len(args) != 2:
+        print "\nImproper number of arguments!"
+        usage()
+    inpath = args[0]
+    outpath = args[1]
+    for path in [inpath, outpath]:
+        if getFormat(path) == None:
+            print "\nUnknown grid format for %s!" % path
+            usage()
+
+    startVio()
+    try:
+        grid = convertGrid(inpath, outpath, size, compress, title)
+    except IOError, details:
+        sys.stderr.write("%s\n" % details)
+        sys.exit(1)
+    sys.stdout.write("Converted %d x %d x %d grid from %s to %s\n" % \
+                     (grid.nx, grid.ny, grid.nz, inpath, outpath))
+    delete_vgrid(grid)
+
+if __name__ == "__main__": main()
@@ -21,7 +21,16 @@ HEADER = "\n\n\
 import string
 import sys
 import getopt
+import threading
+import numpy
 from vgrid import *
+
+class MergeError(Exception):
+    """
+        A dx file that could not be merged; the argument is the list of
+        lines explaining why
+    """
+    pass
         
 def IJK(nx, ny, nz, i, j, k):
     """
@@ -43,29 +52,134 @@ def IJK(nx, ny, nz, i, j, k):
     value = (k*nx*ny + j*nx + i)
     return value
 
-def createGrid(inputpath, root):
+def readSubgrid(root, i, glob, pdime):
     """
-        Create the merged grid by use of an APBS input file and
-        the multiple dx files.
+        Read the dx file of one processor and check that it lines up with
+        the global grid
+
+        Parameters
+            root:    The root of the name of the dx files (string)
+            i:       The processor number (int)
+            glob:    No. of global gridpoints in each direction (list)
+            pdime:   No. of processors in each direction (list)
+        Returns
+            grid:    The grid read from the file (Vgrid)
+            mins:    The global gridpoint of the grid's lower corner (list)
+            lines:   The messages to print about the grid (list)
+    """
+    kp = int(i/(pdime[0]*pdime[1]))
+    jp = int((i - kp*pdime[0]*pdime[1])/pdime[0])
+    ip = i - kp*pdime[0]*pdime[1] - jp*pdime[0]
+    mins = [ip*glob[0]/pdime[0], jp*glob[1]/pdime[1], kp*glob[2]/pdime[2]]
+    procs = [ip, jp, kp]
+
+    filename = "%s%i.dx" % (root, i)
+    try:
+        file = open(filename)
+        file.close()
+    except IOError:
+        raise MergeError, ["Unable to find file %s!" % filename]
+
+    data = []
+    grid = Vgrid_ctor(0, 0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, data)
+    Vgrid_readDX(grid, "FILE", "ASC", "", filename)
+    grid.xmax = grid.xmin + grid.hx*(grid.nx - 1)
+    grid.ymax = grid.ymin + grid.hy*(grid.ny - 1)
+    grid.zmax = grid.zmin + grid.hzed*(grid.nz - 1)
+
+    lines = ["Reading dx file %s..." % filename,
+             "\tGrid dimensions: %i %i %i" % (grid.nx, grid.ny, grid.nz),
+             "\tGrid spacing: %.5f %.5f %.5f" % (grid.hx, grid.hy, grid.hzed),
+             "\tGrid lower corner: %.2f %.2f %.2f" % (grid.xmin, grid.ymin, grid.zmin),
+             "\tGrid upper corner: %.2f %.2f %.2f" % (grid.xmax, grid.ymax, grid.zmax),
+             "\tGlobal Gridpoint Minima: %i %i %i\n" % (mins[0], mins[1], mins[2])]
+
+    # The last processor in a given direction must end on the global
+    # boundary, and no processor may go past it
+
+    dims = [grid.nx, grid.ny, grid.nz]
+    for d in range(3):
+        if (procs[d] == (pdime[d] - 1) and glob[d] != (mins[d] + dims[d])) \
+               or glob[d] < (mins[d] + dims[d]):
+            delete_vgrid(grid)
+            raise MergeError, lines + \
+                  ["Error occurred - This grid does not line up globally!",
+                   "Global %s-dim gridpoint size:   %i" % ("xyz"[d], glob[d]),
+                   "This grid's maximum gridpoint: %i" % (mins[d] + dims[d])]
+
+    return grid, mins, lines
+
+def checkCoverage(boxes, glob):
+    """
+        Find the first global gridpoint (in i, j, k order) that is not
+        in exactly one of the boxes.  The edges of the boxes cut the
+        global grid into cells whose points are all in the same boxes,
+        so only the cells are counted, not every gridpoint.
+
+        Parameters
+            boxes:  The lower and upper (exclusive) global gridpoints of
+                    each box, as pairs of lists (list)
+            glob:   No. of global gridpoints in each direction (list)
+        Returns
+            point:  The first gridpoint not in exactly one box, or None
+                    (list)
+            count:  The number of boxes the gridpoint is in (int)
+    """
+    edges = []
+    for d in range(3):
+        cuts = {0: 1, glob[d]: 1}
+        for lower, upper in boxes:
+            cuts[lower[d]] = 1
+            cuts[upper[d]] = 1
+        cuts = cuts.keys()
+        cuts.sort()
+        edges.append(cuts)
+    counts = numpy.zeros([len(edges[d]) - 1 for d in range(3)],
+                         dtype=numpy.int32)
+    for lower, upper in boxes:
+        cell = []
+        for d in range(3):
+            cell.append(slice(edges[d].index(lower[d]),
+                              edges[d].index(upper[d])))
+        counts[tuple(cell)] += 1
+    bad = numpy.argwhere(counts != 1)
+    if len(bad) == 0:
+        return None, 1
+    cell = tuple(bad[0])
+    return [edges[d][cell[d]] for d in range(3)], counts[cell]
+
+def mergeGrid(inputpath, root, jobs=1, scratch=None):
+    """
+        Merge the multiple dx files into one array by use of an APBS
+        input file.  Each dx file is read into an array and copied into
+        its box of the global array in one slice assignment; up to jobs
+        files are read at the same time.  With scratch, the global array
+        is a NumPy (.npy) file mapped into memory rather than held in it,
+        so only the subgrids being read need to fit in memory; the file
+        can be loaded again with numpy.load(scratch, mmap_mode="r").
 
         Parameters
             inputpath: The path to the APBS input file (string)
             root:      The root of the name of the multiple dx files,
                        to be completed with <int>.dx (string)
+            jobs:      The number of files to read concurrently (int)
+            scratch:   The path of the memory-mapped global array, or
+                       None to keep it in memory (string)
         Returns
-            mygrid:    The merged grid object (Vgrid)
+            mydata:    The merged grid, indexed [i,j,k]; a Fortran order
+                       array in memory or a C order (dx order) array on
+                       disk (numpy.ndarray)
+            h:         The grid spacing in each direction (tuple)
+            origin:    The lower corner of the grid (tuple)
     """
     
     # Initialize some variables
     
-    myaccess = []
     ofrac = [0,0,0]
     pdime = [0,0,0]
     dime =  [0,0,0]
     fglen = [0,0,0]
     glob =  [0,0,0]
-    mygrid = None
-    mydata = None
 
     # Parse the input file for useful information
 
@@ -104,192 +218,164 @@ def createGrid(inputpath, root):
      
     size = pdime[0] * pdime[1] * pdime[2]
 
-    myxmin = None
-    myymin = None
-    myzmin = None
-    myhx = None
-    myhy = None
-    myhz = None
-    mydata = []
-    
-    # Read each dx file
-
-    for i in range(size):
-        mins = []
-        for j in range(3): mins.append(None)
-        kp = int(i/(pdime[0]*pdime[1]))
-        jp = int((i - kp*pdime[0]*pdime[1])/pdime[0])
-        ip = i - kp*pdime[0]*pdime[1] - jp*pdime[0]
-        mins[0] = ip*glob[0]/pdime[0]
-        mins[1] = jp*glob[1]/pdime[1]
-        mins[2] = kp*glob[2]/pdime[2]
-
-                
-        filename = "%s%i.dx" % (root, i)
-        try:
-            file = open(filename)
-            file.close()
-        except IOError:
-            print "Unable to find file %s!" % filename
-            sys.exit()
+    myhx = fglen[0]/(glob[0] - 1)
+    myhy = fglen[1]/(glob[1] - 1)
+    myhzed = fglen[2]/(glob[2] - 1)
+    if scratch == None:
+        mydata = numpy.zeros(glob, dtype=numpy.float64, order="F")
+    else:
+        mydata = numpy.lib.format.open_memmap(scratch, mode="w+",
+                                              dtype=numpy.float64,
+                                              shape=tuple(glob))
+    boxes = []
+    origin = [None]
+    errors = []
+    lock = threading.Lock()
+    todo = range(size)
+    todo.reverse()
+
+    def merge():
+        """ Read dx files off the todo list and copy them into the
+            merged grid until the list is empty or a file fails """
+        while 1:
+            lock.acquire()
+            try:
+                if errors or not todo: return
+                i = todo.pop()
+            finally:
+                lock.release()
+            try:
+                grid, mins, lines = readSubgrid(root, i, glob, pdime)
+            except MergeError, details:
+                lock.acquire()
+                errors.append(details.args[0])
+                lock.release()
+                return
+            box = (slice(mins[0], mins[0] + grid.nx),
+                   slice(mins[1], mins[1] + grid.ny),
+                   slice(mins[2], mins[2] + grid.nz))
+            lock.acquire()
+            try:
+                print string.join(lines, "\n")
+                if i == 0:
+                    origin[0] = (grid.xmin, grid.ymin, grid.zmin)
+                mydata[box] = getVgridArray(grid)
+                boxes.append(([mins[0], mins[1], mins[2]],
+                              [box[0].stop, box[1].stop, box[2].stop]))
+            finally:
+                lock.release()
+
+            # Delete this grid object
+
+            delete_vgrid(grid)
 
-        data = []
-        grid = Vgrid_ctor(0, 0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, data)
+    # Read each dx file
 
-        print "Reading dx file %s..." % filename
-        Vgrid_readDX(grid, "FILE", "ASC", "", filename)
-        grid.xmax = grid.xmin + grid.hx*(grid.nx - 1)
-        grid.ymax = grid.ymin + grid.hy*(grid.ny - 1)
-        grid.zmax = grid.zmin + grid.hzed*(grid.nz - 1)
-        
-        print "\tGrid dimensions: %i %i %i" % (grid.nx, grid.ny, grid.nz)
-        print "\tGrid spacing: %.5f %.5f %.5f" % (grid.hx, grid.hy, grid.hzed)
-        print "\tGrid lower corner: %.2f %.2f %.2f" % (grid.xmin, grid.ymin, grid.zmin)
-        print "\tGrid upper corner: %.2f %.2f %.2f" % (grid.xmax, grid.ymax, grid.zmax)
-        print "\tGlobal Gridpoint Minima: %i %i %i\n" % (mins[0], mins[1], mins[2])
-
-        # If this is the first processor, initialize the merged grid
-
-        if i == 0: # Initialize merged grid
-            myhx = fglen[0]/(glob[0] - 1)
-            myhy = fglen[1]/(glob[1] - 1)
-            myhzed = fglen[2]/(glob[2] - 1)
-            myxmin = grid.xmin
-            myymin = grid.ymin
-            myzmin = grid.zmin         
-            for j in range(glob[0]*glob[1]*glob[2]):
-                mydata.append(0.0)
-                myaccess.append(0)
-
-        # If this processor is the last in a given direction, do a sanity check
-
-        if ip == (pdime[0] - 1):
-            if glob[0] != (mins[0] + grid.nx):
-                print "Error occurred - This grid does not line up globally!"
-                print "Global x-dim gridpoint size:   %i" % glob[0]
-                print "This grid's maximum gridpoint: %i" % (mins[0] + grid.nx)
-                sys.exit()
-        if jp == (pdime[1] - 1):
-            if glob[1] != (mins[1] + grid.ny):
-                print "Error occurred - This grid does not line up globally!"
-                print "Global x-dim gridpoint size:   %i" % glob[1]
-                print "This grid's maximum gridpoint: %i" % (mins[1] + grid.ny)
-                sys.exit()
-        if kp == (pdime[2] - 1):
-            if glob[2] != (mins[2] + grid.nz):
-                print "Error occurred - This grid does not line up globally!"
-                print "Global x-dim gridpoint size:   %i" % glob[2]
-                print "This grid's maximum gridpoint: %i" % (mins[2] + grid.nz)
-                sys.exit()
-           
-        # Now add this grid to the merged grid
-   
-        for x in range(grid.nx):
-            ival = grid.xmin + x*grid.hx
-            for y in range(grid.ny):
-                jval = grid.ymin + y*grid.hy
-                for z in range(grid.nz):
-                    kval = grid.zmin + z*grid.hzed
-                    inval = 0.0
-                    pt = [ival, jval, kval]
-                    ret, value = Vgrid_value(grid, pt, inval)
-                    if ret:
-                        location = IJK(glob[0], glob[1], glob[2], (x+mins[0]), (y+mins[1]), (z+mins[2]))
-                        myaccess[location] += 1
-                        mydata[location] = value
-                    else:
-                        print ival, jval, kval
-                        print "Could not find gridpoint %i %i %i in grid %s!" % (x,y,z, filename)
-                        sys.exit()
-
-        # Delete this grid object
-
-        delete_vgrid(grid)
+    workers = []
+    for j in range(min(jobs, size) - 1):
+        worker = threading.Thread(target=merge)
+        worker.start()
+        workers.append(worker)
+    merge()
+    for worker in workers:
+        worker.join()
+    if errors:
+        print string.join(errors[0], "\n")
+        sys.exit()
 
     # Make sure all values of the grid were accessed
 
     print "Ensuring all grid points were merged..."
-    for i in range(glob[0]):
-        for j in range(glob[1]):
-            for k in range(glob[2]):
-                location = IJK(glob[0], glob[1], glob[2], i, j, k)
-                if myaccess[location] == 0:
-                    print "Error: Found unaccessed gridpoint at %i %i %i!" % (i,j,k)
-                    sys.exit()
-                elif myaccess[location] > 1: #Pt. on multiple grids: Error!                    
-                    print "Error: Multiple grids attempted to access gridpoint %i %i %i in the global grid!" % (i,j,k)
-                    sys.exit()
+    point, count = checkCoverage(boxes, glob)
+    if point != None:
+        i, j, k = point
+        if count == 0:
+            print "Error: Found unaccessed gridpoint at %i %i %i!" % (i,j,k)
+        else: #Pt. on multiple grids: Error!
+            print "Error: Multiple grids attempted to access gridpoint %i %i %i in the global grid!" % (i,j,k)
+        sys.exit()
 
-                
-    # Make the grid
-    
-    mygrid = Vgrid_ctor(glob[0], glob[1], glob[2], myhx, myhy, myhzed,
-                        myxmin, myymin, myzmin, mydata)
+    if scratch != None:
+        mydata.flush()
+    return mydata, (myhx, myhy, myhzed), origin[0]
+
+def createGrid(inputpath, root, jobs=1):
+    """
+        Create the merged grid by use of an APBS input file and
+        the multiple dx files (see mergeGrid).
 
-    return mygrid
+        Parameters
+            inputpath: The path to the APBS input file (string)
+            root:      The root of the name of the multiple dx files,
+                       to be completed with <int>.dx (string)
+            jobs:      The number of files to read concurrently (int)
+        Returns
+            mygrid:    The merged grid object (Vgrid)
+    """
+    mydata, h, origin = mergeGrid(inputpath, root, jobs)
+    return makeVgrid(mydata, h, origin)
                 
-def resampleGrid(grid, nx, ny, nz):
+def resampleData(mydata, h, origin, nx, ny, nz, method="linear", jobs=1):
     """
-        Resample the grid to a smaller (less-defined) resolution
+        Resample a merged array to a smaller (less-defined) resolution
+        spanning the same box
 
         Parameters
-            grid:   The merged grid (Vgrid)
-            nx:     The number of gridpoints in the x dir (int)
-            nx:     The number of gridpoints in the x dir (int)
+            mydata: The merged grid, indexed [i,j,k] (numpy.ndarray)
+            h:      The grid spacing in each direction (tuple)
+            origin: The lower corner of the grid (tuple)
             nx:     The number of gridpoints in the x dir (int)
+            ny:     The number of gridpoints in the y dir (int)
+            nz:     The number of gridpoints in the z dir (int)
+            method: "linear" or "spl2" (see resampleArray) (string)
+            jobs:   The number of threads to resample with (int)
 
-        Retrurns
-            newgrid: The resampleed merged grid (Vgrid)
+        Returns
+            newdata: The resampled array, in Fortran order (numpy.ndarray)
+            newh:    The new grid spacing (tuple)
     """
 
     print "Resampling the grid..."
     
     # Ensure that the new grid size is smaller than the old grid size
     
-    if (nx > grid.nx or ny > grid.ny or nz > grid.nz):
+    if (nx > mydata.shape[0] or ny > mydata.shape[1] or nz > mydata.shape[2]):
         print "Error: User specified grid size (%i %i %i) is larger than " % (nx, ny, nz)
-        print "merged grid size (%i %i %i)!" % (grid.nx, grid.ny, grid.nz)
+        print "merged grid size (%i %i %i)!" % mydata.shape
         sys.exit()
 
-    # Get new grid spacing, and create initialized grid
-    
-    xmin = grid.xmin
-    ymin = grid.ymin
-    zmin = grid.zmin  
-    xmax = grid.xmin + grid.hx*(grid.nx - 1)
-    ymax = grid.ymin + grid.hy*(grid.ny - 1)
-    zmax = grid.zmin + grid.hzed*(grid.nz - 1)
-    hxnew = (xmax - xmin)/(nx - 1)
-    hynew = (ymax - ymin)/(ny - 1)
-    hznew = (zmax - zmin)/(nz - 1)
-    mydata = []
-    for i in range(nx*ny*nz): mydata.append(0.0)
-    
     # Populate the new grid
 
-    for x in range(nx):
-        ival = xmin + x*hxnew
-        for y in range(ny):
-            jval = ymin + y*hynew
-            for z in range(nz):
-                kval = zmin + z*hznew
-                pt = [ival, jval, kval]
-                inval = 0.0
-                ret, value = Vgrid_value(grid, pt, inval)
-                if ret:
-                    location = IJK(nx, ny, nz, x,y,z)
-                    if (value < VSMALL and value > 0): value = 0.0
-                    mydata[location] = value
-                else:
-                    print "Could not find gridpoint %i %i %i in grid %s!" % (x,y,z, filename)
-                    sys.exit()
+    newdata, newh = resampleArray(mydata, h, origin, (nx, ny, nz),
+                                  method=method, jobs=jobs)
+    newdata[(newdata < VSMALL) & (newdata > 0)] = 0.0
+    return newdata, newh
+
+def resampleGrid(grid, nx, ny, nz, method="linear", jobs=1):
+    """
+        Resample the grid to a smaller (less-defined) resolution
+
+        Parameters
+            grid:   The merged grid (Vgrid)
+            nx:     The number of gridpoints in the x dir (int)
+            ny:     The number of gridpoints in the y dir (int)
+            nz:     The number of gridpoints in the z dir (int)
+            method: "linear" or "spl2" (see resampleArray) (string)
+            jobs:   The number of threads to resample with (int)
+
+        Returns
+            newgrid: The resampled merged grid (Vgrid)
+    """
+    origin = (grid.xmin, grid.ymin, grid.zmin)
+    newdata, newh = resampleData(getVgridArray(grid),
+                                 (grid.hx, grid.hy, grid.hzed), origin,
+                                 nx, ny, nz, method, jobs)
 
     # Delete the old grid
     delete_vgrid(grid)
 
     # Make the new grid
-    newgrid = Vgrid_ctor(nx, ny, nz, hxnew, hynew, hznew,
-                         xmin, ymin, zmin, mydata)
+    newgrid = makeVgrid(newdata, newh, origin)
     return newgrid
 
 def printGrid(mygrid, outpath):
@@ -303,6 +389,21 @@ def printGrid(mygrid, outpath):
     print "Writing output to %s..." % outpath
     title = "Merged Grid from mergedx.py"
     Vgrid_writeDX(mygrid, "FILE", "ASC", "", outpath,title, null_array());
+
+def printArray(mydata, h, origin, outpath):
+    """
+        Print a merged array in the format of printGrid, reading it in
+        dx order so that a memory-mapped array is streamed from disk
+
+        Parameters
+            mydata:  The merged grid, indexed [i,j,k] (numpy.ndarray)
+            h:       The grid spacing in each direction (tuple)
+            origin:  The lower corner of the grid (tuple)
+            outpath: The output path for the new .dx file (string)
+    """
+    print "Writing output to %s..." % outpath
+    title = "Merged Grid from mergedx.py"
+    writeDXArray(mydata, h, origin, outpath, title)
    
 def usage():
     """
@@ -335,6 +436,11 @@ def usage():
     str = str + "        --ny=<ysize>   : Resample to the <ysize> gridpoints in the z direction\n"
     str = str + "        --nz=<zsize>   : Resample to the <zsize> gridpoints in the z direction\n"
     str = str + "                         Note: If resampling, nx, ny, and nz all must be specified.\n"
+    str = str + "        --method=<m>   : Resample by linear (default) or spl2 interpolation\n"
+    str = str + "        --jobs=<n>     : Read up to <n> dx files at the same time, and\n"
+    str = str + "                         resample with <n> threads\n"
+    str = str + "        --scratch=<path>: Merge into a memory-mapped NumPy file <path>\n"
+    str = str + "                         instead of memory, for grids larger than memory\n"
     str = str + "\n"
     sys.stderr.write(str)
     sys.exit()
@@ -344,7 +450,7 @@ def main():
         The main driver for the mergedx script
     """
     shortOptlist = "h"
-    longOptlist = ["help","out=","nx=","ny=","nz="]
+    longOptlist = ["help","out=","nx=","ny=","nz=","method=","jobs=","scratch="]
     try: opts, args = getopt.getopt(sys.argv[1:], shortOptlist, longOptlist)
     except getopt.GetoptError, details:
         sys.stderr.write("GetoptError:  %s\n" % details)
@@ -354,6 +460,9 @@ def main():
     nx = None
     ny = None
     nz = None
+    method = "linear"
+    jobs = 1
+    scratch = None
     resample = 0
     for o,a in opts:
         if o in ("-h","--help"):
@@ -367,6 +476,18 @@ def main():
             ny = int(a)
         elif o == "--nz":
             nz = int(a)
+        elif o == "--method":
+            method = a
+            if method not in RESAMPLEMETHODS.keys():
+                print "\nUnknown resampling method %s!" % method
+                usage()
+        elif o == "--jobs":
+            jobs = int(a)
+            if jobs < 1:
+                print "\n--jobs must be a positive integer!"
+                usage()
+        elif o == "--scratch":
+            scratch = a
  
     if (nx != None and ny != None and nz != None):
         resample = 1
@@ -377,13 +498,9 @@ def main():
         usage()
         sys.exit()
             
-    argid = 1
-    if outpath != OUT: argid += 1
-    if resample == 1: argid += 3
-
     try:
-        inputpath = sys.argv[argid]
-        root = sys.argv[argid + 1]
+        inputpath = args[0]
+        root = args[1]
     except IndexError:
         print "\nImproper number of arguments!"
         usage()
@@ -391,9 +508,17 @@ def main():
         
     startVio()
 
-    mygrid = createGrid(inputpath, root)
+    if scratch != None:
+        mydata, h, origin = mergeGrid(inputpath, root, jobs, scratch)
+        if resample:
+            mydata, h = resampleData(mydata, h, origin, nx, ny, nz,
+                                     method, jobs)
+        printArray(mydata, h, origin, outpath)
+        return
+
+    mygrid = createGrid(inputpath, root, jobs)
     if resample:
-        mygrid = resampleGrid(mygrid,nx,ny,nz)
+        mygrid = resampleGrid(mygrid,nx,ny,nz,method,jobs)
     printGrid(mygrid, outpath)
 
     # If we're outputting back to stdout, delete the grid
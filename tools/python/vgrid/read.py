@@ -1,5 +1,6 @@
 from vgrid import *
 import sys
+import numpy
 from sys import stdout, stderr
 
 """
@@ -55,29 +56,24 @@ def main():
 
     stdout.write("main:  Moving along x-axis...\n")
 
+    pts = numpy.zeros((nx, 3))
+    pts[:,0] = xmin + numpy.arange(nx)*hx
+    pts[:,1] = ymin + 0.5*(ny-1)*hy
+    pts[:,2] = zmin + 0.5*(nz-1)*hzed
+    values, mask = Vgrid_valueArray(grid, pts)
     for i in range(nx):
-        inval = 0.0
-        pt = [xmin + i*hx, ymin + 0.5*(ny-1)*hy, zmin + 0.5*(nz-1)*hzed]
-        ret, value = Vgrid_value(grid, pt, inval)
-        if ret:
-            stdout.write("main: u(%g, %g, %g) = %g\n" % (pt[0], pt[1], pt[2], value))
+        if mask[i]:
+            pt = pts[i]
+            stdout.write("main: u(%g, %g, %g) = %g\n" % (pt[0], pt[1], pt[2], values[i]))
 
     # Integrate
 
     stdout.write("main:  Integrating...\n")
-    sum = 0
-    for i in range(nx):
-        for j in range(ny):
-            for k in range(nz):
-                inval = 0.0
-                pt = [xmin + i*hx, ymin + j*hy, zmin + k*hzed]
-                ret, value = Vgrid_value(grid, pt, inval)
-                if ret:
-                    sum = sum + value
+    sum = getVgridArray(grid).sum()
     
     stdout.write("main:  Integral over grid = %1.12E\n" % (sum*hx*hy*hzed))
 
-    grad = [0.0,0.0,0.0]
-    Vgrid_gradient(grid, pt, grad)
+    pt = [xmin + (nx-1)*hx, ymin + (ny-1)*hy, zmin + (nz-1)*hzed]
+    grads, mask = Vgrid_gradientArray(grid, [pt])
 
 if __name__ == "__main__": main()
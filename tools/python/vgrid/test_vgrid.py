@@ -0,0 +1,366 @@
+""" Tests for vgrid.py and mergedx.py
+
+    Run from the build tree, after make has built _vgrid.so:
+
+        python test_vgrid.py
+"""
+
+import unittest, os, sys, shutil, tempfile
+from cStringIO import StringIO
+import numpy
+from vgrid import *
+import mergedx, gridconvert
+
+INPUT = """
+read
+    mol pqr ion.pqr
+end
+elec name solv
+    mg-para
+    ofrac 0.1
+    pdime %i %i %i
+    dime 33 33 33
+    fglen 16 16 16
+    lpbe
+end
+quit
+"""
+
+def makeArray(shape, seed=1):
+    """ Random values that an OpenDX file holds exactly """
+    random = numpy.random.RandomState(seed)
+    return random.randint(-1000, 1000, shape)/8.0
+
+def linear(shape, h, origin):
+    """ The linear function 1 + 2x - y + z/2 on a grid """
+    x, y, z = [origin[d] + h[d]*numpy.arange(shape[d]) for d in range(3)]
+    return 1.0 + 2.0*x[:,None,None] - y[None,:,None] + 0.5*z[None,None,:]
+
+def quietly(function, *args, **kwargs):
+    """ Call function without printing to stdout """
+    saved = sys.stdout
+    sys.stdout = StringIO()
+    try:
+        return function(*args, **kwargs)
+    finally:
+        sys.stdout = saved
+
+class MergeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.root = self.path("pot-PE")
+        self.input = self.path("para.in")
+        # With ofrac 0.1, each of two processors along x owns 28 of the 56
+        # global points; one processor spans y and z
+        self.glob = (56, 33, 33)
+        self.h = (16.0/55, 0.5, 0.5)
+        self.origin = (-8.0, -8.0, -8.0)
+        self.array = makeArray(self.glob)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def split(self, pdime, sizes=None):
+        """ Write the input file and the dx file of each processor of
+            pdime, each owning sizes[d] points along axis d """
+        open(self.input, "w").write(INPUT % tuple(pdime))
+        if sizes == None:
+            sizes = [self.glob[d]/pdime[d] for d in range(3)]
+        for i in range(pdime[0]*pdime[1]*pdime[2]):
+            procs = [i % pdime[0], (i/pdime[0]) % pdime[1],
+                     i/(pdime[0]*pdime[1])]
+            mins = [procs[d]*sizes[d] for d in range(3)]
+            box = tuple([slice(mins[d], mins[d] + sizes[d]) for d in range(3)])
+            origin = [self.origin[d] + mins[d]*self.h[d] for d in range(3)]
+            writeDXArray(self.array[box], self.h, origin,
+                         "%s%i.dx" % (self.root, i), "POTENTIAL")
+
+    def testMerge(self):
+        """ Two subgrids merge into the global grid, read serially or
+            concurrently """
+        self.split([2, 1, 1])
+        data, h, origin = quietly(mergedx.mergeGrid, self.input, self.root)
+        self.assertEqual(data.shape, self.glob)
+        self.assert_(numpy.all(data == self.array))
+        for d in range(3):
+            self.assertAlmostEqual(h[d], self.h[d], 6)
+            self.assertAlmostEqual(origin[d], self.origin[d], 6)
+        threaded = quietly(mergedx.mergeGrid, self.input, self.root, jobs=2)[0]
+        self.assert_(numpy.all(threaded == data))
+
+    def testGrid(self):
+        """ createGrid holds the merged values as a Vgrid """
+        self.split([2, 1, 1])
+        grid = quietly(mergedx.createGrid, self.input, self.root, 2)
+        try:
+            self.assertEqual((grid.nx, grid.ny, grid.nz), self.glob)
+            self.assert_(numpy.all(getVgridArray(grid) == self.array))
+        finally:
+            delete_vgrid(grid)
+
+    def testErrors(self):
+        """ A missing subgrid or one that does not line up is refused """
+        self.split([2, 1, 1])
+        os.remove("%s1.dx" % self.root)
+        self.assertRaises(SystemExit, quietly, mergedx.mergeGrid,
+                          self.input, self.root)
+        self.split([2, 1, 1], [27, 33, 33])
+        self.assertRaises(SystemExit, quietly, mergedx.mergeGrid,
+                          self.input, self.root)
+
+    def testScratch(self):
+        """ A merge into a scratch file gives the in-memory merge, on disk
+            and in the dx file written from it """
+        self.split([2, 1, 1])
+        data = quietly(mergedx.mergeGrid, self.input, self.root)[0]
+        scratch = self.path("scratch.npy")
+        mapped, h, origin = quietly(mergedx.mergeGrid, self.input,
+                                    self.root, 2, scratch)
+        self.assert_(isinstance(mapped, numpy.memmap))
+        self.assert_(numpy.all(mapped == data))
+        self.assert_(numpy.all(numpy.load(scratch, mmap_mode="r") == data))
+        grid = quietly(mergedx.createGrid, self.input, self.root)
+        try:
+            quietly(mergedx.printGrid, grid, self.path("memory.dx"))
+        finally:
+            delete_vgrid(grid)
+        quietly(mergedx.printArray, mapped, h, origin, self.path("disk.dx"))
+        self.assertEqual(open(self.path("disk.dx")).read(),
+                         open(self.path("memory.dx")).read())
+
+class ResampleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.h = (0.25, 0.5, 0.5)
+        self.origin = (-4.0, -8.0, -2.0)
+        self.shape = (33, 17, 9)
+        self.array = linear(self.shape, self.h, self.origin)
+
+    def testLinear(self):
+        """ Trilinear resampling reproduces a linear function and the
+            values of Vgrid_value, on the same box or inside it """
+        out, h = resampleArray(self.array, self.h, self.origin, (9, 5, 3))
+        self.assertEqual(out.shape, (9, 5, 3))
+        self.assertEqual(h, (1.0, 2.0, 2.0))
+        self.assert_(numpy.allclose(out, linear((9, 5, 3), h, self.origin),
+                                    rtol=0.0, atol=1e-12))
+        neworigin = (-3.3, -7.1, -1.9)
+        out, h = resampleArray(self.array, self.h, self.origin, (7, 5, 4),
+                               newh=(0.7, 1.3, 0.6), neworigin=neworigin)
+        self.assertEqual(h, (0.7, 1.3, 0.6))
+        grid = makeVgrid(self.array, self.h, self.origin)
+        try:
+            for i, j, k in [(0, 0, 0), (6, 4, 3), (3, 2, 1)]:
+                point = [neworigin[0] + i*h[0], neworigin[1] + j*h[1],
+                         neworigin[2] + k*h[2]]
+                ok, value = Vgrid_value(grid, point, 0.0)
+                self.assertEqual(ok, 1)
+                self.assertAlmostEqual(out[i,j,k], value, 12)
+        finally:
+            delete_vgrid(grid)
+
+    def testSplines(self):
+        """ spl2 smoothing keeps a constant and smooths a spike """
+        out = resampleArray(numpy.ones(self.shape), self.h, self.origin,
+                            (9, 5, 3), method="spl2")[0]
+        self.assert_(numpy.allclose(out, 1.0, rtol=0.0, atol=1e-12))
+        spike = numpy.zeros(self.shape)
+        spike[16,8,4] = 1.0
+        linearSpike = resampleArray(spike, self.h, self.origin, (9, 5, 3))[0]
+        splineSpike = resampleArray(spike, self.h, self.origin, (9, 5, 3),
+                                    method="spl2")[0]
+        self.assertEqual(linearSpike[4,2,1], 1.0)
+        self.assert_(0.0 < splineSpike[4,2,1] < 1.0)
+
+    def testJobs(self):
+        """ Threads and stacks give the values of a serial resample of
+            each grid """
+        single = resampleArray(self.array, self.h, self.origin, (9, 5, 3),
+                               method="spl2")[0]
+        threaded = resampleArray(self.array, self.h, self.origin, (9, 5, 3),
+                                 method="spl2", jobs=4)[0]
+        self.assert_(numpy.all(threaded == single))
+        stack = numpy.array([self.array, 2.0*self.array])
+        out = resampleArray(stack, self.h, self.origin, (9, 5, 3),
+                            method="spl2", jobs=3)[0]
+        self.assertEqual(out.shape, (2, 9, 5, 3))
+        self.assert_(numpy.all(out[0] == single))
+        self.assert_(numpy.allclose(out[1], 2.0*single, rtol=1e-14, atol=0.0))
+
+    def testErrors(self):
+        """ Lattices outside the grid, unknown methods and larger merged
+            grids are refused """
+        self.assertRaises(ValueError, resampleArray, self.array, self.h,
+                          self.origin, (9, 5, 3), neworigin=(-5.0, -8.0, -2.0))
+        self.assertRaises(ValueError, resampleArray, self.array, self.h,
+                          self.origin, (9, 5, 3), method="cubic")
+        self.assertRaises(ValueError, resampleArray, self.array[0], self.h,
+                          self.origin, (9, 5, 3))
+        self.assertRaises(SystemExit, quietly, mergedx.resampleData,
+                          self.array, self.h, self.origin, 65, 17, 9)
+
+    def testResampleGrid(self):
+        """ resampleGrid replaces a Vgrid by its resampled copy """
+        grid = makeVgrid(self.array, self.h, self.origin)
+        newgrid = quietly(mergedx.resampleGrid, grid, 17, 9, 5)
+        try:
+            self.assertEqual((newgrid.nx, newgrid.ny, newgrid.nz), (17, 9, 5))
+            self.assertEqual((newgrid.hx, newgrid.hy, newgrid.hzed),
+                             (0.5, 1.0, 1.0))
+            expected = linear((17, 9, 5), (0.5, 1.0, 1.0), self.origin)
+            self.assert_(numpy.allclose(getVgridArray(newgrid), expected,
+                                        rtol=0.0, atol=1e-12))
+        finally:
+            delete_vgrid(newgrid)
+
+class QueryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.h = (0.25, 0.5, 0.5)
+        self.origin = (-4.0, -8.0, -2.0)
+        self.array = linear((33, 17, 9), self.h, self.origin)
+        self.grid = makeVgrid(self.array, self.h, self.origin)
+        random = numpy.random.RandomState(2)
+        # Points inside the grid, and some past its upper corner
+        self.points = random.uniform([-4.0, -8.0, -2.0], [4.0, 0.0, 2.0],
+                                     (200, 3))
+        self.points[::10] += [9.0, 0.0, 0.0]
+
+    def tearDown(self):
+        delete_vgrid(self.grid)
+
+    def testValues(self):
+        """ Each value and mask entry is what Vgrid_value gives """
+        values, mask = Vgrid_valueArray(self.grid, self.points)
+        self.assertEqual((values.shape, mask.shape), ((200,), (200,)))
+        for i in range(len(self.points)):
+            ok, value = Vgrid_value(self.grid, list(self.points[i]), 0.0)
+            self.assertEqual(mask[i], ok == 1)
+            self.assertEqual(values[i], value)
+        self.assertEqual(numpy.sum(mask), 180)
+        self.assert_(numpy.all(values[~mask] == 0.0))
+
+    def testDerivatives(self):
+        """ A linear function has a constant gradient and no curvature """
+        grads, mask = Vgrid_gradientArray(self.grid, self.points)
+        self.assertEqual(grads.shape, (200, 3))
+        self.assertEqual(numpy.sum(mask), 180)
+        self.assert_(numpy.all(grads[~mask] == 0.0))
+        # Differences are one-sided within a spacing of the faces
+        lower = numpy.array(self.origin) + 2.0*numpy.array(self.h)
+        upper = numpy.array([4.0, 0.0, 2.0]) - 2.0*numpy.array(self.h)
+        inside = numpy.all((self.points > lower) & (self.points < upper), 1)
+        self.assert_(numpy.sum(inside) > 50)
+        self.assert_(numpy.allclose(grads[inside], [2.0, -1.0, 0.5],
+                                    rtol=0.0, atol=1e-9))
+        for cflag in [0, 1]:
+            curvs = Vgrid_curvatureArray(self.grid, self.points, cflag)[0]
+            self.assert_(numpy.allclose(curvs[inside], 0.0, rtol=0.0,
+                                        atol=1e-9))
+        self.assertRaises(ValueError, Vgrid_curvatureArray, self.grid,
+                          self.points, 2)
+
+    def testJobs(self):
+        """ Threads give the values of a serial query; bad point arrays
+            are refused """
+        for query in [Vgrid_valueArray, Vgrid_gradientArray,
+                      Vgrid_curvatureArray]:
+            values, mask = query(self.grid, self.points)
+            threaded, threadedMask = query(self.grid, self.points, jobs=4)
+            self.assert_(numpy.all(threaded == values))
+            self.assert_(numpy.all(threadedMask == mask))
+        values, mask = Vgrid_valueArray(self.grid, numpy.zeros((0, 3)))
+        self.assertEqual(len(values), 0)
+        self.assertRaises(ValueError, Vgrid_valueArray, self.grid,
+                          self.points[:,0:2])
+
+class BinTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.h = (0.25, 0.5, 0.75)
+        self.origin = (-4.0, -8.0, -2.0)
+        self.array = numpy.random.RandomState(3).normal(0.0, 10.0, (9, 7, 5))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def testRoundTrip(self):
+        """ Doubles round trip exactly, floats to single precision, and
+            compressed files give the uncompressed values """
+        path = self.path("pot.bin")
+        for size, compress in [(8, 0), (4, 0), (8, 1), (4, 1)]:
+            writeBinArray(self.array, self.h, self.origin, path, "POTENTIAL",
+                          size, compress)
+            array, h, origin, title = readBinArray(path)
+            self.assertEqual((h, origin, title),
+                             (self.h, self.origin, "POTENTIAL"))
+            self.assertEqual(array.shape, self.array.shape)
+            self.assertEqual(isinstance(array, numpy.memmap), not compress)
+            expected = self.array.astype("f%d" % size)
+            self.assert_(numpy.all(array == expected))
+            del array
+        writeBinArray(self.array, self.h, self.origin, path, "POTENTIAL")
+        array = readBinArray(path, mmap=0)[0]
+        self.assert_(not isinstance(array, numpy.memmap))
+        self.assert_(numpy.all(array == self.array))
+        self.assertRaises(ValueError, writeBinArray, self.array, self.h,
+                          self.origin, path, "POTENTIAL", 2)
+
+    def testConvert(self):
+        """ Files written by Vgrid_writeBIN read back with readBinArray, and
+            files written by writeBinArray read back with Vgrid_readBIN """
+        dx = self.path("pot.dx")
+        values = makeArray(self.array.shape)
+        writeDXArray(values, self.h, self.origin, dx, "POTENTIAL")
+        for size, compress in [(8, 0), (4, 1)]:
+            path = self.path("pot%i%i.bin" % (size, compress))
+            delete_vgrid(gridconvert.convertGrid(dx, path, size, compress,
+                                                 "Converted"))
+            array, h, origin, title = readBinArray(path)
+            self.assert_(numpy.all(array == values))
+            self.assertEqual(title, "Converted")
+            for d in range(3):
+                self.assertAlmostEqual(h[d], self.h[d], 12)
+                self.assertAlmostEqual(origin[d], self.origin[d], 12)
+            del array
+        python = self.path("python.bin")
+        writeBinArray(values, self.h, self.origin, python, "POTENTIAL",
+                      compress=1)
+        grid = gridconvert.convertGrid(python, self.path("back.dx"))
+        try:
+            self.assertEqual((grid.nx, grid.ny, grid.nz), values.shape)
+            self.assert_(numpy.all(getVgridArray(grid) == values))
+        finally:
+            delete_vgrid(grid)
+        self.assertEqual(gridconvert.getFormat(dx), "dx")
+        self.assertEqual(gridconvert.getFormat(python), "bin")
+        self.assertEqual(gridconvert.getFormat(self.path("pot.txt")), None)
+
+    def testErrors(self):
+        """ Files that are not grids, or are cut short, are refused """
+        path = self.path("pot.bin")
+        open(path, "wb").write("NOTAGRID" + "\0"*200)
+        self.assertRaises(IOError, readBinArray, path)
+        self.assertRaises(IOError, quietly, gridconvert.convertGrid, path,
+                          self.path("pot.dx"))
+        writeBinArray(self.array, self.h, self.origin, path, "POTENTIAL",
+                      compress=1)
+        data = open(path, "rb").read()
+        open(path, "wb").write(data[:BINHEADER + 8])
+        self.assertRaises(IOError, readBinArray, path)
+        writeBinArray(self.array, self.h, self.origin, path, "POTENTIAL")
+        data = open(path, "rb").read()
+        open(path, "wb").write(data[:-8])
+        self.assertRaises(IOError, readBinArray, path, 0)
+
+if __name__ == "__main__":
+    startVio()
+    unittest.main()
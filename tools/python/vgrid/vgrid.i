@@ -1,18 +1,39 @@
 /* Input file for creating Python wrappers for Vgrid via swig
    Author: Todd Dolinsky
    Email: todd@ccb.wustl.edu
+   To generate a new vgrid wrapper file ("make wrappers"; see apbslib.i for
+   the flags), and commit vgrid.py and vgridlib.c with the change:
+        swig -python -builtin -O -module vgrid -o vgridlib.c vgrid.i
  
 Header files:
 -----------------------
 */ 
 
 %{
+#include "apbscfg.h"
 #include "routines.h"
 #include "apbs/vgrid.h"
+#include <string.h>
 %}
 
 #define VEXTERNC extern
 
+/* Release the GIL while grids are read and written (see apbslib.i) */
+
+%define RELEASEGIL(function)
+%exception function {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+}
+%enddef
+
+RELEASEGIL(Vgrid_readDX)
+RELEASEGIL(Vgrid_writeDX)
+RELEASEGIL(Vgrid_writeUHBD)
+RELEASEGIL(Vgrid_writeBIN)
+RELEASEGIL(Vgrid_readBIN)
+
 // Generic array of doubles:
 
 %inline %{
@@ -39,12 +60,351 @@ typedef struct {
 %inline %{
 void delete_vgrid(Vgrid *thee){
     if (thee != VNULL) {
-        Vmem_free(thee->mem, (thee->nx*thee->ny*thee->nz), sizeof(double),
-          (void **)&(thee->data));
+        /* A grid whose file could not be read has no data */
+        if (thee->data != VNULL) {
+            Vmem_free(thee->mem, (thee->nx*thee->ny*thee->nz),
+              sizeof(double), (void **)&(thee->data));
+        }
         Vmem_free(VNULL, 1, sizeof(Vgrid), (void **)&thee);
         thee = VNULL;
     }
 }
+
+/* Return a read-write buffer over the data of a Vgrid (nx*ny*nz doubles,
+   x varying fastest); it is only valid until the Vgrid is destroyed */
+PyObject *getVgridBuffer(Vgrid *thee){
+    VASSERT(thee != VNULL);
+    if (!(thee->ctordata || thee->readdata)) {
+        PyErr_SetString(PyExc_ValueError, "no data in this Vgrid");
+        return NULL;
+    }
+    return PyBuffer_FromReadWriteMemory((void *)thee->data,
+      (Py_ssize_t)(thee->nx*thee->ny*thee->nz*sizeof(double)));
+}
+
+/* Construct a Vgrid holding a copy of a buffer of nx*ny*nz doubles (a
+   NumPy array in Fortran order, for example); returns NULL if the buffer
+   is the wrong size.  Free it with delete_vgrid */
+Vgrid *Vgrid_ctorBuffer(int nx, int ny, int nz, double hx, double hy,
+  double hzed, double xmin, double ymin, double zmin, PyObject *buffer){
+    const void *ptr;
+    Py_ssize_t len;
+    Vgrid *thee;
+
+    if (PyObject_AsReadBuffer(buffer, &ptr, &len) != 0) {
+        PyErr_Clear();
+        return VNULL;
+    }
+    if ((nx < 1) || (ny < 1) || (nz < 1) ||
+      (len != (Py_ssize_t)(nx*ny*nz*sizeof(double)))) return VNULL;
+    thee = Vgrid_ctor(nx, ny, nz, hx, hy, hzed, xmin, ymin, zmin, VNULL);
+    thee->data = Vmem_malloc(thee->mem, nx*ny*nz, sizeof(double));
+    VASSERT(thee->data != VNULL);
+    memcpy(thee->data, ptr, len);
+    thee->readdata = 1;
+    return thee;
+}
+
+/* Write a buffer of nx*ny*nz doubles stored in DX order (z varying
+   fastest: a C order NumPy array indexed [i,j,k]) to an OpenDX file, in
+   the same format as Vgrid_writeDX.  The buffer is read front to back,
+   so a memory-mapped array is streamed from disk rather than held in
+   memory; returns 1 on success and 0 on failure */
+int writeDXBuffer(const char *fname, char *title, int nx, int ny, int nz,
+  double hx, double hy, double hzed, double xmin, double ymin, double zmin,
+  PyObject *buffer){
+    const void *ptr;
+    const double *data;
+    Py_ssize_t len, u, count;
+    char prec[VMAX_BUFSIZE];
+    int icol, ok;
+    Vio *sock;
+
+    if (PyObject_AsReadBuffer(buffer, &ptr, &len) != 0) {
+        PyErr_Clear();
+        return 0;
+    }
+    count = (Py_ssize_t)nx*ny*nz;
+    if (len != (Py_ssize_t)(count*sizeof(double))) return 0;
+    data = (const double *)ptr;
+    sprintf(prec, "%%12.%de %%12.%de %%12.%de", VGRID_DIGITS, VGRID_DIGITS,
+      VGRID_DIGITS);
+
+    ok = 0;
+    Py_BEGIN_ALLOW_THREADS
+    sock = Vio_ctor("FILE", "ASC", "", fname, "w");
+    if ((sock != VNULL) && (Vio_connect(sock, 0) >= 0)) {
+        Vio_printf(sock, "# Data from %s\n", PACKAGE_STRING);
+        Vio_printf(sock, "# \n");
+        Vio_printf(sock, "# %s\n", title);
+        Vio_printf(sock, "# \n");
+        Vio_printf(sock, "object 1 class gridpositions counts %d %d %d\n",
+          nx, ny, nz);
+        Vio_printf(sock, "origin ");
+        Vio_printf(sock, prec, xmin, ymin, zmin);
+        Vio_printf(sock, "\ndelta ");
+        Vio_printf(sock, prec, hx, 0.0, 0.0);
+        Vio_printf(sock, "\ndelta ");
+        Vio_printf(sock, prec, 0.0, hy, 0.0);
+        Vio_printf(sock, "\ndelta ");
+        Vio_printf(sock, prec, 0.0, 0.0, hzed);
+        Vio_printf(sock, "\nobject 2 class gridconnections counts %d %d %d\n",
+          nx, ny, nz);
+        Vio_printf(sock, "object 3 class array type double rank 0 items %d \
+data follows\n", (nx*ny*nz));
+        icol = 0;
+        for (u=0; u<count; u++) {
+            Vio_printf(sock, "%12.6e ", data[u]);
+            icol++;
+            if (icol == 3) {
+                icol = 0;
+                Vio_printf(sock, "\n");
+            }
+        }
+        if (icol != 0) Vio_printf(sock, "\n");
+        Vio_printf(sock, "attribute \"dep\" string \"positions\"\n");
+        Vio_printf(sock, "object \"regular positions regular connections\" \
+class field\n");
+        Vio_printf(sock, "component \"positions\" value 1\n");
+        Vio_printf(sock, "component \"connections\" value 2\n");
+        Vio_printf(sock, "component \"data\" value 3\n");
+        Vio_connectFree(sock);
+        ok = 1;
+    }
+    if (sock != VNULL) Vio_dtor(&sock);
+    Py_END_ALLOW_THREADS
+    return ok;
+}
+
+/* Geometry of a grid stored in a buffer: the dimensions, the stride (in
+   doubles) between neighbors in each direction, spacing and lower corner */
+typedef struct {
+    int nx, ny, nz;
+    Py_ssize_t si, sj, sk;
+    double hx, hy, hzed, xmin, ymin, zmin;
+} GridGeometry;
+
+static int getGeometry(PyObject *tuple, GridGeometry *geom){
+    if (!PyArg_ParseTuple(tuple, "iiinnndddddd", &(geom->nx), &(geom->ny),
+      &(geom->nz), &(geom->si), &(geom->sj), &(geom->sk), &(geom->hx),
+      &(geom->hy), &(geom->hzed), &(geom->xmin), &(geom->ymin),
+      &(geom->zmin))) {
+        PyErr_Clear();
+        return 0;
+    }
+    return 1;
+}
+
+/* The size in bytes a buffer needs to hold a grid */
+static Py_ssize_t geometrySize(GridGeometry *geom){
+    return (Py_ssize_t)sizeof(double)*(1 + (geom->nx - 1)*geom->si
+      + (geom->ny - 1)*geom->sj + (geom->nz - 1)*geom->sk);
+}
+
+/* Trilinear interpolation, exactly as Vgrid_value; returns 0 off the mesh */
+static int linearValue(const double *data, GridGeometry *g, double vcompare,
+  double pt[3], double *value){
+    int ihi, jhi, khi, ilo, jlo, klo;
+    double ifloat, jfloat, kfloat, dx, dy, dz;
+
+#define DATA(i,j,k) (data[(i)*g->si + (j)*g->sj + (k)*g->sk])
+    ifloat = (pt[0] - g->xmin)/g->hx;
+    jfloat = (pt[1] - g->ymin)/g->hy;
+    kfloat = (pt[2] - g->zmin)/g->hzed;
+    ihi = (int)ceil(ifloat);
+    jhi = (int)ceil(jfloat);
+    khi = (int)ceil(kfloat);
+    ilo = (int)floor(ifloat);
+    jlo = (int)floor(jfloat);
+    klo = (int)floor(kfloat);
+    if (VABS(pt[0] - g->xmin) < vcompare) ilo = 0;
+    if (VABS(pt[1] - g->ymin) < vcompare) jlo = 0;
+    if (VABS(pt[2] - g->zmin) < vcompare) klo = 0;
+    if (VABS(pt[0] - (g->xmin + (g->nx-1)*g->hx)) < vcompare) ihi = g->nx-1;
+    if (VABS(pt[1] - (g->ymin + (g->ny-1)*g->hy)) < vcompare) jhi = g->ny-1;
+    if (VABS(pt[2] - (g->zmin + (g->nz-1)*g->hzed)) < vcompare) khi = g->nz-1;
+    if ((ihi >= g->nx) || (jhi >= g->ny) || (khi >= g->nz) ||
+      (ilo < 0) || (jlo < 0) || (klo < 0)) return 0;
+
+    dx = ifloat - (double)(ilo);
+    dy = jfloat - (double)(jlo);
+    dz = kfloat - (double)(klo);
+    *value = dx      *dy      *dz      *DATA(ihi,jhi,khi)
+           + dx      *(1.0-dy)*dz      *DATA(ihi,jlo,khi)
+           + dx      *dy      *(1.0-dz)*DATA(ihi,jhi,klo)
+           + dx      *(1.0-dy)*(1.0-dz)*DATA(ihi,jlo,klo)
+           + (1.0-dx)*dy      *dz      *DATA(ilo,jhi,khi)
+           + (1.0-dx)*(1.0-dy)*dz      *DATA(ilo,jlo,khi)
+           + (1.0-dx)*dy      *(1.0-dz)*DATA(ilo,jhi,klo)
+           + (1.0-dx)*(1.0-dy)*(1.0-dz)*DATA(ilo,jlo,klo);
+    return 1;
+}
+
+/* The B-spline of the "spl2" charge discretization of Vpmg (bspline2) */
+static double splineWeight(double x){
+    double m2m, m2;
+
+    if ((x >= 0.0) && (x <= 2.0)) m2m = 1.0 - VABS(x - 1.0);
+    else m2m = 0.0;
+    if ((x >= 1.0) && (x <= 3.0)) m2 = 1.0 - VABS(x - 2.0);
+    else m2 = 0.0;
+    if ((x >= 0.0) && (x <= 3.0)) return 0.5*x*m2m + 0.5*(3.0-x)*m2;
+    return 0.0;
+}
+
+/* B-spline smoothing over the same nearest and next-nearest neighbors as
+   the "spl2" charge discretization of Vpmg; the weights are normalized
+   where the stencil is cut off by the edge of the grid.  Returns 0 off
+   the mesh */
+static int splineValue(const double *data, GridGeometry *g, double vcompare,
+  double pt[3], double *value){
+    double flt[3], lim[3], w[3][4], u, wsum;
+    int lo[3], hi[3], n[3], d, ii, jj, kk;
+
+    flt[0] = (pt[0] - g->xmin)/g->hx;
+    flt[1] = (pt[1] - g->ymin)/g->hy;
+    flt[2] = (pt[2] - g->zmin)/g->hzed;
+    n[0] = g->nx;
+    n[1] = g->ny;
+    n[2] = g->nz;
+    for (d=0; d<3; d++) {
+        lim[d] = (double)(n[d] - 1);
+        if ((flt[d] < 0.0) && (flt[d] > -vcompare)) flt[d] = 0.0;
+        if ((flt[d] > lim[d]) && (flt[d] < lim[d] + vcompare)) flt[d] = lim[d];
+        if ((flt[d] < 0.0) || (flt[d] > lim[d])) return 0;
+        lo[d] = VMAX2((int)floor(flt[d]) - 1, 0);
+        hi[d] = VMIN2((int)ceil(flt[d]) + 1, n[d] - 1);
+        for (ii=lo[d]; ii<=hi[d]; ii++) {
+            w[d][ii-lo[d]] = splineWeight(1.5 + ((double)ii - flt[d]));
+        }
+    }
+
+    u = 0.0;
+    wsum = 0.0;
+    for (ii=lo[0]; ii<=hi[0]; ii++) {
+        for (jj=lo[1]; jj<=hi[1]; jj++) {
+            for (kk=lo[2]; kk<=hi[2]; kk++) {
+                u += w[0][ii-lo[0]]*w[1][jj-lo[1]]*w[2][kk-lo[2]]
+                  *DATA(ii,jj,kk);
+                wsum += w[0][ii-lo[0]]*w[1][jj-lo[1]]*w[2][kk-lo[2]];
+            }
+        }
+    }
+#undef DATA
+    *value = u/wsum;
+    return 1;
+}
+
+/* Resample the grid in the buffer source onto the lattice of the buffer
+   target (method 0: trilinear, as Vgrid_value; 1: "spl2" B-splines), for
+   the target x indices ilo to ihi-1.  Each geometry is a tuple (nx, ny,
+   nz, x stride, y stride, z stride, hx, hy, hzed, xmin, ymin, zmin), the
+   strides in doubles.  Points off the source mesh are set to zero.
+   Returns the number of such points, or -1 if the arguments are bad */
+long resampleBuffer(PyObject *source, PyObject *sgeom, PyObject *target,
+  PyObject *tgeom, int method, int ilo, int ihi){
+    const void *sptr;
+    void *tptr;
+    Py_ssize_t slen, tlen;
+    GridGeometry sg, tg;
+    const double *sdata;
+    double *tdata, pt[3], value, vcompare;
+    long missed;
+    int i, j, k, ok;
+
+    if (!getGeometry(sgeom, &sg) || !getGeometry(tgeom, &tg)) return -1;
+    if (PyObject_AsReadBuffer(source, &sptr, &slen) != 0) {
+        PyErr_Clear();
+        return -1;
+    }
+    if (PyObject_AsWriteBuffer(target, &tptr, &tlen) != 0) {
+        PyErr_Clear();
+        return -1;
+    }
+    if ((sg.nx < 2) || (sg.ny < 2) || (sg.nz < 2) || (tg.nx < 1) ||
+      (tg.ny < 1) || (tg.nz < 1) || (slen < geometrySize(&sg)) ||
+      (tlen < geometrySize(&tg)) || (ilo < 0) || (ihi > tg.nx) ||
+      ((method != 0) && (method != 1))) return -1;
+    sdata = (const double *)sptr;
+    tdata = (double *)tptr;
+    vcompare = pow(10, -1*(VGRID_DIGITS - 2));
+
+    missed = 0;
+    Py_BEGIN_ALLOW_THREADS
+    for (i=ilo; i<ihi; i++) {
+        pt[0] = tg.xmin + i*tg.hx;
+        for (j=0; j<tg.ny; j++) {
+            pt[1] = tg.ymin + j*tg.hy;
+            for (k=0; k<tg.nz; k++) {
+                pt[2] = tg.zmin + k*tg.hzed;
+                if (method == 0) ok = linearValue(sdata, &sg, vcompare, pt,
+                  &value);
+                else ok = splineValue(sdata, &sg, vcompare, pt, &value);
+                if (!ok) {
+                    value = 0.0;
+                    missed++;
+                }
+                tdata[i*tg.si + j*tg.sj + k*tg.sk] = value;
+            }
+        }
+    }
+    Py_END_ALLOW_THREADS
+    return missed;
+}
+
+/* Evaluate a Vgrid at points lo to hi-1 of a buffer of N points (x, y, z
+   doubles): kind 0 stores Vgrid_value in values (N doubles), 1
+   Vgrid_gradient (N*3 doubles) and 2 Vgrid_curvature with cflag (N
+   doubles).  mask (N chars) is set to 1 where the point could be
+   evaluated and to 0, with zero values, where it could not.  Returns the
+   number of points evaluated, or -1 if the arguments are bad */
+long queryBuffer(Vgrid *thee, PyObject *points, PyObject *values,
+  PyObject *mask, int kind, int cflag, long lo, long hi){
+    const void *pptr;
+    void *vptr, *mptr;
+    Py_ssize_t plen, vlen, mlen, npts, width;
+    const double *pts;
+    double *val;
+    char *ok;
+    long i, count;
+
+    VASSERT(thee != VNULL);
+    if (!(thee->ctordata || thee->readdata)) return -1;
+    if (PyObject_AsReadBuffer(points, &pptr, &plen) != 0) {
+        PyErr_Clear();
+        return -1;
+    }
+    if ((PyObject_AsWriteBuffer(values, &vptr, &vlen) != 0) ||
+      (PyObject_AsWriteBuffer(mask, &mptr, &mlen) != 0)) {
+        PyErr_Clear();
+        return -1;
+    }
+    width = (kind == 1) ? 3 : 1;
+    npts = plen/(Py_ssize_t)(3*sizeof(double));
+    if ((kind < 0) || (kind > 2) || ((kind == 2) && (cflag != 0) &&
+      (cflag != 1)) || (plen != npts*(Py_ssize_t)(3*sizeof(double))) ||
+      (vlen != npts*width*(Py_ssize_t)sizeof(double)) || (mlen != npts) ||
+      (lo < 0) || (hi > npts)) return -1;
+    pts = (const double *)pptr;
+    val = (double *)vptr;
+    ok = (char *)mptr;
+
+    count = 0;
+    Py_BEGIN_ALLOW_THREADS
+    for (i=lo; i<hi; i++) {
+        if (kind == 0) ok[i] = (char)Vgrid_value(thee, (double *)&(pts[3*i]),
+          &(val[i]));
+        else if (kind == 1) ok[i] = (char)Vgrid_gradient(thee,
+          (double *)&(pts[3*i]), &(val[3*i]));
+        else ok[i] = (char)Vgrid_curvature(thee, (double *)&(pts[3*i]),
+          cflag, &(val[i]));
+        if (ok[i]) count++;
+        else if (kind == 1) val[3*i] = val[3*i+1] = val[3*i+2] = 0.0;
+        else val[i] = 0.0;
+    }
+    Py_END_ALLOW_THREADS
+    return count;
+}
 %}
 
 extern int Vgrid_ctor2(Vgrid *thee, int nx, int ny, int nz, double hx, 
@@ -59,6 +419,10 @@ extern void Vgrid_writeDX(Vgrid *thee, const char *iodev, const char *iofmt, con
 
 extern int Vgrid_readDX(Vgrid *thee, const char *iodev, const char *iofmt, const char *thost, const char *fname);
 
+extern int Vgrid_writeBIN(Vgrid *thee, const char *fname, char *title, double *pvec, int size, int compress);
+
+extern int Vgrid_readBIN(Vgrid *thee, const char *fname);
+
 extern void startVio();
 
 // Typemaps and functions for easy Python Access
@@ -118,3 +482,296 @@ extern int Vgrid_gradient(Vgrid *thee, double pt[3], double grad[3]);
 extern Vgrid* Vgrid_ctor(int nx, int ny, int nz, double hx, double hy,
 						 double hzed, double xmin, double ymin, double zmin, 
 						 double *data);
+
+%pythoncode %{
+# NumPy is only imported by the first call that needs it (as in apbslib)
+# The module is kept in _numpy, which "from vgrid import *" does not copy
+# over a caller's own numpy
+_numpy = None
+
+def loadNumpy():
+    """ Import NumPy the first time it is needed; returns the numpy
+    module, or None if NumPy is not installed """
+    global _numpy
+    if _numpy == None:
+        try:
+            import numpy
+        except ImportError:
+            return None
+        _numpy = numpy
+    return _numpy
+
+def getVgridArray(grid):
+    """ Return a writable (nx, ny, nz) NumPy view of the data of a Vgrid,
+    indexed [i,j,k].  No data is copied; the view must not be used after
+    the Vgrid is destroyed (delete_vgrid) """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("getVgridArray requires NumPy")
+    data = numpy.frombuffer(getVgridBuffer(grid), dtype=numpy.float64)
+    return data.reshape((grid.nx, grid.ny, grid.nz), order="F")
+
+def makeVgrid(array, h, origin):
+    """ Return a new Vgrid holding a copy of an (nx, ny, nz) array indexed
+    [i,j,k], with spacing h (hx, hy, hzed) and lower corner origin (xmin,
+    ymin, zmin).  Free it with delete_vgrid """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("makeVgrid requires NumPy")
+    array = numpy.asarray(array, dtype=numpy.float64)
+    if array.ndim != 3:
+        raise ValueError("makeVgrid needs a three dimensional array")
+    nx, ny, nz = array.shape
+    data = array.ravel(order="F")
+    grid = Vgrid_ctorBuffer(nx, ny, nz, h[0], h[1], h[2],
+                            origin[0], origin[1], origin[2], data)
+    if grid == None:
+        raise ValueError("Unable to make a Vgrid from this array")
+    return grid
+
+def writeDXArray(array, h, origin, path, title):
+    """ Write an (nx, ny, nz) array indexed [i,j,k], with spacing h and
+    lower corner origin, to the OpenDX file path in the format of
+    Vgrid_writeDX.  A C contiguous array (a memory-mapped one, for
+    example) is written straight from its memory in the order it is
+    stored; anything else is converted to one first """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("writeDXArray requires NumPy")
+    array = numpy.ascontiguousarray(array, dtype=numpy.float64)
+    if array.ndim != 3:
+        raise ValueError("writeDXArray needs a three dimensional array")
+    nx, ny, nz = array.shape
+    if not writeDXBuffer(path, title, nx, ny, nz, h[0], h[1], h[2],
+                         origin[0], origin[1], origin[2], array):
+        raise IOError("Unable to write %s" % path)
+
+def runJobs(call, n, jobs):
+    """ Split range(n) into up to jobs slices and call call(lo, hi) for
+    each of them in its own thread; returns the list of results.  If a
+    call raises an exception, the first one is raised again in the
+    calling thread once all threads have finished """
+    import sys, threading
+    jobs = max(1, min(jobs, n))
+    results = [None]*jobs
+    errors = [None]*jobs
+    def run(job):
+        try:
+            results[job] = call(job*n/jobs, (job + 1)*n/jobs)
+        except Exception:
+            errors[job] = sys.exc_info()
+    workers = []
+    for job in range(1, jobs):
+        worker = threading.Thread(target=run, args=(job,))
+        worker.start()
+        workers.append(worker)
+    run(0)
+    for worker in workers:
+        worker.join()
+    for error in errors:
+        if error != None:
+            raise error[0], error[1], error[2]
+    return results
+
+RESAMPLEMETHODS = {"linear": 0, "spl2": 1}
+
+def resampleArray(array, h, origin, shape, newh=None, neworigin=None,
+                  method="linear", jobs=1):
+    """ Resample a grid, an (nx, ny, nz) array indexed [i,j,k] with
+    spacing h and lower corner origin, or a stack of them, an (n, nx, ny,
+    nz) array, onto a lattice of shape points with spacing newh and lower
+    corner neworigin.  By default the lattice spans the same box as the
+    grid.  method is "linear" (trilinear, the values Vgrid_value gives) or
+    "spl2" (smoothing with the B-splines of the spl2 charge
+    discretization).  The lattice is split into jobs slabs resampled by
+    concurrent threads.  Returns the resampled array or stack, each grid
+    in Fortran order, and the new spacing.  Raises ValueError if the
+    lattice is not inside the grid """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("resampleArray requires NumPy")
+    if not RESAMPLEMETHODS.has_key(method):
+        raise ValueError("Unknown resampling method %s" % method)
+    array = numpy.asarray(array, dtype=numpy.float64)
+    if array.ndim == 3:
+        grids = [array]
+    elif array.ndim == 4:
+        grids = array
+    else:
+        raise ValueError("resampleArray needs a grid or a stack of grids")
+    dims = array.shape[-3:]
+    if newh == None:
+        if min(shape) < 2:
+            raise ValueError("Can't span the grid with one point")
+        newh = []
+        for d in range(3):
+            top = origin[d] + h[d]*(dims[d] - 1)
+            newh.append((top - origin[d])/(shape[d] - 1))
+    if neworigin == None:
+        neworigin = origin
+    newh = tuple(newh)
+
+    out = numpy.empty(tuple(shape) + (len(grids),), dtype=numpy.float64,
+                      order="F")
+    out = numpy.rollaxis(out, 3)
+    code = RESAMPLEMETHODS[method]
+    results = []
+    for n in range(len(grids)):
+        grid = grids[n]
+        if not (grid.flags.c_contiguous or grid.flags.f_contiguous):
+            grid = numpy.ascontiguousarray(grid)
+        sgeom = dims + tuple([s/8 for s in grid.strides]) + \
+                tuple(h) + tuple(origin)
+        tgeom = tuple(shape) + tuple([s/8 for s in out[n].strides]) + \
+                newh + tuple(neworigin)
+        results += runJobs(lambda lo, hi: resampleBuffer(grid, sgeom, out[n],
+                                                         tgeom, code, lo, hi),
+                           shape[0], jobs)
+    if min(results) < 0:
+        raise ValueError("Unable to resample this array")
+    if max(results) > 0:
+        raise ValueError("The new lattice is not inside the grid")
+    if array.ndim == 3:
+        out = out[0]
+    return out, newh
+
+def queryPoints(grid, points, kind, cflag, jobs):
+    """ Evaluate a Vgrid at the rows of an (N,3) array of points with
+    queryBuffer in up to jobs threads; returns the values and the mask """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("Vgrid point arrays require NumPy")
+    points = numpy.ascontiguousarray(points, dtype=numpy.float64)
+    if points.ndim != 2 or points.shape[1] != 3:
+        raise ValueError("points must be an (N,3) array")
+    npts = len(points)
+    if kind == 1:
+        values = numpy.zeros((npts, 3), dtype=numpy.float64)
+    else:
+        values = numpy.zeros(npts, dtype=numpy.float64)
+    mask = numpy.zeros(npts, dtype=numpy.bool_)
+    if npts == 0:
+        return values, mask
+    results = runJobs(lambda lo, hi: queryBuffer(grid, points, values, mask,
+                                                 kind, cflag, lo, hi),
+                      npts, jobs)
+    if min(results) < 0:
+        raise ValueError("Unable to evaluate this Vgrid")
+    return values, mask
+
+def Vgrid_valueArray(grid, points, jobs=1):
+    """ Return the values of a Vgrid (as Vgrid_value) at the rows of an
+    (N,3) array of points as an (N,) array, and an (N,) boolean mask that
+    is false for points off the grid, whose values are zero.  The points
+    are split between jobs threads """
+    return queryPoints(grid, points, 0, 0, jobs)
+
+def Vgrid_gradientArray(grid, points, jobs=1):
+    """ Return the gradients of a Vgrid (as Vgrid_gradient) at the rows of
+    an (N,3) array of points as an (N,3) array, and the mask of the points
+    where they could be computed (see Vgrid_valueArray) """
+    return queryPoints(grid, points, 1, 0, jobs)
+
+def Vgrid_curvatureArray(grid, points, cflag=1, jobs=1):
+    """ Return the curvatures of a Vgrid (as Vgrid_curvature: cflag 0 for
+    the largest second derivative, 1 for the mean) at the rows of an (N,3)
+    array of points as an (N,) array, and the mask of the points where
+    they could be computed (see Vgrid_valueArray) """
+    if cflag not in [0, 1]:
+        raise ValueError("cflag must be 0 or 1")
+    return queryPoints(grid, points, 2, cflag, jobs)
+
+BINMAGIC = "APBSGRID"
+BINHEADER = 128
+
+def readBinArray(path, mmap=1):
+    """ Read a binary grid file written by Vgrid_writeBIN (or
+    writeBinArray) and return (array, h, origin, title), with array the
+    (nx, ny, nz) values indexed [i,j,k].  Uncompressed files are memory
+    mapped read-only (pass mmap=0 to read them into memory instead), so
+    only the parts of the grid that are used are read from disk;
+    compressed files are decompressed a z plane at a time """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("readBinArray requires NumPy")
+    import struct
+    f = open(path, "rb")
+    try:
+        header = f.read(BINHEADER)
+        if len(header) != BINHEADER or header[:8] != BINMAGIC:
+            raise IOError("%s is not a binary grid file" % path)
+        version, size, nx, ny, nz, compress = struct.unpack("<6i",
+                                                            header[8:32])
+        if version != 1 or size not in [4, 8]:
+            raise IOError("Unsupported binary grid file %s" % path)
+        vals = struct.unpack("<6d", header[32:80])
+        h = vals[0:3]
+        origin = vals[3:6]
+        title = header[80:].split("\0")[0]
+        dtype = numpy.dtype("<f%d" % size)
+        if not compress:
+            if mmap:
+                return (numpy.memmap(path, dtype=dtype, mode="r",
+                                     offset=BINHEADER, shape=(nx, ny, nz),
+                                     order="F"), h, origin, title)
+            data = numpy.fromfile(f, dtype=dtype, count=nx*ny*nz)
+            if data.size != nx*ny*nz:
+                raise IOError("%s is truncated" % path)
+            return data.reshape((nx, ny, nz), order="F"), h, origin, title
+        import zlib
+        sizes = numpy.fromfile(f, dtype="<u8", count=nz)
+        if sizes.size != nz:
+            raise IOError("%s is truncated" % path)
+        array = numpy.empty((nx, ny, nz), dtype=dtype, order="F")
+        for k in range(nz):
+            plane = numpy.frombuffer(zlib.decompress(f.read(int(sizes[k]))),
+                                     dtype=dtype)
+            if plane.size != nx*ny:
+                raise IOError("%s is corrupt" % path)
+            array[:,:,k] = plane.reshape((nx, ny), order="F")
+        return array, h, origin, title
+    finally:
+        f.close()
+
+def writeBinArray(array, h, origin, path, title, size=8, compress=0):
+    """ Write an (nx, ny, nz) array indexed [i,j,k], with spacing h and
+    lower corner origin, to path in the binary grid format of
+    Vgrid_writeBIN: size is 8 for doubles or 4 for floats, and compress=1
+    compresses each z plane with zlib """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("writeBinArray requires NumPy")
+    import struct
+    if size not in [4, 8]:
+        raise ValueError("size must be 4 or 8")
+    array = numpy.asarray(array)
+    if array.ndim != 3:
+        raise ValueError("writeBinArray needs a three dimensional array")
+    nx, ny, nz = array.shape
+    dtype = numpy.dtype("<f%d" % size)
+    compress = int(compress != 0)
+    header = BINMAGIC + struct.pack("<6i", 1, size, nx, ny, nz, compress)
+    header = header + struct.pack("<6d", h[0], h[1], h[2],
+                                  origin[0], origin[1], origin[2])
+    header = header + str(title)[:47].ljust(BINHEADER - len(header), "\0")
+    f = open(path, "wb")
+    try:
+        f.write(header)
+        if compress:
+            import zlib
+            planes = []
+            for k in range(nz):
+                plane = numpy.asarray(array[:,:,k], dtype=dtype)
+                planes.append(zlib.compress(plane.tostring(order="F"), 6))
+            sizes = numpy.array([len(plane) for plane in planes],
+                                dtype="<u8")
+            f.write(sizes.tostring())
+            for plane in planes:
+                f.write(plane)
+        else:
+            for k in range(nz):
+                plane = numpy.asarray(array[:,:,k], dtype=dtype)
+                f.write(plane.tostring(order="F"))
+    finally:
+        f.close()
+%}
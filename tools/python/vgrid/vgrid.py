@@ -1,118 +1,359 @@
-# This file was created automatically by SWIG.
-# Don't modify this file, modify the SWIG interface instead.
-# This file is compatible with both classic and new-style classes.
-
-import _vgrid
-
-def _swig_setattr_nondynamic(self,class_type,name,value,static=1):
-    if (name == "this"):
-        if isinstance(value, class_type):
-            self.__dict__[name] = value.this
-            if hasattr(value,"thisown"): self.__dict__["thisown"] = value.thisown
-            del value.thisown
-            return
-    method = class_type.__swig_setmethods__.get(name,None)
-    if method: return method(self,value)
-    if (not static) or hasattr(self,name) or (name == "thisown"):
-        self.__dict__[name] = value
-    else:
-        raise AttributeError("You cannot add attributes to %s" % self)
+# This file was automatically generated by SWIG (http://www.swig.org).
+# Version 4.0.2
+#
+# Do not make changes to this file unless you know what you are doing--modify
+# the SWIG interface file instead.
 
-def _swig_setattr(self,class_type,name,value):
-    return _swig_setattr_nondynamic(self,class_type,name,value,0)
+from sys import version_info as _swig_python_version_info
+if _swig_python_version_info < (2, 7, 0):
+    raise RuntimeError("Python 2.7 or later required")
 
-def _swig_getattr(self,class_type,name):
-    method = class_type.__swig_getmethods__.get(name,None)
-    if method: return method(self)
-    raise AttributeError,name
+# Pull in all the attributes from the low-level C/C++ module
+if __package__ or "." in __name__:
+    from ._vgrid import *
+else:
+    from _vgrid import *
 
-import types
 try:
-    _object = types.ObjectType
-    _newclass = 1
-except AttributeError:
-    class _object : pass
-    _newclass = 0
-del types
-
-
-
-null_array = _vgrid.null_array
-class Vgrid(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, Vgrid, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, Vgrid, name)
-    def __repr__(self):
-        return "<%s.%s; proxy of C Vgrid instance at %s>" % (self.__class__.__module__, self.__class__.__name__, self.this,)
-    def __init__(self, *args):
-        _swig_setattr(self, Vgrid, 'this', _vgrid.new_Vgrid(*args))
-        _swig_setattr(self, Vgrid, 'thisown', 1)
-    def __del__(self, destroy=_vgrid.delete_Vgrid):
+    import builtins as __builtin__
+except ImportError:
+    import __builtin__
+
+def _swig_repr(self):
+    try:
+        strthis = "proxy of " + self.this.__repr__()
+    except __builtin__.Exception:
+        strthis = ""
+    return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
+
+
+def _swig_setattr_nondynamic_instance_variable(set):
+    def set_instance_attr(self, name, value):
+        if name == "thisown":
+            self.this.own(value)
+        elif name == "this":
+            set(self, name, value)
+        elif hasattr(self, name) and isinstance(getattr(type(self), name), property):
+            set(self, name, value)
+        else:
+            raise AttributeError("You cannot add instance attributes to %s" % self)
+    return set_instance_attr
+
+
+def _swig_setattr_nondynamic_class_variable(set):
+    def set_class_attr(cls, name, value):
+        if hasattr(cls, name) and not isinstance(getattr(cls, name), property):
+            set(cls, name, value)
+        else:
+            raise AttributeError("You cannot add class attributes to %s" % cls)
+    return set_class_attr
+
+
+def _swig_add_metaclass(metaclass):
+    """Class decorator for adding a metaclass to a SWIG wrapped class - a slimmed down version of six.add_metaclass"""
+    def wrapper(cls):
+        return metaclass(cls.__name__, cls.__bases__, cls.__dict__.copy())
+    return wrapper
+
+
+class _SwigNonDynamicMeta(type):
+    """Meta class to enforce nondynamic attributes (no new attributes) for a class"""
+    __setattr__ = _swig_setattr_nondynamic_class_variable(type.__setattr__)
+
+
+
+
+
+# NumPy is only imported by the first call that needs it (as in apbslib)
+# The module is kept in _numpy, which "from vgrid import *" does not copy
+# over a caller's own numpy
+_numpy = None
+
+def loadNumpy():
+    """ Import NumPy the first time it is needed; returns the numpy
+    module, or None if NumPy is not installed """
+    global _numpy
+    if _numpy == None:
         try:
-            if self.thisown: destroy(self)
-        except: pass
-
-    __swig_setmethods__["nx"] = _vgrid.Vgrid_nx_set
-    __swig_getmethods__["nx"] = _vgrid.Vgrid_nx_get
-    if _newclass:nx = property(_vgrid.Vgrid_nx_get, _vgrid.Vgrid_nx_set)
-    __swig_setmethods__["ny"] = _vgrid.Vgrid_ny_set
-    __swig_getmethods__["ny"] = _vgrid.Vgrid_ny_get
-    if _newclass:ny = property(_vgrid.Vgrid_ny_get, _vgrid.Vgrid_ny_set)
-    __swig_setmethods__["nz"] = _vgrid.Vgrid_nz_set
-    __swig_getmethods__["nz"] = _vgrid.Vgrid_nz_get
-    if _newclass:nz = property(_vgrid.Vgrid_nz_get, _vgrid.Vgrid_nz_set)
-    __swig_setmethods__["hx"] = _vgrid.Vgrid_hx_set
-    __swig_getmethods__["hx"] = _vgrid.Vgrid_hx_get
-    if _newclass:hx = property(_vgrid.Vgrid_hx_get, _vgrid.Vgrid_hx_set)
-    __swig_setmethods__["hy"] = _vgrid.Vgrid_hy_set
-    __swig_getmethods__["hy"] = _vgrid.Vgrid_hy_get
-    if _newclass:hy = property(_vgrid.Vgrid_hy_get, _vgrid.Vgrid_hy_set)
-    __swig_setmethods__["hzed"] = _vgrid.Vgrid_hzed_set
-    __swig_getmethods__["hzed"] = _vgrid.Vgrid_hzed_get
-    if _newclass:hzed = property(_vgrid.Vgrid_hzed_get, _vgrid.Vgrid_hzed_set)
-    __swig_setmethods__["xmin"] = _vgrid.Vgrid_xmin_set
-    __swig_getmethods__["xmin"] = _vgrid.Vgrid_xmin_get
-    if _newclass:xmin = property(_vgrid.Vgrid_xmin_get, _vgrid.Vgrid_xmin_set)
-    __swig_setmethods__["ymin"] = _vgrid.Vgrid_ymin_set
-    __swig_getmethods__["ymin"] = _vgrid.Vgrid_ymin_get
-    if _newclass:ymin = property(_vgrid.Vgrid_ymin_get, _vgrid.Vgrid_ymin_set)
-    __swig_setmethods__["zmin"] = _vgrid.Vgrid_zmin_set
-    __swig_getmethods__["zmin"] = _vgrid.Vgrid_zmin_get
-    if _newclass:zmin = property(_vgrid.Vgrid_zmin_get, _vgrid.Vgrid_zmin_set)
-    __swig_setmethods__["data"] = _vgrid.Vgrid_data_set
-    __swig_getmethods__["data"] = _vgrid.Vgrid_data_get
-    if _newclass:data = property(_vgrid.Vgrid_data_get, _vgrid.Vgrid_data_set)
-
-class VgridPtr(Vgrid):
-    def __init__(self, this):
-        _swig_setattr(self, Vgrid, 'this', this)
-        if not hasattr(self,"thisown"): _swig_setattr(self, Vgrid, 'thisown', 0)
-        _swig_setattr(self, Vgrid,self.__class__,Vgrid)
-_vgrid.Vgrid_swigregister(VgridPtr)
-
-
-delete_vgrid = _vgrid.delete_vgrid
-
-Vgrid_ctor2 = _vgrid.Vgrid_ctor2
-
-Vgrid_dtor = _vgrid.Vgrid_dtor
-
-Vgrid_dtor2 = _vgrid.Vgrid_dtor2
-
-Vgrid_writeUHBD = _vgrid.Vgrid_writeUHBD
-
-Vgrid_writeDX = _vgrid.Vgrid_writeDX
-
-Vgrid_readDX = _vgrid.Vgrid_readDX
-
-startVio = _vgrid.startVio
-
-Vgrid_value = _vgrid.Vgrid_value
-
-Vgrid_curvature = _vgrid.Vgrid_curvature
-
-Vgrid_gradient = _vgrid.Vgrid_gradient
-
-Vgrid_ctor = _vgrid.Vgrid_ctor
+            import numpy
+        except ImportError:
+            return None
+        _numpy = numpy
+    return _numpy
+
+def getVgridArray(grid):
+    """ Return a writable (nx, ny, nz) NumPy view of the data of a Vgrid,
+    indexed [i,j,k].  No data is copied; the view must not be used after
+    the Vgrid is destroyed (delete_vgrid) """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("getVgridArray requires NumPy")
+    data = numpy.frombuffer(getVgridBuffer(grid), dtype=numpy.float64)
+    return data.reshape((grid.nx, grid.ny, grid.nz), order="F")
+
+def makeVgrid(array, h, origin):
+    """ Return a new Vgrid holding a copy of an (nx, ny, nz) array indexed
+    [i,j,k], with spacing h (hx, hy, hzed) and lower corner origin (xmin,
+    ymin, zmin).  Free it with delete_vgrid """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("makeVgrid requires NumPy")
+    array = numpy.asarray(array, dtype=numpy.float64)
+    if array.ndim != 3:
+        raise ValueError("makeVgrid needs a three dimensional array")
+    nx, ny, nz = array.shape
+    data = array.ravel(order="F")
+    grid = Vgrid_ctorBuffer(nx, ny, nz, h[0], h[1], h[2],
+                            origin[0], origin[1], origin[2], data)
+    if grid == None:
+        raise ValueError("Unable to make a Vgrid from this array")
+    return grid
+
+def writeDXArray(array, h, origin, path, title):
+    """ Write an (nx, ny, nz) array indexed [i,j,k], with spacing h and
+    lower corner origin, to the OpenDX file path in the format of
+    Vgrid_writeDX.  A C contiguous array (a memory-mapped one, for
+    example) is written straight from its memory in the order it is
+    stored; anything else is converted to one first """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("writeDXArray requires NumPy")
+    array = numpy.ascontiguousarray(array, dtype=numpy.float64)
+    if array.ndim != 3:
+        raise ValueError("writeDXArray needs a three dimensional array")
+    nx, ny, nz = array.shape
+    if not writeDXBuffer(path, title, nx, ny, nz, h[0], h[1], h[2],
+                         origin[0], origin[1], origin[2], array):
+        raise IOError("Unable to write %s" % path)
+
+def runJobs(call, n, jobs):
+    """ Split range(n) into up to jobs slices and call call(lo, hi) for
+    each of them in its own thread; returns the list of results.  If a
+    call raises an exception, the first one is raised again in the
+    calling thread once all threads have finished """
+    import sys, threading
+    jobs = max(1, min(jobs, n))
+    results = [None]*jobs
+    errors = [None]*jobs
+    def run(job):
+        try:
+            results[job] = call(job*n/jobs, (job + 1)*n/jobs)
+        except Exception:
+            errors[job] = sys.exc_info()
+    workers = []
+    for job in range(1, jobs):
+        worker = threading.Thread(target=run, args=(job,))
+        worker.start()
+        workers.append(worker)
+    run(0)
+    for worker in workers:
+        worker.join()
+    for error in errors:
+        if error != None:
+            raise error[0], error[1], error[2]
+    return results
+
+RESAMPLEMETHODS = {"linear": 0, "spl2": 1}
+
+def resampleArray(array, h, origin, shape, newh=None, neworigin=None,
+                  method="linear", jobs=1):
+    """ Resample a grid, an (nx, ny, nz) array indexed [i,j,k] with
+    spacing h and lower corner origin, or a stack of them, an (n, nx, ny,
+    nz) array, onto a lattice of shape points with spacing newh and lower
+    corner neworigin.  By default the lattice spans the same box as the
+    grid.  method is "linear" (trilinear, the values Vgrid_value gives) or
+    "spl2" (smoothing with the B-splines of the spl2 charge
+    discretization).  The lattice is split into jobs slabs resampled by
+    concurrent threads.  Returns the resampled array or stack, each grid
+    in Fortran order, and the new spacing.  Raises ValueError if the
+    lattice is not inside the grid """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("resampleArray requires NumPy")
+    if not RESAMPLEMETHODS.has_key(method):
+        raise ValueError("Unknown resampling method %s" % method)
+    array = numpy.asarray(array, dtype=numpy.float64)
+    if array.ndim == 3:
+        grids = [array]
+    elif array.ndim == 4:
+        grids = array
+    else:
+        raise ValueError("resampleArray needs a grid or a stack of grids")
+    dims = array.shape[-3:]
+    if newh == None:
+        if min(shape) < 2:
+            raise ValueError("Can't span the grid with one point")
+        newh = []
+        for d in range(3):
+            top = origin[d] + h[d]*(dims[d] - 1)
+            newh.append((top - origin[d])/(shape[d] - 1))
+    if neworigin == None:
+        neworigin = origin
+    newh = tuple(newh)
+
+    out = numpy.empty(tuple(shape) + (len(grids),), dtype=numpy.float64,
+                      order="F")
+    out = numpy.rollaxis(out, 3)
+    code = RESAMPLEMETHODS[method]
+    results = []
+    for n in range(len(grids)):
+        grid = grids[n]
+        if not (grid.flags.c_contiguous or grid.flags.f_contiguous):
+            grid = numpy.ascontiguousarray(grid)
+        sgeom = dims + tuple([s/8 for s in grid.strides]) + \
+                tuple(h) + tuple(origin)
+        tgeom = tuple(shape) + tuple([s/8 for s in out[n].strides]) + \
+                newh + tuple(neworigin)
+        results += runJobs(lambda lo, hi: resampleBuffer(grid, sgeom, out[n],
+                                                         tgeom, code, lo, hi),
+                           shape[0], jobs)
+    if min(results) < 0:
+        raise ValueError("Unable to resample this array")
+    if max(results) > 0:
+        raise ValueError("The new lattice is not inside the grid")
+    if array.ndim == 3:
+        out = out[0]
+    return out, newh
+
+def queryPoints(grid, points, kind, cflag, jobs):
+    """ Evaluate a Vgrid at the rows of an (N,3) array of points with
+    queryBuffer in up to jobs threads; returns the values and the mask """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("Vgrid point arrays require NumPy")
+    points = numpy.ascontiguousarray(points, dtype=numpy.float64)
+    if points.ndim != 2 or points.shape[1] != 3:
+        raise ValueError("points must be an (N,3) array")
+    npts = len(points)
+    if kind == 1:
+        values = numpy.zeros((npts, 3), dtype=numpy.float64)
+    else:
+        values = numpy.zeros(npts, dtype=numpy.float64)
+    mask = numpy.zeros(npts, dtype=numpy.bool_)
+    if npts == 0:
+        return values, mask
+    results = runJobs(lambda lo, hi: queryBuffer(grid, points, values, mask,
+                                                 kind, cflag, lo, hi),
+                      npts, jobs)
+    if min(results) < 0:
+        raise ValueError("Unable to evaluate this Vgrid")
+    return values, mask
+
+def Vgrid_valueArray(grid, points, jobs=1):
+    """ Return the values of a Vgrid (as Vgrid_value) at the rows of an
+    (N,3) array of points as an (N,) array, and an (N,) boolean mask that
+    is false for points off the grid, whose values are zero.  The points
+    are split between jobs threads """
+    return queryPoints(grid, points, 0, 0, jobs)
+
+def Vgrid_gradientArray(grid, points, jobs=1):
+    """ Return the gradients of a Vgrid (as Vgrid_gradient) at the rows of
+    an (N,3) array of points as an (N,3) array, and the mask of the points
+    where they could be computed (see Vgrid_valueArray) """
+    return queryPoints(grid, points, 1, 0, jobs)
+
+def Vgrid_curvatureArray(grid, points, cflag=1, jobs=1):
+    """ Return the curvatures of a Vgrid (as Vgrid_curvature: cflag 0 for
+    the largest second derivative, 1 for the mean) at the rows of an (N,3)
+    array of points as an (N,) array, and the mask of the points where
+    they could be computed (see Vgrid_valueArray) """
+    if cflag not in [0, 1]:
+        raise ValueError("cflag must be 0 or 1")
+    return queryPoints(grid, points, 2, cflag, jobs)
+
+BINMAGIC = "APBSGRID"
+BINHEADER = 128
+
+def readBinArray(path, mmap=1):
+    """ Read a binary grid file written by Vgrid_writeBIN (or
+    writeBinArray) and return (array, h, origin, title), with array the
+    (nx, ny, nz) values indexed [i,j,k].  Uncompressed files are memory
+    mapped read-only (pass mmap=0 to read them into memory instead), so
+    only the parts of the grid that are used are read from disk;
+    compressed files are decompressed a z plane at a time """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("readBinArray requires NumPy")
+    import struct
+    f = open(path, "rb")
+    try:
+        header = f.read(BINHEADER)
+        if len(header) != BINHEADER or header[:8] != BINMAGIC:
+            raise IOError("%s is not a binary grid file" % path)
+        version, size, nx, ny, nz, compress = struct.unpack("<6i",
+                                                            header[8:32])
+        if version != 1 or size not in [4, 8]:
+            raise IOError("Unsupported binary grid file %s" % path)
+        vals = struct.unpack("<6d", header[32:80])
+        h = vals[0:3]
+        origin = vals[3:6]
+        title = header[80:].split("\0")[0]
+        dtype = numpy.dtype("<f%d" % size)
+        if not compress:
+            if mmap:
+                return (numpy.memmap(path, dtype=dtype, mode="r",
+                                     offset=BINHEADER, shape=(nx, ny, nz),
+                                     order="F"), h, origin, title)
+            data = numpy.fromfile(f, dtype=dtype, count=nx*ny*nz)
+            if data.size != nx*ny*nz:
+                raise IOError("%s is truncated" % path)
+            return data.reshape((nx, ny, nz), order="F"), h, origin, title
+        import zlib
+        sizes = numpy.fromfile(f, dtype="<u8", count=nz)
+        if sizes.size != nz:
+            raise IOError("%s is truncated" % path)
+        array = numpy.empty((nx, ny, nz), dtype=dtype, order="F")
+        for k in range(nz):
+            plane = numpy.frombuffer(zlib.decompress(f.read(int(sizes[k]))),
+                                     dtype=dtype)
+            if plane.size != nx*ny:
+                raise IOError("%s is corrupt" % path)
+            array[:,:,k] = plane.reshape((nx, ny), order="F")
+        return array, h, origin, title
+    finally:
+        f.close()
+
+def writeBinArray(array, h, origin, path, title, size=8, compress=0):
+    """ Write an (nx, ny, nz) array indexed [i,j,k], with spacing h and
+    lower corner origin, to path in the binary grid format of
+    Vgrid_writeBIN: size is 8 for doubles or 4 for floats, and compress=1
+    compresses each z plane with zlib """
+    numpy = loadNumpy()
+    if numpy == None:
+        raise ImportError("writeBinArray requires NumPy")
+    import struct
+    if size not in [4, 8]:
+        raise ValueError("size must be 4 or 8")
+    array = numpy.asarray(array)
+    if array.ndim != 3:
+        raise ValueError("writeBinArray needs a three dimensional array")
+    nx, ny, nz = array.shape
+    dtype = numpy.dtype("<f%d" % size)
+    compress = int(compress != 0)
+    header = BINMAGIC + struct.pack("<6i", 1, size, nx, ny, nz, compress)
+    header = header + struct.pack("<6d", h[0], h[1], h[2],
+                                  origin[0], origin[1], origin[2])
+    header = header + str(title)[:47].ljust(BINHEADER - len(header), "\0")
+    f = open(path, "wb")
+    try:
+        f.write(header)
+        if compress:
+            import zlib
+            planes = []
+            for k in range(nz):
+                plane = numpy.asarray(array[:,:,k], dtype=dtype)
+                planes.append(zlib.compress(plane.tostring(order="F"), 6))
+            sizes = numpy.array([len(plane) for plane in planes],
+                                dtype="<u8")
+            f.write(sizes.tostring())
+            for plane in planes:
+                f.write(plane)
+        else:
+            for k in range(nz):
+                plane = numpy.asarray(array[:,:,k], dtype=dtype)
+                f.write(plane.tostring(order="F"))
+    finally:
+        f.close()
+
+
 